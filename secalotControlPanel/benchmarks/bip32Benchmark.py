@@ -0,0 +1,106 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares address throughput of one getPublicKey round trip per address with host-side derivation
+# from the parent node, and checks that both give the same keys.
+
+import argparse
+import os
+import statistics
+import time
+
+import secalotCP.ethControl as ethControl
+import secalotCP.keccak as keccak
+import secalotCP.simulator as simulator
+
+SIMULATOR_PIN = b'1234'
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='BIP32 derivation benchmark.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--simulator', action='store_true',
+                        help=('Run against a simulated device with a random wallet.'))
+    parser.add_argument('--latency', type=float, default=2.0,
+                        help=('Simulated APDU latency in milliseconds. Default: 2'))
+    parser.add_argument('--pin', type=ethControl.pin, default=None, help=('PIN-code of a physical device.'))
+    parser.add_argument('--deviceCount', type=int, default=50, help=('Number of addresses read from the device.'))
+    parser.add_argument('--hostCount', type=int, default=2000, help=('Number of addresses derived on the host.'))
+    args = parser.parse_args()
+    return args
+
+
+def measure(operation, iterations):
+    timings = []
+    for count in range(0, iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def printTimings(name, timings):
+    print(name + ': mean ' + format(statistics.mean(timings), '.3f') + ' ms, median ' +
+          format(statistics.median(timings), '.3f') + ' ms, max ' + format(max(timings), '.3f') + ' ms, ' +
+          format(1000 / statistics.mean(timings), '.0f') + ' addresses/s')
+
+
+def main():
+    arguments = parse_arguments()
+
+    if arguments.simulator:
+        simulator.install(simulator.Simulator(1, arguments.latency / 1000))
+
+    try:
+        connection = ethControl.findConnectedDevice()
+
+        if arguments.simulator:
+            ethControl.initWallet(connection, os.urandom(32), SIMULATOR_PIN)
+            ethControl.verifyPin(connection, SIMULATOR_PIN)
+        elif arguments.pin is not None:
+            ethControl.verifyPin(connection, arguments.pin)
+
+        parentPath = ethControl.derivationPath(ethControl.DEFAULT_PARENT_PATH)
+
+        deviceAddresses = []
+        deviceTimings = measure(lambda: deviceAddresses.append(
+            ethControl.ethereumAddress(ethControl.getPublicKey(connection, parentPath + [len(deviceAddresses)])[0])),
+                                arguments.deviceCount)
+
+        # The fixed-base table is built on the first derivation, it is not part of the per-address cost.
+        next(ethControl.deriveAddresses(connection, parentPath, 0, 1))
+
+        start = time.perf_counter()
+        derivedAddresses = list(ethControl.deriveAddresses(connection, parentPath, 0, arguments.hostCount))
+        hostTime = (time.perf_counter() - start) * 1000
+
+    except ethControl.NoReaderFoundError:
+        print('Error: please connect a device.')
+        return
+    except ethControl.WalletError as e:
+        print('Error: ' + e.message)
+        return
+
+    printTimings('Round trip per address', deviceTimings)
+    printTimings('Host derivation', [hostTime / arguments.hostCount])
+
+    if keccak.PYCRYPTODOME_SUPPORTED:
+        print('Keccak: pycryptodome')
+    else:
+        print('Keccak: pure Python')
+
+    checkedAddresses = deviceAddresses[:len(derivedAddresses)]
+    mismatches = [index for index, address in enumerate(checkedAddresses) if derivedAddresses[index].address != address]
+
+    if len(mismatches) == 0:
+        print('Cross-check: ' + str(len(checkedAddresses)) + ' addresses match the device')
+    else:
+        print('Cross-check FAILED for indexes ' + ', '.join(str(index) for index in mismatches))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares per-operation latency of the old connect/transmit/disconnect pattern used by
+# DeviceCommunicatorImplementation with the pooled connections.
+
+import argparse
+import statistics
+import time
+
+import smartcard.System
+
+import secalotCP.otpControl as otpControl
+from secalotCP.connectionPool import ConnectionPool
+
+READER_NAME = 'Secalot Secalot Dongle'
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Connection pool benchmark.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--iterations', type=int, default=200, help=('Number of operations to time.'))
+    args = parser.parse_args()
+    return args
+
+
+def unpooledOperation(readerName):
+    connectedReaders = smartcard.System.readers()
+    reader = next((reader for reader in connectedReaders if readerName in reader.name), None)
+    connection = reader.createConnection()
+    connection.connect()
+    try:
+        otpControl.getNumberOfDigitsAndType(connection)
+    finally:
+        connection.disconnect()
+
+
+def pooledOperation(pool, readerName):
+    # As in the control panel, every operation starts with a SELECT sent to the card.
+    connection = pool.getConnection(readerName)
+    connection.session.restartOperation()
+    try:
+        otpControl.getNumberOfDigitsAndType(connection)
+    finally:
+        connection.session.endOperation()
+        pool.release(connection)
+
+
+def measure(operation, iterations):
+    timings = []
+    for count in range(0, iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def printTimings(name, timings):
+    print(name + ': mean ' + format(statistics.mean(timings), '.2f') + ' ms, median ' +
+          format(statistics.median(timings), '.2f') + ' ms, max ' + format(max(timings), '.2f') + ' ms')
+
+
+def main():
+    arguments = parse_arguments()
+
+    reader = next((reader for reader in smartcard.System.readers() if reader.name.startswith(READER_NAME)), None)
+    if reader is None:
+        print('Error: please connect a device.')
+        return
+
+    readerName = reader.name
+    pool = ConnectionPool()
+
+    unpooledTimings = measure(lambda: unpooledOperation(readerName), arguments.iterations)
+    pooledTimings = measure(lambda: pooledOperation(pool, readerName), arguments.iterations)
+
+    printTimings('Connect per operation', unpooledTimings)
+    printTimings('Pooled connection', pooledTimings)
+    print('SELECT round trips saved: ' + str(pool.savedRoundTrips()))
+
+    pool.evictAll()
+    print('Speedup: ' + format(statistics.mean(unpooledTimings) / statistics.mean(pooledTimings), '.1f') + 'x')
+
+
+if __name__ == "__main__":
+    main()
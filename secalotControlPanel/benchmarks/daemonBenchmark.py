@@ -0,0 +1,86 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares cold scpOtpControl runs with runs forwarded to a running scpDaemon, and measures
+# the per-call latency of a client that stays connected to the daemon.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import secalotCP.daemon as daemon
+import secalotCP.otpControl as otpControl
+
+READER_NAME = 'Secalot Secalot Dongle'
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Daemon benchmark.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--runs', type=int, default=20, help=('Number of CLI runs to time.'))
+    parser.add_argument('--iterations', type=int, default=200, help=('Number of forwarded calls to time.'))
+    args = parser.parse_args()
+    return args
+
+
+def cliRun(socketPath):
+    environment = dict(os.environ)
+    environment[daemon.SOCKET_ENVIRONMENT_VARIABLE] = socketPath
+    subprocess.run([sys.executable, '-m', 'secalotCP.otpControl', 'getNumberOfDigitsAndType'], env=environment,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+
+def measure(operation, iterations):
+    timings = []
+    for count in range(0, iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def printTimings(name, timings):
+    print(name + ': mean ' + format(statistics.mean(timings), '.2f') + ' ms, median ' +
+          format(statistics.median(timings), '.2f') + ' ms, max ' + format(max(timings), '.2f') + ' ms')
+
+
+def main():
+    arguments = parse_arguments()
+
+    socketPath = daemon.defaultSocketPath()
+    client = daemon.connectToDaemon()
+    if client is None:
+        print('Error: please start scpDaemon.')
+        return
+
+    reader = next((reader for reader in daemon.readers() if reader.name.startswith(READER_NAME)), None)
+    if reader is None:
+        print('Error: please connect a device.')
+        return
+
+    # An empty socket path disables the client mode.
+    coldTimings = measure(lambda: cliRun(''), arguments.runs)
+    clientTimings = measure(lambda: cliRun(socketPath), arguments.runs)
+
+    # The daemon keeps the reader claimed by this client until it disconnects, so it connects after the CLI runs.
+    connection = reader.createConnection()
+    connection.connect()
+    forwardedTimings = measure(lambda: otpControl.getNumberOfDigitsAndType(connection), arguments.iterations)
+
+    connection.disconnect()
+
+    printTimings('Cold CLI run', coldTimings)
+    printTimings('CLI run through the daemon', clientTimings)
+    printTimings('Call from a connected client', forwardedTimings)
+    print('Speedup per call: ' + format(statistics.mean(coldTimings) / statistics.mean(forwardedTimings), '.1f') + 'x')
+
+
+if __name__ == "__main__":
+    main()
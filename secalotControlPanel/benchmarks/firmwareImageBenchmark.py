@@ -0,0 +1,96 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares memory usage and CPU time of the streaming update image APDUs with the list of lists
+# representation used before.
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import secalotCP.updateFirmware as updateFirmware
+
+
+def createImageFile():
+    imageFile = tempfile.TemporaryFile()
+    imageFile.write(updateFirmware.MAGIC)
+    imageFile.write(os.urandom(updateFirmware.IMAGE_LENGTH - len(updateFirmware.MAGIC)))
+    imageFile.flush()
+    return imageFile
+
+
+def listOfListsAPDUs(imageFile):
+    fwApduList = []
+    blApduList = []
+
+    imageFile.seek(len(updateFirmware.MAGIC), 0)
+
+    header = imageFile.read(updateFirmware.HEADER_LENGTH)
+    fwSignature = imageFile.read(updateFirmware.SIGNATURE_LENGTH)
+    blSignature = imageFile.read(updateFirmware.SIGNATURE_LENGTH)
+
+    fwApduList.append([0x80, 0x02, 0x00, 0x00, updateFirmware.HEADER_LENGTH + updateFirmware.SIGNATURE_LENGTH] +
+                      list(header) + list(fwSignature))
+    blApduList.append([0x80, 0x02, 0x00, 0x00, 8 + updateFirmware.SIGNATURE_LENGTH] + list(header[0:4]) +
+                      list(header[12:16]) + list(blSignature))
+
+    for count in range(0, updateFirmware.FIRMWARE_CHUNKS):
+        chunk = imageFile.read(updateFirmware.CHUNK_LENGTH)
+        fwApduList.append([0x80, 0x03, 0x00, 0x00, updateFirmware.CHUNK_LENGTH] + list(chunk))
+
+    for count in range(0, updateFirmware.BOOTLOADER_CHUNKS):
+        chunk = imageFile.read(updateFirmware.CHUNK_LENGTH)
+        blApduList.append([0x80, 0x03, 0x00, 0x00, updateFirmware.CHUNK_LENGTH] + list(chunk))
+
+    fwApduList.append([0x80, 0x04, 0x00, 0x00])
+    blApduList.append([0x80, 0x04, 0x00, 0x00])
+
+    return fwApduList, blApduList
+
+
+def transmitAll(apdus):
+    # Mimics loadTheImage: every APDU is handed to pyscard as a list of integers.
+    length = 0
+    for apdu in apdus:
+        length += len(list(apdu))
+    return length
+
+
+def measure(name, imageFile, makeAPDUs):
+    tracemalloc.start()
+    start = time.process_time()
+
+    fwApdus, blApdus = makeAPDUs(imageFile)
+    length = transmitAll(blApdus) + transmitAll(fwApdus)
+
+    elapsed = time.process_time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(name + ': CPU ' + format(elapsed * 1000, '.1f') + ' ms, peak memory ' + format(peak / 1024, '.0f') +
+          ' KiB, retained ' + format(current / 1024, '.0f') + ' KiB (' + str(length) + ' APDU bytes)')
+
+    # The streaming APDUs map the image, the lists hold copies of it.
+    if isinstance(fwApdus, updateFirmware.ImageAPDUs):
+        fwApdus.close()
+
+    del fwApdus, blApdus
+
+
+def main():
+    imageFile = createImageFile()
+
+    try:
+        measure('List of lists', imageFile, listOfListsAPDUs)
+        measure('Streaming', imageFile, lambda file: updateFirmware.updateImageToAPDUs(file, False))
+    finally:
+        imageFile.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares RemoteScreen reconnect latency with the SRP verifier regenerated for every connection, as
+# before, and with the cached verifier.
+
+import argparse
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from PyQt5.QtCore import QCoreApplication, QSettings
+from PyQt5.QtNetwork import QHostAddress
+from tlslite import TLSConnection, HandshakeSettings
+
+from secalotCP.remoteScreen import RemoteScreen
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='RemoteScreen reconnect benchmark.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--iterations', type=int, default=50, help=('Number of reconnects to time.'))
+    args = parser.parse_args()
+    return args
+
+
+def reconnect(port, key):
+    sock = socket.create_connection(('127.0.0.1', port))
+    connection = TLSConnection(sock)
+
+    # The phone application negotiates TLS 1.2.
+    settings = HandshakeSettings()
+    settings.maxVersion = (3, 3)
+
+    connection.handshakeClientSRP(bytearray(b'user'), bytearray.fromhex(key), settings=settings)
+    connection.close()
+
+
+def measure(operation, iterations):
+    timings = []
+    for count in range(0, iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def printTimings(name, timings):
+    print(name + ': mean ' + format(statistics.mean(timings), '.2f') + ' ms, median ' +
+          format(statistics.median(timings), '.2f') + ' ms, max ' + format(max(timings), '.2f') + ' ms')
+
+
+def main():
+    arguments = parse_arguments()
+    application = QCoreApplication(sys.argv)
+
+    # A temporary settings file, the binding of the installed control panel is left alone.
+    settingsFile = tempfile.NamedTemporaryFile(suffix='.ini', delete=False)
+    settingsFile.close()
+    settings = QSettings(settingsFile.name, QSettings.IniFormat)
+
+    key = os.urandom(32).hex()
+    settings.setValue('removeScreenKey', key)
+
+    verifierCache = RemoteScreen.VerifierCache(settings)
+    server = RemoteScreen.TCPServer(None, verifierCache)
+    if not server.listen(QHostAddress(QHostAddress.LocalHost), 0):
+        print('Error: can not start the server.')
+        return
+
+    port = server.serverPort()
+    results = {}
+
+    def uncachedReconnect():
+        verifierCache.invalidate()
+        reconnect(port, key)
+
+    def run():
+        try:
+            reconnect(port, key)
+            results['uncached'] = measure(uncachedReconnect, arguments.iterations)
+            verifierCache.get()
+            results['cached'] = measure(lambda: reconnect(port, key), arguments.iterations)
+        finally:
+            application.quit()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    application.exec_()
+    thread.join()
+
+    server.close()
+    os.unlink(settingsFile.name)
+
+    if 'cached' not in results:
+        print('Error: the handshakes failed.')
+        return
+
+    printTimings('Verifier per connection', results['uncached'])
+    printTimings('Cached verifier', results['cached'])
+    print('Speedup: ' + format(statistics.mean(results['uncached']) / statistics.mean(results['cached']), '.2f') + 'x')
+
+
+if __name__ == "__main__":
+    main()
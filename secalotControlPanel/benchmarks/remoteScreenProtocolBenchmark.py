@@ -0,0 +1,203 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares APDU throughput of RemoteScreen protocol version 1 (JSON and base64) with version 2 (binary
+# frames). The device answers every APDU immediately, so only the protocol overhead is measured.
+
+import argparse
+import base64
+import json
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QSettings, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QGuiApplication
+from PyQt5.QtNetwork import QHostAddress
+from PyQt5.QtQml import QQmlEngine
+from tlslite import TLSConnection, HandshakeSettings
+
+from secalotCP.remoteScreen import RemoteScreen
+
+
+class EchoDevice(QObject):
+    # Answers every RemoteScreen command with its own bytes and a success status word.
+
+    remoteScreenErrorOccurred = pyqtSignal(str)
+    remoteScreenCommandSent = pyqtSignal(bytes)
+    getSslPublicKeyReady = pyqtSignal(str)
+
+    @pyqtSlot(bytes)
+    def sendRemoteScreenCommand(self, command):
+        self.remoteScreenCommandSent.emit(command + b'\x90\x00')
+
+    @pyqtSlot()
+    def getSslPublicKey(self):
+        pass
+
+
+class PhoneConnection(object):
+
+    def __init__(self, port, key):
+        sock = socket.create_connection(('127.0.0.1', port))
+        self.connection = TLSConnection(sock)
+        self.buffer = bytearray()
+        self.bytesSent = 0
+        self.bytesReceived = 0
+
+        # The phone application negotiates TLS 1.2.
+        settings = HandshakeSettings()
+        settings.maxVersion = (3, 3)
+
+        self.connection.handshakeClientSRP(bytearray(b'user'), bytearray.fromhex(key), settings=settings)
+
+    def write(self, data):
+        self.bytesSent += len(data)
+        self.connection.write(data)
+
+    def readExactly(self, length):
+        while len(self.buffer) < length:
+            data = self.connection.read()
+            if len(data) == 0:
+                raise EOFError()
+            self.buffer += data
+
+        data = bytes(self.buffer[:length])
+        del self.buffer[:length]
+        self.bytesReceived += length
+        return data
+
+    def readLine(self):
+        while b'\n' not in self.buffer:
+            data = self.connection.read()
+            if len(data) == 0:
+                raise EOFError()
+            self.buffer += data
+
+        return self.readExactly(self.buffer.index(b'\n') + 1)
+
+    def ping(self, arguments):
+        self.write((json.dumps({"command": "Ping", "arguments": arguments}) + '\n').encode('utf-8'))
+        return json.loads(self.readLine())
+
+    def sendApduJson(self, apdu):
+        command = {"command": "SendAPDU", "arguments": [base64.b64encode(apdu).decode('utf8')]}
+        self.write((json.dumps(command) + '\n').encode('utf-8'))
+        return base64.b64decode(json.loads(self.readLine())["arguments"][0])
+
+    def sendApduBinary(self, apdu):
+        self.write(RemoteScreen.BinaryFramer.encode(RemoteScreen.FRAME_APDU, apdu))
+        frameType, length = RemoteScreen.BinaryFramer.HEADER.unpack(
+            self.readExactly(RemoteScreen.BinaryFramer.HEADER.size))
+        return self.readExactly(length)
+
+    def close(self):
+        self.connection.close()
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='RemoteScreen protocol benchmark.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--iterations', type=int, default=1000, help=('Number of APDUs sent per protocol.'))
+    parser.add_argument('--apduSize', type=int, default=255, help=('APDU size in bytes. Default: 255'))
+    args = parser.parse_args()
+    return args
+
+
+def measure(operation, iterations):
+    timings = []
+    for count in range(0, iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def printTimings(name, timings, bytesPerApdu):
+    print(name + ': mean ' + format(statistics.mean(timings), '.3f') + ' ms, median ' +
+          format(statistics.median(timings), '.3f') + ' ms, ' +
+          format(1000 / statistics.mean(timings), '.0f') + ' APDUs/s, ' +
+          format(bytesPerApdu, '.0f') + ' bytes per exchange')
+
+
+def main():
+    arguments = parse_arguments()
+    application = QGuiApplication(sys.argv)
+
+    # A temporary settings file, the binding of the installed control panel is left alone.
+    settingsFile = tempfile.NamedTemporaryFile(suffix='.ini', delete=False)
+    settingsFile.close()
+    settings = QSettings(settingsFile.name, QSettings.IniFormat)
+
+    key = os.urandom(32).hex()
+    settings.setValue('removeScreenKey', key)
+
+    engine = QQmlEngine()
+    device = EchoDevice()
+    remoteScreen = RemoteScreen(engine, device)
+    remoteScreen.verifierCache = RemoteScreen.VerifierCache(settings)
+
+    server = RemoteScreen.TCPServer(None, remoteScreen.verifierCache)
+    server.newConnection.connect(remoteScreen.newConnection)
+    if not server.listen(QHostAddress(QHostAddress.LocalHost), 0):
+        print('Error: can not start the server.')
+        return
+
+    port = server.serverPort()
+    apdu = os.urandom(arguments.apduSize)
+    results = {}
+
+    def runProtocol(name, version, sendApdu):
+        phone = PhoneConnection(port, key)
+
+        if version != 1:
+            if phone.ping([str(version)])["arguments"] != [str(version)]:
+                raise ValueError()
+
+        if sendApdu(phone, apdu) != apdu + b'\x90\x00':
+            raise ValueError()
+
+        phone.bytesSent = 0
+        phone.bytesReceived = 0
+        results[name] = measure(lambda: sendApdu(phone, apdu), arguments.iterations)
+        results[name + 'Bytes'] = (phone.bytesSent + phone.bytesReceived) / arguments.iterations
+
+        phone.close()
+
+    def run():
+        try:
+            runProtocol('json', 1, PhoneConnection.sendApduJson)
+            runProtocol('binary', 2, PhoneConnection.sendApduBinary)
+        finally:
+            application.quit()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    application.exec_()
+    thread.join()
+
+    server.close()
+    remoteScreen.requestClose.emit()
+    remoteScreen.tcpSocketWorkerThread.quit()
+    remoteScreen.tcpSocketWorkerThread.wait()
+    os.unlink(settingsFile.name)
+
+    if 'binary' not in results:
+        print('Error: the sessions failed.')
+        return
+
+    printTimings('Protocol 1, JSON', results['json'], results['jsonBytes'])
+    printTimings('Protocol 2, binary', results['binary'], results['binaryBytes'])
+    print('Speedup: ' + format(statistics.mean(results['json']) / statistics.mean(results['binary']), '.2f') + 'x')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Compares the CPU time an idle RemoteScreen session consumes and the round-trip latency of a line with
+# the previous polling socket worker and with the one woken by socket notifications.
+
+import argparse
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from PyQt5.QtCore import QCoreApplication, QObject, QSettings, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtNetwork import QHostAddress
+from tlslite import TLSConnection, HandshakeSettings
+
+from secalotCP.remoteScreen import RemoteScreen
+
+
+class PollingSocketWorker(QObject):
+    # The socket worker as it was before, it spins on the event loop while waiting for a line.
+
+    lineRead = pyqtSignal(object)
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.connection = None
+        self.data = bytes()
+
+    @pyqtSlot()
+    def closeConnection(self):
+        try:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+        except Exception as e:
+            pass
+
+    @pyqtSlot(object)
+    def newConnection(self, connection):
+        try:
+            self.closeConnection()
+            self.connection = connection
+        except Exception as e:
+            pass
+
+    @pyqtSlot()
+    def readLine(self):
+        while True:
+            try:
+                gen = self.connection.readAsync()
+                for data in gen:
+                    if isinstance(data, int):
+                        if data == 0:
+                            QCoreApplication.processEvents()
+                            if self.connection is None:
+                                return
+                    elif isinstance(data, bytes):
+                        if len(data) == 0:
+                            self.closeConnection()
+                            return
+                        else:
+                            self.data += data
+                            if data[-1:] == b'\n':
+                                self.lineRead.emit(self.data)
+                                self.data = bytes()
+                                return
+            except Exception as e:
+                return
+
+    @pyqtSlot(object)
+    def writeLine(self, data):
+        try:
+            self.connection.write(data)
+        except Exception as e:
+            pass
+
+
+class EchoSession(QObject):
+    # Wires a socket worker the way RemoteScreen does and sends every line back.
+
+    requestOpen = pyqtSignal(object)
+    requestRead = pyqtSignal()
+    requestWrite = pyqtSignal(object)
+    requestClose = pyqtSignal()
+
+    def __init__(self, server, worker, polling):
+        super().__init__()
+        self.polling = polling
+
+        self.thread = QThread()
+        self.worker = worker
+        self.worker.moveToThread(self.thread)
+        self.thread.start()
+
+        self.requestOpen.connect(self.worker.newConnection)
+        self.requestWrite.connect(self.worker.writeLine)
+        self.requestClose.connect(self.worker.closeConnection)
+        if polling:
+            self.requestRead.connect(self.worker.readLine)
+
+        self.worker.lineRead.connect(self.lineRead)
+        server.newConnection.connect(self.newConnection)
+
+    @pyqtSlot(object)
+    def newConnection(self, connection):
+        self.requestOpen.emit(connection)
+        if self.polling:
+            self.requestRead.emit()
+
+    @pyqtSlot(object)
+    def lineRead(self, data):
+        self.requestWrite.emit(data)
+        if self.polling:
+            self.requestRead.emit()
+
+    def stop(self):
+        self.requestClose.emit()
+        self.thread.quit()
+        self.thread.wait()
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='RemoteScreen socket worker benchmark.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--idle', type=float, default=2.0, help=('Seconds the session is left idle. Default: 2'))
+    parser.add_argument('--iterations', type=int, default=200, help=('Number of round trips to time.'))
+    args = parser.parse_args()
+    return args
+
+
+def connect(port, key):
+    sock = socket.create_connection(('127.0.0.1', port))
+    connection = TLSConnection(sock)
+
+    # The phone application negotiates TLS 1.2.
+    settings = HandshakeSettings()
+    settings.maxVersion = (3, 3)
+
+    connection.handshakeClientSRP(bytearray(b'user'), bytearray.fromhex(key), settings=settings)
+    return connection
+
+
+def readLine(connection):
+    data = bytes()
+    while not data.endswith(b'\n'):
+        received = connection.read()
+        if len(received) == 0:
+            raise EOFError()
+        data += received
+    return data
+
+
+def measure(operation, iterations):
+    timings = []
+    for count in range(0, iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def printTimings(name, timings):
+    print(name + ': mean ' + format(statistics.mean(timings), '.3f') + ' ms, median ' +
+          format(statistics.median(timings), '.3f') + ' ms, max ' + format(max(timings), '.3f') + ' ms')
+
+
+def runSession(application, server, port, key, worker, polling, arguments):
+    session = EchoSession(server, worker, polling)
+    results = {}
+
+    def roundTrip(connection):
+        line = b'{"command": "ping"}\n'
+        connection.write(line)
+        if readLine(connection) != line:
+            raise ValueError()
+
+    def run():
+        try:
+            connection = connect(port, key)
+            roundTrip(connection)
+
+            # CPU time of the whole process, the client only sleeps meanwhile.
+            start = time.process_time()
+            time.sleep(arguments.idle)
+            results['idle'] = (time.process_time() - start) / arguments.idle * 100
+
+            results['roundTrip'] = measure(lambda: roundTrip(connection), arguments.iterations)
+            connection.close()
+        finally:
+            application.quit()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    application.exec_()
+    thread.join()
+
+    server.newConnection.disconnect(session.newConnection)
+    session.stop()
+
+    return results
+
+
+def main():
+    arguments = parse_arguments()
+    application = QCoreApplication(sys.argv)
+
+    # A temporary settings file, the binding of the installed control panel is left alone.
+    settingsFile = tempfile.NamedTemporaryFile(suffix='.ini', delete=False)
+    settingsFile.close()
+    settings = QSettings(settingsFile.name, QSettings.IniFormat)
+
+    key = os.urandom(32).hex()
+    settings.setValue('removeScreenKey', key)
+
+    server = RemoteScreen.TCPServer(None, RemoteScreen.VerifierCache(settings))
+    if not server.listen(QHostAddress(QHostAddress.LocalHost), 0):
+        print('Error: can not start the server.')
+        return
+
+    port = server.serverPort()
+
+    polling = runSession(application, server, port, key, PollingSocketWorker(None), True, arguments)
+    notified = runSession(application, server, port, key, RemoteScreen.TCPSocketWorker(None), False, arguments)
+
+    server.close()
+    os.unlink(settingsFile.name)
+
+    if 'roundTrip' not in polling or 'roundTrip' not in notified:
+        print('Error: the sessions failed.')
+        return
+
+    print('Polling worker idle CPU: ' + format(polling['idle'], '.1f') + ' %')
+    print('Notified worker idle CPU: ' + format(notified['idle'], '.1f') + ' %')
+    printTimings('Polling worker round trip', polling['roundTrip'])
+    printTimings('Notified worker round trip', notified['roundTrip'])
+
+
+if __name__ == "__main__":
+    main()
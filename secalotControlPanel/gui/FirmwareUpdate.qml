@@ -25,6 +25,10 @@ FirmwareUpdateForm {
 
     FirmwareUpdatePopup {
         id: firmwareUpdatePopup
+
+        onCancelRequested: {
+            cancelRequested()
+        }
     }
 
     function setPopupMessage(message) {
@@ -35,6 +39,17 @@ FirmwareUpdateForm {
         firmwareUpdatePopup.close()
     }
 
+    function setProgress(stage, bytesSent, totalBytes, throughput, eta) {
+        var text = stage === "bootloader" ? qsTr("Bootloader: ") : qsTr("Firmware: ")
+        text += Math.round(100 * bytesSent / totalBytes) + "%, " + (throughput / 1024).toFixed(1) + " KiB/s"
+
+        if(eta >= 0) {
+            text += qsTr(", %1 s left").arg(Math.round(eta))
+        }
+
+        firmwareUpdatePopup.setProgress(bytesSent / totalBytes, text)
+    }
+
     function setDeviceInfo(deviceID, serialNumber, firmwareVersion, fileSystemVersion, bootloaderVersion) {
 
         deviceIDValueLabel.text = deviceID
@@ -75,11 +90,14 @@ FirmwareUpdateForm {
 
     function updateFinished() {
         firmwareUpdatePopup.setFirmwareUpdateMessageText(qsTr("Update finished."))
+        firmwareUpdatePopup.hideCancelButton()
+        firmwareUpdatePopup.hideProgress()
         firmwareUpdatePopup.showDoneButton()
     }
 
     signal updateRequested(string fileName, bool cleanFileSystemRequested)
     signal firmwareImageInfoRequested(string fileName)
+    signal cancelRequested()
 
     selectFirmwareImageButton.onClicked: {
         clearFirmwareImageInfo()
@@ -93,6 +111,8 @@ FirmwareUpdateForm {
         }
         else {
             firmwareUpdatePopup.hideDoneButton()
+            firmwareUpdatePopup.hideProgress()
+            firmwareUpdatePopup.showCancelButton()
             firmwareUpdatePopup.setFirmwareUpdateMessageText("")
             updateRequested(selectFirmwareImageFile, eraseFSCheckBox.checked)
             firmwareUpdatePopup.open()
@@ -7,6 +7,9 @@ ColumnLayout {
     property alias label: label
     property alias button: button
     property alias busyIndicator: busyIndicator
+    property alias progressBar: progressBar
+    property alias progressLabel: progressLabel
+    property alias cancelButton: cancelButton
     spacing: 20
 
     BusyIndicator {
@@ -23,10 +26,31 @@ ColumnLayout {
         Layout.alignment: Qt.AlignHCenter | Qt.AlignVCenter
     }
 
+    ProgressBar {
+        id: progressBar
+        visible: false
+        Layout.alignment: Qt.AlignHCenter | Qt.AlignVCenter
+    }
+
+    Label {
+        id: progressLabel
+        visible: false
+        text: qsTr("")
+        horizontalAlignment: Text.AlignHCenter
+        Layout.alignment: Qt.AlignHCenter | Qt.AlignVCenter
+    }
+
     Button {
         id: button
         visible: false
         text: qsTr("OK")
         Layout.alignment: Qt.AlignHCenter | Qt.AlignVCenter
     }
+
+    Button {
+        id: cancelButton
+        visible: false
+        text: qsTr("Cancel")
+        Layout.alignment: Qt.AlignHCenter | Qt.AlignVCenter
+    }
 }
@@ -19,6 +19,29 @@ Popup {
         firmwareUpdateMessage.label.text = text
     }
 
+    function showCancelButton() {
+        firmwareUpdateMessage.cancelButton.enabled = true
+        firmwareUpdateMessage.cancelButton.visible = true
+    }
+
+    function hideCancelButton() {
+        firmwareUpdateMessage.cancelButton.visible = false
+    }
+
+    function setProgress(value, text) {
+        firmwareUpdateMessage.progressBar.value = value
+        firmwareUpdateMessage.progressBar.visible = true
+        firmwareUpdateMessage.progressLabel.text = text
+        firmwareUpdateMessage.progressLabel.visible = true
+    }
+
+    function hideProgress() {
+        firmwareUpdateMessage.progressBar.visible = false
+        firmwareUpdateMessage.progressLabel.visible = false
+    }
+
+    signal cancelRequested()
+
     x: (parent.width - width) / 2
     y: (parent.height - height) / 2
 
@@ -33,6 +56,11 @@ Popup {
             firmwareMessagePopup.close()
         }
 
+        cancelButton.onClicked: {
+            firmwareUpdateMessage.cancelButton.enabled = false
+            firmwareMessagePopup.cancelRequested()
+        }
+
     }
 
 }
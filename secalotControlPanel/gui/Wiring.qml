@@ -80,6 +80,10 @@ Item {
         onFirmwareImageInfoRequested: {
             deviceCommunicator.getFirmwareImageInfo(fileName)
         }
+
+        onCancelRequested: {
+            deviceCommunicator.cancelFirmwareUpdate()
+        }
     }
 
     Connections {
@@ -151,14 +155,7 @@ Item {
 
             deviceCommunicator.readerSelected(readerName, readerType)
 
-            if( readerType === 'firmware') {
-                deviceCommunicator.getOTPSettings()
-                deviceCommunicator.getEthereumWalletInfo()
-                deviceCommunicator.getXrpWalletInfo()
-                deviceCommunicator.getSslPublicKeyFingerprint()
-            }
-
-            deviceCommunicator.getDeviceInfo()
+            deviceCommunicator.getDeviceSnapshot()
         }
 
         onNoDevicesConnected: {
@@ -195,10 +192,35 @@ Item {
             firmwareUpdate.setDeviceInfo(deviceID, serialNumber, fwVersion, fsVersion, bootloaderVersion)
         }
 
+        onGetDeviceSnapshotReady: {
+            firmwareUpdate.setDeviceInfo(snapshot.deviceID, snapshot.serialNumber, snapshot.fwVersion,
+                                         snapshot.fsVersion, snapshot.bootloaderVersion)
+
+            if (snapshot.otpType !== undefined) {
+                otpControl.setCurrentOTPSettings(snapshot.numberOfDigits, snapshot.otpType)
+            }
+
+            if (snapshot.ethAppVersion !== undefined) {
+                ethereumWallet.setWalletInfo(snapshot.ethAppVersion, snapshot.ethWalletInitialized,
+                                             snapshot.ethPinVerified)
+                xrpWallet.setWalletInfo(snapshot.xrpAppVersion, snapshot.xrpWalletInitialized,
+                                        snapshot.xrpPinVerified)
+            }
+
+            if (snapshot.sslFingerprint !== undefined) {
+                remoteScreen.supportedDeviceConnected()
+                remoteScreen.setFingerprint(snapshot.sslFingerprint)
+            }
+        }
+
         onFirmwareUpdateInfo: {
             firmwareUpdate.setPopupMessage(message)
         }
 
+        onFirmwareUpdateProgress: {
+            firmwareUpdate.setProgress(stage, bytesSent, totalBytes, throughput, eta)
+        }
+
         onFirmwareUpdateReady: {
             firmwareUpdate.updateFinished()
             deviceFinder.restartMonitoring()
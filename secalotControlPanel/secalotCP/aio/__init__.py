@@ -0,0 +1,13 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from secalotCP.aio.readerExecutor import shutdownExecutors
+from secalotCP.aio.device import NoReaderFoundError, AsyncDevice, MODE_SWITCH_TIMEOUT, list_devices, open_device, \
+    open_all_devices, get_device_info, flash_firmware, otp_get_settings, otp_set_settings, send_time, eth_get_info, \
+    eth_get_random, eth_init_wallet, eth_wipeout_wallet, eth_verify_pin, eth_get_pin_tries_left, eth_get_public_key, \
+    xrp_get_info, xrp_get_random, xrp_init_wallet, xrp_wipeout_wallet, xrp_verify_pin, xrp_get_pin_tries_left, \
+    xrp_get_public_key, xrp_sign, ssl_get_public_key, ssl_get_public_key_fingerprint
@@ -0,0 +1,253 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import asyncio
+import smartcard.System
+from smartcard.Exceptions import SmartcardException
+
+import secalotCP.otpControl as otpControl
+import secalotCP.updateFirmware as updateFirmware
+import secalotCP.totpService as totpService
+import secalotCP.ethControl as ethControl
+import secalotCP.xrpControl as xrpControl
+import secalotCP.sslControl as sslControl
+from secalotCP.appletSession import AppletSession, operation
+from secalotCP.aio.readerExecutor import readerExecutor, forgetReaderExecutors, forgetMissingReaderExecutors
+
+MODE_SWITCH_TIMEOUT = 60.0
+
+
+class NoReaderFoundError(Exception):
+    pass
+
+
+def readerType(readerName):
+    if readerName.startswith(updateFirmware.BOOTLOADER_READER_NAME):
+        return 'bootloader'
+    elif readerName.startswith(updateFirmware.READER_NAME):
+        return 'firmware'
+    else:
+        return None
+
+
+def listDevicesBlocking():
+    readerNames = [reader.name for reader in smartcard.System.readers()]
+    forgetMissingReaderExecutors(readerNames)
+
+    return [(readerName, readerType(readerName)) for readerName in readerNames if readerType(readerName) is not None]
+
+
+class AsyncDevice(object):
+    # Every blocking call runs on the executor of the device's reader. A cancelled or timed out call
+    # still completes on that thread, the next one is only started afterwards.
+
+    def __init__(self, readerName, deviceType):
+        self.readerName = readerName
+        self.deviceType = deviceType
+        self.connection = None
+
+    @property
+    def executor(self):
+        # Looked up on every call, so it follows the reader name after a firmware update and
+        # a replugged reader gets a new executor once the old one was forgotten.
+        return readerExecutor(self.readerName)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await self.close()
+
+    async def call(self, function, *arguments):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, self.callBlocking, function, arguments)
+
+    async def close(self):
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self.executor, self.disconnectBlocking)
+
+    def callBlocking(self, function, arguments):
+        if self.connection is None:
+            self.connectBlocking()
+
+        try:
+            with operation(self.connection):
+                return function(self.connection, *arguments)
+        except SmartcardException:
+            # The device may have been replugged, the next call connects again.
+            self.disconnectBlocking()
+            raise
+
+    def connectBlocking(self):
+        reader = next((reader for reader in smartcard.System.readers() if reader.name == self.readerName), None)
+
+        if reader is None:
+            raise NoReaderFoundError()
+
+        connection = reader.createConnection()
+        connection.connect()
+        self.connection = AppletSession(connection)
+
+    def disconnectBlocking(self):
+        connection = self.connection
+        self.connection = None
+
+        if connection is not None:
+            try:
+                connection.disconnect()
+            except Exception:
+                pass
+
+    def flashBlocking(self, imageFile, cleanFileSystem, modeSwitchTimeout, job):
+        imageInfo = updateFirmware.getUpdateImageInfo(imageFile)
+        fwApdus, blApdus = updateFirmware.updateImageToAPDUs(imageFile, cleanFileSystem)
+
+        with fwApdus, blApdus:
+            serialNumber = self.callBlocking(
+                lambda connection: updateFirmware.getDeviceInfo(self.deviceType, connection).serialNumber, ())
+            self.disconnectBlocking()
+
+            # The device reenumerates under other reader names while being updated, it is followed by its serial
+            # number.
+            registry = updateFirmware.DeviceRegistry()
+            updateFirmware.performFleetUpdate(registry, serialNumber, fwApdus, blApdus, imageInfo, cleanFileSystem,
+                                              modeSwitchTimeout, job)
+
+        oldReaderName = self.readerName
+
+        with registry.lock:
+            self.readerName = next((readerName for readerName, value in registry.serialNumbers.items() if
+                                    value == serialNumber), self.readerName)
+        self.deviceType = 'firmware'
+
+        if self.readerName != oldReaderName:
+            forgetReaderExecutors([oldReaderName])
+
+
+async def list_devices():
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, listDevicesBlocking)
+
+
+async def open_device(readerName=None):
+    devices = await list_devices()
+
+    device = next(((name, deviceType) for name, deviceType in devices if
+                   readerName is None or name.startswith(readerName)), None)
+
+    if device is None:
+        raise NoReaderFoundError()
+
+    return AsyncDevice(*device)
+
+
+async def open_all_devices():
+    return [AsyncDevice(name, deviceType) for name, deviceType in await list_devices()]
+
+
+async def get_device_info(device):
+    return await device.call(lambda connection: updateFirmware.getDeviceInfo(device.deviceType, connection))
+
+
+async def flash_firmware(device, imageFile, cleanFileSystem=False, progress=None,
+                         modeSwitchTimeout=MODE_SWITCH_TIMEOUT):
+    loop = asyncio.get_event_loop()
+
+    if progress is None:
+        job = updateFirmware.FlashJob()
+    else:
+        job = updateFirmware.FlashJob(lambda flashProgress: loop.call_soon_threadsafe(progress, flashProgress))
+
+    future = loop.run_in_executor(device.executor, device.flashBlocking, imageFile, cleanFileSystem,
+                                  modeSwitchTimeout, job)
+
+    try:
+        await future
+    except asyncio.CancelledError:
+        # The update stops at its next safe point, it can be completed later with the same image.
+        job.cancel()
+        raise
+
+
+async def otp_get_settings(device):
+    return await device.call(otpControl.getNumberOfDigitsAndType)
+
+
+async def otp_set_settings(device, key, type, numberOfDigits):
+    await device.call(otpControl.setSettings, key, type, numberOfDigits)
+
+
+async def send_time(device):
+    await device.call(totpService.sendTime)
+
+
+async def eth_get_info(device):
+    return await device.call(ethControl.getInfo)
+
+
+async def eth_get_random(device, length):
+    return await device.call(ethControl.getRandom, length)
+
+
+async def eth_init_wallet(device, seed, pin):
+    await device.call(ethControl.initWallet, seed, pin)
+
+
+async def eth_wipeout_wallet(device):
+    await device.call(ethControl.wipeoutWallet)
+
+
+async def eth_verify_pin(device, pin):
+    await device.call(ethControl.verifyPin, pin)
+
+
+async def eth_get_pin_tries_left(device):
+    return await device.call(ethControl.getPinTriesLeft)
+
+
+async def eth_get_public_key(device, derivationPath):
+    return await device.call(ethControl.getPublicKey, derivationPath)
+
+
+async def xrp_get_info(device):
+    return await device.call(xrpControl.getInfo)
+
+
+async def xrp_get_random(device, length):
+    return await device.call(xrpControl.getRandom, length)
+
+
+async def xrp_init_wallet(device, privateKey, pin):
+    await device.call(xrpControl.initWallet, privateKey, pin)
+
+
+async def xrp_wipeout_wallet(device):
+    await device.call(xrpControl.wipeoutWallet)
+
+
+async def xrp_verify_pin(device, pin):
+    await device.call(xrpControl.verifyPin, pin)
+
+
+async def xrp_get_pin_tries_left(device):
+    return await device.call(xrpControl.getPinTriesLeft)
+
+
+async def xrp_get_public_key(device):
+    return await device.call(xrpControl.getPublicKey)
+
+
+async def xrp_sign(device, dataToSign):
+    return await device.call(xrpControl.sign, dataToSign)
+
+
+async def ssl_get_public_key(device):
+    return await device.call(sslControl.getPublicKey)
+
+
+async def ssl_get_public_key_fingerprint(device):
+    return await device.call(sslControl.getPublicKeyFingerprint)
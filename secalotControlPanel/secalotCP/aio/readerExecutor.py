@@ -0,0 +1,50 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# A card processes one command at a time, so every reader gets a single thread. Operations on one
+# reader are serialized, different readers are served in parallel.
+executors = {}
+executorsLock = threading.Lock()
+
+
+def readerExecutor(readerName):
+    with executorsLock:
+        executor = executors.get(readerName)
+
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='secalot-reader')
+            executors[readerName] = executor
+
+        return executor
+
+
+def forgetReaderExecutors(readerNames):
+    # Called for readers that disappeared. Work already queued still completes, a replugged reader gets a new thread.
+    with executorsLock:
+        forgottenExecutors = [executors.pop(readerName) for readerName in readerNames if readerName in executors]
+
+    for executor in forgottenExecutors:
+        executor.shutdown(wait=False)
+
+
+def forgetMissingReaderExecutors(connectedReaderNames):
+    with executorsLock:
+        missingReaderNames = [readerName for readerName in executors if readerName not in connectedReaderNames]
+
+    forgetReaderExecutors(missingReaderNames)
+
+
+def shutdownExecutors(wait=True):
+    with executorsLock:
+        allExecutors = list(executors.values())
+        executors.clear()
+
+    for executor in allExecutors:
+        executor.shutdown(wait=wait)
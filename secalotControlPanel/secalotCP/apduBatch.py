@@ -0,0 +1,92 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from collections import namedtuple
+from contextlib import contextmanager
+
+from smartcard.Exceptions import CardConnectionException
+from smartcard.scard import SCardBeginTransaction, SCardEndTransaction, SCARD_S_SUCCESS, SCARD_LEAVE_CARD
+
+from secalotCP.appletSession import findSession, operation
+
+SW_SUCCESS = 0x9000
+
+ApduResponse = namedtuple('ApduResponse', 'data sw1 sw2')
+
+
+class ApduBatchError(Exception):
+    def __init__(self, index, response):
+        super().__init__()
+        self.index = index
+        self.response = response
+
+
+def findCardHandle(connection):
+    # Connections are wrapped by pyscard decorators and by our own pooled/session objects.
+    while connection is not None:
+        hcard = getattr(connection, 'hcard', None)
+        if hcard is not None:
+            return hcard
+        connection = getattr(connection, 'connection', None) or getattr(connection, 'component', None)
+
+    return None
+
+
+@contextmanager
+def exclusiveTransaction(connection):
+    session = findSession(connection)
+
+    # Helpers called from within a transaction run in it, the applet selected by an earlier one is still selected.
+    nested = session is not None and session.transactionDepth > 0
+    hcard = None if nested else findCardHandle(connection)
+
+    if hcard is not None:
+        hresult = SCardBeginTransaction(hcard)
+        if hresult != SCARD_S_SUCCESS:
+            raise CardConnectionException('Failed to begin a transaction', hresult=hresult)
+
+    try:
+        if session is not None:
+            # Another process may have selected its applet before the transaction began.
+            if not nested:
+                session.invalidate()
+            session.transactionDepth += 1
+
+        try:
+            with operation(connection):
+                yield
+        finally:
+            if session is not None:
+                session.transactionDepth -= 1
+    finally:
+        if hcard is not None:
+            SCardEndTransaction(hcard, SCARD_LEAVE_CARD)
+
+
+class ApduBatch(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def add(self, apdu, expectedStatusWords=(SW_SUCCESS,)):
+        self.commands.append((apdu, expectedStatusWords))
+        return self
+
+    def execute(self, connection):
+        responses = []
+
+        with exclusiveTransaction(connection):
+            for index, (apdu, expectedStatusWords) in enumerate(self.commands):
+                data, sw1, sw2 = connection.transmit(apdu)
+                response = ApduResponse(data, sw1, sw2)
+
+                if expectedStatusWords is not None and ((sw1 << 8) | sw2) not in expectedStatusWords:
+                    raise ApduBatchError(index, response)
+
+                responses.append(response)
+
+        return responses
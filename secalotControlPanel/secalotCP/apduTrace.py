@@ -0,0 +1,484 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Opt-in APDU tracing. Setting SECALOT_APDU_TRACE to a file name makes the utilities append a JSON line per
+# exchanged APDU to that file. Payloads of PIN, seed and OTP key APDUs and random numbers returned by the device
+# are redacted unless SECALOT_APDU_TRACE_SECRETS is set to 1.
+
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from collections import namedtuple
+
+import smartcard.System
+from smartcard.Exceptions import CardConnectionException
+
+import secalotCP.readerMonitor as readerMonitor
+from secalotCP.appletSession import OTP_APPLET_AID, isSelectAPDU
+
+READER_NAME = 'Secalot Secalot Dongle'
+BOOTLOADER_READER_NAME = 'Secalot Secalot Bootloader'
+
+TRACE_ENVIRONMENT_VARIABLE = 'SECALOT_APDU_TRACE'
+TRACE_SECRETS_ENVIRONMENT_VARIABLE = 'SECALOT_APDU_TRACE_SECRETS'
+
+# VERIFY, CHANGE REFERENCE DATA and RESET RETRY COUNTER carry PINs in every applet. Wallet initialisation uses
+# INS 0x20 as well, so seeds and private keys are covered by the same rule.
+REDACTED_INS = (0x20, 0x22, 0x24, 0x2C)
+REDACTED_APPLET_INS = {OTP_APPLET_AID: (0x01,)}
+REDACTED_RESPONSE_INS = (0xC0,)
+
+READER_WAIT_TIMEOUT = 30.0
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+HISTOGRAM_BUCKETS = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+HISTOGRAM_WIDTH = 40
+
+TraceRecord = namedtuple('TraceRecord', 'timestamp reader header lc le data sw responseLength response duration error')
+
+traceWriter = None
+originalReaders = None
+
+
+class TraceReplayError(Exception):
+    def __init__(self, message):
+        super().__init__()
+        self.message = message
+
+
+def splitAPDU(apdu):
+    apdu = bytes(apdu)
+
+    if len(apdu) == 5:
+        return apdu[0:4], None, apdu[4], b''
+
+    if len(apdu) > 5:
+        return apdu[0:4], apdu[4], None, apdu[5:5 + apdu[4]]
+
+    return apdu[0:4], None, None, b''
+
+
+def commandRedacted(header, selectedAID):
+    if len(header) < 2:
+        return False
+
+    return header[1] in REDACTED_INS or header[1] in REDACTED_APPLET_INS.get(selectedAID, ())
+
+
+def responseRedacted(header):
+    return len(header) >= 2 and header[1] in REDACTED_RESPONSE_INS
+
+
+class TraceWriter(object):
+
+    def __init__(self, file, includeSecrets=False):
+        self.file = file
+        self.includeSecrets = includeSecrets
+        self.lock = threading.Lock()
+
+    def record(self, reader, selectedAID, apdu, response, sw1, sw2, timestamp, duration, error=None):
+        header, lc, le, data = splitAPDU(apdu)
+
+        if not self.includeSecrets and commandRedacted(header, selectedAID):
+            data = None
+        else:
+            data = data.hex()
+
+        if sw1 is None:
+            sw = None
+            responseLength = None
+            response = None
+        else:
+            sw = format((sw1 << 8) | sw2, '04x')
+            responseLength = len(response)
+            if not self.includeSecrets and responseRedacted(header):
+                response = None
+            else:
+                response = bytes(response).hex()
+
+        traceRecord = TraceRecord(timestamp, reader, header.hex(), lc, le, data, sw, responseLength, response,
+                                  duration, error)
+
+        line = json.dumps(traceRecord._asdict(), separators=(',', ':'))
+
+        with self.lock:
+            self.file.write(line + '\n')
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+def traceTransmit(reader, apdu, transmit, selectedAID=None):
+    writer = traceWriter
+
+    if writer is None:
+        return transmit(apdu)
+
+    timestamp = time.time()
+    start = time.perf_counter()
+
+    try:
+        response, sw1, sw2 = transmit(apdu)
+    except Exception as e:
+        writer.record(reader, selectedAID, apdu, None, None, None, timestamp, time.perf_counter() - start,
+                      type(e).__name__)
+        raise
+
+    writer.record(reader, selectedAID, apdu, response, sw1, sw2, timestamp, time.perf_counter() - start)
+
+    return response, sw1, sw2
+
+
+class TracingConnection(object):
+
+    def __init__(self, connection, readerName):
+        self.connection = connection
+        self.readerName = readerName
+        self.selectedAID = None
+
+    def transmit(self, apdu, protocol=None):
+        selectedAID = self.selectedAID
+
+        response, sw1, sw2 = traceTransmit(self.readerName, apdu,
+                                           lambda apdu: self.connection.transmit(apdu, protocol), selectedAID)
+
+        if isSelectAPDU(apdu):
+            if sw1 == 0x90 and sw2 == 0x00:
+                self.selectedAID = bytes(apdu[5:5 + apdu[4]])
+            else:
+                self.selectedAID = None
+
+        return response, sw1, sw2
+
+    def connect(self, *args, **kwargs):
+        self.selectedAID = None
+        self.connection.connect(*args, **kwargs)
+
+    def disconnect(self):
+        self.selectedAID = None
+        self.connection.disconnect()
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+
+class TracingReader(object):
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.name = reader.name
+
+    def createConnection(self):
+        return TracingConnection(self.reader.createConnection(), self.name)
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return str(self.reader)
+
+    def __str__(self):
+        return str(self.reader)
+
+
+def tracedReaders(groups=[]):
+    return [TracingReader(reader) for reader in originalReaders(groups)]
+
+
+def install(fileName, includeSecrets=False):
+    global traceWriter, originalReaders
+
+    uninstall()
+
+    # Traces show which applets are used and may hold secrets, a new file is only readable by its owner.
+    traceFile = os.fdopen(os.open(fileName, os.O_CREAT | os.O_WRONLY | os.O_APPEND, 0o600), 'a')
+
+    traceWriter = TraceWriter(traceFile, includeSecrets)
+    originalReaders = smartcard.System.readers
+    smartcard.System.readers = tracedReaders
+
+
+def uninstall():
+    global traceWriter, originalReaders
+
+    if originalReaders is not None:
+        smartcard.System.readers = originalReaders
+        originalReaders = None
+
+    if traceWriter is not None:
+        traceWriter.close()
+        traceWriter = None
+
+
+def installFromEnvironment():
+    fileName = os.environ.get(TRACE_ENVIRONMENT_VARIABLE)
+
+    if fileName:
+        install(fileName, os.environ.get(TRACE_SECRETS_ENVIRONMENT_VARIABLE) == '1')
+
+
+def readTrace(file):
+    records = []
+
+    for line in file:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        records.append(TraceRecord(**json.loads(line)))
+
+    return records
+
+
+def commandClass(record):
+    return bytes.fromhex(record.header)[1]
+
+
+def latenciesByCommandClass(records):
+    latencies = {}
+
+    for record in records:
+        latencies.setdefault(commandClass(record), []).append(record.duration * 1000)
+
+    return latencies
+
+
+def histogram(latencies):
+    counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    for latency in latencies:
+        index = next((index for index, bound in enumerate(HISTOGRAM_BUCKETS) if latency < bound),
+                     len(HISTOGRAM_BUCKETS))
+        counts[index] += 1
+
+    return counts
+
+
+def percentile(sortedValues, fraction):
+    return sortedValues[min(int(len(sortedValues) * fraction), len(sortedValues) - 1)]
+
+
+def printSummary(records):
+    latencies = latenciesByCommandClass(records)
+
+    for ins in sorted(latencies.keys()):
+        values = sorted(latencies[ins])
+
+        print('')
+        print('INS ' + format(ins, '02X') + ': ' + str(len(values)) + ' APDUs, mean ' +
+              format(statistics.mean(values), '.2f') + ' ms, median ' + format(percentile(values, 0.5), '.2f') +
+              ' ms, p95 ' + format(percentile(values, 0.95), '.2f') + ' ms, max ' + format(values[-1], '.2f') + ' ms')
+
+        counts = histogram(values)
+        largestCount = max(counts)
+        lowerBound = 0
+
+        for index, count in enumerate(counts):
+            if index < len(HISTOGRAM_BUCKETS):
+                label = format(lowerBound, 'g') + '-' + format(HISTOGRAM_BUCKETS[index], 'g') + ' ms'
+                lowerBound = HISTOGRAM_BUCKETS[index]
+            else:
+                label = '>= ' + format(lowerBound, 'g') + ' ms'
+
+            if count != 0:
+                print('  ' + label.rjust(14) + ' ' + str(count).rjust(6) + ' ' +
+                      '#' * max(1, round(count * HISTOGRAM_WIDTH / largestCount)))
+
+
+def readerPrefix(readerName):
+    for prefix in (BOOTLOADER_READER_NAME, READER_NAME):
+        if readerName.startswith(prefix):
+            return prefix
+
+    return readerName
+
+
+class TraceReplayer(object):
+    # Maps readers from the trace to connected readers. A reader with the very same name is preferred,
+    # otherwise the first unassigned reader of the same kind is used.
+
+    def __init__(self, readerTimeout=READER_WAIT_TIMEOUT):
+        self.readerTimeout = readerTimeout
+        self.readerNames = {}
+        self.connections = {}
+        self.replayedRecords = []
+
+    def findReader(self, traceReaderName):
+        deadline = time.monotonic() + self.readerTimeout
+        prefix = readerPrefix(traceReaderName)
+        assignedReaderNames = [readerName for traceName, readerName in self.readerNames.items() if
+                               traceName != traceReaderName]
+
+        while True:
+            readers = smartcard.System.readers()
+
+            reader = next((reader for reader in readers if reader.name == traceReaderName), None)
+            if reader is None:
+                reader = next((reader for reader in readers if reader.name.startswith(prefix) and
+                               reader.name not in assignedReaderNames), None)
+
+            if reader is not None:
+                return reader
+
+            if time.monotonic() >= deadline:
+                raise TraceReplayError('No reader found for ' + traceReaderName + '.')
+
+            time.sleep(readerMonitor.POLLING_INTERVAL)
+
+    def connect(self, traceReaderName):
+        readerName = self.readerNames.get(traceReaderName)
+
+        if readerName is not None:
+            # The device may be reenumerating after a mode switch.
+            try:
+                readerName, elapsed = readerMonitor.waitForReadyReader(readerName, self.readerTimeout)
+            except readerMonitor.ReaderWaitTimeoutError:
+                readerName = None
+
+        reader = None
+        if readerName is not None:
+            reader = next((reader for reader in smartcard.System.readers() if reader.name == readerName), None)
+        if reader is None:
+            reader = self.findReader(traceReaderName)
+
+        connection = reader.createConnection()
+        connection.connect()
+
+        self.readerNames[traceReaderName] = reader.name
+        self.connections[traceReaderName] = connection
+
+        return connection
+
+    def disconnect(self, traceReaderName):
+        connection = self.connections.pop(traceReaderName, None)
+
+        if connection is not None:
+            try:
+                connection.disconnect()
+            except Exception:
+                pass
+
+    def transmit(self, traceReaderName, apdu):
+        connection = self.connections.get(traceReaderName)
+
+        if connection is None:
+            connection = self.connect(traceReaderName)
+
+        try:
+            return connection.transmit(apdu)
+        except CardConnectionException:
+            self.disconnect(traceReaderName)
+            return self.connect(traceReaderName).transmit(apdu)
+
+    def replay(self, records, speed=1.0, keepTiming=True):
+        skipped = 0
+        mismatched = 0
+
+        if len(records) == 0:
+            return skipped, mismatched
+
+        firstTimestamp = records[0].timestamp
+        start = time.monotonic()
+
+        for record in records:
+            if record.data is None:
+                skipped += 1
+                continue
+
+            if keepTiming:
+                delay = start + (record.timestamp - firstTimestamp) / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+            apdu = list(bytes.fromhex(record.header))
+            if record.lc is not None:
+                apdu += [record.lc] + list(bytes.fromhex(record.data))
+            elif record.le is not None:
+                apdu += [record.le]
+
+            timestamp = time.time()
+            transmitStart = time.perf_counter()
+            response, sw1, sw2 = self.transmit(record.reader, apdu)
+            duration = time.perf_counter() - transmitStart
+
+            sw = format((sw1 << 8) | sw2, '04x')
+            if record.sw is not None and sw != record.sw:
+                mismatched += 1
+
+            self.replayedRecords.append(record._replace(timestamp=timestamp, sw=sw, responseLength=len(response),
+                                                        response=None, duration=duration, error=None))
+
+        return skipped, mismatched
+
+    def close(self):
+        for traceReaderName in list(self.connections.keys()):
+            self.disconnect(traceReaderName)
+
+
+def speedFactor(string):
+    value = float(string)
+    if value <= 0:
+        raise argparse.ArgumentTypeError('The value should be greater than zero')
+    return value
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='APDU trace tools.')
+    parser._optionals.title = 'Options'
+    subparsers = parser.add_subparsers(dest='subcommand')
+    subparsers.required = True
+    parserSummary = subparsers.add_parser('summary', help='Print latency histograms per command class (INS byte).')
+    parserSummary._optionals.title = 'Options'
+    parserSummary.add_argument('--traceFile', required=True, type=argparse.FileType('r'), help=('Trace file.'))
+    parserReplay = subparsers.add_parser('replay', help='Send the traced APDUs to connected devices again.')
+    parserReplay._optionals.title = 'Options'
+    parserReplay.add_argument('--traceFile', required=True, type=argparse.FileType('r'), help=('Trace file.'))
+    parserReplay.add_argument('--speed', type=speedFactor, default=1.0,
+                              help=('Replay speed relative to the recorded timing.'))
+    parserReplay.add_argument('--asFastAsPossible', action='store_true',
+                              help=('Ignore the recorded timing and send the APDUs back to back.'))
+    parserReplay.add_argument('--readerTimeout', type=float, default=READER_WAIT_TIMEOUT,
+                              help=('Seconds to wait for a reader to appear.'))
+
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    arguments = parse_arguments()
+
+    try:
+        records = readTrace(arguments.traceFile)
+
+        if arguments.subcommand == 'summary':
+            printSummary(records)
+        elif arguments.subcommand == 'replay':
+            installFromEnvironment()
+            replayer = TraceReplayer(arguments.readerTimeout)
+            try:
+                skipped, mismatched = replayer.replay(records, arguments.speed, not arguments.asFastAsPossible)
+            finally:
+                replayer.close()
+
+            print('Replayed ' + str(len(replayer.replayedRecords)) + ' APDUs, skipped ' + str(skipped) +
+                  ' redacted APDUs, ' + str(mismatched) + ' status words differ from the trace.')
+            printSummary(replayer.replayedRecords)
+    except TraceReplayError as e:
+        print('Error: ' + e.message)
+    except (ValueError, TypeError):
+        print('Error: invalid trace file.')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from contextlib import contextmanager
+
+SELECT_HEADER = bytes([0x00, 0xA4, 0x04, 0x00])
+
+OTP_APPLET_AID = b'OTPAPPLET'
+ETH_APPLET_AID = b'ETHAPPLET'
+XRP_APPLET_AID = b'XRPAPPLET'
+SSL_APPLET_AID = b'SSLAPPLET'
+BOOTLOADER_APPLET_AID = b'BLDRAPPLET'
+
+# First status bytes the Secalot applets answer with while staying selected.
+# Anything else, e.g. 6D00 from another applet, may mean the card lost the selection, so the next SELECT
+# is sent to the card.
+APPLET_STATUS_SW1 = (0x90, 0x63, 0x64, 0x67, 0x69)
+
+
+def isSelectAPDU(apdu):
+    return len(apdu) > 5 and bytes(apdu[0:4]) == SELECT_HEADER
+
+
+def selectAPDU(aid):
+    return list(SELECT_HEADER) + [len(aid)] + list(aid)
+
+
+class AppletSession(object):
+    # Other processes select their own applets on the same card between our operations, so a repeated
+    # SELECT is only skipped within one operation. The first SELECT of every operation and of every
+    # exclusive transaction reaches the card, helpers nested in a transaction reuse its selection.
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.selectedAID = None
+        self.selectResponse = None
+        self.savedRoundTrips = 0
+        self.operationDepth = 0
+        self.transactionDepth = 0
+
+    def transmit(self, apdu, protocol=None):
+        if isSelectAPDU(apdu):
+            aid = bytes(apdu[5:5 + apdu[4]])
+
+            if self.operationDepth > 0 and aid == self.selectedAID:
+                self.savedRoundTrips += 1
+                return list(self.selectResponse), 0x90, 0x00
+
+            response, sw1, sw2 = self.connection.transmit(apdu, protocol)
+
+            if sw1 == 0x90 and sw2 == 0x00:
+                self.selectedAID = aid
+                self.selectResponse = list(response)
+            else:
+                self.invalidate()
+
+            return response, sw1, sw2
+
+        response, sw1, sw2 = self.connection.transmit(apdu, protocol)
+
+        if sw1 not in APPLET_STATUS_SW1:
+            self.invalidate()
+
+        return response, sw1, sw2
+
+    def select(self, aid):
+        return self.transmit(selectAPDU(aid))
+
+    def invalidate(self):
+        self.selectedAID = None
+        self.selectResponse = None
+
+    def beginOperation(self):
+        if self.operationDepth == 0:
+            self.invalidate()
+        self.operationDepth += 1
+
+    def endOperation(self):
+        if self.operationDepth > 0:
+            self.operationDepth -= 1
+            if self.operationDepth == 0:
+                self.invalidate()
+
+    def restartOperation(self):
+        # For connections used by one operation at a time. An operation that was never ended, e.g. because
+        # a firmware update replaced its connection, is ended by the next one.
+        self.invalidate()
+        self.operationDepth = 1
+
+    def connect(self, *args, **kwargs):
+        self.invalidate()
+        self.connection.connect(*args, **kwargs)
+
+    def disconnect(self):
+        self.invalidate()
+        self.connection.disconnect()
+
+    def getATR(self):
+        return self.connection.getATR()
+
+
+def findSession(connection):
+    if isinstance(connection, AppletSession):
+        return connection
+
+    session = getattr(connection, 'session', None)
+
+    if isinstance(session, AppletSession):
+        return session
+
+    return None
+
+
+@contextmanager
+def operation(connection):
+    session = findSession(connection)
+
+    if session is None:
+        yield
+        return
+
+    session.beginOperation()
+    try:
+        yield
+    finally:
+        session.endOperation()
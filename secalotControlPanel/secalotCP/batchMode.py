@@ -0,0 +1,106 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import argparse
+import json
+import shlex
+import sys
+
+from secalotCP.appletSession import operation
+
+BATCH_HELP = ('Execute subcommands read from FILE, one per line with the same syntax as the command line, '
+              'over a single connection. Use - to read them from the standard input. '
+              'Results are printed as JSON lines.')
+
+
+class BatchCommandError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+class BatchArgumentParser(argparse.ArgumentParser):
+    # Reports invalid lines to the caller instead of exiting, the remaining lines are still executed.
+
+    def error(self, message):
+        raise BatchCommandError(message)
+
+    def exit(self, status=0, message=None):
+        raise BatchCommandError(message or 'Unexpected exit.')
+
+    def print_help(self, file=None):
+        raise BatchCommandError('Help is not available in batch mode.')
+
+
+def addBatchArgument(parser):
+    # The subcommand is given either on the command line or by the batch file, checkArguments enforces that.
+    parser.add_argument('--batch', metavar='FILE', default=None, help=BATCH_HELP)
+
+
+def checkArguments(parser, arguments):
+    if arguments.batch is None and arguments.subcommand is None:
+        parser.error('a subcommand or --batch is required')
+
+
+def readLines(fileName):
+    if fileName == '-':
+        for line in sys.stdin:
+            yield line
+    else:
+        with open(fileName, 'r') as file:
+            for line in file:
+                yield line
+
+
+def parseLine(parser, line):
+    try:
+        argv = shlex.split(line)
+    except ValueError as e:
+        raise BatchCommandError(str(e))
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.subcommand is None:
+        raise BatchCommandError('a subcommand is required')
+    if arguments.batch is not None:
+        raise BatchCommandError('--batch can not be nested')
+
+    return arguments
+
+
+def printRecord(record):
+    print(json.dumps(record), flush=True)
+
+
+def runBatch(parser, fileName, connection, executeSubcommand, errors, errorMessage):
+    # Errors listed in errors are reported for their line, anything else, e.g. a lost card, ends the batch.
+    failed = 0
+
+    for lineNumber, line in enumerate(readLines(fileName), 1):
+        line = line.strip()
+
+        if line == '' or line.startswith('#'):
+            continue
+
+        # The line itself is not echoed, it may carry a PIN, seed or key.
+        record = {'line': lineNumber}
+
+        try:
+            arguments = parseLine(parser, line)
+            record['subcommand'] = arguments.subcommand
+            with operation(connection):
+                record['result'] = executeSubcommand(connection, arguments)
+        except BatchCommandError as e:
+            record['error'] = e.message
+            failed += 1
+        except errors as e:
+            record['error'] = errorMessage(e)
+            failed += 1
+
+        printRecord(record)
+
+    return failed
@@ -0,0 +1,249 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# BIP32 key derivation on secp256k1. Non-hardened public children are derived on the host from a node
+# read from the device once. Points stay in Jacobian coordinates while children are derived and are
+# converted to affine ones together, with a single modular inversion per batch.
+
+import hashlib
+import hmac
+import threading
+from collections import namedtuple
+
+P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+GX = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+GY = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+
+HARDENED = 0x80000000
+
+WINDOW_BITS = 8
+WINDOWS = 256 // WINDOW_BITS
+
+INFINITY = (1, 1, 0)
+
+PublicNode = namedtuple('PublicNode', 'publicKey chainCode')
+PrivateNode = namedtuple('PrivateNode', 'privateKey chainCode')
+
+
+class InvalidChildError(Exception):
+    # Happens with a probability below 2^-127, BIP32 says to proceed with the next index.
+    pass
+
+
+class InvalidPublicKeyError(Exception):
+    pass
+
+
+def inverse(value):
+    return pow(value, P - 2, P)
+
+
+def jacobianDouble(point):
+    x, y, z = point
+
+    if z == 0 or y == 0:
+        return INFINITY
+
+    yy = y * y % P
+    s = 4 * x * yy % P
+    m = 3 * x * x % P
+    x3 = (m * m - 2 * s) % P
+    y3 = (m * (s - x3) - 8 * yy * yy) % P
+    z3 = 2 * y * z % P
+
+    return x3, y3, z3
+
+
+def jacobianAddAffine(point, x2, y2):
+    x1, y1, z1 = point
+
+    if z1 == 0:
+        return x2, y2, 1
+
+    z1z1 = z1 * z1 % P
+    h = (x2 * z1z1 - x1) % P
+    r = (y2 * z1 * z1z1 - y1) % P
+
+    if h == 0:
+        if r == 0:
+            return jacobianDouble(point)
+        return INFINITY
+
+    hh = h * h % P
+    hhh = h * hh % P
+    v = x1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - y1 * hhh) % P
+    z3 = z1 * h % P
+
+    return x3, y3, z3
+
+
+def toAffine(points):
+    # Montgomery's trick: one inversion for the whole list instead of one per point.
+    products = []
+    product = 1
+
+    for x, y, z in points:
+        if z == 0:
+            raise InvalidChildError()
+        product = product * z % P
+        products.append(product)
+
+    productInverse = inverse(product)
+    result = [None] * len(points)
+
+    for index in range(len(points) - 1, -1, -1):
+        x, y, z = points[index]
+
+        if index > 0:
+            zInverse = productInverse * products[index - 1] % P
+            productInverse = productInverse * z % P
+        else:
+            zInverse = productInverse
+
+        zInverse2 = zInverse * zInverse % P
+        result[index] = (x * zInverse2 % P, y * zInverse2 * zInverse % P)
+
+    return result
+
+
+baseTable = None
+baseTableLock = threading.Lock()
+
+
+def generatorTable():
+    # table[window][digit - 1] is digit * 2^(window * WINDOW_BITS) * G in affine coordinates.
+    global baseTable
+
+    with baseTableLock:
+        if baseTable is None:
+            points = []
+            baseX, baseY = GX, GY
+
+            for window in range(0, WINDOWS):
+                point = (baseX, baseY, 1)
+                windowPoints = [point]
+
+                for digit in range(2, 1 << WINDOW_BITS):
+                    point = jacobianAddAffine(point, baseX, baseY)
+                    windowPoints.append(point)
+
+                windowPoints = toAffine(windowPoints)
+                points.append(windowPoints)
+
+                # The next window's base is 2^WINDOW_BITS times this one, i.e. its largest multiple plus one.
+                lastX, lastY = windowPoints[-1]
+                baseX, baseY = toAffine([jacobianAddAffine((lastX, lastY, 1), baseX, baseY)])[0]
+
+            baseTable = points
+
+        return baseTable
+
+
+def multiplyGenerator(scalar):
+    table = generatorTable()
+    mask = (1 << WINDOW_BITS) - 1
+    point = INFINITY
+
+    for window in range(0, WINDOWS):
+        digit = (scalar >> (window * WINDOW_BITS)) & mask
+
+        if digit != 0:
+            x, y = table[window][digit - 1]
+            point = jacobianAddAffine(point, x, y)
+
+    return point
+
+
+def parsePublicKey(publicKey):
+    if len(publicKey) != 65 or publicKey[0] != 0x04:
+        raise InvalidPublicKeyError()
+
+    x = int.from_bytes(publicKey[1:33], 'big')
+    y = int.from_bytes(publicKey[33:], 'big')
+
+    if x >= P or y >= P or (y * y - x * x * x - 7) % P != 0:
+        raise InvalidPublicKeyError()
+
+    return x, y
+
+
+def uncompressedPublicKey(x, y):
+    return b'\x04' + x.to_bytes(32, 'big') + y.to_bytes(32, 'big')
+
+
+def compressedPublicKey(x, y):
+    return bytes([0x02 | (y & 1)]) + x.to_bytes(32, 'big')
+
+
+def publicChildren(node, indexes):
+    parentX, parentY = parsePublicKey(node.publicKey)
+    parentData = compressedPublicKey(parentX, parentY)
+
+    points = []
+    chainCodes = []
+
+    for index in indexes:
+        if index & HARDENED:
+            raise ValueError('Hardened children can not be derived from a public node')
+
+        digest = hmac.new(node.chainCode, parentData + index.to_bytes(4, 'big'), hashlib.sha512).digest()
+        tweak = int.from_bytes(digest[:32], 'big')
+
+        if tweak >= N:
+            raise InvalidChildError()
+
+        points.append(jacobianAddAffine(multiplyGenerator(tweak), parentX, parentY))
+        chainCodes.append(digest[32:])
+
+    return [PublicNode(uncompressedPublicKey(x, y), chainCode) for (x, y), chainCode in
+            zip(toAffine(points), chainCodes)]
+
+
+def publicChild(node, index):
+    return publicChildren(node, [index])[0]
+
+
+def masterNode(seed):
+    digest = hmac.new(b'Bitcoin seed', bytes(seed), hashlib.sha512).digest()
+    privateKey = int.from_bytes(digest[:32], 'big')
+
+    if privateKey == 0 or privateKey >= N:
+        raise InvalidChildError()
+
+    return PrivateNode(privateKey, digest[32:])
+
+
+def privateChild(node, index):
+    if index & HARDENED:
+        data = b'\x00' + node.privateKey.to_bytes(32, 'big')
+    else:
+        data = compressedPublicKey(*toAffine([multiplyGenerator(node.privateKey)])[0])
+
+    digest = hmac.new(node.chainCode, data + index.to_bytes(4, 'big'), hashlib.sha512).digest()
+    tweak = int.from_bytes(digest[:32], 'big')
+    privateKey = (tweak + node.privateKey) % N
+
+    if tweak >= N or privateKey == 0:
+        raise InvalidChildError()
+
+    return PrivateNode(privateKey, digest[32:])
+
+
+def privateNodeAtPath(seed, path):
+    node = masterNode(seed)
+
+    for index in path:
+        node = privateChild(node, index)
+
+    return node
+
+
+def publicNode(node):
+    return PublicNode(uncompressedPublicKey(*toAffine([multiplyGenerator(node.privateKey)])[0]), node.chainCode)
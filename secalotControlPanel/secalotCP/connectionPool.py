@@ -0,0 +1,140 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import threading
+
+import smartcard.System
+from smartcard.Exceptions import CardConnectionException
+from smartcard.scard import SCARD_W_RESET_CARD, SCARD_W_REMOVED_CARD
+
+from secalotCP.appletSession import AppletSession
+
+
+class ReaderNotFoundError(Exception):
+    pass
+
+
+class PooledConnection(object):
+
+    def __init__(self, pool, readerName, connection):
+        self.pool = pool
+        self.readerName = readerName
+        self.connection = connection
+        self.session = AppletSession(connection)
+
+    def transmit(self, apdu, protocol=None):
+        try:
+            return self.session.transmit(apdu, protocol)
+        except CardConnectionException as e:
+            # The card was reset or replugged since the last operation. The APDU was not processed,
+            # so it is safe to reestablish the connection, restore the applet selection and send it once more.
+            # Other failures, e.g. a timeout, may come after the card has processed the APDU. Sending it again
+            # could verify a PIN-code twice or sign twice, so they are raised. The handle may be dead as well,
+            # e.g. after pcscd restarted, so it is dropped from the pool and the next operation connects again.
+            if getattr(e, 'hresult', None) not in (SCARD_W_RESET_CARD, SCARD_W_REMOVED_CARD):
+                self.disconnect()
+                raise
+
+            selectedAID = self.session.selectedAID
+            self.reconnect()
+            if selectedAID is not None:
+                self.session.select(selectedAID)
+            return self.session.transmit(apdu, protocol)
+
+    def reconnect(self):
+        try:
+            self.session.disconnect()
+        except Exception:
+            pass
+
+        try:
+            self.session.connect()
+        except Exception:
+            self.disconnect()
+            raise
+
+    def getATR(self):
+        return self.connection.getATR()
+
+    def disconnect(self):
+        with self.pool.lock:
+            if self.pool.connections.get(self.readerName) is self:
+                self.pool.evict(self.readerName)
+                return
+
+        self.connection.disconnect()
+
+
+class ConnectionPool(object):
+
+    # The daemon shares one pool between its handler threads, connections of a failed transmit are evicted
+    # from any of them.
+
+    def __init__(self):
+        self.connections = {}
+        self.retiredSavedRoundTrips = 0
+        self.lock = threading.RLock()
+
+    def getConnection(self, readerName):
+        with self.lock:
+            connection = self.connections.get(readerName)
+
+            if connection is not None:
+                return connection
+
+            connectedReaders = smartcard.System.readers()
+
+            reader = next((reader for reader in connectedReaders if readerName in reader.name), None)
+
+            if reader is None:
+                raise ReaderNotFoundError()
+
+            cardConnection = reader.createConnection()
+            cardConnection.connect()
+
+            connection = PooledConnection(self, readerName, cardConnection)
+            self.connections[readerName] = connection
+
+            return connection
+
+    def release(self, connection):
+        if connection is None:
+            return
+
+        with self.lock:
+            if self.connections.get(getattr(connection, 'readerName', None)) is connection:
+                return
+
+        try:
+            connection.disconnect()
+        except Exception:
+            pass
+
+    def evict(self, readerName):
+        with self.lock:
+            connection = self.connections.pop(readerName, None)
+
+            if connection is not None:
+                self.retiredSavedRoundTrips += connection.session.savedRoundTrips
+
+        if connection is not None:
+            try:
+                connection.connection.disconnect()
+            except Exception:
+                pass
+
+    def savedRoundTrips(self):
+        with self.lock:
+            return self.retiredSavedRoundTrips + sum(
+                connection.session.savedRoundTrips for connection in self.connections.values())
+
+    def evictAll(self):
+        with self.lock:
+            readerNames = list(self.connections.keys())
+
+        for readerName in readerNames:
+            self.evict(readerName)
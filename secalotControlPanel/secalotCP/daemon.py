@@ -0,0 +1,423 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+
+import smartcard.System
+from smartcard.Exceptions import SmartcardException, CardConnectionException
+
+import secalotCP.apduTrace as apduTrace
+from secalotCP.connectionPool import ConnectionPool, ReaderNotFoundError
+
+SOCKET_ENVIRONMENT_VARIABLE = 'SECALOT_DAEMON_SOCKET'
+
+ERROR_PARSE = -32700
+ERROR_INVALID_REQUEST = -32600
+ERROR_METHOD_NOT_FOUND = -32601
+ERROR_INVALID_PARAMS = -32602
+ERROR_INTERNAL = -32603
+ERROR_READER_NOT_FOUND = 1
+ERROR_CARD = 2
+ERROR_READER_BUSY = 3
+
+# How long a client waits for a reader claimed by another client.
+CLAIM_TIMEOUT = 30
+
+
+class DaemonError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class UnsafeSocketPathError(Exception):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Keep Secalot connections open and serve them to local clients.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--socket', default=None,
+                        help=('Unix domain socket to listen on. Defaults to $' + SOCKET_ENVIRONMENT_VARIABLE +
+                              ' or a per-user socket in the runtime directory.'))
+    args = parser.parse_args()
+    return args
+
+
+def defaultSocketPath():
+    socketPath = os.environ.get(SOCKET_ENVIRONMENT_VARIABLE)
+
+    if socketPath is not None:
+        return socketPath
+
+    runtimeDirectory = os.environ.get('XDG_RUNTIME_DIR')
+
+    if runtimeDirectory:
+        return os.path.join(runtimeDirectory, 'secalot-daemon.sock')
+
+    # Anyone can create files in the temporary directory, the socket is kept in a private directory there.
+    return os.path.join(tempfile.gettempdir(), 'secalot-' + str(os.getuid()), 'daemon.sock')
+
+
+def preparePrivateDirectory(directory):
+    # PIN-codes, seeds and keys pass through the socket, nobody else may be able to replace it.
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+
+    status = os.lstat(directory)
+
+    if not stat.S_ISDIR(status.st_mode) or status.st_uid != os.getuid() or status.st_mode & 0o022:
+        raise UnsafeSocketPathError(directory)
+
+
+def checkDaemonSocket(socketPath):
+    status = os.lstat(socketPath)
+
+    if not stat.S_ISSOCK(status.st_mode) or status.st_uid != os.getuid():
+        raise UnsafeSocketPathError(socketPath)
+
+
+def checkPeer(sock, socketPath):
+    # The socket file may have been replaced after it was checked, the listening process is checked as well.
+    if hasattr(socket, 'SO_PEERCRED'):
+        credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        pid, uid, gid = struct.unpack('3i', credentials)
+
+        if uid != os.getuid():
+            raise UnsafeSocketPathError(socketPath)
+
+
+class ReaderSlot(object):
+    # A client keeps a reader from its first command until it releases it or disconnects,
+    # so the command sequences of different clients, e.g. SELECT and what follows, never interleave.
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+
+    def setup(self):
+        super().setup()
+        # Slots by full reader name, and the full names of the names the client used.
+        self.claimedReaders = {}
+        self.readerNames = {}
+
+    def handle(self):
+        for line in self.rfile:
+            response = {'jsonrpc': '2.0', 'id': None}
+
+            try:
+                try:
+                    request = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    raise DaemonError(ERROR_PARSE, 'Parse error.')
+
+                if not isinstance(request, dict):
+                    raise DaemonError(ERROR_INVALID_REQUEST, 'Invalid request.')
+
+                response['id'] = request.get('id')
+                response['result'] = self.dispatch(request.get('method'), request.get('params', {}))
+            except DaemonError as e:
+                response['error'] = {'code': e.code, 'message': e.message}
+            except Exception as e:
+                response['error'] = {'code': ERROR_INTERNAL, 'message': str(e) or type(e).__name__}
+
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+    def finish(self):
+        for slot in self.claimedReaders.values():
+            slot.lock.release()
+
+        self.claimedReaders = {}
+
+        super().finish()
+
+    def dispatch(self, method, params):
+        if method == 'ping':
+            return 'pong'
+        elif method == 'listReaders':
+            return [reader.name for reader in smartcard.System.readers()]
+
+        try:
+            readerName = params['reader']
+        except (KeyError, TypeError):
+            raise DaemonError(ERROR_INVALID_PARAMS, 'Reader name missing.')
+
+        if method == 'connect':
+            self.claimConnection(readerName)
+            return None
+        elif method == 'transmit':
+            try:
+                apdu = list(bytes.fromhex(params['apdu']))
+            except (KeyError, ValueError):
+                raise DaemonError(ERROR_INVALID_PARAMS, 'Invalid APDU.')
+
+            data, sw1, sw2 = self.cardOperation(readerName, lambda connection: connection.transmit(apdu))
+            return {'data': bytes(data).hex(), 'sw1': sw1, 'sw2': sw2}
+        elif method == 'getATR':
+            return bytes(self.cardOperation(readerName, lambda connection: connection.getATR())).hex()
+        elif method == 'release':
+            self.release(readerName)
+            return None
+        else:
+            raise DaemonError(ERROR_METHOD_NOT_FOUND, 'Method not found.')
+
+    def claimConnection(self, readerName):
+        # Clients may name a reader by a part of its name. Slots and connections are keyed by the full name,
+        # so clients naming the same reader differently still take turns.
+        fullReaderName = self.readerNames.get(readerName)
+
+        if fullReaderName is None:
+            fullReaderName = self.server.fullReaderName(readerName)
+            self.readerNames[readerName] = fullReaderName
+
+        if fullReaderName not in self.claimedReaders:
+            slot = self.server.readerSlot(fullReaderName)
+            if not slot.lock.acquire(timeout=CLAIM_TIMEOUT):
+                raise DaemonError(ERROR_READER_BUSY, 'Reader is used by another client.')
+            self.claimedReaders[fullReaderName] = slot
+
+        try:
+            return self.server.connectionPool.getConnection(fullReaderName)
+        except ReaderNotFoundError:
+            raise DaemonError(ERROR_READER_NOT_FOUND, 'Reader not found.')
+        except SmartcardException as e:
+            raise DaemonError(ERROR_CARD, str(e))
+
+    def cardOperation(self, readerName, operation):
+        connection = self.claimConnection(readerName)
+
+        try:
+            return operation(connection)
+        except SmartcardException as e:
+            self.server.connectionPool.evict(connection.readerName)
+            raise DaemonError(ERROR_CARD, str(e))
+
+    def release(self, readerName):
+        fullReaderName = self.readerNames.get(readerName)
+        slot = self.claimedReaders.pop(fullReaderName, None)
+
+        if slot is not None:
+            slot.lock.release()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socketPath):
+        self.connectionPool = ConnectionPool()
+        self.slots = {}
+        self.slotsLock = threading.Lock()
+        super().__init__(socketPath, DaemonRequestHandler)
+
+    def fullReaderName(self, readerName):
+        try:
+            connectedReaders = smartcard.System.readers()
+        except SmartcardException as e:
+            raise DaemonError(ERROR_CARD, str(e))
+
+        reader = next((reader for reader in connectedReaders if readerName in reader.name), None)
+
+        if reader is None:
+            raise DaemonError(ERROR_READER_NOT_FOUND, 'Reader not found.')
+
+        return reader.name
+
+    def readerSlot(self, readerName):
+        with self.slotsLock:
+            slot = self.slots.get(readerName)
+
+            if slot is None:
+                slot = ReaderSlot()
+                self.slots[readerName] = slot
+
+            return slot
+
+
+class DaemonClient(object):
+
+    def __init__(self, socketPath):
+        checkDaemonSocket(socketPath)
+
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.socket.connect(socketPath)
+            checkPeer(self.socket, socketPath)
+        except Exception:
+            self.socket.close()
+            raise
+
+        self.file = self.socket.makefile('rwb')
+        self.lock = threading.Lock()
+        self.nextId = 0
+
+    def call(self, method, **params):
+        with self.lock:
+            self.nextId += 1
+            request = {'jsonrpc': '2.0', 'id': self.nextId, 'method': method, 'params': params}
+            self.file.write(json.dumps(request).encode('utf-8') + b'\n')
+            self.file.flush()
+
+            line = self.file.readline()
+
+        if len(line) == 0:
+            raise DaemonError(ERROR_CARD, 'The daemon closed the connection.')
+
+        response = json.loads(line.decode('utf-8'))
+
+        if 'error' in response:
+            raise DaemonError(response['error']['code'], response['error']['message'])
+
+        return response['result']
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+
+class RemoteConnection(object):
+    # Stands in for a pyscard connection, the card is accessed through the daemon.
+
+    def __init__(self, client, readerName):
+        self.client = client
+        self.readerName = readerName
+
+    def call(self, method, **params):
+        try:
+            return self.client.call(method, reader=self.readerName, **params)
+        except DaemonError as e:
+            raise CardConnectionException(e.message)
+
+    def connect(self, *args, **kwargs):
+        self.call('connect')
+
+    def disconnect(self):
+        self.call('release')
+
+    def transmit(self, apdu, protocol=None):
+        response = self.call('transmit', apdu=bytes(apdu).hex())
+        return list(bytes.fromhex(response['data'])), response['sw1'], response['sw2']
+
+    def getATR(self):
+        return list(bytes.fromhex(self.call('getATR')))
+
+    def getReader(self):
+        return self.readerName
+
+
+class RemoteReader(object):
+
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def createConnection(self):
+        return RemoteConnection(self.client, self.name)
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return str(self)
+
+    def __str__(self):
+        return self.name
+
+
+client = None
+clientLock = threading.Lock()
+
+
+def connectToDaemon():
+    global client
+
+    with clientLock:
+        if client is None:
+            socketPath = defaultSocketPath()
+
+            if socketPath == '' or not os.path.exists(socketPath):
+                return None
+
+            try:
+                client = DaemonClient(socketPath)
+            except (OSError, UnsafeSocketPathError):
+                return None
+
+        return client
+
+
+def readers():
+    # Readers served by the daemon if one is running, local PC/SC readers otherwise.
+    daemonClient = connectToDaemon()
+
+    if daemonClient is None:
+        return smartcard.System.readers()
+
+    return [RemoteReader(daemonClient, name) for name in daemonClient.call('listReaders')]
+
+
+def main():
+    arguments = parse_arguments()
+    apduTrace.installFromEnvironment()
+
+    socketPath = arguments.socket
+    if socketPath is None:
+        socketPath = defaultSocketPath()
+
+    try:
+        preparePrivateDirectory(os.path.dirname(os.path.abspath(socketPath)))
+
+        if os.path.lexists(socketPath):
+            try:
+                probe = DaemonClient(socketPath)
+                probe.close()
+                print('Error: a daemon is already listening on ' + socketPath + '.')
+                return
+            except OSError:
+                os.unlink(socketPath)
+    except UnsafeSocketPathError as e:
+        print('Error: ' + e.path + ' is not private to the current user.')
+        return
+
+    previousUmask = os.umask(0o077)
+    try:
+        server = DaemonServer(socketPath)
+    finally:
+        os.umask(previousUmask)
+
+    print('Listening on ' + socketPath + '.')
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.connectionPool.evictAll()
+        os.unlink(socketPath)
+
+
+if __name__ == "__main__":
+    main()
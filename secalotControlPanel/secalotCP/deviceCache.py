@@ -0,0 +1,66 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+DEVICE_INFO = 'deviceInfo'
+OTP_SETTINGS = 'otpSettings'
+SSL_PUBLIC_KEY = 'sslPublicKey'
+
+# Returned by get() when nothing is cached. None is a valid cached value: it records an absent applet.
+CACHE_MISS = object()
+
+
+class DeviceCache(object):
+    # Data read from the devices, stored per serial number. Readers are mapped to serial numbers once
+    # a device has been identified, so entries can be looked up without talking to the device.
+
+    def __init__(self):
+        self.serialNumbers = {}
+        self.entries = {}
+
+    def serialNumber(self, readerName):
+        return self.serialNumbers.get(readerName)
+
+    def addReader(self, readerName, serialNumber):
+        self.serialNumbers[readerName] = serialNumber
+
+    def removeReader(self, readerName):
+        serialNumber = self.serialNumbers.pop(readerName, None)
+
+        if serialNumber is not None:
+            self.entries.pop(serialNumber, None)
+
+    def get(self, readerName, key):
+        serialNumber = self.serialNumbers.get(readerName)
+
+        if serialNumber is None:
+            return CACHE_MISS
+
+        return self.entries.get(serialNumber, {}).get(key, CACHE_MISS)
+
+    def put(self, readerName, key, value):
+        serialNumber = self.serialNumbers.get(readerName)
+
+        if serialNumber is not None:
+            self.entries.setdefault(serialNumber, {})[key] = value
+
+    def invalidate(self, readerName, *keys):
+        serialNumber = self.serialNumbers.get(readerName)
+
+        if serialNumber is None:
+            return
+
+        if len(keys) == 0:
+            self.entries.pop(serialNumber, None)
+            return
+
+        entries = self.entries.get(serialNumber, {})
+        for key in keys:
+            entries.pop(key, None)
+
+    def clear(self):
+        self.serialNumbers = {}
+        self.entries = {}
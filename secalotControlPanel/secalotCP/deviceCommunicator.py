@@ -7,6 +7,7 @@
 
 from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot, QMetaObject, Q_ARG, QUrl
 import smartcard.System
+from smartcard.Exceptions import SmartcardException
 import time
 
 import secalotCP.otpControl as otpControl
@@ -15,12 +16,24 @@ import secalotCP.totpService as totpService
 import secalotCP.ethControl as ethControl
 import secalotCP.xrpControl as xrpControl
 import secalotCP.sslControl as sslControl
+import secalotCP.deviceSnapshot as deviceSnapshot
+import secalotCP.readerMonitor as readerMonitor
 from secalotCP.deviceFinder import DeviceFinder
+from secalotCP.connectionPool import ConnectionPool, ReaderNotFoundError
+from secalotCP.appletSession import findSession
+from secalotCP.apduBatch import exclusiveTransaction
+from secalotCP.operationQueue import OperationQueue, PRIORITY_INTERACTIVE, PRIORITY_USER, PRIORITY_BACKGROUND
+from secalotCP.deviceCache import DeviceCache, CACHE_MISS, DEVICE_INFO, OTP_SETTINGS, SSL_PUBLIC_KEY
 from mnemonic import Mnemonic
 import base58check
 import hashlib
 
 
+READER_READY_TIMEOUT = 2.0
+CONNECT_RETRY_INITIAL_DELAY = 0.01
+CONNECT_RETRY_MAXIMUM_DELAY = 0.2
+
+
 class DeviceCommunicatorException(Exception):
     def __init__(self, reason):
         super().__init__()
@@ -33,6 +46,29 @@ class EnglishMnemonic(Mnemonic):
         return ['english']
 
 
+def appInfo(control, connection):
+    # A failed SELECT means the applet is not installed, which is reported as None. The helper runs in the
+    # same transaction, so it does not select the applet again. Not cached, other applications change the
+    # wallet and PIN-code status.
+    with exclusiveTransaction(connection):
+        try:
+            control.selectApp(connection)
+        except control.InvalidCardResponseError:
+            return None
+
+        return control.getInfo(connection)
+
+
+def sslPublicKey(connection):
+    with exclusiveTransaction(connection):
+        try:
+            sslControl.selectApp(connection)
+        except sslControl.InvalidCardResponseError:
+            return None
+
+        return sslControl.readPublicKey(connection)
+
+
 class DeviceCommunicatorImplementation(QObject):
     remoteScreenErrorOccurred = pyqtSignal(str, arguments=['errorMessage'])
     remoteScreenCommandSent = pyqtSignal(bytes, arguments=['response'])
@@ -47,6 +83,8 @@ class DeviceCommunicatorImplementation(QObject):
     firmwareUpdateInfo = pyqtSignal(str, arguments=['message'])
     firmwareUpdateReady = pyqtSignal()
     firmwareUpdateFailed = pyqtSignal(str, arguments=['errorMessage'])
+    firmwareUpdateProgress = pyqtSignal(str, int, int, float, float,
+                                        arguments=['stage', 'bytesSent', 'totalBytes', 'throughput', 'eta'])
     getFirmwareImageInfoReady = pyqtSignal(str, str, str, str,
                                            arguments=['deviceID', 'fwVersion', 'fsVersion', 'bootloaderVersion'])
     getEthereumWalletInfoReady = pyqtSignal(str, str, str, arguments=['appVersion', 'walletInitialized', 'pinVerified'])
@@ -59,24 +97,63 @@ class DeviceCommunicatorImplementation(QObject):
     createXrpWalletReady = pyqtSignal(str, arguments=['secret'])
     getSslPublicKeyFingerprintReady = pyqtSignal(str, arguments=['fingerprint'])
     getSslPublicKeyReady = pyqtSignal(str, arguments=['publicKey'])
+    getDeviceSnapshotReady = pyqtSignal('QVariantMap', arguments=['snapshot'])
+    readerReady = pyqtSignal(str, float, arguments=['readerName', 'readyTime'])
 
     selectedReader = None
     selectedReaderType = None
 
-    def __init__(self):
+    def __init__(self, reader=None, readerType=None):
         super().__init__()
+        self.selectedReader = reader
+        self.selectedReaderType = readerType
+        self.connectionPool = ConnectionPool()
+        self.deviceCache = DeviceCache()
+        self.operationQueue = OperationQueue()
+        self.flashJob = None
+
+    @pyqtSlot()
+    def runNextOperation(self):
+        # Posted once per scheduled operation, the queue decides which one actually runs.
+        operation = self.operationQueue.get()
+
+        if operation is not None:
+            getattr(self, operation.method)(*operation.arguments)
 
     @pyqtSlot(str, str)
     def readerSelected(self, reader, readerType):
+        connection = None
         self.selectedReader = reader
         self.selectedReaderType = readerType
-        time.sleep(0.2)
+
+        try:
+            # The pooled connection is kept, so the operations following the selection find the device ready.
+            connection = self.connectToReadyDevice(reader)
+        except Exception as e:
+            pass
+        finally:
+            self.disconnectFromDevice(connection)
 
     @pyqtSlot()
     def readerDeselected(self):
         self.selectedReader = None
         self.selectedReaderType = None
 
+    @pyqtSlot(str)
+    def deviceRemoved(self, reader):
+        self.connectionPool.evict(reader)
+        self.deviceCache.removeReader(reader)
+
+    @pyqtSlot()
+    def closeAllConnections(self):
+        self.connectionPool.evictAll()
+
+    @pyqtSlot()
+    def shutdown(self):
+        # Queued behind the operations already posted to the worker, so they are completed first.
+        self.connectionPool.evictAll()
+        QThread.currentThread().quit()
+
     @pyqtSlot(bytes)
     def sendRemoteScreenCommand(self, command):
         connection = None
@@ -97,7 +174,8 @@ class DeviceCommunicatorImplementation(QObject):
         connection = None
         try:
             connection = self.connectToDevice()
-            numberOfDigits, type = otpControl.getNumberOfDigitsAndType(connection)
+            numberOfDigits, type = self.cachedDeviceData(connection, OTP_SETTINGS,
+                                                         lambda: otpControl.getNumberOfDigitsAndType(connection))
             self.getOTPSettingsReady.emit(str(numberOfDigits), type)
         except DeviceCommunicatorException as e:
             self.errorOccurred.emit(e.reason)
@@ -125,8 +203,9 @@ class DeviceCommunicatorImplementation(QObject):
 
             connection = self.connectToDevice()
 
-            otpControl.setKeyAndType(connection, key, type)
-            otpControl.setNumberOfDigits(connection, numberOfDigits)
+            self.deviceCache.invalidate(self.getSelectedReaderName(), OTP_SETTINGS)
+            otpControl.setSettings(connection, key, type, numberOfDigits)
+            self.deviceCache.put(self.getSelectedReaderName(), OTP_SETTINGS, (numberOfDigits, type))
 
             self.setOTPSettingsReady.emit()
         except DeviceCommunicatorException as e:
@@ -152,7 +231,9 @@ class DeviceCommunicatorImplementation(QObject):
         connection = None
         try:
             connection = self.connectToDevice()
-            deviceInfo = updateFirmware.getDeviceInfo(self.getSelectedReaderType(), connection)
+            deviceInfo = self.cachedDeviceData(connection, DEVICE_INFO,
+                                               lambda: updateFirmware.getDeviceInfo(self.getSelectedReaderType(),
+                                                                                    connection))
 
             self.getDeviceInfoReady.emit(hex(deviceInfo.deviceID), hex(deviceInfo.serialNumber)[2:].zfill(8),
                                          hex(deviceInfo.firmwareVersion), hex(deviceInfo.fileSystemVersion),
@@ -169,30 +250,38 @@ class DeviceCommunicatorImplementation(QObject):
     @pyqtSlot(str, bool)
     def flashFirmware(self, fileName, cleanFileSystemRequested):
         connection = None
+        fwApdus = None
+        job = updateFirmware.FlashJob(self.emitFirmwareUpdateProgress)
+        self.flashJob = job
 
         try:
             self.firmwareUpdateInfo.emit(self.tr('Loading firmware...'))
             deviceType = self.getSelectedReaderType()
             fileName = QUrl(fileName).toLocalFile()
-            file = open(fileName, "rb")
 
-            try:
-                imageInfo = updateFirmware.getUpdateImageInfo(file)
-            except Exception:
-                raise DeviceCommunicatorException(self.tr('Invalid image file format.'))
+            with open(fileName, "rb") as file:
+                try:
+                    imageInfo = updateFirmware.getUpdateImageInfo(file)
+                except Exception:
+                    raise DeviceCommunicatorException(self.tr('Invalid image file format.'))
+
+                fwApdus, blApdus = updateFirmware.updateImageToAPDUs(file, cleanFileSystemRequested)
 
-            fwApduList, blApduList = updateFirmware.updateImageToAPDUs(file, cleanFileSystemRequested)
             connection = self.connectToDevice()
+            self.deviceCache.invalidate(self.getSelectedReaderName())
             deviceInfo = updateFirmware.getDeviceInfo(deviceType, connection)
             updateFirmware.checkImageInfo(imageInfo, deviceInfo, cleanFileSystemRequested)
+            updateFirmware.forgetCachedPublicKeys(deviceInfo, cleanFileSystemRequested)
 
             if deviceType == 'bootloader':
                 if deviceInfo.bootloaderVersion != imageInfo.bootloaderVersion:
+                    job.checkpoint()
                     self.firmwareUpdateInfo.emit(self.tr('Please replug your device.'))
                     updateFirmware.switchModes(deviceType, connection)
                     deviceType, connection = updateFirmware.findConnectedDevice()
                     self.firmwareUpdateInfo.emit(self.tr('Loading firmware...'))
-                    updateFirmware.loadTheImage(connection, blApduList)
+                    updateFirmware.loadTheImage(connection, blApdus, job, 'bootloader')
+                    job.checkpoint()
                     self.firmwareUpdateInfo.emit(self.tr('Please replug your device.'))
                     updateFirmware.switchModes(deviceType, connection)
                     deviceType, connection = updateFirmware.findConnectedDevice()
@@ -200,19 +289,23 @@ class DeviceCommunicatorImplementation(QObject):
                 if (
                             deviceInfo.bootloaderVersion != imageInfo.bootloaderVersion) or deviceInfo.bootloaderIsBootable == False:
                     self.firmwareUpdateInfo.emit(self.tr('Loading firmware...'))
-                    updateFirmware.loadTheImage(connection, blApduList)
+                    updateFirmware.loadTheImage(connection, blApdus, job, 'bootloader')
+                job.checkpoint()
                 self.firmwareUpdateInfo.emit(self.tr('Please replug your device.'))
                 updateFirmware.switchModes(deviceType, connection)
                 deviceType, connection = updateFirmware.findConnectedDevice()
 
             self.firmwareUpdateInfo.emit(self.tr('Loading firmware...'))
-            updateFirmware.loadTheImage(connection, fwApduList)
+            updateFirmware.loadTheImage(connection, fwApdus, job, 'firmware')
+            job.checkpoint()
             self.firmwareUpdateInfo.emit(self.tr('Please replug your device.'))
             updateFirmware.switchModes(deviceType, connection)
             self.firmwareUpdateReady.emit()
 
         except DeviceCommunicatorException as e:
             self.firmwareUpdateFailed.emit(e.reason)
+        except updateFirmware.FlashCancelledError:
+            self.firmwareUpdateFailed.emit(self.tr("Update cancelled.\nFlash the same image again to complete it."))
         except updateFirmware.InvalidCardResponseError:
             self.firmwareUpdateFailed.emit(self.tr("Communication failed."))
         except updateFirmware.NotSuitableImageError as e:
@@ -222,17 +315,37 @@ class DeviceCommunicatorImplementation(QObject):
         except Exception as e:
             self.firmwareUpdateFailed.emit(self.tr("An error occurred."))
         finally:
+            self.flashJob = None
             self.disconnectFromDevice(connection)
 
+            if fwApdus is not None:
+                fwApdus.close()
+
+    def emitFirmwareUpdateProgress(self, progress):
+        if progress.eta is None:
+            eta = -1.0
+        else:
+            eta = progress.eta
+
+        self.firmwareUpdateProgress.emit(progress.stage, progress.bytesSent, progress.totalBytes, progress.throughput,
+                                         eta)
+
+    def cancelFirmwareUpdate(self):
+        # Called from the GUI thread while this worker is busy flashing.
+        job = self.flashJob
+
+        if job is not None:
+            job.cancel()
+
     @pyqtSlot(str)
     def getFirmwareImageInfo(self, fileName):
         try:
             fileName = QUrl(fileName).toLocalFile()
-            file = open(fileName, "rb")
-            try:
-                imageInfo = updateFirmware.getUpdateImageInfo(file)
-            except Exception:
-                raise DeviceCommunicatorException(self.tr("Invalid image file format."))
+            with open(fileName, "rb") as file:
+                try:
+                    imageInfo = updateFirmware.getUpdateImageInfo(file)
+                except Exception:
+                    raise DeviceCommunicatorException(self.tr("Invalid image file format."))
             self.getFirmwareImageInfoReady.emit(hex(imageInfo.deviceID), hex(imageInfo.firmwareVersion),
                                                 hex(imageInfo.fileSystemVersion), hex(imageInfo.bootloaderVersion))
         except DeviceCommunicatorException as e:
@@ -246,27 +359,15 @@ class DeviceCommunicatorImplementation(QObject):
         try:
             connection = self.connectToDevice()
 
-            appExists = True
-
             try:
-                info = ethControl.getInfo(connection)
+                info = appInfo(ethControl, connection)
             except:
-                appExists = False
+                info = None
 
-            if appExists == False:
+            if info is None:
                 self.getEthereumWalletInfoReady.emit('0.0', self.tr('unknown'), self.tr('unknown'))
             else:
-                if info.walletInitialized == True:
-                    initStatus = self.tr('initialized')
-                else:
-                    initStatus = self.tr('not initialized')
-
-                if info.pinVerified == True:
-                    pinStatus = self.tr('verified')
-                else:
-                    pinStatus = self.tr('unverified')
-
-                self.getEthereumWalletInfoReady.emit(info.version, initStatus, pinStatus)
+                self.getEthereumWalletInfoReady.emit(*self.walletInfoToStrings(info))
 
         except DeviceCommunicatorException as e:
             self.errorOccurred.emit(e.reason)
@@ -346,12 +447,14 @@ class DeviceCommunicatorImplementation(QObject):
 
             mnemonic = EnglishMnemonic('english')
 
-            entropy = ethControl.getRandom(connection, 16)
-            entropy = bytearray(entropy)
-            phrase = mnemonic.to_mnemonic(entropy)
-            seed = mnemonic.to_seed(phrase)
+            # Both helpers run in one transaction, the applet is selected once.
+            with exclusiveTransaction(connection):
+                entropy = ethControl.getRandom(connection, 16)
+                entropy = bytearray(entropy)
+                phrase = mnemonic.to_mnemonic(entropy)
+                seed = mnemonic.to_seed(phrase)
 
-            ethControl.initWallet(connection, seed, newPin)
+                ethControl.initWallet(connection, seed, newPin)
 
             self.createEthereumWalletReady.emit(phrase)
 
@@ -370,27 +473,15 @@ class DeviceCommunicatorImplementation(QObject):
         try:
             connection = self.connectToDevice()
 
-            appExists = True
-
             try:
-                info = xrpControl.getInfo(connection)
+                info = appInfo(xrpControl, connection)
             except:
-                appExists = False
+                info = None
 
-            if appExists == False:
+            if info is None:
                 self.getXrpWalletInfoReady.emit('0.0', self.tr('unknown'), self.tr('unknown'))
             else:
-                if info.walletInitialized == True:
-                    initStatus = self.tr('initialized')
-                else:
-                    initStatus = self.tr('not initialized')
-
-                if info.pinVerified == True:
-                    pinStatus = self.tr('verified')
-                else:
-                    pinStatus = self.tr('unverified')
-
-                self.getXrpWalletInfoReady.emit(info.version, initStatus, pinStatus)
+                self.getXrpWalletInfoReady.emit(*self.walletInfoToStrings(info))
 
         except DeviceCommunicatorException as e:
             self.errorOccurred.emit(e.reason)
@@ -470,19 +561,20 @@ class DeviceCommunicatorImplementation(QObject):
             except Exception:
                 raise DeviceCommunicatorException(self.tr("PIN-code length should be between 4 and 32 bytes"))
 
-            entropy = xrpControl.getRandom(connection, 16)
+            with exclusiveTransaction(connection):
+                entropy = xrpControl.getRandom(connection, 16)
 
-            secret = bytes.fromhex('21') + bytearray(entropy)
-            hash = hashlib.sha256(secret).digest()
-            hash = hashlib.sha256(hash).digest()
-            secret += hash[0:4]
+                secret = bytes.fromhex('21') + bytearray(entropy)
+                hash = hashlib.sha256(secret).digest()
+                hash = hashlib.sha256(hash).digest()
+                secret += hash[0:4]
 
-            encoding = str.encode('rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz')
-            secret = base58check.b58encode(secret, encoding)
+                encoding = str.encode('rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz')
+                secret = base58check.b58encode(secret, encoding)
 
-            privateKey = xrpControl.PrivateKey(bytearray(entropy), 'secret')
+                privateKey = xrpControl.PrivateKey(bytearray(entropy), 'secret')
 
-            xrpControl.initWallet(connection, privateKey, newPin)
+                xrpControl.initWallet(connection, privateKey, newPin)
 
             self.createXrpWalletReady.emit(secret.decode("ascii"))
 
@@ -501,14 +593,12 @@ class DeviceCommunicatorImplementation(QObject):
         try:
             connection = self.connectToDevice()
 
-            try:
-                sslControl.selectApp(connection)
-            except sslControl.InvalidCardResponseError as e:
-                return
+            publicKey = self.cachedDeviceData(connection, SSL_PUBLIC_KEY, lambda: sslPublicKey(connection))
 
-            fingerprint = sslControl.getPublicKeyFingerprint(connection)
+            if publicKey is None:
+                return
 
-            self.getSslPublicKeyFingerprintReady.emit(fingerprint)
+            self.getSslPublicKeyFingerprintReady.emit(sslControl.publicKeyFingerprint(publicKey))
 
         except DeviceCommunicatorException as e:
             self.errorOccurred.emit(e.reason)
@@ -522,9 +612,12 @@ class DeviceCommunicatorImplementation(QObject):
         connection = None
         try:
             connection = self.connectToDevice()
-            publicKey = sslControl.getPublicKey(connection)
+            publicKey = self.cachedDeviceData(connection, SSL_PUBLIC_KEY, lambda: sslPublicKey(connection))
 
-            self.getSslPublicKeyReady.emit(publicKey)
+            if publicKey is None:
+                raise sslControl.InvalidCardResponseError()
+
+            self.getSslPublicKeyReady.emit(sslControl.publicKeyToHex(publicKey))
 
         except DeviceCommunicatorException as e:
             self.errorOccurred.emit(e.reason)
@@ -533,13 +626,51 @@ class DeviceCommunicatorImplementation(QObject):
         finally:
             self.disconnectFromDevice(connection)
 
+    @pyqtSlot()
+    def getDeviceSnapshot(self):
+        connection = None
+        try:
+            readerName = self.getSelectedReaderName()
+            readerType = self.getSelectedReaderType()
+
+            snapshot = self.cachedDeviceSnapshot(readerName, readerType)
+            connection = self.connectToDevice()
+
+            if snapshot is None:
+                snapshot = self.readDeviceSnapshot(readerName, readerType, connection)
+            elif readerType == 'firmware':
+                # The wallet and PIN-code status are not cached, other applications change them.
+                ethAppInfo, xrpAppInfo = deviceSnapshot.readWalletAppInfo(connection)
+                snapshot = snapshot._replace(ethAppInfo=ethAppInfo, xrpAppInfo=xrpAppInfo)
+
+            self.getDeviceSnapshotReady.emit(self.snapshotToMap(snapshot, readerType))
+        except DeviceCommunicatorException as e:
+            self.errorOccurred.emit(e.reason)
+        except updateFirmware.InvalidCardResponseError:
+            self.errorOccurred.emit(self.tr("Communication failed."))
+        except Exception as e:
+            self.errorOccurred.emit(self.tr("An error occurred."))
+        finally:
+            self.disconnectFromDevice(connection)
+
+    @pyqtSlot(str, str)
+    def prefetchDeviceSnapshot(self, reader, readerType):
+        connection = None
+        try:
+            if self.cachedDeviceSnapshot(reader, readerType) is None:
+                connection = self.connectToReadyDevice(reader)
+                self.readDeviceSnapshot(reader, readerType, connection)
+        except Exception as e:
+            pass
+        finally:
+            self.disconnectFromDevice(connection)
+
     @pyqtSlot(str, str)
     def sendCurrentTimeToDevice(self, reader, readerType):
         connection = None
         if readerType == "firmware":
             try:
-                time.sleep(0.2)
-                connection = self.connectToDevice(reader)
+                connection = self.connectToReadyDevice(reader)
                 totpService.sendTime(connection)
             except Exception as e:
                 pass
@@ -555,6 +686,8 @@ class DeviceCommunicatorImplementation(QObject):
             for reader in connectedFirmwareReaders:
                 connection = self.connectToDevice(reader.name)
                 totpService.sendTime(connection)
+                self.disconnectFromDevice(connection)
+                connection = None
         except Exception as e:
             pass
         finally:
@@ -574,6 +707,102 @@ class DeviceCommunicatorImplementation(QObject):
 
         return errorMessages[reasonCode - 1]
 
+    def readDeviceSnapshot(self, readerName, readerType, connection):
+        snapshot = deviceSnapshot.readDeviceSnapshot(readerType, connection)
+
+        self.deviceCache.addReader(readerName, snapshot.deviceInfo.serialNumber)
+        self.deviceCache.put(readerName, DEVICE_INFO, snapshot.deviceInfo)
+
+        if readerType == 'firmware':
+            if snapshot.otpSettings is not None:
+                self.deviceCache.put(readerName, OTP_SETTINGS, snapshot.otpSettings)
+            self.deviceCache.put(readerName, SSL_PUBLIC_KEY, snapshot.sslPublicKey)
+
+        return snapshot
+
+    def cachedDeviceSnapshot(self, readerName, readerType):
+        if readerType == 'firmware':
+            keys = [DEVICE_INFO, OTP_SETTINGS, SSL_PUBLIC_KEY]
+        else:
+            keys = [DEVICE_INFO]
+
+        values = dict((key, self.deviceCache.get(readerName, key)) for key in keys)
+
+        if CACHE_MISS in values.values():
+            return None
+
+        return deviceSnapshot.DeviceSnapshot(deviceInfo=values[DEVICE_INFO], otpSettings=values.get(OTP_SETTINGS),
+                                             ethAppInfo=None, xrpAppInfo=None,
+                                             sslPublicKey=values.get(SSL_PUBLIC_KEY))
+
+    def snapshotToMap(self, snapshot, readerType):
+        deviceInfo = snapshot.deviceInfo
+
+        snapshotMap = {'deviceID': hex(deviceInfo.deviceID),
+                       'serialNumber': hex(deviceInfo.serialNumber)[2:].zfill(8),
+                       'fwVersion': hex(deviceInfo.firmwareVersion),
+                       'fsVersion': hex(deviceInfo.fileSystemVersion),
+                       'bootloaderVersion': hex(deviceInfo.bootloaderVersion)}
+
+        if readerType != 'firmware':
+            return snapshotMap
+
+        if snapshot.otpSettings is not None:
+            snapshotMap['numberOfDigits'] = str(snapshot.otpSettings[0])
+            snapshotMap['otpType'] = snapshot.otpSettings[1]
+
+        for prefix, info in (('eth', snapshot.ethAppInfo), ('xrp', snapshot.xrpAppInfo)):
+            if info is None:
+                appVersion, walletInitialized, pinVerified = '0.0', self.tr('unknown'), self.tr('unknown')
+            else:
+                appVersion, walletInitialized, pinVerified = self.walletInfoToStrings(info)
+
+            snapshotMap[prefix + 'AppVersion'] = appVersion
+            snapshotMap[prefix + 'WalletInitialized'] = walletInitialized
+            snapshotMap[prefix + 'PinVerified'] = pinVerified
+
+        if snapshot.sslPublicKey is not None:
+            snapshotMap['sslFingerprint'] = sslControl.publicKeyFingerprint(snapshot.sslPublicKey)
+
+        return snapshotMap
+
+    def walletInfoToStrings(self, info):
+        if info.walletInitialized == True:
+            initStatus = self.tr('initialized')
+        else:
+            initStatus = self.tr('not initialized')
+
+        if info.pinVerified == True:
+            pinStatus = self.tr('verified')
+        else:
+            pinStatus = self.tr('unverified')
+
+        return info.version, initStatus, pinStatus
+
+    def cachedDeviceData(self, connection, key, fetch):
+        readerName = self.getSelectedReaderName()
+
+        if self.deviceCache.serialNumber(readerName) is None:
+            self.identifyDevice(readerName, connection)
+
+        value = self.deviceCache.get(readerName, key)
+
+        if value is CACHE_MISS:
+            value = fetch()
+            self.deviceCache.put(readerName, key, value)
+
+        return value
+
+    def identifyDevice(self, readerName, connection):
+        try:
+            deviceInfo = updateFirmware.getDeviceInfo(self.getSelectedReaderType(), connection)
+        except updateFirmware.InvalidCardResponseError:
+            # Nothing is cached for devices that can not be identified.
+            return
+
+        self.deviceCache.addReader(readerName, deviceInfo.serialNumber)
+        self.deviceCache.put(readerName, DEVICE_INFO, deviceInfo)
+
     def connectToDevice(self, reader=None):
 
         if reader == None:
@@ -581,18 +810,48 @@ class DeviceCommunicatorImplementation(QObject):
         else:
             selectedReader = reader
 
-        connectedReaders = smartcard.System.readers()
+        try:
+            connection = self.connectionPool.getConnection(selectedReader)
+        except ReaderNotFoundError:
+            raise DeviceCommunicatorException(self.tr("No reader selected."))
+
+        connection.session.restartOperation()
 
-        reader = next((reader for reader in connectedReaders if selectedReader in reader.name), None)
+        return connection
 
-        if reader == None:
-            raise DeviceCommunicatorException(self.tr("No reader selected."))
+    def connectToReadyDevice(self, reader):
+        # A freshly inserted device may not be powered yet. Its card state is waited for,
+        # then connecting is retried with a backoff. The time it took is reported.
+        start = time.monotonic()
+        deadline = start + READER_READY_TIMEOUT
+
+        try:
+            connection = self.connectToDevice(reader)
+        except (DeviceCommunicatorException, SmartcardException):
+            try:
+                readerMonitor.waitForReadyReader(reader, READER_READY_TIMEOUT)
+            except readerMonitor.ReaderWaitTimeoutError:
+                pass
 
-        connection = reader.createConnection()
-        connection.connect()
+            connection = self.connectWithBackoff(reader, deadline)
+
+        self.readerReady.emit(reader, time.monotonic() - start)
 
         return connection
 
+    def connectWithBackoff(self, reader, deadline):
+        delay = CONNECT_RETRY_INITIAL_DELAY
+
+        while True:
+            try:
+                return self.connectToDevice(reader)
+            except (DeviceCommunicatorException, SmartcardException):
+                if time.monotonic() + delay > deadline:
+                    raise
+
+            time.sleep(delay)
+            delay = min(delay * 2, CONNECT_RETRY_MAXIMUM_DELAY)
+
     def getSelectedReaderName(self):
         if self.selectedReader == None:
             raise DeviceCommunicatorException(self.tr("No reader selected."))
@@ -606,11 +865,41 @@ class DeviceCommunicatorImplementation(QObject):
         return self.selectedReaderType
 
     def disconnectFromDevice(self, connection):
-        try:
-            if connection != None:
-                connection.disconnect()
-        except Exception:
-            pass
+        session = findSession(connection)
+        if session is not None:
+            session.endOperation()
+
+        self.connectionPool.release(connection)
+
+
+class DeviceWorker(object):
+    # An implementation bound to a single reader together with the thread it runs on.
+
+    def __init__(self, reader=None, readerType=None):
+        self.reader = reader
+        self.readerType = readerType
+        self.implementation = DeviceCommunicatorImplementation(reader, readerType)
+        self.thread = QThread()
+        self.implementation.moveToThread(self.thread)
+        self.thread.start()
+
+    def invoke(self, method, *arguments):
+        QMetaObject.invokeMethod(self.implementation, method, Qt.QueuedConnection, *arguments)
+
+    def schedule(self, priority, method, *arguments, coalescable=False):
+        if self.implementation.operationQueue.put(priority, method, arguments, coalescable):
+            self.invoke("runNextOperation")
+
+    def stop(self):
+        self.invoke("shutdown")
+
+    def cleanup(self):
+        if self.thread.isRunning():
+            QMetaObject.invokeMethod(self.implementation, "closeAllConnections", Qt.BlockingQueuedConnection)
+        self.thread.quit()
+        if self.thread.wait(2000) == False:
+            self.thread.terminate()
+            self.thread.wait(2000)
 
 
 class DeviceCommunicator(QObject):
@@ -626,6 +915,8 @@ class DeviceCommunicator(QObject):
     firmwareUpdateInfo = pyqtSignal(str, arguments=['message'])
     firmwareUpdateReady = pyqtSignal()
     firmwareUpdateFailed = pyqtSignal(str, arguments=['errorMessage'])
+    firmwareUpdateProgress = pyqtSignal(str, int, int, float, float,
+                                        arguments=['stage', 'bytesSent', 'totalBytes', 'throughput', 'eta'])
     getFirmwareImageInfoReady = pyqtSignal(str, str, str, str,
                                            arguments=['deviceID', 'fwVersion', 'fsVersion', 'bootloaderVersion'])
     getEthereumWalletInfoReady = pyqtSignal(str, str, str, arguments=['appVersion', 'walletInitialized', 'pinVerified'])
@@ -638,132 +929,221 @@ class DeviceCommunicator(QObject):
     createXrpWalletReady = pyqtSignal(str, arguments=['secret'])
     getSslPublicKeyFingerprintReady = pyqtSignal(str, arguments=['fingerprint'])
     getSslPublicKeyReady = pyqtSignal(str, arguments=['publicKey'])
+    getDeviceSnapshotReady = pyqtSignal('QVariantMap', arguments=['snapshot'])
+    readerReady = pyqtSignal(str, float, arguments=['readerName', 'readyTime'])
 
     def __init__(self):
         super().__init__()
-        self.implementation = DeviceCommunicatorImplementation()
-        self.implementationThread = QThread()
-        self.implementation.moveToThread(self.implementationThread)
-        self.implementationThread.start()
-
-        self.implementation.remoteScreenErrorOccurred.connect(self.remoteScreenErrorOccurred)
-        self.implementation.remoteScreenCommandSent.connect(self.remoteScreenCommandSent)
-        self.implementation.getOTPSettingsReady.connect(self.getOTPSettingsReady)
-        self.implementation.setOTPSettingsReady.connect(self.setOTPSettingsReady)
-        self.implementation.generatedOTPKeyReady.connect(self.generatedOTPKeyReady)
-        self.implementation.getDeviceInfoReady.connect(self.getDeviceInfoReady)
-        self.implementation.errorOccurred.connect(self.errorOccurred)
-        self.implementation.firmwareUpdateInfo.connect(self.firmwareUpdateInfo)
-        self.implementation.firmwareUpdateReady.connect(self.firmwareUpdateReady)
-        self.implementation.firmwareUpdateFailed.connect(self.firmwareUpdateFailed)
-        self.implementation.getFirmwareImageInfoReady.connect(self.getFirmwareImageInfoReady)
-        self.implementation.getEthereumWalletInfoReady.connect(self.getEthereumWalletInfoReady)
-        self.implementation.wipeoutEthereumWalletReady.connect(self.wipeoutEthereumWalletReady)
-        self.implementation.restoreEthereumWalletReady.connect(self.restoreEthereumWalletReady)
-        self.implementation.createEthereumWalletReady.connect(self.createEthereumWalletReady)
-        self.implementation.getXrpWalletInfoReady.connect(self.getXrpWalletInfoReady)
-        self.implementation.wipeoutXrpWalletReady.connect(self.wipeoutXrpWalletReady)
-        self.implementation.restoreXrpWalletReady.connect(self.restoreXrpWalletReady)
-        self.implementation.createXrpWalletReady.connect(self.createXrpWalletReady)
-        self.implementation.getSslPublicKeyFingerprintReady.connect(self.getSslPublicKeyFingerprintReady)
-        self.implementation.getSslPublicKeyReady.connect(self.getSslPublicKeyReady)
+        self.selectedReader = None
+        self.selectedReaderType = None
+
+        # Every connected reader gets its own worker, so operations on different devices run concurrently.
+        # Operations which do not need a device, or are requested while none is selected, go to the default one.
+        self.workers = {}
+        self.retiredWorkers = []
+        self.defaultWorker = self.createWorker()
+
+    def createWorker(self, reader=None, readerType=None):
+        worker = DeviceWorker(reader, readerType)
+        implementation = worker.implementation
+
+        implementation.remoteScreenErrorOccurred.connect(self.remoteScreenErrorOccurred)
+        implementation.remoteScreenCommandSent.connect(self.remoteScreenCommandSent)
+        implementation.getOTPSettingsReady.connect(self.getOTPSettingsReady)
+        implementation.setOTPSettingsReady.connect(self.setOTPSettingsReady)
+        implementation.generatedOTPKeyReady.connect(self.generatedOTPKeyReady)
+        implementation.getDeviceInfoReady.connect(self.getDeviceInfoReady)
+        implementation.errorOccurred.connect(self.errorOccurred)
+        implementation.firmwareUpdateInfo.connect(self.firmwareUpdateInfo)
+        implementation.firmwareUpdateReady.connect(self.firmwareUpdateReady)
+        implementation.firmwareUpdateFailed.connect(self.firmwareUpdateFailed)
+        implementation.firmwareUpdateProgress.connect(self.firmwareUpdateProgress)
+        implementation.getFirmwareImageInfoReady.connect(self.getFirmwareImageInfoReady)
+        implementation.getEthereumWalletInfoReady.connect(self.getEthereumWalletInfoReady)
+        implementation.wipeoutEthereumWalletReady.connect(self.wipeoutEthereumWalletReady)
+        implementation.restoreEthereumWalletReady.connect(self.restoreEthereumWalletReady)
+        implementation.createEthereumWalletReady.connect(self.createEthereumWalletReady)
+        implementation.getXrpWalletInfoReady.connect(self.getXrpWalletInfoReady)
+        implementation.wipeoutXrpWalletReady.connect(self.wipeoutXrpWalletReady)
+        implementation.restoreXrpWalletReady.connect(self.restoreXrpWalletReady)
+        implementation.createXrpWalletReady.connect(self.createXrpWalletReady)
+        implementation.getSslPublicKeyFingerprintReady.connect(self.getSslPublicKeyFingerprintReady)
+        implementation.getSslPublicKeyReady.connect(self.getSslPublicKeyReady)
+        implementation.getDeviceSnapshotReady.connect(self.getDeviceSnapshotReady)
+        implementation.readerReady.connect(self.readerReady)
+
+        worker.thread.finished.connect(self.workerFinished)
+
+        return worker
+
+    def workerForReader(self, reader, readerType):
+        worker = self.workers.get(reader)
+
+        if worker is None:
+            worker = self.createWorker(reader, readerType)
+            self.workers[reader] = worker
+
+        return worker
+
+    def selectedWorker(self):
+        worker = self.workers.get(self.selectedReader)
+
+        if worker is None:
+            return self.defaultWorker
+
+        return worker
+
+    @pyqtSlot()
+    def workerFinished(self):
+        thread = self.sender()
+        self.retiredWorkers = [worker for worker in self.retiredWorkers if worker.thread is not thread]
+
+    @pyqtSlot(result='QVariantMap')
+    def operationQueueMetrics(self):
+        workers = [self.defaultWorker] + list(self.workers.values()) + self.retiredWorkers
+        metrics = {'depth': 0, 'oldestPendingWait': 0.0}
+
+        for worker in workers:
+            operationQueue = worker.implementation.operationQueue
+            metrics['depth'] += operationQueue.depth()
+            metrics['oldestPendingWait'] = max(metrics['oldestPendingWait'], operationQueue.oldestPendingWait())
+
+            for name, statistics in operationQueue.statistics().items():
+                total = metrics.setdefault(name, {'executed': 0, 'coalesced': 0, 'averageWait': 0.0,
+                                                  'maximumWait': 0.0})
+
+                if statistics.executed != 0:
+                    total['averageWait'] = (total['averageWait'] * total['executed'] + statistics.averageWait *
+                                            statistics.executed) / (total['executed'] + statistics.executed)
+                total['executed'] += statistics.executed
+                total['coalesced'] += statistics.coalesced
+                total['maximumWait'] = max(total['maximumWait'], statistics.maximumWait)
+
+        return metrics
+
+    @pyqtSlot()
+    def cancelFirmwareUpdate(self):
+        # Not queued: the worker running the update does not process queued operations until it is done.
+        for worker in [self.defaultWorker] + list(self.workers.values()) + self.retiredWorkers:
+            worker.implementation.cancelFirmwareUpdate()
 
     def cleanup(self):
-        self.implementationThread.quit()
-        if self.implementationThread.wait(2000) == False:
-            self.implementationThread.terminate()
-            self.implementationThread.wait(2000)
+        for worker in [self.defaultWorker] + list(self.workers.values()) + self.retiredWorkers:
+            worker.cleanup()
+
+    @pyqtSlot(str, str)
+    def deviceAdded(self, reader, readerType):
+        self.workerForReader(reader, readerType)
 
     @pyqtSlot(str, str)
     def readerSelected(self, reader, readerType):
-        QMetaObject.invokeMethod(self.implementation, "readerSelected", Qt.QueuedConnection, Q_ARG(str, reader),
-                                 Q_ARG(str, readerType))
+        self.selectedReader = reader
+        self.selectedReaderType = readerType
+        self.workerForReader(reader, readerType).schedule(PRIORITY_USER, "readerSelected", reader, readerType)
 
     @pyqtSlot()
     def readerDeselected(self):
-        QMetaObject.invokeMethod(self.implementation, "readerDeselected", Qt.QueuedConnection)
+        self.selectedReader = None
+        self.selectedReaderType = None
+
+    @pyqtSlot(str)
+    def deviceRemoved(self, reader):
+        worker = self.workers.pop(reader, None)
+
+        if worker is None:
+            return
+
+        # The worker may still be busy, e.g. flashing a device which reenumerates under another reader name.
+        # It is kept until its thread finishes, so its signals keep being forwarded.
+        worker.invoke("deviceRemoved", Q_ARG(str, reader))
+        worker.stop()
+        self.retiredWorkers.append(worker)
 
     @pyqtSlot(bytes)
     def sendRemoteScreenCommand(self, command):
-        QMetaObject.invokeMethod(self.implementation, "sendRemoteScreenCommand", Qt.QueuedConnection,
-                                 Q_ARG(bytes, command))
+        self.selectedWorker().schedule(PRIORITY_INTERACTIVE, "sendRemoteScreenCommand", command)
 
     @pyqtSlot()
     def getOTPSettings(self):
-        QMetaObject.invokeMethod(self.implementation, "getOTPSettings", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_BACKGROUND, "getOTPSettings", coalescable=True)
 
     @pyqtSlot(str, str, str)
     def setOTPSettings(self, numberOfDigits, type, key):
-        QMetaObject.invokeMethod(self.implementation, "setOTPSettings", Qt.QueuedConnection, Q_ARG(str, numberOfDigits),
-                                 Q_ARG(str, type), Q_ARG(str, key))
+        self.selectedWorker().schedule(PRIORITY_USER, "setOTPSettings", numberOfDigits, type, key)
 
     @pyqtSlot(str, str)
     def generateOTPKey(self, keyFormat, keyLength):
-        QMetaObject.invokeMethod(self.implementation, "generateOTPKey", Qt.QueuedConnection, Q_ARG(str, keyFormat),
-                                 Q_ARG(str, keyLength))
+        self.defaultWorker.schedule(PRIORITY_USER, "generateOTPKey", keyFormat, keyLength)
 
     @pyqtSlot()
     def getDeviceInfo(self):
-        QMetaObject.invokeMethod(self.implementation, "getDeviceInfo", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_BACKGROUND, "getDeviceInfo", coalescable=True)
 
     @pyqtSlot(str, bool)
     def flashFirmware(self, fileName, cleanFileSystemRequested):
-        QMetaObject.invokeMethod(self.implementation, "flashFirmware", Qt.QueuedConnection, Q_ARG(str, fileName),
-                                 Q_ARG(bool, cleanFileSystemRequested))
+        self.selectedWorker().schedule(PRIORITY_USER, "flashFirmware", fileName, cleanFileSystemRequested)
 
     @pyqtSlot(str)
     def getFirmwareImageInfo(self, fileName):
-        QMetaObject.invokeMethod(self.implementation, "getFirmwareImageInfo", Qt.QueuedConnection, Q_ARG(str, fileName))
+        self.defaultWorker.schedule(PRIORITY_USER, "getFirmwareImageInfo", fileName, coalescable=True)
 
     @pyqtSlot()
     def getEthereumWalletInfo(self):
-        QMetaObject.invokeMethod(self.implementation, "getEthereumWalletInfo", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_BACKGROUND, "getEthereumWalletInfo", coalescable=True)
 
     @pyqtSlot()
     def wipeoutEthereumWallet(self):
-        QMetaObject.invokeMethod(self.implementation, "wipeoutEthereumWallet", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_USER, "wipeoutEthereumWallet")
 
     @pyqtSlot(str, str, str)
     def restoreEthereumWallet(self, seed, newPin, repeatPin):
-        QMetaObject.invokeMethod(self.implementation, "restoreEthereumWallet", Qt.QueuedConnection, Q_ARG(str, seed),
-                                 Q_ARG(str, newPin), Q_ARG(str, repeatPin))
+        self.selectedWorker().schedule(PRIORITY_USER, "restoreEthereumWallet", seed, newPin, repeatPin)
 
     @pyqtSlot(str, str)
     def createEthereumWallet(self, newPin, repeatPin):
-        QMetaObject.invokeMethod(self.implementation, "createEthereumWallet", Qt.QueuedConnection, Q_ARG(str, newPin),
-                                 Q_ARG(str, repeatPin))
+        self.selectedWorker().schedule(PRIORITY_USER, "createEthereumWallet", newPin, repeatPin)
 
     @pyqtSlot()
     def getXrpWalletInfo(self):
-        QMetaObject.invokeMethod(self.implementation, "getXrpWalletInfo", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_BACKGROUND, "getXrpWalletInfo", coalescable=True)
 
     @pyqtSlot()
     def wipeoutXrpWallet(self):
-        QMetaObject.invokeMethod(self.implementation, "wipeoutXrpWallet", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_USER, "wipeoutXrpWallet")
 
     @pyqtSlot(str, str, str)
     def restoreXrpWallet(self, privateKey, newPin, repeatPin):
-        QMetaObject.invokeMethod(self.implementation, "restoreXrpWallet", Qt.QueuedConnection, Q_ARG(str, privateKey),
-                                 Q_ARG(str, newPin), Q_ARG(str, repeatPin))
+        self.selectedWorker().schedule(PRIORITY_USER, "restoreXrpWallet", privateKey, newPin, repeatPin)
 
     @pyqtSlot(str, str)
     def createXrpWallet(self, newPin, repeatPin):
-        QMetaObject.invokeMethod(self.implementation, "createXrpWallet", Qt.QueuedConnection, Q_ARG(str, newPin),
-                                 Q_ARG(str, repeatPin))
+        self.selectedWorker().schedule(PRIORITY_USER, "createXrpWallet", newPin, repeatPin)
 
     @pyqtSlot()
     def getSslPublicKeyFingerprint(self):
-        QMetaObject.invokeMethod(self.implementation, "getSslPublicKeyFingerprint", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_BACKGROUND, "getSslPublicKeyFingerprint", coalescable=True)
 
     @pyqtSlot()
     def getSslPublicKey(self):
-        QMetaObject.invokeMethod(self.implementation, "getSslPublicKey", Qt.QueuedConnection)
+        self.selectedWorker().schedule(PRIORITY_USER, "getSslPublicKey", coalescable=True)
+
+    @pyqtSlot()
+    def getDeviceSnapshot(self):
+        self.selectedWorker().schedule(PRIORITY_BACKGROUND, "getDeviceSnapshot", coalescable=True)
+
+    @pyqtSlot(str, str)
+    def prefetchDeviceSnapshot(self, reader, readerType):
+        # Scheduled when the device appears. Queued in the same class as readerSelected and ahead of it, so it
+        # runs before the selection and the snapshot the panel asks for next is served from the cache.
+        self.workerForReader(reader, readerType).schedule(PRIORITY_USER, "prefetchDeviceSnapshot", reader,
+                                                          readerType, coalescable=True)
 
     @pyqtSlot(str, str)
     def sendCurrentTimeToDevice(self, reader, readerType):
-        QMetaObject.invokeMethod(self.implementation, "sendCurrentTimeToDevice", Qt.QueuedConnection,
-                                 Q_ARG(str, reader), Q_ARG(str, readerType))
+        self.workerForReader(reader, readerType).schedule(PRIORITY_BACKGROUND, "sendCurrentTimeToDevice", reader,
+                                                          readerType)
 
     @pyqtSlot()
     def sendCurrentTimeToAllConnectedDevices(self):
-        QMetaObject.invokeMethod(self.implementation, "sendCurrentTimeToAllConnectedDevices", Qt.QueuedConnection)
+        for reader, worker in self.workers.items():
+            worker.schedule(PRIORITY_BACKGROUND, "sendCurrentTimeToDevice", reader, worker.readerType)
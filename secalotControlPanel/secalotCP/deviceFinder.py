@@ -9,9 +9,13 @@ from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot
 import smartcard.System
 import time
 
+from secalotCP.readerMonitor import ReaderMonitor
+
 READER_NAME = 'Secalot Secalot Dongle'
 BOOTLOADER_READER_NAME = 'Secalot Secalot Bootloader'
 
+POLLING_INTERVAL = 0.1
+
 
 class DeviceFinder(QThread):
     moreThanOneDeviceConnected = pyqtSignal()
@@ -25,8 +29,12 @@ class DeviceFinder(QThread):
 
     firstRun = True
 
+    summaryRequested = False
+
     monitoringStopped = False
 
+    readerMonitor = None
+
     def __init__(self):
         super().__init__()
 
@@ -34,37 +42,72 @@ class DeviceFinder(QThread):
 
         while True:
             try:
-                time.sleep(0.1)
+                self.readerMonitor = ReaderMonitor()
+            except Exception:
+                # The PC/SC service may not be running while no readers are attached.
+                self.updateReaders()
+                time.sleep(POLLING_INTERVAL)
+                continue
+
+            try:
+                if self.readerMonitor.pnpNotificationSupported():
+                    self.waitForReaderChanges()
+                else:
+                    self.pollReaders()
+            except Exception:
+                time.sleep(POLLING_INTERVAL)
+            finally:
+                readerMonitor = self.readerMonitor
+                self.readerMonitor = None
+                readerMonitor.close()
+
+    def waitForReaderChanges(self):
+        while True:
+            self.updateReaders()
+            self.readerMonitor.waitForReaderListChange()
 
-                if not self.monitoringStopped:
+    def pollReaders(self):
+        while True:
+            time.sleep(POLLING_INTERVAL)
+            self.updateReaders()
 
-                    connectedFirmwareReaders, connectedBootloaderReaders = self.getAllReaders()
+    def updateReaders(self):
+        try:
+            if not self.monitoringStopped:
 
-                    connectedReaders = connectedFirmwareReaders + connectedBootloaderReaders
+                connectedFirmwareReaders, connectedBootloaderReaders = self.getAllReaders()
 
-                    newReaders = [reader for reader in connectedReaders if reader not in self.knownReaders]
+                connectedReaders = connectedFirmwareReaders + connectedBootloaderReaders
 
-                    removedReaders = [reader for reader in self.knownReaders if reader not in connectedReaders]
+                newReaders = [reader for reader in connectedReaders if reader not in self.knownReaders]
 
-                    for reader in newReaders:
-                        self.deviceAdded.emit(str(reader), reader.type)
+                removedReaders = [reader for reader in self.knownReaders if reader not in connectedReaders]
 
-                    for reader in removedReaders:
-                        self.deviceRemoved.emit(str(reader))
+                for reader in newReaders:
+                    self.deviceAdded.emit(str(reader), reader.type)
 
-                    if (len(connectedReaders) > 1) and (len(self.knownReaders) <= 1):
-                        self.moreThanOneDeviceConnected.emit()
-                    elif (len(connectedReaders) == 0) and ((len(self.knownReaders) != 0) or (self.firstRun == True)):
-                        self.noDevicesConnected.emit()
-                        self.firstRun = False
-                    elif (len(connectedReaders) == 1) and (
-                                (len(self.knownReaders) != 1) or (connectedReaders[0] != self.knownReaders[0])):
-                        self.oneDeviceConnected.emit(str(connectedReaders[0]), connectedReaders[0].type)
+                for reader in removedReaders:
+                    self.deviceRemoved.emit(str(reader))
 
-                    self.knownReaders = connectedReaders
+                # After a restart the summary is reported again, while readers that stayed connected keep their workers.
+                previousReaders = self.knownReaders
+                if self.summaryRequested:
+                    self.summaryRequested = False
+                    previousReaders = []
 
-            except Exception:
-                continue
+                if (len(connectedReaders) > 1) and (len(previousReaders) <= 1):
+                    self.moreThanOneDeviceConnected.emit()
+                elif (len(connectedReaders) == 0) and ((len(previousReaders) != 0) or (self.firstRun == True)):
+                    self.noDevicesConnected.emit()
+                    self.firstRun = False
+                elif (len(connectedReaders) == 1) and (
+                            (len(previousReaders) != 1) or (connectedReaders[0] != previousReaders[0])):
+                    self.oneDeviceConnected.emit(str(connectedReaders[0]), connectedReaders[0].type)
+
+                self.knownReaders = connectedReaders
+
+        except Exception:
+            pass
 
     @staticmethod
     def getAllReaders():
@@ -98,7 +141,16 @@ class DeviceFinder(QThread):
 
     @pyqtSlot()
     def restartMonitoring(self):
-        self.knownReaders = []
+        self.summaryRequested = True
         self.firstRun = True
         smartcard.pcsc.PCSCContext.PCSCContext.instance = None
         self.monitoringStopped = False
+        self.wakeUp()
+
+    def wakeUp(self):
+        readerMonitor = self.readerMonitor
+        if readerMonitor is not None:
+            try:
+                readerMonitor.cancel()
+            except Exception:
+                pass
@@ -0,0 +1,102 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from collections import namedtuple
+
+import secalotCP.otpControl as otpControl
+import secalotCP.updateFirmware as updateFirmware
+import secalotCP.ethControl as ethControl
+import secalotCP.xrpControl as xrpControl
+import secalotCP.sslControl as sslControl
+from secalotCP.apduBatch import ApduBatch, SW_SUCCESS
+from secalotCP.appletSession import selectAPDU, OTP_APPLET_AID, ETH_APPLET_AID, XRP_APPLET_AID, SSL_APPLET_AID, \
+    BOOTLOADER_APPLET_AID
+
+# Missing applets are reported as None.
+DeviceSnapshot = namedtuple('DeviceSnapshot', 'deviceInfo otpSettings ethAppInfo xrpAppInfo sslPublicKey')
+
+# Every applet is selected once and queried right away, so the whole snapshot is read in a single
+# transaction. Status words are checked while parsing, a missing applet must not abort the sequence.
+WALLET_APP_INFO_APDUS = [
+    selectAPDU(ETH_APPLET_AID), [0x80, 0xC4, 0x00, 0x00],
+    selectAPDU(XRP_APPLET_AID), [0x80, 0xC4, 0x00, 0x00],
+]
+
+FIRMWARE_SNAPSHOT_APDUS = [
+    selectAPDU(BOOTLOADER_APPLET_AID), [0x80, 0x00, 0x00, 0x00],
+    selectAPDU(OTP_APPLET_AID), [0x80, 0x02, 0x00, 0x00],
+] + WALLET_APP_INFO_APDUS + [
+    selectAPDU(SSL_APPLET_AID), [0x80, 0x10, 0x00, 0x00],
+]
+
+BOOTLOADER_SNAPSHOT_APDUS = [
+    [0x80, 0x00, 0x00, 0x00],
+]
+
+
+def parseResponse(select, response, parse, error):
+    if select is not None and ((select.sw1 << 8) | select.sw2) != SW_SUCCESS:
+        return None
+
+    if ((response.sw1 << 8) | response.sw2) != SW_SUCCESS:
+        return None
+
+    try:
+        return parse(response.data)
+    except error:
+        return None
+
+
+def readDeviceSnapshot(device, connection):
+    batch = ApduBatch()
+
+    if device == 'firmware':
+        apdus = FIRMWARE_SNAPSHOT_APDUS
+    else:
+        apdus = BOOTLOADER_SNAPSHOT_APDUS
+
+    for apdu in apdus:
+        batch.add(apdu, None)
+
+    responses = batch.execute(connection)
+
+    if device != 'firmware':
+        deviceInfo = parseResponse(None, responses[0], updateFirmware.parseDeviceInfo,
+                                   updateFirmware.InvalidCardResponseError)
+        if deviceInfo is None:
+            raise updateFirmware.InvalidCardResponseError()
+
+        return DeviceSnapshot(deviceInfo, None, None, None, None)
+
+    deviceInfo = parseResponse(responses[0], responses[1], updateFirmware.parseDeviceInfo,
+                               updateFirmware.InvalidCardResponseError)
+    if deviceInfo is None:
+        raise updateFirmware.InvalidCardResponseError()
+
+    return DeviceSnapshot(
+        deviceInfo=deviceInfo,
+        otpSettings=parseResponse(responses[2], responses[3], otpControl.parseNumberOfDigitsAndType,
+                                  otpControl.InvalidCardResponseError),
+        ethAppInfo=parseResponse(responses[4], responses[5], ethControl.parseAppInfo,
+                                 ethControl.InvalidCardResponseError),
+        xrpAppInfo=parseResponse(responses[6], responses[7], xrpControl.parseAppInfo,
+                                 xrpControl.InvalidCardResponseError),
+        sslPublicKey=parseResponse(responses[8], responses[9], sslControl.parsePublicKey,
+                                   sslControl.InvalidCardResponseError)
+    )
+
+
+def readWalletAppInfo(connection):
+    batch = ApduBatch()
+
+    for apdu in WALLET_APP_INFO_APDUS:
+        batch.add(apdu, None)
+
+    responses = batch.execute(connection)
+
+    return (parseResponse(responses[0], responses[1], ethControl.parseAppInfo, ethControl.InvalidCardResponseError),
+            parseResponse(responses[2], responses[3], xrpControl.parseAppInfo, xrpControl.InvalidCardResponseError))
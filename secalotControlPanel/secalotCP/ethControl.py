@@ -6,7 +6,17 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import argparse
+import hashlib
 import smartcard.System
+from secalotCP.appletSession import AppletSession, operation
+from secalotCP.apduBatch import ApduBatch, ApduBatchError, exclusiveTransaction
+import secalotCP.apduTrace as apduTrace
+import secalotCP.batchMode as batchMode
+import secalotCP.bip32 as bip32
+import secalotCP.daemon as daemon
+import secalotCP.updateFirmware as updateFirmware
+from secalotCP.keccak import keccak256
+from secalotCP.publicKeyCache import PublicKeyCache, defaultCacheFile
 from collections import namedtuple
 from mnemonic import Mnemonic
 
@@ -35,6 +45,15 @@ class EnglishMnemonic(Mnemonic):
 
 
 AppInfo = namedtuple('AppInfo', 'version walletInitialized pinVerified')
+ExportedPublicKey = namedtuple('ExportedPublicKey', 'index path publicKey chainCode address cached')
+DerivedAddress = namedtuple('DerivedAddress', 'index path publicKey address')
+
+DEFAULT_PATH_TEMPLATE = "m/44'/60'/{}'"
+DEFAULT_PARENT_PATH = "m/44'/60'/0'/0"
+WALLET_FINGERPRINT_PATH = "m/44'/60'"
+
+DERIVATION_BATCH_SIZE = 256
+EXPORT_BATCH_SIZE = 32
 
 
 def seed(seedText):
@@ -96,11 +115,31 @@ def derivationPath(string):
     return intIndexes
 
 
-def parse_arguments():
-    parser = argparse.ArgumentParser(description='Ethereum control.')
+def pathTemplate(string):
+    if string.count('{}') != 1:
+        raise argparse.ArgumentTypeError('The path template should contain one {} placeholder')
+
+    derivationPath(string.replace('{}', '0'))
+
+    return string
+
+
+def keyIndex(string):
+    try:
+        index = int(string)
+    except ValueError:
+        raise argparse.ArgumentTypeError('Invalid index')
+
+    if index < 0 or index >= 0x80000000:
+        raise argparse.ArgumentTypeError('The index should be between 0 and 2147483647')
+
+    return index
+
+
+def argumentParser(parserClass=argparse.ArgumentParser):
+    parser = parserClass(description='Ethereum control.')
     parser._optionals.title = 'Options'
     subparsers = parser.add_subparsers(dest='subcommand')
-    subparsers.required = True
 
     parserGetInfo = subparsers.add_parser('getInfo', help='Get wallet info.')
 
@@ -121,12 +160,51 @@ def parse_arguments():
     parserGetPublicKey.add_argument('--derivationPath', required=True, type=derivationPath,
                                     help=('Bip32 derivation path'))
 
+    parserExportPublicKeys = subparsers.add_parser('exportPublicKeys',
+                                                   help='Export public keys, chaincodes and addresses of a range of '
+                                                        'derivation paths as JSON lines.')
+    parserExportPublicKeys._optionals.title = 'Options'
+    parserExportPublicKeys.add_argument('--pathTemplate', default=DEFAULT_PATH_TEMPLATE, type=pathTemplate,
+                                        help=('Bip32 derivation path with {} in place of the index. '
+                                              'Default: ' + DEFAULT_PATH_TEMPLATE))
+    parserExportPublicKeys.add_argument('--first', default=0, type=keyIndex, help=('First index. Default: 0'))
+    parserExportPublicKeys.add_argument('--count', required=True, type=keyIndex, help=('Number of indexes.'))
+    parserExportPublicKeys.add_argument('--pin', type=pin,
+                                        help=('PIN-code. Not needed if it is already verified.'))
+    parserExportPublicKeys.add_argument('--cache', default=None,
+                                        help=('Public key cache file. Default: $SECALOT_PUBLIC_KEY_CACHE or '
+                                              'secalot/publicKeys.sqlite3 in the user cache directory'))
+    parserExportPublicKeys.add_argument('--noCache', action='store_true', help=('Do not use the cache.'))
+    parserExportPublicKeys.add_argument('--refresh', action='store_true',
+                                        help=('Fetch every key from the device and update the cache.'))
+
+    parserDeriveAddresses = subparsers.add_parser('deriveAddresses',
+                                                  help='Derive non-hardened child addresses of a node on the host '
+                                                       'and print them as JSON lines.')
+    parserDeriveAddresses._optionals.title = 'Options'
+    parserDeriveAddresses.add_argument('--parentPath', default=derivationPath(DEFAULT_PARENT_PATH),
+                                       type=derivationPath,
+                                       help=('Bip32 derivation path of the parent node. Default: ' +
+                                             DEFAULT_PARENT_PATH))
+    parserDeriveAddresses.add_argument('--first', default=0, type=keyIndex, help=('First child index. Default: 0'))
+    parserDeriveAddresses.add_argument('--count', required=True, type=keyIndex, help=('Number of children.'))
+    parserDeriveAddresses.add_argument('--pin', type=pin,
+                                       help=('PIN-code. Not needed if it is already verified.'))
+
+    batchMode.addBatchArgument(parser)
+
+    return parser
+
+
+def parse_arguments():
+    parser = argumentParser()
     args = parser.parse_args()
+    batchMode.checkArguments(parser, args)
     return args
 
 
 def findConnectedDevice():
-    connectedReaders = smartcard.System.readers()
+    connectedReaders = daemon.readers()
 
     reader = next((reader for reader in connectedReaders if reader.name.startswith(READER_NAME)), None)
 
@@ -137,23 +215,43 @@ def findConnectedDevice():
 
     connection.connect()
 
-    return connection
+    return AppletSession(connection)
+
+
+SELECT_APDU = [0x00, 0xA4, 0x04, 0x00, 0x09, 0x45, 0x54, 0x48, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54]
 
 
 def selectApp(connection):
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x09, 0x45, 0x54, 0x48, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
+    response, sw1, sw2 = connection.transmit(SELECT_APDU)
     if sw1 != 0x90 or sw2 != 00:
         raise InvalidCardResponseError()
 
 
-def getInfo(connection):
-    selectApp(connection)
+def executeBatch(connection, batch):
+    # Only the SELECT is checked by the batch, status words of the commands are mapped by the callers.
+    try:
+        return batch.execute(connection)[1:]
+    except ApduBatchError:
+        raise InvalidCardResponseError()
+
 
-    response, sw1, sw2 = connection.transmit([0x80, 0xC4, 0x00, 0x00])
+def transmitAfterSelect(connection, apdu):
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add(apdu, expectedStatusWords=None)
+
+    return executeBatch(connection, batch)[0]
+
+
+def getInfo(connection):
+    response, sw1, sw2 = transmitAfterSelect(connection, [0x80, 0xC4, 0x00, 0x00])
     if sw1 != 0x90 or sw2 != 00:
         raise InvalidCardResponseError()
 
+    return parseAppInfo(response)
+
+
+def parseAppInfo(response):
     if len(response) != 8:
         raise InvalidCardResponseError()
 
@@ -167,9 +265,7 @@ def getInfo(connection):
 
 
 def getRandom(connection, length):
-    selectApp(connection)
-
-    response, sw1, sw2 = connection.transmit([0x80, 0xC0, 0x00, 0x00, length])
+    response, sw1, sw2 = transmitAfterSelect(connection, [0x80, 0xC0, 0x00, 0x00, length])
     if sw1 != 0x90 or sw2 != 00:
         raise InvalidCardResponseError()
 
@@ -180,8 +276,6 @@ def getRandom(connection, length):
 
 
 def initWallet(connection, seed, pin):
-    selectApp(connection)
-
     data = bytearray()
 
     data.append(len(pin))
@@ -189,7 +283,7 @@ def initWallet(connection, seed, pin):
     data.append(len(seed))
     data += seed
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x20, 0x00, 0x00] + [len(data)] + list(data))
+    response, sw1, sw2 = transmitAfterSelect(connection, [0x80, 0x20, 0x00, 0x00] + [len(data)] + list(data))
     if sw1 != 0x90 or sw2 != 00:
         if sw1 == 0x6d and sw2 == 0x00:
             raise WalletError("ALREADY_INIT", 'Wallet already initialized')
@@ -198,9 +292,7 @@ def initWallet(connection, seed, pin):
 
 
 def wipeoutWallet(connection):
-    selectApp(connection)
-
-    response, sw1, sw2 = connection.transmit([0x80, 0xF0, 0x00, 0x00])
+    response, sw1, sw2 = transmitAfterSelect(connection, [0x80, 0xF0, 0x00, 0x00])
     if sw1 != 0x90 or sw2 != 00:
         if sw1 == 0x6d and sw2 == 0x00:
             raise WalletError("NOT_INIT", 'Wallet not initialized')
@@ -209,28 +301,26 @@ def wipeoutWallet(connection):
 
 
 def verifyPin(connection, pin):
-    selectApp(connection)
-
-    response, sw1, sw2 = connection.transmit([0x80, 0x22, 0x00, 0x00] + [len(pin)] + list(pin))
-
-    if sw1 != 0x90 or sw2 != 00:
-        if sw1 == 0x6d and sw2 == 0x00:
-            raise WalletError("NOT_INIT", 'Wallet not initialized')
-        elif sw1 == 0x69 and sw2 == 0x82:
-            triesLeft = getPinTriesLeft(connection)
-            raise WalletError("INVALID_PIN", 'Invalid PIN-code. ' + str(triesLeft) + ' tries left.')
-        elif sw1 == 0x67 and sw2 == 0x00:
-            raise WalletError("WRONG_LENGTH", 'Unsupported PIN-code length')
-        elif sw1 == 0x69 and sw2 == 0x83:
-            raise WalletError("PIN_BLOCKED", 'PIN-code blocked')
-        else:
-            raise InvalidCardResponseError()
+    # The tries counter of a rejected PIN-code is read in the same transaction, behind the same SELECT.
+    with exclusiveTransaction(connection):
+        response, sw1, sw2 = transmitAfterSelect(connection, [0x80, 0x22, 0x00, 0x00] + [len(pin)] + list(pin))
+
+        if sw1 != 0x90 or sw2 != 00:
+            if sw1 == 0x6d and sw2 == 0x00:
+                raise WalletError("NOT_INIT", 'Wallet not initialized')
+            elif sw1 == 0x69 and sw2 == 0x82:
+                triesLeft = getPinTriesLeft(connection)
+                raise WalletError("INVALID_PIN", 'Invalid PIN-code. ' + str(triesLeft) + ' tries left.')
+            elif sw1 == 0x67 and sw2 == 0x00:
+                raise WalletError("WRONG_LENGTH", 'Unsupported PIN-code length')
+            elif sw1 == 0x69 and sw2 == 0x83:
+                raise WalletError("PIN_BLOCKED", 'PIN-code blocked')
+            else:
+                raise InvalidCardResponseError()
 
 
 def getPinTriesLeft(connection):
-    selectApp(connection)
-
-    response, sw1, sw2 = connection.transmit([0x80, 0x22, 0x80, 0x00])
+    response, sw1, sw2 = transmitAfterSelect(connection, [0x80, 0x22, 0x80, 0x00])
     if sw1 != 0x63:
         if sw1 == 0x6d and sw2 == 0x00:
             raise WalletError("NOT_INIT", 'Wallet not initialized')
@@ -240,16 +330,31 @@ def getPinTriesLeft(connection):
     return (sw2 - 0xC0)
 
 
-def getPublicKey(connection, derivationPath):
-    selectApp(connection)
-
+def getPublicKeyAPDU(derivationPath):
     indexArray = bytearray()
 
     for index in derivationPath:
         indexArray += index.to_bytes(4, 'big')
 
-    response, sw1, sw2 = connection.transmit(
-        [0x80, 0x40, 0x00, 0x00] + [len(indexArray) + 1] + [len(derivationPath)] + list(indexArray))
+    return [0x80, 0x40, 0x00, 0x00] + [len(indexArray) + 1] + [len(derivationPath)] + list(indexArray)
+
+
+def getPublicKey(connection, derivationPath):
+    return parsePublicKey(transmitAfterSelect(connection, getPublicKeyAPDU(derivationPath)))
+
+
+def getPublicKeys(connection, derivationPaths):
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+
+    for derivationPath in derivationPaths:
+        batch.add(getPublicKeyAPDU(derivationPath), expectedStatusWords=None)
+
+    return [parsePublicKey(response) for response in executeBatch(connection, batch)]
+
+
+def parsePublicKey(apduResponse):
+    response, sw1, sw2 = apduResponse
 
     if sw1 != 0x90 or sw2 != 00:
         if sw1 == 0x6d and sw2 == 0x00:
@@ -268,42 +373,234 @@ def getPublicKey(connection, derivationPath):
     return publicKey, chainCode
 
 
+def formatDerivationPath(indexes):
+    return 'm/' + '/'.join(str(index & 0x7FFFFFFF) + ('\'' if index & 0x80000000 else '') for index in indexes)
+
+
+def ethereumAddress(publicKey):
+    # EIP-55 mixed case checksum encoding of the last 20 bytes of the uncompressed key's hash.
+    address = keccak256(publicKey[1:])[-20:].hex()
+    checksum = keccak256(address.encode('ascii')).hex()
+
+    return '0x' + ''.join(character.upper() if int(checksum[i], 16) >= 8 else character for i, character in
+                          enumerate(address))
+
+
+def getSerialNumber(connection):
+    try:
+        deviceInfo = updateFirmware.getDeviceInfo('firmware', connection)
+    except updateFirmware.InvalidCardResponseError:
+        raise InvalidCardResponseError()
+
+    return format(deviceInfo.serialNumber, '08x')
+
+
+def getWalletFingerprint(connection):
+    # Identifies the wallet currently on the device. Reading it needs a verified PIN-code, like any public key.
+    publicKey, chainCode = getPublicKey(connection, derivationPath(WALLET_FINGERPRINT_PATH))
+
+    return hashlib.sha256(publicKey + chainCode).hexdigest()[:16]
+
+
+def checkIndexRange(first, count):
+    if first + count > bip32.HARDENED:
+        raise WalletError('INVALID_RANGE', 'Indexes should be below ' + str(bip32.HARDENED))
+
+
+def exportPublicKeys(connection, pathTemplate, first, count, pin=None, cache=None, refresh=False):
+    # Keys found in the cache for the wallet on the device are not requested from the device.
+    checkIndexRange(first, count)
+
+    paths = [derivationPath(pathTemplate.replace('{}', str(index))) for index in range(first, first + count)]
+    pathNames = [formatDerivationPath(path) for path in paths]
+
+    if pin is not None:
+        verifyPin(connection, pin)
+
+    cachedKeys = {}
+
+    if cache is not None:
+        serialNumber = getSerialNumber(connection)
+        walletFingerprint = getWalletFingerprint(connection)
+        cache.forgetOtherWallets(serialNumber, walletFingerprint)
+
+        if not refresh:
+            cachedKeys = cache.getMany(serialNumber, walletFingerprint, pathNames)
+
+    try:
+        # Keys missing from the cache are read in batches which select the applet once.
+        for batchFirst in range(0, count, EXPORT_BATCH_SIZE):
+            batchPaths = paths[batchFirst:batchFirst + EXPORT_BATCH_SIZE]
+            batchPathNames = pathNames[batchFirst:batchFirst + EXPORT_BATCH_SIZE]
+
+            missingPaths = [path for path, pathName in zip(batchPaths, batchPathNames) if pathName not in cachedKeys]
+            readKeys = iter(getPublicKeys(connection, missingPaths) if missingPaths else [])
+
+            for index, pathName in zip(range(first + batchFirst, first + count), batchPathNames):
+                cachedKey = cachedKeys.get(pathName)
+
+                if cachedKey is not None:
+                    publicKey, chainCode = cachedKey
+                else:
+                    publicKey, chainCode = next(readKeys)
+
+                    if cache is not None:
+                        cache.put(serialNumber, walletFingerprint, pathName, publicKey, chainCode)
+
+                yield ExportedPublicKey(index, pathName, publicKey, chainCode, ethereumAddress(publicKey),
+                                        cachedKey is not None)
+    finally:
+        if cache is not None:
+            cache.commit()
+
+
+def getNode(connection, path, pin=None):
+    # Not cached, checking that a cached node belongs to the wallet on the device takes as long as reading it.
+    if pin is not None:
+        verifyPin(connection, pin)
+
+    publicKey, chainCode = getPublicKey(connection, path)
+
+    return bip32.PublicNode(publicKey, chainCode)
+
+
+def deriveAddresses(connection, parentPath, first, count, pin=None, batchSize=DERIVATION_BATCH_SIZE):
+    # Only the parent node comes from the device, its non-hardened children are derived on the host.
+    checkIndexRange(first, count)
+
+    parentPathName = formatDerivationPath(parentPath)
+    node = getNode(connection, parentPath, pin)
+
+    for batchFirst in range(first, first + count, batchSize):
+        indexes = range(batchFirst, min(batchFirst + batchSize, first + count))
+
+        try:
+            children = bip32.publicChildren(node, indexes)
+        except bip32.InvalidPublicKeyError:
+            raise InvalidCardResponseError()
+
+        for index, child in zip(indexes, children):
+            yield DerivedAddress(index, parentPathName + '/' + str(index), child.publicKey,
+                                 ethereumAddress(child.publicKey))
+
+
+def derivedAddressRecord(derivedAddress):
+    return {'index': derivedAddress.index, 'path': derivedAddress.path,
+            'publicKey': derivedAddress.publicKey.hex(), 'address': derivedAddress.address}
+
+
+def exportedPublicKeyRecord(exportedPublicKey):
+    return {'index': exportedPublicKey.index, 'path': exportedPublicKey.path,
+            'publicKey': exportedPublicKey.publicKey.hex(), 'chainCode': exportedPublicKey.chainCode.hex(),
+            'address': exportedPublicKey.address, 'cached': exportedPublicKey.cached}
+
+
+def openPublicKeyCache(arguments):
+    if arguments.noCache:
+        return None
+
+    return PublicKeyCache(arguments.cache or defaultCacheFile())
+
+
+def deriveAddressesFromArguments(connection, arguments):
+    for derivedAddress in deriveAddresses(connection, arguments.parentPath, arguments.first, arguments.count,
+                                          arguments.pin):
+        yield derivedAddressRecord(derivedAddress)
+
+
+def exportPublicKeysFromArguments(connection, arguments):
+    cache = openPublicKeyCache(arguments)
+
+    try:
+        for exportedPublicKey in exportPublicKeys(connection, arguments.pathTemplate, arguments.first,
+                                                  arguments.count, arguments.pin, cache, arguments.refresh):
+            yield exportedPublicKeyRecord(exportedPublicKey)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+CLI_ERRORS = (NoReaderFoundError, InvalidCardResponseError, WalletError)
+
+
+def errorMessage(e):
+    if isinstance(e, NoReaderFoundError):
+        return 'please connect a device.'
+    elif isinstance(e, WalletError):
+        return e.message
+    else:
+        return 'invalid response received from the device.'
+
+
+def executeSubcommand(connection, arguments):
+    if arguments.subcommand == 'initWallet':
+        initWallet(connection, arguments.seed, arguments.pin)
+    elif arguments.subcommand == 'getPublicKey':
+        publicKey, chainCode = getPublicKey(connection, arguments.derivationPath)
+        return {'publicKey': ''.join(format(x, '02x') for x in publicKey),
+                'chainCode': ''.join(format(x, '02x') for x in chainCode)}
+    elif arguments.subcommand == 'wipeoutWallet':
+        wipeoutWallet(connection)
+    elif arguments.subcommand == 'verifyPin':
+        verifyPin(connection, arguments.pin)
+    elif arguments.subcommand == 'getInfo':
+        info = getInfo(connection)
+        return {'version': info.version, 'walletInitialized': info.walletInitialized,
+                'pinVerified': info.pinVerified}
+    elif arguments.subcommand == 'exportPublicKeys':
+        return {'keys': list(exportPublicKeysFromArguments(connection, arguments))}
+    elif arguments.subcommand == 'deriveAddresses':
+        return {'addresses': list(deriveAddressesFromArguments(connection, arguments))}
+
+    return {}
+
+
 def main():
     arguments = parse_arguments()
+    apduTrace.installFromEnvironment()
 
     try:
         connection = findConnectedDevice()
-        if arguments.subcommand == 'initWallet':
-            initWallet(connection, arguments.seed, arguments.pin)
-        elif arguments.subcommand == 'getPublicKey':
-            publicKey, chainCode = getPublicKey(connection, arguments.derivationPath)
-            print('Public key: ' + ''.join(format(x, '02x') for x in publicKey))
-            print('Chaincode: ' + ''.join(format(x, '02x') for x in chainCode))
-        elif arguments.subcommand == 'wipeoutWallet':
-            wipeoutWallet(connection)
-        elif arguments.subcommand == 'verifyPin':
-            verifyPin(connection, arguments.pin)
+
+        if arguments.batch is not None:
+            batchMode.runBatch(argumentParser(batchMode.BatchArgumentParser), arguments.batch, connection,
+                               executeSubcommand, CLI_ERRORS, errorMessage)
+            return
+
+        if arguments.subcommand == 'exportPublicKeys':
+            for record in exportPublicKeysFromArguments(connection, arguments):
+                batchMode.printRecord(record)
+            return
+        elif arguments.subcommand == 'deriveAddresses':
+            for record in deriveAddressesFromArguments(connection, arguments):
+                batchMode.printRecord(record)
+            return
+
+        with operation(connection):
+            result = executeSubcommand(connection, arguments)
+
+        if arguments.subcommand == 'getPublicKey':
+            print('Public key: ' + result['publicKey'])
+            print('Chaincode: ' + result['chainCode'])
         elif arguments.subcommand == 'getInfo':
-            info = getInfo(connection)
             print('')
-            print('App version: ' + info.version)
+            print('App version: ' + result['version'])
 
-            if info.walletInitialized == True:
+            if result['walletInitialized'] == True:
                 print('Wallet status: initialized')
             else:
                 print('Wallet status: not initialized')
 
-            if info.pinVerified == True:
+            if result['pinVerified'] == True:
                 print('Pin status: verified')
             else:
                 print('Pin status: unverified')
 
-    except NoReaderFoundError:
-        print('Error: please connect a device.')
-    except InvalidCardResponseError:
-        print('Error: invalid response received from the device.')
-    except WalletError as e:
-        print('Error: ' + e.message)
+    except CLI_ERRORS as e:
+        if arguments.batch is not None or arguments.subcommand in ('exportPublicKeys', 'deriveAddresses'):
+            batchMode.printRecord({'error': errorMessage(e)})
+        else:
+            print('Error: ' + errorMessage(e))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Ethereum uses the original Keccak padding, hashlib.sha3_256 uses the FIPS 202 one and gives different digests.
+
+PYCRYPTODOME_SUPPORTED = True
+
+try:
+    from Crypto.Hash import keccak as pycryptodomeKeccak
+except ImportError:
+    PYCRYPTODOME_SUPPORTED = False
+
+LANE_MASK = (1 << 64) - 1
+
+KECCAK_DELIMITER = 0x01
+SHA3_DELIMITER = 0x06
+
+
+def roundConstants():
+    constants = []
+    lfsr = 1
+
+    for round in range(0, 24):
+        constant = 0
+
+        for j in range(0, 7):
+            lfsr = ((lfsr << 1) ^ ((lfsr >> 7) * 0x71)) % 256
+            if lfsr & 2:
+                constant ^= 1 << ((1 << j) - 1)
+
+        constants.append(constant)
+
+    return constants
+
+
+def rotationOffsets():
+    offsets = [0] * 25
+    x, y = 1, 0
+
+    for t in range(0, 24):
+        offsets[x + 5 * y] = ((t + 1) * (t + 2) // 2) % 64
+        x, y = y, (2 * x + 3 * y) % 5
+
+    return offsets
+
+
+ROUND_CONSTANTS = roundConstants()
+ROTATION_OFFSETS = rotationOffsets()
+# Lane x + 5 * y moves to y + 5 * (2 * x + 3 * y) in the pi step.
+PI_TARGETS = [y + 5 * ((2 * x + 3 * y) % 5) for y in range(0, 5) for x in range(0, 5)]
+# Source lane, target lane and rotation amounts of the combined rho and pi steps.
+RHO_PI = [(index, PI_TARGETS[index], ROTATION_OFFSETS[index], 64 - ROTATION_OFFSETS[index]) for index in range(0, 25)]
+
+
+def permute(lanes):
+    for roundConstant in ROUND_CONSTANTS:
+        c0 = lanes[0] ^ lanes[5] ^ lanes[10] ^ lanes[15] ^ lanes[20]
+        c1 = lanes[1] ^ lanes[6] ^ lanes[11] ^ lanes[16] ^ lanes[21]
+        c2 = lanes[2] ^ lanes[7] ^ lanes[12] ^ lanes[17] ^ lanes[22]
+        c3 = lanes[3] ^ lanes[8] ^ lanes[13] ^ lanes[18] ^ lanes[23]
+        c4 = lanes[4] ^ lanes[9] ^ lanes[14] ^ lanes[19] ^ lanes[24]
+
+        d = (c4 ^ (((c1 << 1) | (c1 >> 63)) & LANE_MASK),
+             c0 ^ (((c2 << 1) | (c2 >> 63)) & LANE_MASK),
+             c1 ^ (((c3 << 1) | (c3 >> 63)) & LANE_MASK),
+             c2 ^ (((c4 << 1) | (c4 >> 63)) & LANE_MASK),
+             c3 ^ (((c0 << 1) | (c0 >> 63)) & LANE_MASK))
+
+        rotated = [0] * 25
+        for source, target, left, right in RHO_PI:
+            lane = lanes[source] ^ d[source % 5]
+            rotated[target] = ((lane << left) | (lane >> right)) & LANE_MASK
+
+        for y in range(0, 25, 5):
+            b0, b1, b2, b3, b4 = rotated[y:y + 5]
+            lanes[y] = b0 ^ (~b1 & b2)
+            lanes[y + 1] = b1 ^ (~b2 & b3)
+            lanes[y + 2] = b2 ^ (~b3 & b4)
+            lanes[y + 3] = b3 ^ (~b4 & b0)
+            lanes[y + 4] = b4 ^ (~b0 & b1)
+
+        lanes[0] ^= roundConstant
+
+
+def sponge(data, rate, delimiter, outputLength):
+    padded = bytearray(data)
+    padded.append(delimiter)
+    padded.extend(bytes((-len(padded)) % rate))
+    padded[-1] |= 0x80
+
+    lanes = [0] * 25
+
+    for offset in range(0, len(padded), rate):
+        for index in range(0, rate // 8):
+            start = offset + index * 8
+            lanes[index] ^= int.from_bytes(padded[start:start + 8], 'little')
+        permute(lanes)
+
+    output = bytearray()
+
+    while True:
+        for index in range(0, rate // 8):
+            output += lanes[index].to_bytes(8, 'little')
+
+        if len(output) >= outputLength:
+            return bytes(output[:outputLength])
+
+        permute(lanes)
+
+
+def keccak256(data):
+    if PYCRYPTODOME_SUPPORTED:
+        return pycryptodomeKeccak.new(digest_bits=256, data=bytes(data)).digest()
+
+    return sponge(data, 136, KECCAK_DELIMITER, 32)
@@ -0,0 +1,111 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from collections import namedtuple
+import heapq
+import itertools
+import threading
+import time
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_USER = 1
+PRIORITY_BACKGROUND = 2
+
+PRIORITY_NAMES = ['interactive', 'user', 'background']
+
+Operation = namedtuple('Operation', 'priority method arguments coalescable enqueuedAt')
+OperationStatistics = namedtuple('OperationStatistics', 'executed coalesced averageWait maximumWait')
+
+
+class OperationQueue(object):
+    # Operations are taken in priority order, FIFO within a priority class. A coalescable operation
+    # is dropped while an identical one is still pending, the pending one is promoted if needed.
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.heap = []
+        self.sequence = itertools.count()
+        self.pendingEntries = {}
+
+        self.executed = [0] * len(PRIORITY_NAMES)
+        self.coalesced = [0] * len(PRIORITY_NAMES)
+        self.totalWait = [0.0] * len(PRIORITY_NAMES)
+        self.maximumWait = [0.0] * len(PRIORITY_NAMES)
+
+    def put(self, priority, method, arguments=(), coalescable=False):
+        # Returns False when the operation was merged into a pending one, so no new wakeup is needed.
+        with self.lock:
+            key = (method, tuple(arguments))
+
+            if coalescable and key in self.pendingEntries:
+                entry = self.pendingEntries[key]
+                self.coalesced[priority] += 1
+
+                if priority < entry[0]:
+                    entry[3] = False
+                    entry = [priority, next(self.sequence), entry[2]._replace(priority=priority), True]
+                    self.pendingEntries[key] = entry
+                    heapq.heappush(self.heap, entry)
+
+                return False
+
+            operation = Operation(priority, method, tuple(arguments), coalescable, time.monotonic())
+            entry = [priority, next(self.sequence), operation, True]
+            heapq.heappush(self.heap, entry)
+
+            if coalescable:
+                self.pendingEntries[key] = entry
+
+            return True
+
+    def get(self):
+        with self.lock:
+            while len(self.heap) != 0:
+                priority, sequence, operation, valid = heapq.heappop(self.heap)
+
+                if not valid:
+                    continue
+
+                if operation.coalescable:
+                    del self.pendingEntries[(operation.method, operation.arguments)]
+
+                wait = time.monotonic() - operation.enqueuedAt
+                self.executed[priority] += 1
+                self.totalWait[priority] += wait
+                self.maximumWait[priority] = max(self.maximumWait[priority], wait)
+
+                return operation
+
+            return None
+
+    def depth(self):
+        with self.lock:
+            return len([entry for entry in self.heap if entry[3]])
+
+    def oldestPendingWait(self):
+        with self.lock:
+            enqueuedAt = [entry[2].enqueuedAt for entry in self.heap if entry[3]]
+
+        if len(enqueuedAt) == 0:
+            return 0.0
+
+        return time.monotonic() - min(enqueuedAt)
+
+    def statistics(self):
+        with self.lock:
+            result = {}
+
+            for priority, name in enumerate(PRIORITY_NAMES):
+                if self.executed[priority] != 0:
+                    averageWait = self.totalWait[priority] / self.executed[priority]
+                else:
+                    averageWait = 0.0
+
+                result[name] = OperationStatistics(self.executed[priority], self.coalesced[priority], averageWait,
+                                                   self.maximumWait[priority])
+
+            return result
@@ -7,6 +7,11 @@
 
 import argparse
 import smartcard.System
+from secalotCP.appletSession import AppletSession, operation
+from secalotCP.apduBatch import ApduBatch, ApduBatchError
+import secalotCP.apduTrace as apduTrace
+import secalotCP.batchMode as batchMode
+import secalotCP.daemon as daemon
 import base64
 import os
 
@@ -65,11 +70,10 @@ def key_length(string):
     return integer
 
 
-def parse_arguments():
-    parser = argparse.ArgumentParser(description='OTP control.')
+def argumentParser(parserClass=argparse.ArgumentParser):
+    parser = parserClass(description='OTP control.')
     parser._optionals.title = 'Options'
     subparsers = parser.add_subparsers(dest='subcommand')
-    subparsers.required = True
     parserGetNumberOfDigitsAndType = subparsers.add_parser('getNumberOfDigitsAndType',
                                                            help='Get the number of OTP digits and OTP type.')
     parserSetNumberOfDigits = subparsers.add_parser('setNumberOfDigits',
@@ -82,12 +86,20 @@ def parse_arguments():
     parserGenerateKey.add_argument('keyFormat', type=key_format, help=('Key format: hex or base32.'))
     parserGenerateKey.add_argument('keyLength', type=key_length, help=('Key length in bytes. 10 to 32.'))
 
+    batchMode.addBatchArgument(parser)
+
+    return parser
+
+
+def parse_arguments():
+    parser = argumentParser()
     args = parser.parse_args()
+    batchMode.checkArguments(parser, args)
     return args
 
 
 def findConnectedDevice():
-    connectedReaders = smartcard.System.readers()
+    connectedReaders = daemon.readers()
 
     reader = next((reader for reader in connectedReaders if reader.name.startswith(READER_NAME)), None)
 
@@ -98,19 +110,41 @@ def findConnectedDevice():
 
     connection.connect()
 
-    return connection
+    return AppletSession(connection)
 
 
-def getNumberOfDigitsAndType(connection):
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x09, 0x4F, 0x54, 0x50, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+SELECT_APDU = [0x00, 0xA4, 0x04, 0x00, 0x09, 0x4F, 0x54, 0x50, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54]
+
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x02, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
+def executeBatch(connection, batch):
+    try:
+        return batch.execute(connection)
+    except ApduBatchError:
         raise InvalidCardResponseError()
 
+
+def setNumberOfDigitsAPDU(numberOfDigits):
+    return [0x80, 0x00, 0x00, 0x00, 0x01, numberOfDigits]
+
+
+def setKeyAndTypeAPDU(key, type):
+    if type == 'HOTP':
+        type = 1
+    else:
+        type = 2
+
+    return [0x80, 0x01, 0x00, 0x00, len(key) + 1] + [type] + list(key)
+
+
+def getNumberOfDigitsAndType(connection):
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add([0x80, 0x02, 0x00, 0x00])
+
+    return parseNumberOfDigitsAndType(executeBatch(connection, batch)[1].data)
+
+
+def parseNumberOfDigitsAndType(response):
     if len(response) != 2:
         raise InvalidCardResponseError()
 
@@ -125,30 +159,28 @@ def getNumberOfDigitsAndType(connection):
 
 
 def setNumberOfDigits(connection, numberOfDigits):
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x09, 0x4F, 0x54, 0x50, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add(setNumberOfDigitsAPDU(numberOfDigits))
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x00, 0x00, 0x00, 0x01, numberOfDigits])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+    executeBatch(connection, batch)
 
 
 def setKeyAndType(connection, key, type):
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x09, 0x4F, 0x54, 0x50, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add(setKeyAndTypeAPDU(key, type))
 
-    if type == 'HOTP':
-        type = 1
-    else:
-        type = 2
+    executeBatch(connection, batch)
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x01, 0x00, 0x00, len(key) + 1] + [type] + list(key))
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+
+def setSettings(connection, key, type, numberOfDigits):
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add(setKeyAndTypeAPDU(key, type))
+    batch.add(setNumberOfDigitsAPDU(numberOfDigits))
+
+    executeBatch(connection, batch)
 
 
 def generateKey(format, length):
@@ -165,29 +197,57 @@ def generateKey(format, length):
     return key
 
 
+CLI_ERRORS = (NoReaderFoundError, InvalidCardResponseError)
+
+
+def errorMessage(e):
+    if isinstance(e, NoReaderFoundError):
+        return 'please connect a device.'
+    else:
+        return 'invalid response received from the device.'
+
+
+def executeSubcommand(connection, arguments):
+    if arguments.subcommand == 'getNumberOfDigitsAndType':
+        numberOfDigits, type = getNumberOfDigitsAndType(connection)
+        return {'numberOfDigits': numberOfDigits, 'type': type}
+    elif arguments.subcommand == 'setNumberOfDigits':
+        setNumberOfDigits(connection, arguments.numberOfDigits)
+    elif arguments.subcommand == 'setKeyAndType':
+        setKeyAndType(connection, arguments.key, arguments.type)
+    elif arguments.subcommand == 'generateKey':
+        return {'key': generateKey(arguments.keyFormat, arguments.keyLength)}
+
+    return {}
+
+
 def main():
     arguments = parse_arguments()
+    apduTrace.installFromEnvironment()
 
     try:
         connection = findConnectedDevice()
 
+        if arguments.batch is not None:
+            batchMode.runBatch(argumentParser(batchMode.BatchArgumentParser), arguments.batch, connection,
+                               executeSubcommand, CLI_ERRORS, errorMessage)
+            return
+
+        with operation(connection):
+            result = executeSubcommand(connection, arguments)
+
         if arguments.subcommand == 'getNumberOfDigitsAndType':
-            numberOfDigits, type = getNumberOfDigitsAndType(connection)
             print('')
-            print('Number of digits: ' + str(numberOfDigits))
-            print('Type: ' + type)
-        elif arguments.subcommand == 'setNumberOfDigits':
-            setNumberOfDigits(connection, arguments.numberOfDigits)
-        elif arguments.subcommand == 'setKeyAndType':
-            setKeyAndType(connection, arguments.key, arguments.type)
+            print('Number of digits: ' + str(result['numberOfDigits']))
+            print('Type: ' + result['type'])
         elif arguments.subcommand == 'generateKey':
-            key = generateKey(arguments.keyFormat, arguments.keyLength)
-            print('Key: ' + key)
+            print('Key: ' + result['key'])
 
-    except NoReaderFoundError:
-        print("Error: please connect a device.");
-    except InvalidCardResponseError:
-        print("Error: invalid response received from the device.");
+    except CLI_ERRORS as e:
+        if arguments.batch is not None:
+            batchMode.printRecord({'error': errorMessage(e)})
+        else:
+            print('Error: ' + errorMessage(e))
 
 
 if __name__ == "__main__":
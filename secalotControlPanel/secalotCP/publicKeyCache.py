@@ -0,0 +1,104 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+
+CACHE_ENVIRONMENT_VARIABLE = 'SECALOT_PUBLIC_KEY_CACHE'
+
+CachedPublicKey = namedtuple('CachedPublicKey', 'publicKey chainCode')
+
+
+def defaultCacheFile():
+    fileName = os.environ.get(CACHE_ENVIRONMENT_VARIABLE)
+
+    if fileName is not None:
+        return fileName
+
+    cacheDirectory = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cacheDirectory, 'secalot', 'publicKeys.sqlite3')
+
+
+class PublicKeyCache(object):
+    # Public keys and chain codes by device serial number, wallet fingerprint and derivation path. A wallet can
+    # be wiped out and initialised with another seed by any application, so the fingerprint of the wallet on
+    # the device is part of the key and entries of a replaced wallet are never found.
+
+    def __init__(self, fileName):
+        directory = os.path.dirname(fileName)
+        if directory != '' and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+        # The keys identify the wallet's accounts, the file is only readable by its owner.
+        if not os.path.exists(fileName):
+            os.close(os.open(fileName, os.O_CREAT | os.O_WRONLY, 0o600))
+
+        self.lock = threading.Lock()
+        self.database = sqlite3.connect(fileName, check_same_thread=False)
+        self.database.execute('CREATE TABLE IF NOT EXISTS walletPublicKeys (serialNumber TEXT NOT NULL, '
+                              'walletFingerprint TEXT NOT NULL, path TEXT NOT NULL, publicKey BLOB NOT NULL, '
+                              'chainCode BLOB NOT NULL, PRIMARY KEY (serialNumber, walletFingerprint, path))')
+        self.database.commit()
+
+    def getMany(self, serialNumber, walletFingerprint, paths):
+        result = {}
+
+        with self.lock:
+            for path in paths:
+                row = self.database.execute('SELECT publicKey, chainCode FROM walletPublicKeys WHERE '
+                                            'serialNumber = ? AND walletFingerprint = ? AND path = ?',
+                                            (serialNumber, walletFingerprint, path)).fetchone()
+                if row is not None:
+                    result[path] = CachedPublicKey(bytes(row[0]), bytes(row[1]))
+
+        return result
+
+    def put(self, serialNumber, walletFingerprint, path, publicKey, chainCode):
+        with self.lock:
+            self.database.execute('INSERT OR REPLACE INTO walletPublicKeys VALUES (?, ?, ?, ?, ?)',
+                                  (serialNumber, walletFingerprint, path, bytes(publicKey), bytes(chainCode)))
+
+    def commit(self):
+        with self.lock:
+            self.database.commit()
+
+    def forgetOtherWallets(self, serialNumber, walletFingerprint):
+        # Entries of a replaced wallet are never found again, they are only removed to keep the cache small.
+        with self.lock:
+            self.database.execute('DELETE FROM walletPublicKeys WHERE serialNumber = ? AND walletFingerprint != ?',
+                                  (serialNumber, walletFingerprint))
+
+    def forgetDevice(self, serialNumber):
+        with self.lock:
+            self.database.execute('DELETE FROM walletPublicKeys WHERE serialNumber = ?', (serialNumber,))
+            self.database.commit()
+
+    def close(self):
+        with self.lock:
+            self.database.commit()
+            self.database.close()
+
+
+def forgetCachedDevice(serialNumber, fileName=None):
+    # Called when a device's wallets are replaced or erased. Their entries would not be found anymore,
+    # they are only removed to keep the cache small.
+    fileName = fileName or defaultCacheFile()
+
+    if not os.path.exists(fileName):
+        return
+
+    try:
+        cache = PublicKeyCache(fileName)
+        try:
+            cache.forgetDevice(serialNumber)
+        finally:
+            cache.close()
+    except sqlite3.Error:
+        pass
@@ -0,0 +1,193 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import time
+
+import smartcard.System
+from smartcard.scard import SCardEstablishContext, SCardReleaseContext, SCardGetStatusChange, SCardCancel, \
+    SCardListReaders, SCARD_SCOPE_USER, SCARD_S_SUCCESS, SCARD_E_TIMEOUT, SCARD_E_CANCELLED, \
+    SCARD_E_NO_READERS_AVAILABLE, SCARD_E_NO_SERVICE, SCARD_STATE_UNAWARE, SCARD_STATE_UNKNOWN, SCARD_STATE_CHANGED, \
+    SCARD_STATE_PRESENT, SCARD_STATE_MUTE, SCARD_STATE_EXCLUSIVE, SCARD_STATE_UNAVAILABLE, INFINITE
+
+PNP_NOTIFICATION_READER = '\\\\?PnP?\\Notification'
+
+POLLING_INTERVAL = 0.05
+
+CARD_NOT_READY_STATES = SCARD_STATE_MUTE | SCARD_STATE_EXCLUSIVE | SCARD_STATE_UNAVAILABLE | SCARD_STATE_UNKNOWN
+
+# Cleared when readers do not come from the PC/SC service, e.g. when the simulator is installed.
+# Reader changes are then detected by polling smartcard.System.readers().
+pcscEventsAvailable = True
+
+
+class ReaderMonitorError(Exception):
+    def __init__(self, hresult):
+        super().__init__()
+        self.hresult = hresult
+
+
+class ReaderWaitTimeoutError(Exception):
+    pass
+
+
+def cardReady(eventState):
+    return (eventState & SCARD_STATE_PRESENT) != 0 and (eventState & CARD_NOT_READY_STATES) == 0
+
+
+def remainingMilliseconds(deadline):
+    if deadline is None:
+        return INFINITE
+
+    remaining = int((deadline - time.monotonic()) * 1000)
+
+    if remaining <= 0:
+        raise ReaderWaitTimeoutError()
+
+    return remaining
+
+
+def waitForReadyReader(readerPrefix, timeout=None):
+    start = time.monotonic()
+
+    if timeout is None:
+        deadline = None
+    else:
+        deadline = start + timeout
+
+    if not pcscEventsAvailable:
+        return pollForReadyReader(readerPrefix, deadline), time.monotonic() - start
+
+    while True:
+        try:
+            readerMonitor = ReaderMonitor()
+        except ReaderMonitorError:
+            # The PC/SC service may be restarting while the device reenumerates.
+            remainingMilliseconds(deadline)
+            time.sleep(POLLING_INTERVAL)
+            continue
+
+        try:
+            readerName = readerMonitor.waitForReadyReader(readerPrefix, deadline)
+            return readerName, time.monotonic() - start
+        except ReaderMonitorError:
+            time.sleep(POLLING_INTERVAL)
+        finally:
+            readerMonitor.close()
+
+
+def pollForReadyReader(readerPrefix, deadline=None):
+    while True:
+        reader = next((reader for reader in smartcard.System.readers() if reader.name.startswith(readerPrefix)), None)
+
+        if reader is not None:
+            return reader.name
+
+        timeout = remainingMilliseconds(deadline)
+        time.sleep(min(POLLING_INTERVAL, timeout / 1000))
+
+
+class ReaderMonitor(object):
+
+    def __init__(self):
+        if not pcscEventsAvailable:
+            raise ReaderMonitorError(SCARD_E_NO_SERVICE)
+
+        hresult, self.hcontext = SCardEstablishContext(SCARD_SCOPE_USER)
+        if hresult != SCARD_S_SUCCESS:
+            raise ReaderMonitorError(hresult)
+
+        self.pnpState = SCARD_STATE_UNAWARE
+
+    def close(self):
+        try:
+            SCardReleaseContext(self.hcontext)
+        except Exception:
+            pass
+
+    def cancel(self):
+        SCardCancel(self.hcontext)
+
+    def pnpNotificationSupported(self):
+        # Older pcsc-lite versions either fail or report the pseudo reader as unknown.
+        hresult, readerStates = SCardGetStatusChange(self.hcontext, 0, [(PNP_NOTIFICATION_READER, SCARD_STATE_UNAWARE)])
+
+        if hresult != SCARD_S_SUCCESS and hresult != SCARD_E_TIMEOUT:
+            return False
+
+        readerName, eventState, atr = readerStates[0]
+
+        if eventState & SCARD_STATE_UNKNOWN:
+            return False
+
+        self.pnpState = eventState & ~SCARD_STATE_CHANGED
+
+        return True
+
+    def waitForReaderListChange(self, timeout=INFINITE):
+        hresult, readerStates = SCardGetStatusChange(self.hcontext, timeout,
+                                                     [(PNP_NOTIFICATION_READER, self.pnpState)])
+
+        if hresult == SCARD_E_TIMEOUT or hresult == SCARD_E_CANCELLED:
+            return False
+        if hresult != SCARD_S_SUCCESS:
+            raise ReaderMonitorError(hresult)
+
+        readerName, eventState, atr = readerStates[0]
+        self.pnpState = eventState & ~SCARD_STATE_CHANGED
+
+        return True
+
+    def findReadyReader(self, readerPrefix):
+        hresult, readerNames = SCardListReaders(self.hcontext, [])
+
+        if hresult == SCARD_E_NO_READERS_AVAILABLE:
+            return None, []
+        if hresult != SCARD_S_SUCCESS:
+            raise ReaderMonitorError(hresult)
+
+        readerStates = [(readerName, SCARD_STATE_UNAWARE) for readerName in readerNames if
+                        readerName.startswith(readerPrefix)]
+
+        if len(readerStates) == 0:
+            return None, []
+
+        hresult, readerStates = SCardGetStatusChange(self.hcontext, 0, readerStates)
+
+        if hresult != SCARD_S_SUCCESS and hresult != SCARD_E_TIMEOUT:
+            raise ReaderMonitorError(hresult)
+
+        readerName = next((readerName for readerName, eventState, atr in readerStates if cardReady(eventState)), None)
+
+        return readerName, readerStates
+
+    def waitForReadyReader(self, readerPrefix, deadline=None):
+        pnpNotificationSupported = self.pnpNotificationSupported()
+
+        while True:
+            readerName, readerStates = self.findReadyReader(readerPrefix)
+
+            if readerName is not None:
+                return readerName
+
+            timeout = remainingMilliseconds(deadline)
+
+            if not pnpNotificationSupported:
+                time.sleep(min(POLLING_INTERVAL, timeout / 1000))
+                continue
+
+            watchedStates = [(PNP_NOTIFICATION_READER, self.pnpState)] + [
+                (readerName, eventState & ~SCARD_STATE_CHANGED) for readerName, eventState, atr in readerStates]
+
+            hresult, watchedStates = SCardGetStatusChange(self.hcontext, timeout, watchedStates)
+
+            if hresult == SCARD_E_TIMEOUT or hresult == SCARD_E_CANCELLED:
+                continue
+            if hresult != SCARD_S_SUCCESS:
+                raise ReaderMonitorError(hresult)
+
+            readerName, eventState, atr = watchedStates[0]
+            self.pnpState = eventState & ~SCARD_STATE_CHANGED
@@ -6,15 +6,23 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import base64
+import hashlib
 import json
 import os
 import qrcode
+import select
+import socket
+import struct
+import threading
+import time
 import uuid
+from collections import namedtuple
 from io import BytesIO
 from tlslite import *
 from zeroconf import ServiceInfo, Zeroconf, DNSQuestion, _TYPE_PTR, _TYPE_ANY
 
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QSettings, QSize, QThread, QCoreApplication
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QSettings, QSize, QThread, QRunnable, QThreadPool, \
+    QSocketNotifier, Qt
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtNetwork import QTcpServer, QHostAddress
 from PyQt5.QtQuick import QQuickImageProvider
@@ -26,21 +34,132 @@ class RemoteScreenException(Exception):
         self.reason = reason
 
 
+class HandshakeTimeoutError(Exception):
+    pass
+
+
+class FrameTooLargeError(Exception):
+    pass
+
+
+BinaryFrame = namedtuple('BinaryFrame', 'frameType payload')
+
+
 class RemoteScreen(QObject):
     SERVER_PORT = 19380
 
+    # A handshake has to complete within HANDSHAKE_TIMEOUT seconds, however slowly the client sends its data.
+    HANDSHAKE_TIMEOUT = 10.0
+    HANDSHAKE_WORKERS = 2
+    # Connections accepted while this many handshakes are running or queued are closed immediately.
+    MAXIMUM_PENDING_HANDSHAKES = 8
+    # Commands carry a single short APDU, a longer line means the peer is misbehaving.
+    MAXIMUM_FRAME_SIZE = 16384
+
+    # Version 1 exchanges newline-terminated JSON commands. A phone that sends a version in its Ping switches
+    # the session to the highest version both support, version 2 exchanges binary frames after the Pong.
+    PROTOCOL_VERSIONS = (1, 2)
+
+    FRAME_APDU = 0x01
+    FRAME_ERROR = 0x02
+    FRAME_PING = 0x03
+    FRAME_PONG = 0x04
+
+    class LineFramer(object):
+        # Splits a byte stream into newline-terminated frames. Bytes already searched for a newline are not
+        # searched again when more data arrives.
+
+        def __init__(self, maximumFrameSize):
+            self.maximumFrameSize = maximumFrameSize
+            self.buffer = bytearray()
+            self.searchOffset = 0
+
+        def feed(self, data):
+            self.buffer += data
+
+            frames = []
+            start = 0
+
+            while True:
+                end = self.buffer.find(b'\n', max(start, self.searchOffset))
+                if end == -1:
+                    break
+
+                if end + 1 - start > self.maximumFrameSize:
+                    raise FrameTooLargeError()
+
+                frames.append(bytes(self.buffer[start:end + 1]))
+                start = end + 1
+
+            del self.buffer[:start]
+            self.searchOffset = len(self.buffer)
+
+            if len(self.buffer) > self.maximumFrameSize:
+                raise FrameTooLargeError()
+
+            return frames
+
+    class BinaryFramer(object):
+        # Frames of protocol version 2: a type byte and the payload length as a big-endian 16 bit number,
+        # followed by the payload.
+
+        HEADER = struct.Struct('>BH')
+
+        def __init__(self, maximumFrameSize):
+            self.maximumFrameSize = maximumFrameSize
+            self.buffer = bytearray()
+
+        def feed(self, data):
+            self.buffer += data
+
+            frames = []
+            start = 0
+
+            while len(self.buffer) - start >= self.HEADER.size:
+                frameType, length = self.HEADER.unpack_from(self.buffer, start)
+
+                if length > self.maximumFrameSize:
+                    raise FrameTooLargeError()
+
+                end = start + self.HEADER.size + length
+                if end > len(self.buffer):
+                    break
+
+                frames.append(BinaryFrame(frameType, bytes(self.buffer[start + self.HEADER.size:end])))
+                start = end
+
+            del self.buffer[:start]
+
+            return frames
+
+        @classmethod
+        def encode(cls, frameType, payload):
+            return cls.HEADER.pack(frameType, len(payload)) + payload
+
     class TCPSocketWorker(QObject):
+        # Sleeps in its thread's event loop until the socket becomes readable, then decrypts whatever
+        # TLS records have arrived and emits every complete line.
 
-        lineRead = pyqtSignal(object)
+        frameRead = pyqtSignal(object)
 
         def __init__(self, parent):
             super().__init__(parent)
             self.connection = None
-            self.data = bytes()
+            self.notifier = None
+            self.reader = None
+            self.framer = RemoteScreen.LineFramer(RemoteScreen.MAXIMUM_FRAME_SIZE)
 
         @pyqtSlot()
         def closeConnection(self):
             try:
+                if self.notifier is not None:
+                    self.notifier.setEnabled(False)
+                    self.notifier.deleteLater()
+                    self.notifier = None
+
+                self.reader = None
+                self.framer = RemoteScreen.LineFramer(RemoteScreen.MAXIMUM_FRAME_SIZE)
+
                 if self.connection is not None:
                     self.connection.close()
                     self.connection = None
@@ -52,33 +171,58 @@ class RemoteScreen(QObject):
             try:
                 self.closeConnection()
                 self.connection = connection
+
+                # Newer tlslite-ng versions wrap the socket in a BufferedSocket, which only buffers writes.
+                sock = getattr(connection.sock, 'socket', connection.sock)
+
+                self.notifier = QSocketNotifier(sock.fileno(), QSocketNotifier.Read, self)
+                self.notifier.activated.connect(self.socketReadable)
+
+                # The handshake may have read application data along with its last records.
+                self.socketReadable()
             except Exception as e:
-                pass
+                self.closeConnection()
 
         @pyqtSlot()
-        def readLine(self):
-            while True:
-                try:
-                    gen = self.connection.readAsync()
-                    for data in gen:
-                        if isinstance(data, int):
-                            if data == 0:
-                                QCoreApplication.processEvents()
-                                if self.connection is None:
-                                    return
-                        elif isinstance(data, bytes):
-                            if len(data) == 0:
-                                self.closeConnection()
-                                return
-                            else:
-                                self.data += data
-                                test = data[-1:]
-                                if data[-1:] == b'\n':
-                                    self.lineRead.emit(self.data)
-                                    self.data = bytes()
-                                    return
-                except Exception as e:
-                    return
+        def socketReadable(self):
+            try:
+                while self.connection is not None:
+                    # A read that would block is resumed from the same generator on the next notification,
+                    # so a partially received record is not lost.
+                    if self.reader is None:
+                        self.reader = self.connection.readAsync()
+
+                    data = next(self.reader)
+
+                    if isinstance(data, int):
+                        return
+
+                    self.reader = None
+
+                    if len(data) == 0:
+                        self.closeConnection()
+                        return
+
+                    for frame in self.framer.feed(data):
+                        self.frameRead.emit(frame)
+            except Exception as e:
+                self.closeConnection()
+
+        @pyqtSlot(int)
+        def setProtocolVersion(self, version):
+            try:
+                # Anything the phone sent after the negotiating Ping is already in the new format.
+                buffered = bytes(self.framer.buffer)
+
+                if version == 2:
+                    self.framer = RemoteScreen.BinaryFramer(RemoteScreen.MAXIMUM_FRAME_SIZE)
+                else:
+                    self.framer = RemoteScreen.LineFramer(RemoteScreen.MAXIMUM_FRAME_SIZE)
+
+                for frame in self.framer.feed(buffered):
+                    self.frameRead.emit(frame)
+            except Exception as e:
+                self.closeConnection()
 
         @pyqtSlot(object)
         def writeLine(self, data):
@@ -87,33 +231,170 @@ class RemoteScreen(QObject):
             except Exception as e:
                 pass
 
+    class VerifierCache(object):
+        # The SRP verifier only depends on the bound phone's key. It is generated once, kept in memory and
+        # persisted with the binding together with a hash of the key it belongs to.
+
+        def __init__(self, settings):
+            self.lock = threading.Lock()
+            self.settings = settings
+            self.verifierDB = None
+
+        def get(self):
+            with self.lock:
+                if self.verifierDB is None:
+                    verifierDB = VerifierDB()
+                    verifierDB.create()
+                    verifierDB[b"user"] = self.loadEntry()
+                    self.verifierDB = verifierDB
+
+                return self.verifierDB
+
+        def loadEntry(self):
+            key = self.settings.value('removeScreenKey', '', str)
+            key = bytearray.fromhex(key)
+            keyHash = hashlib.sha256(key).hexdigest()
+
+            try:
+                stored = json.loads(self.settings.value('removeScreenVerifier', '', str))
+
+                if stored['keyHash'] == keyHash:
+                    return (int(stored['N'], 16), int(stored['g'], 16), bytearray.fromhex(stored['salt']),
+                            int(stored['verifier'], 16))
+            except (ValueError, KeyError, TypeError):
+                pass
+
+            entry = VerifierDB.makeVerifier("user", key, 2048)
+            N, g, salt, verifier = entry
+
+            self.settings.setValue('removeScreenVerifier', json.dumps(
+                {'keyHash': keyHash, 'N': format(N, 'x'), 'g': format(g, 'x'), 'salt': salt.hex(),
+                 'verifier': format(verifier, 'x')}))
+
+            return entry
+
+        def invalidate(self):
+            with self.lock:
+                self.verifierDB = None
+                self.settings.remove('removeScreenVerifier')
+
+    class VerifierTask(QRunnable):
+        # Generates the verifier of a new binding before the phone connects, away from the GUI thread.
+
+        def __init__(self, verifierCache):
+            super().__init__()
+            self.verifierCache = verifierCache
+
+        def run(self):
+            try:
+                self.verifierCache.get()
+            except Exception as e:
+                pass
+
+    class HandshakeTask(QRunnable):
+        # Runs on the server's handshake pool, only established sessions are handed back to the GUI thread.
+
+        def __init__(self, server, sock):
+            super().__init__()
+            self.server = server
+            self.sock = sock
+
+        def run(self):
+            if not self.server.handshakeStarted(self.sock):
+                return
+
+            try:
+                connection = TLSConnection(self.sock)
+                self.performHandshake(connection, self.server.verifierCache.get())
+                self.server.handshakeFinished(connection)
+            except Exception as e:
+                self.sock.close()
+            finally:
+                self.server.handshakeDone()
+
+        def performHandshake(self, connection, verifierDB):
+            deadline = time.monotonic() + RemoteScreen.HANDSHAKE_TIMEOUT
+
+            for result in connection.handshakeServerAsync(verifierDB=verifierDB):
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    raise HandshakeTimeoutError()
+
+                if result == 0:
+                    select.select([self.sock], [], [], remaining)
+                else:
+                    select.select([], [self.sock], [], remaining)
+
     class TCPServer(QTcpServer):
 
         newConnection = pyqtSignal(object)
 
-        def __init__(self, parent):
+        def __init__(self, parent, verifierCache):
             super().__init__(parent)
 
-        def incomingConnection(self, sock):
+            self.verifierCache = verifierCache
+
+            self.handshakePool = QThreadPool(self)
+            self.handshakePool.setMaxThreadCount(RemoteScreen.HANDSHAKE_WORKERS)
+
+            self.lock = threading.Lock()
+            self.pendingHandshakes = 0
+            self.queuedSockets = set()
+            self.stopped = False
+
+        def incomingConnection(self, handle):
             try:
-                sock = socket.fromfd(sock, socket.AF_INET, socket.SOCK_STREAM)
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, fileno=int(handle))
                 sock.setblocking(False)
-                connection = TLSConnection(sock)
 
-                settings = QSettings('Secalot', 'Secalot Control Panel')
-                key = settings.value('removeScreenKey', '', str)
-                key = bytearray.fromhex(key)
+                with self.lock:
+                    if self.stopped or self.pendingHandshakes >= RemoteScreen.MAXIMUM_PENDING_HANDSHAKES:
+                        sock.close()
+                        return
+                    self.pendingHandshakes += 1
+                    self.queuedSockets.add(sock)
+
+                self.handshakePool.start(RemoteScreen.HandshakeTask(self, sock))
+            except Exception as e:
+                pass
 
-                verifierDB = VerifierDB()
-                verifierDB.create()
-                entry = VerifierDB.makeVerifier("user", key, 2048)
-                verifierDB[b"user"] = entry
+        def handshakeStarted(self, sock):
+            # Whoever takes the socket off the queue, the task or close(), closes it and balances the count.
+            with self.lock:
+                if sock not in self.queuedSockets:
+                    return False
+                self.queuedSockets.remove(sock)
+                return True
 
-                connection.handshakeServer(verifierDB=verifierDB)
+        def handshakeFinished(self, connection):
+            with self.lock:
+                stopped = self.stopped
 
+            if stopped:
+                connection.close()
+            else:
                 self.newConnection.emit(connection)
-            except Exception as e:
-                pass
+
+        def handshakeDone(self):
+            with self.lock:
+                self.pendingHandshakes -= 1
+
+        def close(self):
+            # Sockets of queued handshakes are closed now, running ones end within HANDSHAKE_TIMEOUT and their
+            # sessions are closed.
+            with self.lock:
+                self.stopped = True
+                queuedSockets = list(self.queuedSockets)
+                self.queuedSockets.clear()
+                self.pendingHandshakes -= len(queuedSockets)
+
+            self.handshakePool.clear()
+
+            for sock in queuedSockets:
+                sock.close()
+
+            super().close()
 
     class QRCodeImageProvider(QQuickImageProvider):
 
@@ -157,9 +438,9 @@ class RemoteScreen(QObject):
     getDevicePublicKey = pyqtSignal()
 
     requestOpen = pyqtSignal(object)
-    requestRead = pyqtSignal()
     requestWrite = pyqtSignal(object)
     requestClose = pyqtSignal()
+    requestProtocolVersion = pyqtSignal(int)
 
     def __init__(self, engine, deviceCommunicator):
         super().__init__()
@@ -171,6 +452,8 @@ class RemoteScreen(QObject):
         self.qrCodeImageProvider.qrCodeImageData = None
 
         self.server = None
+        self.protocolVersion = 1
+        self.verifierCache = self.VerifierCache(QSettings('Secalot', 'Secalot Control Panel'))
 
         self.zeroConf = None
         self.zeroConfInfo = None
@@ -194,9 +477,11 @@ class RemoteScreen(QObject):
         self.requestClose.connect(self.tcpSocketWorker.closeConnection)
         self.requestOpen.connect(self.tcpSocketWorker.newConnection)
         self.requestWrite.connect(self.tcpSocketWorker.writeLine)
-        self.requestRead.connect(self.tcpSocketWorker.readLine)
+        self.requestProtocolVersion.connect(self.tcpSocketWorker.setProtocolVersion)
+        # The socket notifier has to be disabled in the thread it belongs to.
+        self.tcpSocketWorkerThread.finished.connect(self.tcpSocketWorker.closeConnection, Qt.DirectConnection)
 
-        self.tcpSocketWorker.lineRead.connect(self.dataReceived)
+        self.tcpSocketWorker.frameRead.connect(self.dataReceived)
 
     def __del__(self):
         self.tcpSocketWorkerThread.quit()
@@ -224,6 +509,7 @@ class RemoteScreen(QObject):
             settings.remove('mobilePhoneBound')
             settings.remove('removeScreenUID')
             settings.remove('removeScreenKey')
+            self.verifierCache.invalidate()
 
             self.unbindMobilePhoneReady.emit()
 
@@ -282,6 +568,9 @@ class RemoteScreen(QObject):
             settings.setValue('removeScreenKey', self.srpKey)
             settings.setValue('mobilePhoneBound', True)
 
+            self.verifierCache.invalidate()
+            QThreadPool.globalInstance().start(self.VerifierTask(self.verifierCache))
+
             self.finishMobilePhoneBindingReady.emit()
 
         except Exception as e:
@@ -299,7 +588,7 @@ class RemoteScreen(QObject):
             self.zeroConfInfo = ServiceInfo('_secalot._tcp.local.',
                                             guid + '._secalot._tcp.local.',
                                             None, self.SERVER_PORT, 0, 0,
-                                            {'version': '1'}, "secalot")
+                                            {'version': str(max(self.PROTOCOL_VERSIONS))}, "secalot")
 
             self.zeroConf = self.ZeroConfServer()
 
@@ -326,7 +615,7 @@ class RemoteScreen(QObject):
     @pyqtSlot()
     def startServer(self):
         try:
-            self.server = self.TCPServer(self)
+            self.server = self.TCPServer(self, self.verifierCache)
 
             self.server.newConnection.connect(self.newConnection)
 
@@ -357,29 +646,40 @@ class RemoteScreen(QObject):
     @pyqtSlot(object)
     def newConnection(self, connection):
         try:
+            self.protocolVersion = 1
             self.requestOpen.emit(connection)
-            self.requestRead.emit()
         except Exception as e:
             self.errorOccurred.emit(self.tr("A RemoteScreen error occurred."))
 
     @pyqtSlot(object)
-    def dataReceived(self, command):
+    def dataReceived(self, frame):
         try:
-            self.processCommand(command)
+            if isinstance(frame, BinaryFrame):
+                self.processFrame(frame)
+            else:
+                self.processCommand(frame)
         except RemoteScreenException as e:
             self.errorOccurred.emit(e.reason)
         except Exception as e:
             self.errorOccurred.emit(self.tr("A RemoteScreen error occurred."))
-        finally:
-            self.requestRead.emit()
 
     def processCommand(self, command):
         command = json.loads(command)
 
         if command["command"] == "Ping":
-            response = {"response": "Pong", "arguments": []}
+            if len(command["arguments"]) == 0:
+                version = 1
+                response = {"response": "Pong", "arguments": []}
+            else:
+                version = self.negotiateProtocolVersion(command["arguments"][0])
+                response = {"response": "Pong", "arguments": [str(version)]}
             response = json.dumps(response) + '\n'
             response = response.encode('utf-8')
+            # The worker switches its framing before the Pong is written, the phone sends the next command
+            # only after receiving it.
+            if version != self.protocolVersion:
+                self.protocolVersion = version
+                self.requestProtocolVersion.emit(version)
             self.requestWrite.emit(response)
         elif command["command"] == "SendAPDU":
             if (len(command["arguments"]) != 1):
@@ -389,12 +689,36 @@ class RemoteScreen(QObject):
         else:
             raise RemoteScreenException("Invalid RemoteScreen command received")
 
+    def negotiateProtocolVersion(self, requestedVersion):
+        try:
+            requestedVersion = int(requestedVersion)
+        except (TypeError, ValueError):
+            raise RemoteScreenException("Invalid RemoteScreen command received")
+
+        versions = [version for version in self.PROTOCOL_VERSIONS if version <= requestedVersion]
+
+        if len(versions) == 0:
+            raise RemoteScreenException("Invalid RemoteScreen command received")
+
+        return max(versions)
+
+    def processFrame(self, frame):
+        if frame.frameType == self.FRAME_APDU:
+            self.sendRemoteScreenCommand.emit(frame.payload)
+        elif frame.frameType == self.FRAME_PING:
+            self.requestWrite.emit(self.BinaryFramer.encode(self.FRAME_PONG, b''))
+        else:
+            raise RemoteScreenException("Invalid RemoteScreen command received")
+
     @pyqtSlot(str)
     def remoteScreenErrorOccurred(self, errorMessage):
         try:
-            response = {"response": "Error", "arguments": [errorMessage]}
-            response = json.dumps(response) + '\n'
-            response = response.encode('utf-8')
+            if self.protocolVersion == 2:
+                response = self.BinaryFramer.encode(self.FRAME_ERROR, errorMessage.encode('utf-8'))
+            else:
+                response = {"response": "Error", "arguments": [errorMessage]}
+                response = json.dumps(response) + '\n'
+                response = response.encode('utf-8')
             self.requestWrite.emit(response)
         except Exception as e:
             self.errorOccurred.emit(self.tr("A RemoteScreen error occurred."))
@@ -402,6 +726,10 @@ class RemoteScreen(QObject):
     @pyqtSlot(bytes)
     def remoteScreenCommandSent(self, response):
         try:
+            if self.protocolVersion == 2:
+                self.requestWrite.emit(self.BinaryFramer.encode(self.FRAME_APDU, response))
+                return
+
             response = {"response": "SendAPDU", "arguments": [base64.b64encode(response).decode('utf8')]}
             try:
                 response = json.dumps(response) + '\n'
@@ -2,7 +2,7 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.12.2)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
@@ -17,1474 +17,110 @@ qt_resource_data = b"\
 \x61\x72\x6b\x0d\x0a\x41\x63\x63\x65\x6e\x74\x3d\x42\x6c\x75\x65\
 \x0d\x0a\x50\x72\x69\x6d\x61\x72\x79\x3d\x42\x6c\x75\x65\x0d\x0a\
 \
-\x00\x00\x02\xc7\
+\x00\x00\x06\x4e\
 \x00\
-\x00\x0c\xed\x78\x9c\x9d\x56\x4b\x6f\xdb\x30\x0c\xbe\xfb\x57\x08\
-\xb9\x24\x01\x0a\xa3\x1d\x76\x1a\x50\x0c\x69\x92\x15\x05\xb6\xa2\
-\xef\x62\x47\x35\x66\x32\xa1\x8a\xe4\x4a\x54\xd3\x6c\xc8\x7f\x1f\
-\x1d\xbb\xf1\x5b\x71\xa2\x93\x2d\x92\x1f\x29\xf2\x23\x25\xb1\x8c\
-\xb5\x41\x76\x8b\xb7\x4e\xcc\x5e\xd9\x97\xf0\x6b\x20\x4a\x5b\xe1\
-\x44\x70\xa9\x17\x96\x9d\x85\x67\x41\x30\xc5\x3f\x60\xc0\x2d\x9f\
-\xb9\x94\x80\x3f\xb4\x59\xb2\x7f\x41\xc0\x68\xfd\x06\x7b\xad\x7f\
-\x81\xb5\x7c\x01\x37\x3a\x76\x31\x09\x58\xb6\x44\xf4\x8d\xad\xab\
-\xf2\xad\x74\x93\x1a\xdf\x08\x35\x52\xd1\x3d\x40\x34\x55\x68\xd6\
-\x1e\x98\xb8\x5d\xb3\x02\xd8\x01\xc9\x0b\x31\x11\x36\x96\x7c\x9d\
-\xb8\xf2\xa0\x44\xcd\x5a\x45\xa0\xb1\x56\x0a\x66\x28\xb4\xb2\x05\
-\x63\xe4\x66\x01\xd8\x94\x97\x9d\x8a\x56\x94\xd4\x0b\x87\xa8\xd5\
-\x58\x52\x29\x80\xfc\xe5\x00\xc9\x5a\x89\x18\xb4\xc3\x3b\x78\x73\
-\x60\x11\xa2\xc1\x70\x27\xde\x74\x0f\xc1\x97\xd3\x42\x30\x77\xe4\
-\x42\x1b\xf0\x06\xf4\xce\x0d\x03\x85\xc4\x91\x68\xc2\x91\xb3\x73\
-\x1f\x78\x48\xde\xa7\xb9\x72\x21\xf8\x64\x99\xd4\x5d\x7e\xb6\x02\
-\x6e\x68\x09\xef\xa4\xe8\x29\x54\xb0\xa2\xa2\x97\xf7\x0c\xc4\xc0\
-\x91\xb6\x8f\x4d\x8b\x37\x1f\x63\x43\xe0\x47\xa4\xe3\xc0\x3c\xcc\
-\xb6\x6e\x9a\xd3\x70\xcc\xa1\xe7\x4e\x6d\x8f\xcc\x66\x52\x5b\xf0\
-\x74\xde\x60\x58\x38\x8d\xaf\x8c\x5b\xa0\x2c\xea\x36\x27\x7b\xd1\
-\x0f\x83\x2d\xb4\xdd\x20\xe1\xc2\xf0\x73\x0c\x25\xab\xa5\x27\x89\
-\x34\x98\x1b\xec\xd5\xd6\x31\xa8\x16\xef\x04\x94\x0e\xc0\x2b\x35\
-\xd7\x03\x1e\xc7\x4f\x60\x2c\x09\x4e\xd8\x2a\xdb\x16\x48\x53\x53\
-\xfc\x4d\x48\x4a\x67\x23\xb1\x98\x8b\x4a\x94\x62\x5e\xb0\x64\xe7\
-\xe7\xac\x7f\x1a\x9e\xf6\x87\x15\x06\xa5\xd5\x4f\xbd\x5d\x1a\xed\
-\xe2\x0b\xfd\x11\x82\xe2\x2f\x12\x22\xa2\xd3\x9c\x4b\x0b\x4d\x6d\
-\x73\x80\x45\x36\x44\xf6\x58\x94\x4c\xf2\xc0\x9f\xb8\x74\xf0\x93\
-\xbf\x80\x0c\x11\x3e\x90\xd4\xdf\xec\x83\x19\xf4\xaf\x35\xb2\x98\
-\x62\x21\x66\xf6\xcb\x7c\x4e\x53\x74\x8f\x1c\x9d\x6d\xb3\x7e\x54\
-\xaf\x4a\xaf\x54\xbf\x4a\xe1\x64\x01\x45\x53\x49\x92\x2f\x9c\x5c\
-\x76\x40\x14\xb5\x32\x96\x8f\x4f\xa5\xab\x69\x50\x05\xb3\xe8\x7b\
-\x22\xdf\xed\x0d\xab\x05\x3d\xaa\xa8\xc7\x15\xb6\x4b\x71\xd1\xb8\
-\xb2\xd1\xa6\xf4\xd7\x90\xec\x0e\x07\xa8\x81\x76\x89\xbf\xd1\xa8\
-\x1b\x37\x9b\xe3\x6f\x9b\x7a\xc0\xcd\x04\xde\xc5\x0c\xb6\xdd\x5b\
-\xea\x49\x1f\x91\x7a\xbd\x9d\x9a\x9f\x3c\xa4\xb8\xd3\x3c\xa8\xd2\
-\x87\x55\xb8\x7b\x6a\xaa\x29\x48\xda\x12\x2f\x1f\xaf\x4a\x23\xb8\
-\x96\x97\x9d\xa4\xf6\x42\x29\x4d\xe6\x64\x75\xbd\x1c\x32\xdd\x4e\
-\xa3\xde\x8a\x85\xe2\xb2\xed\x85\x93\x49\x6b\x6f\x04\x8b\x46\xa8\
-\x05\x4b\x9f\x07\xd9\xcf\xe7\x25\x99\xfd\x56\xee\xc7\x0c\xa9\x7a\
-\xcb\xee\xb5\x0d\x6a\x35\x48\x5f\x02\x61\xe9\x31\xe0\x49\x22\xd5\
-\xa0\xf8\x66\x7e\x20\xf2\x0c\xd2\xf9\x31\x32\xc0\xd6\xda\x31\xeb\
-\xb2\x8f\x15\x57\xc8\x50\xb3\x08\xc8\xcd\x76\xcb\x64\x1c\xfc\x4e\
-\x03\xc6\xe3\xa3\x7e\x87\x95\x38\xe6\x8d\xd8\x5f\x54\x22\xcb\x48\
-\xca\x8e\x1c\xa8\x87\x51\xec\x8b\x7d\x51\x74\x75\xbf\xcf\xef\x26\
-\xf8\x0f\x25\x57\x06\x8d\
-\x00\x00\x00\x39\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x50\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\
-\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\
-\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
-\x00\x00\x3f\x91\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x27\x97\x00\x00\
-\x27\x97\x01\xe3\x1e\x7b\xf5\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe1\x03\x1a\x12\x0b\x35\xc3\x2d\xc5\x5a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\xda\xec\xdd\x79\x7c\x9d\x75\x9d\xfe\xff\xeb\x7d\x9f\
-\x73\x92\xee\x0b\x94\x7d\x47\x04\x64\x51\x99\x22\x08\x95\xa1\xd2\
-\x24\xa5\x42\x71\x4d\xbf\x7e\x55\x0a\x59\xda\xfa\x45\xc1\xe1\x37\
-\x6a\x69\xd2\x8e\xb7\x36\x49\xc1\x61\x74\xc4\xc1\x99\xb4\x49\x0a\
-\x88\xa3\xb6\xa3\x40\x8b\x94\x66\xa9\x75\x28\xab\x22\xb8\xb0\x4a\
-\xcb\x52\x90\xb2\x76\x5f\x92\x73\xce\xfd\xfe\xfd\x91\x82\x20\x85\
-\x36\x6d\x96\x73\xce\xfd\x7a\x3e\x1e\x15\x17\x30\x27\xd7\xe7\x24\
-\x9f\xeb\x7e\xdf\xf7\xb9\x6f\x13\x80\x7e\x77\xd1\x37\x9b\x87\xa7\
-\x87\x44\x23\xa3\xac\x8f\x8c\xa2\xc4\x60\x37\x1b\xa5\x28\x2a\x36\
-\xd3\x10\xb7\x60\x98\x29\x2a\x52\xa4\x51\xb2\xa0\x58\xa6\x21\xee\
-\x3e\x3c\x90\x52\x2e\x1b\x25\x49\x72\x2f\x36\xd3\x10\x49\x72\x69\
-\x88\x64\xc5\xdd\xff\xde\x87\x99\x94\xda\xf9\x65\x46\x4a\x16\xec\
-\xfa\x15\x78\xd0\xfd\xbf\xbf\xa7\x48\xb2\x8d\xef\xfd\xb7\x78\x46\
-\xd2\xe6\xdd\xfc\xff\x74\x49\xb6\x75\xe7\xdf\xef\x26\x6d\xd8\xf9\
-\xdf\x67\x5c\xd6\xfd\xcf\x5a\xd4\xe9\x6e\xdb\x24\x29\x90\xb6\xb9\
-\x59\xa7\x79\xb4\xc5\x5d\x69\xb3\x60\x7d\x64\x4a\x9b\x47\x5b\xcc\
-\x82\xed\x91\xb4\x23\xe1\xd1\xa6\x6c\xa0\xb4\xd2\xc1\xc6\x44\x90\
-\xde\xee\x5d\x83\x37\xb5\x5e\x3b\x75\x2b\xef\x2c\x60\xcf\x19\x11\
-\x00\x7b\x67\x72\xd8\x38\x64\xfb\x76\x8d\x49\x24\x52\x63\x32\x41\
-\x74\x60\xc2\x6d\x7f\x37\x1f\x23\xd9\xfe\x72\x1b\x2d\xf9\x48\xb9\
-\x46\x2a\xd0\x48\xb9\x8f\x94\x6c\xa4\x64\xa3\x24\x1f\xd9\xbd\xcf\
-\xa1\x97\xed\x2c\x2c\xbe\x41\xd2\xa6\xee\x62\xe2\x9b\x64\xb6\xc9\
-\x5d\x9b\x4c\xbe\xc1\x3d\xd8\x64\xe6\xaf\xb9\xf4\x8a\x2c\x7a\x4d\
-\x96\x7c\x2d\x91\xed\x7a\x75\x44\xd1\xe8\xd7\x16\x87\x53\xba\x88\
-\x10\x14\x00\x20\xa6\xce\xba\x72\xd1\xe0\x11\xc5\x9b\x0e\x93\x25\
-\x0e\x71\xcb\x1e\x16\x99\x1d\x6c\xa6\xc3\xdd\x75\xb0\x49\x63\x24\
-\x1d\xa8\xee\xbf\xee\x2f\x75\x1f\x81\xa3\x30\xb8\xb4\xd9\xa4\xd7\
-\xe4\x7a\x45\xa6\x57\x65\xfe\x9a\x79\xb0\x2e\x92\xbf\x10\xb8\xaf\
-\x33\x4f\xbc\x10\x25\xb4\x6e\x50\xb2\xeb\x85\xa5\xe1\x8c\x6d\x24\
-\x06\x0a\x00\x90\x27\x26\x5d\x7e\x5d\x71\xd7\xb0\x41\x47\x05\x89\
-\xc4\xd1\xe6\x76\xb4\xcb\x8f\x32\xd3\xe1\x72\x1d\xea\xd2\xa1\xea\
-\xfe\x33\x8a\xa4\xb0\x07\x36\x4a\x7a\x41\xd2\xba\xee\xbf\xfa\x8b\
-\x32\x7b\xce\x23\x7f\xc6\x3d\x78\x7a\xdb\x8e\x61\x4f\xdf\xfb\xfd\
-\x29\xdb\x89\x09\x14\x00\xa0\x1f\x94\x97\x2f\x4a\xac\x7f\xdf\x96\
-\xa3\x2c\xe9\xc7\xfd\x6d\x83\xb7\xa3\xdd\xfd\x68\xb9\x8e\x96\xe9\
-\x10\xde\xf3\xe8\xc7\x5f\xae\xeb\x5c\xf6\x8c\xcc\x9f\x91\xfc\x69\
-\xf3\xe0\x19\x79\xf6\x69\x0f\x92\xcf\xbc\xfe\x72\xd7\x33\x0f\xce\
-\x9f\x91\x26\x25\x50\x00\x80\x1e\x18\x1f\x2e\x1c\x55\x94\xcd\xbc\
-\xcf\x23\x3b\xd6\xcc\x4e\x76\xb7\x93\x24\x1d\x2b\xf9\x07\xc4\x58\
-\x1e\xf9\x21\x23\xe9\x39\x93\xd6\xb8\xf4\xa8\xc9\x1e\x89\x4c\x6b\
-\x3c\xca\xfe\xa9\xa3\x61\xda\x4b\xc4\x03\x0a\x00\x62\x6d\x62\xd8\
-\xb4\x9f\xba\xec\x43\x6e\x76\xaa\x2b\x3a\x55\xb2\x13\x25\x9d\xa8\
-\xee\x73\xf0\x40\xa1\x7a\x49\xb2\xc7\xe4\x7a\xc2\xcd\x1f\x97\xd9\
-\x9f\x3d\x9b\x78\xa8\x63\xde\x25\xaf\x11\x0d\x28\x00\x28\xb0\x23\
-\xfa\x30\x59\x9c\x3d\xf4\x84\x28\x0a\x4e\x32\xb3\x93\x23\xd7\x58\
-\x93\x4e\x92\x74\x0c\xef\x51\xe0\x4d\x2f\x9a\xf4\x88\x4b\x8f\xba\
-\xeb\xc1\x44\x22\xfb\xe0\xf2\xb9\xd3\x1e\x95\xcc\x89\x06\x14\x00\
-\xe4\xc5\x66\x9f\xea\x3a\xea\x14\x33\x3f\xc3\xe5\x67\x48\x3a\x5d\
-\xd2\x07\x24\x15\x91\x0e\xd0\x63\x1b\x24\x7b\xd8\x3d\x7a\x48\xb2\
-\x87\x13\x89\xec\x83\x67\x25\xfe\xfa\x58\x18\x86\x11\xd1\x80\x02\
-\x80\x01\x55\x1a\x36\x1f\x6a\x69\x1f\x2b\xb3\xb1\x72\x8d\x73\xe9\
-\x6c\x71\x9e\x1e\xe8\x33\x2e\x6d\x36\xd3\x1f\x25\x5b\x65\x1e\xdd\
-\x9d\xca\x76\xad\xfa\xd5\xd5\x97\xad\x27\x19\x50\x00\xd0\x67\xc6\
-\x4e\x6f\x4c\x8d\xda\x3f\x79\x7a\x60\xfe\x8f\x32\x3b\x47\xd2\x99\
-\xe2\x7c\x3d\x30\xd0\xb2\x92\xfe\xec\xd2\xdd\x26\xbf\x2f\x6b\xc9\
-\x7b\x56\xd4\x5d\xba\x9a\x58\x40\x01\xc0\x5e\x9b\x74\xf9\x75\xc5\
-\xd1\xb0\xe1\x67\x44\x16\x8d\x37\xd3\x3f\xba\x74\x96\xa4\xa1\x24\
-\x03\xe4\xbc\x97\x4c\x5a\x15\x99\x75\x78\x36\xd3\xd1\x31\x6f\xfa\
-\x93\x44\x42\x01\x00\xde\xf3\x08\x7f\xf4\x81\xc1\x38\x73\xfb\xb8\
-\x64\xe3\x25\x9d\x21\x69\x10\xc9\x00\xf9\xbe\x13\xd8\x73\x72\xef\
-\x70\xf7\x76\x97\x77\xf0\x51\x44\x0a\x00\xa0\x09\x35\x0b\x0e\x32\
-\x05\x13\xcd\xec\x42\xc9\x4b\xc5\x9d\xf2\x80\x38\x58\xe3\x52\xbb\
-\xc9\xdb\xd3\xa9\x44\xdb\xca\xb0\x62\x03\x91\x50\x00\x50\xe0\x26\
-\x5d\x7e\x5d\x71\x7a\xe4\xb0\x73\x4c\x7e\xbe\x5c\x93\xd4\xfd\x71\
-\x3c\x00\xf1\x95\x91\x74\x8f\xcb\x97\x9a\x25\x6e\x6b\xab\xab\xf8\
-\x0b\x91\x50\x00\x50\x20\x26\x86\x4d\xfb\x45\x5d\x76\x91\xa4\x4f\
-\xcb\x34\x41\x9c\xc7\x07\xf0\xee\x1e\x97\x7c\x89\x22\x2d\x19\x57\
-\xfc\xfc\xbd\x7c\xe4\x90\x02\x80\x3c\x33\x61\xd6\x8d\xfb\x9b\x65\
-\x2e\x90\xa9\xdc\xa4\x32\xf1\x39\x7c\x00\x3d\xf7\x9a\xa4\x3b\x24\
-\x5f\x3a\x38\x6d\x77\x2e\xf9\x6e\xd5\x66\x22\xa1\x00\x20\x07\x95\
-\xd5\xb6\x1c\xe1\x16\x7d\x46\x6e\x9f\x91\xf4\x31\xf1\x4c\x7a\x00\
-\xbd\x67\xbb\x4b\x1d\x81\xfb\x2d\x5d\x45\x89\x5f\x72\xdd\x00\x05\
-\x00\x03\x6c\x62\xd8\xb4\x5f\x94\xb1\xff\x2b\xb7\x2f\x49\x7e\x26\
-\x6b\x0e\xa0\x1f\x74\xba\x6b\x99\x99\xff\xf7\x96\x6d\x23\x6e\xe7\
-\xd1\xc8\x14\x00\xf4\x93\xf2\xf2\x45\x89\xf5\x27\x6c\xf9\xb8\xb9\
-\x4f\x95\xf4\x39\x49\x83\x49\x05\xc0\x40\x4d\x06\x24\xbb\xdd\x14\
-\xfd\xf8\xb5\x57\xb2\x77\xf2\x18\x64\x0a\x00\xfa\xe2\x68\x7f\xce\
-\xfc\x93\x23\x4f\x5e\x2c\xf7\x4b\x25\x1d\x44\x22\x00\x72\xcc\xeb\
-\x92\x7e\xe5\x66\x37\xb5\xd7\x55\x74\xf0\x20\x23\x0a\x00\xf6\x41\
-\xc9\xcc\xc6\x91\x96\x4a\x5c\x6a\x6e\x95\x2e\x7d\x90\x44\x00\xe4\
-\x89\x67\x5c\x76\x73\x60\xd9\x96\xd6\xba\x69\x4f\x13\x07\x05\x00\
-\x7b\xe8\xfc\xd9\xcd\x27\x64\x5d\x97\x49\xaa\x94\x34\x8c\x44\x00\
-\xe4\xa9\xc8\xa4\x15\x2e\x9f\xff\xfa\x2b\xd9\x5b\x39\x45\x40\x01\
-\xc0\x2e\x84\x61\x18\xdc\x93\x3e\xfc\x02\xc9\xae\x70\x69\x02\xeb\
-\x07\xa0\xc0\x36\xa4\x75\x6e\x76\x63\x56\xc1\x02\x1e\x58\x44\x01\
-\x80\xa4\xb2\xf0\xa6\x03\xbd\xab\xab\x42\x66\xff\x4f\xd2\x51\x24\
-\x02\x20\x2e\x53\x81\x51\xa9\x11\xb7\x2d\x0e\xa7\x74\x11\x09\x05\
-\x20\x56\xce\xbf\x6a\xe1\xd1\xd9\x44\x34\x53\x52\x85\xa4\x62\x12\
-\x01\x10\x43\x2f\xc9\xec\x06\xcf\x68\x7e\xfb\xd5\x95\x6b\x88\x83\
-\x02\x50\xd0\x4a\xae\x6a\x39\x56\x09\x9f\x69\xdd\x1b\x7f\x8a\x44\
-\x00\x40\x91\x4b\x77\xc8\xec\x07\xed\x75\x95\xed\xc4\x41\x01\x28\
-\xac\x8d\x7f\xce\xc2\x53\x2d\x8a\xbe\x21\xe9\x0b\x92\x12\x24\x02\
-\x00\xbb\xdc\xba\x1e\x74\xf7\xeb\x32\x45\x6b\xff\x7b\x65\x18\x66\
-\xc8\x83\x02\x90\xb7\x26\xcc\x6a\x3e\xcb\x02\xd5\x98\x74\x01\x6b\
-\x02\x00\x7b\x6c\x8d\xc9\x7e\xd0\x95\xda\xde\xb2\x32\xfc\xca\x16\
-\xe2\xa0\x00\xe4\x8d\xb2\x59\x0b\x4f\xf4\xc0\xbf\x23\x79\x39\x69\
-\x00\xc0\x5e\xdb\x24\xe9\x06\x93\x5d\xdb\x5a\x5f\xb9\x96\x38\x28\
-\x00\x39\xab\x34\x6c\x3e\x54\x69\xff\xb6\x64\x15\x62\xd4\x0f\x00\
-\xbd\xa5\xcb\x4c\x3f\x93\xdb\x6c\x8a\xc0\xee\x25\x89\xa0\xff\x8c\
-\x0f\xaf\x1f\x96\xea\x2a\xfe\x8a\xa7\x55\x6b\xb2\xe1\x24\x02\x00\
-\xbd\xaa\xc8\x5d\x53\x5d\xbe\x44\x12\x05\x80\x02\x30\xf0\xc6\x4e\
-\x6f\x4c\xed\x7f\x40\xaa\xc2\xd3\xfe\x1d\x99\x0e\x62\xec\x02\x00\
-\x7d\x27\x90\x73\xdf\x00\x0a\xc0\xc0\x2b\xab\x59\x50\xea\x16\x5c\
-\xef\xf2\xf7\x93\x06\x00\xf4\xbd\xc8\x03\x0a\x00\x05\x60\xe0\x4c\
-\xa8\x59\x70\x50\x60\xc1\xbf\xba\x74\x31\x69\x00\x40\x7f\x8e\x00\
-\xb2\x9d\x84\x40\x01\x18\x00\x6e\x25\x35\x2d\x17\x9b\xe9\x7b\x92\
-\xf6\x27\x0f\x00\xe8\xe7\xdf\xc2\xd9\x80\x02\x40\x01\xe8\xf7\xa3\
-\xfe\x0f\x26\x82\x96\xff\x72\xd7\x59\xa4\x01\x00\x03\xb4\xb1\x99\
-\x51\x00\x28\x00\xfd\x63\x72\xd8\x38\x64\x47\x26\xf9\x1d\xb9\xbe\
-\xe6\x4e\xa6\x00\x30\xa0\x13\x00\x45\x5c\x03\x40\x01\xe8\x7b\x25\
-\x73\x16\x9e\xba\x23\x1d\xfd\x44\xd2\xa9\xa4\x01\x00\x39\x50\x00\
-\x82\x04\x13\x80\x3d\x10\x10\xc1\x5e\xbf\xc5\xac\x74\x76\xd3\xd7\
-\x2c\x8a\x7e\xc7\xe6\x0f\x00\xb9\x23\xeb\x59\x26\x00\x4c\x00\xfa\
-\xe8\xa8\x7f\x66\xe3\x91\x96\x6a\xb9\x49\x6e\xe7\x92\x06\x00\xe4\
-\x96\x28\xc5\x04\x80\x09\x40\x1f\x28\xad\x6d\x2a\xb7\x64\xea\x61\
-\xb9\xd8\xfc\x01\x20\x07\x15\x8b\x09\x00\x13\x80\x5e\x34\x29\xbc\
-\x79\x44\x26\xd3\xd9\x28\xd7\xe7\x25\x27\x10\x00\xc8\x51\x9d\xea\
-\xa4\x00\x50\x00\x7a\xc7\xc4\xab\x9a\x8e\xcb\xa4\xbb\x6e\x95\x74\
-\x32\x69\x00\x40\xae\x7b\x65\x07\x19\xec\x1e\xb7\xa5\xdf\x8d\xb2\
-\x9a\xe6\x49\x6e\xfa\x6f\x49\xa3\x48\x03\x00\x72\x5e\xd4\x56\x5f\
-\xc5\x53\x56\xf7\x00\xd7\x00\xbc\x2b\xb7\xd2\x9a\xa6\x99\x6e\xba\
-\x9d\xcd\x1f\x00\xf2\x06\xe3\xff\x3d\xc4\x29\x80\x5d\x1d\xf5\x7f\
-\xfd\xa6\xa1\x5e\xbc\x70\xa1\x64\xe5\xa4\x01\x00\x79\x85\x4f\x00\
-\x50\x00\xf6\x72\xf3\xaf\x6d\x39\xc2\x95\xb9\x45\xf2\xb1\xa4\x01\
-\x00\x4c\x00\x28\x00\x71\xd8\xfc\xe7\x2c\x18\xeb\x91\xdf\x21\xe9\
-\x40\xd2\x00\x80\x3c\xe4\x4c\x00\xf6\x14\xd7\x00\xec\x54\x32\x7b\
-\xc1\x78\x8f\x82\x15\x6c\xfe\x00\x90\xc7\x8c\x09\x00\x05\xa0\x27\
-\x9b\x7f\x6d\xcb\x27\xcd\x83\x65\x92\x46\x90\x06\x00\xe4\x35\x26\
-\x00\x14\x80\x3d\xdc\xfc\x6b\x9a\xa7\x9a\xfc\x7f\x24\x0d\xe2\xed\
-\x00\x00\xf9\xce\x29\x00\x14\x80\xdd\x2b\x9d\xdd\xf4\x35\x33\xdd\
-\x20\xae\x85\x00\x80\x02\x61\x9c\x02\xa0\x00\xec\x6e\xf3\x6f\xbe\
-\x56\x6e\xff\x2e\x6e\x86\x04\x00\x85\x84\x02\x40\x01\x78\xcf\x23\
-\xff\x06\xb9\xfe\x99\xe5\x07\x80\x82\xc3\x29\x80\x3d\x14\xbb\xd1\
-\x77\x49\x6d\xf3\x3f\xc9\x35\x8b\xa5\x07\x80\x42\xc4\x35\x00\x4c\
-\x00\x76\xa1\xac\xb6\xe9\x32\x93\xbe\xcf\xb2\x03\x40\x81\x6e\xff\
-\xce\x35\x00\x14\x80\xbf\x53\x5a\xdb\x74\xb1\xcb\x7e\xc8\x92\x03\
-\x40\x01\x33\x26\x00\x14\x80\xb7\x1e\xf9\xcf\x6e\xfa\x94\x64\x2d\
-\xe2\x63\x8f\x00\x50\xd8\x9b\x9a\x19\x05\x80\x02\xd0\xad\xa4\xa6\
-\x65\xa2\xbb\xfd\x5c\x7c\xd4\x0f\x00\x0a\x9e\xbb\x73\x0a\x80\x02\
-\x20\x4d\x9c\x33\xff\x64\x33\xff\xb9\xa4\x22\x96\x1a\x00\xe2\xd0\
-\x00\x98\x00\xc4\xbe\x00\x4c\xac\x69\x3c\x24\xf2\xe4\x1d\x92\x46\
-\xb2\xcc\x00\x10\x93\xfd\x5f\x4c\x00\x62\x5d\x00\x26\x87\x8d\x43\
-\x22\x4b\x2e\x91\xfb\x91\x2c\x31\x00\xc4\x87\x05\x01\x05\x20\xce\
-\x05\x60\x47\x3a\xf5\x23\x49\xa7\xb3\xbc\x00\x10\xb7\x11\x40\xc4\
-\x29\x80\xb8\x16\x80\xb2\xd9\x2d\x57\x4a\x7e\x09\x4b\x0b\x00\xb1\
-\x9c\x01\x50\x00\xe2\x58\x00\xca\x6a\x5b\xce\x76\xf7\xab\x59\x56\
-\x00\x88\xe9\x00\x80\x6b\x00\xe2\x57\x00\x26\xd4\x2c\x38\x48\xf2\
-\x5f\x88\x2b\xfe\x01\x20\xc6\x9b\x1a\xd7\x00\xc4\xac\x00\xb8\x99\
-\x05\x4d\x2e\x1d\xcc\x92\x02\x40\x8c\x27\x00\xc6\x35\x00\x7b\xaa\
-\x20\x6e\x8e\x53\x5a\xbb\xf0\x1b\x92\x2e\x64\x39\x01\x20\xe6\x22\
-\xae\x01\x88\xcd\x04\xa0\xb4\xb6\xf9\x74\xc9\xeb\x58\x4a\x00\x00\
-\xd7\x00\xc4\xa4\x00\x4c\xba\xfc\xba\x62\xc9\x6e\x90\x94\x62\x29\
-\x01\x00\xe2\x59\x00\xf1\x28\x00\xd9\x11\xc3\xea\x24\x3f\x99\x65\
-\x04\x00\x48\x3c\x0c\x28\x16\x05\x60\xc2\xac\xe6\xb3\x5c\x7e\x25\
-\x4b\x08\x00\x78\x03\xa7\x00\x0a\xbc\x00\x94\x87\x8b\x8a\x82\x40\
-\x4d\x92\x12\x2c\x21\x00\xe0\x4d\x59\x26\x00\x05\x5d\x00\xd6\x77\
-\x6d\x9e\x25\xe9\x24\x96\x0f\x00\xf0\x56\x11\x13\x80\xc2\x2d\x00\
-\xa5\xb3\x17\xbe\xdf\x4c\x57\xb1\x74\x00\x80\xbf\x97\xe4\x1a\x80\
-\x02\x9e\x00\x78\xf4\x5f\x92\x06\xb1\x74\x00\x80\x77\x6c\x11\x8a\
-\x98\x00\x14\x62\x01\x28\x9b\xdd\xf2\x39\x49\xe7\xb1\x6c\x00\x80\
-\x5d\x16\x80\x20\xc1\x04\xa0\xd0\x0a\xc0\xa4\xcb\xaf\x2b\x76\xf7\
-\x79\x2c\x19\x00\xe0\x5d\x0b\x40\xba\x8b\x02\x50\x68\x05\x20\x33\
-\x62\xe8\x3f\x4b\x3a\x8e\x25\x03\x00\xbc\xeb\x5e\x31\xb8\x88\x53\
-\x00\x85\x54\x00\xca\xc2\x9b\x0e\x74\x71\xe1\x1f\x00\xe0\xbd\x15\
-\x2b\x4b\x01\x28\xa4\x02\xe0\xe9\x74\xad\x49\xc3\x59\x2e\x00\xc0\
-\x7b\xee\x17\x5b\x8a\x38\x05\x50\x28\x05\xa0\x64\x66\xe3\x91\x92\
-\x66\xb0\x54\x00\x80\xdd\xe9\x1a\xb6\x86\x02\x50\x28\x05\xc0\x92\
-\xc9\x50\x52\x31\x4b\x05\x00\xd8\x8d\x68\x65\x18\x66\x88\xa1\x00\
-\x0a\xc0\x79\xb3\x6f\x78\x9f\xa4\x8b\x59\x26\x00\xc0\x9e\x0c\x00\
-\x88\xa0\x40\x0a\x40\xd2\xb3\x33\x25\x25\x59\x26\x00\xc0\x1e\x60\
-\xfc\x5f\x08\x05\xe0\xbc\xda\x1b\x0f\x73\x69\x2a\x4b\x04\x00\xa0\
-\x00\xc4\xa8\x00\x24\x95\xf9\xba\x38\xf7\x0f\x00\xd8\x53\xce\x29\
-\x80\xbc\x2f\x00\xe3\xc3\x85\xa3\x5c\xaa\x66\x79\x00\x00\x7b\xca\
-\xcc\x99\x00\xe4\x7b\x01\x48\xa6\xb3\xd5\x92\x86\xb1\x3c\x00\x80\
-\x3d\x1f\x00\x18\x13\x80\x7c\x2e\x00\xe5\xe5\x8b\x12\x26\xbb\x8c\
-\xa5\x01\x00\xf4\xb0\x02\x30\x01\xc8\xe7\x02\xb0\xf1\x84\x2d\x9f\
-\x96\x74\x0c\x4b\x03\x00\xe8\x19\x26\x00\x79\x5d\x00\xdc\xfd\xcb\
-\x2c\x0b\x00\xa0\xc7\xfb\x07\xd7\x00\xe4\x6f\x01\x28\x9b\xbd\xe0\
-\x18\x49\x1f\x67\x59\x00\x00\x3d\xde\xd0\xdc\x28\x00\xf9\x3b\x01\
-\xb0\x2a\xe5\xd1\x23\x8a\x01\x00\x39\x34\x01\x90\x73\x0a\x20\x1f\
-\x0b\xc0\xf8\x30\x4c\xba\xdb\xa5\x2c\x09\x00\x60\x2f\x0f\x22\x99\
-\x00\xe4\x63\x01\x28\xea\x3a\xa2\x54\xd2\x61\x2c\x09\x00\x80\x09\
-\x40\x8c\x0a\x80\x07\xfe\x05\x96\x03\x00\xb0\xd7\x1b\x9a\x31\x01\
-\xc8\xbb\x02\x30\x39\x6c\x1c\x22\xb7\x4f\xb1\x1c\x00\x80\xbd\x3e\
-\x90\x74\x26\x00\x79\x57\x00\x3a\xbb\x12\x17\x89\x3b\xff\x01\x00\
-\xf6\xa9\x01\x30\x01\xc8\xbb\x02\x10\xc9\xfe\x0f\x4b\x01\x00\xd8\
-\xa7\xfd\x9f\x6b\x00\xf2\xab\x00\x4c\x0e\x1b\x87\x98\xa9\x8c\xa5\
-\x00\x00\xec\xd3\x86\xc6\x35\x00\xf9\x55\x00\x3a\x33\x89\x32\x49\
-\x43\x58\x0a\x00\xc0\x3e\x31\x51\x00\xf2\xa9\x00\xb8\xdb\x27\x59\
-\x06\x00\xc0\xbe\xef\x27\xe2\x14\x40\xbe\x14\x80\xf2\xf2\x45\x09\
-\x49\x17\xb0\x0c\x00\x80\x7d\x2e\x00\x5c\x03\x90\x3f\x05\x60\xe3\
-\x89\x5b\x4e\x97\x74\x00\xcb\x00\x00\xd8\x67\x5c\x03\x90\x3f\x05\
-\xc0\xb3\xce\xc5\x7f\x00\x80\xde\xd9\xd0\xf8\x18\x60\xfe\x14\x00\
-\x05\x9a\xc8\x12\x00\x00\x7a\xe5\xa0\x92\x1b\x01\xe5\x47\x01\x98\
-\x14\xde\x3c\x42\xae\x33\x58\x02\x00\x40\xaf\xe0\x14\x40\x7e\x14\
-\x80\x6c\x7a\xc7\xb9\x92\x52\x2c\x01\x00\xa0\x57\x26\x00\x5c\x04\
-\x98\x1f\x05\x20\x32\x3b\x87\xf8\x01\x00\xbd\xb6\xa1\x31\x01\xc8\
-\x8f\x02\x60\x4e\x01\x00\x00\x30\x01\x18\x28\xc9\x81\xf8\xa2\x93\
-\xc3\xc6\x21\x3b\xd2\xfe\x0f\xc4\x0f\xc4\xda\xb6\x9d\x7f\x36\x99\
-\xb4\xc5\x65\xdb\x4c\xbe\x45\xf2\xad\xae\xa0\x4b\xf2\x8c\x4b\x9b\
-\xbb\x8f\x54\x6c\x93\x9b\xb2\xf2\xa8\x53\xae\x6d\xdd\x47\x11\x81\
-\x9b\xb4\xe1\xdd\x37\x83\x68\xbb\xa4\x1d\xbb\x3c\x00\xb1\xc0\xa3\
-\x5d\xfc\xb3\xe6\xd1\xe8\xb7\xfc\xc7\x41\xa6\x60\xf0\xce\x8d\x25\
-\x90\xfb\x48\x33\x1b\x25\xf7\x91\x91\xd9\x08\x49\x23\x4d\x1a\x21\
-\xf9\x08\xc9\x46\xba\x34\xc6\xa4\xe1\x2c\xeb\x40\x16\x80\x88\x02\
-\x90\xeb\x05\x60\x7b\x26\x38\xc3\xa4\x22\xe2\x07\xf2\xfd\x17\xae\
-\x36\x9b\xf4\x82\xa4\x57\xe5\x7a\x5d\x66\xeb\xdd\xa3\xd7\x4d\xb6\
-\x5e\x81\x5e\xf7\xc8\xd7\x7b\xa0\xd7\x93\xae\xd7\x23\x4b\xac\x57\
-\x32\xda\x5a\xb4\xa3\x73\xfb\xaf\xae\xbe\x6c\x7d\x21\xe6\x71\xd6\
-\x95\x8b\x06\x0f\x1f\xba\xf1\x60\x79\xe2\x10\x59\x74\xa0\xcb\x0e\
-\x93\xfb\x81\x26\x3b\x24\x92\x0e\x31\xd9\x31\x92\x1f\x2b\x69\x30\
-\xef\x9e\x3e\x78\x3f\x66\x03\x4e\x01\xe4\x7a\x01\x30\x4f\x9c\x21\
-\x39\xe9\x03\xb9\xed\x05\x37\x5f\x63\x6e\xcf\xb8\x69\x9d\x5c\x7f\
-\x0d\xdc\xd7\x99\x27\x5e\x88\x12\x5a\x37\x28\xd9\xf5\xc2\xd2\x70\
-\xc6\x36\x62\xfa\x9b\x7b\xbf\x3f\x65\xbb\xa4\xa7\x77\xfe\x79\x57\
-\xe3\xc3\x85\x07\x17\xa5\xfd\x58\xc9\x8f\x71\xd7\xb1\x32\x1d\x23\
-\xd3\xb1\x72\x9d\x2c\x69\x0c\x49\xee\xe5\x86\xc6\x35\x00\xb9\x5f\
-\x00\x24\x9d\x4e\xf4\xc0\x80\x8b\x24\xad\x96\xfc\x2f\xe6\xb6\x3a\
-\x32\xad\x09\xe4\xab\xb3\x51\xb0\x3a\x5b\x6c\x6b\x56\x86\x15\x3b\
-\x88\xa8\x6f\xac\x0c\x2b\xd6\x49\x5a\x27\xe9\x9e\x77\x96\x83\xc6\
-\x31\xc9\x4c\x70\x8a\x94\xf8\x80\x45\x7e\xb2\x4c\x1f\x90\x74\xb2\
-\xa4\x83\x48\x6e\x37\x13\x00\x4e\x01\xe4\x43\x01\x70\x0a\x00\xd0\
-\xaf\xbf\x18\xb5\xd9\xa4\x3f\x99\xfb\x1f\x3c\xd0\x1f\xdc\xfd\x0f\
-\x41\x67\xf1\x9f\x5a\xaf\x9d\xba\x95\x74\x72\xad\x1c\xcc\x78\x55\
-\xd2\xca\x9d\x7f\xde\x5e\x0c\xba\x52\x63\xcd\x7c\xac\xdc\xc6\xca\
-\x7c\xac\xa4\xa3\x48\xec\x2d\xef\xf3\x20\xc1\x04\xa0\x07\xac\xbf\
-\xbf\xe0\xf8\xb0\x71\x4c\x2a\x9d\x7c\x85\xe8\x81\xbe\xdc\xef\xf5\
-\x88\x5c\xbf\x31\xf9\xaa\x4c\x90\xfc\xed\x8a\xba\x4b\xd6\x48\xc6\
-\x79\xb7\x02\xf3\xd6\x52\x60\xf2\x33\x5c\x76\xb6\x62\xfc\x7c\x95\
-\xac\xfc\xe8\x15\xf5\xd5\xcf\xf2\xce\xc8\xd1\x09\x40\x2a\x93\xe4\
-\xea\x7f\xa0\xb7\x7f\xef\xc9\x1e\x36\xf9\x5d\x91\x6c\xa5\x47\x89\
-\x55\x1d\xf3\x2e\x79\xed\xed\x7f\xcb\xa5\xa4\x54\xb8\xd3\x82\xe5\
-\x3b\xff\x48\x92\xca\x66\x2d\x3c\x51\x89\x68\x9c\xbb\x3e\x26\x69\
-\x9c\xa4\xf7\xc7\x25\x8f\x28\xc5\x04\x20\xa7\x0b\x80\xc9\x4e\x76\
-\x2e\x00\x04\xf6\xd5\x0e\xb9\x5a\x5d\xfa\x45\x71\xd4\xb9\xb4\x50\
-\xaf\xaa\x47\xcf\xb5\xce\xab\x78\x5c\xd2\xe3\x92\x9a\xbb\xa7\x04\
-\x0b\x0f\x4e\xa6\xa3\x71\x92\xce\x33\xa9\xb4\x90\x0b\x41\xb1\xb2\
-\x5c\x03\x90\xcb\x05\x20\x72\x9d\x62\xe4\x0e\xec\x8d\xed\x2e\x75\
-\xc8\xb5\x38\x55\x54\x7c\xeb\xb2\xf0\x4b\x9b\x88\x04\xbb\x9f\x12\
-\x54\xac\x93\xf4\x8b\x9d\x7f\x34\x3e\x5c\x78\x70\x2a\x9d\x3d\xc7\
-\x65\x25\xe6\xba\x50\xa6\x43\x0b\xe5\x7b\x2d\x52\x96\x0b\x57\x73\
-\x7b\x02\xa0\x93\x88\x1d\xe8\xd1\x0f\xcd\x6f\x3c\xf2\xf9\x83\x8b\
-\xb2\xb7\xf2\xb1\x3b\xf4\x52\x21\x58\x2c\x69\x71\x18\x86\xc1\xbd\
-\x5d\x47\x7e\xd8\x15\x4d\x74\x0b\x2e\x92\xfc\x0c\x0d\xf4\x53\x62\
-\xf7\xc1\x5f\xff\xaa\x34\x2b\xdc\xa3\xfd\xb8\x3f\xb9\x95\xd6\xb6\
-\x6c\x90\x34\x82\xe8\x81\xf7\xb4\xc3\xdc\x17\x46\x81\xff\xb0\xbd\
-\x6e\xda\x63\xc4\x81\xfe\x50\x16\xde\x74\xa0\xba\xba\x2e\x8c\x64\
-\x93\xcd\x54\x2a\x69\x68\x1e\xbd\xfc\xa8\xad\xbe\x2a\xc1\x2a\xe6\
-\x68\x01\x38\xaf\xf6\xc6\xc3\x12\xca\x3c\x4f\xec\xc0\xbb\xda\x22\
-\xb3\xeb\xa3\x28\xfb\xfd\x8e\x86\x69\x2f\x11\x07\x06\xca\xf8\x70\
-\xe1\xa0\x54\x46\xe7\xb9\x47\x9f\x34\xe9\x33\xca\xfd\x1b\x14\xed\
-\x68\xab\xaf\xe2\x0e\x8b\x3d\xd0\xaf\xa7\x00\x12\x51\xf6\xb8\xfc\
-\x1d\x2e\x01\x7d\x7b\xf4\x22\xe9\x27\x81\x67\x66\x2e\xaf\x9f\xf1\
-\x22\x71\x60\xa0\xed\xbc\x11\xd4\x1d\x92\xee\x28\x2f\x5f\x74\xd9\
-\xfa\xe3\x37\x9f\x65\x52\xb9\xa4\xcf\x4b\x3a\x30\x07\x5f\x32\x9f\
-\x00\xc8\xe5\x02\xe0\x09\x1d\xcb\x27\x91\x81\x77\x78\xc0\x83\xa0\
-\xba\x7d\x6e\xc5\x9f\x88\x02\xb9\x68\xf1\xe2\x29\x59\x49\xab\x24\
-\xad\x1a\x3b\xbd\xf1\xeb\xa3\x0e\x4c\x4c\x08\xdc\xa6\x48\xfa\xb4\
-\xa4\x51\x14\x00\x0a\xc0\x6e\x05\x8a\xde\xe7\xe2\x33\x00\xc0\xdf\
-\x7e\x61\xd9\xbf\x8c\x7a\x72\xd8\xbf\xed\xfc\x05\x0b\xe4\xbc\x07\
-\xe7\xcf\x48\x4b\xba\x53\xd2\x9d\xe3\xc3\x85\x97\x15\xa5\xfd\x93\
-\xae\x68\xaa\x64\x13\x25\x0d\xdc\x39\x78\x17\x1f\x01\xcc\xe5\x02\
-\x10\xb9\x8e\x63\xfb\x07\x24\xb9\x9e\x77\x8b\xca\xdb\xeb\xa7\xdd\
-\x47\x18\xc8\x57\x3b\x4f\x13\xfc\x5c\xd2\xcf\x27\xd6\x34\x1e\x12\
-\x05\x89\x29\x72\xbb\x44\xd2\x69\xfd\xfd\x5a\xcc\x9c\x09\x40\x2e\
-\x17\x00\x53\x70\x14\x4f\x01\x44\xec\x99\xee\x4e\xa7\x32\x9f\xda\
-\x79\x17\x37\xa0\x20\x2c\x6f\x98\xf1\xa2\xa4\x1f\x48\xfa\x41\x69\
-\x6d\xf3\xe9\x72\xab\x96\xf9\x17\x25\x0d\xeb\x9f\x4e\x6d\x4c\x00\
-\x7a\xa8\x7f\x2f\xc9\x73\x3f\x9c\xc8\x11\xef\x03\x7f\xfd\x3a\x9d\
-\xdc\x71\x3e\x9b\x3f\x0a\x59\x5b\x7d\xd5\xef\xda\x1a\x2a\xbf\x3c\
-\x38\xad\x43\x4d\x36\x43\xd2\x1f\xfa\xe1\xa7\x8b\x09\x40\x8f\x8f\
-\x45\xfa\x49\x18\x86\xc1\xdd\xe9\x23\x76\x48\x4a\x11\x3b\x62\x6a\
-\x45\x72\xd3\xd6\x4f\x2c\xfb\xe1\x15\xfc\xa2\x42\xec\x4c\x9c\xb5\
-\xf0\x1c\x4f\xf8\x97\xdd\xfd\xb3\x92\x8a\xfb\xe0\x4b\x3c\xd0\x56\
-\x5f\x75\x26\x49\xe7\xe0\x04\xe0\xde\xae\x43\x0e\x62\xf3\x47\x8c\
-\x3d\x56\x94\xed\xfc\x1c\x9b\x3f\xe2\x6a\xf9\xbc\x8a\xbb\x5a\xeb\
-\x2a\xbf\x68\xa9\xd4\x91\x66\xfa\xb6\xa4\x5e\x9d\x82\x39\xd7\x00\
-\xe4\x6e\x01\xf0\x44\x70\x28\x71\x23\xa6\xb6\x27\x4c\x9f\xe6\x81\
-\x3d\x80\xd4\x1a\x4e\x7d\xb9\xb5\xae\x2a\x1c\x94\xca\x1c\x25\xe9\
-\xff\x49\x7a\xb2\x37\xfe\x7f\xcd\xb9\x06\x20\x67\x0b\x40\x94\xb5\
-\x83\x89\x1b\x71\x64\x66\xb5\x77\xd6\x55\x3d\x41\x12\xc0\xdf\x2c\
-\x0d\x67\x6c\x6b\xab\xaf\xfa\xaf\x71\xa9\xb5\x1f\x90\xe9\x93\xea\
-\xbe\xcf\xc0\xbe\x1c\x66\x32\x01\xe8\xa1\x7e\xfb\x14\x40\x60\x1a\
-\xc3\xf5\xff\x88\xdd\xe6\x2f\xfd\xf1\xec\xe4\x73\x3f\x68\x25\x0a\
-\x60\x97\xc2\x30\x8c\x24\x2d\x91\xb4\xa4\x74\x56\xcb\xb9\x0a\xfc\
-\x5f\x24\x9d\xd7\xe3\xed\x9f\x09\x40\xee\x4e\x00\xdc\x6d\x0c\x71\
-\x23\x7e\x0d\xc0\xbf\xb5\xf3\x17\x1c\x80\xdd\x68\x9b\x57\xf9\x9b\
-\xb6\xfa\xaa\x09\x26\x1b\xe7\xd2\xed\xea\xc1\xe7\xc6\x2d\x10\x8f\
-\x02\xce\xd5\x02\x20\xd3\x7e\xc4\x8d\x98\x79\xac\xb5\xae\xea\x36\
-\x62\x00\x7a\xa6\xb5\xbe\xf2\x9e\xf6\xfa\xaa\xc9\x81\xfc\xa3\xd6\
-\x7d\xd7\xc1\x3d\xd8\x62\xb8\x13\x60\xee\x4e\x00\x72\xff\x49\x52\
-\x40\xef\xbe\xe7\xdd\x7e\x22\xf1\xf4\x0b\x60\x6f\x2d\xaf\xaf\x7e\
-\xa0\xb5\xbe\x6a\x92\xc9\xc6\xb9\xf9\x5d\xbb\xd9\x64\xb8\x06\x20\
-\x57\x0b\x80\x59\xce\x3c\x30\x02\xe8\x17\x51\x10\xfc\x8c\x14\x80\
-\x5e\x9a\x08\xd4\x55\x9d\xeb\x16\x7d\x56\xd2\xe3\xbb\x2e\xdc\x4c\
-\x00\x72\xb6\x00\xc8\x35\x9c\xb8\x11\x23\x2f\xac\xa8\xbb\x74\x35\
-\x31\x00\xbd\x76\x18\xe9\xed\x75\xd3\x7e\x99\x4e\xad\x3d\xd5\x4d\
-\xd3\x25\xbd\xfc\xf6\x2d\xc6\x29\x00\xb9\x5a\x00\xdc\x7c\x18\x71\
-\x23\x36\xbf\xaa\x24\x1e\xf2\x03\xf4\x81\x95\x61\x98\x69\xaf\xab\
-\x5a\x90\x4e\xed\x78\xdf\xce\x1b\x0a\x75\x49\x52\x60\xc6\x29\x80\
-\xdc\x9d\x00\xd8\x50\xe2\x46\x8c\x0e\x56\x1e\x27\x04\xa0\x2f\x8b\
-\xc0\x57\xb6\xb4\xd6\x55\x85\x6e\xd1\x87\x25\xb5\x32\x01\xe8\xb9\
-\xfe\x7c\x1a\x20\x05\x00\xf1\xe1\xc1\xcb\x84\x00\xf4\xbd\xf6\xba\
-\x69\x8f\x49\x9a\x38\x3e\x6c\xe4\x42\xf3\x5c\x9d\x00\x98\x53\x00\
-\x10\xab\x06\xf0\x1a\x19\x00\xfd\x39\x11\xe0\x09\x9b\x39\x5b\x00\
-\x64\x2a\x22\x6e\xc4\x07\xa7\xbc\x00\x50\x00\x06\xe2\x6b\x01\x03\
-\x7b\xfc\x2f\xf1\xec\x0b\x00\x14\x80\x9d\x47\x44\x09\xe2\x46\x8c\
-\x2a\xc0\x44\x32\x00\x40\x01\xe8\xfe\x85\xc8\x04\x00\x71\x72\x56\
-\xd9\xec\x05\xc7\x10\x03\x00\x0a\x80\xc4\x04\x00\x71\x62\xae\xa0\
-\x81\x18\x00\x50\x00\xb8\x06\x00\x71\xe3\xfa\x7c\xe9\xec\xe6\x32\
-\x82\x00\xc0\x04\x00\x88\x5f\x09\xf8\xe9\x84\x59\xf3\x8f\x27\x08\
-\x00\x4c\x00\x80\x78\xd9\x2f\x08\x12\x4b\xcf\xab\xbd\xf1\x30\xa2\
-\x00\x40\x01\x00\xe2\xe5\xf8\x84\x32\x77\x9f\x3f\xbb\xf9\x04\xa2\
-\x00\x10\xc7\x02\x90\x26\x6e\xc4\xd8\x51\x59\xd7\xaa\x09\xb3\x9b\
-\xce\x27\x0a\x00\x71\x2b\x00\x3b\x88\x1b\x31\x37\x26\x70\xbb\xa3\
-\xb4\xb6\xf9\x07\x63\xa7\x37\xa6\x88\x03\x40\x2c\x0a\x80\x51\x00\
-\x80\x9d\x3f\x0a\xba\x62\xbf\x03\x92\xbf\x9d\x58\xdb\x74\x06\x71\
-\x00\x28\xf8\x02\xe0\xd2\x76\xe2\x06\xde\xf4\xa1\x48\x76\x4f\x49\
-\x4d\xd3\xf7\x2e\xfa\x66\xf3\x70\xe2\x00\x50\xb0\x05\x40\x52\x27\
-\x71\x03\x6f\x93\x30\xb3\x2b\xb7\xa7\xf4\x74\x69\x4d\xd3\xcc\x49\
-\x97\x5f\x57\x4c\x24\x00\x0a\xb1\x00\x30\x01\x00\x76\x6d\x7f\x99\
-\x5d\x9d\x19\x31\xf4\x8f\x65\x35\x4d\x9f\x2f\x2f\x5f\xc4\x3d\x33\
-\x00\x14\x4e\x01\x30\xe3\x1a\x00\x60\x37\x8e\x77\xb3\x9f\x6e\x38\
-\x7e\xf3\x5f\x4a\x67\x37\x7d\x8d\x89\x00\x80\x82\x28\x00\x91\x53\
-\x00\x80\x3d\x74\x8c\xdc\xfe\x3d\x33\x62\xe8\x13\xa5\xb5\xcd\xff\
-\x5f\xc9\xcc\xc6\x91\x44\x02\x20\x6f\x0b\x80\xa4\xad\xc4\x0d\xf4\
-\xc8\x51\x92\xfe\x4d\xc9\xe4\xda\xb2\x9a\xe6\xeb\x4a\x67\x2f\x7c\
-\x3f\x91\x00\xe8\x2d\xd6\x5f\x5f\xa8\x6c\x76\xf3\x8d\xee\x9a\x4a\
-\xe4\xc0\x3e\xfd\xc8\x3e\x68\xd2\xfc\xae\xd4\xf6\xff\x5e\x19\x7e\
-\x65\x0b\x79\x00\xc8\xf9\x09\x80\xbb\x5e\x25\x6e\x60\x9f\x7f\x92\
-\xc6\xba\xbc\x31\x95\x1e\xf4\x42\x69\x6d\xf3\x4d\x25\xb3\x5b\x4a\
-\x24\x37\x72\x01\x90\xb3\x13\x80\xd2\xda\xe6\x1a\x49\xf5\x44\x0e\
-\xf4\xba\xc7\xe5\x7e\x43\x24\xbf\xa1\xa3\x61\xda\x4b\xc4\x01\x20\
-\xb7\x0a\xc0\xec\xa6\x19\x72\xfb\x2f\x22\x07\xfa\x4c\x5a\xb2\x3b\
-\xe5\x5a\x94\x2c\x2a\x5a\xb2\x2c\xfc\xd2\x26\x22\x01\x30\xe0\x05\
-\xa0\x6c\x76\xcb\xe7\xdc\x7d\x31\x91\x03\xfd\xa2\xd3\xa5\x36\xb9\
-\x16\x2b\x9b\xb9\xad\xfd\x9a\x19\x1b\x89\x04\xc0\x80\x14\x80\x89\
-\x35\xcd\x1f\x8f\x4c\x2b\x88\x1c\x18\xb8\x32\x90\x2a\x2a\xbe\x95\
-\xc9\x00\x80\x7e\x2d\x00\x25\x73\x16\x9e\x6a\x51\xf4\x47\x22\x07\
-\x06\xd4\x0e\x93\x2f\x8f\xdc\x7e\x99\x29\xca\xdc\xb1\x32\x9c\xc1\
-\xc5\xb9\x00\x05\xa0\xaf\x27\x00\x8d\x87\x44\x96\xfc\x2b\x91\x03\
-\x39\x23\x2b\xe9\x5e\xc9\x96\x5a\x64\x4b\x5a\xe7\x55\x3c\x4e\x24\
-\x00\x05\xa0\xd7\x85\x61\x18\xdc\x9d\x3e\x62\xbb\xa4\x22\x62\x07\
-\x72\xd2\xd3\x2e\xb5\x05\xf2\xdb\x47\xa6\x46\x2c\x5f\x1c\x4e\xe9\
-\x22\x12\x80\x02\xd0\x2b\xca\x6a\x9b\x9e\x72\xd9\xfb\x88\x1d\xc8\
-\xf9\x5f\x0d\xeb\x25\xbf\xd3\xdc\x97\x58\x91\x5a\x97\x87\xd5\xaf\
-\x93\x09\x40\x01\xd8\x6b\xa5\xb5\xcd\x1d\x92\xce\x23\x76\x20\xaf\
-\x64\x25\x7b\x58\xa6\x76\x97\xda\xd7\xbf\x9c\xfe\xcd\x83\xf3\x67\
-\xa4\x89\x05\xa0\x00\xf4\xa4\x00\xb4\x48\xaa\x20\x76\x20\xaf\xbd\
-\x26\xd9\x0a\x93\xda\x25\x2d\x6b\xad\xaf\x5c\x4b\x24\x40\xfe\x49\
-\xf6\xe7\x17\x73\xd7\xb3\xc6\x4d\x4b\x81\x7c\xb7\xbf\xe4\xe5\x2e\
-\x95\xef\x2c\xf6\x6b\x24\xdd\xee\x66\x4b\x53\x1b\xb7\xdc\xb5\xec\
-\x87\x57\x74\x12\x11\xc0\x04\xe0\x6d\xca\x6a\x9b\x2e\x71\xd9\x0d\
-\xc4\x0e\x14\xac\x2d\x92\x7e\xe3\x52\x7b\xe0\xde\xde\xda\x50\xfd\
-\x67\x22\x01\x28\x00\x2a\x99\xbd\x60\xbc\x79\xf0\x6b\x62\x07\x62\
-\xe3\x65\xc9\x7e\x63\x52\x7b\x94\x49\xdf\xd9\x7e\xcd\x8c\xe7\x88\
-\x04\x88\x63\x01\x98\xd9\x78\xa4\x25\x93\xcf\x12\x3b\x10\x5b\x8f\
-\x4a\x6a\x37\x79\xfb\xa0\xb4\xad\x5c\xf2\xdd\xaa\xcd\x44\x02\xc4\
-\xa0\x00\x48\x6e\x25\xb5\x2d\x1b\x4d\x1a\x4e\xf4\x40\xec\x65\x64\
-\xba\xdf\xa4\x76\xb9\xaf\x18\x99\x1a\x71\x1f\xf7\x1e\x00\x0a\xb6\
-\x00\x48\xa5\x35\xcd\xf7\xc9\x74\x26\xd1\x03\xf8\x3b\xdb\x4c\xba\
-\x47\xa6\xbb\x23\xd9\x2a\x3e\x6e\x08\x14\x5a\x01\xa8\x6d\x6e\x92\
-\x54\x45\xf4\x00\x76\x63\x8b\x49\xf7\xb9\x7b\xbb\x25\xbc\xbd\x75\
-\x6e\xf5\xef\x25\x73\x62\x01\xf2\xb4\x00\x94\xcd\x6e\xb9\xd2\xdd\
-\xbf\x47\xf4\x00\x7a\xe8\x15\xc9\x56\x9a\xd4\x6e\x41\xe6\xee\xe5\
-\x73\xa7\x3f\x42\x24\x40\x3e\x15\x80\x9a\x05\xa5\x6e\x41\x2b\xd1\
-\x03\xd8\x47\x2f\x4a\xb6\x8a\x4f\x18\x00\x79\x52\x00\x78\x2a\x20\
-\x80\x3e\xb2\xc6\x77\x7e\xc2\x20\x8a\x52\x2b\x3a\xe6\x5d\xf2\x1a\
-\x91\x00\x39\x54\x00\x24\xa9\xb4\xb6\xf9\x15\x49\x63\x88\x1f\x40\
-\x7f\x14\x02\xcf\x64\x5b\xdb\xaf\x99\xb1\x91\x48\x80\x81\x2f\x00\
-\xcb\x25\x95\x11\x3f\x80\x7e\x92\x96\xe9\x01\xb9\x77\x98\xd4\xc1\
-\x47\x0e\x81\x01\x2a\x00\x65\xb3\x9b\x43\x77\x7d\x8b\xf8\x01\x0c\
-\x90\x6d\x26\xdd\xf3\xc6\x27\x0c\xce\x4e\xbc\xf0\x50\x18\x86\x11\
-\xb1\x80\x02\xd0\xd7\x13\x80\xd9\xcd\x65\x72\x2d\x27\x7e\x00\x39\
-\xe2\x55\xc9\x7e\x6d\x52\x7b\x94\x55\x7b\xfb\xd5\x95\x6b\x88\x04\
-\x14\x80\x3e\x30\x29\xbc\x79\x44\x26\xdd\xf9\xba\xa4\x04\x4b\x00\
-\x20\x07\xad\x91\x74\xb7\xc9\x56\x79\xca\x6f\x6f\x0b\xab\xb8\x70\
-\x19\x14\x80\x5e\x9b\x02\xd4\x36\xff\x51\xd2\xa9\x2c\x01\x80\x7c\
-\x28\x04\x6f\x5c\x50\x98\x4c\x0d\x5a\xbe\x2c\xfc\xd2\x26\x22\x01\
-\x05\x60\x2f\x95\xd4\x36\x37\x9a\x34\x9d\x25\x00\x90\x67\x32\x92\
-\xfd\x41\xa6\x76\x97\xda\x47\x27\x87\xfd\x2f\x17\x14\x82\x02\xd0\
-\x93\x09\x40\x4d\xf3\xa5\x32\x2d\x64\x09\x00\xe4\xb9\xad\x26\xdd\
-\xcb\x2d\x8b\x41\x01\xd8\x43\x65\xb3\x17\x1c\xe3\x1e\x70\xa1\x0d\
-\x80\x42\xf3\xa2\xcc\x3b\x14\x59\x47\xd6\x92\x6d\x2b\xea\x2f\x79\
-\x81\x48\x40\x01\xf8\xfb\x29\x40\x6d\xf3\x13\x92\x8e\x67\x19\x00\
-\x14\xb0\x35\x2e\xb5\x07\xf2\xdb\xbb\x52\x89\xb6\x95\x61\xc5\x0e\
-\x22\x41\xec\x0b\x40\x59\x4d\xf3\x75\x6e\xba\x9c\x65\x00\x10\x13\
-\xdb\x4d\xba\xfb\x6f\xa7\x0b\xa6\x3d\x48\x24\x88\x65\x01\x28\xa9\
-\x69\xba\xc0\xcc\x6e\x67\x19\x00\xc4\xf4\x17\xf0\x3a\x97\xda\x24\
-\x5f\x9a\xee\x9e\x0e\x6c\x20\x15\xc4\xa2\x00\x4c\x0e\x1b\x87\xec\
-\x48\x27\x5f\x93\x34\x88\xa5\x00\x10\x73\x19\x37\xbf\x57\x51\xb0\
-\x3c\x48\x64\xef\xe4\x62\x42\x14\x74\x01\x90\xa4\xd2\xda\x96\x56\
-\xc9\x4b\x59\x0a\x00\x78\x9b\x57\x24\xdd\x29\xf9\x52\xee\x3d\x80\
-\xc2\x2c\x00\x35\xcd\xff\x2c\xd3\xb5\x2c\x05\x00\xbc\xfb\x74\x40\
-\xa6\xfb\x15\xf9\x52\xf3\xc4\x6d\xad\xf3\x2a\x1e\x27\x12\xe4\x7d\
-\x01\x28\xb9\xaa\xe5\x58\x4b\xf8\x53\xb9\xf0\x5a\x00\x20\x4f\xac\
-\x91\x74\xbb\x9b\x2d\xe5\x46\x44\xc8\xdb\x02\x20\x49\xa5\xb5\xcd\
-\xbf\x95\x74\x3a\xcb\x01\x00\x3d\xfe\x35\xbe\x5e\xe6\xcb\xcd\x75\
-\x7b\x36\x4a\xde\xd9\x31\xef\x92\xd7\xc8\x04\x79\x53\x00\x4a\x6a\
-\x9b\xbe\x6e\xb2\x7f\x65\x39\x00\x60\x9f\x64\x65\xba\x4f\xf2\xc5\
-\xc9\xa4\xff\x62\x59\x38\xed\x79\x22\x41\x4e\x17\x80\xb2\xda\x96\
-\x23\x5c\xfe\xac\x38\x0d\x00\x00\xbd\xe9\x51\x33\x2d\x8e\x14\xfd\
-\xbc\xbd\x6e\xda\x63\xc4\x81\x9c\x2b\x00\x92\x54\x5a\xdb\x7c\xb7\
-\xa4\xb3\x59\x12\x00\xe8\x13\x7f\x96\xe9\x16\x57\xf4\x53\xca\x00\
-\x72\xaa\x00\x94\xd5\xb6\x5c\xe1\xf2\x1f\xb0\x24\x00\xd0\xf7\x93\
-\x01\xb9\xdf\x14\xc9\x6f\xe8\x68\x98\xf6\x12\x71\x50\x00\x06\xd4\
-\xc4\x9a\xc6\x43\x22\x4b\x3e\x27\x29\xc9\xb2\x00\x40\xbf\xc8\x48\
-\x5a\x6e\xee\x37\x6f\xde\x3e\xe2\xb6\x7b\xbf\x3f\x65\x3b\x91\x50\
-\x00\x06\x68\x0a\xd0\x74\xab\xcb\x3e\xc9\xb2\x00\x40\xbf\xdb\xe8\
-\xb2\x5f\x04\x81\xe6\xb7\xce\xad\xbc\x9f\x38\x28\x00\xfd\x5b\x00\
-\x6a\x9a\x27\xb9\xe9\x0e\x96\x05\x00\x06\xd4\x63\x32\x6f\x4c\x27\
-\x3b\x9b\x57\x86\x5f\xd9\x42\x1c\x14\x80\x3e\x17\x86\x61\x70\x77\
-\xfa\x88\xa7\x24\x1d\xc3\xd2\x00\xc0\x80\xdb\xe4\xd2\xcf\xdc\xa3\
-\xeb\x3b\x1a\xa6\xfd\x91\x38\x28\x00\x7d\x3c\x05\x68\x9a\xe5\x66\
-\x0d\x2c\x0d\x00\xe4\x94\xff\x75\xd7\xf5\xa3\xff\x32\xfc\x17\x8b\
-\x17\x4f\xc9\x12\x07\x05\xa0\xd7\x4d\xa8\x59\x70\x50\x60\xc1\x5a\
-\x49\x29\x96\x07\x00\x72\xce\xd3\x32\xff\xc1\xa0\x64\x76\xc1\xd2\
-\x70\xc6\x36\xe2\xa0\x00\xf4\xaa\xd2\xda\x96\x45\x92\x97\xb3\x3c\
-\x00\x90\xb3\x5e\x71\xd7\xf5\x99\xa2\xcc\xf5\x2b\xc3\x19\xaf\x12\
-\x07\x05\xa0\x57\x4c\xac\x6d\x3a\x23\x92\x71\x15\x2a\x00\xe4\xbe\
-\x6d\x92\xb5\x98\x65\xbf\xd7\x5a\x37\xed\x69\xe2\xa0\x00\xf4\xc2\
-\x14\xa0\xb9\x43\xd2\x79\x2c\x11\x00\xe4\x85\xb4\xa4\x9f\x79\xd6\
-\xc2\xf6\xab\x2b\xd7\x10\x47\xee\x0b\x72\xf5\x85\xb9\xd9\x3c\x96\
-\x07\x00\xf2\x46\x4a\xd2\xc5\x96\xf0\xc7\x4a\x6a\x9b\x1b\x4b\xc3\
-\xe6\x43\x89\x84\x09\xc0\x3e\x4c\x01\x5a\xee\x95\xfc\xa3\x2c\x13\
-\x00\xe4\x9d\x4e\x97\x6e\xcc\xa4\x82\x6f\xad\x0c\x2b\xd6\x11\x07\
-\x13\x80\x9e\xce\x01\xbe\xcb\x12\x01\x40\x5e\x2a\x36\x69\x7a\x32\
-\x1d\x3d\x59\x36\xbb\x39\x2c\xfb\xfa\x4d\x43\x89\x84\x02\xb0\xc7\
-\xc6\xa5\xd6\xde\x26\xe9\x51\x96\x09\x00\xf2\x93\x49\xc3\xdd\xf5\
-\x2d\x2f\x4a\x3f\x5e\x56\xdb\xfc\x45\xc9\x79\xec\x7b\xee\xac\x4d\
-\x6e\x2b\x9b\xdd\xf4\x29\x77\xbb\x85\xa5\x02\x80\x82\xf0\x3b\x45\
-\xfe\x4f\x6d\xf3\xaa\xef\x26\x0a\x0a\xc0\x6e\x95\xd6\x36\xdf\x25\
-\xe9\x63\x2c\x17\x00\x14\x04\x97\xec\x7f\xb2\x8a\xbe\xb1\xa2\xbe\
-\xfa\x59\xe2\x18\x18\x41\x7e\xbc\x53\xa2\x6f\x74\xbf\x61\x00\x00\
-\x85\x71\xf0\xe9\xe5\x09\xd9\x23\x65\xb3\x5b\xae\x2c\x2f\x5f\x94\
-\x20\x12\x26\x00\xef\x3e\x05\xa8\x69\x5e\x2c\xd3\xe7\x58\x32\x00\
-\x28\xb8\x81\xc0\xc3\x92\x4d\x6b\xab\xaf\xfa\x1d\x59\x50\x00\xde\
-\xa1\xe4\xaa\x96\x63\x2d\xe1\x8f\x49\x2a\x62\xd9\x00\xa0\xe0\x64\
-\x24\xfd\x28\x9d\xda\x51\xcb\x23\x88\xfb\x47\x90\x2f\x2f\xb4\xfd\
-\xea\xca\x35\x26\xfd\x88\x25\x03\x80\x82\x94\x94\x74\x45\x51\xba\
-\xf8\xe1\xd2\x9a\xa6\x09\xc4\xc1\x04\xe0\x6d\x2e\xfa\x66\xf3\xf0\
-\xed\x49\x3d\x2a\xd3\xe1\x2c\x1d\x00\x14\xb4\x1f\x5b\x67\xea\xff\
-\xb5\x5e\x3b\x75\x2b\x51\xc4\x7c\x02\x20\x49\x4b\xbe\x5b\xb5\x59\
-\xa6\x2b\x58\x36\x00\x28\x78\x17\x7b\x71\xfa\x77\x65\x73\x16\x8c\
-\x25\x0a\x26\x00\x6f\x2a\xab\x6d\xba\xd5\x65\x9f\x64\xf9\x00\xa0\
-\xe0\x65\xcc\x54\x3f\xf2\x89\xe1\x73\x17\x2f\x9e\x92\x25\x8e\x98\
-\x4e\x00\xde\xe0\x29\xbb\x4c\xd2\x46\x96\x0f\x00\x0a\x5e\xd2\x5d\
-\xdf\xda\x78\xc2\xe6\xbb\x4a\xae\x6a\x39\x96\x38\x62\x5e\x00\xda\
-\xc2\xaa\xbf\x9a\xec\x5f\x58\x3e\x00\x88\x07\x77\x9d\x65\x09\xfd\
-\xae\x6c\x76\xcb\x85\xa4\xd1\x3b\xf2\xf8\x9e\xcc\x6e\xa5\xb5\x2d\
-\xbf\x92\x34\x89\x65\x04\x80\xf8\x74\x01\x99\x7d\x77\xd4\x13\xc3\
-\x6a\x39\x25\x10\xc3\x09\xc0\xce\xee\xe2\x4a\xa9\x5a\xd2\x6b\x2c\
-\x23\x00\xc4\xe8\xc0\xd5\x7d\xe6\xfa\xe3\x37\xb7\x95\x85\x37\x1d\
-\x48\x1c\xb1\x2c\x00\xdd\xa7\x02\x24\x4d\x63\x19\x01\x20\x6e\x2d\
-\x40\x1f\xf7\x74\xfa\x77\x65\x73\x5a\xce\x24\x8d\x18\x16\x00\x49\
-\x6a\xab\xaf\xba\xc5\x65\x2d\x2c\x25\x00\xc4\xce\x11\x1e\xf9\xca\
-\xd2\xda\xa6\x8b\x89\x22\x86\x05\x40\x92\x32\xa9\xed\x5f\x93\xf4\
-\x17\x96\x13\x00\x62\x67\x90\x64\x37\x96\xd4\x34\x7f\x4b\x72\x23\
-\x8e\x3d\x57\x30\x61\x95\xcd\x5a\x78\xa2\x07\xd1\xfd\x92\x46\xb0\
-\xac\x00\x10\xcb\x1d\x6d\x51\x3a\x19\x5c\xb2\x32\xac\xd8\x41\x18\
-\x31\x99\x00\x48\x52\xeb\xbc\x8a\xc7\xcd\xfc\x12\xf1\xd8\x60\x00\
-\x88\x27\xd7\x94\x54\x3a\xea\x18\x1f\x36\x8e\x21\x8c\x18\x15\x00\
-\x49\x6a\xad\xab\xbe\xd5\xa4\x6b\x58\x56\x00\x88\xad\xb3\x53\xe9\
-\xe4\x5d\x65\xb3\x17\x1c\x43\x14\x31\x2a\x00\xdd\x2b\xbf\xb6\x56\
-\xf2\x3b\x58\x5a\x00\x88\xad\x13\xe5\xc1\x3d\x65\x35\x4d\xa7\x10\
-\xc5\xbb\x2b\xc8\x0b\x26\x2e\xb8\xea\x47\xa3\xbb\x12\xc5\xf7\x49\
-\x3a\x9e\x25\x06\x80\xd8\x7a\x59\x1e\x4c\x6c\x6b\xa8\x78\x98\x28\
-\x62\x30\x01\x90\xa4\x5f\x5d\x7d\xd9\x7a\xb3\xe8\x7c\x49\x2f\xb2\
-\xc4\x00\x10\x5b\x07\xca\xa2\x5f\x4f\x98\xd5\x7c\x16\x51\xc4\xa4\
-\x00\x48\x52\x6b\xdd\xb4\xa7\x3d\x08\x26\x4a\xda\xc0\x32\x03\x40\
-\x6c\x8d\x0a\x02\xb5\x95\xcc\x6e\x29\x21\x8a\x98\x14\x00\x49\x6a\
-\x9f\x5b\xf1\x27\x37\x2b\x97\xd4\xc5\x52\x03\x40\x6c\x0d\x35\xf7\
-\x25\xa5\x35\x4d\x13\x88\x22\x26\x05\x40\x92\xda\xeb\x2a\xdb\xcd\
-\xfd\x12\x49\x11\xcb\x0d\x00\xb1\x35\x58\x66\x4b\x26\xce\x5a\x78\
-\x0e\x51\xc4\xa4\x00\x48\x52\x6b\x43\xf5\xcf\xe4\x36\x83\x12\x00\
-\x00\xb1\x36\x24\x0a\xa2\xa5\x65\x73\x16\x8c\x25\x8a\x02\xfd\x14\
-\xc0\xbb\x29\xad\x69\xa9\x96\x79\x63\x5c\x8a\x0f\x00\x60\x97\x5e\
-\x8d\x22\x3b\xb7\x63\x5e\xe5\xa3\x14\x00\x4a\x00\x00\x20\x5e\x5e\
-\x4a\x98\xce\xbd\xb3\xae\xea\x89\xb8\x06\x10\xbb\x4d\xb0\xad\xa1\
-\xb2\xc9\xcd\xbe\x2a\x6e\x19\x0c\x00\x71\x76\x50\xe4\xfe\xab\x38\
-\xdf\x36\x38\x96\x47\xc1\xed\x75\x95\xff\xe9\xa6\x19\x92\xb2\xfc\
-\x0c\x00\x40\x3c\xb9\xec\x7d\xa9\x4c\xf2\xd6\xf1\xe1\xc2\x41\x14\
-\x80\x58\x95\x80\xaa\x05\x2e\xfb\xac\xa4\xed\xfc\x18\x00\x40\x6c\
-\x5b\xc0\xb8\x54\xda\x6f\x8a\xe3\xa3\x84\x63\x7d\x1e\xbc\xbd\xbe\
-\xf2\x36\x57\x74\x9e\xa4\x57\xf9\x29\x00\x80\xd8\xb6\x80\xf2\x92\
-\xda\x85\xdf\x89\xdb\x77\x6d\x2c\xbc\x54\x56\xd3\x74\x8a\xcb\x96\
-\xc9\x74\x38\x69\x00\x40\x6c\xa7\x01\x15\x6d\x0d\x55\x37\x50\x00\
-\xe2\x56\x02\x6a\x5b\x8e\x70\x45\x4b\x24\xfb\x30\x69\x00\x40\x2c\
-\x75\x5a\x60\xe7\xb6\xce\xad\xbc\x3f\x0e\xdf\x2c\x1f\x85\xdb\xa9\
-\xb5\xbe\x72\x6d\x3a\x95\x38\x4b\xe6\x37\x93\x06\x00\xc4\x52\xb1\
-\x47\xbe\x78\xd2\xac\x96\x03\x98\x00\xc4\x92\x5b\x69\x4d\xf3\x37\
-\x65\xd6\x40\x41\x02\x80\x58\x5a\x31\xea\xc9\xe1\x65\x8b\x17\x4f\
-\x29\xe8\x4f\x8a\xb1\xc1\xbd\xb3\x13\x79\x5b\x43\xf5\x35\xb2\x60\
-\xb2\xa4\x8d\xe4\x01\x00\xb1\x73\xde\xc6\x13\x36\x7d\x9b\x09\x40\
-\x8c\x95\xcc\x5e\xf0\x01\xf3\xe0\xe7\x92\x4e\x25\x0d\x00\x88\x15\
-\x37\xf9\x27\x5b\xeb\xab\x97\x52\x00\x62\x6a\x7c\xb8\x70\x50\x2a\
-\x1d\x5d\x23\xe9\x0a\xd2\x00\x80\x58\xd9\x60\xb2\x0f\xb6\xd6\x57\
-\xae\x2d\xc4\x6f\x8e\x53\x00\xbb\xb1\x32\xac\xd8\xd1\x56\x5f\xf5\
-\x35\x49\x9f\x91\x6c\x3d\x89\x00\x40\x6c\x8c\x72\xa9\xb9\x50\x6f\
-\x12\x44\x01\xd8\x43\x6d\xf5\x55\xb7\x98\x65\xc7\xca\x75\x3f\x69\
-\x00\x40\x5c\x78\x69\x59\xed\xc2\xcb\x29\x00\x31\xd7\x5a\x37\xed\
-\xe9\x74\xd1\xda\x8f\xc9\xfd\x2a\x49\x9d\x24\x02\x00\x31\xa8\x00\
-\xf2\xef\x96\xcc\x59\x58\x70\xd7\x82\x71\x0d\xc0\x5e\x9a\x38\x67\
-\xfe\xc9\x51\x36\xb1\x50\xa6\x8f\x90\x06\x00\x14\xbc\x87\x46\xa5\
-\x86\x7f\x74\x71\x38\xa5\x8b\x09\x40\xcc\x2d\x9f\x3b\xfd\x91\x74\
-\xd1\xda\xb3\x4d\x3e\x47\x52\x17\x89\x00\x40\x41\x3b\x6d\x63\x66\
-\x73\x0d\x13\x00\xbc\x4d\xc9\x9c\x85\xa7\x9a\x47\xff\x29\xd7\x38\
-\xd2\x00\x80\x82\xd5\xe9\x16\x9d\xd6\x5e\x37\xed\x31\x26\x00\x90\
-\x24\xb5\xcf\xad\xf8\x53\x5b\x5d\xe5\x39\xee\xba\x44\xd2\xcb\x24\
-\x02\x00\x05\xa9\x58\xb2\xc6\x42\xf9\x54\x00\x05\xa0\xd7\x98\xb7\
-\x37\x54\xdd\x54\x94\xed\x3c\x51\xd2\x75\x92\xb2\x64\x02\x00\x85\
-\xf6\x9b\xde\xce\x29\x99\xdd\x52\x5d\x10\xdf\x0b\xcb\xd9\x37\xca\
-\xe6\xb4\x81\x33\x5a\x7a\x00\x00\x1f\x12\x49\x44\x41\x54\x9c\xe9\
-\x91\xfe\x5d\xf2\x8f\x92\x06\x00\x14\x54\x0d\x58\x9f\x4e\xd9\x49\
-\x2b\xc3\x8a\x75\x4c\x00\xf0\x0e\xad\x73\x2b\xef\x6f\xab\xaf\x38\
-\xdb\x64\x9f\x97\xf4\x34\x89\x00\x40\xa1\xf0\xd1\x45\x19\xff\x37\
-\x26\x00\xd8\xad\xb1\xd3\x1b\x53\xfb\x1f\x90\xaa\x70\x79\xbd\xa4\
-\x31\x24\x02\x00\xf9\xdf\x02\x5c\xfa\xc7\xf6\xfa\xaa\x55\x4c\x00\
-\xf0\xae\x1e\x9c\x3f\x23\xdd\x5a\x5f\x39\x3f\x8a\x92\x27\xba\xfb\
-\xf7\x25\x6d\x27\x15\x00\xc8\xef\x03\x68\x93\xfd\x6b\x3e\x5f\x10\
-\xc8\x04\x60\x00\x4c\x9a\xd5\x72\x40\x26\xa1\x7f\x96\xfb\x15\x92\
-\x06\x93\x08\x00\xe4\xed\x36\xfa\x85\xb6\xfa\xca\x9f\x52\x00\xd0\
-\xb3\x22\x10\x2e\x38\x3c\x93\x0e\xbe\x21\x69\xba\xa4\x41\x24\x02\
-\x00\x79\xc6\xf5\xfc\xa0\xa2\xcc\x09\x4b\xc3\x19\xdb\xf2\xed\xa5\
-\x27\x58\xbd\x81\xf3\xd4\xca\xa5\x9b\xd6\xdc\xb5\xe4\xce\xa3\xff\
-\xf1\xa2\x9b\x03\x05\x49\x49\xa7\x48\x4a\x91\x0c\x00\xe4\xcd\x61\
-\xf4\x88\x4c\x14\x6c\x5b\x73\xd7\x92\xbb\x98\x00\x60\xaf\x8d\x0f\
-\x1b\xc7\x14\x65\x92\x5f\x75\xd7\x57\x25\xed\x4f\x22\x00\x90\x17\
-\x36\x16\x65\x3b\x8f\xf9\xd5\xd5\x97\xe5\xd5\x23\xe3\x99\x00\xe4\
-\x90\x67\x56\xde\xbe\x6d\xf5\xff\x2e\x59\x79\xe4\x84\x89\x3f\x4a\
-\x7a\xea\x55\x49\x27\x49\x1a\x49\x32\x00\x90\xd3\x06\x65\x13\xc9\
-\xae\x35\xff\xbb\xe4\xd7\x4c\x00\xd0\x2b\xca\xcb\x17\x25\x36\x1e\
-\xbf\xe9\x13\x92\x5d\xe1\x52\x09\x89\x00\x40\xce\xda\x92\x8c\xec\
-\xd8\x65\xf3\x2a\x5f\xa1\x00\xa0\x57\x95\xcc\x69\x3a\x4d\x91\x7d\
-\xd9\xa4\x2f\x49\x1a\x42\x22\x00\x90\x73\x1a\xda\xea\xab\x6a\x29\
-\x00\xe8\x13\xe3\xc3\xc6\x31\xa9\xae\x44\x95\xcc\xaa\x25\x1d\x47\
-\x22\x00\x90\x3b\x53\x80\x74\x2a\x73\xcc\xca\x70\xc6\xab\x14\x00\
-\xf4\x21\xb7\xb2\xd9\x0b\x3f\xee\xee\xd5\x92\x3e\x23\xa9\x98\x4c\
-\x00\x80\x29\x00\x05\x20\x46\x26\xcc\xba\x71\x7f\x0b\x32\x17\x9b\
-\x54\xa5\xee\x8f\x12\x02\x00\x06\xc6\xeb\xd6\x99\x3a\xb2\xf5\xda\
-\xa9\x5b\x29\x00\xe8\x57\x13\xe7\xcc\x3f\x39\xf2\xe4\xc5\x72\x9f\
-\x2a\xe9\x10\x12\x01\x80\xfe\xe5\xa6\x2b\xda\xeb\xaa\x7e\x48\x01\
-\xc0\x80\x08\xc3\x30\x58\x95\x3e\xe2\x6c\x49\x17\x9b\xf4\x05\x49\
-\xc3\x48\x05\x00\xfa\xc5\xd3\xe9\xd4\xda\xe3\x57\x86\x61\x86\x02\
-\x80\x01\x75\xd6\x95\x8b\x06\x0f\x1f\xb2\xa9\xc4\x65\xe5\x92\x3e\
-\x4d\x19\x00\x80\x3e\xde\x5c\xcd\xca\x5b\xeb\x2a\xff\x87\x02\x80\
-\x9c\x71\xd1\x37\x9b\x87\x6f\x4b\xfa\x64\xc9\xca\xcd\x74\xbe\x78\
-\x06\x01\x00\xf4\xc5\xf6\x7a\x5f\x5b\x7d\xe5\x59\x14\x00\xe4\x6c\
-\x19\xd8\x51\x64\x13\x25\x9f\xec\xae\x4f\x48\x1a\x43\x2a\x00\xd0\
-\x4b\x1b\x6c\x10\x9d\xde\x3a\x77\xda\x83\x14\x00\xe4\xb4\x30\x0c\
-\x83\x7b\xb2\x87\x9d\x26\x0f\x26\xbb\xdb\x85\x92\xff\x03\xef\x0f\
-\x00\xd8\x07\x6e\x8d\x6d\x0d\x95\x5f\xa6\x00\x20\xaf\x9c\x7f\xd5\
-\xc2\xa3\xa3\x84\x97\x45\xf2\xc9\x26\x95\x8a\xfb\x0c\x00\x40\x4f\
-\x6d\x49\xa6\x8a\x0f\x5b\x16\x7e\x69\x13\x05\x00\x79\xe9\x8d\x53\
-\x05\xee\xba\x50\xf2\x4f\x48\x3a\x80\x54\x00\x60\x4f\x36\x59\x9b\
-\xd1\x5a\x5f\x39\x9f\x02\x80\x82\x50\x72\x55\xcb\xb1\x41\x42\x25\
-\xdd\x0f\x28\xf2\x32\xf1\xc4\x42\x00\x78\x37\xbf\x6b\xab\xaf\xfa\
-\x08\x05\x00\x05\x67\xec\xf4\xc6\xd4\xe8\x03\x92\x67\x9a\xec\x3c\
-\xc9\x27\x48\xfa\xa8\xa4\x22\x92\x01\x80\x6e\x81\xdb\xd8\xe5\x0d\
-\x95\xbf\xa7\x00\xa0\xa0\x4d\x0e\x1b\x87\x6c\xcf\xa4\xce\xb6\xee\
-\xe9\xc0\xc7\xe4\x3a\x53\x52\x92\x64\x00\xc4\x96\xe9\xdf\xda\xea\
-\xaa\xbe\x4e\x01\x40\xac\x4c\x0c\x9b\xf6\xcb\x66\x7c\xbc\x79\x70\
-\xae\xe4\xff\x28\xd9\xa9\x92\x12\x24\x03\x20\x36\x5c\x7f\x1d\x57\
-\xb4\xf6\x88\x30\x0c\x23\x0a\x00\x62\x6b\x7c\x78\xfd\xb0\x64\x66\
-\xf0\x47\x83\xee\xe9\xc0\x38\x97\xce\x11\x9f\x30\x00\x50\xe8\x43\
-\x00\xb3\x09\xad\x75\x95\x2b\x28\x00\xc0\x4e\x93\xc3\xc6\x21\xdb\
-\xd3\xc9\x7f\x30\xf7\x71\x66\x56\xe2\xd2\x38\x49\x83\x49\x06\x40\
-\x81\x8d\x01\x9a\xda\xea\xab\xa7\x51\x00\x80\x77\x9d\x10\x84\xc9\
-\xa2\xec\x61\x1f\x72\xb7\x8f\xc9\x83\x71\xea\xbe\x96\x60\x34\xc9\
-\x00\xc8\x73\x1b\x92\x9b\xb6\x1e\xbc\xec\x87\x57\x74\x52\x00\x80\
-\x3d\x50\x5e\xbe\x28\xb1\xe1\xf8\xcd\xa7\xc9\x75\xae\x4c\x13\xd4\
-\x7d\xca\x80\x87\x19\x01\xc8\x3b\x26\xbf\xa8\xb5\xbe\x7a\x29\x05\
-\x00\xd8\xcb\x42\xb0\xf1\xc4\x8d\x1f\xf6\xac\x95\xec\x3c\x65\xf0\
-\x31\xf1\x40\x23\x00\x79\xc0\x65\x2d\xed\xf5\x95\x55\x14\x00\xa0\
-\x17\x9c\x75\xe5\xa2\xc1\x43\x87\x6e\x19\xf7\x96\x8b\x0a\xcf\x95\
-\x94\x22\x19\x00\x39\xe8\xe5\x51\x4f\x0e\x3f\x74\xf1\xe2\x29\x59\
-\x0a\x00\xd0\xcb\xde\xf8\x94\x81\x49\x25\x72\x95\xf0\x50\x23\x00\
-\xb9\xc4\x64\xe3\x5a\xeb\x2b\xef\xa1\x00\x00\x7d\xac\x2c\xbc\xe9\
-\x40\x4f\x77\x9d\xeb\xb2\x92\x9d\x0f\x35\x3a\x86\x54\x00\x0c\x1c\
-\xff\x6e\x5b\x7d\xf5\x4c\x0a\x00\xd0\xcf\x4a\xae\x6a\x39\x56\x49\
-\x9f\x60\xd2\x79\x72\x9d\x27\xe9\x40\x52\x01\xd0\x8f\x1e\x6f\xab\
-\xaf\xfa\x00\x05\x00\x18\x40\x61\x18\x06\xf7\x64\x0f\x3b\x2d\xca\
-\x26\xce\x37\xf3\xf3\xd5\xfd\x1c\x03\x6e\x5b\x0c\xa0\x4f\x65\x2d\
-\x71\xdc\x8a\xba\x4b\x57\x53\x00\x80\x1c\x51\xf6\xf5\x9b\x86\xaa\
-\xb8\xeb\xbc\x48\x76\xa1\x99\x9d\x2f\xf7\x23\x49\x05\x40\xef\xef\
-\xbc\xfe\xe5\xb6\xba\xea\x46\x0a\x00\x90\xa3\xde\x78\xec\x71\x24\
-\x9f\xdc\xfd\x70\x23\x3e\x6e\x08\xa0\x57\xb6\xde\xc5\x6d\xf5\x95\
-\x53\x28\x00\x40\x9e\x4c\x07\x7c\x50\x7a\x82\xdc\x27\x9b\xec\x42\
-\x97\x0e\x26\x15\x00\x7b\xe9\xb5\x71\xa9\xb5\x07\x0e\xf4\xc3\x81\
-\x28\x00\xc0\x5e\x98\x38\x67\xfe\xc9\x51\x36\xb8\x50\x81\x4d\x96\
-\xeb\x6c\x7e\x96\x00\xf4\x44\xe0\x36\x76\x79\x43\xe5\xef\x29\x00\
-\x40\x1e\x2b\x99\xd9\x78\x64\x90\x4c\x9d\xbf\xf3\x54\x41\xa9\x78\
-\xba\x21\x80\xdd\x6f\xbf\x33\xdb\xea\x2b\xbf\x4b\x01\x00\x0a\xc4\
-\xf8\xf0\xfa\x61\xc9\xf4\xa0\x89\x26\x5d\xa8\xee\x3f\x63\x48\x05\
-\xc0\x2e\x2c\x6b\xab\xaf\xfa\x04\x05\x00\x28\x40\xe5\xe5\x8b\x12\
-\xeb\x8f\xdf\x7c\x96\x49\xe5\x72\x7d\x4e\xa6\x43\x49\x05\xc0\x4e\
-\x1b\xc6\xa5\xd6\xee\x3f\x90\xd7\x01\x50\x00\x80\x7e\x10\x86\x61\
-\xb0\x2a\x7d\xc4\xd9\x66\x76\xa1\x79\xf4\x39\x97\xbd\x8f\x54\x80\
-\x78\x0b\x82\xec\x29\xcb\xe7\x4e\x7f\x84\x02\x00\xc4\xc8\xc4\x39\
-\xf3\x4f\x76\x4f\x94\xbb\xeb\x0b\x92\xde\x4f\x22\x40\xfc\xb8\x69\
-\x7a\x7b\x5d\xd5\x02\x0a\x00\x10\x53\x65\x73\x16\x8c\x55\x14\x7c\
-\x4e\xf2\x72\x26\x03\x40\xac\x2c\x6c\xab\xaf\xaa\xa4\x00\x00\xe8\
-\xfe\x78\xa1\x27\x2f\x96\xfb\xa5\x92\x0e\x22\x11\xa0\x80\x27\x00\
-\xd2\x13\xed\xf5\x55\x27\x52\x00\x00\xbc\x69\xec\xf4\xc6\xd4\xe8\
-\x31\x89\x32\x33\xfb\xa2\xa4\x4f\x4a\x1a\x42\x2a\x40\xe1\x75\x80\
-\x74\x2a\xd8\x6f\x65\x58\xb1\x81\x02\x00\xe0\x1d\xce\xba\x72\xd1\
-\xe0\x61\x43\x36\x5d\xe8\xb2\xa9\x26\x4d\x94\x94\x22\x15\xa0\x40\
-\x1a\x80\x45\x1f\x6f\xaf\x9b\xb6\x92\x02\x00\xe0\x3d\x4d\x98\x75\
-\xe3\xfe\x89\x20\xfb\x59\x37\x9f\x2a\xd7\x38\x12\x01\xf2\xbc\x00\
-\x48\x57\xb6\xd7\x57\xfd\x3b\x05\x00\xc0\x1e\xeb\xbe\x1d\x71\x72\
-\x9a\xcc\x2f\x96\xb4\x1f\x89\x00\xf9\xc8\x6e\x6c\xab\xaf\xbc\x94\
-\x02\x00\xa0\xc7\x26\x5d\x7e\x5d\x71\x66\xc4\x90\x8b\x4c\x36\xdd\
-\xa5\x09\xfc\x5c\x03\x79\x35\x03\x78\xb8\xad\xbe\xfa\x34\x0a\x00\
-\x80\x7d\x32\x61\xd6\xfc\xe3\x83\x44\xb2\x52\xee\x95\x92\x0e\x20\
-\x11\x20\xe7\x75\x8d\x4a\x0d\x1f\xbe\x38\x9c\xd2\x45\x01\x00\xd0\
-\x4b\x53\x81\x61\x9f\x91\x34\x5d\xf2\x73\xf9\x59\x07\x72\x57\xe4\
-\xd1\x87\x3a\x1a\xa6\xfd\x91\x02\x00\xa0\xd7\xa7\x02\x89\x20\x39\
-\xcd\xe5\x95\xe2\x5a\x01\x20\x07\xf9\x94\xb6\xfa\xea\xc5\xfd\xfd\
-\x55\x03\x82\x07\x0a\x5b\xc7\xbc\xe9\x4f\xb6\xd6\x57\x7e\x23\xb9\
-\x69\xeb\xa1\xee\xba\x44\xd2\x9f\x49\x05\xc8\x1d\x26\x9d\x30\x40\
-\x5f\x17\x40\xdc\x94\xd4\x36\x7f\xcc\x64\x57\x48\xfe\x19\x49\x09\
-\x12\x01\x06\xb2\x01\xf8\xcd\x6d\x75\xd5\x17\x33\x01\x00\xd0\xe7\
-\xda\xeb\xab\x56\xb5\xd5\x57\x4e\x71\x8b\x4e\x95\xb4\x50\x52\x17\
-\xa9\x00\x03\xc4\x6d\x40\x6e\x07\xcc\x04\x00\x80\xc6\x87\x0b\x0f\
-\x2e\xca\x44\x5f\x76\xd7\x3f\x49\x1a\x49\x22\x40\x3f\xee\xff\xd2\
-\xe6\xf6\xfa\xca\x91\x92\x39\x05\x00\xc0\x80\x98\x18\x36\xed\x97\
-\xed\xb2\xcb\xcd\xec\x6b\x92\x8f\x26\x11\xa0\x7f\xa4\x53\xc1\x21\
-\x2b\xc3\x8a\x75\xfd\xf9\x35\x39\x05\x00\xe0\x4d\xcb\xc3\xea\xd7\
-\xdb\x1b\xaa\xbe\x9d\x4e\x6d\x3f\x52\xee\x57\x49\xb6\x9e\x54\x80\
-\xbe\x57\x94\xf5\xa3\xfa\xfb\x6b\x52\x00\x00\xbc\xc3\xca\xf0\x2b\
-\x5b\xda\x1a\xaa\xaf\x19\x9c\xf6\xa3\xba\x8b\x80\x36\x90\x0a\xd0\
-\x77\x3c\x8a\x8e\xa4\x00\x00\xc8\x19\x4b\xbe\x5b\xb5\xb9\xad\xa1\
-\xfa\x9a\x20\xe5\xef\x33\xd9\xb5\x92\x3a\x49\x05\xe8\x7d\xe6\x76\
-\x34\x05\x00\x40\xce\x59\x1e\x56\xbf\xde\x5a\x5f\xf9\x0d\x93\xbd\
-\xdf\xa5\xf9\x92\x22\x52\x01\x7a\x71\x02\x60\xc6\x04\x00\x40\xee\
-\x6a\xad\xaf\x5c\xdb\x5e\x5f\x35\xc3\x82\xe8\x0c\x97\x7e\x4d\x22\
-\x40\xaf\xe1\x1a\x00\x00\x79\x50\x04\xe6\x4e\x7b\xb0\xbd\xbe\xea\
-\x3c\x93\x7d\x5e\xd2\x0b\x24\x02\xec\xf3\x0c\x80\x09\x00\x80\xbc\
-\x9a\x08\xfc\x7c\x50\x2a\x73\xbc\x99\xbe\x2d\x6e\x26\x04\xec\x8b\
-\x83\xfb\xfb\x0b\x72\x1f\x00\x00\xbd\x62\xe2\x9c\xf9\x27\x47\x51\
-\x62\xbe\xa4\xb3\x49\x03\xe8\xb1\xec\xa8\x27\x87\x17\x2f\x5e\x3c\
-\x25\x4b\x01\x00\x90\x87\xdc\xca\x6a\x17\x4e\x73\xf9\xf7\x24\x0d\
-\x25\x0f\xa0\x07\x1b\x72\x2a\x75\x50\x6b\x38\xf5\xe5\xfe\xfa\x7a\
-\x9c\x02\x00\xd0\x9b\xbf\xc2\xbc\xb5\xbe\x72\x7e\xd6\x12\x1f\x92\
-\xf4\xbf\xe4\x01\xec\xb9\x28\x9b\x3d\xa8\x3f\xbf\x1e\x05\x00\x40\
-\xaf\x5b\x51\x77\xe9\xea\x51\x4f\x0e\x3f\x4f\xb2\x6f\x49\xca\x92\
-\x08\xb0\x07\xdc\x29\x00\x00\xf2\xdf\xe2\xc5\x53\xb2\x6d\xf5\x95\
-\xdf\x31\xb3\x32\x49\x2f\x91\x08\xb0\x9b\x0d\x99\x02\x00\xa0\x90\
-\xb4\xd6\x55\xae\xb0\x54\xea\x83\x92\xb5\x91\x06\xf0\xee\xa2\x7e\
-\x7e\x00\x17\x05\x00\x40\xdf\x97\x80\x70\xea\xcb\xa3\x9e\x1c\x36\
-\x49\xae\xeb\x49\x03\x78\xd7\x0d\x79\x14\x05\x00\x40\xc1\x59\xbc\
-\x78\x4a\xb6\xad\xa1\xea\xab\x32\xff\x27\x71\x2b\x61\x60\x57\x5b\
-\xf2\x48\x0a\x00\x80\x82\xd5\x56\x57\xfd\x03\x49\x9f\x93\xb4\x8d\
-\x34\x80\xb7\x72\x0a\x00\x80\x02\x2f\x01\xf5\x55\xb7\xc8\xfd\x22\
-\x49\x3b\x48\x03\xd8\xb9\xfd\x9b\x28\x00\x00\x62\x50\x02\x1a\xaa\
-\x3b\x64\xfa\x24\x25\x00\x78\xa3\x01\x50\x00\x00\xc4\xa5\x04\xd4\
-\x55\xb5\x7a\xf7\x03\x85\xd2\xa4\x81\xd8\x33\x0d\xa3\x00\x00\x88\
-\x8d\xf6\xfa\xca\xdb\xdc\xec\x6b\x24\x01\x26\x00\x2a\xa6\x00\x00\
-\x88\x57\x09\xa8\xab\xfc\x4f\x49\xcd\x24\x81\x98\x8f\x00\x06\x53\
-\x00\x00\xc4\x4e\x3a\x15\x7c\x55\xae\xdf\x92\x04\x62\xbb\xfd\x2b\
-\x1a\x44\x01\x00\x10\x3b\x2b\xc3\x8a\x1d\x0a\x82\x2f\x4a\xea\x24\
-\x0d\xc4\x91\xcb\x28\x00\x00\xe2\xa9\xad\xae\xe2\x2f\x66\x7e\x2d\
-\x49\x20\xa6\x28\x00\x00\xe2\xab\x38\x99\x6d\x90\xf4\x0c\x49\x20\
-\x8e\x6f\x7f\x0a\x00\x80\xd8\x5a\x1a\xce\xd8\xe6\x66\xdf\x21\x09\
-\xc4\x50\xbf\xee\xc9\xc9\x5c\xfb\xee\xcb\x66\x2d\x3c\xd1\x83\x68\
-\xa6\x2b\x6a\x6c\xaf\x9f\x76\x1f\xef\x07\x20\x7e\xb6\x6e\x1d\xf6\
-\xb3\x61\x43\x36\xff\xab\xa4\xfd\x49\x03\x31\x62\xb1\x9e\x00\x64\
-\x93\x1a\x2e\xe9\x52\x53\x70\x6f\x69\x6d\xf3\xa3\xa5\x35\x4d\x33\
-\x2f\xb8\xea\x47\xa3\x79\x5f\x00\xf1\x71\xef\xf7\xa7\x6c\x97\x59\
-\x13\x49\x80\x02\x10\xa3\x02\x60\x51\xf4\xd6\x73\x20\x1f\x90\xd9\
-\xd5\x9d\x89\xe2\x67\x4b\x6b\x5a\xfe\xab\x64\x4e\xd3\x69\xbc\x3f\
-\x80\x98\xfc\x26\xcc\xda\x0d\xa4\x80\x98\x09\x0a\xf6\x8b\xed\xd1\
-\x0f\xbd\x7b\xf1\x2e\x2a\xd1\x70\x99\xcf\xb0\xc8\x7e\x5f\x5a\xd3\
-\x7c\x5f\xc9\xec\x96\x8a\xc9\x61\xe3\x10\xde\x2b\x40\xe1\x6a\x9d\
-\x57\xf1\xb8\xb8\x18\x10\x14\x80\xf8\x14\x00\x05\x89\xf7\xbe\x0a\
-\xd2\x74\xa6\xb9\xb7\xec\x48\x27\xff\x5a\x52\xdb\xdc\x58\x56\xdb\
-\x72\x36\xef\x19\xa0\x30\xb9\xfc\x7e\x52\x00\xfa\x46\x32\xf7\x7e\
-\xe2\xa3\x3d\xfd\x18\xc4\x48\x93\xa6\xbb\x7c\x7a\x49\x6d\xf3\x13\
-\x81\xfb\x8d\x89\x22\xff\xf1\xb2\x70\xda\xf3\x2c\x2b\x50\x18\xcc\
-\xed\x91\xfe\x3d\x2b\x0a\x0c\xa8\x4c\xbc\x0b\x80\x6c\x90\xe4\x3d\
-\xfb\x27\xa4\x13\xdc\xac\x21\x93\xb6\xba\xd2\xd9\xcd\xf7\x9a\xdb\
-\x4d\xea\x4c\xfe\xa4\xf5\xda\xa9\x5b\x79\x3f\x01\x79\x3c\x01\x08\
-\xb4\xce\x9c\x1c\x10\x93\xf7\x7b\x3f\x3f\x15\x33\xf7\x4e\x01\xec\
-\xe2\x1a\x80\x1e\x7d\x3f\xae\x71\x2e\x6f\xf4\xe2\xf4\x0b\x25\xb5\
-\xcd\x8d\xa5\xb3\x9a\xc6\x49\xce\x31\x04\x90\x8f\x22\xa7\xc4\x23\
-\x36\xac\x9f\x0b\x40\xee\x4d\x00\x02\x2f\xee\xa5\xfd\x7a\xa4\x49\
-\xd3\x15\xd8\xf4\xd2\xda\x96\x67\xdd\x9a\x17\xc9\xfc\xa7\xed\x73\
-\xab\x1f\xe2\x6d\x06\xe4\xcd\xaf\xc4\x24\x19\x20\x46\x62\x5e\x00\
-\xfa\xe6\x5e\xc8\x47\x99\xeb\x1b\x72\xfb\x46\x69\x6d\xf3\x33\x32\
-\xfb\xb9\x2b\x7b\x63\x7b\xdd\xb4\xc7\x78\xbf\x01\x39\x7d\x48\x74\
-\x28\x21\x20\x46\xe2\x7d\x0d\x80\x45\x56\xd4\xc7\x03\xfb\xa3\xe5\
-\x3e\xd3\x14\xcc\x2c\xad\x6d\xfe\x83\x4b\x3f\x4b\x66\x83\x9f\xdd\
-\x79\x75\xc5\x33\xbc\xf7\x80\x5c\xdb\xff\x75\x14\x29\x80\x09\x40\
-\x4c\x0a\x80\xf7\xef\xd3\x90\x3e\x64\xd2\x87\xb2\x89\xa8\xa1\xb4\
-\xb6\xe5\x7e\x49\xb7\x04\xd9\xe8\x97\xcb\xaf\xae\x7e\x8a\xf7\x21\
-\x90\x13\xce\x24\x02\xc4\xc8\xb6\x78\x4f\x00\x02\x2f\xf6\xfe\xbf\
-\x66\xcf\x24\xff\xa8\xa4\x8f\x46\x09\xbb\xa6\xb4\xb6\xf9\x4f\x32\
-\xdd\xea\xe6\xb7\x70\xcd\x00\x30\x30\x26\x86\x4d\xfb\x45\x69\x7d\
-\x88\x24\x10\x1b\xae\xcd\xb1\x2e\x00\xf2\xa0\xb8\xa7\x1f\x03\xec\
-\x03\xa7\xca\x75\xaa\xb9\xcd\x29\xad\x6d\x7e\x56\xd2\x6d\x6e\xb6\
-\x34\x93\x7c\x6e\xe5\xca\x30\xcc\xf0\x2e\x05\xfa\x5e\x94\xb1\xff\
-\x2b\x9e\x58\x8a\x18\x31\x8b\x7d\x01\xf0\xe2\x1c\xbb\xf1\xc7\x51\
-\x92\xae\x30\xf7\x2b\x52\xe9\x23\x5e\x2e\xab\x6d\xbe\x4d\xf2\xa5\
-\xea\x2c\x5a\xc1\x7d\x06\x80\x3e\xfb\x45\x60\xf2\x96\x69\xe4\x80\
-\x58\x95\x5e\xd7\x96\x78\x17\x00\xeb\xd7\x6b\x00\x7a\xea\x40\x97\
-\xa6\x49\x36\x4d\xc5\xe9\x4c\xe9\xec\xe6\xfb\x15\xf9\x52\x4b\x78\
-\x7b\xeb\xdc\x69\x0f\xf2\xf6\x05\x7a\x47\x49\x4d\x4b\xb9\xc4\xf8\
-\x1f\x4c\x00\x62\x55\x00\x5c\x56\x94\x03\xa7\x00\xf6\x2c\x3b\xd7\
-\x38\x99\x8d\xf3\xc8\x54\x5a\xdb\xfc\x94\xa4\x3b\xdc\xed\x8e\x4c\
-\x91\xfd\x66\x65\x58\xb1\x83\xb7\x33\xd0\x73\x65\x5f\xbf\x69\xa8\
-\xac\xab\xc1\xb9\x07\x30\xe2\x56\x00\x5c\x1b\x62\x5e\x00\xa2\x41\
-\x96\x9f\x3f\xf8\xc7\x49\xba\xc2\xcc\xaf\x48\xa5\x7d\x5b\x49\x6d\
-\xf3\x8a\x40\xbe\x2c\x1b\x45\xed\x1d\xf3\xa6\x3f\xc9\x5b\x1b\xd8\
-\xc3\xdf\x01\xc5\x5d\xff\x2e\xd9\xfb\x48\x02\xb1\x7b\xef\x4b\xaf\
-\xc4\xba\x00\xc8\xad\xb8\x00\x8a\xff\x10\x93\x2e\x74\xd9\x85\x41\
-\x90\x50\x59\x6d\xf3\x3a\x97\xdd\x65\x52\xbb\xa4\x65\xad\xf5\x95\
-\x6b\x79\xab\x03\xef\x54\x32\xbb\x79\x9a\x5c\xd5\x24\x81\x58\x0a\
-\xfc\xe5\x58\x17\x00\x33\x15\x17\xda\x9a\xba\x74\xb0\xe4\xe5\x2e\
-\x95\x4b\x52\x69\x6d\xf3\x9f\xe5\xd6\x61\x16\x75\x0c\x4a\xdb\xca\
-\x25\xdf\xad\xda\xcc\x3b\x1f\x6c\xfe\x0b\x3e\x63\xae\xff\x24\x09\
-\xc4\x76\x02\xe0\xf6\x6a\xbc\x27\x00\x2a\xbc\x02\xb0\x0b\xa7\xc8\
-\xfc\x14\x97\x7d\x6d\x7b\x4a\x99\xd2\xda\xe6\x07\xcc\xfc\xd7\x59\
-\x69\x55\x51\x72\xd0\x3d\xcb\xc2\x2f\x6d\xe2\x47\x01\x71\x52\x5a\
-\xd3\x7c\xa9\x5c\x0b\x24\x25\x48\x03\x71\x95\x88\x82\x78\x4f\x00\
-\x64\x2a\x56\xbc\x1e\xff\x99\x94\x74\xb6\xbb\x9d\x1d\x48\xca\xa4\
-\x3b\xb3\xa5\xb5\xcd\x7f\x94\x74\x97\x99\xdd\xd5\x95\xb4\x55\x2b\
-\xc3\x8a\x75\xfc\x68\xa0\x10\x8d\x0f\xc3\x64\x32\x73\x44\x83\x5c\
-\x5f\x97\xb8\xea\x0f\xf1\x96\x51\xfa\xa5\x78\x17\x00\x8f\xc5\x04\
-\xe0\x3d\x4b\xa0\xa4\xd3\x24\x9d\xe6\xee\x57\xa4\xd2\xae\xd2\xda\
-\xe6\xbf\x48\x5a\xe5\x66\x77\x99\x6c\x55\x5b\x5d\xc5\x5f\xf8\x51\
-\x41\xbe\x3b\x6f\xf6\x0d\xef\x0b\x32\x99\x85\xe6\x3a\x87\x34\x00\
-\xf9\xb6\x1d\xa3\xfa\xf5\xfa\xb0\x9c\x6b\xdc\x3b\x8f\x7e\x4f\xe5\
-\xbd\xf0\x9e\x5e\x91\xf4\x80\x64\x0f\x44\x16\x3d\x30\x28\xd3\x75\
-\xff\xaf\xae\xbe\x6c\x3d\xb1\x20\x1f\x94\x87\x8b\x8a\x36\xa4\xb7\
-\xfc\x93\xe4\xdf\x92\x34\x84\x44\x00\x49\xd2\xcb\x6d\xf5\x55\x07\
-\xc5\x7b\x02\xa0\x9c\xbe\x11\x50\xae\x38\x40\xd2\x05\x92\x5f\x10\
-\xb8\xa9\x2b\x51\xec\xa5\xb5\xcd\x7f\x91\xf9\x03\x2e\x7b\x20\x30\
-\x7b\x60\x64\x62\xd8\x43\x8b\xc3\x29\x5d\x44\x85\x5c\x11\x86\x61\
-\x70\x4f\xfa\xc8\xf2\x0d\xe9\xcd\x0d\x92\x8e\x25\x11\xe0\xad\xc7\
-\xff\x7a\xb6\xbf\xbf\x64\x0e\x5e\x03\x60\xc5\x72\xe7\xcd\xd0\xc3\
-\xd4\x24\x1d\x2f\xb7\xe3\x4d\xfa\x92\xbb\x6b\x43\xb4\xb9\xb3\xb4\
-\xa6\xf9\x61\x93\xff\x5e\x16\x3c\x9c\x0d\xec\xa1\x6d\x5b\x86\xfe\
-\xf9\xde\xef\x4f\xd9\x4e\x5c\xe8\x4f\xe3\xc3\xeb\x87\x25\x33\x83\
-\x2a\xee\x49\xfb\xd7\x5c\xce\xe7\xfb\x81\x5d\x6e\x7d\x7a\x8e\x02\
-\xe0\x5e\xcc\x5b\xa1\x57\x14\xcb\x74\xa6\xcb\xce\x94\x5c\x41\xe4\
-\x1a\x36\x64\x73\xb6\xb4\xb6\xf9\x09\x33\x7b\xd8\x5d\x7f\x30\xcf\
-\x3e\x94\xf0\xc4\xc3\xcb\xe6\x55\xbe\x42\x5c\xe8\x6d\x25\x33\x1b\
-\x8f\xb4\x64\xe2\x2b\x4a\xdb\x74\x49\xa3\xb8\xb3\x1f\xf0\x1e\x5b\
-\x9f\xe9\x19\x0a\x80\x44\x01\xe8\x3b\x09\x49\x27\xb9\xfb\x49\x92\
-\xbe\xe0\x16\x28\x63\xae\xd2\x9a\xe6\xbf\xca\xfc\x61\x59\xf0\x27\
-\x8f\xfc\x51\x33\x3d\x9a\x4e\xed\x78\x7c\x65\xf8\x95\x2d\x44\x86\
-\x9e\x98\x14\x2e\x38\x3c\x93\xb1\xcf\x4a\x56\x2e\xd7\x59\xe2\x69\
-\x7e\xc0\x9e\x15\x00\xe9\x09\x0a\x00\x05\xa0\xff\x99\x0e\x95\xec\
-\x50\xb9\x7f\xc2\x76\x1e\xa4\xa5\xd2\x83\xbc\xb4\xb6\xf9\x59\x93\
-\x1e\x77\xd3\x23\x26\x3d\x96\xcd\xea\xd1\x6c\x71\xf0\xd8\xca\xb0\
-\x62\x03\xa1\xe1\x0d\x13\x66\xb5\x9c\x94\x48\x68\xa2\xbb\x7f\x2e\
-\x93\xd6\x59\xe2\xe3\x7c\x40\xcf\x8f\xce\xb2\xc1\xe3\x14\x00\x0a\
-\x40\xee\xd4\x02\xe9\x68\x97\x8e\x96\xeb\x7c\x97\x14\x04\x52\x90\
-\x8e\x76\x4e\x0c\xf4\xb8\x4b\x4f\x99\x6c\xb5\xcb\x57\x27\x02\x3d\
-\xd5\x99\xd8\xb1\x9a\xa9\x41\xe1\x3b\x7f\x76\xf3\x09\x59\xf9\x78\
-\x77\x7d\xdc\x64\xe3\x25\x3f\x88\xcb\x76\x80\x7d\x9c\x00\x14\x27\
-\xfa\x7d\x02\x90\x53\x4d\xbd\xfb\xe3\x41\x9b\x3b\x79\x2b\xe4\xb5\
-\x97\x64\x7a\x4a\x6e\x4f\xc9\x7d\xb5\xcc\x9e\xb2\x40\x6b\x2c\x9b\
-\x7e\x6e\x79\xc3\xf4\x75\x92\xb1\x55\xe4\x91\xb2\xd9\x0b\x8e\x71\
-\x0f\x3e\x2c\xd3\x69\x72\xfb\xb0\xe4\xa7\x4b\x3a\x84\x64\x80\x5e\
-\xf5\x7a\x5b\x7d\xd5\xfe\xb1\x9e\x00\x74\x6e\xdb\x5c\xac\x14\xef\
-\x84\x3c\x77\x90\x5c\x07\x49\x3e\xae\xbb\x5e\xba\x3c\x92\xdc\x92\
-\x2a\xad\x6d\xe9\x92\x9a\x9f\x97\xf4\xbc\xa4\x67\x25\xad\x95\xb4\
-\xd6\xdd\xd7\x06\xd2\xb3\x5d\x45\x89\xe7\x39\xbd\xd0\xff\xc6\x4e\
-\x6f\x4c\x8d\xda\xdf\x8e\x09\x12\xa9\xe3\xdc\xa3\xe3\xcd\x75\x9c\
-\x9b\x4e\x32\xe9\x34\x77\x8d\xea\x3e\x3c\x79\xf3\x5f\x00\xf4\xfe\
-\xa1\xf8\x63\x03\xf1\x65\x73\xaa\x00\x6c\x1a\x92\x29\x4e\xa5\x93\
-\xbc\x19\x0a\x57\x91\xba\x3f\xff\xfd\xb6\xcf\x80\x9b\x99\x5c\x52\
-\x2a\x1d\xa9\xb4\xb6\x79\x8b\x4b\x2f\x98\xf4\x8a\x49\x2f\xb9\x6b\
-\x9d\xcc\x5e\x96\xfc\x65\x97\xbd\x18\x48\xaf\x64\x2c\x78\x29\xb9\
-\x23\x58\xd7\x7a\xed\xd4\xad\x44\xba\x7b\xe3\xc3\xc6\x31\xc9\x6c\
-\xd1\x21\xe6\x3a\x42\x91\x1f\xea\xf2\xc3\x02\xd3\x61\x92\x8e\x90\
-\xfc\xfd\x2e\x3b\x4a\x52\x52\x1e\x75\x77\x36\xe3\x24\x3e\xd0\xaf\
-\xdc\x1e\x8a\x7d\x01\x08\xd2\x83\x8a\xa5\x0c\x6f\x86\x78\x1b\x66\
-\xd2\x09\x92\x4e\xf0\x9d\x9b\xd1\x1b\x47\x9e\x26\x97\x4b\x4a\x78\
-\x56\x5e\x9c\x55\x69\x6d\xf3\x36\x49\xaf\x48\xbe\x5e\x0a\x36\x74\
-\xff\x55\x1b\x24\xad\x37\xf9\xfa\x48\xda\x10\xc8\xd6\x47\xee\x1b\
-\x02\x0b\xd6\x67\x23\x6d\x30\xd7\x0e\xb7\xc4\xc6\xa2\xe2\x44\x3a\
-\x9f\x1e\xba\x54\x32\xb3\x71\x64\x94\x1c\x34\xac\xc8\x32\xc3\x22\
-\x8b\x86\x45\x9e\x18\x2d\xd7\xd0\x40\x3e\x2c\x32\xed\x17\x48\xfb\
-\xbb\xdb\xfe\x32\x1f\x63\xae\x31\x2e\x1f\x23\xd9\xfe\x92\x0e\x50\
-\x5a\x83\xa4\xe8\x8d\x23\x0d\xd9\xdb\x8e\xe5\xd9\xea\x81\x81\xdf\
-\xff\xf5\x7b\x0a\x40\x36\x5b\xcc\xb3\xc0\xd0\x03\x43\x24\x1d\x25\
-\xd9\x51\x7f\x3f\x9e\x76\xd9\x9b\x1b\x5d\xf7\x84\xc1\x15\x04\x6f\
-\x6c\x79\x19\x65\xd2\x19\x95\xd6\x36\x4b\xd2\x0e\xc9\xb6\xcb\xb4\
-\xd9\x3c\x4a\x7b\x77\x91\xe8\x34\x69\x9b\x24\xb9\x6b\x9b\xcc\xfe\
-\xee\xba\x14\xdf\xea\xd2\x1e\xdc\x65\xd1\x92\x26\x0d\xdf\xc5\x8f\
-\xfb\x3b\xff\x7b\xd3\x50\x77\x2b\x92\x7c\x88\xba\x2f\x84\x1d\x2c\
-\xd9\x20\xc9\x07\x75\xff\x7b\x29\xa1\x8c\xb2\x2e\xc9\x03\xd9\xce\
-\xef\xd7\xd5\x7d\x55\xc5\x9b\xff\xc9\xff\x56\x97\x00\xe4\x87\x84\
-\x39\x05\xc0\x4d\x83\xf8\xb5\x85\x7e\xd6\xbd\xc9\xba\x46\xfb\x5b\
-\x8e\x8d\xfd\x6d\x07\xc8\xef\x3c\xf7\xbd\x67\xef\x53\xdf\xf3\xff\
-\x65\x97\xe7\xd8\x39\xe7\x0e\xc4\xc0\x8e\x57\x5f\xca\x3c\x3a\x20\
-\x07\xdd\xb9\x94\x82\x25\x23\x3e\x02\x08\x00\x88\x11\x7b\xf8\xc1\
-\xf9\x33\xd2\xb1\x2f\x00\x8a\xb8\x0d\x30\x00\x20\x46\xdb\xbf\xb4\
-\x6a\xa0\xbe\x76\x6e\x4d\x00\xa2\x04\x05\x00\x00\x10\xa3\x06\x10\
-\xdd\x4d\x01\x50\xf7\x35\x00\xbc\x1b\x00\x00\x31\xe1\x4a\x16\xdd\
-\x43\x01\x90\x14\x58\x54\xc4\xfb\x01\x00\x10\x13\x4f\xb5\x86\x53\
-\x5f\xa6\x00\x48\x72\x31\x01\x00\x00\xc4\xe5\xf8\xdf\x56\x0c\xe8\
-\x41\x77\x6e\x85\x11\x70\x0d\x00\x00\x20\x26\xfb\xbf\xb7\x51\x00\
-\x76\xb2\x80\x4f\x01\x00\x00\x62\x21\x9b\x48\xf9\xaf\x29\x00\x6f\
-\xb4\x21\x4e\x01\x00\x00\x62\xc0\x4c\x0f\x2c\x0f\xab\x5f\xa7\x00\
-\xbc\x11\x88\x8c\x8b\x00\x01\x00\x71\xd0\x3a\xd0\x2f\x20\xc7\x6e\
-\x04\x14\x31\x01\x00\x00\x14\xbc\xc8\xfc\x36\x0a\xc0\xdb\x5e\x8d\
-\x71\x0d\x00\x00\xa0\xd0\x3d\xdb\x3e\xb7\xea\x61\x0a\xc0\x5b\xb9\
-\x28\x00\x00\x80\xc2\xe6\x76\x6b\xf7\x73\x3c\x29\x00\x6f\x8a\x9c\
-\x4f\x01\x00\x00\x0a\x7c\xff\x0f\xb2\xb7\xe6\xc2\xeb\xc8\xad\x09\
-\x80\x71\x0a\x00\x00\x50\xd0\x5e\xca\x24\x5f\x58\x95\x0b\x2f\x24\
-\xb7\x0a\x80\x8c\x8b\x00\x01\x00\x05\xcb\xa4\x9f\xae\x0c\xc3\x0c\
-\x05\xe0\x1d\x38\x05\x00\x00\x28\x5c\x2e\xfd\x24\x57\x5e\x4b\x6e\
-\xdd\x07\x80\x8b\x00\x01\x00\x85\xeb\x2f\x6d\xf5\x55\xbf\xa3\x00\
-\xec\xb2\x01\x70\x0d\x00\x00\xa0\x40\x8f\xfe\xdd\x6e\xcc\xa5\xd7\
-\x93\x63\xa7\x00\xb8\x15\x30\x00\xa0\x20\x65\x22\x4b\xdc\x90\x4b\
-\x2f\x28\x99\x63\xfd\x88\x09\x00\x00\xa0\x00\x8f\xfe\x75\xfb\x8a\
-\x86\x4b\x5e\x60\x02\xf0\xae\x09\x71\x0d\x00\x00\xa0\xf0\x04\xd2\
-\xfc\x1c\x7c\x4d\x39\xc4\xc4\xc3\x80\x00\x00\x85\xe6\xd9\xb3\x8b\
-\xd6\x2e\xa7\x00\xbc\x37\xae\x01\x00\x00\x14\x16\xd7\x0f\xc3\x30\
-\x8c\x72\xed\x65\xe5\xd8\x35\x00\x14\x00\x00\x40\x21\xed\xfd\xda\
-\xac\x6c\xa6\x29\x17\x5f\x1b\xd7\x00\x00\x00\xd0\x47\x4c\x5a\xd0\
-\x7e\xcd\x8c\x8d\x14\x80\xdd\x27\x45\x01\x00\x00\x14\x8a\xac\x59\
-\xf4\x1f\xb9\xfa\xe2\x72\xaa\x00\xb8\xb8\x08\x10\x00\x50\x28\x87\
-\xff\xfe\xd3\xd6\xba\x69\x4f\x53\x00\xf6\x68\x00\xc0\x35\x00\x00\
-\x80\x02\x39\xfa\xcf\x26\xea\x73\xf9\x05\xe6\x4c\x01\x08\xc3\x30\
-\x90\x94\xe2\x3d\x03\x00\x28\x00\x8b\x5a\xe7\x55\x3c\x4e\x01\xd8\
-\x03\xcb\x37\x9e\xc4\xf9\x7f\x00\x40\x21\x88\x3c\x08\xe6\xe5\xfa\
-\x8b\xcc\x99\x02\x50\x3c\x72\x2b\x05\x00\x00\x90\xf7\xcc\xec\x67\
-\xed\x73\x2b\xfe\x44\x01\xd8\x43\x89\xae\x0c\x05\x00\x00\x90\xef\
-\xba\x32\x0a\xfe\x25\x1f\x5e\x68\xce\x14\x00\xcb\x46\x14\x00\x00\
-\x40\xbe\xfb\x8f\x15\x75\x97\xae\xa6\x00\xf4\x80\x07\xc6\x27\x00\
-\x00\x00\xf9\x6c\x43\x14\x25\x1b\xf2\xe5\xc5\xe6\xce\x04\x20\x99\
-\x62\x02\x00\x00\xc8\x5f\xae\xba\x8e\x79\x97\xbc\x46\x01\xe8\x69\
-\x01\x88\x38\x05\x00\x00\xc8\x5b\x8f\xbd\xfe\x6a\xe6\xba\x7c\x7a\
-\xc1\xb9\x73\x23\xa0\xc8\x29\x00\x00\x80\xfc\x3c\xf8\x77\xbb\xf2\
-\xc1\xf9\x33\xd2\x14\x80\xbd\x99\x00\x24\x02\x0a\x00\x00\x20\x0f\
-\xd9\xe2\xf6\x86\xca\xe5\xf9\xf6\xaa\x99\x00\x00\x00\xb0\xf7\x36\
-\x66\x95\xb8\x32\x1f\x5f\x78\xee\x7c\x0a\xc0\x78\x0e\x00\x00\x20\
-\xcf\x8e\xfd\x65\xdf\x5c\x51\x7f\xc9\x0b\x14\x80\x7d\x09\xd1\x99\
-\x00\x00\x00\xf2\x6a\xf7\xff\x4d\x6b\x7d\xc5\x82\x7c\x7d\xf9\x41\
-\x0e\x05\x49\x01\x00\x00\xe4\x8b\xed\x52\x30\x4d\x32\xa7\x00\xec\
-\xfb\x4b\xa1\x00\x00\x00\xf2\x82\xcb\xbf\xd9\x56\x57\xf1\x97\x7c\
-\xfe\x1e\x72\xa8\x00\x70\x0d\x00\x00\x20\x1f\x58\x5b\x7b\x7d\xd5\
-\xf5\xf9\xfe\x5d\xe4\x4e\x01\xe0\x1a\x00\x00\x40\xee\x6f\xfe\xeb\
-\x4d\xaa\xca\xe7\xd1\x7f\xce\x15\x80\x48\x56\xc4\x1b\x0b\x00\x90\
-\xcb\x5c\x3e\xad\xb5\xbe\x72\x6d\x21\x7c\x2f\xb9\x74\x11\x20\xa7\
-\x00\x00\x00\xb9\x7b\xec\xef\xfa\x61\x7b\x7d\xd5\x2f\x0a\xe5\xfb\
-\xc9\xa1\x02\xc0\x29\x00\x00\x40\xce\x1e\xfa\xff\x36\xb1\x79\xeb\
-\x37\x0a\xe9\x5b\xca\xa1\xfb\x00\xf0\x31\x40\x00\x40\x4e\x1e\xfb\
-\xaf\xb7\x20\xfa\x3f\xcb\x7e\x78\x45\x67\x21\x7d\x57\xc9\xdc\x69\
-\x57\x56\x5c\x00\xd7\x54\x00\x00\x0a\x4b\x36\xb2\xe8\x0b\x1d\x75\
-\xd3\x9e\x2e\xb4\x6f\x2c\x77\x0a\x00\xd7\x00\x00\x00\x72\x8d\x6b\
-\x66\x47\x7d\xf5\x9d\x85\xf8\xad\x71\x0d\x00\x00\x00\xbb\xde\x97\
-\x6e\x6e\x6b\xa8\xfa\xb7\x42\xfd\xf6\x72\xe8\x3e\x00\x5c\x03\x00\
-\x00\xc8\x19\x0f\xa4\x93\x89\x69\x85\xfc\x0d\xe6\xd0\x9d\x00\x99\
-\x00\x00\x00\x72\xc2\xd3\x91\x47\x17\xad\x0c\x2b\x76\x50\x00\xfa\
-\x85\x71\x0d\x00\x00\x60\xa0\xbd\x96\x30\x4d\xea\x68\x98\xf6\x52\
-\xa1\x7f\xa3\x3c\x0d\x10\x00\x80\x6e\x3b\x5c\xfa\xd4\x9d\x75\x55\
-\x4f\xc4\xe1\x9b\xcd\x9d\x02\x10\x89\x5b\x01\x03\x00\x06\x4a\xc6\
-\x65\x9f\x6f\xaf\xaf\x5a\x15\x97\x6f\x98\x5b\x01\x03\x00\xe2\xce\
-\xcd\x7d\x46\x7b\x7d\xe5\x6d\x71\xfa\xa6\x73\xe9\x71\xc0\x9c\x02\
-\x00\x00\xf4\xff\xf1\xa7\xd9\x3f\xb7\x36\x54\xb7\xc4\xed\xfb\x4e\
-\xe6\xd0\x6b\xa1\x00\x00\x00\xfa\x77\xf3\x77\x7d\xb3\xb5\xbe\xf2\
-\xfb\x71\xfc\xde\x73\x69\x02\xc0\x29\x00\x00\x40\x7f\xaa\x6d\x6d\
-\xa8\xfa\xd7\xb8\x7e\xf3\x4c\x00\x00\x00\xb1\xe3\xd2\xac\xf6\xfa\
-\xaa\xab\xe3\x9c\x41\x2e\x15\x00\x3e\x05\x00\x00\xe8\xf3\xbd\xdf\
-\x4d\x5f\x6b\xaf\xab\xfa\x61\xdc\x83\x60\x02\x00\x00\x88\x8b\xac\
-\x99\x66\xb4\xd5\x55\x35\x13\x45\x8e\x14\x80\xb1\xd3\x1b\x53\x92\
-\x12\x2c\x07\x00\xa0\x8f\x74\x99\xd9\x17\x5b\xeb\x2a\xff\x87\x28\
-\xba\xe5\xc4\x45\x80\xc3\x0f\xcd\x70\xf4\x0f\x00\xe8\x2b\x9b\xe4\
-\xfe\x09\x36\xff\x1c\x2c\x00\x89\xce\x61\x14\x00\x00\x40\xef\x73\
-\x3d\xef\x81\x8f\x6f\x6b\xa8\xee\x20\x8c\x1c\x2c\x00\x41\x31\x13\
-\x00\x00\x40\x6f\xb3\xfb\x22\x45\xa7\xb7\xcf\xad\x7e\x88\x2c\xde\
-\x29\x27\xae\x01\xf0\x1d\x36\xc8\x12\xce\x6a\x00\x00\x7a\x6b\xf3\
-\x5f\xbc\x65\xdb\xb0\x4b\xee\xfd\xfe\x94\xed\x64\x91\xc3\x13\x00\
-\x25\xb3\x4c\x00\x00\x00\xbd\x72\x4c\x29\xb3\x6b\xc6\xa5\x9e\xfb\
-\x3c\x9b\x7f\x1e\x4c\x00\x2c\x4a\x16\xcb\x22\x56\x03\x00\xb0\x2f\
-\x3a\xe5\x56\xdd\x56\x5f\x79\x73\x1b\x59\xe4\x49\x01\x48\x78\xb1\
-\xb3\xff\x03\x00\xf6\xde\x8b\x51\xa4\xcf\x76\xcc\xab\xbc\x97\x28\
-\xf6\x4c\x6e\x9c\x02\x88\x22\x4e\x01\x00\x00\xf6\xd6\x8a\xc0\x33\
-\x63\x3b\xe6\x55\xb1\xf9\xe7\x5b\x01\x70\x33\x1e\x04\x04\x00\xe8\
-\xa9\x8c\x99\xbe\x3d\x2e\xb5\xb6\x74\x79\xc3\x8c\x17\x89\xa3\x67\
-\x72\xe3\x14\x80\x7b\xb1\xcb\x58\x0d\x00\xc0\x1e\x1e\x39\xea\xf9\
-\xc0\x83\x2f\x2c\x9f\x57\x71\x57\x2b\x69\xe4\xef\x04\x40\x16\x70\
-\x0a\x00\x00\xb0\x67\x5b\x86\xd4\x1e\x29\x3a\x7d\xf9\xbc\x8a\xbb\
-\x48\x23\xdf\x0b\x80\x3b\x05\x00\x00\xb0\x3b\x19\x33\x7d\xfb\xec\
-\xd4\xda\x89\x1d\x0d\xd3\x5e\x22\x8e\x7d\x93\x1b\x4f\x03\x74\x2f\
-\x96\x71\x0a\x00\x00\xf0\xae\xc7\xfd\x8f\x44\x81\x55\x74\xcc\xad\
-\xf8\x2d\x23\xff\x42\x9a\x00\x98\xb8\x08\x10\x00\xb0\xcb\xa3\x7e\
-\x99\x5d\x93\xdc\xb4\x65\x6c\xc7\xdc\x8a\xdf\x12\x47\xa1\x4d\x00\
-\x2c\x28\x96\x73\x2b\x60\x00\xc0\xdb\xfc\x39\x0a\x82\x4a\x36\xfe\
-\x02\x9e\x00\x44\x5c\x03\x00\x00\x78\xc7\x51\xff\xd6\xd3\xd9\xfc\
-\x0b\x7d\x02\xe0\x2a\xe6\x53\x80\x00\x00\x93\xfe\xa8\x20\xaa\x6c\
-\x9d\x3b\xed\x41\xd2\x88\x41\x01\xb0\xc0\x8b\xe5\x34\x00\x00\x88\
-\xb1\xad\xe6\x5e\xff\xda\xab\xd9\x6b\x1f\x9c\x3f\x23\x4d\x1c\xb1\
-\x99\x00\x18\xa7\x00\x00\x20\xa6\x5c\xba\x3d\x92\x7f\x75\x45\x43\
-\xf5\xb3\xa4\x11\xb3\x02\xe0\xd2\x20\x8e\xff\x01\x20\x76\x5b\xff\
-\xc3\x41\x94\xb8\x82\x1b\xfa\xc4\xb8\x00\x98\xc4\x04\x00\x00\x62\
-\xc3\xd6\xcb\xa2\x6f\x8f\x7a\x62\xc4\x7f\x2c\x5e\x3c\x25\x4b\x1e\
-\x31\x2e\x00\x32\xae\x01\x00\x80\x18\x88\x24\xfd\x24\x19\xe9\x9f\
-\x97\xcd\xab\x7e\x85\x38\x28\x00\x92\x07\xc5\x12\xf7\x01\x00\x80\
-\x42\xe5\xd2\xed\x0a\x82\x9a\xf6\xb9\x15\x7f\x22\x0d\x0a\xc0\x5b\
-\xde\x19\xce\xc7\x00\x01\xa0\x30\xdd\xa3\xc8\x6a\xda\xe7\x55\xfe\
-\x86\x28\x28\x00\xef\x64\x5c\x03\x00\x00\x85\xc4\xa4\x3f\xba\xbc\
-\xae\xad\xbe\x7a\x31\x69\x50\x00\xde\xe3\x9d\xe2\xb7\x28\xb2\x93\
-\x65\x3a\x9c\x25\x01\x80\xbc\xde\xfa\x1f\x91\x7c\x4e\x6b\x7d\xe5\
-\xad\x92\x71\x6e\x37\x87\xe5\xc4\xad\x80\xdb\xea\xaa\x1b\xd3\x45\
-\x6b\x8f\x91\xf4\x19\xc9\xda\xc4\x05\x01\x00\x90\x67\x47\xfc\xbe\
-\x5a\xf2\xa9\xe3\x52\xcf\x7d\xb0\xad\xbe\xea\x16\x36\xff\x7c\x58\
-\xb3\x1c\x34\xf1\xaa\xa6\xe3\xa2\x64\x50\x2d\xf7\x2a\x49\x63\x58\
-\x26\x00\xc8\x59\x7f\x70\xd7\xf7\x32\x45\x6b\xff\x7b\x65\x18\x66\
-\x88\x83\x02\xd0\x2b\x26\x5d\x7e\x5d\x71\x66\xc4\x90\x8b\x5c\x36\
-\xd5\xa4\xf3\x95\x2b\xa7\x2c\x00\x80\xdd\xe3\x6e\x73\xbf\xa6\xb5\
-\xbe\xea\x76\x8e\xf6\x29\x00\x7d\xea\xbc\xda\x1b\x0f\x4b\x78\xfa\
-\x4b\x32\xab\x92\xf4\x7e\x96\x0e\x00\xfa\x5d\xe4\xd2\x1d\x09\xf9\
-\xdc\xe5\xf5\xd5\x0f\x10\x07\x05\xa0\x9f\xb9\x95\xd4\xb6\x8c\x33\
-\xf9\x25\x52\xf0\x59\xc9\x47\xb3\x8c\x00\xd0\xa7\xb6\xc9\xb5\xd0\
-\x23\xfb\x5e\xfb\xd5\x95\x6b\x88\x83\x02\x30\xe0\xca\xcb\x17\x25\
-\xd6\x9f\xb0\xe5\xe3\xe6\x3e\xd5\xa5\x4f\x99\x34\x9c\x25\x05\x80\
-\xde\xda\x20\x7c\xb5\xbb\x16\xa4\x8b\xb2\xcd\x2b\xc3\x19\xaf\x92\
-\x08\x05\x20\x27\x8d\x0f\x17\x0e\x2a\x4a\x67\x4b\x5d\x56\x2e\xe9\
-\x33\x92\x86\xb2\xbc\x00\xd0\x63\x91\x49\x2b\x5c\x3e\x7f\xd4\x93\
-\x23\x7e\xc9\xbd\xfa\x29\x00\x79\xa5\x64\x66\xe3\x48\x25\x12\x17\
-\x98\xec\xd3\x32\x4d\xa2\x0c\x00\xc0\x6e\xbd\x24\xa9\xd9\x33\x99\
-\xc6\xf6\x6b\x66\x3c\x47\x1c\x14\x80\xbc\x77\xd6\x95\x8b\x06\x0f\
-\x1b\xba\xb9\x54\xae\x4f\x4b\x9a\x2c\x69\x7f\x96\x1d\x00\x24\x75\
-\xdf\x73\xe5\x2e\x73\xff\xcf\x91\x45\x23\x7e\xb9\x38\x9c\xd2\x45\
-\x24\x14\x80\x82\x34\x3e\x0c\x93\xa9\xae\xc3\xcf\x35\xd9\x27\xdd\
-\x74\x81\xa4\x63\x79\x0b\x00\x88\xa1\x35\x66\xfa\xb1\x65\xfc\xe6\
-\xe5\x57\x57\x3f\x45\x1c\x14\x80\xd8\x29\xb9\xaa\xe5\xd8\x20\xa1\
-\x92\x48\x3e\xd9\xa4\x32\x49\x45\xbc\x25\x00\x14\xa8\x8d\x92\x96\
-\xb8\xd9\x4d\xed\x75\x15\x1d\x7c\x76\x1f\x3c\x83\xef\x8d\x32\x30\
-\xb3\x71\xa4\x25\x13\x65\x92\x7d\x42\xd2\x24\x49\x07\x91\x0a\x80\
-\x3c\x97\x71\xe9\x4e\xb9\x7e\x9c\x29\x0a\x96\xac\x0c\x2b\x76\x10\
-\x09\x28\x00\xef\xc9\x6d\xe2\x9c\x96\x0f\x66\x23\x2f\x35\x05\x65\
-\x92\x7f\x4c\xd2\x60\x72\x01\x90\x07\x22\x49\xab\xdc\xf4\x3f\x41\
-\x32\xf5\xf3\xd6\x70\xea\xcb\x44\x02\x0a\xc0\x5e\x3a\xeb\xca\x45\
-\x83\x87\x0e\xdd\x32\xce\xa4\x12\xb9\x4a\x24\xff\x07\xb2\x03\x90\
-\x43\xb2\x32\xdd\x27\xf9\x62\x25\x6d\x71\x5b\x58\xf5\x57\x22\x01\
-\x05\xa0\x0f\x4c\xa8\x59\x70\x50\xc2\x12\xe3\x5d\x3e\x5e\xd2\x78\
-\x49\x27\x92\x0a\x80\x7e\xd6\x29\x79\x87\xb9\x7e\x91\xf5\xd4\x6d\
-\x1d\xf3\x2e\x79\x8d\x48\x40\x01\xe8\x67\x13\x6b\x1a\x0f\x89\x2c\
-\x35\xde\xe5\xe3\xad\xbb\x10\x1c\x4f\x2a\x00\xfa\xc0\x26\x93\xda\
-\x24\xdd\x12\x65\x32\xb7\xb7\x5f\x33\x63\x23\x91\x80\x02\x90\x43\
-\x4a\xc3\xe6\x43\x2d\x6d\xe7\xc8\x7d\x9c\x9b\x9f\x23\xd9\xa9\x92\
-\x12\x24\x03\x60\x2f\xfc\x49\xf2\x65\x81\xdb\x9d\xaf\xbe\x9a\x59\
-\xf5\xe0\xfc\x19\x69\x22\x01\x05\x20\x4f\x8c\x0f\xaf\x1f\x96\x4c\
-\x0f\xfa\xb0\xb9\x8f\x73\xb3\x8f\x99\x74\x8e\xa4\x91\x24\x03\x60\
-\x17\xb6\x99\x74\x8f\x9b\xdf\xee\xe9\xec\x2d\xdc\x95\x0f\x14\x80\
-\x82\x2a\x04\x61\x32\x95\x3e\xe2\xc3\x6e\xf6\x11\x73\xff\x88\xa4\
-\x8f\x48\xfa\x00\x53\x02\x20\x96\xb2\x2e\xfd\x21\x90\xad\x70\x8f\
-\xee\x1c\x55\x34\xe2\x2e\xee\xc8\x07\x0a\x40\x8c\x94\x7d\xfd\xa6\
-\xa1\x51\x71\xfa\x34\x33\x1f\x2b\xb7\xb1\x92\xc6\xee\x2c\x05\xac\
-\x11\x50\x78\xd6\xb8\xd4\x6e\xf2\xf6\x20\xa5\x8e\xe5\x61\xf5\xeb\
-\x44\x02\x0a\x00\xde\x34\x29\xbc\x79\x44\x3a\xdd\xf9\xc1\xb7\x94\
-\x82\x8f\x49\x3a\x86\x64\x80\xfc\xdd\xf0\xa3\x28\xb5\x82\x2b\xf6\
-\x41\x01\x40\x8f\x9d\x57\x7b\xe3\x61\x49\x4b\x7f\xc4\xdd\x3e\x22\
-\xd9\x47\x24\xff\xb0\xa4\x03\x48\x06\xc8\x19\x5b\x24\xfb\x9d\x2c\
-\xba\x57\xb2\xfb\xa2\x6c\xf2\x6e\x36\x7c\x50\x00\xd0\x27\x2e\xb8\
-\xea\x47\xa3\x3b\x13\xc5\x27\x07\xb2\x93\x5c\x7e\xb2\x4c\x63\xe5\
-\xfa\x90\xa4\x61\xa4\x03\xf4\xb9\x17\x25\x5b\x25\x8b\xee\x76\xb7\
-\x07\x47\xa7\x86\x3f\xc0\x39\x7c\x50\x00\x30\x60\xc2\x30\x0c\xee\
-\xdd\x71\xf8\xb1\xd9\xa4\x7f\xd0\x3c\x71\x8a\xa4\x53\x5c\xfe\x41\
-\x93\x8e\x13\x17\x1b\x02\x7b\xc7\xf5\xbc\x9b\x1e\x0e\x4c\x0f\x2a\
-\xd2\xfd\xa9\xa8\xf3\xbe\x5f\x5d\x7d\xd9\x7a\x82\x01\x05\x00\x39\
-\x6f\x7c\xb8\x70\x50\x71\x97\x9f\x94\x95\x9f\xa2\x40\xa7\x98\xeb\
-\x83\x72\x9d\x2c\xd3\xe1\xa4\x03\xbc\x29\x92\xf4\xa4\x4c\x0f\xcb\
-\xed\x21\xf3\xec\x43\x09\x4f\x3c\xbc\x6c\x5e\xe5\x2b\x44\x03\x0a\
-\x00\x0a\xac\x18\x5c\x3f\x2c\xd5\x35\xe4\x38\x59\xf6\xfd\xe6\x3a\
-\xce\xcd\xde\xef\xe6\xc7\x99\xdb\xf1\xe2\xc9\x88\x28\xec\x5f\x83\
-\xeb\x25\x7f\xcc\xa4\x47\x24\x7f\x38\x1b\xd9\x43\x89\x74\xea\x8f\
-\xad\xd7\x4e\xdd\x4a\x36\xa0\x00\x20\xd6\x26\x5d\x7e\x5d\x71\x7a\
-\xe8\xb0\xc3\x82\x44\x74\xb2\xbb\x4e\x72\xb3\x63\x03\xe9\x58\x97\
-\x8e\x55\xf7\xa7\x12\x78\x1f\x21\x3f\x36\x7a\xf3\x47\xdd\xf5\x88\
-\xb9\xaf\x31\xd3\xa3\x51\x36\x78\xa4\xfd\xea\x8a\xa7\x25\x73\xf2\
-\x01\x05\x00\xe8\x81\x92\x99\x8d\x23\x83\xa2\xe0\x38\x45\x89\xe3\
-\x22\xd7\x71\x26\x1d\x21\xf3\xc3\x25\x1d\x29\xe9\x30\x49\xfb\x91\
-\x12\xfa\xd1\x46\x97\x56\x9b\x6c\xb5\xc9\x57\xbb\xdb\x6a\x33\x3d\
-\x9a\xca\xee\x78\x8c\x73\xf5\x00\x05\x00\xfd\x68\x72\xd8\x38\xa4\
-\xb3\xb3\xe8\x48\xb7\xec\x61\x66\x3a\xdc\xdd\x8e\x94\xec\x30\x4a\
-\x02\xf6\x92\xcb\xf5\xa2\x07\xbe\xda\x7c\xe7\x26\xaf\x60\x75\xa0\
-\x68\x75\x67\x2a\xbb\x66\x65\x38\xe3\x55\x22\x02\x28\x00\xc8\xb3\
-\x92\x10\x25\xfc\xf0\xc0\xa3\xc3\x5c\x76\x98\x49\x07\x44\xd2\x01\
-\x26\x1d\x2c\xe9\x40\x93\x0e\xf0\xee\xfb\x1d\xf0\x09\x86\xc2\xf6\
-\x92\x4b\x2f\x98\xeb\x79\x93\x9e\x75\xf9\x0b\x66\xf6\xbc\x45\xc1\
-\x73\x9e\xc8\x3c\x3f\x32\x39\xf2\x05\x3e\x62\x07\x50\x00\x10\xbf\
-\x83\x3f\x2b\x0b\x7f\x7c\x80\x65\x77\x1c\x90\x75\x3b\xc0\x3c\x71\
-\xc8\xdf\x8a\x42\x74\xb0\xdc\x0e\xb4\x40\x07\xc8\xfd\x40\x97\xed\
-\x2f\x69\x14\x99\xe5\x84\xed\x92\x5e\x32\xd3\x8b\x1e\xe9\x15\x33\
-\xbd\xe4\xa6\x75\xee\xfe\xb2\x49\x2f\x05\x51\x62\x9d\x3c\xfb\x62\
-\xb0\x75\xdb\xda\x65\x3f\xbc\xa2\x93\xb8\x00\x0a\x00\xb0\xcf\x85\
-\x61\x62\xd8\x3c\x3a\x9d\x49\x8e\x4e\x78\x76\xb4\x79\x34\x5a\x96\
-\xd8\xcf\xe5\xa3\xcd\x7d\x74\x14\xd8\x68\x73\x1f\x6d\xb2\xd1\x2e\
-\x8d\xd6\xdf\xfe\xec\x27\xfd\xff\xed\xdc\x3d\x4e\xc3\x40\x10\x86\
-\xe1\xf7\x5b\xc7\xb2\x13\xc0\x98\x73\x71\x10\x0a\x2e\x40\x99\x53\
-\x70\x11\x2e\xc0\x6d\x90\x28\xbc\x22\xc6\x5b\x60\x7b\x3f\x8a\xa4\
-\x88\xf8\x39\x00\x68\x9f\x6a\xa6\x9a\xd5\x68\x46\x9a\x6a\xe9\x4a\
-\xff\xbe\x99\x81\x08\x0c\x12\xd1\x76\x44\x0c\xca\x8a\xd6\x31\x76\
-\x56\x0c\x72\x74\x66\xa0\xaa\x5e\xe7\x4d\x7a\x79\xde\xdf\xbf\x97\
-\xd6\x15\x45\x39\x00\x8a\xe2\xcf\xb8\x7d\x78\xbc\x59\x42\xd5\xae\
-\xb9\xde\x52\xe7\x6b\x2f\x6a\x55\xe9\x02\xd6\x4e\xae\x1a\xc1\x95\
-\xf1\x25\xd0\x22\x75\xca\xde\x21\x5a\xa3\xde\x78\x1b\xa0\x05\x30\
-\xf4\xa0\xb3\x5d\xf3\x0e\x68\xce\x4a\xd5\xa0\x2f\xbf\x36\xba\xff\
-\x61\x3f\x17\xd0\xf8\xcb\xb1\xb3\x02\x87\x53\x92\x41\x6f\xa7\x78\
-\x14\x5e\x8c\x3f\x20\x4c\xc7\xf7\x38\x02\x04\x48\x86\x84\x7d\x90\
-\x18\x81\xc9\x90\xac\x10\x83\x49\xb6\x92\xb3\x0f\xb5\x18\x37\xcd\
-\x3c\x3d\xed\xef\x52\x99\x8a\xa2\xf8\x3f\x3e\x01\xf7\x27\x2f\x81\
-\xe2\x05\x69\x7e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x03\xfd\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
-\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
-\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
-\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x20\x20\
-\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\
-\x20\x66\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\x3a\x20\x66\
-\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\
-\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x63\
-\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x3a\x20\x63\x61\x6e\
-\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\
-\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x69\x6d\x61\
-\x67\x65\x3a\x20\x69\x6d\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\x73\
-\x70\x61\x63\x69\x6e\x67\x3a\x20\x32\x30\x0a\x0a\x20\x20\x20\x20\
-\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x69\x6e\x73\x74\x72\x75\x63\x74\x69\x6f\x6e\x73\
-\x4c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\
-\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x3c\x62\x3e\x50\x6c\x65\
-\x61\x73\x65\x20\x73\x63\x61\x6e\x20\x74\x68\x65\x20\x51\x52\x20\
-\x63\x6f\x64\x65\x20\x64\x69\x73\x70\x6c\x61\x79\x65\x64\x20\x62\
-\x65\x6c\x6f\x77\x20\x75\x73\x69\x6e\x67\x20\x53\x65\x63\x61\x6c\
-\x6f\x74\x20\x52\x65\x6d\x6f\x74\x65\x53\x63\x72\x65\x65\x6e\x20\
-\x61\x70\x70\x20\x6f\x6e\x20\x79\x6f\x75\x72\x20\x6d\x6f\x62\x69\
-\x6c\x65\x20\x70\x68\x6f\x6e\x65\x2e\x3c\x2f\x62\x3e\x22\x29\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x6d\
-\x61\x78\x69\x6d\x75\x6d\x57\x69\x64\x74\x68\x3a\x20\x34\x30\x30\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\
-\x65\x3a\x20\x54\x65\x78\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x46\x6f\x72\
-\x6d\x61\x74\x3a\x20\x54\x65\x78\x74\x2e\x52\x69\x63\x68\x54\x65\
-\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\
-\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\
-\x65\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x49\x6d\x61\
-\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\
-\x6f\x75\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\
-\x72\x75\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\
-\x69\x6d\x61\x67\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\
-\x6c\x6c\x4d\x6f\x64\x65\x3a\x20\x49\x6d\x61\x67\x65\x2e\x50\x72\
-\x65\x73\x65\x72\x76\x65\x41\x73\x70\x65\x63\x74\x46\x69\x74\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x73\x6f\x75\x72\x63\x65\x3a\x20\
-\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x61\x63\x68\x65\
-\x3a\x20\x66\x61\x6c\x73\x65\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\
-\x20\x20\x20\x52\x6f\x77\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x72\x6f\x77\x4c\x61\
-\x79\x6f\x75\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\
-\x6f\x75\x74\x2e\x61\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\
-\x74\x2e\x41\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\
-\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\
-\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\
-\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\
-\x3a\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\
-\x20\x71\x73\x54\x72\x28\x22\x43\x61\x6e\x63\x65\x6c\x22\x29\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x66\x69\x6e\x69\
-\x73\x68\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\
-\x22\x46\x69\x6e\x69\x73\x68\x22\x29\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x00\x2d\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x50\x69\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\
-\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
-\x00\x00\x04\x48\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
-\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
-\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
-\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x0a\x20\
-\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\
-\x73\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x3a\x20\x6f\x6b\x42\x75\
-\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\
-\x79\x20\x61\x6c\x69\x61\x73\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\
-\x61\x62\x65\x6c\x3a\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\x61\x62\
-\x65\x6c\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\
-\x61\x6c\x69\x61\x73\x20\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\
-\x65\x61\x3a\x20\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\
-\x0a\x20\x20\x20\x20\x73\x70\x61\x63\x69\x6e\x67\x3a\x20\x32\x30\
-\x0a\x0a\x20\x20\x20\x20\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x77\x61\x72\x6e\x69\x6e\
-\x67\x4c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\
-\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x3c\x62\x3e\x59\x6f\
-\x75\x72\x20\x6e\x65\x77\x20\x77\x61\x6c\x6c\x65\x74\x27\x73\x20\
-\x73\x65\x65\x64\x20\x69\x73\x20\x77\x72\x69\x74\x74\x65\x6e\x20\
-\x62\x65\x6c\x6f\x77\x2e\x20\x50\x6c\x65\x61\x73\x65\x20\x73\x61\
-\x76\x65\x20\x69\x74\x20\x69\x6e\x20\x61\x20\x73\x61\x66\x65\x20\
-\x70\x6c\x61\x63\x65\x2c\x20\x73\x6f\x20\x79\x6f\x75\x20\x77\x6f\
-\x75\x6c\x64\x20\x62\x65\x20\x61\x62\x6c\x65\x20\x74\x6f\x20\x72\
-\x65\x73\x74\x6f\x72\x65\x20\x79\x6f\x75\x72\x20\x77\x61\x6c\x6c\
-\x65\x74\x20\x69\x6e\x20\x63\x61\x73\x65\x20\x79\x6f\x75\x72\x20\
-\x53\x65\x63\x61\x6c\x6f\x74\x20\x64\x65\x76\x69\x63\x65\x20\x67\
-\x65\x74\x73\x20\x73\x74\x6f\x6c\x65\x6e\x20\x6f\x72\x20\x64\x61\
-\x6d\x61\x67\x65\x64\x2e\x0a\x3c\x62\x72\x3e\x50\x6c\x65\x61\x73\
-\x65\x20\x6e\x6f\x74\x65\x20\x74\x68\x61\x74\x3a\x0a\x3c\x62\x72\
-\x3e\x31\x2e\x20\x41\x6e\x79\x62\x6f\x64\x79\x20\x67\x65\x74\x74\
-\x69\x6e\x67\x20\x61\x63\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\
-\x75\x72\x20\x73\x65\x65\x64\x20\x77\x6f\x75\x6c\x64\x20\x68\x61\
-\x76\x65\x20\x61\x63\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\x75\
-\x20\x77\x61\x6c\x6c\x65\x74\x20\x61\x6e\x64\x20\x65\x76\x65\x72\
-\x79\x74\x68\x69\x6e\x67\x20\x6f\x6e\x20\x69\x74\x2e\x0a\x3c\x62\
-\x72\x3e\x32\x2e\x20\x49\x74\x20\x69\x73\x20\x73\x61\x66\x65\x72\
-\x20\x74\x6f\x20\x73\x74\x6f\x72\x65\x20\x79\x6f\x75\x72\x20\x73\
-\x65\x65\x64\x20\x69\x6e\x20\x61\x20\x6e\x6f\x6e\x2d\x65\x6c\x65\
-\x63\x74\x72\x6f\x6e\x69\x63\x20\x66\x6f\x72\x6d\x2c\x20\x66\x6f\
-\x72\x20\x65\x78\x61\x6d\x70\x6c\x65\x20\x6f\x6e\x20\x70\x61\x70\
-\x65\x72\x2e\x3c\x2f\x62\x3e\x22\x29\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x6d\x61\x78\x69\x6d\x75\x6d\
-\x57\x69\x64\x74\x68\x3a\x20\x34\x30\x30\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\x65\x3a\x20\x54\x65\x78\
-\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x74\x65\x78\x74\x46\x6f\x72\x6d\x61\x74\x3a\x20\x54\
-\x65\x78\x74\x2e\x52\x69\x63\x68\x54\x65\x78\x74\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x66\x69\x6c\x6c\
-\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\
-\x7d\x0a\x0a\x20\x20\x20\x20\x54\x65\x78\x74\x41\x72\x65\x61\x20\
-\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x73\x65\
-\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x22\
-\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\
-\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\
-\x65\x3a\x20\x54\x65\x78\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\
-\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x42\x75\x74\x74\
-\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\
-\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x4f\x4b\
-\x22\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\
-\x74\x2e\x61\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\
-\x41\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\
-\x74\x2e\x41\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0a\x20\
-\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x02\x4f\
-\x00\
-\x00\x09\x86\x78\x9c\xad\x56\x4d\x73\x9b\x30\x10\xbd\xf3\x2b\x34\
-\xb9\xb4\x3d\x94\x31\x69\x4f\xdc\x6c\x8f\xd3\x78\x26\x4d\x1c\x37\
-\x13\x9f\x55\xd8\xd8\x9a\x0a\x89\x8a\x65\xb0\xa7\xe5\xbf\x57\x80\
-\x21\x08\x24\xc7\x4d\xa2\x83\xc7\xda\x7d\xda\x5d\xbd\xfd\x10\x2c\
-\x49\xa5\x42\x72\x8f\xf7\x39\x8b\x7e\x91\x4b\xff\xab\xc7\x0c\x91\
-\x3f\x97\x02\x95\xe4\x99\x4d\x77\x43\x0f\x32\xc7\x8c\x04\x7e\x10\
-\x78\xde\x5c\xf2\x3c\x11\x8d\x8c\xfc\xf1\x88\x5e\x2c\x0e\x49\xd4\
-\x13\x7b\xb5\x34\x55\x32\x05\x85\x07\x42\x39\xa3\x19\xc9\x00\xe2\
-\x07\xd8\xe3\x54\x01\x0d\x8d\x9d\x0d\x1d\x51\x11\x01\x9f\xe5\x88\
-\x52\x84\xc6\xce\x86\x56\x90\xa1\x54\xd0\xc2\x8d\xad\x0d\x2f\xa0\
-\x58\x31\x51\xf9\xbf\x62\xc0\x75\xf4\x03\x81\xdd\x47\x0a\x14\xcd\
-\x63\x63\x59\x7d\x32\x4b\x69\xc4\xc4\x36\x24\x97\x93\x86\x8a\x6f\
-\x4a\xe6\xe9\x4c\xee\x8f\x7c\xb5\x9c\x35\x5e\x5b\x65\xa7\x6a\x48\
-\xf4\x9f\x18\xe7\x1b\x16\xe3\x2e\x24\xa8\x72\xe8\xd4\xc8\x90\x43\
-\x48\x7e\x67\x0f\xea\xe3\xc5\x42\x20\x28\x42\x2b\x53\x64\xb5\xbc\
-\xfd\x1c\xc9\x18\x2e\x3e\x79\x1d\xd8\x92\xad\x71\x04\x7d\x90\x01\
-\xd1\xb4\xef\xa4\xca\xea\x50\x42\x92\x52\x05\x02\x3d\x03\x71\x43\
-\x7f\x02\x1f\x18\x36\x8d\xd7\x88\x91\x1e\x35\x61\xed\x1d\x6e\x7b\
-\xb1\x87\x3a\xf8\x3e\xae\x34\xdd\x75\x3c\x9f\x74\x69\x66\xc3\xe5\
-\x76\xe0\xa9\x5a\xa0\xaf\xfb\xbd\x8a\xa2\x76\xb4\x14\xa9\x4e\xc3\
-\x8a\x66\x59\x21\x55\xbc\xd0\xba\x3b\xb1\x88\x19\x8e\x8e\x1d\x13\
-\x96\x30\xc1\x92\x3c\x39\xe6\xec\xcb\x64\xe2\x02\xba\x32\x6b\xb9\
-\xf0\x29\x7e\xbb\xea\x7b\x99\xe2\x75\x0d\x35\xaa\xe4\x8d\x4c\x3b\
-\x4a\xdf\x15\xc0\xbb\x93\x7d\x9a\x43\xf3\x5f\x79\xb2\x0b\xab\x51\
-\xf4\x0e\x3d\xa8\xf1\x8a\x14\x94\x73\xc0\x0f\xcd\xb4\xfb\x8f\x3e\
-\xac\xe0\x6f\xe8\xc2\x25\x42\xe2\xc8\x13\xd3\xaa\xc0\x45\xa2\x9e\
-\x6c\x5b\x91\x68\x73\xa1\x1e\xf6\xfe\xb4\xda\x5d\xcf\xa1\xbe\xce\
-\xdf\x4e\xf2\xd8\x48\x5e\x93\x88\x1e\xec\xd8\x1c\xd7\xc0\xb6\x3b\
-\xed\x2e\x70\x77\x47\x42\xf7\x43\xe4\x08\xfa\x23\xd2\x8f\x15\x7f\
-\x64\xba\x9e\xc7\xd7\xee\x48\xed\x40\x56\xc8\xcb\xb4\xb6\x2b\xe2\
-\x2c\x75\xdc\xae\x5a\xed\x3b\xe6\x08\xa5\x0b\x67\xf8\xe4\xd9\x56\
-\xa1\x68\xfa\xdc\x14\xfe\x46\x6f\xa7\xb8\xd1\x1d\x31\x93\xb9\x88\
-\xa9\x3a\xdc\xa9\xa9\x38\x14\x3b\x50\xf6\x58\xce\x08\xb7\x1c\x49\
-\xcb\x73\xba\x67\x2d\x8b\x51\xf9\xd6\x83\xa0\x95\x0f\x7b\xe7\x55\
-\xc5\xe5\x28\xaa\x4e\xdf\xbc\xe9\x96\x0e\x1a\x7d\x22\xb4\xab\x3f\
-\x85\xe6\x35\xa8\x37\x8b\xca\x33\x2c\x8f\xbf\x26\x6c\xa6\xd7\x0d\
-\xea\x38\x01\x0c\x17\xcd\x6f\xe9\xfd\x03\x2b\x53\x8d\x49\
-\x00\x00\x02\xf4\
-\x00\
-\x00\x0b\xc0\x78\x9c\xa5\x56\x5b\x6b\xdb\x30\x14\x7e\x2f\xf4\x3f\
-\x88\x3c\x39\x23\x98\x2d\xec\xa9\xd0\x87\xb5\x21\xa3\xb0\x95\x76\
-\x69\xbb\x67\xc5\x39\x89\x45\x65\xc9\x95\xe4\x5e\x18\xfd\xef\x3b\
-\x96\x7c\x91\x2d\x3b\x09\xad\x03\x89\x23\x7d\xe7\xfa\x7d\xb6\x0e\
-\xcb\x72\xa9\x0c\xb9\x35\xb7\x05\x4b\x1e\xc9\x3c\xfe\x7e\x7a\xc2\
-\x3a\x6b\xf1\x82\x51\x2e\x77\x9a\x7c\x8b\xbf\x9e\x9e\x9c\x9e\x2c\
-\x99\xca\x5e\xa8\x82\xfb\x7c\x43\x0d\x2c\xa5\xca\xc8\xbf\x72\xbd\
-\xfc\x10\xbc\x72\x25\x73\x50\xe6\x8d\x3c\x53\x45\x34\x70\x48\x4c\
-\x6d\x72\x95\xd1\x1d\x2c\x19\x87\x33\x32\x99\xd4\xf8\xf2\xbf\x0b\
-\x51\xfa\x21\xd5\xc5\x36\x67\x64\xdb\xec\xb4\xeb\x86\x19\x6b\x7e\
-\xc3\x81\x6a\xa8\xfc\x13\x8a\x58\x17\x82\xb0\x32\xc6\xa4\x35\xd8\
-\x4a\xbe\x01\x75\x46\x74\x8a\x35\x25\x85\xd1\x71\x2a\x33\x68\xf7\
-\x05\xcd\xca\x94\x0c\x28\x8d\x6e\xbf\xc4\x6b\x26\x3c\xeb\x67\xa6\
-\xd9\xba\x0c\xb8\xa5\x5c\x7b\x56\x52\xfc\x48\x12\xc8\x0d\x60\x9a\
-\x5e\xd6\x36\xa0\x5f\xec\x95\xd8\xca\x3f\xf0\x54\x80\x46\x68\xb4\
-\x03\x73\x43\x4d\x1a\x4d\xa7\xad\xc9\x7b\xdd\x07\x6b\x5b\x88\xc4\
-\x30\x29\x48\x83\xec\x7b\x2f\x9b\x9a\xe3\x0e\x39\xb7\xed\xb9\x57\
-\x3c\x36\x72\x65\x14\x13\xbb\x68\xda\x85\x2a\x30\x85\x12\x16\xdd\
-\x09\xd7\x89\xda\x65\xf3\x46\xe6\x45\x1e\xd2\x10\x40\x7a\x4e\x9a\
-\xb4\x35\xa6\x5d\xee\xff\x06\xad\xb1\xfa\x28\x73\xbf\x9d\x2a\x06\
-\xdc\xc5\x68\xd7\x4d\xa4\x72\x70\x07\xaf\xa6\x71\x32\x16\x34\xe1\
-\x52\x3b\x3f\xd1\xc1\x40\x16\x1b\x8d\xba\xc2\x3c\x16\xf0\xcc\x12\
-\xcb\x5b\xb4\x71\xb7\x8b\x19\xae\x2b\xd4\xe1\x75\x91\xad\x41\xcd\
-\x1a\xc7\x0f\xa8\x19\xb4\x9a\x59\x26\x56\x6f\x48\x71\xd6\x2c\xad\
-\xa5\x34\x5c\x52\x94\x5e\xb5\x34\x75\x4f\x49\x9d\x5c\xed\xfb\x81\
-\xf2\x02\x7e\xd1\x35\x20\x8f\x58\x2c\xd2\x5a\xef\xb4\x58\x3f\x7a\
-\x88\xf7\x77\xc3\xe2\xab\xe8\xa1\x59\x0f\xe0\x5b\x36\xc5\x0c\x18\
-\xf5\x0a\x6d\xcd\x82\x82\x43\xeb\x00\x32\x46\x83\x02\x24\xe2\xe7\
-\xfd\x55\x97\xcf\x04\x1f\x79\xe5\xd1\xb3\x47\x10\x3d\xe0\xb1\xad\
-\x9f\x4c\x8e\x6d\xba\x8f\x3c\xd8\xea\x2e\x78\xbc\xbb\x3e\xee\x88\
-\x76\xd6\xf0\x41\x19\x2f\xfb\x6f\x21\x4f\xcd\x1f\xd7\xef\x78\x0b\
-\xe7\xe3\xf2\x1d\xed\xcf\xfc\x43\x5a\x9c\x7f\x4e\x8c\xf3\x03\x6a\
-\x74\xdc\x0f\x9e\x5a\x55\x4c\x77\x24\xc5\xcd\x2b\x7a\xaf\x0c\x43\
-\x1e\x8e\x6d\xe4\x51\x12\x1b\x41\xef\xe9\xda\x91\x22\x1b\xc4\x8f\
-\xf7\x65\x5c\x8b\x85\x1b\x13\x98\x60\x3a\xc5\x23\xf0\x73\x47\xc1\
-\x93\xbe\x53\xd1\xc4\xad\xa3\xb5\xf3\x19\x4f\xfc\xf3\x74\xd0\x67\
-\x2a\x5f\x16\x52\xc0\x45\x61\x8c\x14\x01\x63\x9a\xed\x04\xe5\x55\
-\xa6\xed\x69\xad\xed\xa9\x6a\xbb\x79\x8d\x43\x82\x7d\x26\xb8\x65\
-\x55\x2c\x9b\x0e\x37\xf0\x69\xc7\xd7\x9e\x21\xa0\xe7\x76\xda\x64\
-\x11\x36\xd7\xe5\x1b\x4b\x71\xc9\x71\x10\xeb\xcd\x1a\x63\xf2\xea\
-\xea\xa0\x12\x2b\x8e\x64\x61\xdd\x5b\x4e\x75\x5a\x7b\x18\x8c\xe5\
-\x0d\x02\xdb\x68\x94\xfd\xf3\x92\xff\x60\x52\xc9\x28\x13\x7f\x99\
-\xd8\xc8\x17\x1b\x7d\x85\x53\x25\xaf\x8e\x69\x47\x63\x6f\x84\xab\
-\xa5\xe2\x26\x38\x9b\x7c\x97\xd9\xf7\xf6\x16\x70\x18\x1b\x9b\xbb\
-\x7c\xe2\x53\xb6\x81\x90\xf8\x0f\xcb\x0f\xab\xec\x7a\x08\x24\x33\
-\xdc\xa2\x19\x01\x85\xa5\x2e\x57\x97\x29\x24\x8f\x17\xf2\x35\x4e\
-\xca\x9b\x46\x34\xfb\x12\xf2\x99\xf3\xba\x60\x49\xc4\xaf\xff\xbb\
-\x5c\xa0\x0e\
-\x00\x00\x02\x98\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0a\x69\x6d\
-\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
-\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
-\x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\
-\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\
-\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\
-\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\
-\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\
-\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\
-\x20\x32\x0a\x20\x20\x20\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\
-\x75\x65\x0a\x20\x20\x20\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\
-\x75\x65\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\
-\x30\x0a\x20\x20\x20\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\
-\x79\x3a\x20\x50\x6f\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\
-\x45\x73\x63\x61\x70\x65\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\
-\x74\x69\x6f\x6e\x20\x63\x6c\x65\x61\x72\x41\x6c\x6c\x28\x29\x20\
-\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x64\x69\x73\x70\x6c\x61\
-\x79\x53\x65\x65\x64\x4d\x65\x73\x73\x61\x67\x65\x2e\x73\x65\x65\
-\x64\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\x78\x74\x20\x3d\
-\x20\x22\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x66\
-\x75\x6e\x63\x74\x69\x6f\x6e\x20\x73\x65\x74\x53\x65\x65\x64\x28\
-\x73\x65\x65\x64\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\x4d\x65\x73\x73\x61\
-\x67\x65\x2e\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\x2e\
-\x74\x65\x78\x74\x20\x3d\x20\x73\x65\x65\x64\x0a\x20\x20\x20\x20\
-\x7d\x0a\x0a\x20\x20\x20\x20\x44\x69\x73\x70\x6c\x61\x79\x53\x65\
-\x65\x64\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x69\x64\x3a\x20\x64\x69\x73\x70\x6c\x61\x79\x53\
-\x65\x65\x64\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\
-\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\
-\x64\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\
-\x65\x61\x72\x41\x6c\x6c\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\
-\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\
-\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\
-\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x04\x6b\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0a\x69\x6d\
-\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
-\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
-\x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\
-\x63\x72\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
-\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\x20\x28\x70\x61\
-\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\x20\x77\x69\x64\
-\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\
-\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\
-\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\
-\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\
-\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\
-\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\x30\x0a\x20\x20\x20\x20\x63\
-\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\x75\
-\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\x65\x0a\
-\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x63\x6c\
-\x65\x61\x72\x41\x6c\x6c\x28\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\
-\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x73\
-\x65\x63\x72\x65\x74\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\
-\x78\x74\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\
-\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\x50\
-\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\
-\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\
-\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\
-\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\
-\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\
-\x74\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\
-\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x67\x65\x74\x45\x6e\
-\x74\x65\x72\x65\x64\x44\x61\x74\x61\x28\x29\x20\x7b\x0a\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x73\x65\x63\x72\x65\x74\
-\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\
-\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x73\x65\
-\x63\x72\x65\x74\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\x78\
-\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x65\x77\
-\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\
-\x63\x72\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
-\x2e\x6e\x65\x77\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\
-\x2e\x74\x65\x78\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x72\x65\x70\x65\x61\x74\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\
-\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\x72\x79\
-\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\x50\x69\
-\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\
-\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\x61\x6c\x20\x72\x65\x73\x74\
-\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\
-\x28\x29\x0a\x0a\x20\x20\x20\x20\x50\x69\x6e\x41\x6e\x64\x58\x72\
-\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\
-\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\
-\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\
-\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\
-\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\
-\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\x72\
-\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\
-\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x72\x65\x73\x74\x6f\x72\x65\
-\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\
-\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\
-\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
-\x2e\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\x43\x6c\
-\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x02\x64\
-\x00\
-\x00\x0d\xb2\x78\x9c\xd5\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
-\x39\x6d\x17\xa3\x49\x07\x0c\xd0\xad\xcd\x80\xae\x40\x77\x48\x57\
-\xa4\x67\xd5\x61\x12\x61\x8a\xa4\x49\x74\xda\x6e\xcb\x7f\x9f\xfc\
-\x19\x7f\xd0\x49\x87\x15\xcd\xa6\x83\x01\x91\x8f\x12\xf9\xf4\x4c\
-\x49\x6e\xac\x71\xc8\x66\x38\x4b\x65\xf2\x8d\x4d\xe2\x0f\x91\x6c\
-\x99\xe2\xa9\xd1\xe8\x8c\xf2\xc1\x37\xee\xfa\x6e\xc4\xb3\x49\xd1\
-\xb3\x71\x7c\x1e\x45\xd7\x08\x1b\xf6\x33\x62\x61\xc8\x05\x67\x1b\
-\x21\x75\x66\xca\x0d\xd6\x19\x0b\x0e\x9f\x99\x50\x52\x78\x26\xac\
-\x9d\x83\xf3\xd2\xe8\xb9\x50\x29\xdc\x88\x07\x50\x9c\xb4\x52\xd1\
-\x8f\x42\x29\xc0\xaf\x28\x30\xf5\xcd\x78\xda\x4e\xae\x20\x2d\x84\
-\xc4\xef\xf3\x80\xcb\x14\xd1\x68\x4e\x19\xa9\xd8\xc4\x81\x40\x28\
-\x50\x57\xce\xa4\xf6\xd2\x3c\x71\xd2\x4a\x45\x3b\xf0\x68\x5c\x2f\
-\x9c\x34\x1f\xcd\x7c\x1f\x4f\x9a\x8f\xee\x5f\x55\x4e\x18\x8f\x55\
-\x5e\x85\xf6\x6d\x51\x1e\x3a\x35\x2a\xdd\xe8\x42\x1f\xa5\x28\x9a\
-\xc2\x68\xba\x6b\xa7\xd0\xc9\xda\x38\x1f\x3b\xb9\x5a\x23\x67\x56\
-\x38\xd0\x58\xcc\x68\xcc\x17\xe1\x56\x32\x24\x31\xfe\x78\xd6\x03\
-\x28\x58\xee\xd7\xc8\x26\x24\xe2\xd0\x0a\xdb\x50\xba\x4c\x84\x9a\
-\x86\x15\xc0\xd5\x6b\xb5\xcd\x75\x94\xb7\x22\x91\x7a\xc5\xd9\xe4\
-\x2c\xaa\x8d\xd5\x49\x34\x18\xa8\x58\x58\xc0\x56\x26\x70\xad\x97\
-\xa6\x75\x5c\xd5\x40\x89\x0a\x38\x1b\x15\xcc\x32\x19\x70\xa3\x16\
-\xa0\xe0\x2e\x5e\x4a\xa5\xee\xe5\x02\xd7\x9c\xa1\x4b\x21\x6a\x61\
-\xae\x9c\x5c\xf4\x8e\x60\x28\x89\x0a\xda\x03\x56\x7c\x64\x5b\x55\
-\x2c\xf4\x40\xce\x3c\x7a\xce\xce\x7b\xf6\x24\x3f\xe8\xe0\x9a\x44\
-\x3d\x5f\xfe\x7b\x12\x99\x55\xd9\xed\xfb\xc1\x1d\x3c\xe1\xfe\x67\
-\xee\x0e\x0c\x5e\xce\xbe\xfb\x3b\xf7\x6e\x74\x61\x2d\xdb\x16\x41\
-\x7c\xf4\xbe\x07\xdf\xfd\x4d\x16\x9d\x9e\x72\x28\x0d\x62\xeb\x6c\
-\x04\x1e\xe5\x8f\xd0\x4f\x85\xba\x50\x72\xa5\x37\x81\x49\xce\xb2\
-\xe2\xe2\x7c\xfe\xb9\xa3\xa9\x76\x9a\xe4\x79\xbf\x42\x81\xcd\xb6\
-\xf9\x72\xa2\x4b\x61\xfa\x3c\xec\x95\xa8\x3e\xd0\xc0\x0f\xa5\x72\
-\x42\xb2\xe9\xd9\xee\x45\x1d\x60\xf0\xca\xa8\x6b\x2c\x7b\xc0\x34\
-\x07\x96\xec\xfc\x79\x17\x00\x2d\x1e\x14\x84\x0d\x97\x42\xf9\x8e\
-\x6f\xa0\x4d\x0f\xa5\x49\xb6\xed\x6a\x90\x7d\xa2\x87\x2a\x2e\x89\
-\x03\x22\x20\x6e\x14\x0a\xda\x14\x40\x9b\x20\x5a\x0d\x25\x53\x62\
-\x2f\x85\x59\x29\x84\xdb\xec\x2a\x61\xbf\xea\xf9\xfc\xd4\xc2\x18\
-\x7e\x0c\xd4\xc5\x97\xca\xb8\x2d\x90\xa7\x92\x46\x2b\xd1\xb7\xd0\
-\xc6\xd0\x43\xa5\x3b\x9a\xe2\xe8\x70\xf4\xdf\xab\x63\xf8\xa9\x57\
-\x57\x5f\xaa\xe3\x13\x04\xc4\xc9\xc4\xd1\xca\xf3\x2d\xc4\x31\xf4\
-\x7e\xef\x8e\xa6\x38\xda\x14\xfd\xd3\xda\x28\xbe\xbb\xe8\x37\x7d\
-\xc4\xbd\x8b\
-\x00\x00\x00\x2a\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x59\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x46\
-\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
-\x00\x00\x02\xf5\
+\x00\x22\xf6\x78\x9c\xed\x5a\x4b\x8f\xdb\x36\x10\xbe\x07\xc8\x7f\
+\x50\x73\x72\x81\x85\xd0\xf6\x52\x20\x40\x0e\x1b\x6f\xdc\x2e\x9a\
+\x7d\x24\xde\xed\xa6\xbd\xd1\xd2\xd8\x26\x22\x91\x0c\x49\xc5\xeb\
+\x16\xf9\xef\x1d\x4a\xb4\x24\x4a\x94\x4c\x6d\xdc\xf4\x52\x1e\x36\
+\xb2\xc4\x99\xf9\x86\x33\x9a\x97\x42\x73\xc1\xa5\x8e\xde\xe9\x77\
+\x05\x4d\x3e\x46\x3f\xc5\x3f\x3f\x7f\x46\x9d\x7b\xf1\x9c\x33\x2d\
+\x79\xa6\xf0\xe1\x0f\xbd\x87\x6f\xc9\x9e\x17\x5a\x45\x3f\x7a\x9e\
+\x3d\x50\x96\xf2\x5d\x45\xf6\xfc\xd9\xa5\x86\x3c\xfa\xdb\x5c\x45\
+\xb8\xe6\x1c\xf7\x32\x60\x3a\xe6\xcc\x5c\x67\xa0\x21\x7d\x69\x9e\
+\x47\x76\x7d\xca\xb3\x5f\x21\x13\x20\xef\x35\xcd\x54\xbc\x01\x3d\
+\x2f\xa4\x44\x8a\x25\x68\x4d\xd9\x46\xcd\xbe\x3f\x30\x33\x4b\x42\
+\xce\x35\x2c\x13\x09\xc0\xde\x23\x24\xca\x40\xc5\x54\x5d\xf1\x15\
+\xcd\xe0\x76\x8b\xb2\x5e\xf3\x82\xa5\x86\xc8\x6c\xff\xd2\x00\x61\
+\x0c\x12\x4d\x39\x53\x6d\xe9\x9a\x48\x94\xf8\x32\x52\x7b\x85\xb8\
+\xef\x24\xd9\x37\xcf\x38\xbb\x11\xc0\xce\x85\xb8\x02\x56\x18\xb5\
+\xe6\x19\xaa\xdb\x81\x6f\x56\x4e\x28\xab\x0e\x21\x56\x5b\xbe\x3b\
+\xc8\xf6\x3c\x96\x84\x2a\x18\x7b\x0e\x9f\x0a\x50\xfa\x1c\x81\x7e\
+\x26\xda\xd9\xf9\xa5\x7d\x0a\x9c\xbd\x79\xa4\xfa\x18\xae\x77\x3a\
+\xfe\x54\x50\xdd\xe1\x32\xe5\x58\x5c\xe3\xb8\x08\x3a\x66\x7a\x0f\
+\x24\xdd\xf7\x20\x70\x51\xf2\x8e\x15\x9a\x75\x0b\xc9\xc7\x15\x7f\
+\x5c\x6a\xa3\x99\x02\x96\x5a\x0e\x77\x34\x87\x3b\x7e\x01\x9f\x69\
+\x02\x8e\xad\xcd\xa2\xeb\xa1\xad\xd1\xab\x57\xaf\x22\x2d\x0b\xf8\
+\xbe\x2b\xd4\xac\xb4\xdc\x83\x2e\x97\x17\x8c\x26\x44\x73\x19\xf7\
+\xf8\x9c\x67\x99\xd5\x1f\xd2\x8a\xa7\xea\xda\xa6\x61\xb5\x40\x0b\
+\x81\x8c\xab\x1f\xe7\x69\x0a\x69\x9c\x54\xc4\xb3\x10\x59\xb5\x7a\
+\x6d\xce\x5f\xdc\x9f\x90\x29\x18\xd6\xc5\x03\x20\xa5\xea\x94\x18\
+\x26\x3a\x87\xb5\x6d\xc7\x2b\x8c\x95\x5f\xf3\xc7\x21\x9f\xec\xbc\
+\xee\xaa\xff\xba\x2b\xe3\x1f\x5e\x3f\x30\x0f\xfe\xb7\xfa\x7f\x6d\
+\x75\x2d\x6c\xa6\x70\x0d\x8f\xf6\xbb\xd1\xa2\x89\x06\x65\x20\xf3\
+\x38\x80\x17\xb2\xbe\xb9\xbb\xad\x1d\x80\x15\xf9\x0a\xe4\xcd\xfa\
+\x82\x6e\xa8\x56\x67\x91\xde\x0b\x38\x8b\x3e\xc2\x7e\x38\x1a\xfe\
+\x02\x0c\x24\x7a\xc7\x35\xec\x7e\x83\xfd\x24\xe1\x1b\x4b\x8a\x08\
+\x90\x74\x86\x62\x16\x5c\xe6\x44\x97\x12\xdf\x02\xdb\xe8\xed\xd3\
+\xe3\xe7\x9a\xca\x7c\x47\x24\xdc\x8b\x14\x45\xb8\x98\xab\x7b\x2e\
+\x56\x1f\x5a\xeb\x01\x4a\x73\x71\xc5\x19\x45\xcc\x78\x4a\x5d\x8f\
+\xf5\x28\xb6\xce\x88\xda\x2e\x2c\x80\xd9\x1a\xd3\xe3\x35\xc9\xf1\
+\x20\x93\x0c\x08\x5b\xe0\xcf\x65\x99\xf3\x6a\x00\xc3\xa7\x7b\x60\
+\x72\x99\x93\x0d\x5c\xb2\x35\x9f\x78\xc0\xba\xc7\xa0\x86\x33\x2c\
+\x74\x4e\x58\x02\xd9\x24\x49\x49\x49\xb2\x70\xce\xfc\x2b\x92\x1f\
+\xe8\x2d\x48\x28\xf2\x07\x92\x61\xd9\xe2\xa2\x7b\xa0\x02\xb0\xfa\
+\x38\x6e\x3d\x07\xe0\xae\xa2\x7a\xe3\x30\x1e\x49\xf2\xef\x91\x37\
+\x97\x01\x3e\xe2\x48\x91\x15\x55\x47\x8a\x02\x48\xcf\x22\x06\xbb\
+\x5b\xca\xce\xb0\x8c\x12\x40\x34\x5e\x8e\x18\x40\x42\x90\x7f\xba\
+\x26\x28\x89\x3a\xa2\x83\x84\x86\x5a\xe5\x51\x8a\x93\x1b\xe4\xc3\
+\x81\xe7\xbf\x65\x8b\x46\x80\x02\x3c\x22\xfd\xad\x0c\xd1\xc8\x0d\
+\xb7\x41\x90\x15\xda\x65\xb8\x8b\xb6\x5d\x89\x63\xe4\xc2\x58\x85\
+\x05\x9f\xf4\xe3\xf6\x16\xf3\xca\x6c\xef\x73\x19\x31\x4d\x7f\x33\
+\xc6\x4c\xaa\xb6\xe1\x32\xd7\xe5\xfe\xa7\x0a\xbd\x67\x2b\xdc\xde\
+\x8b\x50\x5e\x49\x45\xb9\xb7\x45\xec\x15\x11\xfa\x32\xb4\x33\x84\
+\x0b\xef\x86\xc1\x85\xf5\x0a\x5b\xeb\x78\xce\xa2\xd5\x79\xa4\xee\
+\xe6\x19\xba\x0f\xf2\xbc\xc3\xd4\xdb\x2b\xc5\xbc\x6e\x6e\x76\x2f\
+\x21\x6b\x13\x57\xe9\x66\x1a\x23\xd4\xaa\x82\xbd\x64\x44\x60\x33\
+\x35\xf6\x46\x5e\xdb\xd2\x46\x4d\x52\xf1\xa2\xae\x9e\x20\x9d\x85\
+\xeb\x76\x01\xea\xa0\xdd\x98\x4f\x48\xb8\xdb\x92\xc9\x87\xaf\x39\
+\xbf\x22\x6c\xdf\xaa\x46\xbf\x16\xd5\x74\x27\x6a\x73\xef\xb4\x9a\
+\x52\x72\x79\x93\x24\xa6\xa8\x1c\x6d\x7e\x39\xb6\xcb\x4b\x6a\x9a\
+\xfc\x5b\x2e\x0a\x31\x03\x43\x78\x05\x4a\x61\xd6\x1f\xab\xdd\xda\
+\xd5\xdf\x40\x1b\x59\x17\x9d\xad\x8e\x61\xac\x66\x44\x02\xeb\x72\
+\x03\x52\x97\x01\x52\xfd\xfe\xd9\x16\x3b\xaa\x55\x65\xce\xaa\x5e\
+\xf2\xb1\x77\x8b\x43\xa3\x58\x43\x61\x2b\xfb\xcb\x8b\xb3\x48\x81\
+\xa4\x24\xbb\x2e\x15\x3c\x8b\xd6\xbb\xdf\x41\x2a\x34\x25\x5e\xaa\
+\xfa\x72\xc5\xb9\xce\xb8\xf1\x08\x7b\x2b\x00\xd8\xe1\x0d\x7b\x02\
+\x38\x65\x49\xe3\x16\xca\xc3\x2d\x17\x6e\x7d\xbb\xc1\xdd\xef\x74\
+\x06\x57\x43\xdd\xa8\x5a\xdf\xf3\xe9\xdc\xed\x19\xa3\x06\xaa\xf5\
+\x88\xe8\x3b\xec\x1f\x0b\x8c\x97\x18\xf2\xb1\xe6\xf5\x35\x5e\x47\
+\x9d\xad\xe6\xd9\xf5\xba\xae\xb0\x7e\xd3\x35\x02\x10\xcb\xcd\x73\
+\x21\xac\x2e\x01\x30\xdd\xf2\xd4\x40\xad\xae\x5c\x0b\x39\x5c\x5b\
+\x08\xf1\xfe\x61\x3b\xd5\x68\x30\xfa\x17\x96\x87\x13\x4c\xe3\x98\
+\x07\x99\x61\x45\x81\x42\xe8\x9a\x3a\x8d\xc4\x61\xd5\x45\xdb\x10\
+\x4c\xdc\xe0\x85\x59\x13\x3e\x0d\x66\x9b\xcf\x30\xc2\x71\xbb\x28\
+\x85\x2d\x05\xdb\x80\x14\xd8\x78\xe9\x00\xc3\xb4\xf3\x7e\xac\x0a\
+\x61\x86\xa5\x87\x51\xc3\xbc\x9d\x7a\xc6\x09\x4d\xdb\x54\x8b\x1d\
+\x82\x33\xda\xd6\xfb\x7a\xb8\xea\x7d\x36\x87\x1f\xf0\xca\x97\x61\
+\xdc\x06\xf0\x59\x7e\x2c\x90\xbb\x22\x6e\x25\xdf\x60\xf5\xab\x42\
+\xc4\xd8\xad\x66\xc2\xb3\xc1\x92\x61\xb5\xd7\xa0\x96\xf8\xd2\x61\
+\xef\xcf\x35\xc9\x5e\x9b\xdf\x78\xbd\x95\xbc\xd8\x6c\x45\x81\xf7\
+\x41\x93\x50\x20\x41\xf1\xad\x28\xff\x39\x94\x8d\xfe\xee\xda\x36\
+\xe2\xa6\xa4\x2f\x2b\x54\x5f\x2f\x3e\x8a\x64\x41\xb0\xe8\xeb\x67\
+\xd0\x0e\x94\x24\xe3\xca\x26\xd0\xe1\x41\x71\x60\xaa\x35\x4b\x95\
+\xdb\xec\xb3\x72\xb7\x99\xc5\x1b\x21\xcd\x2c\xcb\xea\x54\xf9\x68\
+\xa3\xd9\x68\x16\xf1\x4c\x05\xc2\x12\x49\x7f\x1a\xd0\xa4\x91\x13\
+\xa4\xb7\x6a\x9c\x93\x56\xf3\x9c\x90\x72\xc2\x8e\x7d\x46\x95\x75\
+\x3b\xda\x61\x6d\x47\x83\x32\x69\x45\xb8\x5d\x2f\xaa\x45\xc2\x1b\
+\xa0\x3a\x58\x1e\x7c\x23\x84\x29\xe5\x4b\x5f\x93\xe3\x4d\x6f\x88\
+\xb4\x8e\xe6\x95\x17\x53\x76\xce\xd2\x25\x40\xfa\x06\x4f\x7b\xdf\
+\xf6\xc1\x80\x01\xd6\x54\xb0\x73\xcf\xec\x61\x12\xd6\xa3\x20\x3b\
+\x74\x29\x55\x22\x23\x7b\xa3\x5f\x39\x5e\x39\xbd\x4a\xe8\x79\x1f\
+\x9a\x0c\x38\xe4\x74\x43\xd9\xf5\x84\xfe\x56\xa3\x98\xe2\x6a\x0e\
+\xf4\xe3\x5e\x76\x44\x46\xa3\x65\xcb\xb7\x90\x66\x59\x4e\x54\x9e\
+\xe8\x60\xa1\x10\xe7\xee\x38\x25\x14\xe1\x51\x54\x0d\x89\x75\xa6\
+\x5a\x21\x3b\x29\x3a\x81\x16\x1d\x87\x5a\xaa\xec\xb6\x58\x65\x34\
+\xc1\xb8\xd7\xaa\x24\xfc\x2a\x3d\xa9\x96\x19\xab\x63\xd6\xde\xda\
+\xc5\x39\xed\x75\xc1\xca\x66\x35\x1a\xc8\x4a\xb3\x5e\xd5\x15\x9e\
+\x9f\xcd\x1a\x4b\x88\xad\x6f\x2b\x41\x39\xd1\x01\x3f\x61\x66\x76\
+\x98\x07\x7d\xd3\x4e\xfb\xb2\xf7\x99\x3c\xc4\xe8\xe0\x19\xc6\x95\
+\x7e\x96\x77\x98\xf9\xbe\xd9\x75\xf7\x94\x9f\xef\x5e\xfc\x01\xea\
+\xc5\xd1\xd2\xd9\x1d\x08\x2e\x41\x7e\x06\x79\xac\x6a\x76\x69\xfe\
+\x04\xc9\xd1\x26\xeb\x2e\x55\xe0\x07\xb8\x01\xc6\x5c\x4c\xc6\xc2\
+\xc5\x08\x94\xe1\x11\x85\x7f\x10\x1a\x60\x33\x1b\x4b\xda\xc6\x1a\
+\xf6\x8a\xfb\xee\x44\xf2\xb8\x80\x80\xff\x78\xe1\x11\xb4\x18\x18\
+\xb2\x9e\x5e\x5e\x79\x81\x7f\xfe\x01\x90\x27\x48\x69\
+\x00\x00\x03\x7c\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
 \x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
@@ -1493,98 +129,55 @@ qt_resource_data = b"\
 \x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
 \x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
 \x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\
-\x61\x67\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\x20\
-\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\x20\
-\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x79\
-\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\x74\
-\x20\x2d\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\x20\
-\x20\x20\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\x20\
-\x20\x20\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\x20\
-\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\x30\x0a\x20\x20\
-\x20\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\
-\x6f\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\
-\x70\x65\x0a\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\x61\x6c\x20\x66\
-\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\x6b\
-\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\
-\x6f\x6e\x20\x72\x65\x66\x72\x65\x73\x68\x49\x6d\x61\x67\x65\x28\
-\x73\x6f\x75\x72\x63\x65\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\
-\x2e\x69\x6d\x61\x67\x65\x2e\x73\x6f\x75\x72\x63\x65\x20\x3d\x20\
-\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x69\x6e\x64\x69\
-\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x2e\x69\x6d\x61\x67\x65\x2e\
-\x73\x6f\x75\x72\x63\x65\x20\x3d\x20\x22\x69\x6d\x61\x67\x65\x3a\
-\x2f\x2f\x71\x72\x43\x6f\x64\x65\x2f\x71\x72\x43\x6f\x64\x65\x2e\
-\x70\x6e\x67\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\
-\x42\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x62\x69\x6e\
-\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\
-\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x69\x6e\x64\x69\
-\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\
-\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\
-\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\x6e\x69\x73\x68\
-\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\
-\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\
-\x70\x75\x70\x2e\x66\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\
-\x43\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\
-\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\x73\x65\x28\
-\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\
-\x7d\x0a\x7d\x0a\
-\x00\x00\x03\x07\
-\x00\
-\x00\x0d\x66\x78\x9c\xed\x56\x5d\x4f\xdb\x30\x14\x7d\x47\xe2\x3f\
-\x58\x7d\xa1\x7d\x89\xd8\x26\xc1\x14\xa9\x0f\x1b\x8c\x0d\x69\x55\
-\x3b\x5a\x06\xaf\xc6\xb9\xa5\xd6\x1c\xdb\xb3\x1d\xda\x6e\xe2\xbf\
-\xcf\xa9\xe3\x26\x69\x9c\x14\x54\x1e\x57\x55\x2a\xdc\x8f\xe3\x7b\
-\xce\xbd\xb9\x0e\x4d\xa5\x50\x06\xfd\x30\x3f\x32\x4a\x7e\xa1\xf7\
-\xd1\xf9\xf1\x11\xad\xd9\xa2\x0b\xc1\x8d\x12\x4c\x5b\xe7\x69\xc3\
-\xf9\x1d\xaf\x45\x66\x34\x7a\x17\xf0\xdd\x51\x9e\x88\xa5\x4b\x3b\
-\x3e\xfa\x24\x25\xa3\x04\x1b\x2a\x78\xe1\xf8\x7b\x7c\x84\xec\x87\
-\x26\x71\x8a\x69\x61\x74\xa6\x27\xaa\xe9\x03\x83\x18\x19\x95\x81\
-\x33\x2d\x69\x62\x16\x31\x3a\xff\x70\xea\xfe\x5f\x00\x7d\x5c\x98\
-\x18\x9d\x7d\xdc\xa0\xe7\xa6\x94\x72\x9a\x66\xe9\xb7\xaa\xa7\x62\
-\xbf\xab\x20\x38\xc7\xdc\x32\x8b\x08\x96\xd4\x60\x46\xff\x6c\x4a\
-\x8b\xd1\x55\x6e\x1c\xd1\x15\x24\x17\x58\x83\x0f\x35\xd4\xe4\xf5\
-\xfc\xd6\x33\xd5\xef\x4d\x81\x60\x26\x0c\x2a\x94\x41\x13\xcc\x81\
-\x59\x09\xce\x7a\x03\x1f\x2f\xf8\x05\x13\x9a\xf2\xc7\xd8\xd3\xdc\
-\x7c\x88\x35\x42\x84\x09\x01\x69\x20\x41\x43\x34\xc7\x4c\x43\x25\
-\xa0\x54\x22\x5a\xd0\x04\xfa\x83\xc2\xf7\xec\x81\xef\xa8\xb2\xa8\
-\x1e\x74\x6b\x9e\x67\x9c\xe4\xf5\xa3\x04\x9e\x28\x01\x5b\x19\x07\
-\x62\x8f\xe8\x2b\xc0\x09\xa8\xd9\x5a\xc2\x20\x4f\x2a\x8f\xd2\xb6\
-\x5b\x0c\x46\xa0\x35\x7e\x84\x89\x90\x99\x8c\x36\xd5\xf5\x07\xd5\
-\x28\x3a\xef\xa3\x12\x02\x0d\x87\x43\x74\x32\xa7\x2a\x5d\x62\x05\
-\x27\x83\x1a\xb7\x1c\x73\x49\x25\xfc\xa4\xb0\x8c\x80\x63\xdb\xc0\
-\xcb\x4d\x31\x37\xc0\xb0\x2d\x65\x86\x1f\xf4\x96\x8f\xab\xdd\xff\
-\x09\x56\x84\x7d\x58\x57\xc5\xa9\x23\x91\xc0\x98\xb3\x75\x37\x6a\
-\x9b\x30\x97\x54\x93\xad\x36\x3b\x8a\x08\x23\x8b\x8e\x46\x0a\x34\
-\x98\xaf\xb7\xd7\x55\x64\x4f\xfb\x56\x26\xf6\xe0\x60\x08\x98\x05\
-\x28\xb0\xa3\x86\x19\x03\x13\x0c\x59\x29\xd9\xe1\x55\x90\x0a\x03\
-\x53\xa2\x00\x78\x2d\xa0\xd2\xb7\xad\x2e\x09\xd5\xad\x22\x77\xf6\
-\xd9\xc2\x4e\xab\xd6\x19\xac\x4c\xdf\x8d\xf6\x84\x81\x9d\x7a\x54\
-\x68\x84\x30\xf2\xb3\xee\xe4\x8b\x7a\x83\x7d\xe0\x42\x02\xf7\x94\
-\x9a\x5d\x30\x42\x8c\x30\x5f\xbb\x9a\xf5\xff\x0e\xec\xed\x00\xac\
-\x30\x31\x6c\x6d\x17\x0a\xbc\x75\x2f\x72\xaf\xab\x62\x13\xdd\x07\
-\xa5\x84\x2a\xf2\x6b\x8f\xf6\x4b\x09\xd4\x00\x5e\x5f\xd8\xb4\x11\
-\x57\x2d\xc2\x5e\x13\x01\xa4\x5d\x08\xdf\x9a\x46\xa6\x77\x94\x66\
-\xcc\xc9\x42\x28\x1d\xcd\x29\x63\x31\x92\x76\xae\xb8\x29\xbd\x24\
-\x53\xb9\xe1\x9a\x27\xb0\xb2\xf7\x10\x7e\xf8\x8c\x55\x54\x35\x56\
-\xa5\x2f\x97\x4c\xeb\x40\xec\xae\xb7\xca\xa8\xbb\xfd\x16\xba\x0d\
-\x9a\x33\xdf\x19\xbb\x33\xfc\x9d\xb1\xe5\x53\xd0\x1a\xf6\x1c\xa4\
-\xd8\xba\xd9\x5f\xc4\xb0\xbc\xd0\xf7\x12\x6c\x86\xb6\xf2\x6b\x86\
-\x86\xe8\xd5\xa3\xba\xd8\x75\xde\x35\x6f\xde\xc9\x57\x10\x7d\x83\
-\x46\x7e\xa9\x61\xef\x92\xc9\x9f\x95\xfa\xe9\x2d\x30\xf7\xfe\xd8\
-\x10\xc2\xb6\xa6\x96\xe4\xf1\x56\xb2\x50\x76\x29\x68\x4b\xfa\x55\
-\x4d\xc9\x10\x44\x5d\xeb\x16\x98\x9b\xca\xaa\x0f\x81\x54\xaf\x82\
-\xe0\x6b\xcb\x58\xe6\x33\xa3\x83\x1c\x9c\xab\xe3\xbd\x44\x58\x6c\
-\x15\xa3\xd9\x66\xb3\xec\xae\x2b\xb7\x6f\xda\xb6\x51\x79\x01\xd5\
-\x17\x92\x8f\xce\x31\x33\x63\x44\x83\x95\xb1\x5b\xda\xbf\xc4\xfa\
-\x39\xe8\x85\x5f\xc9\x5e\x84\x71\x7f\x33\x39\x24\x7d\x3c\x3b\x28\
-\xdd\x35\xf7\x10\x84\xea\x04\x1c\x44\xc4\x75\x3b\x00\x61\x7f\xec\
-\xf7\x1f\x0b\x55\xbd\xca\
+\x20\x69\x64\x3a\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\
+\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\
+\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\
+\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\
+\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\
+\x74\x20\x2d\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\
+\x20\x20\x20\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\
+\x20\x20\x20\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\
+\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\x30\x0a\x20\
+\x20\x20\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\
+\x50\x6f\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\
+\x61\x70\x65\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\
+\x6e\x20\x63\x6c\x65\x61\x72\x41\x6c\x6c\x28\x29\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\x4d\
+\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\x50\x69\x6e\x54\x65\x78\
+\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x20\x3d\x20\x22\x22\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x45\x6e\x74\x72\
+\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\x50\
+\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\
+\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\
+\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x67\x65\x74\x45\x6e\x74\
+\x65\x72\x65\x64\x44\x61\x74\x61\x28\x29\x20\x7b\x0a\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x65\x77\x50\x69\x6e\x3a\
+\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
+\x2e\x6e\x65\x77\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\
+\x2e\x74\x65\x78\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x72\x65\x70\x65\x61\x74\x50\x69\x6e\x3a\x20\x70\x69\x6e\x45\
+\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\
+\x61\x74\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\
+\x65\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\
+\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\x61\x6c\x20\
+\x63\x72\x65\x61\x74\x65\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\
+\x6b\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x50\x69\x6e\x45\x6e\
+\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x70\x69\x6e\x45\x6e\x74\x72\
+\x79\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x2e\x6f\
+\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\
+\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\
+\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x63\x72\x65\x61\x74\x65\x42\x75\
+\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\
+\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\
+\x75\x70\x2e\x63\x72\x65\x61\x74\x65\x42\x75\x74\x74\x6f\x6e\x43\
+\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
 \x00\x00\x02\xc8\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
@@ -1632,40 +225,91 @@ qt_resource_data = b"\
 \x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\
 \x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\
 \x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x01\xe9\
+\x00\x00\x02\x4f\
 \x00\
-\x00\x07\x35\x78\x9c\x95\x54\xcb\x6e\xdb\x30\x10\xbc\xeb\x2b\x88\
-\x5c\x62\x5f\x74\x28\x7a\x0a\xe0\x8b\x53\x24\x30\x50\x03\x49\x8c\
-\x14\xe8\x51\x8f\x95\x4c\x94\x5a\x12\x7c\x14\x09\x0a\xfd\x7b\x29\
-\x59\xa6\x69\x92\x8a\x6d\x9e\x24\xed\xce\xec\xce\x70\x57\xb4\x13\
-\x5c\x6a\xf2\xaa\x5f\x0d\xad\xfe\x90\x6f\xf9\xf7\x2c\x7b\x83\x8e\
-\x6b\xd8\x55\x12\x00\x9f\xb8\xec\xc8\xbf\x2c\x23\xf6\xac\x29\xd6\
-\x14\xdb\x2d\x28\x55\xb4\xf0\xc2\x85\x11\x36\x44\xa6\x43\xeb\x07\
-\x52\xc6\x19\x63\xbc\x3f\x10\x3c\x72\x44\xa8\x34\xe5\xa8\x3c\xa0\
-\x2e\x64\x0b\x3a\x0d\x76\x49\x1c\x9f\x28\x52\xb5\x5f\x1b\xad\x39\
-\x3e\x32\xdb\x2c\xd8\x82\x27\x96\xe1\x74\xbc\xa4\x0c\x5e\xf6\x1c\
-\x61\xea\xf5\x00\x82\x7a\xb1\x74\x89\xbd\xdf\x91\xa2\x2d\x16\x2c\
-\x01\xdc\xd9\xae\xb4\xc3\xcd\xa6\x05\xfc\x71\xde\x3b\x0e\xb2\x6c\
-\x78\x8c\x0b\xc9\x05\x48\xfd\x49\x4a\xce\xd9\xf8\xb6\xf5\x28\xb9\
-\x41\x2b\xa9\x29\x98\x82\x99\xec\x9d\x11\xc3\x75\x41\xfd\x03\xfe\
-\xd2\x0a\x26\x3f\xc1\xa1\x46\x58\x63\x70\xf4\x98\x28\xd0\xdb\xa8\
-\xe3\x0d\x36\x7c\xd1\x05\x55\x97\xc7\x2b\x1e\x4e\xe9\x1c\xd0\x46\
-\xfd\x2a\x98\x81\x9f\x45\x09\x2c\xd7\xf0\xa1\xc9\x8a\x84\xd8\x13\
-\x90\x36\x11\x31\x59\xad\x56\xe4\xfe\x37\xa8\xfb\x65\x70\x57\x43\
-\x15\xaf\xbb\x67\xc9\x8d\x58\xf3\x8f\x1c\xb0\x28\x19\x58\xa0\x67\
-\xc4\xf1\x18\xbc\x8c\xd2\xd2\x9c\x83\x52\x2e\x87\x79\xbd\x7b\x02\
-\x5b\x33\xe8\xd4\xca\xfa\xca\x7b\x2b\x71\x24\x0b\x05\x5e\x27\x32\
-\x6a\xb7\xcf\x6e\x96\x1c\x1b\x35\xa3\xf9\x3c\xf1\x6c\x11\xdc\xd0\
-\xd4\x54\x09\x56\x7c\xfa\xd3\x92\x9a\x0e\x7f\x4b\x73\x09\x8d\x04\
-\xb5\xdf\x74\xf6\x8b\xb7\x69\xa9\x54\x3b\xd1\x38\xa5\x4c\x95\x03\
-\x7d\x87\x05\xcf\xcf\x76\xdc\x31\x5e\xda\xd3\x89\x32\x32\xed\x5a\
-\x52\xb7\xad\x29\x67\xac\x44\xd0\xcf\xef\x9b\xd8\x8f\x5b\xae\xe7\
-\xeb\x51\x0a\x92\x2b\x06\x85\xb4\xff\x98\x16\xa4\x90\x14\xf5\x4c\
-\x67\x6a\x86\x6f\xe1\xcf\xe4\x85\xc2\xe3\x20\xfa\xab\x9c\x9e\xa1\
-\xa9\xc3\xdb\xb7\x39\xb1\x6f\xa1\x8c\x58\xad\x57\xa5\x39\x7d\x8f\
-\xff\x49\x77\x77\x69\x5f\x40\xfb\x74\x1e\xc5\xd5\xcc\x5e\xf0\x58\
-\xa2\xcf\xfe\x03\x1e\x83\x3e\x6c\
-\x00\x00\x03\x7c\
+\x00\x09\x86\x78\x9c\xad\x56\x4d\x73\x9b\x30\x10\xbd\xf3\x2b\x34\
+\xb9\xb4\x3d\x94\x31\x69\x4f\xdc\x6c\x8f\xd3\x78\x26\x4d\x1c\x37\
+\x13\x9f\x55\xd8\xd8\x9a\x0a\x89\x8a\x65\xb0\xa7\xe5\xbf\x57\x80\
+\x21\x08\x24\xc7\x4d\xa2\x83\xc7\xda\x7d\xda\x5d\xbd\xfd\x10\x2c\
+\x49\xa5\x42\x72\x8f\xf7\x39\x8b\x7e\x91\x4b\xff\xab\xc7\x0c\x91\
+\x3f\x97\x02\x95\xe4\x99\x4d\x77\x43\x0f\x32\xc7\x8c\x04\x7e\x10\
+\x78\xde\x5c\xf2\x3c\x11\x8d\x8c\xfc\xf1\x88\x5e\x2c\x0e\x49\xd4\
+\x13\x7b\xb5\x34\x55\x32\x05\x85\x07\x42\x39\xa3\x19\xc9\x00\xe2\
+\x07\xd8\xe3\x54\x01\x0d\x8d\x9d\x0d\x1d\x51\x11\x01\x9f\xe5\x88\
+\x52\x84\xc6\xce\x86\x56\x90\xa1\x54\xd0\xc2\x8d\xad\x0d\x2f\xa0\
+\x58\x31\x51\xf9\xbf\x62\xc0\x75\xf4\x03\x81\xdd\x47\x0a\x14\xcd\
+\x63\x63\x59\x7d\x32\x4b\x69\xc4\xc4\x36\x24\x97\x93\x86\x8a\x6f\
+\x4a\xe6\xe9\x4c\xee\x8f\x7c\xb5\x9c\x35\x5e\x5b\x65\xa7\x6a\x48\
+\xf4\x9f\x18\xe7\x1b\x16\xe3\x2e\x24\xa8\x72\xe8\xd4\xc8\x90\x43\
+\x48\x7e\x67\x0f\xea\xe3\xc5\x42\x20\x28\x42\x2b\x53\x64\xb5\xbc\
+\xfd\x1c\xc9\x18\x2e\x3e\x79\x1d\xd8\x92\xad\x71\x04\x7d\x90\x01\
+\xd1\xb4\xef\xa4\xca\xea\x50\x42\x92\x52\x05\x02\x3d\x03\x71\x43\
+\x7f\x02\x1f\x18\x36\x8d\xd7\x88\x91\x1e\x35\x61\xed\x1d\x6e\x7b\
+\xb1\x87\x3a\xf8\x3e\xae\x34\xdd\x75\x3c\x9f\x74\x69\x66\xc3\xe5\
+\x76\xe0\xa9\x5a\xa0\xaf\xfb\xbd\x8a\xa2\x76\xb4\x14\xa9\x4e\xc3\
+\x8a\x66\x59\x21\x55\xbc\xd0\xba\x3b\xb1\x88\x19\x8e\x8e\x1d\x13\
+\x96\x30\xc1\x92\x3c\x39\xe6\xec\xcb\x64\xe2\x02\xba\x32\x6b\xb9\
+\xf0\x29\x7e\xbb\xea\x7b\x99\xe2\x75\x0d\x35\xaa\xe4\x8d\x4c\x3b\
+\x4a\xdf\x15\xc0\xbb\x93\x7d\x9a\x43\xf3\x5f\x79\xb2\x0b\xab\x51\
+\xf4\x0e\x3d\xa8\xf1\x8a\x14\x94\x73\xc0\x0f\xcd\xb4\xfb\x8f\x3e\
+\xac\xe0\x6f\xe8\xc2\x25\x42\xe2\xc8\x13\xd3\xaa\xc0\x45\xa2\x9e\
+\x6c\x5b\x91\x68\x73\xa1\x1e\xf6\xfe\xb4\xda\x5d\xcf\xa1\xbe\xce\
+\xdf\x4e\xf2\xd8\x48\x5e\x93\x88\x1e\xec\xd8\x1c\xd7\xc0\xb6\x3b\
+\xed\x2e\x70\x77\x47\x42\xf7\x43\xe4\x08\xfa\x23\xd2\x8f\x15\x7f\
+\x64\xba\x9e\xc7\xd7\xee\x48\xed\x40\x56\xc8\xcb\xb4\xb6\x2b\xe2\
+\x2c\x75\xdc\xae\x5a\xed\x3b\xe6\x08\xa5\x0b\x67\xf8\xe4\xd9\x56\
+\xa1\x68\xfa\xdc\x14\xfe\x46\x6f\xa7\xb8\xd1\x1d\x31\x93\xb9\x88\
+\xa9\x3a\xdc\xa9\xa9\x38\x14\x3b\x50\xf6\x58\xce\x08\xb7\x1c\x49\
+\xcb\x73\xba\x67\x2d\x8b\x51\xf9\xd6\x83\xa0\x95\x0f\x7b\xe7\x55\
+\xc5\xe5\x28\xaa\x4e\xdf\xbc\xe9\x96\x0e\x1a\x7d\x22\xb4\xab\x3f\
+\x85\xe6\x35\xa8\x37\x8b\xca\x33\x2c\x8f\xbf\x26\x6c\xa6\xd7\x0d\
+\xea\x38\x01\x0c\x17\xcd\x6f\xe9\xfd\x03\x2b\x53\x8d\x49\
+\x00\x00\x02\x54\
+\x00\
+\x00\x09\x96\x78\x9c\xad\x56\x4b\x73\xdb\x20\x10\xbe\xeb\x57\x30\
+\xb9\xa4\x3d\x54\x63\xa7\x3d\xe9\x66\x7b\x9c\xc6\x33\x69\xe2\xb8\
+\x99\xb8\x57\x2a\x6d\x6d\xa6\x08\x54\x40\x23\x7b\x5a\xfd\xf7\xa2\
+\x67\x85\x00\xc7\x4d\xc2\xc1\x63\x76\x3f\xf6\xf1\x2d\xbb\x88\xa4\
+\x19\x17\x0a\x3d\xa8\x87\x9c\xc4\x3f\xd1\x55\xf8\x29\x20\x86\x28\
+\x5c\x70\xa6\x04\xa7\xd2\xa5\xbb\xc5\x47\x9e\x2b\x89\xa6\xe1\x74\
+\x1a\x04\x0b\x4e\xf3\x94\x35\x32\xf4\x3b\x40\x7a\x91\x24\x42\xf1\
+\x40\x1c\xd4\xd2\x4c\xf0\x0c\x84\x3a\x22\x4c\x09\x96\x48\x42\x2c\
+\x40\x3d\xc2\x41\xcd\x04\xe0\x68\xb4\x77\x9d\x88\x31\x8b\x81\xce\
+\x73\xa5\x38\x8b\x8c\x9d\x0b\x2d\x40\x2a\x2e\xa0\x83\x1b\x5b\x17\
+\x9e\x41\xb1\x26\xac\xf2\x7f\x4d\x80\xea\x0c\x46\x02\xb7\x8f\x0c\
+\xb0\x32\x8f\xd9\xb2\xfa\xa4\xcc\x70\x4c\xd8\x2e\x42\x57\x93\x86\
+\x8e\xcf\x82\xe7\xd9\x9c\x1f\x5a\xce\x3a\xde\x1a\xaf\x9d\xb2\x57\
+\x35\x44\x86\x3f\x08\xa5\x5b\x92\xa8\x7d\x84\x94\xc8\xa1\x57\x2b\
+\xa2\x28\x44\xe8\x97\x7c\x14\xef\x2e\x96\x4c\x81\x40\xb8\x32\x85\
+\xd6\xab\xbb\x0f\x31\x4f\xe0\xe2\x7d\xd0\x83\x1d\x15\xb3\x23\x18\
+\x82\x0c\x88\xa6\x7d\xcf\x85\xac\x43\x89\x50\x86\x05\x30\x15\x18\
+\x88\x5b\xfc\x1d\xe8\xc8\xb0\x69\xbc\x46\x58\x7a\xa5\x09\xeb\x72\
+\xb8\x1b\xc4\x1e\xe9\xe0\x87\xb8\xd2\x74\xd7\xf3\x7c\xd2\xa5\x59\
+\x0d\x9f\xdb\x91\xa7\x6a\x81\x4e\xf7\x4b\x15\x45\xed\x68\xc5\x32\
+\x5d\x86\x35\x96\xb2\xe0\x22\x59\x6a\xdd\x3d\x5b\x26\x44\x59\xc7\
+\xda\x82\xa5\x84\x91\x34\x4f\xdb\x9a\x7d\x9c\x4c\x7c\x40\x5f\x65\
+\x1d\x09\x9f\xe2\xb7\xbf\x7d\xcf\x53\xbc\xa9\xa1\xc6\x2d\x79\x25\
+\xd3\x9e\xab\xef\x0b\xe0\xcd\xc9\x3e\xcd\xa1\xf9\xaf\x3c\xd9\x85\
+\xcd\x30\x7a\x83\x2e\xd4\x78\x81\x0a\x4c\x29\xa8\x4b\x89\xbe\x6d\
+\xd6\xad\xe9\xff\xe8\xc7\xe6\xc0\x2b\xfa\x71\xa5\x20\xf5\x54\x8c\
+\x68\xd5\xd4\x47\xa7\x9e\x71\x3b\x96\x6a\x73\x91\x1e\xfd\xe1\xac\
+\xda\xdd\x2c\xa0\x4e\xeb\x4f\x2f\x79\x6a\x24\x2f\x29\xc9\x00\xd6\
+\xb6\xc9\x0d\x90\xdd\x5e\xbb\x9b\xfa\xfb\x24\xc5\x87\x31\xd2\x82\
+\x7e\x8d\xf5\xd3\x45\x9f\x88\xbe\xd9\x76\xda\x3d\xad\x3d\xc8\x09\
+\x79\x9e\xd6\x6e\xc5\x94\x64\x9e\xec\xaa\xd5\xbd\x68\x9e\x50\xfa\
+\x70\xec\xe7\xcf\xb5\x0a\x81\xb3\x7f\x0d\x12\x6e\xf5\x76\xa6\xb6\
+\xba\x3b\xe6\x3c\x67\x09\x16\xc7\x7b\x31\x63\xc7\x62\x0f\xc2\x1d\
+\xcd\x19\x01\x97\x96\xb4\x3c\xa7\x93\x36\xbc\xb0\xae\x70\x3d\x14\
+\x3a\xf9\xb8\x8b\x5e\x74\xbd\x3c\xd7\xaa\xd7\x37\xef\xbb\xa3\x8b\
+\xac\xcf\x85\x6e\x0d\x27\xd2\xa2\x06\x0d\xe6\x52\x79\x86\x65\xfb\
+\xcb\xc2\x65\x7a\xd3\xa0\xda\x59\x60\xb8\x68\x7e\xcb\xe0\x2f\xdd\
+\xf5\x93\xc1\
+\x00\x00\x00\x30\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0d\x0a\x0d\x0a\x53\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\
+\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0d\x0a\x0d\x0a\x7d\x0d\x0a\
+\x00\x00\x02\x7c\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
 \x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
@@ -1674,158 +318,111 @@ qt_resource_data = b"\
 \x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
 \x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
 \x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\
-\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\
-\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\
-\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\
-\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\
-\x74\x20\x2d\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\
-\x20\x20\x20\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\
-\x20\x20\x20\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\
-\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\x30\x0a\x20\
-\x20\x20\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\
-\x50\x6f\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\
-\x61\x70\x65\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\
-\x6e\x20\x63\x6c\x65\x61\x72\x41\x6c\x6c\x28\x29\x20\x7b\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\x4d\
-\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\x50\x69\x6e\x54\x65\x78\
-\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x20\x3d\x20\x22\x22\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x45\x6e\x74\x72\
-\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\x50\
-\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\
-\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\
-\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x67\x65\x74\x45\x6e\x74\
-\x65\x72\x65\x64\x44\x61\x74\x61\x28\x29\x20\x7b\x0a\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x65\x77\x50\x69\x6e\x3a\
-\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
-\x2e\x6e\x65\x77\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\
-\x2e\x74\x65\x78\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x72\x65\x70\x65\x61\x74\x50\x69\x6e\x3a\x20\x70\x69\x6e\x45\
-\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\
-\x61\x74\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\
-\x65\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\
-\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\x61\x6c\x20\
-\x63\x72\x65\x61\x74\x65\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\
-\x6b\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x50\x69\x6e\x45\x6e\
-\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x70\x69\x6e\x45\x6e\x74\x72\
-\x79\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x2e\x6f\
-\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x45\x6e\x74\x72\x79\
-\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\
-\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x63\x72\x65\x61\x74\x65\x42\x75\
-\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\
-\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\
-\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\
-\x75\x70\x2e\x63\x72\x65\x61\x74\x65\x42\x75\x74\x74\x6f\x6e\x43\
-\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x69\x64\x3a\x20\x79\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\
+\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\x20\x28\x70\
+\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\x20\x77\x69\
+\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x79\x3a\x20\
+\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\
+\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\
+\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\
+\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\
+\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\
+\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\
+\x65\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\
+\x73\x65\x74\x59\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x54\
+\x65\x78\x74\x28\x74\x65\x78\x74\x29\x20\x7b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x79\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\
+\x2e\x6c\x61\x62\x65\x6c\x2e\x74\x65\x78\x74\x20\x3d\x20\x74\x65\
+\x78\x74\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x73\x69\
+\x67\x6e\x61\x6c\x20\x79\x65\x73\x42\x75\x74\x74\x6f\x6e\x43\x6c\
+\x69\x63\x6b\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x59\x65\x73\
+\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x69\x64\x3a\x20\x79\x65\x73\x4e\x6f\x4d\x65\x73\
+\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x79\x65\
+\x73\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\
+\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x79\x65\x73\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\x6b\x65\
+\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x79\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\
+\x70\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x6f\x42\
+\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\
+\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x79\
+\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
+\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\
 \x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x03\x75\
-\x00\
-\x00\x1a\xb1\x78\x9c\xed\x58\x5d\x6f\xd3\x30\x14\x7d\xaf\xd4\xff\
-\x60\xf5\x09\x5e\xaa\x2d\x0c\x21\xe5\x8d\xb5\x14\x2a\x0d\xa4\xd1\
-\x6d\x3c\x7b\xa9\xdb\x5a\x73\xe2\x60\x3b\xfb\x00\xf6\xdf\xb1\x93\
-\x38\x4d\xe2\x8f\x26\xac\x15\x0c\xed\x6a\xd2\x6a\xfb\xde\x9b\xe3\
-\x73\x6d\xe7\xc4\x38\x4e\x29\x13\xe0\x5c\x9c\x67\x38\xba\x01\xc1\
-\xf8\x64\x38\xc0\x8d\xbe\xf1\x84\x26\x82\x51\xc2\xe5\xe0\xb1\x31\
-\x78\x06\x1f\x68\x26\x38\x38\x1e\xbf\x19\x0e\x86\x83\xb9\x40\x31\
-\xf8\x39\x1c\x00\x69\x78\x19\x82\x18\xe2\x44\xf5\x15\x3d\x29\xa3\
-\x29\x62\xe2\x01\x40\x82\x21\x07\x2b\x4c\xd0\xe2\x81\xcb\xe1\x2b\
-\x48\x32\x74\x06\xaf\x11\x09\xad\xbd\x8e\x70\x16\xdf\x41\x86\xae\
-\x10\xe3\x98\x26\xcd\x1c\x8e\x21\x6b\xa2\x25\xba\xc5\x11\x9a\x4f\
-\xeb\x19\xcc\x3e\x6b\xe8\x35\xa5\x82\x50\xb8\x44\xcc\x82\xc2\x33\
-\xd8\x11\x47\x60\x03\x12\xf4\x63\x23\xf0\xd0\xe1\x4a\x65\x56\x20\
-\xb0\x17\xc6\x9e\xc0\x33\xf1\xc0\x4b\x8b\x3d\x1d\x62\x90\xa3\xd9\
-\x62\xb2\x41\xd1\xcd\x29\xbd\x0f\xdb\x1d\xd6\x20\x8e\x08\x8a\xc4\
-\xac\x9c\xf9\x3c\x86\x6b\x74\x9a\x09\x41\x93\xd0\x3d\x64\x67\x83\
-\x40\xbe\xd1\xce\x3a\x85\xa5\xd3\x81\x82\x61\x48\xbe\x64\xf1\xb5\
-\x9c\x6d\x6d\x69\xd8\xfb\xd5\x0e\x52\x49\x26\x94\x64\x71\x52\x6c\
-\x2d\xbd\x9b\xea\x3b\xaa\x3e\xbe\x1d\x85\x49\xb4\xa1\x8c\x8f\x19\
-\x5e\x6f\x44\x08\x52\x89\x2c\x11\x45\xcb\xe1\xf4\x19\xb2\x35\x96\
-\xb3\x39\x7e\x77\x64\x7a\x10\xb4\xda\x66\x51\x0d\xbb\x8b\x37\xc7\
-\xad\xa4\x02\x47\x90\x4c\x64\x0e\xc4\xaa\x6c\xcd\xee\x6d\x18\x4f\
-\x61\x84\x93\x75\x08\x82\x23\x4d\x85\xb2\x8f\x8c\x66\xa9\xac\x73\
-\x9d\x0a\x4d\x47\xb9\x3d\x92\x15\xd5\x5e\x4d\x1f\x81\x05\x41\x21\
-\x18\x4d\x73\x3f\x80\xa5\xe3\xa8\xe9\x51\xd0\x38\x96\xab\x9b\x7c\
-\xc3\x4b\xb1\x09\x81\x60\x19\xaa\x3f\xbf\xc0\x80\x97\x66\x41\x5c\
-\x48\xb4\xaf\xe9\xa9\x99\x51\x8f\xd3\x7c\x98\x5e\x8c\xde\xf1\x10\
-\xbc\x35\x07\xa2\xbc\xf2\x72\x2c\x68\x03\x2c\xa6\x22\x17\x91\x0d\
-\x5f\x0b\xe3\xf4\x02\xdd\x8b\xda\x39\xd4\x36\x21\x87\x43\xf0\x9d\
-\x5f\xb0\x57\x9a\xb8\xf9\x34\x1c\xbd\x36\xbd\x1f\x9f\x04\xa3\x7d\
-\x1e\xfa\x70\xd8\x9e\xae\x4c\xb2\x89\x7f\xc8\x37\x14\x24\xef\x09\
-\x5e\x27\xb1\xe4\x33\x04\x6a\x7e\xe3\xbc\xfd\xa9\xbd\xc6\x9a\x40\
-\xed\xa5\xdf\xcf\x2c\xeb\x7b\xbc\x07\xe1\x8b\x3c\x0c\x24\x79\xdc\
-\x1e\x49\x77\x1d\x39\xbb\xf0\x3c\x3f\xe2\x5b\xaf\xbb\x1e\xdc\xeb\
-\x13\x1d\xdc\x16\xa1\x7b\xa4\x7f\x87\x24\xf1\xa1\x7a\x8e\x15\xd0\
-\x52\xa1\x17\xf9\x04\x01\x9e\x47\x1d\x84\x7f\x97\xac\xf4\x61\x7a\
-\x7e\xd4\x1b\xea\xaa\x47\x05\x4e\xab\xd8\x03\x14\x60\xa7\x1a\xf6\
-\x21\xfb\xcb\x75\x70\x34\x1f\xbb\xaa\x94\x2c\x5d\x42\x81\xf4\xe9\
-\x62\x57\x2a\x5d\xe0\x94\x6a\xa6\xe0\xe4\x32\x4f\x5a\x1d\x2c\x8a\
-\xa2\xa6\xb7\x4b\x46\xba\x91\xd9\x85\xa5\x36\xbb\x76\x31\xfd\x5c\
-\x4c\xd4\x9f\xbb\xaa\xab\x6f\xb7\x7c\xeb\x43\x8e\x95\xa4\xea\x44\
-\xc7\xea\x41\x85\xfe\x33\x88\xda\x02\xf7\x89\xbc\x1d\xf0\xdd\x9a\
-\x4f\x5b\x37\xed\xa7\xad\xd0\x80\x27\x6e\x07\xbf\x16\xd4\xe6\xdd\
-\x97\xf5\x29\x19\xda\x30\xf0\xc7\x74\x17\x89\xda\xac\xe7\xc6\x1f\
-\xe3\x34\xbe\x1a\xbb\x00\xf5\xc1\x53\xf6\x94\xf3\x64\x3b\x93\xee\
-\x6b\x55\xd9\x7e\x68\x71\x89\x9e\x1e\xe4\x74\x52\x3f\x07\x45\xfd\
-\x52\xd3\xca\x1c\x32\xaa\x57\x39\xbb\xe9\xa9\x43\x61\x7e\x29\x66\
-\x65\x7e\x61\xd6\x83\x9e\x8e\x0a\xed\xc0\xc8\xff\xa7\xca\x76\xec\
-\xb6\x32\x39\x63\x30\x46\x3e\x95\x53\x5e\x54\xe6\x7e\xfd\x84\x8d\
-\xdd\x5b\xdf\x78\xee\x92\x27\xd6\x0b\x52\x9b\xd5\x0b\xf4\x41\x05\
-\xe5\xfb\xb7\x3c\x35\x7c\x15\xeb\xc3\x74\x57\x3a\x8b\x7b\x54\xff\
-\x1d\x86\xf7\xe6\xd6\x37\xbb\x45\x1e\x5a\xbd\x70\x0a\x3d\xe8\x9a\
-\x61\x39\x3b\xb8\x5d\x88\xe7\xe5\x32\xfc\xaa\xee\x4d\xc1\xaf\xaa\
-\x7d\x75\xb0\x2f\xbd\xdd\x6c\x38\x2f\xa1\x7d\x3c\xcc\x54\x10\x48\
-\xd0\x5d\xe3\xc3\xe1\xdf\x20\xc1\xd1\x2c\x7f\xca\x7f\xf2\xef\x37\
-\x11\x87\x95\x49\
-\x00\x00\x00\x35\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x44\x69\x73\x70\x6c\x61\x79\x58\x72\x70\x53\x65\x63\
-\x72\x65\x74\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\
-\x0a\x0a\x7d\x0a\
-\x00\x00\x02\x47\
+\x00\x00\x04\x60\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0d\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\
-\x6b\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0d\x0a\
-\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\
-\x61\x79\x6f\x75\x74\x73\x20\x31\x2e\x33\x0d\x0a\x0d\x0a\x43\x6f\
-\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0d\x0a\x20\x20\
-\x20\x20\x69\x64\x3a\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\
-\x75\x74\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\
-\x20\x61\x6c\x69\x61\x73\x20\x62\x75\x74\x74\x6f\x6e\x3a\x20\x62\
-\x75\x74\x74\x6f\x6e\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\
-\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x6c\x61\x62\x65\x6c\x3a\
-\x20\x6c\x61\x62\x65\x6c\x0d\x0a\x20\x20\x20\x20\x73\x70\x61\x63\
-\x69\x6e\x67\x3a\x20\x32\x30\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x4c\
-\x61\x62\x65\x6c\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x6c\x61\x62\x65\x6c\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x22\
-\x29\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2e\
-\x70\x6f\x69\x6e\x74\x53\x69\x7a\x65\x3a\x20\x31\x34\x0d\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x76\x65\x72\x74\x69\x63\x61\x6c\x41\
-\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x54\x65\x78\x74\x2e\x41\
-\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x68\x6f\x72\x69\x7a\x6f\x6e\x74\x61\x6c\x41\
-\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x54\x65\x78\x74\x2e\x41\
-\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\x67\
-\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x48\
-\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\x67\
-\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\x20\x7d\x0d\
-\x0a\x0d\x0a\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x62\x75\x74\
-\x74\x6f\x6e\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\
-\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x4f\x4b\x22\x29\x0d\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\
-\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\
-\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\
-\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\x20\
-\x7d\x0d\x0a\x7d\x0d\x0a\
+\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
+\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
+\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
+\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
+\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x0a\x20\
+\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\
+\x73\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x3a\x20\x6f\x6b\x42\x75\
+\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\
+\x79\x20\x61\x6c\x69\x61\x73\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\
+\x61\x62\x65\x6c\x3a\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\x61\x62\
+\x65\x6c\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\
+\x61\x6c\x69\x61\x73\x20\x73\x65\x63\x72\x65\x74\x54\x65\x78\x74\
+\x41\x72\x65\x61\x3a\x20\x73\x65\x63\x72\x65\x74\x54\x65\x78\x74\
+\x41\x72\x65\x61\x0a\x20\x20\x20\x20\x73\x70\x61\x63\x69\x6e\x67\
+\x3a\x20\x32\x30\x0a\x0a\x20\x20\x20\x20\x4c\x61\x62\x65\x6c\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x77\x61\
+\x72\x6e\x69\x6e\x67\x4c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x3c\
+\x62\x3e\x59\x6f\x75\x72\x20\x6e\x65\x77\x20\x77\x61\x6c\x6c\x65\
+\x74\x27\x73\x20\x58\x52\x50\x20\x73\x65\x63\x72\x65\x74\x20\x69\
+\x73\x20\x77\x72\x69\x74\x74\x65\x6e\x20\x62\x65\x6c\x6f\x77\x2e\
+\x20\x50\x6c\x65\x61\x73\x65\x20\x73\x61\x76\x65\x20\x69\x74\x20\
+\x69\x6e\x20\x61\x20\x73\x61\x66\x65\x20\x70\x6c\x61\x63\x65\x2c\
+\x20\x73\x6f\x20\x79\x6f\x75\x20\x77\x6f\x75\x6c\x64\x20\x62\x65\
+\x20\x61\x62\x6c\x65\x20\x74\x6f\x20\x72\x65\x73\x74\x6f\x72\x65\
+\x20\x79\x6f\x75\x72\x20\x77\x61\x6c\x6c\x65\x74\x20\x69\x6e\x20\
+\x63\x61\x73\x65\x20\x79\x6f\x75\x72\x20\x53\x65\x63\x61\x6c\x6f\
+\x74\x20\x64\x65\x76\x69\x63\x65\x20\x67\x65\x74\x73\x20\x73\x74\
+\x6f\x6c\x65\x6e\x20\x6f\x72\x20\x64\x61\x6d\x61\x67\x65\x64\x2e\
+\x0a\x3c\x62\x72\x3e\x50\x6c\x65\x61\x73\x65\x20\x6e\x6f\x74\x65\
+\x20\x74\x68\x61\x74\x3a\x0a\x3c\x62\x72\x3e\x31\x2e\x20\x41\x6e\
+\x79\x62\x6f\x64\x79\x20\x67\x65\x74\x74\x69\x6e\x67\x20\x61\x63\
+\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\x75\x72\x20\x58\x52\x50\
+\x20\x73\x65\x63\x72\x65\x74\x20\x77\x6f\x75\x6c\x64\x20\x68\x61\
+\x76\x65\x20\x61\x63\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\x75\
+\x20\x77\x61\x6c\x6c\x65\x74\x20\x61\x6e\x64\x20\x65\x76\x65\x72\
+\x79\x74\x68\x69\x6e\x67\x20\x6f\x6e\x20\x69\x74\x2e\x0a\x3c\x62\
+\x72\x3e\x32\x2e\x20\x49\x74\x20\x69\x73\x20\x73\x61\x66\x65\x72\
+\x20\x74\x6f\x20\x73\x74\x6f\x72\x65\x20\x79\x6f\x75\x72\x20\x58\
+\x52\x50\x20\x73\x65\x63\x72\x65\x74\x20\x69\x6e\x20\x61\x20\x6e\
+\x6f\x6e\x2d\x65\x6c\x65\x63\x74\x72\x6f\x6e\x69\x63\x20\x66\x6f\
+\x72\x6d\x2c\x20\x66\x6f\x72\x20\x65\x78\x61\x6d\x70\x6c\x65\x20\
+\x6f\x6e\x20\x70\x61\x70\x65\x72\x2e\x3c\x2f\x62\x3e\x22\x29\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x6d\
+\x61\x78\x69\x6d\x75\x6d\x57\x69\x64\x74\x68\x3a\x20\x34\x30\x30\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\
+\x65\x3a\x20\x54\x65\x78\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x46\x6f\x72\
+\x6d\x61\x74\x3a\x20\x54\x65\x78\x74\x2e\x52\x69\x63\x68\x54\x65\
+\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\
+\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\
+\x65\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x54\x65\x78\
+\x74\x41\x72\x65\x61\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x69\x64\x3a\x20\x73\x65\x63\x72\x65\x74\x54\x65\x78\x74\x41\x72\
+\x65\x61\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\
+\x20\x71\x73\x54\x72\x28\x22\x22\x29\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\
+\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x77\x72\x61\x70\x4d\x6f\x64\x65\x3a\x20\x54\x65\x78\x74\x2e\
+\x57\x6f\x72\x64\x57\x72\x61\x70\x0a\x20\x20\x20\x20\x7d\x0a\x0a\
+\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x6f\x6b\x42\x75\x74\x74\x6f\
+\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\
+\x71\x73\x54\x72\x28\x22\x4f\x4b\x22\x29\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\x67\x6e\x6d\
+\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x48\x43\x65\
+\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x56\
+\x43\x65\x6e\x74\x65\x72\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
 \x00\x00\x02\x46\
 \x00\
 \x00\x0b\x85\x78\x9c\xcd\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
@@ -1865,66 +462,319 @@ qt_resource_data = b"\
 \xee\x91\xb0\xd3\xca\xe7\x0a\x7d\x5c\xb5\x78\x15\xff\x0b\xbd\x4c\
 \xfd\x7f\x1a\x5a\x57\x31\x21\xc2\xfe\x6b\xcd\xd4\xbf\x4e\x3b\xbf\
 \x01\xb6\xb2\x2a\x9a\
-\x00\x00\x00\x34\
+\x00\x00\x02\xf5\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x50\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\
-\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0a\
-\x0a\x7d\x0a\
+\x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0a\x69\x6d\
+\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
+\x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
+\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
+\x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
+\x20\x69\x64\x3a\x20\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\
+\x61\x67\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\x20\
+\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\x20\
+\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x79\
+\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\x74\
+\x20\x2d\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\x20\
+\x20\x20\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\x20\
+\x20\x20\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\x20\
+\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\x30\x0a\x20\x20\
+\x20\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\
+\x6f\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\
+\x70\x65\x0a\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\x61\x6c\x20\x66\
+\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\x6b\
+\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\
+\x6f\x6e\x20\x72\x65\x66\x72\x65\x73\x68\x49\x6d\x61\x67\x65\x28\
+\x73\x6f\x75\x72\x63\x65\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\
+\x2e\x69\x6d\x61\x67\x65\x2e\x73\x6f\x75\x72\x63\x65\x20\x3d\x20\
+\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x69\x6e\x64\x69\
+\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x2e\x69\x6d\x61\x67\x65\x2e\
+\x73\x6f\x75\x72\x63\x65\x20\x3d\x20\x22\x69\x6d\x61\x67\x65\x3a\
+\x2f\x2f\x71\x72\x43\x6f\x64\x65\x2f\x71\x72\x43\x6f\x64\x65\x2e\
+\x70\x6e\x67\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\
+\x42\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x62\x69\x6e\
+\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\
+\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x69\x6e\x64\x69\
+\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\
+\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\
+\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\x6e\x69\x73\x68\
+\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\
+\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\
+\x70\x75\x70\x2e\x66\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\
+\x43\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x62\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\
+\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\x73\x65\x28\
+\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\
+\x7d\x0a\x7d\x0a\
+\x00\x00\x03\xfd\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
+\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
+\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
+\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
+\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x20\x20\
+\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\
+\x20\x66\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\x3a\x20\x66\
+\x69\x6e\x69\x73\x68\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\
+\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x63\
+\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x3a\x20\x63\x61\x6e\
+\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\
+\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x69\x6d\x61\
+\x67\x65\x3a\x20\x69\x6d\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\x73\
+\x70\x61\x63\x69\x6e\x67\x3a\x20\x32\x30\x0a\x0a\x20\x20\x20\x20\
+\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x69\x64\x3a\x20\x69\x6e\x73\x74\x72\x75\x63\x74\x69\x6f\x6e\x73\
+\x4c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\
+\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x3c\x62\x3e\x50\x6c\x65\
+\x61\x73\x65\x20\x73\x63\x61\x6e\x20\x74\x68\x65\x20\x51\x52\x20\
+\x63\x6f\x64\x65\x20\x64\x69\x73\x70\x6c\x61\x79\x65\x64\x20\x62\
+\x65\x6c\x6f\x77\x20\x75\x73\x69\x6e\x67\x20\x53\x65\x63\x61\x6c\
+\x6f\x74\x20\x52\x65\x6d\x6f\x74\x65\x53\x63\x72\x65\x65\x6e\x20\
+\x61\x70\x70\x20\x6f\x6e\x20\x79\x6f\x75\x72\x20\x6d\x6f\x62\x69\
+\x6c\x65\x20\x70\x68\x6f\x6e\x65\x2e\x3c\x2f\x62\x3e\x22\x29\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x6d\
+\x61\x78\x69\x6d\x75\x6d\x57\x69\x64\x74\x68\x3a\x20\x34\x30\x30\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\
+\x65\x3a\x20\x54\x65\x78\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x46\x6f\x72\
+\x6d\x61\x74\x3a\x20\x54\x65\x78\x74\x2e\x52\x69\x63\x68\x54\x65\
+\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\
+\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\
+\x65\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x49\x6d\x61\
+\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\
+\x6f\x75\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\
+\x72\x75\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\
+\x69\x6d\x61\x67\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\
+\x6c\x6c\x4d\x6f\x64\x65\x3a\x20\x49\x6d\x61\x67\x65\x2e\x50\x72\
+\x65\x73\x65\x72\x76\x65\x41\x73\x70\x65\x63\x74\x46\x69\x74\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x73\x6f\x75\x72\x63\x65\x3a\x20\
+\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x61\x63\x68\x65\
+\x3a\x20\x66\x61\x6c\x73\x65\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\
+\x20\x20\x20\x52\x6f\x77\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x72\x6f\x77\x4c\x61\
+\x79\x6f\x75\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\
+\x6f\x75\x74\x2e\x61\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\
+\x74\x2e\x41\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\
+\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\
+\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\
+\x3a\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\
+\x20\x71\x73\x54\x72\x28\x22\x43\x61\x6e\x63\x65\x6c\x22\x29\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x66\x69\x6e\x69\
+\x73\x68\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\
+\x22\x46\x69\x6e\x69\x73\x68\x22\x29\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
+\x00\x00\x01\xaa\
+\x00\
+\x00\x06\x7d\x78\x9c\xa5\x54\x4d\x4f\xc3\x30\x0c\xbd\x4f\xda\x7f\
+\xf0\xb1\x93\x20\x7c\x5c\x90\x26\x71\x80\x21\x4e\x03\x01\x02\x71\
+\xce\x5a\x6f\x8d\xc8\xe2\xd2\x38\x6c\x13\xda\x7f\x27\x6d\x57\xc8\
+\x58\x27\x32\x91\x43\x13\xc5\xef\x3d\x3b\xcf\xaa\xd5\xbc\xa0\x92\
+\xe1\x91\x1f\x9d\x4a\xdf\xe0\x5c\x5c\xf4\x7b\x6a\xeb\x4e\x8c\xc8\
+\x70\x49\xda\xfa\xe0\xe9\x4e\x70\x2c\x57\xe4\xd8\xc2\x59\x47\xec\
+\x55\x99\x8c\x16\x0d\xad\xdf\x7b\xa0\xc2\x15\xf0\x59\x1d\xc1\x2f\
+\x95\x0d\x61\xaa\xca\xf9\x42\x96\x78\x87\xd6\xca\x19\xd6\x88\x36\
+\x3e\x75\x26\x65\x45\x06\x6c\x4e\x8b\x1b\x32\x78\xed\x98\xc9\x24\
+\x83\x4a\x02\x36\xab\x15\x78\x29\x32\xc9\xad\x8c\x98\xd4\x48\xf1\
+\xa1\xac\x9a\x68\x84\x4b\xe0\xd2\x61\x43\x5a\xef\xc8\xe7\x2a\xc3\
+\x7f\xca\x4f\xa5\xb6\x7b\xf5\x2d\xf2\x6d\x97\xcc\x33\x2e\x39\x61\
+\xff\x89\xc8\xa8\xe5\x04\xb5\xa8\xc0\xd5\x63\xfc\xb6\x37\x99\xf7\
+\x6a\x24\x4d\x8a\x3a\xfe\x39\x69\x80\x17\x68\xa4\x7f\x53\xb6\xe5\
+\x59\x24\x35\xde\xee\x7f\x55\x18\x6f\xfb\x43\x49\xb3\xd2\x4b\x24\
+\x1f\x52\x3b\x3c\x82\x48\xb3\x8b\x0d\xed\x5a\x96\xa2\x66\xfa\x54\
+\xf5\x7e\x10\xb1\xc3\x8c\xbf\x99\xe3\xee\x3e\xc7\x12\xe3\x3b\xf0\
+\x6d\xcd\xa1\x7e\x74\x99\x7f\x78\x79\x5d\x9d\xb3\x6a\x66\xa4\x86\
+\xa6\xd7\x4f\xf8\xee\xd0\x32\x66\xc9\xa0\x8d\x2f\x87\x90\x14\x3e\
+\x83\x61\xb1\x50\x19\xe7\x70\x0c\xf5\x3e\x80\x13\x38\x6f\x20\xab\
+\x1f\x48\x8e\x6a\x96\xb3\xc7\x34\x87\x0d\xa8\x81\xcd\x29\x93\x7a\
+\x18\x78\x34\xa5\xd4\xd9\xf0\x22\xd5\x64\xfd\x34\xd2\x2a\xf5\x92\
+\xf5\x54\x12\xf7\x74\xe5\x98\x46\x55\xa0\xd5\xe9\xfc\xad\x43\x3f\
+\xc3\x11\xb7\x05\x6a\x15\xaa\xb5\x99\x26\x64\x46\x3e\xdd\x1b\x7a\
+\x4a\xa0\x10\x5a\x1b\x0e\x49\x51\x57\x58\x99\xd3\xa2\xd6\xa1\xe6\
+\xd6\x0f\xf3\xb7\x72\xd4\x3c\xf8\xd5\xf0\xfd\x95\xed\x36\x70\xa7\
+\xc6\xfa\xe0\x3f\x5f\x39\x64\x06\xd7\
+\x00\x00\x04\x2e\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0a\x69\x6d\
+\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
+\x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
+\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
+\x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
+\x20\x69\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\
+\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
+\x0a\x20\x20\x20\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\
+\x77\x69\x64\x74\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\
+\x20\x32\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\
+\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\
+\x74\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x6d\x6f\x64\x61\x6c\
+\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\x66\x6f\x63\x75\x73\
+\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\
+\x6e\x67\x3a\x32\x30\x0a\x20\x20\x20\x20\x63\x6c\x6f\x73\x65\x50\
+\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\x75\x70\x2e\x43\x6c\x6f\
+\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\x65\x0a\x0a\x20\x20\x20\x20\
+\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x63\x6c\x65\x61\x72\x41\x6c\
+\x6c\x28\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\
+\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\
+\x73\x61\x67\x65\x2e\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\
+\x61\x2e\x74\x65\x78\x74\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\
+\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\x50\x69\
+\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x20\
+\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\
+\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\
+\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\x50\x69\x6e\x54\x65\x78\
+\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x20\x3d\x20\x22\x22\
+\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\
+\x74\x69\x6f\x6e\x20\x67\x65\x74\x45\x6e\x74\x65\x72\x65\x64\x44\
+\x61\x74\x61\x28\x29\x20\x7b\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x73\x65\x65\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\
+\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
+\x2e\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\
+\x78\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x65\
+\x77\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\
+\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\
+\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\
+\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x72\x65\x70\
+\x65\x61\x74\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\
+\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\
+\x65\x70\x65\x61\x74\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\
+\x64\x2e\x74\x65\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\
+\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\
+\x61\x6c\x20\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\
+\x43\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x50\
+\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\
+\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x69\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\
+\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\
+\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\
+\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
+\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\x2e\x6f\
+\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\
+\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\
+\x70\x75\x70\x2e\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\
+\x6e\x43\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
+\x00\x00\x00\xf6\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0d\x0a\x0d\x0a\x4f\x70\x74\x69\x6f\x6e\x73\x46\x6f\x72\x6d\
+\x20\x7b\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\
+\x6f\x6e\x20\x73\x65\x74\x43\x68\x65\x63\x6b\x62\x6f\x78\x53\x74\
+\x61\x74\x65\x28\x73\x74\x61\x74\x65\x29\x20\x7b\x0d\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x2e\x63\
+\x68\x65\x63\x6b\x65\x64\x20\x3d\x20\x73\x74\x61\x74\x65\x0d\x0a\
+\x20\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x73\x69\x67\
+\x6e\x61\x6c\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x43\x6c\x69\x63\
+\x6b\x65\x64\x28\x62\x6f\x6f\x6c\x20\x73\x74\x61\x74\x65\x29\x0d\
+\x0a\x0d\x0a\x20\x20\x20\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x2e\
+\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0d\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x43\x6c\
+\x69\x63\x6b\x65\x64\x28\x63\x68\x65\x63\x6b\x42\x6f\x78\x2e\x63\
+\x68\x65\x63\x6b\x65\x64\x29\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\
+\x0d\x0a\x7d\x0d\x0a\
+\x00\x00\x01\xe9\
+\x00\
+\x00\x07\x35\x78\x9c\x95\x54\xcb\x6e\xdb\x30\x10\xbc\xeb\x2b\x88\
+\x5c\x62\x5f\x74\x28\x7a\x0a\xe0\x8b\x53\x24\x30\x50\x03\x49\x8c\
+\x14\xe8\x51\x8f\x95\x4c\x94\x5a\x12\x7c\x14\x09\x0a\xfd\x7b\x29\
+\x59\xa6\x69\x92\x8a\x6d\x9e\x24\xed\xce\xec\xce\x70\x57\xb4\x13\
+\x5c\x6a\xf2\xaa\x5f\x0d\xad\xfe\x90\x6f\xf9\xf7\x2c\x7b\x83\x8e\
+\x6b\xd8\x55\x12\x00\x9f\xb8\xec\xc8\xbf\x2c\x23\xf6\xac\x29\xd6\
+\x14\xdb\x2d\x28\x55\xb4\xf0\xc2\x85\x11\x36\x44\xa6\x43\xeb\x07\
+\x52\xc6\x19\x63\xbc\x3f\x10\x3c\x72\x44\xa8\x34\xe5\xa8\x3c\xa0\
+\x2e\x64\x0b\x3a\x0d\x76\x49\x1c\x9f\x28\x52\xb5\x5f\x1b\xad\x39\
+\x3e\x32\xdb\x2c\xd8\x82\x27\x96\xe1\x74\xbc\xa4\x0c\x5e\xf6\x1c\
+\x61\xea\xf5\x00\x82\x7a\xb1\x74\x89\xbd\xdf\x91\xa2\x2d\x16\x2c\
+\x01\xdc\xd9\xae\xb4\xc3\xcd\xa6\x05\xfc\x71\xde\x3b\x0e\xb2\x6c\
+\x78\x8c\x0b\xc9\x05\x48\xfd\x49\x4a\xce\xd9\xf8\xb6\xf5\x28\xb9\
+\x41\x2b\xa9\x29\x98\x82\x99\xec\x9d\x11\xc3\x75\x41\xfd\x03\xfe\
+\xd2\x0a\x26\x3f\xc1\xa1\x46\x58\x63\x70\xf4\x98\x28\xd0\xdb\xa8\
+\xe3\x0d\x36\x7c\xd1\x05\x55\x97\xc7\x2b\x1e\x4e\xe9\x1c\xd0\x46\
+\xfd\x2a\x98\x81\x9f\x45\x09\x2c\xd7\xf0\xa1\xc9\x8a\x84\xd8\x13\
+\x90\x36\x11\x31\x59\xad\x56\xe4\xfe\x37\xa8\xfb\x65\x70\x57\x43\
+\x15\xaf\xbb\x67\xc9\x8d\x58\xf3\x8f\x1c\xb0\x28\x19\x58\xa0\x67\
+\xc4\xf1\x18\xbc\x8c\xd2\xd2\x9c\x83\x52\x2e\x87\x79\xbd\x7b\x02\
+\x5b\x33\xe8\xd4\xca\xfa\xca\x7b\x2b\x71\x24\x0b\x05\x5e\x27\x32\
+\x6a\xb7\xcf\x6e\x96\x1c\x1b\x35\xa3\xf9\x3c\xf1\x6c\x11\xdc\xd0\
+\xd4\x54\x09\x56\x7c\xfa\xd3\x92\x9a\x0e\x7f\x4b\x73\x09\x8d\x04\
+\xb5\xdf\x74\xf6\x8b\xb7\x69\xa9\x54\x3b\xd1\x38\xa5\x4c\x95\x03\
+\x7d\x87\x05\xcf\xcf\x76\xdc\x31\x5e\xda\xd3\x89\x32\x32\xed\x5a\
+\x52\xb7\xad\x29\x67\xac\x44\xd0\xcf\xef\x9b\xd8\x8f\x5b\xae\xe7\
+\xeb\x51\x0a\x92\x2b\x06\x85\xb4\xff\x98\x16\xa4\x90\x14\xf5\x4c\
+\x67\x6a\x86\x6f\xe1\xcf\xe4\x85\xc2\xe3\x20\xfa\xab\x9c\x9e\xa1\
+\xa9\xc3\xdb\xb7\x39\xb1\x6f\xa1\x8c\x58\xad\x57\xa5\x39\x7d\x8f\
+\xff\x49\x77\x77\x69\x5f\x40\xfb\x74\x1e\xc5\xd5\xcc\x5e\xf0\x58\
+\xa2\xcf\xfe\x03\x1e\x83\x3e\x6c\
+\x00\x00\x01\xba\
+\x00\
+\x00\x06\x15\x78\x9c\xad\x54\xc9\x4e\xc3\x30\x10\xbd\xe7\x2b\xac\
+\x9e\xe0\x40\xd4\x85\x53\x6e\x34\x2a\x50\xa9\x94\xb6\xaa\xe0\x6c\
+\x92\xa1\xb5\x70\xec\xe0\x4c\x94\x56\xd0\x7f\xc7\x75\x9a\x28\xce\
+\xd2\x22\x81\x0f\x51\xfc\xe6\x79\x96\x37\x1e\xb3\x28\x96\x0a\xc9\
+\x12\x97\x29\x0b\x3e\xc8\xd0\xbd\x75\x98\x05\xb9\xbe\x14\xa8\x24\
+\x4f\xb4\x6d\x50\xb7\xcd\xe8\x5e\xa6\x98\x90\x81\x3b\x72\x1c\x5f\
+\xf2\x34\x12\x39\x44\xbe\x1c\xa2\x17\x0b\x3d\x12\x54\x60\xc7\xa0\
+\xb1\x92\x31\x28\xdc\x13\xca\x19\x4d\x48\x40\x45\x00\x7c\x9c\x22\
+\x4a\xe1\x59\xbb\x36\xb6\x80\x6c\xc1\xc4\x1a\x76\x78\xcf\x80\x6b\
+\xff\x35\xa0\xed\x8c\x82\x18\x28\xda\xc7\x9a\x58\x6b\x6e\x4a\x93\
+\xa0\xcc\xad\xb2\x33\xec\x24\xa6\x01\x13\x1b\x8f\x0c\xfb\x79\x69\
+\x0f\x4a\xa6\xf1\x58\xee\x4e\xf5\x17\x1a\xe4\x39\x16\xc6\xd2\x94\
+\x8b\xe2\xbe\x33\xce\x5f\x59\x88\x5b\x8f\xa0\x4a\xa1\x34\x23\x43\
+\x0e\x1e\xf9\x4c\xd6\xea\xaa\x37\x11\x08\x8a\xd0\xa3\x2b\xb2\x98\
+\xce\x6f\x02\x19\x42\xef\xda\x29\xc9\x2d\xea\x37\x33\xa8\x92\x2c\
+\x8a\x16\x7d\x2b\x55\x62\x52\xf1\x48\x4c\x15\x08\x74\x2c\xc6\x8c\
+\xbe\x01\xaf\x39\xb6\x9d\x1b\x46\xc3\x8e\x5a\xde\xa2\x86\x79\x25\
+\x77\x4f\x27\x5f\xe5\x1d\xec\x70\x65\x57\xce\x86\xb4\x7b\xd7\x15\
+\xb6\x16\xe9\xb8\x40\x97\xfb\x74\xcc\xc2\x04\x9a\x8a\x58\xb7\x61\
+\x41\x93\x24\x93\x2a\x9c\x68\xdb\xb3\x98\x84\x0c\x1b\xc7\x4e\x0d\
+\x8b\x98\x60\x51\x1a\x9d\x7a\x36\xea\xf7\xbb\x88\x5d\x9d\x6d\x29\
+\xf8\x9c\xbe\xe5\x5d\xbd\x2c\xf1\xca\x50\xad\x5b\xf2\x47\xa5\x3b\
+\x06\xa5\x2b\x81\x7f\x17\xfb\xbc\x86\xf6\xdf\xa9\xb4\x95\xcc\x1a\
+\x83\x60\x4a\x29\xf0\xfa\x04\xea\x61\xdf\x88\x48\xdf\x79\x4f\x3f\
+\x6d\xee\xdd\x71\xf7\xe8\x83\x99\xb8\xef\x12\x79\xc9\x91\x4b\xd3\
+\x5b\xda\xf3\x77\xa2\x65\x16\x1b\x4f\x5c\x9b\x8e\xbe\x21\x55\xd4\
+\x3c\xfc\xc6\x73\xfd\x81\x6a\xf5\x6c\x48\x24\xa3\x9c\x03\x5a\x01\
+\xf2\xef\xc1\xf9\x01\x1e\x46\xad\x32\
 \x00\x00\x00\x36\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
 \x34\x0d\x0a\x0d\x0a\x46\x69\x72\x6d\x77\x61\x72\x65\x55\x70\x64\
 \x61\x74\x65\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\
 \x0d\x0a\x7d\x0d\x0a\
-\x00\x00\x02\xca\
-\x00\
-\x00\x0d\x3b\x78\x9c\x9d\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
-\xb9\x24\x01\x0a\xa3\x1d\x76\x1a\x50\x0c\x6d\xb3\x15\x05\xb6\xa2\
-\xdf\xdb\x8e\x6a\xcc\x04\x42\x55\x49\x95\xe8\xa6\xd9\x90\xff\x3e\
-\xfa\x23\x89\x65\x27\xb2\x1d\x9d\x6c\x51\x7c\x7c\x22\x9f\x28\x89\
-\x57\xa3\x2d\xb2\x5b\xbc\x4d\xc5\xf4\x85\x7d\x8a\x3f\x47\xc2\x9b\
-\x8a\x27\x82\x4b\x3d\x77\xec\x24\x3e\x89\xa2\xdf\xd6\xfc\xe2\x52\
-\x02\x7e\xd7\xf6\x95\xfd\x8b\x22\x46\xe3\x0f\xb8\x6b\xfd\x13\x9c\
-\xe3\x73\xb8\xd1\x26\x35\x64\x60\xe5\x10\xc9\x17\xb6\xac\xdb\x73\
-\xeb\xaa\x70\xbe\x11\xea\x4c\x25\x84\x7b\x0f\x53\x0b\xf8\x4d\xa1\
-\x5d\x06\xb0\x4c\xcb\xf2\x1a\x74\x07\xb8\x20\xc4\x44\x38\x23\xf9\
-\x72\x13\x2f\x00\x95\x04\x96\x56\x21\x2f\xb4\x52\x30\x45\xa1\x95\
-\xab\x20\x20\xb7\x73\xc0\x5d\xb9\xda\x2c\xd1\x8a\x12\x7d\x9e\x22\
-\x6a\x75\x21\xa9\x32\x40\x41\xb7\x00\xd9\x58\x08\x03\x3a\xc5\x3b\
-\x78\x4b\xc1\x21\x24\xa3\xf1\xc6\xbc\xea\x4e\xa1\x35\xc5\x15\x46\
-\x77\x14\x47\x5b\x08\xb2\x7a\xe7\x96\x81\x42\xb0\x90\x4c\x38\x72\
-\x76\xda\x1a\x21\x9e\xe7\x93\x6b\x8f\xca\x36\xb2\x61\x8b\x98\xdb\
-\x5d\x56\xc0\x63\x97\x23\x1e\x55\x03\xc6\x0a\x16\x24\x05\x7f\xce\
-\x82\x01\x8e\x34\x7d\x68\x8a\x82\x69\xb9\xb0\x04\x7e\x40\x56\x7a\
-\x66\x62\x9a\x87\xd9\x9d\x88\x43\x36\x3d\x4b\x55\xbe\x65\x36\x95\
-\xda\x41\xdb\xc9\x1c\x8d\x2b\x5b\x6a\x2d\x69\x0e\x59\xf2\xdf\x17\
-\xae\x35\x44\x3f\xd8\xfa\x89\x1c\x15\xe2\x18\xaf\xfb\x56\x36\x42\
-\xa7\x96\xc4\x84\x0d\xe7\x6e\x9e\xda\x80\xda\xc3\x8a\x40\x8b\x16\
-\x7a\xa5\x66\x7a\xc4\x8d\x79\x02\xeb\xc8\x70\xc4\x16\xe5\xb4\x40\
-\x6a\xb9\xe2\x2f\x24\x47\xd9\x9e\xc9\x2c\x66\x02\x12\x8f\xb6\x98\
-\x55\x3c\xd9\xe9\x29\x1b\x1e\xc7\xc7\xc3\x71\x4d\x63\x85\x3e\x8a\
-\x68\x97\x56\xa7\xe6\x5c\x7f\xc4\xa0\xf8\xb3\x84\x84\x04\x37\xe3\
-\xd2\xc1\xae\xa3\xd5\xc3\xa3\x6c\x39\x2d\x1e\x9e\xcb\x96\xf8\x13\
-\x97\x29\xfc\xe0\xcf\x20\x63\x84\x0f\xa4\xe5\x6f\xee\xc1\x8e\x86\
-\xd7\x1a\x99\x21\x2e\xa4\xdd\xa1\xaf\xf8\x22\x45\xf7\xc8\x31\x75\
-\xfb\xbc\x1f\xd5\x8b\xd2\x0b\x35\xac\x8b\x3c\x1b\x40\x6c\x6a\x49\
-\x0a\xd1\xd9\xda\x7a\xb0\x68\x94\xd1\xdf\x3e\x95\xae\xb1\x82\x2a\
-\x58\xb2\x1f\x88\xed\xec\x60\x5c\x2f\xe8\x41\x45\x3d\xac\xb0\x5d\
-\x8a\x8b\x36\xf5\x9d\x56\xde\xdf\x8e\x64\x77\xd8\x40\x03\xb4\x0b\
-\xff\x9d\x4e\xdd\xb4\xb9\x9b\xff\xbe\xbe\x08\xdc\x4e\xe0\x5d\x4c\
-\x21\x3f\xbd\xde\x99\x0c\x09\x69\x30\xd8\x2c\x0b\x8b\x87\x16\x6e\
-\x56\xf6\xaa\x74\xbf\x0a\x77\x4f\x4d\x3d\x05\xd9\xb1\xc4\xcb\xc7\
-\x2b\xaf\x35\x37\xf2\xb2\xb1\x34\xde\x33\x5e\xc7\xce\x46\xaf\x9b\
-\xa3\x74\xe8\x74\x0f\x38\x31\x57\x5c\xee\x7b\x14\x95\xd6\xc6\x63\
-\xc2\xa1\x15\x6a\xce\xd6\xef\x88\xf2\x77\x7d\x9b\x96\xbf\xb5\x8b\
-\xb4\xc4\xaa\x5f\xc7\xad\xbe\x51\xa3\x14\xc5\x93\x21\xf6\x5e\x0d\
-\x81\x5c\x52\x29\xaa\x8f\xef\x07\xd2\xd0\xa8\x68\x23\x67\x16\xd8\
-\x52\xa7\xcc\xa5\xe5\xc7\x82\x2b\x64\xa8\x59\x02\x14\x26\x9f\xb2\
-\xa5\x14\xbf\x52\x9f\x09\xc4\x68\x5e\x65\x9e\xd4\x82\x8c\x3b\xd4\
-\x96\x84\x73\x26\x65\x1f\x3d\x34\x09\x55\x0f\x4a\x1b\x9f\xae\x1c\
-\xda\xe2\xae\xa2\xff\x8b\x1c\x27\xed\
-\x00\x00\x02\x7c\
+\x00\x00\x00\x35\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x44\x69\x73\x70\x6c\x61\x79\x58\x72\x70\x53\x65\x63\
+\x72\x65\x74\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\
+\x0a\x0a\x7d\x0a\
+\x00\x00\x00\x2d\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x50\x69\x6e\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\
+\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
+\x00\x00\x02\x98\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
 \x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
@@ -1933,163 +783,1379 @@ qt_resource_data = b"\
 \x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
 \x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
 \x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x79\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\
-\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\x20\x28\x70\
-\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\x20\x77\x69\
-\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x79\x3a\x20\
-\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\
-\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\
-\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\
-\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\
-\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\
-\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\
-\x65\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\
-\x73\x65\x74\x59\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x54\
-\x65\x78\x74\x28\x74\x65\x78\x74\x29\x20\x7b\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x79\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\
-\x2e\x6c\x61\x62\x65\x6c\x2e\x74\x65\x78\x74\x20\x3d\x20\x74\x65\
-\x78\x74\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x73\x69\
-\x67\x6e\x61\x6c\x20\x79\x65\x73\x42\x75\x74\x74\x6f\x6e\x43\x6c\
-\x69\x63\x6b\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x59\x65\x73\
-\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x69\x64\x3a\x20\x79\x65\x73\x4e\x6f\x4d\x65\x73\
-\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x79\x65\
-\x73\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\
-\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x79\x65\x73\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\x6b\x65\
-\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x79\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\
-\x70\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x6f\x42\
-\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\
-\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x79\
-\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
-\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x00\x30\
+\x20\x69\x64\x3a\x20\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\
+\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\
+\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\
+\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\
+\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\
+\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\x74\x29\x20\x2f\
+\x20\x32\x0a\x20\x20\x20\x20\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\
+\x75\x65\x0a\x20\x20\x20\x20\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\
+\x75\x65\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\
+\x30\x0a\x20\x20\x20\x20\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\
+\x79\x3a\x20\x50\x6f\x70\x75\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\
+\x45\x73\x63\x61\x70\x65\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\
+\x74\x69\x6f\x6e\x20\x63\x6c\x65\x61\x72\x41\x6c\x6c\x28\x29\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x64\x69\x73\x70\x6c\x61\
+\x79\x53\x65\x65\x64\x4d\x65\x73\x73\x61\x67\x65\x2e\x73\x65\x65\
+\x64\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\x78\x74\x20\x3d\
+\x20\x22\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x66\
+\x75\x6e\x63\x74\x69\x6f\x6e\x20\x73\x65\x74\x53\x65\x65\x64\x28\
+\x73\x65\x65\x64\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\x4d\x65\x73\x73\x61\
+\x67\x65\x2e\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\x2e\
+\x74\x65\x78\x74\x20\x3d\x20\x73\x65\x65\x64\x0a\x20\x20\x20\x20\
+\x7d\x0a\x0a\x20\x20\x20\x20\x44\x69\x73\x70\x6c\x61\x79\x53\x65\
+\x65\x64\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x69\x64\x3a\x20\x64\x69\x73\x70\x6c\x61\x79\x53\
+\x65\x65\x64\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\
+\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\
+\x64\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\
+\x65\x61\x72\x41\x6c\x6c\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x64\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\
+\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\
+\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\
+\x20\x20\x20\x7d\x0a\x7d\x0a\
+\x00\x00\x02\xc7\
+\x00\
+\x00\x0c\xed\x78\x9c\x9d\x56\x4b\x6f\xdb\x30\x0c\xbe\xfb\x57\x08\
+\xb9\x24\x01\x0a\xa3\x1d\x76\x1a\x50\x0c\x69\x92\x15\x05\xb6\xa2\
+\xef\x62\x47\x35\x66\x32\xa1\x8a\xe4\x4a\x54\xd3\x6c\xc8\x7f\x1f\
+\x1d\xbb\xf1\x5b\x71\xa2\x93\x2d\x92\x1f\x29\xf2\x23\x25\xb1\x8c\
+\xb5\x41\x76\x8b\xb7\x4e\xcc\x5e\xd9\x97\xf0\x6b\x20\x4a\x5b\xe1\
+\x44\x70\xa9\x17\x96\x9d\x85\x67\x41\x30\xc5\x3f\x60\xc0\x2d\x9f\
+\xb9\x94\x80\x3f\xb4\x59\xb2\x7f\x41\xc0\x68\xfd\x06\x7b\xad\x7f\
+\x81\xb5\x7c\x01\x37\x3a\x76\x31\x09\x58\xb6\x44\xf4\x8d\xad\xab\
+\xf2\xad\x74\x93\x1a\xdf\x08\x35\x52\xd1\x3d\x40\x34\x55\x68\xd6\
+\x1e\x98\xb8\x5d\xb3\x02\xd8\x01\xc9\x0b\x31\x11\x36\x96\x7c\x9d\
+\xb8\xf2\xa0\x44\xcd\x5a\x45\xa0\xb1\x56\x0a\x66\x28\xb4\xb2\x05\
+\x63\xe4\x66\x01\xd8\x94\x97\x9d\x8a\x56\x94\xd4\x0b\x87\xa8\xd5\
+\x58\x52\x29\x80\xfc\xe5\x00\xc9\x5a\x89\x18\xb4\xc3\x3b\x78\x73\
+\x60\x11\xa2\xc1\x70\x27\xde\x74\x0f\xc1\x97\xd3\x42\x30\x77\xe4\
+\x42\x1b\xf0\x06\xf4\xce\x0d\x03\x85\xc4\x91\x68\xc2\x91\xb3\x73\
+\x1f\x78\x48\xde\xa7\xb9\x72\x21\xf8\x64\x99\xd4\x5d\x7e\xb6\x02\
+\x6e\x68\x09\xef\xa4\xe8\x29\x54\xb0\xa2\xa2\x97\xf7\x0c\xc4\xc0\
+\x91\xb6\x8f\x4d\x8b\x37\x1f\x63\x43\xe0\x47\xa4\xe3\xc0\x3c\xcc\
+\xb6\x6e\x9a\xd3\x70\xcc\xa1\xe7\x4e\x6d\x8f\xcc\x66\x52\x5b\xf0\
+\x74\xde\x60\x58\x38\x8d\xaf\x8c\x5b\xa0\x2c\xea\x36\x27\x7b\xd1\
+\x0f\x83\x2d\xb4\xdd\x20\xe1\xc2\xf0\x73\x0c\x25\xab\xa5\x27\x89\
+\x34\x98\x1b\xec\xd5\xd6\x31\xa8\x16\xef\x04\x94\x0e\xc0\x2b\x35\
+\xd7\x03\x1e\xc7\x4f\x60\x2c\x09\x4e\xd8\x2a\xdb\x16\x48\x53\x53\
+\xfc\x4d\x48\x4a\x67\x23\xb1\x98\x8b\x4a\x94\x62\x5e\xb0\x64\xe7\
+\xe7\xac\x7f\x1a\x9e\xf6\x87\x15\x06\xa5\xd5\x4f\xbd\x5d\x1a\xed\
+\xe2\x0b\xfd\x11\x82\xe2\x2f\x12\x22\xa2\xd3\x9c\x4b\x0b\x4d\x6d\
+\x73\x80\x45\x36\x44\xf6\x58\x94\x4c\xf2\xc0\x9f\xb8\x74\xf0\x93\
+\xbf\x80\x0c\x11\x3e\x90\xd4\xdf\xec\x83\x19\xf4\xaf\x35\xb2\x98\
+\x62\x21\x66\xf6\xcb\x7c\x4e\x53\x74\x8f\x1c\x9d\x6d\xb3\x7e\x54\
+\xaf\x4a\xaf\x54\xbf\x4a\xe1\x64\x01\x45\x53\x49\x92\x2f\x9c\x5c\
+\x76\x40\x14\xb5\x32\x96\x8f\x4f\xa5\xab\x69\x50\x05\xb3\xe8\x7b\
+\x22\xdf\xed\x0d\xab\x05\x3d\xaa\xa8\xc7\x15\xb6\x4b\x71\xd1\xb8\
+\xb2\xd1\xa6\xf4\xd7\x90\xec\x0e\x07\xa8\x81\x76\x89\xbf\xd1\xa8\
+\x1b\x37\x9b\xe3\x6f\x9b\x7a\xc0\xcd\x04\xde\xc5\x0c\xb6\xdd\x5b\
+\xea\x49\x1f\x91\x7a\xbd\x9d\x9a\x9f\x3c\xa4\xb8\xd3\x3c\xa8\xd2\
+\x87\x55\xb8\x7b\x6a\xaa\x29\x48\xda\x12\x2f\x1f\xaf\x4a\x23\xb8\
+\x96\x97\x9d\xa4\xf6\x42\x29\x4d\xe6\x64\x75\xbd\x1c\x32\xdd\x4e\
+\xa3\xde\x8a\x85\xe2\xb2\xed\x85\x93\x49\x6b\x6f\x04\x8b\x46\xa8\
+\x05\x4b\x9f\x07\xd9\xcf\xe7\x25\x99\xfd\x56\xee\xc7\x0c\xa9\x7a\
+\xcb\xee\xb5\x0d\x6a\x35\x48\x5f\x02\x61\xe9\x31\xe0\x49\x22\xd5\
+\xa0\xf8\x66\x7e\x20\xf2\x0c\xd2\xf9\x31\x32\xc0\xd6\xda\x31\xeb\
+\xb2\x8f\x15\x57\xc8\x50\xb3\x08\xc8\xcd\x76\xcb\x64\x1c\xfc\x4e\
+\x03\xc6\xe3\xa3\x7e\x87\x95\x38\xe6\x8d\xd8\x5f\x54\x22\xcb\x48\
+\xca\x8e\x1c\xa8\x87\x51\xec\x8b\x7d\x51\x74\x75\xbf\xcf\xef\x26\
+\xf8\x0f\x25\x57\x06\x8d\
+\x00\x00\x01\x62\
+\x00\
+\x00\x05\x8f\x78\x9c\xbd\x53\x4d\x4f\xc3\x30\x0c\xbd\x57\xea\x7f\
+\x88\x76\x82\x4b\x45\xc7\x4e\xb9\x6d\xbd\x0c\x31\x09\x26\x26\xee\
+\x69\x97\x75\x11\x69\x52\x92\x14\xd1\x01\xff\x1d\xb7\x59\xe9\xf7\
+\x34\x09\x86\x55\x29\xf2\x8b\xed\xbc\x67\xbb\x2c\x49\xa5\x32\x68\
+\x6d\xd6\x19\x8b\x5e\xd0\xd4\x9b\xb9\x0e\x6b\x61\x5e\x20\x85\x51\
+\x92\x6b\xb8\xf4\x7b\x97\x2b\x92\xcb\xcc\x68\xe4\x7b\xb7\xae\xe3\
+\x3a\x81\xe4\x59\x22\x2c\x88\x3e\x5c\x07\x81\xb1\x2d\x46\x51\x03\
+\xb7\x68\xaa\x64\x4a\x95\xc9\x11\xe1\x8c\x68\xc4\x49\x48\x39\xb6\
+\xc7\x60\x40\x98\x19\x23\x05\x3e\x9e\x23\x21\x3a\xbf\x13\x5b\x16\
+\x11\x23\x15\x6e\xbb\x83\x09\xe0\xc6\x8a\x6a\xbd\x20\x10\xde\x70\
+\x4e\x06\xaf\x2c\xd3\x96\x3b\x98\x10\x11\x11\x51\xbe\x38\xf2\x6e\
+\x7a\x36\x5c\xa7\x24\x62\x22\xc6\x68\x7a\x53\xb4\xae\x80\x16\x4d\
+\xca\x55\xff\xaa\x1e\x0e\xe8\x29\xcc\x36\xd5\x83\x37\x63\x91\x50\
+\x61\x30\xcc\xc6\x9b\x17\xde\x32\x00\x97\x2a\xf4\xf9\x83\x3c\x5b\
+\xc4\x26\x7f\x55\xaf\x96\x12\xba\xaf\x35\x26\x51\x98\xa1\xef\x50\
+\xf9\x55\x6f\xd4\xd5\x64\x72\x5d\xe3\x3b\x58\x0e\x2f\x95\x4c\x98\
+\x27\x76\xa0\x18\xf9\xb3\xfa\xee\x0d\x9a\x01\x6c\xf9\xbc\xa6\xb6\
+\x81\x32\x03\x54\x0a\xdb\x4b\xc5\x0e\x50\x6d\x24\x7e\xd9\x8d\xff\
+\xbd\xee\xc7\x7a\xe2\x5d\xf5\xbd\x65\x28\xf5\x30\xcd\x42\x0e\x22\
+\x77\x84\x6b\x7a\xf1\x09\x0c\x6c\xd8\x29\x16\x63\x13\xfa\xff\xbe\
+\xda\x25\xef\xaf\x6f\xbd\xfa\xe7\xea\x78\xb8\x6f\x2a\xb9\x14\xb3\
+\xfe\xaf\x79\x2e\xbf\xa0\xcc\xfc\x2b\x8e\xf0\x7d\x03\x87\x46\xa9\
+\xff\
+\x00\x00\x02\x64\
+\x00\
+\x00\x0d\xb2\x78\x9c\xd5\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
+\x39\x6d\x17\xa3\x49\x07\x0c\xd0\xad\xcd\x80\xae\x40\x77\x48\x57\
+\xa4\x67\xd5\x61\x12\x61\x8a\xa4\x49\x74\xda\x6e\xcb\x7f\x9f\xfc\
+\x19\x7f\xd0\x49\x87\x15\xcd\xa6\x83\x01\x91\x8f\x12\xf9\xf4\x4c\
+\x49\x6e\xac\x71\xc8\x66\x38\x4b\x65\xf2\x8d\x4d\xe2\x0f\x91\x6c\
+\x99\xe2\xa9\xd1\xe8\x8c\xf2\xc1\x37\xee\xfa\x6e\xc4\xb3\x49\xd1\
+\xb3\x71\x7c\x1e\x45\xd7\x08\x1b\xf6\x33\x62\x61\xc8\x05\x67\x1b\
+\x21\x75\x66\xca\x0d\xd6\x19\x0b\x0e\x9f\x99\x50\x52\x78\x26\xac\
+\x9d\x83\xf3\xd2\xe8\xb9\x50\x29\xdc\x88\x07\x50\x9c\xb4\x52\xd1\
+\x8f\x42\x29\xc0\xaf\x28\x30\xf5\xcd\x78\xda\x4e\xae\x20\x2d\x84\
+\xc4\xef\xf3\x80\xcb\x14\xd1\x68\x4e\x19\xa9\xd8\xc4\x81\x40\x28\
+\x50\x57\xce\xa4\xf6\xd2\x3c\x71\xd2\x4a\x45\x3b\xf0\x68\x5c\x2f\
+\x9c\x34\x1f\xcd\x7c\x1f\x4f\x9a\x8f\xee\x5f\x55\x4e\x18\x8f\x55\
+\x5e\x85\xf6\x6d\x51\x1e\x3a\x35\x2a\xdd\xe8\x42\x1f\xa5\x28\x9a\
+\xc2\x68\xba\x6b\xa7\xd0\xc9\xda\x38\x1f\x3b\xb9\x5a\x23\x67\x56\
+\x38\xd0\x58\xcc\x68\xcc\x17\xe1\x56\x32\x24\x31\xfe\x78\xd6\x03\
+\x28\x58\xee\xd7\xc8\x26\x24\xe2\xd0\x0a\xdb\x50\xba\x4c\x84\x9a\
+\x86\x15\xc0\xd5\x6b\xb5\xcd\x75\x94\xb7\x22\x91\x7a\xc5\xd9\xe4\
+\x2c\xaa\x8d\xd5\x49\x34\x18\xa8\x58\x58\xc0\x56\x26\x70\xad\x97\
+\xa6\x75\x5c\xd5\x40\x89\x0a\x38\x1b\x15\xcc\x32\x19\x70\xa3\x16\
+\xa0\xe0\x2e\x5e\x4a\xa5\xee\xe5\x02\xd7\x9c\xa1\x4b\x21\x6a\x61\
+\xae\x9c\x5c\xf4\x8e\x60\x28\x89\x0a\xda\x03\x56\x7c\x64\x5b\x55\
+\x2c\xf4\x40\xce\x3c\x7a\xce\xce\x7b\xf6\x24\x3f\xe8\xe0\x9a\x44\
+\x3d\x5f\xfe\x7b\x12\x99\x55\xd9\xed\xfb\xc1\x1d\x3c\xe1\xfe\x67\
+\xee\x0e\x0c\x5e\xce\xbe\xfb\x3b\xf7\x6e\x74\x61\x2d\xdb\x16\x41\
+\x7c\xf4\xbe\x07\xdf\xfd\x4d\x16\x9d\x9e\x72\x28\x0d\x62\xeb\x6c\
+\x04\x1e\xe5\x8f\xd0\x4f\x85\xba\x50\x72\xa5\x37\x81\x49\xce\xb2\
+\xe2\xe2\x7c\xfe\xb9\xa3\xa9\x76\x9a\xe4\x79\xbf\x42\x81\xcd\xb6\
+\xf9\x72\xa2\x4b\x61\xfa\x3c\xec\x95\xa8\x3e\xd0\xc0\x0f\xa5\x72\
+\x42\xb2\xe9\xd9\xee\x45\x1d\x60\xf0\xca\xa8\x6b\x2c\x7b\xc0\x34\
+\x07\x96\xec\xfc\x79\x17\x00\x2d\x1e\x14\x84\x0d\x97\x42\xf9\x8e\
+\x6f\xa0\x4d\x0f\xa5\x49\xb6\xed\x6a\x90\x7d\xa2\x87\x2a\x2e\x89\
+\x03\x22\x20\x6e\x14\x0a\xda\x14\x40\x9b\x20\x5a\x0d\x25\x53\x62\
+\x2f\x85\x59\x29\x84\xdb\xec\x2a\x61\xbf\xea\xf9\xfc\xd4\xc2\x18\
+\x7e\x0c\xd4\xc5\x97\xca\xb8\x2d\x90\xa7\x92\x46\x2b\xd1\xb7\xd0\
+\xc6\xd0\x43\xa5\x3b\x9a\xe2\xe8\x70\xf4\xdf\xab\x63\xf8\xa9\x57\
+\x57\x5f\xaa\xe3\x13\x04\xc4\xc9\xc4\xd1\xca\xf3\x2d\xc4\x31\xf4\
+\x7e\xef\x8e\xa6\x38\xda\x14\xfd\xd3\xda\x28\xbe\xbb\xe8\x37\x7d\
+\xc4\xbd\x8b\
+\x00\x00\x02\x10\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0d\x0a\x0d\x0a\x53\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\
-\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0d\x0a\x0d\x0a\x7d\x0d\x0a\
-\x00\x00\x04\x2e\
+\x37\x0d\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\
+\x6b\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0d\x0a\
+\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\
+\x61\x79\x6f\x75\x74\x73\x20\x31\x2e\x30\x0d\x0a\x69\x6d\x70\x6f\
+\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\
+\x77\x20\x32\x2e\x30\x0d\x0a\x0d\x0a\x50\x6f\x70\x75\x70\x20\x7b\
+\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x69\x64\x3a\x20\x73\x69\x6d\x70\
+\x6c\x65\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x0d\x0a\
+\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x73\
+\x65\x74\x53\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\x67\x65\x54\
+\x65\x78\x74\x28\x74\x65\x78\x74\x29\x20\x7b\x0d\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x73\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\
+\x67\x65\x2e\x6c\x61\x62\x65\x6c\x2e\x74\x65\x78\x74\x20\x3d\x20\
+\x74\x65\x78\x74\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\x20\
+\x20\x20\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\
+\x64\x74\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\
+\x0d\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\
+\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\x74\
+\x29\x20\x2f\x20\x32\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x6d\x6f\x64\
+\x61\x6c\x3a\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x66\x6f\
+\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x63\
+\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\x75\
+\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\x65\x0d\
+\x0a\x0d\x0a\x20\x20\x20\x20\x53\x69\x6d\x70\x6c\x65\x4d\x65\x73\
+\x73\x61\x67\x65\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x69\x64\x3a\x20\x73\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\x67\
+\x65\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x75\x74\
+\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\
+\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x73\x69\
+\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
+\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0d\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x7d\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x7d\x0d\x0a\
+\x00\x00\x02\x64\
+\x00\
+\x00\x0d\xb2\x78\x9c\xd5\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
+\x39\x6d\x17\xa3\x49\x07\x0c\xd0\xad\xcd\x80\xae\x40\x77\x48\x57\
+\xa4\x67\xd5\x61\x12\x61\x8a\xa4\x49\x74\xda\x6e\xcb\x7f\x9f\xfc\
+\x19\x7f\xd0\x49\x87\x15\xcd\xa6\x83\x01\x91\x8f\x12\xf9\xf4\x4c\
+\x49\x6e\xac\x71\xc8\x66\x38\x4b\x65\xf2\x8d\x4d\xe2\x0f\x91\x6c\
+\x99\xe2\xa9\xd1\xe8\x8c\xf2\xc1\x37\xee\xfa\x6e\xc4\xb3\x49\xd1\
+\xb3\x71\x7c\x1e\x45\xd7\x08\x1b\xf6\x33\x62\x61\xc8\x05\x67\x1b\
+\x21\x75\x66\xca\x0d\xd6\x19\x0b\x0e\x9f\x99\x50\x52\x78\x26\xac\
+\x9d\x83\xf3\xd2\xe8\xb9\x50\x29\xdc\x88\x07\x50\x9c\xb4\x52\xd1\
+\x8f\x42\x29\xc0\xaf\x28\x30\xf5\xcd\x78\xda\x4e\xae\x20\x2d\x84\
+\xc4\xef\xf3\x80\xcb\x14\xd1\x68\x4e\x19\xa9\xd8\xc4\x81\x40\x28\
+\x50\x57\xce\xa4\xf6\xd2\x3c\x71\xd2\x4a\x45\x3b\xf0\x68\x5c\x2f\
+\x9c\x34\x1f\xcd\x7c\x1f\x4f\x9a\x8f\xee\x5f\x55\x4e\x18\x8f\x55\
+\x5e\x85\xf6\x6d\x51\x1e\x3a\x35\x2a\xdd\xe8\x42\x1f\xa5\x28\x9a\
+\xc2\x68\xba\x6b\xa7\xd0\xc9\xda\x38\x1f\x3b\xb9\x5a\x23\x67\x56\
+\x38\xd0\x58\xcc\x68\xcc\x17\xe1\x56\x32\x24\x31\xfe\x78\xd6\x03\
+\x28\x58\xee\xd7\xc8\x26\x24\xe2\xd0\x0a\xdb\x50\xba\x4c\x84\x9a\
+\x86\x15\xc0\xd5\x6b\xb5\xcd\x75\x94\xb7\x22\x91\x7a\xc5\xd9\xe4\
+\x2c\xaa\x8d\xd5\x49\x34\x18\xa8\x58\x58\xc0\x56\x26\x70\xad\x97\
+\xa6\x75\x5c\xd5\x40\x89\x0a\x38\x1b\x15\xcc\x32\x19\x70\xa3\x16\
+\xa0\xe0\x2e\x5e\x4a\xa5\xee\xe5\x02\xd7\x9c\xa1\x4b\x21\x6a\x61\
+\xae\x9c\x5c\xf4\x8e\x60\x28\x89\x0a\xda\x03\x56\x7c\x64\x5b\x55\
+\x2c\xf4\x40\xce\x3c\x7a\xce\xce\x7b\xf6\x24\x3f\xe8\xe0\x9a\x44\
+\x3d\x5f\xfe\x7b\x12\x99\x55\xd9\xed\xfb\xc1\x1d\x3c\xe1\xfe\x67\
+\xee\x0e\x0c\x5e\xce\xbe\xfb\x3b\xf7\x6e\x74\x61\x2d\xdb\x16\x41\
+\x7c\xf4\xbe\x07\xdf\xfd\x4d\x16\x9d\x9e\x72\x28\x0d\x62\xeb\x6c\
+\x04\x1e\xe5\x8f\xd0\x4f\x85\xba\x50\x72\xa5\x37\x81\x49\xce\xb2\
+\xe2\xe2\x7c\xfe\xb9\xa3\xa9\x76\x9a\xe4\x79\xbf\x42\x81\xcd\xb6\
+\xf9\x72\xa2\x4b\x61\xfa\x3c\xec\x95\xa8\x3e\xd0\xc0\x0f\xa5\x72\
+\x42\xb2\xe9\xd9\xee\x45\x1d\x60\xf0\xca\xa8\x6b\x2c\x7b\xc0\x34\
+\x07\x96\xec\xfc\x79\x17\x00\x2d\x1e\x14\x84\x0d\x97\x42\xf9\x8e\
+\x6f\xa0\x4d\x0f\xa5\x49\xb6\xed\x6a\x90\x7d\xa2\x87\x2a\x2e\x89\
+\x03\x22\x20\x6e\x14\x0a\xda\x14\x40\x9b\x20\x5a\x0d\x25\x53\x62\
+\x2f\x85\x59\x29\x84\xdb\xec\x2a\x61\xbf\xea\xf9\xfc\xd4\xc2\x18\
+\x7e\x0c\xd4\xc5\x97\xca\xb8\x2d\x90\xa7\x92\x46\x2b\xd1\xb7\xd0\
+\xc6\xd0\x43\xa5\x3b\x9a\xe2\xe8\x70\xf4\xdf\xab\x63\xf8\xa9\x57\
+\x57\x5f\xaa\xe3\x13\x04\xc4\xc9\xc4\xd1\xca\xf3\x2d\xc4\x31\xf4\
+\x7e\xef\x8e\xa6\x38\xda\x14\xfd\xd3\xda\x28\xbe\xbb\xe8\x37\x7d\
+\xc4\xbd\x8b\
+\x00\x00\x3f\x91\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x27\x97\x00\x00\
+\x27\x97\x01\xe3\x1e\x7b\xf5\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe1\x03\x1a\x12\x0b\x35\xc3\x2d\xc5\x5a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\xda\xec\xdd\x79\x7c\x9d\x75\x9d\xfe\xff\xeb\x7d\x9f\
+\x73\x92\xee\x0b\x94\x7d\x47\x04\x64\x51\x99\x22\x08\x95\xa1\xd2\
+\x24\xa5\x42\x71\x4d\xbf\x7e\x55\x0a\x59\xda\xfa\x45\xc1\xe1\x37\
+\x6a\x69\xd2\x8e\xb7\x36\x49\xc1\x61\x74\xc4\xc1\x99\xb4\x49\x0a\
+\x88\xa3\xb6\xa3\x40\x8b\x94\x66\xa9\x75\x28\xab\x22\xb8\xb0\x4a\
+\xcb\x52\x90\xb2\x76\x5f\x92\x73\xce\xfd\xfe\xfd\x91\x82\x20\x85\
+\x36\x6d\x96\x73\xce\xfd\x7a\x3e\x1e\x15\x17\x30\x27\xd7\xe7\x24\
+\x9f\xeb\x7e\xdf\xf7\xb9\x6f\x13\x80\x7e\x77\xd1\x37\x9b\x87\xa7\
+\x87\x44\x23\xa3\xac\x8f\x8c\xa2\xc4\x60\x37\x1b\xa5\x28\x2a\x36\
+\xd3\x10\xb7\x60\x98\x29\x2a\x52\xa4\x51\xb2\xa0\x58\xa6\x21\xee\
+\x3e\x3c\x90\x52\x2e\x1b\x25\x49\x72\x2f\x36\xd3\x10\x49\x72\x69\
+\x88\x64\xc5\xdd\xff\xde\x87\x99\x94\xda\xf9\x65\x46\x4a\x16\xec\
+\xfa\x15\x78\xd0\xfd\xbf\xbf\xa7\x48\xb2\x8d\xef\xfd\xb7\x78\x46\
+\xd2\xe6\xdd\xfc\xff\x74\x49\xb6\x75\xe7\xdf\xef\x26\x6d\xd8\xf9\
+\xdf\x67\x5c\xd6\xfd\xcf\x5a\xd4\xe9\x6e\xdb\x24\x29\x90\xb6\xb9\
+\x59\xa7\x79\xb4\xc5\x5d\x69\xb3\x60\x7d\x64\x4a\x9b\x47\x5b\xcc\
+\x82\xed\x91\xb4\x23\xe1\xd1\xa6\x6c\xa0\xb4\xd2\xc1\xc6\x44\x90\
+\xde\xee\x5d\x83\x37\xb5\x5e\x3b\x75\x2b\xef\x2c\x60\xcf\x19\x11\
+\x00\x7b\x67\x72\xd8\x38\x64\xfb\x76\x8d\x49\x24\x52\x63\x32\x41\
+\x74\x60\xc2\x6d\x7f\x37\x1f\x23\xd9\xfe\x72\x1b\x2d\xf9\x48\xb9\
+\x46\x2a\xd0\x48\xb9\x8f\x94\x6c\xa4\x64\xa3\x24\x1f\xd9\xbd\xcf\
+\xa1\x97\xed\x2c\x2c\xbe\x41\xd2\xa6\xee\x62\xe2\x9b\x64\xb6\xc9\
+\x5d\x9b\x4c\xbe\xc1\x3d\xd8\x64\xe6\xaf\xb9\xf4\x8a\x2c\x7a\x4d\
+\x96\x7c\x2d\x91\xed\x7a\x75\x44\xd1\xe8\xd7\x16\x87\x53\xba\x88\
+\x10\x14\x00\x20\xa6\xce\xba\x72\xd1\xe0\x11\xc5\x9b\x0e\x93\x25\
+\x0e\x71\xcb\x1e\x16\x99\x1d\x6c\xa6\xc3\xdd\x75\xb0\x49\x63\x24\
+\x1d\xa8\xee\xbf\xee\x2f\x75\x1f\x81\xa3\x30\xb8\xb4\xd9\xa4\xd7\
+\xe4\x7a\x45\xa6\x57\x65\xfe\x9a\x79\xb0\x2e\x92\xbf\x10\xb8\xaf\
+\x33\x4f\xbc\x10\x25\xb4\x6e\x50\xb2\xeb\x85\xa5\xe1\x8c\x6d\x24\
+\x06\x0a\x00\x90\x27\x26\x5d\x7e\x5d\x71\xd7\xb0\x41\x47\x05\x89\
+\xc4\xd1\xe6\x76\xb4\xcb\x8f\x32\xd3\xe1\x72\x1d\xea\xd2\xa1\xea\
+\xfe\x33\x8a\xa4\xb0\x07\x36\x4a\x7a\x41\xd2\xba\xee\xbf\xfa\x8b\
+\x32\x7b\xce\x23\x7f\xc6\x3d\x78\x7a\xdb\x8e\x61\x4f\xdf\xfb\xfd\
+\x29\xdb\x89\x09\x14\x00\xa0\x1f\x94\x97\x2f\x4a\xac\x7f\xdf\x96\
+\xa3\x2c\xe9\xc7\xfd\x6d\x83\xb7\xa3\xdd\xfd\x68\xb9\x8e\x96\xe9\
+\x10\xde\xf3\xe8\xc7\x5f\xae\xeb\x5c\xf6\x8c\xcc\x9f\x91\xfc\x69\
+\xf3\xe0\x19\x79\xf6\x69\x0f\x92\xcf\xbc\xfe\x72\xd7\x33\x0f\xce\
+\x9f\x91\x26\x25\x50\x00\x80\x1e\x18\x1f\x2e\x1c\x55\x94\xcd\xbc\
+\xcf\x23\x3b\xd6\xcc\x4e\x76\xb7\x93\x24\x1d\x2b\xf9\x07\xc4\x58\
+\x1e\xf9\x21\x23\xe9\x39\x93\xd6\xb8\xf4\xa8\xc9\x1e\x89\x4c\x6b\
+\x3c\xca\xfe\xa9\xa3\x61\xda\x4b\xc4\x03\x0a\x00\x62\x6d\x62\xd8\
+\xb4\x9f\xba\xec\x43\x6e\x76\xaa\x2b\x3a\x55\xb2\x13\x25\x9d\xa8\
+\xee\x73\xf0\x40\xa1\x7a\x49\xb2\xc7\xe4\x7a\xc2\xcd\x1f\x97\xd9\
+\x9f\x3d\x9b\x78\xa8\x63\xde\x25\xaf\x11\x0d\x28\x00\x28\xb0\x23\
+\xfa\x30\x59\x9c\x3d\xf4\x84\x28\x0a\x4e\x32\xb3\x93\x23\xd7\x58\
+\x93\x4e\x92\x74\x0c\xef\x51\xe0\x4d\x2f\x9a\xf4\x88\x4b\x8f\xba\
+\xeb\xc1\x44\x22\xfb\xe0\xf2\xb9\xd3\x1e\x95\xcc\x89\x06\x14\x00\
+\xe4\xc5\x66\x9f\xea\x3a\xea\x14\x33\x3f\xc3\xe5\x67\x48\x3a\x5d\
+\xd2\x07\x24\x15\x91\x0e\xd0\x63\x1b\x24\x7b\xd8\x3d\x7a\x48\xb2\
+\x87\x13\x89\xec\x83\x67\x25\xfe\xfa\x58\x18\x86\x11\xd1\x80\x02\
+\x80\x01\x55\x1a\x36\x1f\x6a\x69\x1f\x2b\xb3\xb1\x72\x8d\x73\xe9\
+\x6c\x71\x9e\x1e\xe8\x33\x2e\x6d\x36\xd3\x1f\x25\x5b\x65\x1e\xdd\
+\x9d\xca\x76\xad\xfa\xd5\xd5\x97\xad\x27\x19\x50\x00\xd0\x67\xc6\
+\x4e\x6f\x4c\x8d\xda\x3f\x79\x7a\x60\xfe\x8f\x32\x3b\x47\xd2\x99\
+\xe2\x7c\x3d\x30\xd0\xb2\x92\xfe\xec\xd2\xdd\x26\xbf\x2f\x6b\xc9\
+\x7b\x56\xd4\x5d\xba\x9a\x58\x40\x01\xc0\x5e\x9b\x74\xf9\x75\xc5\
+\xd1\xb0\xe1\x67\x44\x16\x8d\x37\xd3\x3f\xba\x74\x96\xa4\xa1\x24\
+\x03\xe4\xbc\x97\x4c\x5a\x15\x99\x75\x78\x36\xd3\xd1\x31\x6f\xfa\
+\x93\x44\x42\x01\x00\xde\xf3\x08\x7f\xf4\x81\xc1\x38\x73\xfb\xb8\
+\x64\xe3\x25\x9d\x21\x69\x10\xc9\x00\xf9\xbe\x13\xd8\x73\x72\xef\
+\x70\xf7\x76\x97\x77\xf0\x51\x44\x0a\x00\xa0\x09\x35\x0b\x0e\x32\
+\x05\x13\xcd\xec\x42\xc9\x4b\xc5\x9d\xf2\x80\x38\x58\xe3\x52\xbb\
+\xc9\xdb\xd3\xa9\x44\xdb\xca\xb0\x62\x03\x91\x50\x00\x50\xe0\x26\
+\x5d\x7e\x5d\x71\x7a\xe4\xb0\x73\x4c\x7e\xbe\x5c\x93\xd4\xfd\x71\
+\x3c\x00\xf1\x95\x91\x74\x8f\xcb\x97\x9a\x25\x6e\x6b\xab\xab\xf8\
+\x0b\x91\x50\x00\x50\x20\x26\x86\x4d\xfb\x45\x5d\x76\x91\xa4\x4f\
+\xcb\x34\x41\x9c\xc7\x07\xf0\xee\x1e\x97\x7c\x89\x22\x2d\x19\x57\
+\xfc\xfc\xbd\x7c\xe4\x90\x02\x80\x3c\x33\x61\xd6\x8d\xfb\x9b\x65\
+\x2e\x90\xa9\xdc\xa4\x32\xf1\x39\x7c\x00\x3d\xf7\x9a\xa4\x3b\x24\
+\x5f\x3a\x38\x6d\x77\x2e\xf9\x6e\xd5\x66\x22\xa1\x00\x20\x07\x95\
+\xd5\xb6\x1c\xe1\x16\x7d\x46\x6e\x9f\x91\xf4\x31\xf1\x4c\x7a\x00\
+\xbd\x67\xbb\x4b\x1d\x81\xfb\x2d\x5d\x45\x89\x5f\x72\xdd\x00\x05\
+\x00\x03\x6c\x62\xd8\xb4\x5f\x94\xb1\xff\x2b\xb7\x2f\x49\x7e\x26\
+\x6b\x0e\xa0\x1f\x74\xba\x6b\x99\x99\xff\xf7\x96\x6d\x23\x6e\xe7\
+\xd1\xc8\x14\x00\xf4\x93\xf2\xf2\x45\x89\xf5\x27\x6c\xf9\xb8\xb9\
+\x4f\x95\xf4\x39\x49\x83\x49\x05\xc0\x40\x4d\x06\x24\xbb\xdd\x14\
+\xfd\xf8\xb5\x57\xb2\x77\xf2\x18\x64\x0a\x00\xfa\xe2\x68\x7f\xce\
+\xfc\x93\x23\x4f\x5e\x2c\xf7\x4b\x25\x1d\x44\x22\x00\x72\xcc\xeb\
+\x92\x7e\xe5\x66\x37\xb5\xd7\x55\x74\xf0\x20\x23\x0a\x00\xf6\x41\
+\xc9\xcc\xc6\x91\x96\x4a\x5c\x6a\x6e\x95\x2e\x7d\x90\x44\x00\xe4\
+\x89\x67\x5c\x76\x73\x60\xd9\x96\xd6\xba\x69\x4f\x13\x07\x05\x00\
+\x7b\xe8\xfc\xd9\xcd\x27\x64\x5d\x97\x49\xaa\x94\x34\x8c\x44\x00\
+\xe4\xa9\xc8\xa4\x15\x2e\x9f\xff\xfa\x2b\xd9\x5b\x39\x45\x40\x01\
+\xc0\x2e\x84\x61\x18\xdc\x93\x3e\xfc\x02\xc9\xae\x70\x69\x02\xeb\
+\x07\xa0\xc0\x36\xa4\x75\x6e\x76\x63\x56\xc1\x02\x1e\x58\x44\x01\
+\x80\xa4\xb2\xf0\xa6\x03\xbd\xab\xab\x42\x66\xff\x4f\xd2\x51\x24\
+\x02\x20\x2e\x53\x81\x51\xa9\x11\xb7\x2d\x0e\xa7\x74\x11\x09\x05\
+\x20\x56\xce\xbf\x6a\xe1\xd1\xd9\x44\x34\x53\x52\x85\xa4\x62\x12\
+\x01\x10\x43\x2f\xc9\xec\x06\xcf\x68\x7e\xfb\xd5\x95\x6b\x88\x83\
+\x02\x50\xd0\x4a\xae\x6a\x39\x56\x09\x9f\x69\xdd\x1b\x7f\x8a\x44\
+\x00\x40\x91\x4b\x77\xc8\xec\x07\xed\x75\x95\xed\xc4\x41\x01\x28\
+\xac\x8d\x7f\xce\xc2\x53\x2d\x8a\xbe\x21\xe9\x0b\x92\x12\x24\x02\
+\x00\xbb\xdc\xba\x1e\x74\xf7\xeb\x32\x45\x6b\xff\x7b\x65\x18\x66\
+\xc8\x83\x02\x90\xb7\x26\xcc\x6a\x3e\xcb\x02\xd5\x98\x74\x01\x6b\
+\x02\x00\x7b\x6c\x8d\xc9\x7e\xd0\x95\xda\xde\xb2\x32\xfc\xca\x16\
+\xe2\xa0\x00\xe4\x8d\xb2\x59\x0b\x4f\xf4\xc0\xbf\x23\x79\x39\x69\
+\x00\xc0\x5e\xdb\x24\xe9\x06\x93\x5d\xdb\x5a\x5f\xb9\x96\x38\x28\
+\x00\x39\xab\x34\x6c\x3e\x54\x69\xff\xb6\x64\x15\x62\xd4\x0f\x00\
+\xbd\xa5\xcb\x4c\x3f\x93\xdb\x6c\x8a\xc0\xee\x25\x89\xa0\xff\x8c\
+\x0f\xaf\x1f\x96\xea\x2a\xfe\x8a\xa7\x55\x6b\xb2\xe1\x24\x02\x00\
+\xbd\xaa\xc8\x5d\x53\x5d\xbe\x44\x12\x05\x80\x02\x30\xf0\xc6\x4e\
+\x6f\x4c\xed\x7f\x40\xaa\xc2\xd3\xfe\x1d\x99\x0e\x62\xec\x02\x00\
+\x7d\x27\x90\x73\xdf\x00\x0a\xc0\xc0\x2b\xab\x59\x50\xea\x16\x5c\
+\xef\xf2\xf7\x93\x06\x00\xf4\xbd\xc8\x03\x0a\x00\x05\x60\xe0\x4c\
+\xa8\x59\x70\x50\x60\xc1\xbf\xba\x74\x31\x69\x00\x40\x7f\x8e\x00\
+\xb2\x9d\x84\x40\x01\x18\x00\x6e\x25\x35\x2d\x17\x9b\xe9\x7b\x92\
+\xf6\x27\x0f\x00\xe8\xe7\xdf\xc2\xd9\x80\x02\x40\x01\xe8\xf7\xa3\
+\xfe\x0f\x26\x82\x96\xff\x72\xd7\x59\xa4\x01\x00\x03\xb4\xb1\x99\
+\x51\x00\x28\x00\xfd\x63\x72\xd8\x38\x64\x47\x26\xf9\x1d\xb9\xbe\
+\xe6\x4e\xa6\x00\x30\xa0\x13\x00\x45\x5c\x03\x40\x01\xe8\x7b\x25\
+\x73\x16\x9e\xba\x23\x1d\xfd\x44\xd2\xa9\xa4\x01\x00\x39\x50\x00\
+\x82\x04\x13\x80\x3d\x10\x10\xc1\x5e\xbf\xc5\xac\x74\x76\xd3\xd7\
+\x2c\x8a\x7e\xc7\xe6\x0f\x00\xb9\x23\xeb\x59\x26\x00\x4c\x00\xfa\
+\xe8\xa8\x7f\x66\xe3\x91\x96\x6a\xb9\x49\x6e\xe7\x92\x06\x00\xe4\
+\x96\x28\xc5\x04\x80\x09\x40\x1f\x28\xad\x6d\x2a\xb7\x64\xea\x61\
+\xb9\xd8\xfc\x01\x20\x07\x15\x8b\x09\x00\x13\x80\x5e\x34\x29\xbc\
+\x79\x44\x26\xd3\xd9\x28\xd7\xe7\x25\x27\x10\x00\xc8\x51\x9d\xea\
+\xa4\x00\x50\x00\x7a\xc7\xc4\xab\x9a\x8e\xcb\xa4\xbb\x6e\x95\x74\
+\x32\x69\x00\x40\xae\x7b\x65\x07\x19\xec\x1e\xb7\xa5\xdf\x8d\xb2\
+\x9a\xe6\x49\x6e\xfa\x6f\x49\xa3\x48\x03\x00\x72\x5e\xd4\x56\x5f\
+\xc5\x53\x56\xf7\x00\xd7\x00\xbc\x2b\xb7\xd2\x9a\xa6\x99\x6e\xba\
+\x9d\xcd\x1f\x00\xf2\x06\xe3\xff\x3d\xc4\x29\x80\x5d\x1d\xf5\x7f\
+\xfd\xa6\xa1\x5e\xbc\x70\xa1\x64\xe5\xa4\x01\x00\x79\x85\x4f\x00\
+\x50\x00\xf6\x72\xf3\xaf\x6d\x39\xc2\x95\xb9\x45\xf2\xb1\xa4\x01\
+\x00\x4c\x00\x28\x00\x71\xd8\xfc\xe7\x2c\x18\xeb\x91\xdf\x21\xe9\
+\x40\xd2\x00\x80\x3c\xe4\x4c\x00\xf6\x14\xd7\x00\xec\x54\x32\x7b\
+\xc1\x78\x8f\x82\x15\x6c\xfe\x00\x90\xc7\x8c\x09\x00\x05\xa0\x27\
+\x9b\x7f\x6d\xcb\x27\xcd\x83\x65\x92\x46\x90\x06\x00\xe4\x35\x26\
+\x00\x14\x80\x3d\xdc\xfc\x6b\x9a\xa7\x9a\xfc\x7f\x24\x0d\xe2\xed\
+\x00\x00\xf9\xce\x29\x00\x14\x80\xdd\x2b\x9d\xdd\xf4\x35\x33\xdd\
+\x20\xae\x85\x00\x80\x02\x61\x9c\x02\xa0\x00\xec\x6e\xf3\x6f\xbe\
+\x56\x6e\xff\x2e\x6e\x86\x04\x00\x85\x84\x02\x40\x01\x78\xcf\x23\
+\xff\x06\xb9\xfe\x99\xe5\x07\x80\x82\xc3\x29\x80\x3d\x14\xbb\xd1\
+\x77\x49\x6d\xf3\x3f\xc9\x35\x8b\xa5\x07\x80\x42\xc4\x35\x00\x4c\
+\x00\x76\xa1\xac\xb6\xe9\x32\x93\xbe\xcf\xb2\x03\x40\x81\x6e\xff\
+\xce\x35\x00\x14\x80\xbf\x53\x5a\xdb\x74\xb1\xcb\x7e\xc8\x92\x03\
+\x40\x01\x33\x26\x00\x14\x80\xb7\x1e\xf9\xcf\x6e\xfa\x94\x64\x2d\
+\xe2\x63\x8f\x00\x50\xd8\x9b\x9a\x19\x05\x80\x02\xd0\xad\xa4\xa6\
+\x65\xa2\xbb\xfd\x5c\x7c\xd4\x0f\x00\x0a\x9e\xbb\x73\x0a\x80\x02\
+\x20\x4d\x9c\x33\xff\x64\x33\xff\xb9\xa4\x22\x96\x1a\x00\xe2\xd0\
+\x00\x98\x00\xc4\xbe\x00\x4c\xac\x69\x3c\x24\xf2\xe4\x1d\x92\x46\
+\xb2\xcc\x00\x10\x93\xfd\x5f\x4c\x00\x62\x5d\x00\x26\x87\x8d\x43\
+\x22\x4b\x2e\x91\xfb\x91\x2c\x31\x00\xc4\x87\x05\x01\x05\x20\xce\
+\x05\x60\x47\x3a\xf5\x23\x49\xa7\xb3\xbc\x00\x10\xb7\x11\x40\xc4\
+\x29\x80\xb8\x16\x80\xb2\xd9\x2d\x57\x4a\x7e\x09\x4b\x0b\x00\xb1\
+\x9c\x01\x50\x00\xe2\x58\x00\xca\x6a\x5b\xce\x76\xf7\xab\x59\x56\
+\x00\x88\xe9\x00\x80\x6b\x00\xe2\x57\x00\x26\xd4\x2c\x38\x48\xf2\
+\x5f\x88\x2b\xfe\x01\x20\xc6\x9b\x1a\xd7\x00\xc4\xac\x00\xb8\x99\
+\x05\x4d\x2e\x1d\xcc\x92\x02\x40\x8c\x27\x00\xc6\x35\x00\x7b\xaa\
+\x20\x6e\x8e\x53\x5a\xbb\xf0\x1b\x92\x2e\x64\x39\x01\x20\xe6\x22\
+\xae\x01\x88\xcd\x04\xa0\xb4\xb6\xf9\x74\xc9\xeb\x58\x4a\x00\x00\
+\xd7\x00\xc4\xa4\x00\x4c\xba\xfc\xba\x62\xc9\x6e\x90\x94\x62\x29\
+\x01\x00\xe2\x59\x00\xf1\x28\x00\xd9\x11\xc3\xea\x24\x3f\x99\x65\
+\x04\x00\x48\x3c\x0c\x28\x16\x05\x60\xc2\xac\xe6\xb3\x5c\x7e\x25\
+\x4b\x08\x00\x78\x03\xa7\x00\x0a\xbc\x00\x94\x87\x8b\x8a\x82\x40\
+\x4d\x92\x12\x2c\x21\x00\xe0\x4d\x59\x26\x00\x05\x5d\x00\xd6\x77\
+\x6d\x9e\x25\xe9\x24\x96\x0f\x00\xf0\x56\x11\x13\x80\xc2\x2d\x00\
+\xa5\xb3\x17\xbe\xdf\x4c\x57\xb1\x74\x00\x80\xbf\x97\xe4\x1a\x80\
+\x02\x9e\x00\x78\xf4\x5f\x92\x06\xb1\x74\x00\x80\x77\x6c\x11\x8a\
+\x98\x00\x14\x62\x01\x28\x9b\xdd\xf2\x39\x49\xe7\xb1\x6c\x00\x80\
+\x5d\x16\x80\x20\xc1\x04\xa0\xd0\x0a\xc0\xa4\xcb\xaf\x2b\x76\xf7\
+\x79\x2c\x19\x00\xe0\x5d\x0b\x40\xba\x8b\x02\x50\x68\x05\x20\x33\
+\x62\xe8\x3f\x4b\x3a\x8e\x25\x03\x00\xbc\xeb\x5e\x31\xb8\x88\x53\
+\x00\x85\x54\x00\xca\xc2\x9b\x0e\x74\x71\xe1\x1f\x00\xe0\xbd\x15\
+\x2b\x4b\x01\x28\xa4\x02\xe0\xe9\x74\xad\x49\xc3\x59\x2e\x00\xc0\
+\x7b\xee\x17\x5b\x8a\x38\x05\x50\x28\x05\xa0\x64\x66\xe3\x91\x92\
+\x66\xb0\x54\x00\x80\xdd\xe9\x1a\xb6\x86\x02\x50\x28\x05\xc0\x92\
+\xc9\x50\x52\x31\x4b\x05\x00\xd8\x8d\x68\x65\x18\x66\x88\xa1\x00\
+\x0a\xc0\x79\xb3\x6f\x78\x9f\xa4\x8b\x59\x26\x00\xc0\x9e\x0c\x00\
+\x88\xa0\x40\x0a\x40\xd2\xb3\x33\x25\x25\x59\x26\x00\xc0\x1e\x60\
+\xfc\x5f\x08\x05\xe0\xbc\xda\x1b\x0f\x73\x69\x2a\x4b\x04\x00\xa0\
+\x00\xc4\xa8\x00\x24\x95\xf9\xba\x38\xf7\x0f\x00\xd8\x53\xce\x29\
+\x80\xbc\x2f\x00\xe3\xc3\x85\xa3\x5c\xaa\x66\x79\x00\x00\x7b\xca\
+\xcc\x99\x00\xe4\x7b\x01\x48\xa6\xb3\xd5\x92\x86\xb1\x3c\x00\x80\
+\x3d\x1f\x00\x18\x13\x80\x7c\x2e\x00\xe5\xe5\x8b\x12\x26\xbb\x8c\
+\xa5\x01\x00\xf4\xb0\x02\x30\x01\xc8\xe7\x02\xb0\xf1\x84\x2d\x9f\
+\x96\x74\x0c\x4b\x03\x00\xe8\x19\x26\x00\x79\x5d\x00\xdc\xfd\xcb\
+\x2c\x0b\x00\xa0\xc7\xfb\x07\xd7\x00\xe4\x6f\x01\x28\x9b\xbd\xe0\
+\x18\x49\x1f\x67\x59\x00\x00\x3d\xde\xd0\xdc\x28\x00\xf9\x3b\x01\
+\xb0\x2a\xe5\xd1\x23\x8a\x01\x00\x39\x34\x01\x90\x73\x0a\x20\x1f\
+\x0b\xc0\xf8\x30\x4c\xba\xdb\xa5\x2c\x09\x00\x60\x2f\x0f\x22\x99\
+\x00\xe4\x63\x01\x28\xea\x3a\xa2\x54\xd2\x61\x2c\x09\x00\x80\x09\
+\x40\x8c\x0a\x80\x07\xfe\x05\x96\x03\x00\xb0\xd7\x1b\x9a\x31\x01\
+\xc8\xbb\x02\x30\x39\x6c\x1c\x22\xb7\x4f\xb1\x1c\x00\x80\xbd\x3e\
+\x90\x74\x26\x00\x79\x57\x00\x3a\xbb\x12\x17\x89\x3b\xff\x01\x00\
+\xf6\xa9\x01\x30\x01\xc8\xbb\x02\x10\xc9\xfe\x0f\x4b\x01\x00\xd8\
+\xa7\xfd\x9f\x6b\x00\xf2\xab\x00\x4c\x0e\x1b\x87\x98\xa9\x8c\xa5\
+\x00\x00\xec\xd3\x86\xc6\x35\x00\xf9\x55\x00\x3a\x33\x89\x32\x49\
+\x43\x58\x0a\x00\xc0\x3e\x31\x51\x00\xf2\xa9\x00\xb8\xdb\x27\x59\
+\x06\x00\xc0\xbe\xef\x27\xe2\x14\x40\xbe\x14\x80\xf2\xf2\x45\x09\
+\x49\x17\xb0\x0c\x00\x80\x7d\x2e\x00\x5c\x03\x90\x3f\x05\x60\xe3\
+\x89\x5b\x4e\x97\x74\x00\xcb\x00\x00\xd8\x67\x5c\x03\x90\x3f\x05\
+\xc0\xb3\xce\xc5\x7f\x00\x80\xde\xd9\xd0\xf8\x18\x60\xfe\x14\x00\
+\x05\x9a\xc8\x12\x00\x00\x7a\xe5\xa0\x92\x1b\x01\xe5\x47\x01\x98\
+\x14\xde\x3c\x42\xae\x33\x58\x02\x00\x40\xaf\xe0\x14\x40\x7e\x14\
+\x80\x6c\x7a\xc7\xb9\x92\x52\x2c\x01\x00\xa0\x57\x26\x00\x5c\x04\
+\x98\x1f\x05\x20\x32\x3b\x87\xf8\x01\x00\xbd\xb6\xa1\x31\x01\xc8\
+\x8f\x02\x60\x4e\x01\x00\x00\x30\x01\x18\x28\xc9\x81\xf8\xa2\x93\
+\xc3\xc6\x21\x3b\xd2\xfe\x0f\xc4\x0f\xc4\xda\xb6\x9d\x7f\x36\x99\
+\xb4\xc5\x65\xdb\x4c\xbe\x45\xf2\xad\xae\xa0\x4b\xf2\x8c\x4b\x9b\
+\xbb\x8f\x54\x6c\x93\x9b\xb2\xf2\xa8\x53\xae\x6d\xdd\x47\x11\x81\
+\x9b\xb4\xe1\xdd\x37\x83\x68\xbb\xa4\x1d\xbb\x3c\x00\xb1\xc0\xa3\
+\x5d\xfc\xb3\xe6\xd1\xe8\xb7\xfc\xc7\x41\xa6\x60\xf0\xce\x8d\x25\
+\x90\xfb\x48\x33\x1b\x25\xf7\x91\x91\xd9\x08\x49\x23\x4d\x1a\x21\
+\xf9\x08\xc9\x46\xba\x34\xc6\xa4\xe1\x2c\xeb\x40\x16\x80\x88\x02\
+\x90\xeb\x05\x60\x7b\x26\x38\xc3\xa4\x22\xe2\x07\xf2\xfd\x17\xae\
+\x36\x9b\xf4\x82\xa4\x57\xe5\x7a\x5d\x66\xeb\xdd\xa3\xd7\x4d\xb6\
+\x5e\x81\x5e\xf7\xc8\xd7\x7b\xa0\xd7\x93\xae\xd7\x23\x4b\xac\x57\
+\x32\xda\x5a\xb4\xa3\x73\xfb\xaf\xae\xbe\x6c\x7d\x21\xe6\x71\xd6\
+\x95\x8b\x06\x0f\x1f\xba\xf1\x60\x79\xe2\x10\x59\x74\xa0\xcb\x0e\
+\x93\xfb\x81\x26\x3b\x24\x92\x0e\x31\xd9\x31\x92\x1f\x2b\x69\x30\
+\xef\x9e\x3e\x78\x3f\x66\x03\x4e\x01\xe4\x7a\x01\x30\x4f\x9c\x21\
+\x39\xe9\x03\xb9\xed\x05\x37\x5f\x63\x6e\xcf\xb8\x69\x9d\x5c\x7f\
+\x0d\xdc\xd7\x99\x27\x5e\x88\x12\x5a\x37\x28\xd9\xf5\xc2\xd2\x70\
+\xc6\x36\x62\xfa\x9b\x7b\xbf\x3f\x65\xbb\xa4\xa7\x77\xfe\x79\x57\
+\xe3\xc3\x85\x07\x17\xa5\xfd\x58\xc9\x8f\x71\xd7\xb1\x32\x1d\x23\
+\xd3\xb1\x72\x9d\x2c\x69\x0c\x49\xee\xe5\x86\xc6\x35\x00\xb9\x5f\
+\x00\x24\x9d\x4e\xf4\xc0\x80\x8b\x24\xad\x96\xfc\x2f\xe6\xb6\x3a\
+\x32\xad\x09\xe4\xab\xb3\x51\xb0\x3a\x5b\x6c\x6b\x56\x86\x15\x3b\
+\x88\xa8\x6f\xac\x0c\x2b\xd6\x49\x5a\x27\xe9\x9e\x77\x96\x83\xc6\
+\x31\xc9\x4c\x70\x8a\x94\xf8\x80\x45\x7e\xb2\x4c\x1f\x90\x74\xb2\
+\xa4\x83\x48\x6e\x37\x13\x00\x4e\x01\xe4\x43\x01\x70\x0a\x00\xd0\
+\xaf\xbf\x18\xb5\xd9\xa4\x3f\x99\xfb\x1f\x3c\xd0\x1f\xdc\xfd\x0f\
+\x41\x67\xf1\x9f\x5a\xaf\x9d\xba\x95\x74\x72\xad\x1c\xcc\x78\x55\
+\xd2\xca\x9d\x7f\xde\x5e\x0c\xba\x52\x63\xcd\x7c\xac\xdc\xc6\xca\
+\x7c\xac\xa4\xa3\x48\xec\x2d\xef\xf3\x20\xc1\x04\xa0\x07\xac\xbf\
+\xbf\xe0\xf8\xb0\x71\x4c\x2a\x9d\x7c\x85\xe8\x81\xbe\xdc\xef\xf5\
+\x88\x5c\xbf\x31\xf9\xaa\x4c\x90\xfc\xed\x8a\xba\x4b\xd6\x48\xc6\
+\x79\xb7\x02\xf3\xd6\x52\x60\xf2\x33\x5c\x76\xb6\x62\xfc\x7c\x95\
+\xac\xfc\xe8\x15\xf5\xd5\xcf\xf2\xce\xc8\xd1\x09\x40\x2a\x93\xe4\
+\xea\x7f\xa0\xb7\x7f\xef\xc9\x1e\x36\xf9\x5d\x91\x6c\xa5\x47\x89\
+\x55\x1d\xf3\x2e\x79\xed\xed\x7f\xcb\xa5\xa4\x54\xb8\xd3\x82\xe5\
+\x3b\xff\x48\x92\xca\x66\x2d\x3c\x51\x89\x68\x9c\xbb\x3e\x26\x69\
+\x9c\xa4\xf7\xc7\x25\x8f\x28\xc5\x04\x20\xa7\x0b\x80\xc9\x4e\x76\
+\x2e\x00\x04\xf6\xd5\x0e\xb9\x5a\x5d\xfa\x45\x71\xd4\xb9\xb4\x50\
+\xaf\xaa\x47\xcf\xb5\xce\xab\x78\x5c\xd2\xe3\x92\x9a\xbb\xa7\x04\
+\x0b\x0f\x4e\xa6\xa3\x71\x92\xce\x33\xa9\xb4\x90\x0b\x41\xb1\xb2\
+\x5c\x03\x90\xcb\x05\x20\x72\x9d\x62\xe4\x0e\xec\x8d\xed\x2e\x75\
+\xc8\xb5\x38\x55\x54\x7c\xeb\xb2\xf0\x4b\x9b\x88\x04\xbb\x9f\x12\
+\x54\xac\x93\xf4\x8b\x9d\x7f\x34\x3e\x5c\x78\x70\x2a\x9d\x3d\xc7\
+\x65\x25\xe6\xba\x50\xa6\x43\x0b\xe5\x7b\x2d\x52\x96\x0b\x57\x73\
+\x7b\x02\xa0\x93\x88\x1d\xe8\xd1\x0f\xcd\x6f\x3c\xf2\xf9\x83\x8b\
+\xb2\xb7\xf2\xb1\x3b\xf4\x52\x21\x58\x2c\x69\x71\x18\x86\xc1\xbd\
+\x5d\x47\x7e\xd8\x15\x4d\x74\x0b\x2e\x92\xfc\x0c\x0d\xf4\x53\x62\
+\xf7\xc1\x5f\xff\xaa\x34\x2b\xdc\xa3\xfd\xb8\x3f\xb9\x95\xd6\xb6\
+\x6c\x90\x34\x82\xe8\x81\xf7\xb4\xc3\xdc\x17\x46\x81\xff\xb0\xbd\
+\x6e\xda\x63\xc4\x81\xfe\x50\x16\xde\x74\xa0\xba\xba\x2e\x8c\x64\
+\x93\xcd\x54\x2a\x69\x68\x1e\xbd\xfc\xa8\xad\xbe\x2a\xc1\x2a\xe6\
+\x68\x01\x38\xaf\xf6\xc6\xc3\x12\xca\x3c\x4f\xec\xc0\xbb\xda\x22\
+\xb3\xeb\xa3\x28\xfb\xfd\x8e\x86\x69\x2f\x11\x07\x06\xca\xf8\x70\
+\xe1\xa0\x54\x46\xe7\xb9\x47\x9f\x34\xe9\x33\xca\xfd\x1b\x14\xed\
+\x68\xab\xaf\xe2\x0e\x8b\x3d\xd0\xaf\xa7\x00\x12\x51\xf6\xb8\xfc\
+\x1d\x2e\x01\x7d\x7b\xf4\x22\xe9\x27\x81\x67\x66\x2e\xaf\x9f\xf1\
+\x22\x71\x60\xa0\xed\xbc\x11\xd4\x1d\x92\xee\x28\x2f\x5f\x74\xd9\
+\xfa\xe3\x37\x9f\x65\x52\xb9\xa4\xcf\x4b\x3a\x30\x07\x5f\x32\x9f\
+\x00\xc8\xe5\x02\xe0\x09\x1d\xcb\x27\x91\x81\x77\x78\xc0\x83\xa0\
+\xba\x7d\x6e\xc5\x9f\x88\x02\xb9\x68\xf1\xe2\x29\x59\x49\xab\x24\
+\xad\x1a\x3b\xbd\xf1\xeb\xa3\x0e\x4c\x4c\x08\xdc\xa6\x48\xfa\xb4\
+\xa4\x51\x14\x00\x0a\xc0\x6e\x05\x8a\xde\xe7\xe2\x33\x00\xc0\xdf\
+\x7e\x61\xd9\xbf\x8c\x7a\x72\xd8\xbf\xed\xfc\x05\x0b\xe4\xbc\x07\
+\xe7\xcf\x48\x4b\xba\x53\xd2\x9d\xe3\xc3\x85\x97\x15\xa5\xfd\x93\
+\xae\x68\xaa\x64\x13\x25\x0d\xdc\x39\x78\x17\x1f\x01\xcc\xe5\x02\
+\x10\xb9\x8e\x63\xfb\x07\x24\xb9\x9e\x77\x8b\xca\xdb\xeb\xa7\xdd\
+\x47\x18\xc8\x57\x3b\x4f\x13\xfc\x5c\xd2\xcf\x27\xd6\x34\x1e\x12\
+\x05\x89\x29\x72\xbb\x44\xd2\x69\xfd\xfd\x5a\xcc\x9c\x09\x40\x2e\
+\x17\x00\x53\x70\x14\x4f\x01\x44\xec\x99\xee\x4e\xa7\x32\x9f\xda\
+\x79\x17\x37\xa0\x20\x2c\x6f\x98\xf1\xa2\xa4\x1f\x48\xfa\x41\x69\
+\x6d\xf3\xe9\x72\xab\x96\xf9\x17\x25\x0d\xeb\x9f\x4e\x6d\x4c\x00\
+\x7a\xa8\x7f\x2f\xc9\x73\x3f\x9c\xc8\x11\xef\x03\x7f\xfd\x3a\x9d\
+\xdc\x71\x3e\x9b\x3f\x0a\x59\x5b\x7d\xd5\xef\xda\x1a\x2a\xbf\x3c\
+\x38\xad\x43\x4d\x36\x43\xd2\x1f\xfa\xe1\xa7\x8b\x09\x40\x8f\x8f\
+\x45\xfa\x49\x18\x86\xc1\xdd\xe9\x23\x76\x48\x4a\x11\x3b\x62\x6a\
+\x45\x72\xd3\xd6\x4f\x2c\xfb\xe1\x15\xfc\xa2\x42\xec\x4c\x9c\xb5\
+\xf0\x1c\x4f\xf8\x97\xdd\xfd\xb3\x92\x8a\xfb\xe0\x4b\x3c\xd0\x56\
+\x5f\x75\x26\x49\xe7\xe0\x04\xe0\xde\xae\x43\x0e\x62\xf3\x47\x8c\
+\x3d\x56\x94\xed\xfc\x1c\x9b\x3f\xe2\x6a\xf9\xbc\x8a\xbb\x5a\xeb\
+\x2a\xbf\x68\xa9\xd4\x91\x66\xfa\xb6\xa4\x5e\x9d\x82\x39\xd7\x00\
+\xe4\x6e\x01\xf0\x44\x70\x28\x71\x23\xa6\xb6\x27\x4c\x9f\xe6\x81\
+\x3d\x80\xd4\x1a\x4e\x7d\xb9\xb5\xae\x2a\x1c\x94\xca\x1c\x25\xe9\
+\xff\x49\x7a\xb2\x37\xfe\x7f\xcd\xb9\x06\x20\x67\x0b\x40\x94\xb5\
+\x83\x89\x1b\x71\x64\x66\xb5\x77\xd6\x55\x3d\x41\x12\xc0\xdf\x2c\
+\x0d\x67\x6c\x6b\xab\xaf\xfa\xaf\x71\xa9\xb5\x1f\x90\xe9\x93\xea\
+\xbe\xcf\xc0\xbe\x1c\x66\x32\x01\xe8\xa1\x7e\xfb\x14\x40\x60\x1a\
+\xc3\xf5\xff\x88\xdd\xe6\x2f\xfd\xf1\xec\xe4\x73\x3f\x68\x25\x0a\
+\x60\x97\xc2\x30\x8c\x24\x2d\x91\xb4\xa4\x74\x56\xcb\xb9\x0a\xfc\
+\x5f\x24\x9d\xd7\xe3\xed\x9f\x09\x40\xee\x4e\x00\xdc\x6d\x0c\x71\
+\x23\x7e\x0d\xc0\xbf\xb5\xf3\x17\x1c\x80\xdd\x68\x9b\x57\xf9\x9b\
+\xb6\xfa\xaa\x09\x26\x1b\xe7\xd2\xed\xea\xc1\xe7\xc6\x2d\x10\x8f\
+\x02\xce\xd5\x02\x20\xd3\x7e\xc4\x8d\x98\x79\xac\xb5\xae\xea\x36\
+\x62\x00\x7a\xa6\xb5\xbe\xf2\x9e\xf6\xfa\xaa\xc9\x81\xfc\xa3\xd6\
+\x7d\xd7\xc1\x3d\xd8\x62\xb8\x13\x60\xee\x4e\x00\x72\xff\x49\x52\
+\x40\xef\xbe\xe7\xdd\x7e\x22\xf1\xf4\x0b\x60\x6f\x2d\xaf\xaf\x7e\
+\xa0\xb5\xbe\x6a\x92\xc9\xc6\xb9\xf9\x5d\xbb\xd9\x64\xb8\x06\x20\
+\x57\x0b\x80\x59\xce\x3c\x30\x02\xe8\x17\x51\x10\xfc\x8c\x14\x80\
+\x5e\x9a\x08\xd4\x55\x9d\xeb\x16\x7d\x56\xd2\xe3\xbb\x2e\xdc\x4c\
+\x00\x72\xb6\x00\xc8\x35\x9c\xb8\x11\x23\x2f\xac\xa8\xbb\x74\x35\
+\x31\x00\xbd\x76\x18\xe9\xed\x75\xd3\x7e\x99\x4e\xad\x3d\xd5\x4d\
+\xd3\x25\xbd\xfc\xf6\x2d\xc6\x29\x00\xb9\x5a\x00\xdc\x7c\x18\x71\
+\x23\x36\xbf\xaa\x24\x1e\xf2\x03\xf4\x81\x95\x61\x98\x69\xaf\xab\
+\x5a\x90\x4e\xed\x78\xdf\xce\x1b\x0a\x75\x49\x52\x60\xc6\x29\x80\
+\xdc\x9d\x00\xd8\x50\xe2\x46\x8c\x0e\x56\x1e\x27\x04\xa0\x2f\x8b\
+\xc0\x57\xb6\xb4\xd6\x55\x85\x6e\xd1\x87\x25\xb5\x32\x01\xe8\xb9\
+\xfe\x7c\x1a\x20\x05\x00\xf1\xe1\xc1\xcb\x84\x00\xf4\xbd\xf6\xba\
+\x69\x8f\x49\x9a\x38\x3e\x6c\xe4\x42\xf3\x5c\x9d\x00\x98\x53\x00\
+\x10\xab\x06\xf0\x1a\x19\x00\xfd\x39\x11\xe0\x09\x9b\x39\x5b\x00\
+\x64\x2a\x22\x6e\xc4\x07\xa7\xbc\x00\x50\x00\x06\xe2\x6b\x01\x03\
+\x7b\xfc\x2f\xf1\xec\x0b\x00\x14\x80\x9d\x47\x44\x09\xe2\x46\x8c\
+\x2a\xc0\x44\x32\x00\x40\x01\xe8\xfe\x85\xc8\x04\x00\x71\x72\x56\
+\xd9\xec\x05\xc7\x10\x03\x00\x0a\x80\xc4\x04\x00\x71\x62\xae\xa0\
+\x81\x18\x00\x50\x00\xb8\x06\x00\x71\xe3\xfa\x7c\xe9\xec\xe6\x32\
+\x82\x00\xc0\x04\x00\x88\x5f\x09\xf8\xe9\x84\x59\xf3\x8f\x27\x08\
+\x00\x4c\x00\x80\x78\xd9\x2f\x08\x12\x4b\xcf\xab\xbd\xf1\x30\xa2\
+\x00\x40\x01\x00\xe2\xe5\xf8\x84\x32\x77\x9f\x3f\xbb\xf9\x04\xa2\
+\x00\x10\xc7\x02\x90\x26\x6e\xc4\xd8\x51\x59\xd7\xaa\x09\xb3\x9b\
+\xce\x27\x0a\x00\x71\x2b\x00\x3b\x88\x1b\x31\x37\x26\x70\xbb\xa3\
+\xb4\xb6\xf9\x07\x63\xa7\x37\xa6\x88\x03\x40\x2c\x0a\x80\x51\x00\
+\x80\x9d\x3f\x0a\xba\x62\xbf\x03\x92\xbf\x9d\x58\xdb\x74\x06\x71\
+\x00\x28\xf8\x02\xe0\xd2\x76\xe2\x06\xde\xf4\xa1\x48\x76\x4f\x49\
+\x4d\xd3\xf7\x2e\xfa\x66\xf3\x70\xe2\x00\x50\xb0\x05\x40\x52\x27\
+\x71\x03\x6f\x93\x30\xb3\x2b\xb7\xa7\xf4\x74\x69\x4d\xd3\xcc\x49\
+\x97\x5f\x57\x4c\x24\x00\x0a\xb1\x00\x30\x01\x00\x76\x6d\x7f\x99\
+\x5d\x9d\x19\x31\xf4\x8f\x65\x35\x4d\x9f\x2f\x2f\x5f\xc4\x3d\x33\
+\x00\x14\x4e\x01\x30\xe3\x1a\x00\x60\x37\x8e\x77\xb3\x9f\x6e\x38\
+\x7e\xf3\x5f\x4a\x67\x37\x7d\x8d\x89\x00\x80\x82\x28\x00\x91\x53\
+\x00\x80\x3d\x74\x8c\xdc\xfe\x3d\x33\x62\xe8\x13\xa5\xb5\xcd\xff\
+\x5f\xc9\xcc\xc6\x91\x44\x02\x20\x6f\x0b\x80\xa4\xad\xc4\x0d\xf4\
+\xc8\x51\x92\xfe\x4d\xc9\xe4\xda\xb2\x9a\xe6\xeb\x4a\x67\x2f\x7c\
+\x3f\x91\x00\xe8\x2d\xd6\x5f\x5f\xa8\x6c\x76\xf3\x8d\xee\x9a\x4a\
+\xe4\xc0\x3e\xfd\xc8\x3e\x68\xd2\xfc\xae\xd4\xf6\xff\x5e\x19\x7e\
+\x65\x0b\x79\x00\xc8\xf9\x09\x80\xbb\x5e\x25\x6e\x60\x9f\x7f\x92\
+\xc6\xba\xbc\x31\x95\x1e\xf4\x42\x69\x6d\xf3\x4d\x25\xb3\x5b\x4a\
+\x24\x37\x72\x01\x90\xb3\x13\x80\xd2\xda\xe6\x1a\x49\xf5\x44\x0e\
+\xf4\xba\xc7\xe5\x7e\x43\x24\xbf\xa1\xa3\x61\xda\x4b\xc4\x01\x20\
+\xb7\x0a\xc0\xec\xa6\x19\x72\xfb\x2f\x22\x07\xfa\x4c\x5a\xb2\x3b\
+\xe5\x5a\x94\x2c\x2a\x5a\xb2\x2c\xfc\xd2\x26\x22\x01\x30\xe0\x05\
+\xa0\x6c\x76\xcb\xe7\xdc\x7d\x31\x91\x03\xfd\xa2\xd3\xa5\x36\xb9\
+\x16\x2b\x9b\xb9\xad\xfd\x9a\x19\x1b\x89\x04\xc0\x80\x14\x80\x89\
+\x35\xcd\x1f\x8f\x4c\x2b\x88\x1c\x18\xb8\x32\x90\x2a\x2a\xbe\x95\
+\xc9\x00\x80\x7e\x2d\x00\x25\x73\x16\x9e\x6a\x51\xf4\x47\x22\x07\
+\x06\xd4\x0e\x93\x2f\x8f\xdc\x7e\x99\x29\xca\xdc\xb1\x32\x9c\xc1\
+\xc5\xb9\x00\x05\xa0\xaf\x27\x00\x8d\x87\x44\x96\xfc\x2b\x91\x03\
+\x39\x23\x2b\xe9\x5e\xc9\x96\x5a\x64\x4b\x5a\xe7\x55\x3c\x4e\x24\
+\x00\x05\xa0\xd7\x85\x61\x18\xdc\x9d\x3e\x62\xbb\xa4\x22\x62\x07\
+\x72\xd2\xd3\x2e\xb5\x05\xf2\xdb\x47\xa6\x46\x2c\x5f\x1c\x4e\xe9\
+\x22\x12\x80\x02\xd0\x2b\xca\x6a\x9b\x9e\x72\xd9\xfb\x88\x1d\xc8\
+\xf9\x5f\x0d\xeb\x25\xbf\xd3\xdc\x97\x58\x91\x5a\x97\x87\xd5\xaf\
+\x93\x09\x40\x01\xd8\x6b\xa5\xb5\xcd\x1d\x92\xce\x23\x76\x20\xaf\
+\x64\x25\x7b\x58\xa6\x76\x97\xda\xd7\xbf\x9c\xfe\xcd\x83\xf3\x67\
+\xa4\x89\x05\xa0\x00\xf4\xa4\x00\xb4\x48\xaa\x20\x76\x20\xaf\xbd\
+\x26\xd9\x0a\x93\xda\x25\x2d\x6b\xad\xaf\x5c\x4b\x24\x40\xfe\x49\
+\xf6\xe7\x17\x73\xd7\xb3\xc6\x4d\x4b\x81\x7c\xb7\xbf\xe4\xe5\x2e\
+\x95\xef\x2c\xf6\x6b\x24\xdd\xee\x66\x4b\x53\x1b\xb7\xdc\xb5\xec\
+\x87\x57\x74\x12\x11\xc0\x04\xe0\x6d\xca\x6a\x9b\x2e\x71\xd9\x0d\
+\xc4\x0e\x14\xac\x2d\x92\x7e\xe3\x52\x7b\xe0\xde\xde\xda\x50\xfd\
+\x67\x22\x01\x28\x00\x2a\x99\xbd\x60\xbc\x79\xf0\x6b\x62\x07\x62\
+\xe3\x65\xc9\x7e\x63\x52\x7b\x94\x49\xdf\xd9\x7e\xcd\x8c\xe7\x88\
+\x04\x88\x63\x01\x98\xd9\x78\xa4\x25\x93\xcf\x12\x3b\x10\x5b\x8f\
+\x4a\x6a\x37\x79\xfb\xa0\xb4\xad\x5c\xf2\xdd\xaa\xcd\x44\x02\xc4\
+\xa0\x00\x48\x6e\x25\xb5\x2d\x1b\x4d\x1a\x4e\xf4\x40\xec\x65\x64\
+\xba\xdf\xa4\x76\xb9\xaf\x18\x99\x1a\x71\x1f\xf7\x1e\x00\x0a\xb6\
+\x00\x48\xa5\x35\xcd\xf7\xc9\x74\x26\xd1\x03\xf8\x3b\xdb\x4c\xba\
+\x47\xa6\xbb\x23\xd9\x2a\x3e\x6e\x08\x14\x5a\x01\xa8\x6d\x6e\x92\
+\x54\x45\xf4\x00\x76\x63\x8b\x49\xf7\xb9\x7b\xbb\x25\xbc\xbd\x75\
+\x6e\xf5\xef\x25\x73\x62\x01\xf2\xb4\x00\x94\xcd\x6e\xb9\xd2\xdd\
+\xbf\x47\xf4\x00\x7a\xe8\x15\xc9\x56\x9a\xd4\x6e\x41\xe6\xee\xe5\
+\x73\xa7\x3f\x42\x24\x40\x3e\x15\x80\x9a\x05\xa5\x6e\x41\x2b\xd1\
+\x03\xd8\x47\x2f\x4a\xb6\x8a\x4f\x18\x00\x79\x52\x00\x78\x2a\x20\
+\x80\x3e\xb2\xc6\x77\x7e\xc2\x20\x8a\x52\x2b\x3a\xe6\x5d\xf2\x1a\
+\x91\x00\x39\x54\x00\x24\xa9\xb4\xb6\xf9\x15\x49\x63\x88\x1f\x40\
+\x7f\x14\x02\xcf\x64\x5b\xdb\xaf\x99\xb1\x91\x48\x80\x81\x2f\x00\
+\xcb\x25\x95\x11\x3f\x80\x7e\x92\x96\xe9\x01\xb9\x77\x98\xd4\xc1\
+\x47\x0e\x81\x01\x2a\x00\x65\xb3\x9b\x43\x77\x7d\x8b\xf8\x01\x0c\
+\x90\x6d\x26\xdd\xf3\xc6\x27\x0c\xce\x4e\xbc\xf0\x50\x18\x86\x11\
+\xb1\x80\x02\xd0\xd7\x13\x80\xd9\xcd\x65\x72\x2d\x27\x7e\x00\x39\
+\xe2\x55\xc9\x7e\x6d\x52\x7b\x94\x55\x7b\xfb\xd5\x95\x6b\x88\x04\
+\x14\x80\x3e\x30\x29\xbc\x79\x44\x26\xdd\xf9\xba\xa4\x04\x4b\x00\
+\x20\x07\xad\x91\x74\xb7\xc9\x56\x79\xca\x6f\x6f\x0b\xab\xb8\x70\
+\x19\x14\x80\x5e\x9b\x02\xd4\x36\xff\x51\xd2\xa9\x2c\x01\x80\x7c\
+\x28\x04\x6f\x5c\x50\x98\x4c\x0d\x5a\xbe\x2c\xfc\xd2\x26\x22\x01\
+\x05\x60\x2f\x95\xd4\x36\x37\x9a\x34\x9d\x25\x00\x90\x67\x32\x92\
+\xfd\x41\xa6\x76\x97\xda\x47\x27\x87\xfd\x2f\x17\x14\x82\x02\xd0\
+\x93\x09\x40\x4d\xf3\xa5\x32\x2d\x64\x09\x00\xe4\xb9\xad\x26\xdd\
+\xcb\x2d\x8b\x41\x01\xd8\x43\x65\xb3\x17\x1c\xe3\x1e\x70\xa1\x0d\
+\x80\x42\xf3\xa2\xcc\x3b\x14\x59\x47\xd6\x92\x6d\x2b\xea\x2f\x79\
+\x81\x48\x40\x01\xf8\xfb\x29\x40\x6d\xf3\x13\x92\x8e\x67\x19\x00\
+\x14\xb0\x35\x2e\xb5\x07\xf2\xdb\xbb\x52\x89\xb6\x95\x61\xc5\x0e\
+\x22\x41\xec\x0b\x40\x59\x4d\xf3\x75\x6e\xba\x9c\x65\x00\x10\x13\
+\xdb\x4d\xba\xfb\x6f\xa7\x0b\xa6\x3d\x48\x24\x88\x65\x01\x28\xa9\
+\x69\xba\xc0\xcc\x6e\x67\x19\x00\xc4\xf4\x17\xf0\x3a\x97\xda\x24\
+\x5f\x9a\xee\x9e\x0e\x6c\x20\x15\xc4\xa2\x00\x4c\x0e\x1b\x87\xec\
+\x48\x27\x5f\x93\x34\x88\xa5\x00\x10\x73\x19\x37\xbf\x57\x51\xb0\
+\x3c\x48\x64\xef\xe4\x62\x42\x14\x74\x01\x90\xa4\xd2\xda\x96\x56\
+\xc9\x4b\x59\x0a\x00\x78\x9b\x57\x24\xdd\x29\xf9\x52\xee\x3d\x80\
+\xc2\x2c\x00\x35\xcd\xff\x2c\xd3\xb5\x2c\x05\x00\xbc\xfb\x74\x40\
+\xa6\xfb\x15\xf9\x52\xf3\xc4\x6d\xad\xf3\x2a\x1e\x27\x12\xe4\x7d\
+\x01\x28\xb9\xaa\xe5\x58\x4b\xf8\x53\xb9\xf0\x5a\x00\x20\x4f\xac\
+\x91\x74\xbb\x9b\x2d\xe5\x46\x44\xc8\xdb\x02\x20\x49\xa5\xb5\xcd\
+\xbf\x95\x74\x3a\xcb\x01\x00\x3d\xfe\x35\xbe\x5e\xe6\xcb\xcd\x75\
+\x7b\x36\x4a\xde\xd9\x31\xef\x92\xd7\xc8\x04\x79\x53\x00\x4a\x6a\
+\x9b\xbe\x6e\xb2\x7f\x65\x39\x00\x60\x9f\x64\x65\xba\x4f\xf2\xc5\
+\xc9\xa4\xff\x62\x59\x38\xed\x79\x22\x41\x4e\x17\x80\xb2\xda\x96\
+\x23\x5c\xfe\xac\x38\x0d\x00\x00\xbd\xe9\x51\x33\x2d\x8e\x14\xfd\
+\xbc\xbd\x6e\xda\x63\xc4\x81\x9c\x2b\x00\x92\x54\x5a\xdb\x7c\xb7\
+\xa4\xb3\x59\x12\x00\xe8\x13\x7f\x96\xe9\x16\x57\xf4\x53\xca\x00\
+\x72\xaa\x00\x94\xd5\xb6\x5c\xe1\xf2\x1f\xb0\x24\x00\xd0\xf7\x93\
+\x01\xb9\xdf\x14\xc9\x6f\xe8\x68\x98\xf6\x12\x71\x50\x00\x06\xd4\
+\xc4\x9a\xc6\x43\x22\x4b\x3e\x27\x29\xc9\xb2\x00\x40\xbf\xc8\x48\
+\x5a\x6e\xee\x37\x6f\xde\x3e\xe2\xb6\x7b\xbf\x3f\x65\x3b\x91\x50\
+\x00\x06\x68\x0a\xd0\x74\xab\xcb\x3e\xc9\xb2\x00\x40\xbf\xdb\xe8\
+\xb2\x5f\x04\x81\xe6\xb7\xce\xad\xbc\x9f\x38\x28\x00\xfd\x5b\x00\
+\x6a\x9a\x27\xb9\xe9\x0e\x96\x05\x00\x06\xd4\x63\x32\x6f\x4c\x27\
+\x3b\x9b\x57\x86\x5f\xd9\x42\x1c\x14\x80\x3e\x17\x86\x61\x70\x77\
+\xfa\x88\xa7\x24\x1d\xc3\xd2\x00\xc0\x80\xdb\xe4\xd2\xcf\xdc\xa3\
+\xeb\x3b\x1a\xa6\xfd\x91\x38\x28\x00\x7d\x3c\x05\x68\x9a\xe5\x66\
+\x0d\x2c\x0d\x00\xe4\x94\xff\x75\xd7\xf5\xa3\xff\x32\xfc\x17\x8b\
+\x17\x4f\xc9\x12\x07\x05\xa0\xd7\x4d\xa8\x59\x70\x50\x60\xc1\x5a\
+\x49\x29\x96\x07\x00\x72\xce\xd3\x32\xff\xc1\xa0\x64\x76\xc1\xd2\
+\x70\xc6\x36\xe2\xa0\x00\xf4\xaa\xd2\xda\x96\x45\x92\x97\xb3\x3c\
+\x00\x90\xb3\x5e\x71\xd7\xf5\x99\xa2\xcc\xf5\x2b\xc3\x19\xaf\x12\
+\x07\x05\xa0\x57\x4c\xac\x6d\x3a\x23\x92\x71\x15\x2a\x00\xe4\xbe\
+\x6d\x92\xb5\x98\x65\xbf\xd7\x5a\x37\xed\x69\xe2\xa0\x00\xf4\xc2\
+\x14\xa0\xb9\x43\xd2\x79\x2c\x11\x00\xe4\x85\xb4\xa4\x9f\x79\xd6\
+\xc2\xf6\xab\x2b\xd7\x10\x47\xee\x0b\x72\xf5\x85\xb9\xd9\x3c\x96\
+\x07\x00\xf2\x46\x4a\xd2\xc5\x96\xf0\xc7\x4a\x6a\x9b\x1b\x4b\xc3\
+\xe6\x43\x89\x84\x09\xc0\x3e\x4c\x01\x5a\xee\x95\xfc\xa3\x2c\x13\
+\x00\xe4\x9d\x4e\x97\x6e\xcc\xa4\x82\x6f\xad\x0c\x2b\xd6\x11\x07\
+\x13\x80\x9e\xce\x01\xbe\xcb\x12\x01\x40\x5e\x2a\x36\x69\x7a\x32\
+\x1d\x3d\x59\x36\xbb\x39\x2c\xfb\xfa\x4d\x43\x89\x84\x02\xb0\xc7\
+\xc6\xa5\xd6\xde\x26\xe9\x51\x96\x09\x00\xf2\x93\x49\xc3\xdd\xf5\
+\x2d\x2f\x4a\x3f\x5e\x56\xdb\xfc\x45\xc9\x79\xec\x7b\xee\xac\x4d\
+\x6e\x2b\x9b\xdd\xf4\x29\x77\xbb\x85\xa5\x02\x80\x82\xf0\x3b\x45\
+\xfe\x4f\x6d\xf3\xaa\xef\x26\x0a\x0a\xc0\x6e\x95\xd6\x36\xdf\x25\
+\xe9\x63\x2c\x17\x00\x14\x04\x97\xec\x7f\xb2\x8a\xbe\xb1\xa2\xbe\
+\xfa\x59\xe2\x18\x18\x41\x7e\xbc\x53\xa2\x6f\x74\xbf\x61\x00\x00\
+\x85\x71\xf0\xe9\xe5\x09\xd9\x23\x65\xb3\x5b\xae\x2c\x2f\x5f\x94\
+\x20\x12\x26\x00\xef\x3e\x05\xa8\x69\x5e\x2c\xd3\xe7\x58\x32\x00\
+\x28\xb8\x81\xc0\xc3\x92\x4d\x6b\xab\xaf\xfa\x1d\x59\x50\x00\xde\
+\xa1\xe4\xaa\x96\x63\x2d\xe1\x8f\x49\x2a\x62\xd9\x00\xa0\xe0\x64\
+\x24\xfd\x28\x9d\xda\x51\xcb\x23\x88\xfb\x47\x90\x2f\x2f\xb4\xfd\
+\xea\xca\x35\x26\xfd\x88\x25\x03\x80\x82\x94\x94\x74\x45\x51\xba\
+\xf8\xe1\xd2\x9a\xa6\x09\xc4\xc1\x04\xe0\x6d\x2e\xfa\x66\xf3\xf0\
+\xed\x49\x3d\x2a\xd3\xe1\x2c\x1d\x00\x14\xb4\x1f\x5b\x67\xea\xff\
+\xb5\x5e\x3b\x75\x2b\x51\xc4\x7c\x02\x20\x49\x4b\xbe\x5b\xb5\x59\
+\xa6\x2b\x58\x36\x00\x28\x78\x17\x7b\x71\xfa\x77\x65\x73\x16\x8c\
+\x25\x0a\x26\x00\x6f\x2a\xab\x6d\xba\xd5\x65\x9f\x64\xf9\x00\xa0\
+\xe0\x65\xcc\x54\x3f\xf2\x89\xe1\x73\x17\x2f\x9e\x92\x25\x8e\x98\
+\x4e\x00\xde\xe0\x29\xbb\x4c\xd2\x46\x96\x0f\x00\x0a\x5e\xd2\x5d\
+\xdf\xda\x78\xc2\xe6\xbb\x4a\xae\x6a\x39\x96\x38\x62\x5e\x00\xda\
+\xc2\xaa\xbf\x9a\xec\x5f\x58\x3e\x00\x88\x07\x77\x9d\x65\x09\xfd\
+\xae\x6c\x76\xcb\x85\xa4\xd1\x3b\xf2\xf8\x9e\xcc\x6e\xa5\xb5\x2d\
+\xbf\x92\x34\x89\x65\x04\x80\xf8\x74\x01\x99\x7d\x77\xd4\x13\xc3\
+\x6a\x39\x25\x10\xc3\x09\xc0\xce\xee\xe2\x4a\xa9\x5a\xd2\x6b\x2c\
+\x23\x00\xc4\xe8\xc0\xd5\x7d\xe6\xfa\xe3\x37\xb7\x95\x85\x37\x1d\
+\x48\x1c\xb1\x2c\x00\xdd\xa7\x02\x24\x4d\x63\x19\x01\x20\x6e\x2d\
+\x40\x1f\xf7\x74\xfa\x77\x65\x73\x5a\xce\x24\x8d\x18\x16\x00\x49\
+\x6a\xab\xaf\xba\xc5\x65\x2d\x2c\x25\x00\xc4\xce\x11\x1e\xf9\xca\
+\xd2\xda\xa6\x8b\x89\x22\x86\x05\x40\x92\x32\xa9\xed\x5f\x93\xf4\
+\x17\x96\x13\x00\x62\x67\x90\x64\x37\x96\xd4\x34\x7f\x4b\x72\x23\
+\x8e\x3d\x57\x30\x61\x95\xcd\x5a\x78\xa2\x07\xd1\xfd\x92\x46\xb0\
+\xac\x00\x10\xcb\x1d\x6d\x51\x3a\x19\x5c\xb2\x32\xac\xd8\x41\x18\
+\x31\x99\x00\x48\x52\xeb\xbc\x8a\xc7\xcd\xfc\x12\xf1\xd8\x60\x00\
+\x88\x27\xd7\x94\x54\x3a\xea\x18\x1f\x36\x8e\x21\x8c\x18\x15\x00\
+\x49\x6a\xad\xab\xbe\xd5\xa4\x6b\x58\x56\x00\x88\xad\xb3\x53\xe9\
+\xe4\x5d\x65\xb3\x17\x1c\x43\x14\x31\x2a\x00\xdd\x2b\xbf\xb6\x56\
+\xf2\x3b\x58\x5a\x00\x88\xad\x13\xe5\xc1\x3d\x65\x35\x4d\xa7\x10\
+\xc5\xbb\x2b\xc8\x0b\x26\x2e\xb8\xea\x47\xa3\xbb\x12\xc5\xf7\x49\
+\x3a\x9e\x25\x06\x80\xd8\x7a\x59\x1e\x4c\x6c\x6b\xa8\x78\x98\x28\
+\x62\x30\x01\x90\xa4\x5f\x5d\x7d\xd9\x7a\xb3\xe8\x7c\x49\x2f\xb2\
+\xc4\x00\x10\x5b\x07\xca\xa2\x5f\x4f\x98\xd5\x7c\x16\x51\xc4\xa4\
+\x00\x48\x52\x6b\xdd\xb4\xa7\x3d\x08\x26\x4a\xda\xc0\x32\x03\x40\
+\x6c\x8d\x0a\x02\xb5\x95\xcc\x6e\x29\x21\x8a\x98\x14\x00\x49\x6a\
+\x9f\x5b\xf1\x27\x37\x2b\x97\xd4\xc5\x52\x03\x40\x6c\x0d\x35\xf7\
+\x25\xa5\x35\x4d\x13\x88\x22\x26\x05\x40\x92\xda\xeb\x2a\xdb\xcd\
+\xfd\x12\x49\x11\xcb\x0d\x00\xb1\x35\x58\x66\x4b\x26\xce\x5a\x78\
+\x0e\x51\xc4\xa4\x00\x48\x52\x6b\x43\xf5\xcf\xe4\x36\x83\x12\x00\
+\x00\xb1\x36\x24\x0a\xa2\xa5\x65\x73\x16\x8c\x25\x8a\x02\xfd\x14\
+\xc0\xbb\x29\xad\x69\xa9\x96\x79\x63\x5c\x8a\x0f\x00\x60\x97\x5e\
+\x8d\x22\x3b\xb7\x63\x5e\xe5\xa3\x14\x00\x4a\x00\x00\x20\x5e\x5e\
+\x4a\x98\xce\xbd\xb3\xae\xea\x89\xb8\x06\x10\xbb\x4d\xb0\xad\xa1\
+\xb2\xc9\xcd\xbe\x2a\x6e\x19\x0c\x00\x71\x76\x50\xe4\xfe\xab\x38\
+\xdf\x36\x38\x96\x47\xc1\xed\x75\x95\xff\xe9\xa6\x19\x92\xb2\xfc\
+\x0c\x00\x40\x3c\xb9\xec\x7d\xa9\x4c\xf2\xd6\xf1\xe1\xc2\x41\x14\
+\x80\x58\x95\x80\xaa\x05\x2e\xfb\xac\xa4\xed\xfc\x18\x00\x40\x6c\
+\x5b\xc0\xb8\x54\xda\x6f\x8a\xe3\xa3\x84\x63\x7d\x1e\xbc\xbd\xbe\
+\xf2\x36\x57\x74\x9e\xa4\x57\xf9\x29\x00\x80\xd8\xb6\x80\xf2\x92\
+\xda\x85\xdf\x89\xdb\x77\x6d\x2c\xbc\x54\x56\xd3\x74\x8a\xcb\x96\
+\xc9\x74\x38\x69\x00\x40\x6c\xa7\x01\x15\x6d\x0d\x55\x37\x50\x00\
+\xe2\x56\x02\x6a\x5b\x8e\x70\x45\x4b\x24\xfb\x30\x69\x00\x40\x2c\
+\x75\x5a\x60\xe7\xb6\xce\xad\xbc\x3f\x0e\xdf\x2c\x1f\x85\xdb\xa9\
+\xb5\xbe\x72\x6d\x3a\x95\x38\x4b\xe6\x37\x93\x06\x00\xc4\x52\xb1\
+\x47\xbe\x78\xd2\xac\x96\x03\x98\x00\xc4\x92\x5b\x69\x4d\xf3\x37\
+\x65\xd6\x40\x41\x02\x80\x58\x5a\x31\xea\xc9\xe1\x65\x8b\x17\x4f\
+\x29\xe8\x4f\x8a\xb1\xc1\xbd\xb3\x13\x79\x5b\x43\xf5\x35\xb2\x60\
+\xb2\xa4\x8d\xe4\x01\x00\xb1\x73\xde\xc6\x13\x36\x7d\x9b\x09\x40\
+\x8c\x95\xcc\x5e\xf0\x01\xf3\xe0\xe7\x92\x4e\x25\x0d\x00\x88\x15\
+\x37\xf9\x27\x5b\xeb\xab\x97\x52\x00\x62\x6a\x7c\xb8\x70\x50\x2a\
+\x1d\x5d\x23\xe9\x0a\xd2\x00\x80\x58\xd9\x60\xb2\x0f\xb6\xd6\x57\
+\xae\x2d\xc4\x6f\x8e\x53\x00\xbb\xb1\x32\xac\xd8\xd1\x56\x5f\xf5\
+\x35\x49\x9f\x91\x6c\x3d\x89\x00\x40\x6c\x8c\x72\xa9\xb9\x50\x6f\
+\x12\x44\x01\xd8\x43\x6d\xf5\x55\xb7\x98\x65\xc7\xca\x75\x3f\x69\
+\x00\x40\x5c\x78\x69\x59\xed\xc2\xcb\x29\x00\x31\xd7\x5a\x37\xed\
+\xe9\x74\xd1\xda\x8f\xc9\xfd\x2a\x49\x9d\x24\x02\x00\x31\xa8\x00\
+\xf2\xef\x96\xcc\x59\x58\x70\xd7\x82\x71\x0d\xc0\x5e\x9a\x38\x67\
+\xfe\xc9\x51\x36\xb1\x50\xa6\x8f\x90\x06\x00\x14\xbc\x87\x46\xa5\
+\x86\x7f\x74\x71\x38\xa5\x8b\x09\x40\xcc\x2d\x9f\x3b\xfd\x91\x74\
+\xd1\xda\xb3\x4d\x3e\x47\x52\x17\x89\x00\x40\x41\x3b\x6d\x63\x66\
+\x73\x0d\x13\x00\xbc\x4d\xc9\x9c\x85\xa7\x9a\x47\xff\x29\xd7\x38\
+\xd2\x00\x80\x82\xd5\xe9\x16\x9d\xd6\x5e\x37\xed\x31\x26\x00\x90\
+\x24\xb5\xcf\xad\xf8\x53\x5b\x5d\xe5\x39\xee\xba\x44\xd2\xcb\x24\
+\x02\x00\x05\xa9\x58\xb2\xc6\x42\xf9\x54\x00\x05\xa0\xd7\x98\xb7\
+\x37\x54\xdd\x54\x94\xed\x3c\x51\xd2\x75\x92\xb2\x64\x02\x00\x85\
+\xf6\x9b\xde\xce\x29\x99\xdd\x52\x5d\x10\xdf\x0b\xcb\xd9\x37\xca\
+\xe6\xb4\x81\x33\x5a\x7a\x00\x00\x1f\x12\x49\x44\x41\x54\x9c\xe9\
+\x91\xfe\x5d\xf2\x8f\x92\x06\x00\x14\x54\x0d\x58\x9f\x4e\xd9\x49\
+\x2b\xc3\x8a\x75\x4c\x00\xf0\x0e\xad\x73\x2b\xef\x6f\xab\xaf\x38\
+\xdb\x64\x9f\x97\xf4\x34\x89\x00\x40\xa1\xf0\xd1\x45\x19\xff\x37\
+\x26\x00\xd8\xad\xb1\xd3\x1b\x53\xfb\x1f\x90\xaa\x70\x79\xbd\xa4\
+\x31\x24\x02\x00\xf9\xdf\x02\x5c\xfa\xc7\xf6\xfa\xaa\x55\x4c\x00\
+\xf0\xae\x1e\x9c\x3f\x23\xdd\x5a\x5f\x39\x3f\x8a\x92\x27\xba\xfb\
+\xf7\x25\x6d\x27\x15\x00\xc8\xef\x03\x68\x93\xfd\x6b\x3e\x5f\x10\
+\xc8\x04\x60\x00\x4c\x9a\xd5\x72\x40\x26\xa1\x7f\x96\xfb\x15\x92\
+\x06\x93\x08\x00\xe4\xed\x36\xfa\x85\xb6\xfa\xca\x9f\x52\x00\xd0\
+\xb3\x22\x10\x2e\x38\x3c\x93\x0e\xbe\x21\x69\xba\xa4\x41\x24\x02\
+\x00\x79\xc6\xf5\xfc\xa0\xa2\xcc\x09\x4b\xc3\x19\xdb\xf2\xed\xa5\
+\x27\x58\xbd\x81\xf3\xd4\xca\xa5\x9b\xd6\xdc\xb5\xe4\xce\xa3\xff\
+\xf1\xa2\x9b\x03\x05\x49\x49\xa7\x48\x4a\x91\x0c\x00\xe4\xcd\x61\
+\xf4\x88\x4c\x14\x6c\x5b\x73\xd7\x92\xbb\x98\x00\x60\xaf\x8d\x0f\
+\x1b\xc7\x14\x65\x92\x5f\x75\xd7\x57\x25\xed\x4f\x22\x00\x90\x17\
+\x36\x16\x65\x3b\x8f\xf9\xd5\xd5\x97\xe5\xd5\x23\xe3\x99\x00\xe4\
+\x90\x67\x56\xde\xbe\x6d\xf5\xff\x2e\x59\x79\xe4\x84\x89\x3f\x4a\
+\x7a\xea\x55\x49\x27\x49\x1a\x49\x32\x00\x90\xd3\x06\x65\x13\xc9\
+\xae\x35\xff\xbb\xe4\xd7\x4c\x00\xd0\x2b\xca\xcb\x17\x25\x36\x1e\
+\xbf\xe9\x13\x92\x5d\xe1\x52\x09\x89\x00\x40\xce\xda\x92\x8c\xec\
+\xd8\x65\xf3\x2a\x5f\xa1\x00\xa0\x57\x95\xcc\x69\x3a\x4d\x91\x7d\
+\xd9\xa4\x2f\x49\x1a\x42\x22\x00\x90\x73\x1a\xda\xea\xab\x6a\x29\
+\x00\xe8\x13\xe3\xc3\xc6\x31\xa9\xae\x44\x95\xcc\xaa\x25\x1d\x47\
+\x22\x00\x90\x3b\x53\x80\x74\x2a\x73\xcc\xca\x70\xc6\xab\x14\x00\
+\xf4\x21\xb7\xb2\xd9\x0b\x3f\xee\xee\xd5\x92\x3e\x23\xa9\x98\x4c\
+\x00\x80\x29\x00\x05\x20\x46\x26\xcc\xba\x71\x7f\x0b\x32\x17\x9b\
+\x54\xa5\xee\x8f\x12\x02\x00\x06\xc6\xeb\xd6\x99\x3a\xb2\xf5\xda\
+\xa9\x5b\x29\x00\xe8\x57\x13\xe7\xcc\x3f\x39\xf2\xe4\xc5\x72\x9f\
+\x2a\xe9\x10\x12\x01\x80\xfe\xe5\xa6\x2b\xda\xeb\xaa\x7e\x48\x01\
+\xc0\x80\x08\xc3\x30\x58\x95\x3e\xe2\x6c\x49\x17\x9b\xf4\x05\x49\
+\xc3\x48\x05\x00\xfa\xc5\xd3\xe9\xd4\xda\xe3\x57\x86\x61\x86\x02\
+\x80\x01\x75\xd6\x95\x8b\x06\x0f\x1f\xb2\xa9\xc4\x65\xe5\x92\x3e\
+\x4d\x19\x00\x80\x3e\xde\x5c\xcd\xca\x5b\xeb\x2a\xff\x87\x02\x80\
+\x9c\x71\xd1\x37\x9b\x87\x6f\x4b\xfa\x64\xc9\xca\xcd\x74\xbe\x78\
+\x06\x01\x00\xf4\xc5\xf6\x7a\x5f\x5b\x7d\xe5\x59\x14\x00\xe4\x6c\
+\x19\xd8\x51\x64\x13\x25\x9f\xec\xae\x4f\x48\x1a\x43\x2a\x00\xd0\
+\x4b\x1b\x6c\x10\x9d\xde\x3a\x77\xda\x83\x14\x00\xe4\xb4\x30\x0c\
+\x83\x7b\xb2\x87\x9d\x26\x0f\x26\xbb\xdb\x85\x92\xff\x03\xef\x0f\
+\x00\xd8\x07\x6e\x8d\x6d\x0d\x95\x5f\xa6\x00\x20\xaf\x9c\x7f\xd5\
+\xc2\xa3\xa3\x84\x97\x45\xf2\xc9\x26\x95\x8a\xfb\x0c\x00\x40\x4f\
+\x6d\x49\xa6\x8a\x0f\x5b\x16\x7e\x69\x13\x05\x00\x79\xe9\x8d\x53\
+\x05\xee\xba\x50\xf2\x4f\x48\x3a\x80\x54\x00\x60\x4f\x36\x59\x9b\
+\xd1\x5a\x5f\x39\x9f\x02\x80\x82\x50\x72\x55\xcb\xb1\x41\x42\x25\
+\xdd\x0f\x28\xf2\x32\xf1\xc4\x42\x00\x78\x37\xbf\x6b\xab\xaf\xfa\
+\x08\x05\x00\x05\x67\xec\xf4\xc6\xd4\xe8\x03\x92\x67\x9a\xec\x3c\
+\xc9\x27\x48\xfa\xa8\xa4\x22\x92\x01\x80\x6e\x81\xdb\xd8\xe5\x0d\
+\x95\xbf\xa7\x00\xa0\xa0\x4d\x0e\x1b\x87\x6c\xcf\xa4\xce\xb6\xee\
+\xe9\xc0\xc7\xe4\x3a\x53\x52\x92\x64\x00\xc4\x96\xe9\xdf\xda\xea\
+\xaa\xbe\x4e\x01\x40\xac\x4c\x0c\x9b\xf6\xcb\x66\x7c\xbc\x79\x70\
+\xae\xe4\xff\x28\xd9\xa9\x92\x12\x24\x03\x20\x36\x5c\x7f\x1d\x57\
+\xb4\xf6\x88\x30\x0c\x23\x0a\x00\x62\x6b\x7c\x78\xfd\xb0\x64\x66\
+\xf0\x47\x83\xee\xe9\xc0\x38\x97\xce\x11\x9f\x30\x00\x50\xe8\x43\
+\x00\xb3\x09\xad\x75\x95\x2b\x28\x00\xc0\x4e\x93\xc3\xc6\x21\xdb\
+\xd3\xc9\x7f\x30\xf7\x71\x66\x56\xe2\xd2\x38\x49\x83\x49\x06\x40\
+\x81\x8d\x01\x9a\xda\xea\xab\xa7\x51\x00\x80\x77\x9d\x10\x84\xc9\
+\xa2\xec\x61\x1f\x72\xb7\x8f\xc9\x83\x71\xea\xbe\x96\x60\x34\xc9\
+\x00\xc8\x73\x1b\x92\x9b\xb6\x1e\xbc\xec\x87\x57\x74\x52\x00\x80\
+\x3d\x50\x5e\xbe\x28\xb1\xe1\xf8\xcd\xa7\xc9\x75\xae\x4c\x13\xd4\
+\x7d\xca\x80\x87\x19\x01\xc8\x3b\x26\xbf\xa8\xb5\xbe\x7a\x29\x05\
+\x00\xd8\xcb\x42\xb0\xf1\xc4\x8d\x1f\xf6\xac\x95\xec\x3c\x65\xf0\
+\x31\xf1\x40\x23\x00\x79\xc0\x65\x2d\xed\xf5\x95\x55\x14\x00\xa0\
+\x17\x9c\x75\xe5\xa2\xc1\x43\x87\x6e\x19\xf7\x96\x8b\x0a\xcf\x95\
+\x94\x22\x19\x00\x39\xe8\xe5\x51\x4f\x0e\x3f\x74\xf1\xe2\x29\x59\
+\x0a\x00\xd0\xcb\xde\xf8\x94\x81\x49\x25\x72\x95\xf0\x50\x23\x00\
+\xb9\xc4\x64\xe3\x5a\xeb\x2b\xef\xa1\x00\x00\x7d\xac\x2c\xbc\xe9\
+\x40\x4f\x77\x9d\xeb\xb2\x92\x9d\x0f\x35\x3a\x86\x54\x00\x0c\x1c\
+\xff\x6e\x5b\x7d\xf5\x4c\x0a\x00\xd0\xcf\x4a\xae\x6a\x39\x56\x49\
+\x9f\x60\xd2\x79\x72\x9d\x27\xe9\x40\x52\x01\xd0\x8f\x1e\x6f\xab\
+\xaf\xfa\x00\x05\x00\x18\x40\x61\x18\x06\xf7\x64\x0f\x3b\x2d\xca\
+\x26\xce\x37\xf3\xf3\xd5\xfd\x1c\x03\x6e\x5b\x0c\xa0\x4f\x65\x2d\
+\x71\xdc\x8a\xba\x4b\x57\x53\x00\x80\x1c\x51\xf6\xf5\x9b\x86\xaa\
+\xb8\xeb\xbc\x48\x76\xa1\x99\x9d\x2f\xf7\x23\x49\x05\x40\xef\xef\
+\xbc\xfe\xe5\xb6\xba\xea\x46\x0a\x00\x90\xa3\xde\x78\xec\x71\x24\
+\x9f\xdc\xfd\x70\x23\x3e\x6e\x08\xa0\x57\xb6\xde\xc5\x6d\xf5\x95\
+\x53\x28\x00\x40\x9e\x4c\x07\x7c\x50\x7a\x82\xdc\x27\x9b\xec\x42\
+\x97\x0e\x26\x15\x00\x7b\xe9\xb5\x71\xa9\xb5\x07\x0e\xf4\xc3\x81\
+\x28\x00\xc0\x5e\x98\x38\x67\xfe\xc9\x51\x36\xb8\x50\x81\x4d\x96\
+\xeb\x6c\x7e\x96\x00\xf4\x44\xe0\x36\x76\x79\x43\xe5\xef\x29\x00\
+\x40\x1e\x2b\x99\xd9\x78\x64\x90\x4c\x9d\xbf\xf3\x54\x41\xa9\x78\
+\xba\x21\x80\xdd\x6f\xbf\x33\xdb\xea\x2b\xbf\x4b\x01\x00\x0a\xc4\
+\xf8\xf0\xfa\x61\xc9\xf4\xa0\x89\x26\x5d\xa8\xee\x3f\x63\x48\x05\
+\xc0\x2e\x2c\x6b\xab\xaf\xfa\x04\x05\x00\x28\x40\xe5\xe5\x8b\x12\
+\xeb\x8f\xdf\x7c\x96\x49\xe5\x72\x7d\x4e\xa6\x43\x49\x05\xc0\x4e\
+\x1b\xc6\xa5\xd6\xee\x3f\x90\xd7\x01\x50\x00\x80\x7e\x10\x86\x61\
+\xb0\x2a\x7d\xc4\xd9\x66\x76\xa1\x79\xf4\x39\x97\xbd\x8f\x54\x80\
+\x78\x0b\x82\xec\x29\xcb\xe7\x4e\x7f\x84\x02\x00\xc4\xc8\xc4\x39\
+\xf3\x4f\x76\x4f\x94\xbb\xeb\x0b\x92\xde\x4f\x22\x40\xfc\xb8\x69\
+\x7a\x7b\x5d\xd5\x02\x0a\x00\x10\x53\x65\x73\x16\x8c\x55\x14\x7c\
+\x4e\xf2\x72\x26\x03\x40\xac\x2c\x6c\xab\xaf\xaa\xa4\x00\x00\xe8\
+\xfe\x78\xa1\x27\x2f\x96\xfb\xa5\x92\x0e\x22\x11\xa0\x80\x27\x00\
+\xd2\x13\xed\xf5\x55\x27\x52\x00\x00\xbc\x69\xec\xf4\xc6\xd4\xe8\
+\x31\x89\x32\x33\xfb\xa2\xa4\x4f\x4a\x1a\x42\x2a\x40\xe1\x75\x80\
+\x74\x2a\xd8\x6f\x65\x58\xb1\x81\x02\x00\xe0\x1d\xce\xba\x72\xd1\
+\xe0\x61\x43\x36\x5d\xe8\xb2\xa9\x26\x4d\x94\x94\x22\x15\xa0\x40\
+\x1a\x80\x45\x1f\x6f\xaf\x9b\xb6\x92\x02\x00\xe0\x3d\x4d\x98\x75\
+\xe3\xfe\x89\x20\xfb\x59\x37\x9f\x2a\xd7\x38\x12\x01\xf2\xbc\x00\
+\x48\x57\xb6\xd7\x57\xfd\x3b\x05\x00\xc0\x1e\xeb\xbe\x1d\x71\x72\
+\x9a\xcc\x2f\x96\xb4\x1f\x89\x00\xf9\xc8\x6e\x6c\xab\xaf\xbc\x94\
+\x02\x00\xa0\xc7\x26\x5d\x7e\x5d\x71\x66\xc4\x90\x8b\x4c\x36\xdd\
+\xa5\x09\xfc\x5c\x03\x79\x35\x03\x78\xb8\xad\xbe\xfa\x34\x0a\x00\
+\x80\x7d\x32\x61\xd6\xfc\xe3\x83\x44\xb2\x52\xee\x95\x92\x0e\x20\
+\x11\x20\xe7\x75\x8d\x4a\x0d\x1f\xbe\x38\x9c\xd2\x45\x01\x00\xd0\
+\x4b\x53\x81\x61\x9f\x91\x34\x5d\xf2\x73\xf9\x59\x07\x72\x57\xe4\
+\xd1\x87\x3a\x1a\xa6\xfd\x91\x02\x00\xa0\xd7\xa7\x02\x89\x20\x39\
+\xcd\xe5\x95\xe2\x5a\x01\x20\x07\xf9\x94\xb6\xfa\xea\xc5\xfd\xfd\
+\x55\x03\x82\x07\x0a\x5b\xc7\xbc\xe9\x4f\xb6\xd6\x57\x7e\x23\xb9\
+\x69\xeb\xa1\xee\xba\x44\xd2\x9f\x49\x05\xc8\x1d\x26\x9d\x30\x40\
+\x5f\x17\x40\xdc\x94\xd4\x36\x7f\xcc\x64\x57\x48\xfe\x19\x49\x09\
+\x12\x01\x06\xb2\x01\xf8\xcd\x6d\x75\xd5\x17\x33\x01\x00\xd0\xe7\
+\xda\xeb\xab\x56\xb5\xd5\x57\x4e\x71\x8b\x4e\x95\xb4\x50\x52\x17\
+\xa9\x00\x03\xc4\x6d\x40\x6e\x07\xcc\x04\x00\x80\xc6\x87\x0b\x0f\
+\x2e\xca\x44\x5f\x76\xd7\x3f\x49\x1a\x49\x22\x40\x3f\xee\xff\xd2\
+\xe6\xf6\xfa\xca\x91\x92\x39\x05\x00\xc0\x80\x98\x18\x36\xed\x97\
+\xed\xb2\xcb\xcd\xec\x6b\x92\x8f\x26\x11\xa0\x7f\xa4\x53\xc1\x21\
+\x2b\xc3\x8a\x75\xfd\xf9\x35\x39\x05\x00\xe0\x4d\xcb\xc3\xea\xd7\
+\xdb\x1b\xaa\xbe\x9d\x4e\x6d\x3f\x52\xee\x57\x49\xb6\x9e\x54\x80\
+\xbe\x57\x94\xf5\xa3\xfa\xfb\x6b\x52\x00\x00\xbc\xc3\xca\xf0\x2b\
+\x5b\xda\x1a\xaa\xaf\x19\x9c\xf6\xa3\xba\x8b\x80\x36\x90\x0a\xd0\
+\x77\x3c\x8a\x8e\xa4\x00\x00\xc8\x19\x4b\xbe\x5b\xb5\xb9\xad\xa1\
+\xfa\x9a\x20\xe5\xef\x33\xd9\xb5\x92\x3a\x49\x05\xe8\x7d\xe6\x76\
+\x34\x05\x00\x40\xce\x59\x1e\x56\xbf\xde\x5a\x5f\xf9\x0d\x93\xbd\
+\xdf\xa5\xf9\x92\x22\x52\x01\x7a\x71\x02\x60\xc6\x04\x00\x40\xee\
+\x6a\xad\xaf\x5c\xdb\x5e\x5f\x35\xc3\x82\xe8\x0c\x97\x7e\x4d\x22\
+\x40\xaf\xe1\x1a\x00\x00\x79\x50\x04\xe6\x4e\x7b\xb0\xbd\xbe\xea\
+\x3c\x93\x7d\x5e\xd2\x0b\x24\x02\xec\xf3\x0c\x80\x09\x00\x80\xbc\
+\x9a\x08\xfc\x7c\x50\x2a\x73\xbc\x99\xbe\x2d\x6e\x26\x04\xec\x8b\
+\x83\xfb\xfb\x0b\x72\x1f\x00\x00\xbd\x62\xe2\x9c\xf9\x27\x47\x51\
+\x62\xbe\xa4\xb3\x49\x03\xe8\xb1\xec\xa8\x27\x87\x17\x2f\x5e\x3c\
+\x25\x4b\x01\x00\x90\x87\xdc\xca\x6a\x17\x4e\x73\xf9\xf7\x24\x0d\
+\x25\x0f\xa0\x07\x1b\x72\x2a\x75\x50\x6b\x38\xf5\xe5\xfe\xfa\x7a\
+\x9c\x02\x00\xd0\x9b\xbf\xc2\xbc\xb5\xbe\x72\x7e\xd6\x12\x1f\x92\
+\xf4\xbf\xe4\x01\xec\xb9\x28\x9b\x3d\xa8\x3f\xbf\x1e\x05\x00\x40\
+\xaf\x5b\x51\x77\xe9\xea\x51\x4f\x0e\x3f\x4f\xb2\x6f\x49\xca\x92\
+\x08\xb0\x07\xdc\x29\x00\x00\xf2\xdf\xe2\xc5\x53\xb2\x6d\xf5\x95\
+\xdf\x31\xb3\x32\x49\x2f\x91\x08\xb0\x9b\x0d\x99\x02\x00\xa0\x90\
+\xb4\xd6\x55\xae\xb0\x54\xea\x83\x92\xb5\x91\x06\xf0\xee\xa2\x7e\
+\x7e\x00\x17\x05\x00\x40\xdf\x97\x80\x70\xea\xcb\xa3\x9e\x1c\x36\
+\x49\xae\xeb\x49\x03\x78\xd7\x0d\x79\x14\x05\x00\x40\xc1\x59\xbc\
+\x78\x4a\xb6\xad\xa1\xea\xab\x32\xff\x27\x71\x2b\x61\x60\x57\x5b\
+\xf2\x48\x0a\x00\x80\x82\xd5\x56\x57\xfd\x03\x49\x9f\x93\xb4\x8d\
+\x34\x80\xb7\x72\x0a\x00\x80\x02\x2f\x01\xf5\x55\xb7\xc8\xfd\x22\
+\x49\x3b\x48\x03\xd8\xb9\xfd\x9b\x28\x00\x00\x62\x50\x02\x1a\xaa\
+\x3b\x64\xfa\x24\x25\x00\x78\xa3\x01\x50\x00\x00\xc4\xa5\x04\xd4\
+\x55\xb5\x7a\xf7\x03\x85\xd2\xa4\x81\xd8\x33\x0d\xa3\x00\x00\x88\
+\x8d\xf6\xfa\xca\xdb\xdc\xec\x6b\x24\x01\x26\x00\x2a\xa6\x00\x00\
+\x88\x57\x09\xa8\xab\xfc\x4f\x49\xcd\x24\x81\x98\x8f\x00\x06\x53\
+\x00\x00\xc4\x4e\x3a\x15\x7c\x55\xae\xdf\x92\x04\x62\xbb\xfd\x2b\
+\x1a\x44\x01\x00\x10\x3b\x2b\xc3\x8a\x1d\x0a\x82\x2f\x4a\xea\x24\
+\x0d\xc4\x91\xcb\x28\x00\x00\xe2\xa9\xad\xae\xe2\x2f\x66\x7e\x2d\
+\x49\x20\xa6\x28\x00\x00\xe2\xab\x38\x99\x6d\x90\xf4\x0c\x49\x20\
+\x8e\x6f\x7f\x0a\x00\x80\xd8\x5a\x1a\xce\xd8\xe6\x66\xdf\x21\x09\
+\xc4\x50\xbf\xee\xc9\xc9\x5c\xfb\xee\xcb\x66\x2d\x3c\xd1\x83\x68\
+\xa6\x2b\x6a\x6c\xaf\x9f\x76\x1f\xef\x07\x20\x7e\xb6\x6e\x1d\xf6\
+\xb3\x61\x43\x36\xff\xab\xa4\xfd\x49\x03\x31\x62\xb1\x9e\x00\x64\
+\x93\x1a\x2e\xe9\x52\x53\x70\x6f\x69\x6d\xf3\xa3\xa5\x35\x4d\x33\
+\x2f\xb8\xea\x47\xa3\x79\x5f\x00\xf1\x71\xef\xf7\xa7\x6c\x97\x59\
+\x13\x49\x80\x02\x10\xa3\x02\x60\x51\xf4\xd6\x73\x20\x1f\x90\xd9\
+\xd5\x9d\x89\xe2\x67\x4b\x6b\x5a\xfe\xab\x64\x4e\xd3\x69\xbc\x3f\
+\x80\x98\xfc\x26\xcc\xda\x0d\xa4\x80\x98\x09\x0a\xf6\x8b\xed\xd1\
+\x0f\xbd\x7b\xf1\x2e\x2a\xd1\x70\x99\xcf\xb0\xc8\x7e\x5f\x5a\xd3\
+\x7c\x5f\xc9\xec\x96\x8a\xc9\x61\xe3\x10\xde\x2b\x40\xe1\x6a\x9d\
+\x57\xf1\xb8\xb8\x18\x10\x14\x80\xf8\x14\x00\x05\x89\xf7\xbe\x0a\
+\xd2\x74\xa6\xb9\xb7\xec\x48\x27\xff\x5a\x52\xdb\xdc\x58\x56\xdb\
+\x72\x36\xef\x19\xa0\x30\xb9\xfc\x7e\x52\x00\xfa\x46\x32\xf7\x7e\
+\xe2\xa3\x3d\xfd\x18\xc4\x48\x93\xa6\xbb\x7c\x7a\x49\x6d\xf3\x13\
+\x81\xfb\x8d\x89\x22\xff\xf1\xb2\x70\xda\xf3\x2c\x2b\x50\x18\xcc\
+\xed\x91\xfe\x3d\x2b\x0a\x0c\xa8\x4c\xbc\x0b\x80\x6c\x90\xe4\x3d\
+\xfb\x27\xa4\x13\xdc\xac\x21\x93\xb6\xba\xd2\xd9\xcd\xf7\x9a\xdb\
+\x4d\xea\x4c\xfe\xa4\xf5\xda\xa9\x5b\x79\x3f\x01\x79\x3c\x01\x08\
+\xb4\xce\x9c\x1c\x10\x93\xf7\x7b\x3f\x3f\x15\x33\xf7\x4e\x01\xec\
+\xe2\x1a\x80\x1e\x7d\x3f\xae\x71\x2e\x6f\xf4\xe2\xf4\x0b\x25\xb5\
+\xcd\x8d\xa5\xb3\x9a\xc6\x49\xce\x31\x04\x90\x8f\x22\xa7\xc4\x23\
+\x36\xac\x9f\x0b\x40\xee\x4d\x00\x02\x2f\xee\xa5\xfd\x7a\xa4\x49\
+\xd3\x15\xd8\xf4\xd2\xda\x96\x67\xdd\x9a\x17\xc9\xfc\xa7\xed\x73\
+\xab\x1f\xe2\x6d\x06\xe4\xcd\xaf\xc4\x24\x19\x20\x46\x62\x5e\x00\
+\xfa\xe6\x5e\xc8\x47\x99\xeb\x1b\x72\xfb\x46\x69\x6d\xf3\x33\x32\
+\xfb\xb9\x2b\x7b\x63\x7b\xdd\xb4\xc7\x78\xbf\x01\x39\x7d\x48\x74\
+\x28\x21\x20\x46\xe2\x7d\x0d\x80\x45\x56\xd4\xc7\x03\xfb\xa3\xe5\
+\x3e\xd3\x14\xcc\x2c\xad\x6d\xfe\x83\x4b\x3f\x4b\x66\x83\x9f\xdd\
+\x79\x75\xc5\x33\xbc\xf7\x80\x5c\xdb\xff\x75\x14\x29\x80\x09\x40\
+\x4c\x0a\x80\xf7\xef\xd3\x90\x3e\x64\xd2\x87\xb2\x89\xa8\xa1\xb4\
+\xb6\xe5\x7e\x49\xb7\x04\xd9\xe8\x97\xcb\xaf\xae\x7e\x8a\xf7\x21\
+\x90\x13\xce\x24\x02\xc4\xc8\xb6\x78\x4f\x00\x02\x2f\xf6\xfe\xbf\
+\x66\xcf\x24\xff\xa8\xa4\x8f\x46\x09\xbb\xa6\xb4\xb6\xf9\x4f\x32\
+\xdd\xea\xe6\xb7\x70\xcd\x00\x30\x30\x26\x86\x4d\xfb\x45\x69\x7d\
+\x88\x24\x10\x1b\xae\xcd\xb1\x2e\x00\xf2\xa0\xb8\xa7\x1f\x03\xec\
+\x03\xa7\xca\x75\xaa\xb9\xcd\x29\xad\x6d\x7e\x56\xd2\x6d\x6e\xb6\
+\x34\x93\x7c\x6e\xe5\xca\x30\xcc\xf0\x2e\x05\xfa\x5e\x94\xb1\xff\
+\x2b\x9e\x58\x8a\x18\x31\x8b\x7d\x01\xf0\xe2\x1c\xbb\xf1\xc7\x51\
+\x92\xae\x30\xf7\x2b\x52\xe9\x23\x5e\x2e\xab\x6d\xbe\x4d\xf2\xa5\
+\xea\x2c\x5a\xc1\x7d\x06\x80\x3e\xfb\x45\x60\xf2\x96\x69\xe4\x80\
+\x58\x95\x5e\xd7\x96\x78\x17\x00\xeb\xd7\x6b\x00\x7a\xea\x40\x97\
+\xa6\x49\x36\x4d\xc5\xe9\x4c\xe9\xec\xe6\xfb\x15\xf9\x52\x4b\x78\
+\x7b\xeb\xdc\x69\x0f\xf2\xf6\x05\x7a\x47\x49\x4d\x4b\xb9\xc4\xf8\
+\x1f\x4c\x00\x62\x55\x00\x5c\x56\x94\x03\xa7\x00\xf6\x2c\x3b\xd7\
+\x38\x99\x8d\xf3\xc8\x54\x5a\xdb\xfc\x94\xa4\x3b\xdc\xed\x8e\x4c\
+\x91\xfd\x66\x65\x58\xb1\x83\xb7\x33\xd0\x73\x65\x5f\xbf\x69\xa8\
+\xac\xab\xc1\xb9\x07\x30\xe2\x56\x00\x5c\x1b\x62\x5e\x00\xa2\x41\
+\x96\x9f\x3f\xf8\xc7\x49\xba\xc2\xcc\xaf\x48\xa5\x7d\x5b\x49\x6d\
+\xf3\x8a\x40\xbe\x2c\x1b\x45\xed\x1d\xf3\xa6\x3f\xc9\x5b\x1b\xd8\
+\xc3\xdf\x01\xc5\x5d\xff\x2e\xd9\xfb\x48\x02\xb1\x7b\xef\x4b\xaf\
+\xc4\xba\x00\xc8\xad\xb8\x00\x8a\xff\x10\x93\x2e\x74\xd9\x85\x41\
+\x90\x50\x59\x6d\xf3\x3a\x97\xdd\x65\x52\xbb\xa4\x65\xad\xf5\x95\
+\x6b\x79\xab\x03\xef\x54\x32\xbb\x79\x9a\x5c\xd5\x24\x81\x58\x0a\
+\xfc\xe5\x58\x17\x00\x33\x15\x17\xda\x9a\xba\x74\xb0\xe4\xe5\x2e\
+\x95\x4b\x52\x69\x6d\xf3\x9f\xe5\xd6\x61\x16\x75\x0c\x4a\xdb\xca\
+\x25\xdf\xad\xda\xcc\x3b\x1f\x6c\xfe\x0b\x3e\x63\xae\xff\x24\x09\
+\xc4\x76\x02\xe0\xf6\x6a\xbc\x27\x00\x2a\xbc\x02\xb0\x0b\xa7\xc8\
+\xfc\x14\x97\x7d\x6d\x7b\x4a\x99\xd2\xda\xe6\x07\xcc\xfc\xd7\x59\
+\x69\x55\x51\x72\xd0\x3d\xcb\xc2\x2f\x6d\xe2\x47\x01\x71\x52\x5a\
+\xd3\x7c\xa9\x5c\x0b\x24\x25\x48\x03\x71\x95\x88\x82\x78\x4f\x00\
+\x64\x2a\x56\xbc\x1e\xff\x99\x94\x74\xb6\xbb\x9d\x1d\x48\xca\xa4\
+\x3b\xb3\xa5\xb5\xcd\x7f\x94\x74\x97\x99\xdd\xd5\x95\xb4\x55\x2b\
+\xc3\x8a\x75\xfc\x68\xa0\x10\x8d\x0f\xc3\x64\x32\x73\x44\x83\x5c\
+\x5f\x97\xb8\xea\x0f\xf1\x96\x51\xfa\xa5\x78\x17\x00\x8f\xc5\x04\
+\xe0\x3d\x4b\xa0\xa4\xd3\x24\x9d\xe6\xee\x57\xa4\xd2\xae\xd2\xda\
+\xe6\xbf\x48\x5a\xe5\x66\x77\x99\x6c\x55\x5b\x5d\xc5\x5f\xf8\x51\
+\x41\xbe\x3b\x6f\xf6\x0d\xef\x0b\x32\x99\x85\xe6\x3a\x87\x34\x00\
+\xf9\xb6\x1d\xa3\xfa\xf5\xfa\xb0\x9c\x6b\xdc\x3b\x8f\x7e\x4f\xe5\
+\xbd\xf0\x9e\x5e\x91\xf4\x80\x64\x0f\x44\x16\x3d\x30\x28\xd3\x75\
+\xff\xaf\xae\xbe\x6c\x3d\xb1\x20\x1f\x94\x87\x8b\x8a\x36\xa4\xb7\
+\xfc\x93\xe4\xdf\x92\x34\x84\x44\x00\x49\xd2\xcb\x6d\xf5\x55\x07\
+\xc5\x7b\x02\xa0\x9c\xbe\x11\x50\xae\x38\x40\xd2\x05\x92\x5f\x10\
+\xb8\xa9\x2b\x51\xec\xa5\xb5\xcd\x7f\x91\xf9\x03\x2e\x7b\x20\x30\
+\x7b\x60\x64\x62\xd8\x43\x8b\xc3\x29\x5d\x44\x85\x5c\x11\x86\x61\
+\x70\x4f\xfa\xc8\xf2\x0d\xe9\xcd\x0d\x92\x8e\x25\x11\xe0\xad\xc7\
+\xff\x7a\xb6\xbf\xbf\x64\x0e\x5e\x03\x60\xc5\x72\xe7\xcd\xd0\xc3\
+\xd4\x24\x1d\x2f\xb7\xe3\x4d\xfa\x92\xbb\x6b\x43\xb4\xb9\xb3\xb4\
+\xa6\xf9\x61\x93\xff\x5e\x16\x3c\x9c\x0d\xec\xa1\x6d\x5b\x86\xfe\
+\xf9\xde\xef\x4f\xd9\x4e\x5c\xe8\x4f\xe3\xc3\xeb\x87\x25\x33\x83\
+\x2a\xee\x49\xfb\xd7\x5c\xce\xe7\xfb\x81\x5d\x6e\x7d\x7a\x8e\x02\
+\xe0\x5e\xcc\x5b\xa1\x57\x14\xcb\x74\xa6\xcb\xce\x94\x5c\x41\xe4\
+\x1a\x36\x64\x73\xb6\xb4\xb6\xf9\x09\x33\x7b\xd8\x5d\x7f\x30\xcf\
+\x3e\x94\xf0\xc4\xc3\xcb\xe6\x55\xbe\x42\x5c\xe8\x6d\x25\x33\x1b\
+\x8f\xb4\x64\xe2\x2b\x4a\xdb\x74\x49\xa3\xb8\xb3\x1f\xf0\x1e\x5b\
+\x9f\xe9\x19\x0a\x80\x44\x01\xe8\x3b\x09\x49\x27\xb9\xfb\x49\x92\
+\xbe\xe0\x16\x28\x63\xae\xd2\x9a\xe6\xbf\xca\xfc\x61\x59\xf0\x27\
+\x8f\xfc\x51\x33\x3d\x9a\x4e\xed\x78\x7c\x65\xf8\x95\x2d\x44\x86\
+\x9e\x98\x14\x2e\x38\x3c\x93\xb1\xcf\x4a\x56\x2e\xd7\x59\xe2\x69\
+\x7e\xc0\x9e\x15\x00\xe9\x09\x0a\x00\x05\xa0\xff\x99\x0e\x95\xec\
+\x50\xb9\x7f\xc2\x76\x1e\xa4\xa5\xd2\x83\xbc\xb4\xb6\xf9\x59\x93\
+\x1e\x77\xd3\x23\x26\x3d\x96\xcd\xea\xd1\x6c\x71\xf0\xd8\xca\xb0\
+\x62\x03\xa1\xe1\x0d\x13\x66\xb5\x9c\x94\x48\x68\xa2\xbb\x7f\x2e\
+\x93\xd6\x59\xe2\xe3\x7c\x40\xcf\x8f\xce\xb2\xc1\xe3\x14\x00\x0a\
+\x40\xee\xd4\x02\xe9\x68\x97\x8e\x96\xeb\x7c\x97\x14\x04\x52\x90\
+\x8e\x76\x4e\x0c\xf4\xb8\x4b\x4f\x99\x6c\xb5\xcb\x57\x27\x02\x3d\
+\xd5\x99\xd8\xb1\x9a\xa9\x41\xe1\x3b\x7f\x76\xf3\x09\x59\xf9\x78\
+\x77\x7d\xdc\x64\xe3\x25\x3f\x88\xcb\x76\x80\x7d\x9c\x00\x14\x27\
+\xfa\x7d\x02\x90\x53\x4d\xbd\xfb\xe3\x41\x9b\x3b\x79\x2b\xe4\xb5\
+\x97\x64\x7a\x4a\x6e\x4f\xc9\x7d\xb5\xcc\x9e\xb2\x40\x6b\x2c\x9b\
+\x7e\x6e\x79\xc3\xf4\x75\x92\xb1\x55\xe4\x91\xb2\xd9\x0b\x8e\x71\
+\x0f\x3e\x2c\xd3\x69\x72\xfb\xb0\xe4\xa7\x4b\x3a\x84\x64\x80\x5e\
+\xf5\x7a\x5b\x7d\xd5\xfe\xb1\x9e\x00\x74\x6e\xdb\x5c\xac\x14\xef\
+\x84\x3c\x77\x90\x5c\x07\x49\x3e\xae\xbb\x5e\xba\x3c\x92\xdc\x92\
+\x2a\xad\x6d\xe9\x92\x9a\x9f\x97\xf4\xbc\xa4\x67\x25\xad\x95\xb4\
+\xd6\xdd\xd7\x06\xd2\xb3\x5d\x45\x89\xe7\x39\xbd\xd0\xff\xc6\x4e\
+\x6f\x4c\x8d\xda\xdf\x8e\x09\x12\xa9\xe3\xdc\xa3\xe3\xcd\x75\x9c\
+\x9b\x4e\x32\xe9\x34\x77\x8d\xea\x3e\x3c\x79\xf3\x5f\x00\xf4\xfe\
+\xa1\xf8\x63\x03\xf1\x65\x73\xaa\x00\x6c\x1a\x92\x29\x4e\xa5\x93\
+\xbc\x19\x0a\x57\x91\xba\x3f\xff\xfd\xb6\xcf\x80\x9b\x99\x5c\x52\
+\x2a\x1d\xa9\xb4\xb6\x79\x8b\x4b\x2f\x98\xf4\x8a\x49\x2f\xb9\x6b\
+\x9d\xcc\x5e\x96\xfc\x65\x97\xbd\x18\x48\xaf\x64\x2c\x78\x29\xb9\
+\x23\x58\xd7\x7a\xed\xd4\xad\x44\xba\x7b\xe3\xc3\xc6\x31\xc9\x6c\
+\xd1\x21\xe6\x3a\x42\x91\x1f\xea\xf2\xc3\x02\xd3\x61\x92\x8e\x90\
+\xfc\xfd\x2e\x3b\x4a\x52\x52\x1e\x75\x77\x36\xe3\x24\x3e\xd0\xaf\
+\xdc\x1e\x8a\x7d\x01\x08\xd2\x83\x8a\xa5\x0c\x6f\x86\x78\x1b\x66\
+\xd2\x09\x92\x4e\xf0\x9d\x9b\xd1\x1b\x47\x9e\x26\x97\x4b\x4a\x78\
+\x56\x5e\x9c\x55\x69\x6d\xf3\x36\x49\xaf\x48\xbe\x5e\x0a\x36\x74\
+\xff\x55\x1b\x24\xad\x37\xf9\xfa\x48\xda\x10\xc8\xd6\x47\xee\x1b\
+\x02\x0b\xd6\x67\x23\x6d\x30\xd7\x0e\xb7\xc4\xc6\xa2\xe2\x44\x3a\
+\x9f\x1e\xba\x54\x32\xb3\x71\x64\x94\x1c\x34\xac\xc8\x32\xc3\x22\
+\x8b\x86\x45\x9e\x18\x2d\xd7\xd0\x40\x3e\x2c\x32\xed\x17\x48\xfb\
+\xbb\xdb\xfe\x32\x1f\x63\xae\x31\x2e\x1f\x23\xd9\xfe\x92\x0e\x50\
+\x5a\x83\xa4\xe8\x8d\x23\x0d\xd9\xdb\x8e\xe5\xd9\xea\x81\x81\xdf\
+\xff\xf5\x7b\x0a\x40\x36\x5b\xcc\xb3\xc0\xd0\x03\x43\x24\x1d\x25\
+\xd9\x51\x7f\x3f\x9e\x76\xd9\x9b\x1b\x5d\xf7\x84\xc1\x15\x04\x6f\
+\x6c\x79\x19\x65\xd2\x19\x95\xd6\x36\x4b\xd2\x0e\xc9\xb6\xcb\xb4\
+\xd9\x3c\x4a\x7b\x77\x91\xe8\x34\x69\x9b\x24\xb9\x6b\x9b\xcc\xfe\
+\xee\xba\x14\xdf\xea\xd2\x1e\xdc\x65\xd1\x92\x26\x0d\xdf\xc5\x8f\
+\xfb\x3b\xff\x7b\xd3\x50\x77\x2b\x92\x7c\x88\xba\x2f\x84\x1d\x2c\
+\xd9\x20\xc9\x07\x75\xff\x7b\x29\xa1\x8c\xb2\x2e\xc9\x03\xd9\xce\
+\xef\xd7\xd5\x7d\x55\xc5\x9b\xff\xc9\xff\x56\x97\x00\xe4\x87\x84\
+\x39\x05\xc0\x4d\x83\xf8\xb5\x85\x7e\xd6\xbd\xc9\xba\x46\xfb\x5b\
+\x8e\x8d\xfd\x6d\x07\xc8\xef\x3c\xf7\xbd\x67\xef\x53\xdf\xf3\xff\
+\x65\x97\xe7\xd8\x39\xe7\x0e\xc4\xc0\x8e\x57\x5f\xca\x3c\x3a\x20\
+\x07\xdd\xb9\x94\x82\x25\x23\x3e\x02\x08\x00\x88\x11\x7b\xf8\xc1\
+\xf9\x33\xd2\xb1\x2f\x00\x8a\xb8\x0d\x30\x00\x20\x46\xdb\xbf\xb4\
+\x6a\xa0\xbe\x76\x6e\x4d\x00\xa2\x04\x05\x00\x00\x10\xa3\x06\x10\
+\xdd\x4d\x01\x50\xf7\x35\x00\xbc\x1b\x00\x00\x31\xe1\x4a\x16\xdd\
+\x43\x01\x90\x14\x58\x54\xc4\xfb\x01\x00\x10\x13\x4f\xb5\x86\x53\
+\x5f\xa6\x00\x48\x72\x31\x01\x00\x00\xc4\xe5\xf8\xdf\x56\x0c\xe8\
+\x41\x77\x6e\x85\x11\x70\x0d\x00\x00\x20\x26\xfb\xbf\xb7\x51\x00\
+\x76\xb2\x80\x4f\x01\x00\x00\x62\x21\x9b\x48\xf9\xaf\x29\x00\x6f\
+\xb4\x21\x4e\x01\x00\x00\x62\xc0\x4c\x0f\x2c\x0f\xab\x5f\xa7\x00\
+\xbc\x11\x88\x8c\x8b\x00\x01\x00\x71\xd0\x3a\xd0\x2f\x20\xc7\x6e\
+\x04\x14\x31\x01\x00\x00\x14\xbc\xc8\xfc\x36\x0a\xc0\xdb\x5e\x8d\
+\x71\x0d\x00\x00\xa0\xd0\x3d\xdb\x3e\xb7\xea\x61\x0a\xc0\x5b\xb9\
+\x28\x00\x00\x80\xc2\xe6\x76\x6b\xf7\x73\x3c\x29\x00\x6f\x8a\x9c\
+\x4f\x01\x00\x00\x0a\x7c\xff\x0f\xb2\xb7\xe6\xc2\xeb\xc8\xad\x09\
+\x80\x71\x0a\x00\x00\x50\xd0\x5e\xca\x24\x5f\x58\x95\x0b\x2f\x24\
+\xb7\x0a\x80\x8c\x8b\x00\x01\x00\x05\xcb\xa4\x9f\xae\x0c\xc3\x0c\
+\x05\xe0\x1d\x38\x05\x00\x00\x28\x5c\x2e\xfd\x24\x57\x5e\x4b\x6e\
+\xdd\x07\x80\x8b\x00\x01\x00\x85\xeb\x2f\x6d\xf5\x55\xbf\xa3\x00\
+\xec\xb2\x01\x70\x0d\x00\x00\xa0\x40\x8f\xfe\xdd\x6e\xcc\xa5\xd7\
+\x93\x63\xa7\x00\xb8\x15\x30\x00\xa0\x20\x65\x22\x4b\xdc\x90\x4b\
+\x2f\x28\x99\x63\xfd\x88\x09\x00\x00\xa0\x00\x8f\xfe\x75\xfb\x8a\
+\x86\x4b\x5e\x60\x02\xf0\xae\x09\x71\x0d\x00\x00\xa0\xf0\x04\xd2\
+\xfc\x1c\x7c\x4d\x39\xc4\xc4\xc3\x80\x00\x00\x85\xe6\xd9\xb3\x8b\
+\xd6\x2e\xa7\x00\xbc\x37\xae\x01\x00\x00\x14\x16\xd7\x0f\xc3\x30\
+\x8c\x72\xed\x65\xe5\xd8\x35\x00\x14\x00\x00\x40\x21\xed\xfd\xda\
+\xac\x6c\xa6\x29\x17\x5f\x1b\xd7\x00\x00\x00\xd0\x47\x4c\x5a\xd0\
+\x7e\xcd\x8c\x8d\x14\x80\xdd\x27\x45\x01\x00\x00\x14\x8a\xac\x59\
+\xf4\x1f\xb9\xfa\xe2\x72\xaa\x00\xb8\xb8\x08\x10\x00\x50\x28\x87\
+\xff\xfe\xd3\xd6\xba\x69\x4f\x53\x00\xf6\x68\x00\xc0\x35\x00\x00\
+\x80\x02\x39\xfa\xcf\x26\xea\x73\xf9\x05\xe6\x4c\x01\x08\xc3\x30\
+\x90\x94\xe2\x3d\x03\x00\x28\x00\x8b\x5a\xe7\x55\x3c\x4e\x01\xd8\
+\x03\xcb\x37\x9e\xc4\xf9\x7f\x00\x40\x21\x88\x3c\x08\xe6\xe5\xfa\
+\x8b\xcc\x99\x02\x50\x3c\x72\x2b\x05\x00\x00\x90\xf7\xcc\xec\x67\
+\xed\x73\x2b\xfe\x44\x01\xd8\x43\x89\xae\x0c\x05\x00\x00\x90\xef\
+\xba\x32\x0a\xfe\x25\x1f\x5e\x68\xce\x14\x00\xcb\x46\x14\x00\x00\
+\x40\xbe\xfb\x8f\x15\x75\x97\xae\xa6\x00\xf4\x80\x07\xc6\x27\x00\
+\x00\x00\xf9\x6c\x43\x14\x25\x1b\xf2\xe5\xc5\xe6\xce\x04\x20\x99\
+\x62\x02\x00\x00\xc8\x5f\xae\xba\x8e\x79\x97\xbc\x46\x01\xe8\x69\
+\x01\x88\x38\x05\x00\x00\xc8\x5b\x8f\xbd\xfe\x6a\xe6\xba\x7c\x7a\
+\xc1\xb9\x73\x23\xa0\xc8\x29\x00\x00\x80\xfc\x3c\xf8\x77\xbb\xf2\
+\xc1\xf9\x33\xd2\x14\x80\xbd\x99\x00\x24\x02\x0a\x00\x00\x20\x0f\
+\xd9\xe2\xf6\x86\xca\xe5\xf9\xf6\xaa\x99\x00\x00\x00\xb0\xf7\x36\
+\x66\x95\xb8\x32\x1f\x5f\x78\xee\x7c\x0a\xc0\x78\x0e\x00\x00\x20\
+\xcf\x8e\xfd\x65\xdf\x5c\x51\x7f\xc9\x0b\x14\x80\x7d\x09\xd1\x99\
+\x00\x00\x00\xf2\x6a\xf7\xff\x4d\x6b\x7d\xc5\x82\x7c\x7d\xf9\x41\
+\x0e\x05\x49\x01\x00\x00\xe4\x8b\xed\x52\x30\x4d\x32\xa7\x00\xec\
+\xfb\x4b\xa1\x00\x00\x00\xf2\x82\xcb\xbf\xd9\x56\x57\xf1\x97\x7c\
+\xfe\x1e\x72\xa8\x00\x70\x0d\x00\x00\x20\x1f\x58\x5b\x7b\x7d\xd5\
+\xf5\xf9\xfe\x5d\xe4\x4e\x01\xe0\x1a\x00\x00\x40\xee\x6f\xfe\xeb\
+\x4d\xaa\xca\xe7\xd1\x7f\xce\x15\x80\x48\x56\xc4\x1b\x0b\x00\x90\
+\xcb\x5c\x3e\xad\xb5\xbe\x72\x6d\x21\x7c\x2f\xb9\x74\x11\x20\xa7\
+\x00\x00\x00\xb9\x7b\xec\xef\xfa\x61\x7b\x7d\xd5\x2f\x0a\xe5\xfb\
+\xc9\xa1\x02\xc0\x29\x00\x00\x40\xce\x1e\xfa\xff\x36\xb1\x79\xeb\
+\x37\x0a\xe9\x5b\xca\xa1\xfb\x00\xf0\x31\x40\x00\x40\x4e\x1e\xfb\
+\xaf\xb7\x20\xfa\x3f\xcb\x7e\x78\x45\x67\x21\x7d\x57\xc9\xdc\x69\
+\x57\x56\x5c\x00\xd7\x54\x00\x00\x0a\x4b\x36\xb2\xe8\x0b\x1d\x75\
+\xd3\x9e\x2e\xb4\x6f\x2c\x77\x0a\x00\xd7\x00\x00\x00\x72\x8d\x6b\
+\x66\x47\x7d\xf5\x9d\x85\xf8\xad\x71\x0d\x00\x00\x00\xbb\xde\x97\
+\x6e\x6e\x6b\xa8\xfa\xb7\x42\xfd\xf6\x72\xe8\x3e\x00\x5c\x03\x00\
+\x00\xc8\x19\x0f\xa4\x93\x89\x69\x85\xfc\x0d\xe6\xd0\x9d\x00\x99\
+\x00\x00\x00\x72\xc2\xd3\x91\x47\x17\xad\x0c\x2b\x76\x50\x00\xfa\
+\x85\x71\x0d\x00\x00\x60\xa0\xbd\x96\x30\x4d\xea\x68\x98\xf6\x52\
+\xa1\x7f\xa3\x3c\x0d\x10\x00\x80\x6e\x3b\x5c\xfa\xd4\x9d\x75\x55\
+\x4f\xc4\xe1\x9b\xcd\x9d\x02\x10\x89\x5b\x01\x03\x00\x06\x4a\xc6\
+\x65\x9f\x6f\xaf\xaf\x5a\x15\x97\x6f\x98\x5b\x01\x03\x00\xe2\xce\
+\xcd\x7d\x46\x7b\x7d\xe5\x6d\x71\xfa\xa6\x73\xe9\x71\xc0\x9c\x02\
+\x00\x00\xf4\xff\xf1\xa7\xd9\x3f\xb7\x36\x54\xb7\xc4\xed\xfb\x4e\
+\xe6\xd0\x6b\xa1\x00\x00\x00\xfa\x77\xf3\x77\x7d\xb3\xb5\xbe\xf2\
+\xfb\x71\xfc\xde\x73\x69\x02\xc0\x29\x00\x00\x40\x7f\xaa\x6d\x6d\
+\xa8\xfa\xd7\xb8\x7e\xf3\x4c\x00\x00\x00\xb1\xe3\xd2\xac\xf6\xfa\
+\xaa\xab\xe3\x9c\x41\x2e\x15\x00\x3e\x05\x00\x00\xe8\xf3\xbd\xdf\
+\x4d\x5f\x6b\xaf\xab\xfa\x61\xdc\x83\x60\x02\x00\x00\x88\x8b\xac\
+\x99\x66\xb4\xd5\x55\x35\x13\x45\x8e\x14\x80\xb1\xd3\x1b\x53\x92\
+\x12\x2c\x07\x00\xa0\x8f\x74\x99\xd9\x17\x5b\xeb\x2a\xff\x87\x28\
+\xba\xe5\xc4\x45\x80\xc3\x0f\xcd\x70\xf4\x0f\x00\xe8\x2b\x9b\xe4\
+\xfe\x09\x36\xff\x1c\x2c\x00\x89\xce\x61\x14\x00\x00\x40\xef\x73\
+\x3d\xef\x81\x8f\x6f\x6b\xa8\xee\x20\x8c\x1c\x2c\x00\x41\x31\x13\
+\x00\x00\x40\x6f\xb3\xfb\x22\x45\xa7\xb7\xcf\xad\x7e\x88\x2c\xde\
+\x29\x27\xae\x01\xf0\x1d\x36\xc8\x12\xce\x6a\x00\x00\x7a\x6b\xf3\
+\x5f\xbc\x65\xdb\xb0\x4b\xee\xfd\xfe\x94\xed\x64\x91\xc3\x13\x00\
+\x25\xb3\x4c\x00\x00\x00\xbd\x72\x4c\x29\xb3\x6b\xc6\xa5\x9e\xfb\
+\x3c\x9b\x7f\x1e\x4c\x00\x2c\x4a\x16\xcb\x22\x56\x03\x00\xb0\x2f\
+\x3a\xe5\x56\xdd\x56\x5f\x79\x73\x1b\x59\xe4\x49\x01\x48\x78\xb1\
+\xb3\xff\x03\x00\xf6\xde\x8b\x51\xa4\xcf\x76\xcc\xab\xbc\x97\x28\
+\xf6\x4c\x6e\x9c\x02\x88\x22\x4e\x01\x00\x00\xf6\xd6\x8a\xc0\x33\
+\x63\x3b\xe6\x55\xb1\xf9\xe7\x5b\x01\x70\x33\x1e\x04\x04\x00\xe8\
+\xa9\x8c\x99\xbe\x3d\x2e\xb5\xb6\x74\x79\xc3\x8c\x17\x89\xa3\x67\
+\x72\xe3\x14\x80\x7b\xb1\xcb\x58\x0d\x00\xc0\x1e\x1e\x39\xea\xf9\
+\xc0\x83\x2f\x2c\x9f\x57\x71\x57\x2b\x69\xe4\xef\x04\x40\x16\x70\
+\x0a\x00\x00\xb0\x67\x5b\x86\xd4\x1e\x29\x3a\x7d\xf9\xbc\x8a\xbb\
+\x48\x23\xdf\x0b\x80\x3b\x05\x00\x00\xb0\x3b\x19\x33\x7d\xfb\xec\
+\xd4\xda\x89\x1d\x0d\xd3\x5e\x22\x8e\x7d\x93\x1b\x4f\x03\x74\x2f\
+\x96\x71\x0a\x00\x00\xf0\xae\xc7\xfd\x8f\x44\x81\x55\x74\xcc\xad\
+\xf8\x2d\x23\xff\x42\x9a\x00\x98\xb8\x08\x10\x00\xb0\xcb\xa3\x7e\
+\x99\x5d\x93\xdc\xb4\x65\x6c\xc7\xdc\x8a\xdf\x12\x47\xa1\x4d\x00\
+\x2c\x28\x96\x73\x2b\x60\x00\xc0\xdb\xfc\x39\x0a\x82\x4a\x36\xfe\
+\x02\x9e\x00\x44\x5c\x03\x00\x00\x78\xc7\x51\xff\xd6\xd3\xd9\xfc\
+\x0b\x7d\x02\xe0\x2a\xe6\x53\x80\x00\x00\x93\xfe\xa8\x20\xaa\x6c\
+\x9d\x3b\xed\x41\xd2\x88\x41\x01\xb0\xc0\x8b\xe5\x34\x00\x00\x88\
+\xb1\xad\xe6\x5e\xff\xda\xab\xd9\x6b\x1f\x9c\x3f\x23\x4d\x1c\xb1\
+\x99\x00\x18\xa7\x00\x00\x20\xa6\x5c\xba\x3d\x92\x7f\x75\x45\x43\
+\xf5\xb3\xa4\x11\xb3\x02\xe0\xd2\x20\x8e\xff\x01\x20\x76\x5b\xff\
+\xc3\x41\x94\xb8\x82\x1b\xfa\xc4\xb8\x00\x98\xc4\x04\x00\x00\x62\
+\xc3\xd6\xcb\xa2\x6f\x8f\x7a\x62\xc4\x7f\x2c\x5e\x3c\x25\x4b\x1e\
+\x31\x2e\x00\x32\xae\x01\x00\x80\x18\x88\x24\xfd\x24\x19\xe9\x9f\
+\x97\xcd\xab\x7e\x85\x38\x28\x00\x92\x07\xc5\x12\xf7\x01\x00\x80\
+\x42\xe5\xd2\xed\x0a\x82\x9a\xf6\xb9\x15\x7f\x22\x0d\x0a\xc0\x5b\
+\xde\x19\xce\xc7\x00\x01\xa0\x30\xdd\xa3\xc8\x6a\xda\xe7\x55\xfe\
+\x86\x28\x28\x00\xef\x64\x5c\x03\x00\x00\x85\xc4\xa4\x3f\xba\xbc\
+\xae\xad\xbe\x7a\x31\x69\x50\x00\xde\xe3\x9d\xe2\xb7\x28\xb2\x93\
+\x65\x3a\x9c\x25\x01\x80\xbc\xde\xfa\x1f\x91\x7c\x4e\x6b\x7d\xe5\
+\xad\x92\x71\x6e\x37\x87\xe5\xc4\xad\x80\xdb\xea\xaa\x1b\xd3\x45\
+\x6b\x8f\x91\xf4\x19\xc9\xda\xc4\x05\x01\x00\x90\x67\x47\xfc\xbe\
+\x5a\xf2\xa9\xe3\x52\xcf\x7d\xb0\xad\xbe\xea\x16\x36\xff\x7c\x58\
+\xb3\x1c\x34\xf1\xaa\xa6\xe3\xa2\x64\x50\x2d\xf7\x2a\x49\x63\x58\
+\x26\x00\xc8\x59\x7f\x70\xd7\xf7\x32\x45\x6b\xff\x7b\x65\x18\x66\
+\x88\x83\x02\xd0\x2b\x26\x5d\x7e\x5d\x71\x66\xc4\x90\x8b\x5c\x36\
+\xd5\xa4\xf3\x95\x2b\xa7\x2c\x00\x80\xdd\xe3\x6e\x73\xbf\xa6\xb5\
+\xbe\xea\x76\x8e\xf6\x29\x00\x7d\xea\xbc\xda\x1b\x0f\x4b\x78\xfa\
+\x4b\x32\xab\x92\xf4\x7e\x96\x0e\x00\xfa\x5d\xe4\xd2\x1d\x09\xf9\
+\xdc\xe5\xf5\xd5\x0f\x10\x07\x05\xa0\x9f\xb9\x95\xd4\xb6\x8c\x33\
+\xf9\x25\x52\xf0\x59\xc9\x47\xb3\x8c\x00\xd0\xa7\xb6\xc9\xb5\xd0\
+\x23\xfb\x5e\xfb\xd5\x95\x6b\x88\x83\x02\x30\xe0\xca\xcb\x17\x25\
+\xd6\x9f\xb0\xe5\xe3\xe6\x3e\xd5\xa5\x4f\x99\x34\x9c\x25\x05\x80\
+\xde\xda\x20\x7c\xb5\xbb\x16\xa4\x8b\xb2\xcd\x2b\xc3\x19\xaf\x92\
+\x08\x05\x20\x27\x8d\x0f\x17\x0e\x2a\x4a\x67\x4b\x5d\x56\x2e\xe9\
+\x33\x92\x86\xb2\xbc\x00\xd0\x63\x91\x49\x2b\x5c\x3e\x7f\xd4\x93\
+\x23\x7e\xc9\xbd\xfa\x29\x00\x79\xa5\x64\x66\xe3\x48\x25\x12\x17\
+\x98\xec\xd3\x32\x4d\xa2\x0c\x00\xc0\x6e\xbd\x24\xa9\xd9\x33\x99\
+\xc6\xf6\x6b\x66\x3c\x47\x1c\x14\x80\xbc\x77\xd6\x95\x8b\x06\x0f\
+\x1b\xba\xb9\x54\xae\x4f\x4b\x9a\x2c\x69\x7f\x96\x1d\x00\x24\x75\
+\xdf\x73\xe5\x2e\x73\xff\xcf\x91\x45\x23\x7e\xb9\x38\x9c\xd2\x45\
+\x24\x14\x80\x82\x34\x3e\x0c\x93\xa9\xae\xc3\xcf\x35\xd9\x27\xdd\
+\x74\x81\xa4\x63\x79\x0b\x00\x88\xa1\x35\x66\xfa\xb1\x65\xfc\xe6\
+\xe5\x57\x57\x3f\x45\x1c\x14\x80\xd8\x29\xb9\xaa\xe5\xd8\x20\xa1\
+\x92\x48\x3e\xd9\xa4\x32\x49\x45\xbc\x25\x00\x14\xa8\x8d\x92\x96\
+\xb8\xd9\x4d\xed\x75\x15\x1d\x7c\x76\x1f\x3c\x83\xef\x8d\x32\x30\
+\xb3\x71\xa4\x25\x13\x65\x92\x7d\x42\xd2\x24\x49\x07\x91\x0a\x80\
+\x3c\x97\x71\xe9\x4e\xb9\x7e\x9c\x29\x0a\x96\xac\x0c\x2b\x76\x10\
+\x09\x28\x00\xef\xc9\x6d\xe2\x9c\x96\x0f\x66\x23\x2f\x35\x05\x65\
+\x92\x7f\x4c\xd2\x60\x72\x01\x90\x07\x22\x49\xab\xdc\xf4\x3f\x41\
+\x32\xf5\xf3\xd6\x70\xea\xcb\x44\x02\x0a\xc0\x5e\x3a\xeb\xca\x45\
+\x83\x87\x0e\xdd\x32\xce\xa4\x12\xb9\x4a\x24\xff\x07\xb2\x03\x90\
+\x43\xb2\x32\xdd\x27\xf9\x62\x25\x6d\x71\x5b\x58\xf5\x57\x22\x01\
+\x05\xa0\x0f\x4c\xa8\x59\x70\x50\xc2\x12\xe3\x5d\x3e\x5e\xd2\x78\
+\x49\x27\x92\x0a\x80\x7e\xd6\x29\x79\x87\xb9\x7e\x91\xf5\xd4\x6d\
+\x1d\xf3\x2e\x79\x8d\x48\x40\x01\xe8\x67\x13\x6b\x1a\x0f\x89\x2c\
+\x35\xde\xe5\xe3\xad\xbb\x10\x1c\x4f\x2a\x00\xfa\xc0\x26\x93\xda\
+\x24\xdd\x12\x65\x32\xb7\xb7\x5f\x33\x63\x23\x91\x80\x02\x90\x43\
+\x4a\xc3\xe6\x43\x2d\x6d\xe7\xc8\x7d\x9c\x9b\x9f\x23\xd9\xa9\x92\
+\x12\x24\x03\x60\x2f\xfc\x49\xf2\x65\x81\xdb\x9d\xaf\xbe\x9a\x59\
+\xf5\xe0\xfc\x19\x69\x22\x01\x05\x20\x4f\x8c\x0f\xaf\x1f\x96\x4c\
+\x0f\xfa\xb0\xb9\x8f\x73\xb3\x8f\x99\x74\x8e\xa4\x91\x24\x03\x60\
+\x17\xb6\x99\x74\x8f\x9b\xdf\xee\xe9\xec\x2d\xdc\x95\x0f\x14\x80\
+\x82\x2a\x04\x61\x32\x95\x3e\xe2\xc3\x6e\xf6\x11\x73\xff\x88\xa4\
+\x8f\x48\xfa\x00\x53\x02\x20\x96\xb2\x2e\xfd\x21\x90\xad\x70\x8f\
+\xee\x1c\x55\x34\xe2\x2e\xee\xc8\x07\x0a\x40\x8c\x94\x7d\xfd\xa6\
+\xa1\x51\x71\xfa\x34\x33\x1f\x2b\xb7\xb1\x92\xc6\xee\x2c\x05\xac\
+\x11\x50\x78\xd6\xb8\xd4\x6e\xf2\xf6\x20\xa5\x8e\xe5\x61\xf5\xeb\
+\x44\x02\x0a\x00\xde\x34\x29\xbc\x79\x44\x3a\xdd\xf9\xc1\xb7\x94\
+\x82\x8f\x49\x3a\x86\x64\x80\xfc\xdd\xf0\xa3\x28\xb5\x82\x2b\xf6\
+\x41\x01\x40\x8f\x9d\x57\x7b\xe3\x61\x49\x4b\x7f\xc4\xdd\x3e\x22\
+\xd9\x47\x24\xff\xb0\xa4\x03\x48\x06\xc8\x19\x5b\x24\xfb\x9d\x2c\
+\xba\x57\xb2\xfb\xa2\x6c\xf2\x6e\x36\x7c\x50\x00\xd0\x27\x2e\xb8\
+\xea\x47\xa3\x3b\x13\xc5\x27\x07\xb2\x93\x5c\x7e\xb2\x4c\x63\xe5\
+\xfa\x90\xa4\x61\xa4\x03\xf4\xb9\x17\x25\x5b\x25\x8b\xee\x76\xb7\
+\x07\x47\xa7\x86\x3f\xc0\x39\x7c\x50\x00\x30\x60\xc2\x30\x0c\xee\
+\xdd\x71\xf8\xb1\xd9\xa4\x7f\xd0\x3c\x71\x8a\xa4\x53\x5c\xfe\x41\
+\x93\x8e\x13\x17\x1b\x02\x7b\xc7\xf5\xbc\x9b\x1e\x0e\x4c\x0f\x2a\
+\xd2\xfd\xa9\xa8\xf3\xbe\x5f\x5d\x7d\xd9\x7a\x82\x01\x05\x00\x39\
+\x6f\x7c\xb8\x70\x50\x71\x97\x9f\x94\x95\x9f\xa2\x40\xa7\x98\xeb\
+\x83\x72\x9d\x2c\xd3\xe1\xa4\x03\xbc\x29\x92\xf4\xa4\x4c\x0f\xcb\
+\xed\x21\xf3\xec\x43\x09\x4f\x3c\xbc\x6c\x5e\xe5\x2b\x44\x03\x0a\
+\x00\x0a\xac\x18\x5c\x3f\x2c\xd5\x35\xe4\x38\x59\xf6\xfd\xe6\x3a\
+\xce\xcd\xde\xef\xe6\xc7\x99\xdb\xf1\xe2\xc9\x88\x28\xec\x5f\x83\
+\xeb\x25\x7f\xcc\xa4\x47\x24\x7f\x38\x1b\xd9\x43\x89\x74\xea\x8f\
+\xad\xd7\x4e\xdd\x4a\x36\xa0\x00\x20\xd6\x26\x5d\x7e\x5d\x71\x7a\
+\xe8\xb0\xc3\x82\x44\x74\xb2\xbb\x4e\x72\xb3\x63\x03\xe9\x58\x97\
+\x8e\x55\xf7\xa7\x12\x78\x1f\x21\x3f\x36\x7a\xf3\x47\xdd\xf5\x88\
+\xb9\xaf\x31\xd3\xa3\x51\x36\x78\xa4\xfd\xea\x8a\xa7\x25\x73\xf2\
+\x01\x05\x00\xe8\x81\x92\x99\x8d\x23\x83\xa2\xe0\x38\x45\x89\xe3\
+\x22\xd7\x71\x26\x1d\x21\xf3\xc3\x25\x1d\x29\xe9\x30\x49\xfb\x91\
+\x12\xfa\xd1\x46\x97\x56\x9b\x6c\xb5\xc9\x57\xbb\xdb\x6a\x33\x3d\
+\x9a\xca\xee\x78\x8c\x73\xf5\x00\x05\x00\xfd\x68\x72\xd8\x38\xa4\
+\xb3\xb3\xe8\x48\xb7\xec\x61\x66\x3a\xdc\xdd\x8e\x94\xec\x30\x4a\
+\x02\xf6\x92\xcb\xf5\xa2\x07\xbe\xda\x7c\xe7\x26\xaf\x60\x75\xa0\
+\x68\x75\x67\x2a\xbb\x66\x65\x38\xe3\x55\x22\x02\x28\x00\xc8\xb3\
+\x92\x10\x25\xfc\xf0\xc0\xa3\xc3\x5c\x76\x98\x49\x07\x44\xd2\x01\
+\x26\x1d\x2c\xe9\x40\x93\x0e\xf0\xee\xfb\x1d\xf0\x09\x86\xc2\xf6\
+\x92\x4b\x2f\x98\xeb\x79\x93\x9e\x75\xf9\x0b\x66\xf6\xbc\x45\xc1\
+\x73\x9e\xc8\x3c\x3f\x32\x39\xf2\x05\x3e\x62\x07\x50\x00\x10\xbf\
+\x83\x3f\x2b\x0b\x7f\x7c\x80\x65\x77\x1c\x90\x75\x3b\xc0\x3c\x71\
+\xc8\xdf\x8a\x42\x74\xb0\xdc\x0e\xb4\x40\x07\xc8\xfd\x40\x97\xed\
+\x2f\x69\x14\x99\xe5\x84\xed\x92\x5e\x32\xd3\x8b\x1e\xe9\x15\x33\
+\xbd\xe4\xa6\x75\xee\xfe\xb2\x49\x2f\x05\x51\x62\x9d\x3c\xfb\x62\
+\xb0\x75\xdb\xda\x65\x3f\xbc\xa2\x93\xb8\x00\x0a\x00\xb0\xcf\x85\
+\x61\x62\xd8\x3c\x3a\x9d\x49\x8e\x4e\x78\x76\xb4\x79\x34\x5a\x96\
+\xd8\xcf\xe5\xa3\xcd\x7d\x74\x14\xd8\x68\x73\x1f\x6d\xb2\xd1\x2e\
+\x8d\xd6\xdf\xfe\xec\x27\xfd\xff\xed\xdc\x3d\x4e\xc3\x40\x10\x86\
+\xe1\xf7\x5b\xc7\xb2\x13\xc0\x98\x73\x71\x10\x0a\x2e\x40\x99\x53\
+\x70\x11\x2e\xc0\x6d\x90\x28\xbc\x22\xc6\x5b\x60\x7b\x3f\x8a\xa4\
+\x88\xf8\x39\x00\x68\x9f\x6a\xa6\x9a\xd5\x68\x46\x9a\x6a\xe9\x4a\
+\xff\xbe\x99\x81\x08\x0c\x12\xd1\x76\x44\x0c\xca\x8a\xd6\x31\x76\
+\x56\x0c\x72\x74\x66\xa0\xaa\x5e\xe7\x4d\x7a\x79\xde\xdf\xbf\x97\
+\xd6\x15\x45\x39\x00\x8a\xe2\xcf\xb8\x7d\x78\xbc\x59\x42\xd5\xae\
+\xb9\xde\x52\xe7\x6b\x2f\x6a\x55\xe9\x02\xd6\x4e\xae\x1a\xc1\x95\
+\xf1\x25\xd0\x22\x75\xca\xde\x21\x5a\xa3\xde\x78\x1b\xa0\x05\x30\
+\xf4\xa0\xb3\x5d\xf3\x0e\x68\xce\x4a\xd5\xa0\x2f\xbf\x36\xba\xff\
+\x61\x3f\x17\xd0\xf8\xcb\xb1\xb3\x02\x87\x53\x92\x41\x6f\xa7\x78\
+\x14\x5e\x8c\x3f\x20\x4c\xc7\xf7\x38\x02\x04\x48\x86\x84\x7d\x90\
+\x18\x81\xc9\x90\xac\x10\x83\x49\xb6\x92\xb3\x0f\xb5\x18\x37\xcd\
+\x3c\x3d\xed\xef\x52\x99\x8a\xa2\xf8\x3f\x3e\x01\xf7\x27\x2f\x81\
+\xe2\x05\x69\x7e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x03\x75\
+\x00\
+\x00\x1a\xb1\x78\x9c\xed\x58\x5d\x6f\xd3\x30\x14\x7d\xaf\xd4\xff\
+\x60\xf5\x09\x5e\xaa\x2d\x0c\x21\xe5\x8d\xb5\x14\x2a\x0d\xa4\xd1\
+\x6d\x3c\x7b\xa9\xdb\x5a\x73\xe2\x60\x3b\xfb\x00\xf6\xdf\xb1\x93\
+\x38\x4d\xe2\x8f\x26\xac\x15\x0c\xed\x6a\xd2\x6a\xfb\xde\x9b\xe3\
+\x73\x6d\xe7\xc4\x38\x4e\x29\x13\xe0\x5c\x9c\x67\x38\xba\x01\xc1\
+\xf8\x64\x38\xc0\x8d\xbe\xf1\x84\x26\x82\x51\xc2\xe5\xe0\xb1\x31\
+\x78\x06\x1f\x68\x26\x38\x38\x1e\xbf\x19\x0e\x86\x83\xb9\x40\x31\
+\xf8\x39\x1c\x00\x69\x78\x19\x82\x18\xe2\x44\xf5\x15\x3d\x29\xa3\
+\x29\x62\xe2\x01\x40\x82\x21\x07\x2b\x4c\xd0\xe2\x81\xcb\xe1\x2b\
+\x48\x32\x74\x06\xaf\x11\x09\xad\xbd\x8e\x70\x16\xdf\x41\x86\xae\
+\x10\xe3\x98\x26\xcd\x1c\x8e\x21\x6b\xa2\x25\xba\xc5\x11\x9a\x4f\
+\xeb\x19\xcc\x3e\x6b\xe8\x35\xa5\x82\x50\xb8\x44\xcc\x82\xc2\x33\
+\xd8\x11\x47\x60\x03\x12\xf4\x63\x23\xf0\xd0\xe1\x4a\x65\x56\x20\
+\xb0\x17\xc6\x9e\xc0\x33\xf1\xc0\x4b\x8b\x3d\x1d\x62\x90\xa3\xd9\
+\x62\xb2\x41\xd1\xcd\x29\xbd\x0f\xdb\x1d\xd6\x20\x8e\x08\x8a\xc4\
+\xac\x9c\xf9\x3c\x86\x6b\x74\x9a\x09\x41\x93\xd0\x3d\x64\x67\x83\
+\x40\xbe\xd1\xce\x3a\x85\xa5\xd3\x81\x82\x61\x48\xbe\x64\xf1\xb5\
+\x9c\x6d\x6d\x69\xd8\xfb\xd5\x0e\x52\x49\x26\x94\x64\x71\x52\x6c\
+\x2d\xbd\x9b\xea\x3b\xaa\x3e\xbe\x1d\x85\x49\xb4\xa1\x8c\x8f\x19\
+\x5e\x6f\x44\x08\x52\x89\x2c\x11\x45\xcb\xe1\xf4\x19\xb2\x35\x96\
+\xb3\x39\x7e\x77\x64\x7a\x10\xb4\xda\x66\x51\x0d\xbb\x8b\x37\xc7\
+\xad\xa4\x02\x47\x90\x4c\x64\x0e\xc4\xaa\x6c\xcd\xee\x6d\x18\x4f\
+\x61\x84\x93\x75\x08\x82\x23\x4d\x85\xb2\x8f\x8c\x66\xa9\xac\x73\
+\x9d\x0a\x4d\x47\xb9\x3d\x92\x15\xd5\x5e\x4d\x1f\x81\x05\x41\x21\
+\x18\x4d\x73\x3f\x80\xa5\xe3\xa8\xe9\x51\xd0\x38\x96\xab\x9b\x7c\
+\xc3\x4b\xb1\x09\x81\x60\x19\xaa\x3f\xbf\xc0\x80\x97\x66\x41\x5c\
+\x48\xb4\xaf\xe9\xa9\x99\x51\x8f\xd3\x7c\x98\x5e\x8c\xde\xf1\x10\
+\xbc\x35\x07\xa2\xbc\xf2\x72\x2c\x68\x03\x2c\xa6\x22\x17\x91\x0d\
+\x5f\x0b\xe3\xf4\x02\xdd\x8b\xda\x39\xd4\x36\x21\x87\x43\xf0\x9d\
+\x5f\xb0\x57\x9a\xb8\xf9\x34\x1c\xbd\x36\xbd\x1f\x9f\x04\xa3\x7d\
+\x1e\xfa\x70\xd8\x9e\xae\x4c\xb2\x89\x7f\xc8\x37\x14\x24\xef\x09\
+\x5e\x27\xb1\xe4\x33\x04\x6a\x7e\xe3\xbc\xfd\xa9\xbd\xc6\x9a\x40\
+\xed\xa5\xdf\xcf\x2c\xeb\x7b\xbc\x07\xe1\x8b\x3c\x0c\x24\x79\xdc\
+\x1e\x49\x77\x1d\x39\xbb\xf0\x3c\x3f\xe2\x5b\xaf\xbb\x1e\xdc\xeb\
+\x13\x1d\xdc\x16\xa1\x7b\xa4\x7f\x87\x24\xf1\xa1\x7a\x8e\x15\xd0\
+\x52\xa1\x17\xf9\x04\x01\x9e\x47\x1d\x84\x7f\x97\xac\xf4\x61\x7a\
+\x7e\xd4\x1b\xea\xaa\x47\x05\x4e\xab\xd8\x03\x14\x60\xa7\x1a\xf6\
+\x21\xfb\xcb\x75\x70\x34\x1f\xbb\xaa\x94\x2c\x5d\x42\x81\xf4\xe9\
+\x62\x57\x2a\x5d\xe0\x94\x6a\xa6\xe0\xe4\x32\x4f\x5a\x1d\x2c\x8a\
+\xa2\xa6\xb7\x4b\x46\xba\x91\xd9\x85\xa5\x36\xbb\x76\x31\xfd\x5c\
+\x4c\xd4\x9f\xbb\xaa\xab\x6f\xb7\x7c\xeb\x43\x8e\x95\xa4\xea\x44\
+\xc7\xea\x41\x85\xfe\x33\x88\xda\x02\xf7\x89\xbc\x1d\xf0\xdd\x9a\
+\x4f\x5b\x37\xed\xa7\xad\xd0\x80\x27\x6e\x07\xbf\x16\xd4\xe6\xdd\
+\x97\xf5\x29\x19\xda\x30\xf0\xc7\x74\x17\x89\xda\xac\xe7\xc6\x1f\
+\xe3\x34\xbe\x1a\xbb\x00\xf5\xc1\x53\xf6\x94\xf3\x64\x3b\x93\xee\
+\x6b\x55\xd9\x7e\x68\x71\x89\x9e\x1e\xe4\x74\x52\x3f\x07\x45\xfd\
+\x52\xd3\xca\x1c\x32\xaa\x57\x39\xbb\xe9\xa9\x43\x61\x7e\x29\x66\
+\x65\x7e\x61\xd6\x83\x9e\x8e\x0a\xed\xc0\xc8\xff\xa7\xca\x76\xec\
+\xb6\x32\x39\x63\x30\x46\x3e\x95\x53\x5e\x54\xe6\x7e\xfd\x84\x8d\
+\xdd\x5b\xdf\x78\xee\x92\x27\xd6\x0b\x52\x9b\xd5\x0b\xf4\x41\x05\
+\xe5\xfb\xb7\x3c\x35\x7c\x15\xeb\xc3\x74\x57\x3a\x8b\x7b\x54\xff\
+\x1d\x86\xf7\xe6\xd6\x37\xbb\x45\x1e\x5a\xbd\x70\x0a\x3d\xe8\x9a\
+\x61\x39\x3b\xb8\x5d\x88\xe7\xe5\x32\xfc\xaa\xee\x4d\xc1\xaf\xaa\
+\x7d\x75\xb0\x2f\xbd\xdd\x6c\x38\x2f\xa1\x7d\x3c\xcc\x54\x10\x48\
+\xd0\x5d\xe3\xc3\xe1\xdf\x20\xc1\xd1\x2c\x7f\xca\x7f\xf2\xef\x37\
+\x11\x87\x95\x49\
+\x00\x00\x04\x48\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0a\x69\x6d\
+\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
 \x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
-\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
-\x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\
-\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
-\x0a\x20\x20\x20\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\
-\x77\x69\x64\x74\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\
-\x20\x32\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\
-\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\
-\x74\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x6d\x6f\x64\x61\x6c\
-\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\x66\x6f\x63\x75\x73\
-\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\
-\x6e\x67\x3a\x32\x30\x0a\x20\x20\x20\x20\x63\x6c\x6f\x73\x65\x50\
-\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\x75\x70\x2e\x43\x6c\x6f\
-\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\x65\x0a\x0a\x20\x20\x20\x20\
-\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x63\x6c\x65\x61\x72\x41\x6c\
-\x6c\x28\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\
-\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\
-\x73\x61\x67\x65\x2e\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\
-\x61\x2e\x74\x65\x78\x74\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\
-\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\x50\x69\
-\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x20\
-\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\
-\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\
-\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\x50\x69\x6e\x54\x65\x78\
-\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x20\x3d\x20\x22\x22\
-\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\
-\x74\x69\x6f\x6e\x20\x67\x65\x74\x45\x6e\x74\x65\x72\x65\x64\x44\
-\x61\x74\x61\x28\x29\x20\x7b\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x73\x65\x65\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\
-\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
-\x2e\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\
-\x78\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x65\
-\x77\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\
-\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\
-\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\
-\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x72\x65\x70\
-\x65\x61\x74\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\
-\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\
-\x65\x70\x65\x61\x74\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\
-\x64\x2e\x74\x65\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\
-\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\
-\x61\x6c\x20\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\
-\x43\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x0a\x20\x20\x20\x20\x50\
-\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\
-\x73\x73\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\
-\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\x74\x6f\x6e\
-\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\
-\x53\x65\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
-\x50\x6f\x70\x75\x70\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\x2e\x6f\
-\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\x53\x65\
-\x65\x64\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\
-\x70\x75\x70\x2e\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\
-\x6e\x43\x6c\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x02\xf5\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x37\x0d\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\
-\x6b\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0d\x0a\
-\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\
-\x61\x79\x6f\x75\x74\x73\x20\x31\x2e\x30\x0d\x0a\x69\x6d\x70\x6f\
-\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\
-\x77\x20\x32\x2e\x30\x0d\x0a\x0d\x0a\x50\x6f\x70\x75\x70\x20\x7b\
-\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x69\x64\x3a\x20\x66\x69\x72\x6d\
-\x77\x61\x72\x65\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
-\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\
-\x20\x73\x68\x6f\x77\x44\x6f\x6e\x65\x42\x75\x74\x74\x6f\x6e\x28\
-\x29\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\x72\
-\x6d\x77\x61\x72\x65\x55\x70\x64\x61\x74\x65\x4d\x65\x73\x73\x61\
-\x67\x65\x2e\x62\x75\x74\x74\x6f\x6e\x2e\x76\x69\x73\x69\x62\x6c\
-\x65\x20\x3d\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x7d\x0d\
-\x0a\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\
-\x68\x69\x64\x65\x44\x6f\x6e\x65\x42\x75\x74\x74\x6f\x6e\x28\x29\
-\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\x72\x6d\
-\x77\x61\x72\x65\x55\x70\x64\x61\x74\x65\x4d\x65\x73\x73\x61\x67\
-\x65\x2e\x62\x75\x74\x74\x6f\x6e\x2e\x76\x69\x73\x69\x62\x6c\x65\
-\x20\x3d\x20\x66\x61\x6c\x73\x65\x0d\x0a\x20\x20\x20\x20\x7d\x0d\
-\x0a\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\
-\x73\x65\x74\x46\x69\x72\x6d\x77\x61\x72\x65\x55\x70\x64\x61\x74\
-\x65\x4d\x65\x73\x73\x61\x67\x65\x54\x65\x78\x74\x28\x74\x65\x78\
-\x74\x29\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\
-\x72\x6d\x77\x61\x72\x65\x55\x70\x64\x61\x74\x65\x4d\x65\x73\x73\
-\x61\x67\x65\x2e\x6c\x61\x62\x65\x6c\x2e\x74\x65\x78\x74\x20\x3d\
-\x20\x74\x65\x78\x74\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\
-\x20\x20\x20\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\
-\x69\x64\x74\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\
-\x32\x0d\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\
-\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\
-\x74\x29\x20\x2f\x20\x32\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x6d\x6f\
-\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x66\
-\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\
-\x63\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\
-\x75\x70\x2e\x4e\x6f\x41\x75\x74\x6f\x43\x6c\x6f\x73\x65\x0d\x0a\
-\x0d\x0a\x20\x20\x20\x20\x46\x69\x72\x6d\x77\x61\x72\x65\x55\x70\
-\x64\x61\x74\x65\x4d\x65\x73\x73\x61\x67\x65\x20\x7b\x0d\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x66\x69\x72\x6d\x77\
-\x61\x72\x65\x55\x70\x64\x61\x74\x65\x4d\x65\x73\x73\x61\x67\x65\
-\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x75\x74\x74\
-\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x66\x69\x72\
-\x6d\x77\x61\x72\x65\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\
-\x70\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x0d\
-\x0a\x7d\x0d\x0a\
+\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
+\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
+\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x0a\x20\
+\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\
+\x73\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x3a\x20\x6f\x6b\x42\x75\
+\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\
+\x79\x20\x61\x6c\x69\x61\x73\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\
+\x61\x62\x65\x6c\x3a\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\x61\x62\
+\x65\x6c\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\
+\x61\x6c\x69\x61\x73\x20\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\
+\x65\x61\x3a\x20\x73\x65\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\
+\x0a\x20\x20\x20\x20\x73\x70\x61\x63\x69\x6e\x67\x3a\x20\x32\x30\
+\x0a\x0a\x20\x20\x20\x20\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x77\x61\x72\x6e\x69\x6e\
+\x67\x4c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\
+\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x3c\x62\x3e\x59\x6f\
+\x75\x72\x20\x6e\x65\x77\x20\x77\x61\x6c\x6c\x65\x74\x27\x73\x20\
+\x73\x65\x65\x64\x20\x69\x73\x20\x77\x72\x69\x74\x74\x65\x6e\x20\
+\x62\x65\x6c\x6f\x77\x2e\x20\x50\x6c\x65\x61\x73\x65\x20\x73\x61\
+\x76\x65\x20\x69\x74\x20\x69\x6e\x20\x61\x20\x73\x61\x66\x65\x20\
+\x70\x6c\x61\x63\x65\x2c\x20\x73\x6f\x20\x79\x6f\x75\x20\x77\x6f\
+\x75\x6c\x64\x20\x62\x65\x20\x61\x62\x6c\x65\x20\x74\x6f\x20\x72\
+\x65\x73\x74\x6f\x72\x65\x20\x79\x6f\x75\x72\x20\x77\x61\x6c\x6c\
+\x65\x74\x20\x69\x6e\x20\x63\x61\x73\x65\x20\x79\x6f\x75\x72\x20\
+\x53\x65\x63\x61\x6c\x6f\x74\x20\x64\x65\x76\x69\x63\x65\x20\x67\
+\x65\x74\x73\x20\x73\x74\x6f\x6c\x65\x6e\x20\x6f\x72\x20\x64\x61\
+\x6d\x61\x67\x65\x64\x2e\x0a\x3c\x62\x72\x3e\x50\x6c\x65\x61\x73\
+\x65\x20\x6e\x6f\x74\x65\x20\x74\x68\x61\x74\x3a\x0a\x3c\x62\x72\
+\x3e\x31\x2e\x20\x41\x6e\x79\x62\x6f\x64\x79\x20\x67\x65\x74\x74\
+\x69\x6e\x67\x20\x61\x63\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\
+\x75\x72\x20\x73\x65\x65\x64\x20\x77\x6f\x75\x6c\x64\x20\x68\x61\
+\x76\x65\x20\x61\x63\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\x75\
+\x20\x77\x61\x6c\x6c\x65\x74\x20\x61\x6e\x64\x20\x65\x76\x65\x72\
+\x79\x74\x68\x69\x6e\x67\x20\x6f\x6e\x20\x69\x74\x2e\x0a\x3c\x62\
+\x72\x3e\x32\x2e\x20\x49\x74\x20\x69\x73\x20\x73\x61\x66\x65\x72\
+\x20\x74\x6f\x20\x73\x74\x6f\x72\x65\x20\x79\x6f\x75\x72\x20\x73\
+\x65\x65\x64\x20\x69\x6e\x20\x61\x20\x6e\x6f\x6e\x2d\x65\x6c\x65\
+\x63\x74\x72\x6f\x6e\x69\x63\x20\x66\x6f\x72\x6d\x2c\x20\x66\x6f\
+\x72\x20\x65\x78\x61\x6d\x70\x6c\x65\x20\x6f\x6e\x20\x70\x61\x70\
+\x65\x72\x2e\x3c\x2f\x62\x3e\x22\x29\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x6d\x61\x78\x69\x6d\x75\x6d\
+\x57\x69\x64\x74\x68\x3a\x20\x34\x30\x30\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\x65\x3a\x20\x54\x65\x78\
+\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x74\x65\x78\x74\x46\x6f\x72\x6d\x61\x74\x3a\x20\x54\
+\x65\x78\x74\x2e\x52\x69\x63\x68\x54\x65\x78\x74\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x66\x69\x6c\x6c\
+\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\
+\x7d\x0a\x0a\x20\x20\x20\x20\x54\x65\x78\x74\x41\x72\x65\x61\x20\
+\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x73\x65\
+\x65\x64\x54\x65\x78\x74\x41\x72\x65\x61\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x22\
+\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\
+\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\
+\x65\x3a\x20\x54\x65\x78\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\
+\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x42\x75\x74\x74\
+\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\
+\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x4f\x4b\
+\x22\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\
+\x74\x2e\x61\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\
+\x41\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\
+\x74\x2e\x41\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0a\x20\
+\x20\x20\x20\x7d\x0a\x7d\x0a\
 \x00\x00\x02\x6a\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
@@ -2131,179 +2197,409 @@ qt_resource_data = b"\
 \x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
 \x20\x7d\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0d\x0a\x20\
 \x20\x20\x20\x7d\x0d\x0a\x7d\x0d\x0a\
-\x00\x00\x00\xf6\
+\x00\x00\x03\xd4\
+\x00\
+\x00\x0e\xad\x78\x9c\xa5\x57\xd9\x6e\xdb\x38\x14\x7d\x0f\x90\x7f\
+\x20\x04\x14\x90\x5a\x43\xb5\x8d\x3e\x05\xf0\x0c\xc6\x0d\x3c\x08\
+\xba\x20\xad\x9b\xf6\x99\x96\x69\x8b\x28\x45\xaa\x24\x95\x05\x83\
+\xfe\xfb\x5c\x92\x5a\x48\x2d\x8e\x91\x3a\x40\x2c\x93\xe7\x2e\x3c\
+\xf7\x50\xbc\xa4\x45\x29\xa4\x46\x5f\xf4\x97\x8a\x66\x3f\xd1\x32\
+\x7d\x77\x79\x41\x83\xb1\xf4\x9a\x62\x26\x8e\x0a\x2d\xd2\xf9\xe5\
+\xc5\xe5\xc5\x86\xca\xe2\x01\x4b\x72\x57\xee\xb1\x26\x1b\x21\x0b\
+\xf4\x9f\x19\x37\x7f\x08\x3e\xa5\x14\x25\x91\xfa\x09\xdd\x63\x89\
+\x14\x61\x24\xd3\x8d\xc9\x4d\x81\x8f\x64\x43\x19\xb9\x42\x51\xd4\
+\xe0\xcd\x6f\x17\xc2\xf8\x41\xf5\x87\xee\xaf\xd0\xa1\x9d\xe9\xc6\
+\x35\xd5\xd6\xfc\x96\x11\xac\x48\xed\x1f\x61\xc0\xba\x10\x88\x9a\
+\x18\x51\x67\x70\x10\x6c\x4f\xe4\x15\x52\x39\xac\x29\xab\xb4\x4a\
+\x73\x51\x90\x6e\x9e\xe3\xc2\xa4\xa4\x89\x54\xe0\xf6\x75\xba\xa3\
+\xdc\xb3\xbe\xa7\x8a\xee\x4c\xc0\x03\x66\xca\xb3\x12\xfc\x9f\x2c\
+\x23\xa5\x26\x90\xa6\x97\xb5\x0d\xe8\x2f\xf6\x86\x1f\xc4\x57\xf2\
+\xab\x22\x0a\xa0\xf1\x91\xe8\x5b\xac\xf3\x38\x49\x3a\x93\xdf\x0d\
+\x0f\xd6\xb6\xe2\x99\xa6\x82\xa3\x16\xd9\xf7\x6e\x48\x2d\x61\x06\
+\xad\x2c\x3d\x77\x92\xa5\x5a\x6c\xb5\xa4\xfc\x18\x27\x21\x54\x12\
+\x5d\x49\x6e\xd1\x41\xb8\x20\x6a\x58\xcd\x5b\x51\x56\xe5\xb0\x0c\
+\x03\x88\x9f\xb3\xe0\xef\x31\xcf\x08\x6b\x97\x39\x60\x24\x0b\xe7\
+\xe3\x64\x3a\x9d\x96\x00\x05\x04\x98\x48\x9f\x88\x52\xc0\x63\x5c\
+\xb8\xef\x80\x8f\x91\xc4\x52\xb0\x0b\x97\x54\x3b\xf8\x46\x1e\x75\
+\xeb\x64\x2a\x68\xc6\x84\x72\x7e\xe2\x67\x03\x59\x6c\x3c\xe9\xca\
+\xe4\x2f\xc5\x51\x42\xc4\x58\x69\x08\x3a\x43\xbb\x27\x4d\xd4\x96\
+\x70\x3d\x43\x5a\x68\xcc\xd6\xe6\x37\x3c\xe7\x52\x54\xc7\xbc\xac\
+\x60\x9c\x68\x1c\x04\x36\xd5\xd6\x90\x39\x54\xdb\x3a\x41\xab\xd5\
+\x0a\x45\x3b\x21\x34\x13\x18\x64\x1d\xa1\xbf\xd1\x2f\xf5\x4d\xc6\
+\xd1\xba\x1d\x03\x15\x27\xe8\xaa\x1e\x6e\xb8\x30\x83\xde\x26\x32\
+\x2e\xdf\xac\xd0\x27\x90\x46\x0a\xd1\xf9\x3e\x5e\xcc\xe7\xe8\x75\
+\x97\x22\x7a\xeb\xe5\x98\xa0\x37\x28\x7a\x35\x43\x11\x7c\xc7\x5d\
+\xba\x80\x59\xcc\x97\xef\x12\x10\xe0\x86\x3e\x42\x5d\x17\x16\x88\
+\x3e\xd0\xf5\x5b\x15\xf9\x12\xa1\x87\x18\x56\x86\xfe\x5a\xa1\xf9\
+\x40\xd0\x4d\x2e\x2e\xdf\x19\x7a\xb5\x40\x0a\x31\x72\xd0\x51\x92\
+\x62\x79\x8c\xbd\x1c\x0d\x3b\x93\x3b\x67\x5c\x0b\x6d\x0d\xc6\x57\
+\x36\xb3\xe1\x4f\x15\xf1\x9a\xdc\xd3\xcc\x6e\xe3\x78\xef\x1e\xaf\
+\x67\x30\x2e\xe1\xb5\xf4\xb9\x2a\x76\x44\xce\xda\xd0\xdf\xe1\x15\
+\x02\x56\x33\xbb\x31\xb7\x4f\x20\xf5\xa2\x1d\xea\x4a\x56\x0f\x25\
+\xee\xa5\xd9\xa4\xdf\xf8\xfe\x8e\x59\x45\x3e\xe2\x1d\x81\x6d\xed\
+\xea\xde\xcc\x74\x58\x3f\xfa\x10\xef\xcf\x0e\xe9\xa9\xa3\x0f\xcd\
+\x7a\x00\xdf\xb2\x5d\xcc\x88\x51\x6f\xa1\x9d\xd9\x60\xc1\x43\xeb\
+\x01\x64\xaa\x0c\x50\x40\xa2\xff\xbd\xbb\x09\x37\x65\x06\x27\x80\
+\xf4\xca\x73\x62\x57\xf7\x80\xe7\x52\x1f\x45\xe7\x92\xee\x23\x9f\
+\xa5\x3a\x04\x4f\xb3\xeb\xe3\xce\xa0\xb3\x81\x8f\xca\x78\xd3\x3f\
+\x94\x3c\x35\xbf\x5c\xbf\xd3\x14\x2e\xa7\xe5\x3b\xc9\xcf\xf2\x45\
+\x5a\x5c\xfe\x99\x18\x97\xcf\xa8\xd1\xd5\x7e\xb4\x89\xa9\x63\xba\
+\x0e\x25\x6d\x4f\xec\x93\x32\x1c\xd6\xe1\x5c\x22\xcf\x92\xd8\x04\
+\xfa\x04\x6b\x67\x8a\x6c\x14\x3f\xcd\xcb\xb4\x16\x2b\xd7\x35\x52\
+\x4e\x55\x6e\x5a\x81\x3f\x3a\xcf\xdd\x99\xe1\xc6\xc1\xda\xf9\x4c\
+\x23\xff\x90\x18\xf3\x99\xd3\x3d\x71\x3d\xcb\xba\xd2\x5a\xf0\xf8\
+\x0c\x7c\x7b\x90\x3c\x83\x85\x36\xf3\xe1\x5a\x70\x12\x7a\x6e\x79\
+\x50\xf4\xc8\x31\xab\x59\xe8\x3a\x22\x65\x1b\x38\x5b\xa9\xcf\xd0\
+\x8f\xda\xfd\xc6\xac\x62\xf8\xa6\xad\x5e\x0b\x4f\x02\x5f\x27\xfa\
+\xcd\x9e\xdb\xd0\x6e\xa4\x2b\xab\xe7\x87\x65\x75\xab\x49\xa1\xd5\
+\x63\x70\x23\xe8\xb5\x78\x53\xc2\x0e\x15\x58\x6f\x13\xb8\x1b\x0c\
+\x59\x39\x30\xac\xf2\xc6\xc3\x68\xac\xa0\x97\x98\xd4\x9d\x69\x8e\
+\xa2\x41\x87\x51\x60\xca\x7f\x50\xbe\x17\x0f\x36\xfa\x16\xae\x37\
+\xac\xee\xf2\x9c\x80\x7a\x77\x89\x46\xa4\xee\x2a\x61\x93\x0f\x35\
+\xf5\xbb\x7b\x24\x70\x2b\x98\xba\x00\xf4\x25\x34\x94\xc5\x4b\x44\
+\x77\x4a\x78\x53\xa2\x7e\xd1\xe6\x8a\xa2\x9e\x87\x81\x68\xc7\xcb\
+\x00\x5d\xac\x04\x3a\x37\xdb\xf7\x39\xc9\x7e\xae\xc5\x63\x9a\x99\
+\x87\x56\xb6\xa7\x12\xf2\xd5\xe1\x31\x6d\x85\x02\xff\xfe\x07\x45\
+\x7f\x7c\xcc\
+\x00\x00\x03\x9b\
+\x00\
+\x00\x15\xfa\x78\x9c\xcd\x58\xdd\x6f\xd3\x30\x10\x7f\xaf\xd4\xff\
+\xc1\xea\x13\x48\xa8\x5a\x5b\x04\x28\x6f\xac\xb0\x0f\x51\x36\xb6\
+\x55\xf0\x80\x78\xf0\x92\x6b\x6b\x2d\x89\x83\xe3\xac\x2b\x68\xff\
+\x3b\x76\x52\xb7\xf9\xb0\x5d\xa7\xdd\x00\xab\x52\x15\xdf\x9d\xf3\
+\xbb\x9f\xcf\x77\xe7\x90\x28\xa1\x8c\xa3\x2b\x7e\x95\x11\xff\x0e\
+\x0d\xfb\xaf\xbb\x1d\x52\x99\xeb\x8f\x69\xcc\x19\x0d\x53\x21\x1c\
+\x34\x84\x13\xbc\xa2\x19\x4f\xd1\xa0\x3f\xea\x76\xba\x9d\x73\x0e\
+\x11\xfa\xdd\xed\x20\x31\x48\xe0\xa1\x08\x93\x58\xce\x15\x33\x09\
+\xa3\x09\x30\xbe\x42\x38\x24\x38\x45\x94\x27\xd3\x55\x02\x5f\x71\
+\x98\xc1\x04\xdf\x42\xe8\x35\xa7\xb4\x86\x71\x16\xdd\x02\xbb\x9c\
+\x7d\x20\x73\xc2\x53\x69\xb0\x36\x37\x08\xb4\x8b\xa4\xc0\x2f\x60\
+\x79\x03\x9c\x93\x78\x9e\x1e\x67\x9c\xd3\xd8\xd3\xce\x6a\xcd\xb9\
+\x80\x7a\x8d\x03\x42\x95\x65\x6d\x42\x6b\xb4\xa8\x1b\x2d\x1c\x8c\
+\xaa\x4e\xdd\x24\x24\x3e\xa6\x0f\x75\x5f\xd7\xd3\xfa\x05\x60\xf9\
+\x09\x56\x53\x78\xe0\x27\x04\x42\xb1\x2b\xb5\x09\xad\xd1\x1c\x62\
+\xa1\xa3\x70\x96\x9f\x2c\xea\x13\x88\xe7\x7c\xb1\x81\xa8\x99\xb4\
+\x18\x9f\x50\x16\x61\x3e\xa6\xd1\x2d\x2d\x59\x57\x67\x65\x8c\xc9\
+\x05\xc6\x34\xcc\xa2\xb8\x08\x3e\x15\x6f\xe5\x98\x2b\xcb\xb7\x52\
+\x1c\xfb\x0b\xca\xd2\x7e\x08\x33\xee\xa1\x04\x33\x88\x79\xfe\xa0\
+\x57\xf9\x8c\xd9\x9c\x08\xe7\x07\x6f\x8f\x9a\x0a\x8c\xcc\x17\xdb\
+\x45\xf2\x27\x83\x92\x76\x99\x34\xc1\xbe\x88\x30\x0f\x0d\x35\x6b\
+\xdf\x0b\x6e\x88\x8f\xc3\xb1\x58\x1a\xd8\xe6\x25\xd5\x69\x45\x85\
+\x1c\xa7\x8c\x66\x89\xa0\xa7\x4c\x85\xa2\xc3\xcf\x98\xb4\x56\x21\
+\xad\x54\xab\x8a\x05\x53\xfd\x19\x09\xc3\x6f\x24\xe0\x0b\x11\xce\
+\x2c\x83\xaa\x0e\x27\x3c\x04\x0f\xfd\x4c\xa7\xec\x45\x6f\x5c\xac\
+\x2a\xcf\x4b\xbe\x6c\xef\x65\x19\x4f\x81\x89\x04\xcd\x0d\xb2\x22\
+\x53\x06\x4d\x75\xc5\x8c\x04\xa8\xf8\x68\x6a\x31\xba\x4c\x05\xa3\
+\x4d\x81\x9f\x87\x43\x21\x6b\x4a\xf3\x1c\xa1\x03\xa9\x80\xae\xb3\
+\x92\x3c\x30\xa5\x7c\x52\x1f\x5c\x88\x15\x3d\x97\xd3\x2f\x88\x0b\
+\x13\x4f\xf2\xa2\x53\x16\xde\x90\x5f\x22\xb1\xe2\xf0\x7d\x48\xe6\
+\x71\x24\xfc\xf1\x90\x7c\x41\x3f\x7f\x9e\x54\x82\x52\x8d\xc7\x43\
+\xd0\xd7\x73\xaa\x0d\xfe\x9e\xa8\xcf\x54\x64\xea\x6c\x5d\x42\x6c\
+\x7f\x27\x6b\x99\xdf\x7d\xa7\x2e\x72\x43\x44\x67\x28\xc8\x4d\xb5\
+\x3b\xf6\x24\x98\xaa\xd5\xc8\x86\xe9\x1f\xd3\x6f\x78\x7c\x74\xcd\
+\x38\xf1\xb6\x80\x3e\x51\xb6\x11\xcb\xc9\x55\x2d\xd9\xc6\x54\x10\
+\x0c\xb8\xf4\xf5\x41\x0d\xb7\x6c\x63\xf2\xa2\xa9\x69\x4f\x85\x5a\
+\xda\xcc\xa9\x50\x8e\x22\xd1\x8d\xf4\x42\x7b\xb2\x2b\x90\x5b\x22\
+\x57\xc1\xa9\x27\x3d\x4d\x5a\x55\xa3\x55\xe6\xd3\x9e\x25\x39\xae\
+\xe9\xd2\x4e\x52\x0d\xd9\x46\xdf\xac\xed\xbe\x45\x1b\x10\xdb\x66\
+\xcc\x06\x43\x41\xd1\x36\x7d\xa6\x51\xa6\x69\x2a\x78\x32\x31\xb4\
+\x0b\xbd\xcd\xc6\x5f\x80\x7f\x07\xc1\x2e\x55\xe3\x26\xc8\xd1\x92\
+\x03\x6d\x0f\x6b\x1a\x65\x0e\xce\x9e\x81\x83\xc7\x96\x41\xe7\x74\
+\x14\x0c\xc5\xc5\xf1\x44\x38\x55\x18\x2b\xc8\x75\xef\xdc\x0e\x66\
+\xa5\xe1\xd6\xbb\xde\x8e\x5a\x4e\x3d\xf4\xce\x2c\x9e\x31\x1a\x79\
+\xe8\x8d\x59\xe1\x5e\x36\x20\x46\x8d\x03\x77\x28\xbf\xd1\x58\xca\
+\x6b\xee\x40\x79\x53\x44\x35\xb9\x83\x55\xfb\xbd\xd8\xdc\x9a\xdc\
+\x20\xd5\x2e\x59\xbb\x60\xd9\x8e\x43\x9b\xfd\xd2\x1c\x03\xad\x47\
+\xf6\x53\x2e\xdd\xd0\x5f\x88\x77\xf7\x30\xc2\xc2\xe4\xcc\x5f\x6c\
+\x45\x8a\x3b\xe4\x13\x75\x21\xa7\x10\x03\xc3\x1c\x10\x96\xa1\xb3\
+\xcf\x8d\x47\xc1\xf9\x5f\x2f\x3a\xe5\x2b\xb7\x63\xaf\x5a\x28\xbb\
+\x77\xcd\xea\x26\xef\x0a\x63\x7b\xf3\xd7\x69\x47\x34\x90\xdf\x7d\
+\xbe\xf7\xce\xe0\x01\x07\xe0\x93\x08\x87\xbd\x57\xa8\x77\x8c\x53\
+\x18\x0d\x7b\x3f\x0c\x1d\x52\x71\xf1\x3c\x8f\x03\x78\xf0\xd0\xd1\
+\xc1\x51\xba\x37\xd3\xc5\xa7\x11\x47\xa6\x0b\x65\x77\xa6\x77\x54\
+\x8d\x3a\x0a\x6b\xbd\x68\x93\x7b\x64\x9d\x18\x19\x6a\x63\x51\x24\
+\x06\x06\xca\xd7\x15\x62\xa8\x11\x1f\xc2\xf2\xc7\x28\xe1\xb6\xda\
+\xb0\x2b\x01\xef\x99\x39\xab\xdf\xcc\x76\xbf\x5a\xa5\x97\x67\x4d\
+\x9b\xeb\x3f\xf1\xfb\x03\x02\x9e\x3f\x5f\
+\x00\x00\x02\x47\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0d\x0a\x0d\x0a\x4f\x70\x74\x69\x6f\x6e\x73\x46\x6f\x72\x6d\
-\x20\x7b\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\
-\x6f\x6e\x20\x73\x65\x74\x43\x68\x65\x63\x6b\x62\x6f\x78\x53\x74\
-\x61\x74\x65\x28\x73\x74\x61\x74\x65\x29\x20\x7b\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x2e\x63\
-\x68\x65\x63\x6b\x65\x64\x20\x3d\x20\x73\x74\x61\x74\x65\x0d\x0a\
-\x20\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x73\x69\x67\
-\x6e\x61\x6c\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x43\x6c\x69\x63\
-\x6b\x65\x64\x28\x62\x6f\x6f\x6c\x20\x73\x74\x61\x74\x65\x29\x0d\
-\x0a\x0d\x0a\x20\x20\x20\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x2e\
-\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x63\x68\x65\x63\x6b\x42\x6f\x78\x43\x6c\
-\x69\x63\x6b\x65\x64\x28\x63\x68\x65\x63\x6b\x42\x6f\x78\x2e\x63\
-\x68\x65\x63\x6b\x65\x64\x29\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\
-\x0d\x0a\x7d\x0d\x0a\
+\x34\x0d\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\
+\x6b\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0d\x0a\
+\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\
+\x61\x79\x6f\x75\x74\x73\x20\x31\x2e\x33\x0d\x0a\x0d\x0a\x43\x6f\
+\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0d\x0a\x20\x20\
+\x20\x20\x69\x64\x3a\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\
+\x75\x74\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\
+\x20\x61\x6c\x69\x61\x73\x20\x62\x75\x74\x74\x6f\x6e\x3a\x20\x62\
+\x75\x74\x74\x6f\x6e\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\
+\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x6c\x61\x62\x65\x6c\x3a\
+\x20\x6c\x61\x62\x65\x6c\x0d\x0a\x20\x20\x20\x20\x73\x70\x61\x63\
+\x69\x6e\x67\x3a\x20\x32\x30\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x4c\
+\x61\x62\x65\x6c\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x69\x64\x3a\x20\x6c\x61\x62\x65\x6c\x0d\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x22\
+\x29\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x6e\x74\x2e\
+\x70\x6f\x69\x6e\x74\x53\x69\x7a\x65\x3a\x20\x31\x34\x0d\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x76\x65\x72\x74\x69\x63\x61\x6c\x41\
+\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x54\x65\x78\x74\x2e\x41\
+\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x68\x6f\x72\x69\x7a\x6f\x6e\x74\x61\x6c\x41\
+\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x54\x65\x78\x74\x2e\x41\
+\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\x67\
+\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x48\
+\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\x67\
+\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\x20\x7d\x0d\
+\x0a\x0d\x0a\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0d\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x62\x75\x74\
+\x74\x6f\x6e\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\
+\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x4f\x4b\x22\x29\x0d\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\
+\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\
+\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\
+\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\x20\
+\x7d\x0d\x0a\x7d\x0d\x0a\
+\x00\x00\x00\x34\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x50\x69\x6e\x41\x6e\x64\x53\x65\x65\x64\x45\x6e\x74\
+\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0a\
+\x0a\x7d\x0a\
+\x00\x00\x00\x39\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x50\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\
+\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x46\x6f\
+\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
+\x00\x00\x00\x30\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x44\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\x4d\x65\
+\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
 \x00\x00\x02\x78\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
-\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
-\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
-\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x20\x20\
-\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\
-\x20\x79\x65\x73\x42\x75\x74\x74\x6f\x6e\x3a\x20\x79\x65\x73\x42\
-\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\
-\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x6e\x6f\x42\x75\x74\x74\x6f\
-\x6e\x3a\x20\x6e\x6f\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\
-\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x6c\
-\x61\x62\x65\x6c\x3a\x20\x6c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\
-\x73\x70\x61\x63\x69\x6e\x67\x3a\x20\x32\x30\x0a\x0a\x20\x20\x20\
-\x20\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x69\x64\x3a\x20\x6c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x22\
-\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\
-\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\
-\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x52\x6f\x77\x4c\
-\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x72\x6f\x77\x4c\x61\x79\x6f\x75\x74\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\
-\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\
-\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\
-\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\
-\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x79\x65\x73\x42\x75\
-\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x59\x65\x73\
-\x22\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x6e\
-\x6f\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\
-\x4e\x6f\x22\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\
-\x20\x20\x20\x7d\x0a\x7d\x0a\
-\x00\x00\x02\x64\
+\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
+\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
+\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
+\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
+\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x20\x20\
+\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\
+\x20\x79\x65\x73\x42\x75\x74\x74\x6f\x6e\x3a\x20\x79\x65\x73\x42\
+\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\
+\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x6e\x6f\x42\x75\x74\x74\x6f\
+\x6e\x3a\x20\x6e\x6f\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\
+\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x6c\
+\x61\x62\x65\x6c\x3a\x20\x6c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\
+\x73\x70\x61\x63\x69\x6e\x67\x3a\x20\x32\x30\x0a\x0a\x20\x20\x20\
+\x20\x4c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x69\x64\x3a\x20\x6c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x22\
+\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\
+\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\x65\
+\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x52\x6f\x77\x4c\
+\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x69\x64\x3a\x20\x72\x6f\x77\x4c\x61\x79\x6f\x75\x74\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\
+\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\
+\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\
+\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\
+\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x79\x65\x73\x42\x75\
+\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x59\x65\x73\
+\x22\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x6e\
+\x6f\x42\x75\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\
+\x4e\x6f\x22\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\
+\x20\x20\x20\x7d\x0a\x7d\x0a\
+\x00\x00\x00\x2c\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x42\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\
+\x65\x46\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
+\x00\x00\x03\x07\
+\x00\
+\x00\x0d\x66\x78\x9c\xed\x56\x5d\x4f\xdb\x30\x14\x7d\x47\xe2\x3f\
+\x58\x7d\xa1\x7d\x89\xd8\x26\xc1\x14\xa9\x0f\x1b\x8c\x0d\x69\x55\
+\x3b\x5a\x06\xaf\xc6\xb9\xa5\xd6\x1c\xdb\xb3\x1d\xda\x6e\xe2\xbf\
+\xcf\xa9\xe3\x26\x69\x9c\x14\x54\x1e\x57\x55\x2a\xdc\x8f\xe3\x7b\
+\xce\xbd\xb9\x0e\x4d\xa5\x50\x06\xfd\x30\x3f\x32\x4a\x7e\xa1\xf7\
+\xd1\xf9\xf1\x11\xad\xd9\xa2\x0b\xc1\x8d\x12\x4c\x5b\xe7\x69\xc3\
+\xf9\x1d\xaf\x45\x66\x34\x7a\x17\xf0\xdd\x51\x9e\x88\xa5\x4b\x3b\
+\x3e\xfa\x24\x25\xa3\x04\x1b\x2a\x78\xe1\xf8\x7b\x7c\x84\xec\x87\
+\x26\x71\x8a\x69\x61\x74\xa6\x27\xaa\xe9\x03\x83\x18\x19\x95\x81\
+\x33\x2d\x69\x62\x16\x31\x3a\xff\x70\xea\xfe\x5f\x00\x7d\x5c\x98\
+\x18\x9d\x7d\xdc\xa0\xe7\xa6\x94\x72\x9a\x66\xe9\xb7\xaa\xa7\x62\
+\xbf\xab\x20\x38\xc7\xdc\x32\x8b\x08\x96\xd4\x60\x46\xff\x6c\x4a\
+\x8b\xd1\x55\x6e\x1c\xd1\x15\x24\x17\x58\x83\x0f\x35\xd4\xe4\xf5\
+\xfc\xd6\x33\xd5\xef\x4d\x81\x60\x26\x0c\x2a\x94\x41\x13\xcc\x81\
+\x59\x09\xce\x7a\x03\x1f\x2f\xf8\x05\x13\x9a\xf2\xc7\xd8\xd3\xdc\
+\x7c\x88\x35\x42\x84\x09\x01\x69\x20\x41\x43\x34\xc7\x4c\x43\x25\
+\xa0\x54\x22\x5a\xd0\x04\xfa\x83\xc2\xf7\xec\x81\xef\xa8\xb2\xa8\
+\x1e\x74\x6b\x9e\x67\x9c\xe4\xf5\xa3\x04\x9e\x28\x01\x5b\x19\x07\
+\x62\x8f\xe8\x2b\xc0\x09\xa8\xd9\x5a\xc2\x20\x4f\x2a\x8f\xd2\xb6\
+\x5b\x0c\x46\xa0\x35\x7e\x84\x89\x90\x99\x8c\x36\xd5\xf5\x07\xd5\
+\x28\x3a\xef\xa3\x12\x02\x0d\x87\x43\x74\x32\xa7\x2a\x5d\x62\x05\
+\x27\x83\x1a\xb7\x1c\x73\x49\x25\xfc\xa4\xb0\x8c\x80\x63\xdb\xc0\
+\xcb\x4d\x31\x37\xc0\xb0\x2d\x65\x86\x1f\xf4\x96\x8f\xab\xdd\xff\
+\x09\x56\x84\x7d\x58\x57\xc5\xa9\x23\x91\xc0\x98\xb3\x75\x37\x6a\
+\x9b\x30\x97\x54\x93\xad\x36\x3b\x8a\x08\x23\x8b\x8e\x46\x0a\x34\
+\x98\xaf\xb7\xd7\x55\x64\x4f\xfb\x56\x26\xf6\xe0\x60\x08\x98\x05\
+\x28\xb0\xa3\x86\x19\x03\x13\x0c\x59\x29\xd9\xe1\x55\x90\x0a\x03\
+\x53\xa2\x00\x78\x2d\xa0\xd2\xb7\xad\x2e\x09\xd5\xad\x22\x77\xf6\
+\xd9\xc2\x4e\xab\xd6\x19\xac\x4c\xdf\x8d\xf6\x84\x81\x9d\x7a\x54\
+\x68\x84\x30\xf2\xb3\xee\xe4\x8b\x7a\x83\x7d\xe0\x42\x02\xf7\x94\
+\x9a\x5d\x30\x42\x8c\x30\x5f\xbb\x9a\xf5\xff\x0e\xec\xed\x00\xac\
+\x30\x31\x6c\x6d\x17\x0a\xbc\x75\x2f\x72\xaf\xab\x62\x13\xdd\x07\
+\xa5\x84\x2a\xf2\x6b\x8f\xf6\x4b\x09\xd4\x00\x5e\x5f\xd8\xb4\x11\
+\x57\x2d\xc2\x5e\x13\x01\xa4\x5d\x08\xdf\x9a\x46\xa6\x77\x94\x66\
+\xcc\xc9\x42\x28\x1d\xcd\x29\x63\x31\x92\x76\xae\xb8\x29\xbd\x24\
+\x53\xb9\xe1\x9a\x27\xb0\xb2\xf7\x10\x7e\xf8\x8c\x55\x54\x35\x56\
+\xa5\x2f\x97\x4c\xeb\x40\xec\xae\xb7\xca\xa8\xbb\xfd\x16\xba\x0d\
+\x9a\x33\xdf\x19\xbb\x33\xfc\x9d\xb1\xe5\x53\xd0\x1a\xf6\x1c\xa4\
+\xd8\xba\xd9\x5f\xc4\xb0\xbc\xd0\xf7\x12\x6c\x86\xb6\xf2\x6b\x86\
+\x86\xe8\xd5\xa3\xba\xd8\x75\xde\x35\x6f\xde\xc9\x57\x10\x7d\x83\
+\x46\x7e\xa9\x61\xef\x92\xc9\x9f\x95\xfa\xe9\x2d\x30\xf7\xfe\xd8\
+\x10\xc2\xb6\xa6\x96\xe4\xf1\x56\xb2\x50\x76\x29\x68\x4b\xfa\x55\
+\x4d\xc9\x10\x44\x5d\xeb\x16\x98\x9b\xca\xaa\x0f\x81\x54\xaf\x82\
+\xe0\x6b\xcb\x58\xe6\x33\xa3\x83\x1c\x9c\xab\xe3\xbd\x44\x58\x6c\
+\x15\xa3\xd9\x66\xb3\xec\xae\x2b\xb7\x6f\xda\xb6\x51\x79\x01\xd5\
+\x17\x92\x8f\xce\x31\x33\x63\x44\x83\x95\xb1\x5b\xda\xbf\xc4\xfa\
+\x39\xe8\x85\x5f\xc9\x5e\x84\x71\x7f\x33\x39\x24\x7d\x3c\x3b\x28\
+\xdd\x35\xf7\x10\x84\xea\x04\x1c\x44\xc4\x75\x3b\x00\x61\x7f\xec\
+\xf7\x1f\x0b\x55\xbd\xca\
+\x00\x00\x00\x2a\
+\x69\
+\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
+\x34\x0a\x0a\x59\x65\x73\x4e\x6f\x4d\x65\x73\x73\x61\x67\x65\x46\
+\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
+\x00\x00\x02\xca\
 \x00\
-\x00\x0d\xb2\x78\x9c\xd5\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
-\x39\x6d\x17\xa3\x49\x07\x0c\xd0\xad\xcd\x80\xae\x40\x77\x48\x57\
-\xa4\x67\xd5\x61\x12\x61\x8a\xa4\x49\x74\xda\x6e\xcb\x7f\x9f\xfc\
-\x19\x7f\xd0\x49\x87\x15\xcd\xa6\x83\x01\x91\x8f\x12\xf9\xf4\x4c\
-\x49\x6e\xac\x71\xc8\x66\x38\x4b\x65\xf2\x8d\x4d\xe2\x0f\x91\x6c\
-\x99\xe2\xa9\xd1\xe8\x8c\xf2\xc1\x37\xee\xfa\x6e\xc4\xb3\x49\xd1\
-\xb3\x71\x7c\x1e\x45\xd7\x08\x1b\xf6\x33\x62\x61\xc8\x05\x67\x1b\
-\x21\x75\x66\xca\x0d\xd6\x19\x0b\x0e\x9f\x99\x50\x52\x78\x26\xac\
-\x9d\x83\xf3\xd2\xe8\xb9\x50\x29\xdc\x88\x07\x50\x9c\xb4\x52\xd1\
-\x8f\x42\x29\xc0\xaf\x28\x30\xf5\xcd\x78\xda\x4e\xae\x20\x2d\x84\
-\xc4\xef\xf3\x80\xcb\x14\xd1\x68\x4e\x19\xa9\xd8\xc4\x81\x40\x28\
-\x50\x57\xce\xa4\xf6\xd2\x3c\x71\xd2\x4a\x45\x3b\xf0\x68\x5c\x2f\
-\x9c\x34\x1f\xcd\x7c\x1f\x4f\x9a\x8f\xee\x5f\x55\x4e\x18\x8f\x55\
-\x5e\x85\xf6\x6d\x51\x1e\x3a\x35\x2a\xdd\xe8\x42\x1f\xa5\x28\x9a\
-\xc2\x68\xba\x6b\xa7\xd0\xc9\xda\x38\x1f\x3b\xb9\x5a\x23\x67\x56\
-\x38\xd0\x58\xcc\x68\xcc\x17\xe1\x56\x32\x24\x31\xfe\x78\xd6\x03\
-\x28\x58\xee\xd7\xc8\x26\x24\xe2\xd0\x0a\xdb\x50\xba\x4c\x84\x9a\
-\x86\x15\xc0\xd5\x6b\xb5\xcd\x75\x94\xb7\x22\x91\x7a\xc5\xd9\xe4\
-\x2c\xaa\x8d\xd5\x49\x34\x18\xa8\x58\x58\xc0\x56\x26\x70\xad\x97\
-\xa6\x75\x5c\xd5\x40\x89\x0a\x38\x1b\x15\xcc\x32\x19\x70\xa3\x16\
-\xa0\xe0\x2e\x5e\x4a\xa5\xee\xe5\x02\xd7\x9c\xa1\x4b\x21\x6a\x61\
-\xae\x9c\x5c\xf4\x8e\x60\x28\x89\x0a\xda\x03\x56\x7c\x64\x5b\x55\
-\x2c\xf4\x40\xce\x3c\x7a\xce\xce\x7b\xf6\x24\x3f\xe8\xe0\x9a\x44\
-\x3d\x5f\xfe\x7b\x12\x99\x55\xd9\xed\xfb\xc1\x1d\x3c\xe1\xfe\x67\
-\xee\x0e\x0c\x5e\xce\xbe\xfb\x3b\xf7\x6e\x74\x61\x2d\xdb\x16\x41\
-\x7c\xf4\xbe\x07\xdf\xfd\x4d\x16\x9d\x9e\x72\x28\x0d\x62\xeb\x6c\
-\x04\x1e\xe5\x8f\xd0\x4f\x85\xba\x50\x72\xa5\x37\x81\x49\xce\xb2\
-\xe2\xe2\x7c\xfe\xb9\xa3\xa9\x76\x9a\xe4\x79\xbf\x42\x81\xcd\xb6\
-\xf9\x72\xa2\x4b\x61\xfa\x3c\xec\x95\xa8\x3e\xd0\xc0\x0f\xa5\x72\
-\x42\xb2\xe9\xd9\xee\x45\x1d\x60\xf0\xca\xa8\x6b\x2c\x7b\xc0\x34\
-\x07\x96\xec\xfc\x79\x17\x00\x2d\x1e\x14\x84\x0d\x97\x42\xf9\x8e\
-\x6f\xa0\x4d\x0f\xa5\x49\xb6\xed\x6a\x90\x7d\xa2\x87\x2a\x2e\x89\
-\x03\x22\x20\x6e\x14\x0a\xda\x14\x40\x9b\x20\x5a\x0d\x25\x53\x62\
-\x2f\x85\x59\x29\x84\xdb\xec\x2a\x61\xbf\xea\xf9\xfc\xd4\xc2\x18\
-\x7e\x0c\xd4\xc5\x97\xca\xb8\x2d\x90\xa7\x92\x46\x2b\xd1\xb7\xd0\
-\xc6\xd0\x43\xa5\x3b\x9a\xe2\xe8\x70\xf4\xdf\xab\x63\xf8\xa9\x57\
-\x57\x5f\xaa\xe3\x13\x04\xc4\xc9\xc4\xd1\xca\xf3\x2d\xc4\x31\xf4\
-\x7e\xef\x8e\xa6\x38\xda\x14\xfd\xd3\xda\x28\xbe\xbb\xe8\x37\x7d\
-\xc4\xbd\x8b\
-\x00\x00\x04\x60\
+\x00\x0d\x3b\x78\x9c\x9d\x56\x4d\x6f\xdb\x30\x0c\xbd\xfb\x57\x08\
+\xb9\x24\x01\x0a\xa3\x1d\x76\x1a\x50\x0c\x6d\xb3\x15\x05\xb6\xa2\
+\xdf\xdb\x8e\x6a\xcc\x04\x42\x55\x49\x95\xe8\xa6\xd9\x90\xff\x3e\
+\xfa\x23\x89\x65\x27\xb2\x1d\x9d\x6c\x51\x7c\x7c\x22\x9f\x28\x89\
+\x57\xa3\x2d\xb2\x5b\xbc\x4d\xc5\xf4\x85\x7d\x8a\x3f\x47\xc2\x9b\
+\x8a\x27\x82\x4b\x3d\x77\xec\x24\x3e\x89\xa2\xdf\xd6\xfc\xe2\x52\
+\x02\x7e\xd7\xf6\x95\xfd\x8b\x22\x46\xe3\x0f\xb8\x6b\xfd\x13\x9c\
+\xe3\x73\xb8\xd1\x26\x35\x64\x60\xe5\x10\xc9\x17\xb6\xac\xdb\x73\
+\xeb\xaa\x70\xbe\x11\xea\x4c\x25\x84\x7b\x0f\x53\x0b\xf8\x4d\xa1\
+\x5d\x06\xb0\x4c\xcb\xf2\x1a\x74\x07\xb8\x20\xc4\x44\x38\x23\xf9\
+\x72\x13\x2f\x00\x95\x04\x96\x56\x21\x2f\xb4\x52\x30\x45\xa1\x95\
+\xab\x20\x20\xb7\x73\xc0\x5d\xb9\xda\x2c\xd1\x8a\x12\x7d\x9e\x22\
+\x6a\x75\x21\xa9\x32\x40\x41\xb7\x00\xd9\x58\x08\x03\x3a\xc5\x3b\
+\x78\x4b\xc1\x21\x24\xa3\xf1\xc6\xbc\xea\x4e\xa1\x35\xc5\x15\x46\
+\x77\x14\x47\x5b\x08\xb2\x7a\xe7\x96\x81\x42\xb0\x90\x4c\x38\x72\
+\x76\xda\x1a\x21\x9e\xe7\x93\x6b\x8f\xca\x36\xb2\x61\x8b\x98\xdb\
+\x5d\x56\xc0\x63\x97\x23\x1e\x55\x03\xc6\x0a\x16\x24\x05\x7f\xce\
+\x82\x01\x8e\x34\x7d\x68\x8a\x82\x69\xb9\xb0\x04\x7e\x40\x56\x7a\
+\x66\x62\x9a\x87\xd9\x9d\x88\x43\x36\x3d\x4b\x55\xbe\x65\x36\x95\
+\xda\x41\xdb\xc9\x1c\x8d\x2b\x5b\x6a\x2d\x69\x0e\x59\xf2\xdf\x17\
+\xae\x35\x44\x3f\xd8\xfa\x89\x1c\x15\xe2\x18\xaf\xfb\x56\x36\x42\
+\xa7\x96\xc4\x84\x0d\xe7\x6e\x9e\xda\x80\xda\xc3\x8a\x40\x8b\x16\
+\x7a\xa5\x66\x7a\xc4\x8d\x79\x02\xeb\xc8\x70\xc4\x16\xe5\xb4\x40\
+\x6a\xb9\xe2\x2f\x24\x47\xd9\x9e\xc9\x2c\x66\x02\x12\x8f\xb6\x98\
+\x55\x3c\xd9\xe9\x29\x1b\x1e\xc7\xc7\xc3\x71\x4d\x63\x85\x3e\x8a\
+\x68\x97\x56\xa7\xe6\x5c\x7f\xc4\xa0\xf8\xb3\x84\x84\x04\x37\xe3\
+\xd2\xc1\xae\xa3\xd5\xc3\xa3\x6c\x39\x2d\x1e\x9e\xcb\x96\xf8\x13\
+\x97\x29\xfc\xe0\xcf\x20\x63\x84\x0f\xa4\xe5\x6f\xee\xc1\x8e\x86\
+\xd7\x1a\x99\x21\x2e\xa4\xdd\xa1\xaf\xf8\x22\x45\xf7\xc8\x31\x75\
+\xfb\xbc\x1f\xd5\x8b\xd2\x0b\x35\xac\x8b\x3c\x1b\x40\x6c\x6a\x49\
+\x0a\xd1\xd9\xda\x7a\xb0\x68\x94\xd1\xdf\x3e\x95\xae\xb1\x82\x2a\
+\x58\xb2\x1f\x88\xed\xec\x60\x5c\x2f\xe8\x41\x45\x3d\xac\xb0\x5d\
+\x8a\x8b\x36\xf5\x9d\x56\xde\xdf\x8e\x64\x77\xd8\x40\x03\xb4\x0b\
+\xff\x9d\x4e\xdd\xb4\xb9\x9b\xff\xbe\xbe\x08\xdc\x4e\xe0\x5d\x4c\
+\x21\x3f\xbd\xde\x99\x0c\x09\x69\x30\xd8\x2c\x0b\x8b\x87\x16\x6e\
+\x56\xf6\xaa\x74\xbf\x0a\x77\x4f\x4d\x3d\x05\xd9\xb1\xc4\xcb\xc7\
+\x2b\xaf\x35\x37\xf2\xb2\xb1\x34\xde\x33\x5e\xc7\xce\x46\xaf\x9b\
+\xa3\x74\xe8\x74\x0f\x38\x31\x57\x5c\xee\x7b\x14\x95\xd6\xc6\x63\
+\xc2\xa1\x15\x6a\xce\xd6\xef\x88\xf2\x77\x7d\x9b\x96\xbf\xb5\x8b\
+\xb4\xc4\xaa\x5f\xc7\xad\xbe\x51\xa3\x14\xc5\x93\x21\xf6\x5e\x0d\
+\x81\x5c\x52\x29\xaa\x8f\xef\x07\xd2\xd0\xa8\x68\x23\x67\x16\xd8\
+\x52\xa7\xcc\xa5\xe5\xc7\x82\x2b\x64\xa8\x59\x02\x14\x26\x9f\xb2\
+\xa5\x14\xbf\x52\x9f\x09\xc4\x68\x5e\x65\x9e\xd4\x82\x8c\x3b\xd4\
+\x96\x84\x73\x26\x65\x1f\x3d\x34\x09\x55\x0f\x4a\x1b\x9f\xae\x1c\
+\xda\xe2\xae\xa2\xff\x8b\x1c\x27\xed\
+\x00\x00\x04\x6b\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
-\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0a\x69\x6d\
+\x37\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\
+\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0a\x69\x6d\
 \x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\x61\x79\
-\x6f\x75\x74\x73\x20\x31\x2e\x33\x0a\x0a\x43\x6f\x6c\x75\x6d\x6e\
-\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0a\x20\x20\x20\x20\x69\x64\x3a\
-\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x0a\x0a\x20\
-\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\x61\x6c\x69\x61\
-\x73\x20\x6f\x6b\x42\x75\x74\x74\x6f\x6e\x3a\x20\x6f\x6b\x42\x75\
-\x74\x74\x6f\x6e\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\
-\x79\x20\x61\x6c\x69\x61\x73\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\
-\x61\x62\x65\x6c\x3a\x20\x77\x61\x72\x6e\x69\x6e\x67\x4c\x61\x62\
-\x65\x6c\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\x20\
-\x61\x6c\x69\x61\x73\x20\x73\x65\x63\x72\x65\x74\x54\x65\x78\x74\
-\x41\x72\x65\x61\x3a\x20\x73\x65\x63\x72\x65\x74\x54\x65\x78\x74\
-\x41\x72\x65\x61\x0a\x20\x20\x20\x20\x73\x70\x61\x63\x69\x6e\x67\
-\x3a\x20\x32\x30\x0a\x0a\x20\x20\x20\x20\x4c\x61\x62\x65\x6c\x20\
-\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x77\x61\
-\x72\x6e\x69\x6e\x67\x4c\x61\x62\x65\x6c\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x74\x65\x78\x74\x3a\x20\x71\x73\x54\x72\x28\x22\x3c\
-\x62\x3e\x59\x6f\x75\x72\x20\x6e\x65\x77\x20\x77\x61\x6c\x6c\x65\
-\x74\x27\x73\x20\x58\x52\x50\x20\x73\x65\x63\x72\x65\x74\x20\x69\
-\x73\x20\x77\x72\x69\x74\x74\x65\x6e\x20\x62\x65\x6c\x6f\x77\x2e\
-\x20\x50\x6c\x65\x61\x73\x65\x20\x73\x61\x76\x65\x20\x69\x74\x20\
-\x69\x6e\x20\x61\x20\x73\x61\x66\x65\x20\x70\x6c\x61\x63\x65\x2c\
-\x20\x73\x6f\x20\x79\x6f\x75\x20\x77\x6f\x75\x6c\x64\x20\x62\x65\
-\x20\x61\x62\x6c\x65\x20\x74\x6f\x20\x72\x65\x73\x74\x6f\x72\x65\
-\x20\x79\x6f\x75\x72\x20\x77\x61\x6c\x6c\x65\x74\x20\x69\x6e\x20\
-\x63\x61\x73\x65\x20\x79\x6f\x75\x72\x20\x53\x65\x63\x61\x6c\x6f\
-\x74\x20\x64\x65\x76\x69\x63\x65\x20\x67\x65\x74\x73\x20\x73\x74\
-\x6f\x6c\x65\x6e\x20\x6f\x72\x20\x64\x61\x6d\x61\x67\x65\x64\x2e\
-\x0a\x3c\x62\x72\x3e\x50\x6c\x65\x61\x73\x65\x20\x6e\x6f\x74\x65\
-\x20\x74\x68\x61\x74\x3a\x0a\x3c\x62\x72\x3e\x31\x2e\x20\x41\x6e\
-\x79\x62\x6f\x64\x79\x20\x67\x65\x74\x74\x69\x6e\x67\x20\x61\x63\
-\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\x75\x72\x20\x58\x52\x50\
-\x20\x73\x65\x63\x72\x65\x74\x20\x77\x6f\x75\x6c\x64\x20\x68\x61\
-\x76\x65\x20\x61\x63\x63\x65\x73\x73\x20\x74\x6f\x20\x79\x6f\x75\
-\x20\x77\x61\x6c\x6c\x65\x74\x20\x61\x6e\x64\x20\x65\x76\x65\x72\
-\x79\x74\x68\x69\x6e\x67\x20\x6f\x6e\x20\x69\x74\x2e\x0a\x3c\x62\
-\x72\x3e\x32\x2e\x20\x49\x74\x20\x69\x73\x20\x73\x61\x66\x65\x72\
-\x20\x74\x6f\x20\x73\x74\x6f\x72\x65\x20\x79\x6f\x75\x72\x20\x58\
-\x52\x50\x20\x73\x65\x63\x72\x65\x74\x20\x69\x6e\x20\x61\x20\x6e\
-\x6f\x6e\x2d\x65\x6c\x65\x63\x74\x72\x6f\x6e\x69\x63\x20\x66\x6f\
-\x72\x6d\x2c\x20\x66\x6f\x72\x20\x65\x78\x61\x6d\x70\x6c\x65\x20\
-\x6f\x6e\x20\x70\x61\x70\x65\x72\x2e\x3c\x2f\x62\x3e\x22\x29\x0a\
-\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x6d\
-\x61\x78\x69\x6d\x75\x6d\x57\x69\x64\x74\x68\x3a\x20\x34\x30\x30\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x77\x72\x61\x70\x4d\x6f\x64\
-\x65\x3a\x20\x54\x65\x78\x74\x2e\x57\x6f\x72\x64\x57\x72\x61\x70\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x46\x6f\x72\
-\x6d\x61\x74\x3a\x20\x54\x65\x78\x74\x2e\x52\x69\x63\x68\x54\x65\
-\x78\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\
-\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\x74\x68\x3a\x20\x74\x72\x75\
-\x65\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\x20\x20\x54\x65\x78\
-\x74\x41\x72\x65\x61\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x73\x65\x63\x72\x65\x74\x54\x65\x78\x74\x41\x72\
-\x65\x61\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\
-\x20\x71\x73\x54\x72\x28\x22\x22\x29\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x66\x69\x6c\x6c\x57\x69\x64\
-\x74\x68\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x77\x72\x61\x70\x4d\x6f\x64\x65\x3a\x20\x54\x65\x78\x74\x2e\
-\x57\x6f\x72\x64\x57\x72\x61\x70\x0a\x20\x20\x20\x20\x7d\x0a\x0a\
-\x20\x20\x20\x20\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x6f\x6b\x42\x75\x74\x74\x6f\
-\x6e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\
-\x71\x73\x54\x72\x28\x22\x4f\x4b\x22\x29\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\x67\x6e\x6d\
-\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x48\x43\x65\
-\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x56\
-\x43\x65\x6e\x74\x65\x72\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
+\x6f\x75\x74\x73\x20\x31\x2e\x30\x0a\x69\x6d\x70\x6f\x72\x74\x20\
+\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\x77\x20\x32\
+\x2e\x30\x0a\x0a\x50\x6f\x70\x75\x70\x20\x7b\x0a\x0a\x20\x20\x20\
+\x20\x69\x64\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\
+\x63\x72\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
+\x50\x6f\x70\x75\x70\x0a\x20\x20\x20\x20\x78\x3a\x20\x28\x70\x61\
+\x72\x65\x6e\x74\x2e\x77\x69\x64\x74\x68\x20\x2d\x20\x77\x69\x64\
+\x74\x68\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\
+\x70\x61\x72\x65\x6e\x74\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\
+\x68\x65\x69\x67\x68\x74\x29\x20\x2f\x20\x32\x0a\x20\x20\x20\x20\
+\x6d\x6f\x64\x61\x6c\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\
+\x66\x6f\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0a\x20\x20\x20\x20\
+\x70\x61\x64\x64\x69\x6e\x67\x3a\x32\x30\x0a\x20\x20\x20\x20\x63\
+\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\x75\
+\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\x65\x0a\
+\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x63\x6c\
+\x65\x61\x72\x41\x6c\x6c\x28\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\
+\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x73\
+\x65\x63\x72\x65\x74\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\
+\x78\x74\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\
+\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x6e\x65\x77\x50\
+\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\
+\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\
+\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\
+\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\
+\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\
+\x74\x20\x3d\x20\x22\x22\x0a\x20\x20\x20\x20\x7d\x0a\x0a\x20\x20\
+\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x67\x65\x74\x45\x6e\
+\x74\x65\x72\x65\x64\x44\x61\x74\x61\x28\x29\x20\x7b\x0a\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x73\x65\x63\x72\x65\x74\
+\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\
+\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x2e\x73\x65\
+\x63\x72\x65\x74\x54\x65\x78\x74\x41\x72\x65\x61\x2e\x74\x65\x78\
+\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6e\x65\x77\
+\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\
+\x63\x72\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\
+\x2e\x6e\x65\x77\x50\x69\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\
+\x2e\x74\x65\x78\x74\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x72\x65\x70\x65\x61\x74\x50\x69\x6e\x3a\x20\x70\x69\x6e\x41\
+\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\x72\x79\
+\x4d\x65\x73\x73\x61\x67\x65\x2e\x72\x65\x70\x65\x61\x74\x50\x69\
+\x6e\x54\x65\x78\x74\x46\x69\x65\x6c\x64\x2e\x74\x65\x78\x74\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\x0a\
+\x0a\x20\x20\x20\x20\x73\x69\x67\x6e\x61\x6c\x20\x72\x65\x73\x74\
+\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\
+\x28\x29\x0a\x0a\x20\x20\x20\x20\x50\x69\x6e\x41\x6e\x64\x58\x72\
+\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\
+\x61\x67\x65\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\
+\x3a\x20\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\
+\x74\x45\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x0a\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x63\x61\x6e\x63\x65\x6c\x42\x75\x74\
+\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x70\x69\x6e\
+\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\x6e\x74\x72\
+\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x2e\x63\x6c\
+\x6f\x73\x65\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x72\x65\x73\x74\x6f\x72\x65\
+\x42\x75\x74\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\
+\x3a\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x70\x69\x6e\x41\x6e\x64\x58\x72\x70\x53\x65\x63\x72\x65\x74\x45\
+\x6e\x74\x72\x79\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
+\x2e\x72\x65\x73\x74\x6f\x72\x65\x42\x75\x74\x74\x6f\x6e\x43\x6c\
+\x69\x63\x6b\x65\x64\x28\x29\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x7d\x0a\x7d\x0a\
 \x00\x00\x05\xa6\
 \x69\
 \x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
@@ -2397,325 +2693,6 @@ qt_resource_data = b"\
 \x74\x65\x64\x28\x6b\x65\x79\x46\x6f\x72\x6d\x61\x74\x2c\x20\x6b\
 \x65\x79\x4c\x65\x6e\x67\x74\x68\x29\x0d\x0a\x20\x20\x20\x20\x7d\
 \x0d\x0a\x7d\x0d\x0a\
-\x00\x00\x00\x30\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x44\x69\x73\x70\x6c\x61\x79\x53\x65\x65\x64\x4d\x65\
-\x73\x73\x61\x67\x65\x46\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
-\x00\x00\x03\x06\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0d\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\
-\x6b\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x31\x0d\x0a\
-\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\
-\x61\x79\x6f\x75\x74\x73\x20\x31\x2e\x33\x0d\x0a\x0d\x0a\x43\x6f\
-\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\x75\x74\x20\x7b\x0d\x0a\x20\x20\
-\x20\x20\x69\x64\x3a\x20\x63\x6f\x6c\x75\x6d\x6e\x4c\x61\x79\x6f\
-\x75\x74\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\x79\
-\x20\x61\x6c\x69\x61\x73\x20\x6c\x61\x62\x65\x6c\x3a\x20\x6c\x61\
-\x62\x65\x6c\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\x65\x72\x74\
-\x79\x20\x61\x6c\x69\x61\x73\x20\x62\x75\x74\x74\x6f\x6e\x3a\x20\
-\x62\x75\x74\x74\x6f\x6e\x0d\x0a\x20\x20\x20\x20\x70\x72\x6f\x70\
-\x65\x72\x74\x79\x20\x61\x6c\x69\x61\x73\x20\x62\x75\x73\x79\x49\
-\x6e\x64\x69\x63\x61\x74\x6f\x72\x3a\x20\x62\x75\x73\x79\x49\x6e\
-\x64\x69\x63\x61\x74\x6f\x72\x0d\x0a\x20\x20\x20\x20\x73\x70\x61\
-\x63\x69\x6e\x67\x3a\x20\x32\x30\x0d\x0a\x0d\x0a\x20\x20\x20\x20\
-\x42\x75\x73\x79\x49\x6e\x64\x69\x63\x61\x74\x6f\x72\x20\x7b\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x62\x75\x73\
-\x79\x49\x6e\x64\x69\x63\x61\x74\x6f\x72\x0d\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\x67\x6e\
-\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\x48\x43\
-\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\
-\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\
-\x0d\x0a\x20\x20\x20\x20\x4c\x61\x62\x65\x6c\x20\x7b\x0d\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3a\x20\x6c\x61\x62\x65\x6c\
-\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\x3a\x20\
-\x71\x73\x54\x72\x28\x22\x22\x29\x0d\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x66\x6f\x6e\x74\x2e\x70\x6f\x69\x6e\x74\x53\x69\x7a\x65\
-\x3a\x20\x31\x34\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x65\
-\x72\x74\x69\x63\x61\x6c\x41\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\
-\x20\x54\x65\x78\x74\x2e\x41\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\
-\x65\x72\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x68\x6f\x72\x69\
-\x7a\x6f\x6e\x74\x61\x6c\x41\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\
-\x20\x54\x65\x78\x74\x2e\x41\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\
-\x65\x72\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\
-\x75\x74\x2e\x61\x6c\x69\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\
-\x2e\x41\x6c\x69\x67\x6e\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\
-\x51\x74\x2e\x41\x6c\x69\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\
-\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x42\x75\
-\x74\x74\x6f\x6e\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x62\x75\x74\x74\x6f\x6e\x0d\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x76\x69\x73\x69\x62\x6c\x65\x3a\x20\x66\x61\x6c\
-\x73\x65\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x65\x78\x74\
-\x3a\x20\x71\x73\x54\x72\x28\x22\x4f\x4b\x22\x29\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x4c\x61\x79\x6f\x75\x74\x2e\x61\x6c\x69\
-\x67\x6e\x6d\x65\x6e\x74\x3a\x20\x51\x74\x2e\x41\x6c\x69\x67\x6e\
-\x48\x43\x65\x6e\x74\x65\x72\x20\x7c\x20\x51\x74\x2e\x41\x6c\x69\
-\x67\x6e\x56\x43\x65\x6e\x74\x65\x72\x0d\x0a\x20\x20\x20\x20\x7d\
-\x0d\x0a\x7d\x0d\x0a\
-\x00\x00\x05\xab\
-\x00\
-\x00\x1f\x38\x78\x9c\xed\x59\x51\x6f\xdb\x36\x10\x7e\x2f\xd0\xff\
-\x20\xf4\xa5\x2e\x60\x08\xdb\x5e\x06\x14\xc8\x43\x6a\xc7\x5d\xb0\
-\x26\x4e\x62\x67\xd9\xf6\x26\x4b\x67\x9b\x88\x44\x32\x24\x15\xc7\
-\x1d\xf2\xdf\x77\x94\x64\x49\x94\x28\x99\x4a\xd3\xee\x65\x7a\x48\
-\x64\x93\x77\xf7\x1d\xef\x23\xef\x8e\x26\x09\x67\x42\x79\xd7\xea\
-\x3a\x25\xe1\xbd\xf7\x8b\xff\xeb\xdb\x37\xc4\xf8\xce\x9f\x30\xaa\
-\x04\x8b\x25\x0e\xfe\xd4\x1a\xfc\x12\xec\x59\xaa\xa4\xf7\xb3\x65\
-\xec\x8e\xd0\x88\xed\x72\xb1\xb7\x6f\xce\x15\x24\xde\x3f\xfa\xcd\
-\xc3\x67\xc2\x70\x2e\x05\xaa\x7c\x46\xf5\x7b\x0c\x0a\xa2\x8f\x7a\
-\xdc\x2b\x9e\x87\x24\xfe\x0d\x62\x0e\xe2\x56\x91\x58\xfa\x1b\x50\
-\x93\x54\x08\x94\x58\x80\x52\x84\x6e\xe4\xe8\xc3\x41\x99\x7e\x04\
-\x24\x4c\xc1\x22\x14\x00\xf4\x06\x21\x11\x0a\xd2\x27\xf2\x82\xad\
-\x48\x0c\x57\x5b\xb4\xf5\x89\xa5\x34\xd2\x42\x7a\xfa\x73\x05\x84\
-\x52\x08\x15\x61\x54\xd6\xad\xab\x40\xa0\xc5\x8f\x9e\xdc\x4b\xc4\
-\xbd\x14\xc1\xbe\x1a\x63\x74\xce\x81\x9e\x72\x7e\x01\x34\xd5\x6e\
-\x4d\x62\x74\xb7\x01\x5f\x3f\x49\x40\x68\xbe\x08\xbe\xdc\xb2\xdd\
-\xc1\xb6\x65\x58\x04\x44\x42\xdf\x38\x3c\xa4\x20\xd5\x29\x02\x7d\
-\x0c\x94\x31\xf3\xb9\xbe\x0a\x8c\x9e\x3d\x11\x75\x0c\xd7\xb5\xf2\
-\x1f\x52\xa2\x1a\x5a\x86\x2c\x8b\x19\x1c\x13\x41\x23\x4c\x37\x10\
-\x44\xfb\x16\x04\xc6\x33\xdd\xbe\xc4\xb0\x6e\x21\xbc\x5f\xb1\xa7\
-\x85\xd2\x9e\x49\xa0\x51\xa1\x61\x49\x12\x58\xb2\x29\x3c\x92\x10\
-\x8c\x58\xeb\x87\xac\xbb\xa6\x7a\x27\x27\x27\x9e\x12\x29\x7c\x68\
-\x1a\xd5\x4f\x94\xcd\x41\xca\x25\x29\x25\x61\xa0\x98\xf0\x5b\x7a\
-\x4e\xe3\xb8\xf0\x1f\xa2\x5c\xa7\x6c\xc6\xa6\x52\x35\xc3\x08\x81\
-\xf0\xf3\x0f\xa7\x51\x04\x91\x1f\xe6\xc2\x23\x17\x5b\xa5\x7b\x75\
-\xcd\xcf\xe6\x47\x88\x25\x74\xfb\x62\x01\x10\x11\xf9\x9a\x18\x06\
-\x92\xa3\x88\x6d\x83\x15\x3a\xca\x9f\xd8\x53\x17\x27\x1b\xdb\x5d\
-\xb6\xb7\xbb\xd4\xfc\xb0\xf2\x40\x0f\xfc\x1f\xf5\xff\x3a\xea\x8a\
-\x17\x99\xc2\x0c\x3c\xc6\x6f\xae\x78\x75\x1a\x64\x07\x99\x85\x00\
-\x56\xc8\x6a\xbe\xbc\x2a\x09\x40\xd3\x64\x05\x62\xbe\x9e\x92\x0d\
-\x51\x72\xec\xa9\x3d\x87\xb1\x77\x0f\xfb\xee\xd3\xf0\x33\x50\x10\
-\xc8\x8e\x4b\xd8\xfd\x0e\xfb\x41\xc6\x37\x85\x28\x22\x40\xd1\x11\
-\x9a\x99\x31\x91\x04\x2a\xb3\xf8\x05\xe8\x46\x6d\x5f\x7e\x7e\xae\
-\x89\x48\x76\x81\x80\x5b\x1e\xa1\x09\x13\x73\xfe\x9d\x89\xd5\x86\
-\xb6\x60\x80\x54\x8c\x5f\x30\x4a\x10\x33\xae\x52\x93\xb1\x16\xc7\
-\xd6\x71\x20\xb7\xb3\x02\xc0\x68\x8d\xe9\xf1\x32\x48\x70\x21\xc3\
-\x18\x02\x3a\xc3\x8f\x8b\x2c\xe7\x95\x00\xba\x57\xf7\xa0\xe4\x3c\
-\x09\x36\x70\x4e\xd7\x6c\xe0\x02\xab\x96\x82\x12\xce\xcb\x97\x16\
-\xd4\x16\x04\xa4\xc9\x5d\x10\x63\x51\x61\x02\xbe\x23\x1c\xb0\x36\
-\x38\xbe\xb6\x06\xd0\x5d\x2e\x75\x66\x28\xee\x49\xc1\x37\xa8\x9b\
-\x09\x87\x08\x1a\x56\x44\x2e\xd5\xb0\x22\x01\xa2\xb1\x47\x61\x77\
-\x45\xe8\x18\x8b\x1c\x0e\x81\xc2\xd7\x6e\xe3\x13\x01\x4e\xec\x31\
-\x6c\x87\x99\x50\xc3\xb4\x93\x51\xd7\xa8\x3c\x09\xfe\xea\x01\xf9\
-\xf3\xa0\xf3\x7b\xc5\xa2\x32\x20\x01\x97\x48\xfd\xa8\x40\x54\x76\
-\xdd\x63\xe0\x14\x85\x7a\x91\x6c\xa2\xad\xd7\xc9\x78\xae\xe0\x49\
-\x82\xe5\x98\xb0\xe3\xb6\x96\xda\x52\x4f\x6f\x6b\xe9\x09\x4d\x7b\
-\x32\x9e\x68\x44\x6e\xdd\x6d\xae\xb3\xf9\x2f\x35\x7a\x4b\x57\x38\
-\xbd\x75\x52\x59\x2d\xa5\xd9\xdc\x9a\xb0\xd5\x84\xeb\x66\xa8\x9f\
-\xdf\x26\xbc\x39\x85\x69\xc1\x8a\xa2\x12\xb1\xac\x45\xad\x2f\x88\
-\xcc\xc9\x23\xa4\x0f\xea\x5c\x62\x62\x6c\x15\x4a\x56\x9a\xeb\xd9\
-\x0b\x88\xeb\xc2\x79\x32\xe8\x51\x84\x15\x57\x6d\x38\xab\xbb\xde\
-\x1f\xf2\xd9\x7b\xd7\xea\x6b\x63\xa6\xf6\xce\x3a\xab\x29\x64\x9e\
-\x51\x59\xca\x70\x96\x2d\xb7\xd5\x30\xb1\x85\x8c\xaf\xd2\x15\x96\
-\xad\x58\x06\x60\xcc\x36\x20\x38\x66\x5a\xd5\x54\xf0\xec\xb0\xe0\
-\xa8\x2d\x0f\x6f\x13\x41\x83\xa5\x97\x45\x71\x26\x07\xd1\x60\x5a\
-\xd6\x7f\x10\x8d\xdc\xe3\x3f\x05\x79\x60\x40\xdf\xbe\x11\xb0\xdc\
-\x06\x83\x09\xaa\x18\xbb\x08\xe8\xbe\x56\x4f\x7f\x2b\x2a\x03\x9c\
-\xd3\x46\xab\x6b\x6f\x34\xcb\x42\x30\x31\x0f\x43\x5d\x16\xf7\xb6\
-\xef\x0c\x1b\xfe\x05\xd1\xd7\x14\x57\x8c\xa7\x7c\x04\x5a\xf0\x02\
-\xa4\xc4\xba\xa5\xaf\xfa\xac\x93\xbc\xa3\x11\x2e\xcb\xe6\x5a\xcf\
-\xd3\x57\xf5\xa2\x40\xb1\x2d\x3b\xac\x2e\x1c\xac\x0e\xda\x91\x6d\
-\xaf\x2a\x12\xdb\xd5\x9b\xe5\xad\x76\xac\x46\xfb\xdc\xf6\xf9\x74\
-\xec\x49\x10\x24\x88\x2f\x33\x07\xc7\xde\x7a\xf7\x07\x08\x89\xa1\
-\xc4\x57\x59\xbe\xae\x18\x53\x31\xd3\x8c\x28\xbe\x3a\x5e\x8e\xe6\
-\x56\xb5\x2d\x07\x60\x59\x3c\x8b\x48\x8e\x92\x63\x11\x35\x4d\x38\
-\x39\x9f\x66\xff\x0e\xa9\xcd\x5e\x9f\x17\xa5\xbc\x2e\x3b\xb2\x2c\
-\x6a\xab\xe6\x7b\x91\xcc\x02\x4c\x4c\x6d\x06\x37\xa0\x84\x31\x93\
-\x05\x81\xbb\xaf\x9a\x1c\xa9\xae\x1f\x99\x4d\x2b\xc6\xb2\xd9\xfa\
-\x36\x4f\x1b\xa9\xba\xe1\xc2\xa7\x3c\xfe\x95\x67\xbd\xf4\xb2\xf4\
-\x15\x6e\x2c\x6b\xf7\x13\x15\xd9\xbe\x99\x5e\x87\x5e\x32\xca\x3b\
-\x42\x97\xed\x5c\x34\x8e\xbd\xce\xb6\x33\x9a\x5d\xb3\xd9\xd7\x68\
-\xed\xb5\x64\x16\x70\x5e\xba\xb4\x2b\xbe\x26\x0a\x37\x17\xf9\xaa\
-\xfb\x07\x4e\x28\x0e\x93\x35\xe9\xeb\xe6\xee\x6c\x6d\xce\x90\xe3\
-\xa3\x3f\x37\xdb\x0b\x73\x17\x6b\x0d\xcf\x73\x16\x13\x7a\x4a\xa3\
-\x05\x76\x47\x67\xb8\xda\xfb\x3a\x07\x1d\x5a\xe0\xa1\x60\x27\x96\
-\xfe\x68\x10\xd6\xa3\x20\x1b\x72\x11\x91\x3c\x0e\xf6\xda\xbf\xac\
-\x05\x7c\x7d\x97\x3e\x37\xea\x21\xbb\x3b\x65\xdb\xf6\xfd\xf8\x56\
-\xa2\x18\x42\xb5\xce\x52\xce\xce\xb2\x23\x36\x2a\x2f\x6b\xdc\x42\
-\x99\x45\xd6\xf5\xbd\x90\x60\xae\x10\x27\x66\xcb\xe7\x8a\xf0\x28\
-\xaa\x4a\xa4\x20\x53\xe9\x50\xd1\xcd\xbe\x82\x17\x0d\x42\x75\x54\
-\xca\x76\x97\xea\x7d\x96\x2f\x53\xae\x7f\x3a\x3a\x5c\xbc\x4e\xea\
-\x65\x6c\xb7\x90\x3e\xf0\xab\x7a\x7c\x5d\xbd\x77\xad\xf6\x3a\xa5\
-\x59\xb1\xe8\x75\x64\xa5\x51\xab\x7d\x71\xcf\xcf\xfa\xe9\x4b\x88\
-\xb5\xdb\x59\xa7\x9c\x68\x80\x1f\xd0\xd7\x1f\x7a\xd6\x1f\x5a\xe9\
-\x9e\xb7\x7e\x68\x73\x09\x3a\x58\x2e\x0c\x32\x9e\x25\x0d\x65\xb6\
-\x1e\xb4\x39\x27\x6b\x44\xdf\xfd\x05\xf2\x9d\xb5\x07\xed\xbe\xb4\
-\x58\x80\x78\x04\x61\xeb\x07\xbb\x65\xfe\x06\xc1\x30\x26\x6b\x4b\
-\x13\x58\xff\xd8\x75\x85\xdf\xa1\x98\xf1\xc1\x58\x18\xef\x81\xd2\
-\xdd\x22\xd8\x2f\x6b\x1c\x62\x56\x9c\x25\xf5\x60\x75\xb3\xe2\xb6\
-\x79\x6b\x72\xdc\x80\xc3\x4f\xb7\x16\x43\xb3\x8e\x8b\xa0\xd7\xb7\
-\x97\xbd\xe0\x9f\x7f\x01\x48\xa5\x2c\x4f\
-\x00\x00\x00\x2c\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x34\x0a\x0a\x42\x69\x6e\x64\x69\x6e\x67\x4d\x65\x73\x73\x61\x67\
-\x65\x46\x6f\x72\x6d\x20\x7b\x0a\x0a\x7d\x0a\
-\x00\x00\x02\x10\
-\x69\
-\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x20\x32\x2e\
-\x37\x0d\x0a\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\
-\x6b\x2e\x43\x6f\x6e\x74\x72\x6f\x6c\x73\x20\x32\x2e\x30\x0d\x0a\
-\x69\x6d\x70\x6f\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x4c\
-\x61\x79\x6f\x75\x74\x73\x20\x31\x2e\x30\x0d\x0a\x69\x6d\x70\x6f\
-\x72\x74\x20\x51\x74\x51\x75\x69\x63\x6b\x2e\x57\x69\x6e\x64\x6f\
-\x77\x20\x32\x2e\x30\x0d\x0a\x0d\x0a\x50\x6f\x70\x75\x70\x20\x7b\
-\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x69\x64\x3a\x20\x73\x69\x6d\x70\
-\x6c\x65\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\x0d\x0a\
-\x0d\x0a\x20\x20\x20\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x73\
-\x65\x74\x53\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\x67\x65\x54\
-\x65\x78\x74\x28\x74\x65\x78\x74\x29\x20\x7b\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x73\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\
-\x67\x65\x2e\x6c\x61\x62\x65\x6c\x2e\x74\x65\x78\x74\x20\x3d\x20\
-\x74\x65\x78\x74\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x0d\x0a\x20\
-\x20\x20\x20\x78\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\x2e\x77\x69\
-\x64\x74\x68\x20\x2d\x20\x77\x69\x64\x74\x68\x29\x20\x2f\x20\x32\
-\x0d\x0a\x20\x20\x20\x20\x79\x3a\x20\x28\x70\x61\x72\x65\x6e\x74\
-\x2e\x68\x65\x69\x67\x68\x74\x20\x2d\x20\x68\x65\x69\x67\x68\x74\
-\x29\x20\x2f\x20\x32\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x6d\x6f\x64\
-\x61\x6c\x3a\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x66\x6f\
-\x63\x75\x73\x3a\x20\x74\x72\x75\x65\x0d\x0a\x20\x20\x20\x20\x63\
-\x6c\x6f\x73\x65\x50\x6f\x6c\x69\x63\x79\x3a\x20\x50\x6f\x70\x75\
-\x70\x2e\x43\x6c\x6f\x73\x65\x4f\x6e\x45\x73\x63\x61\x70\x65\x0d\
-\x0a\x0d\x0a\x20\x20\x20\x20\x53\x69\x6d\x70\x6c\x65\x4d\x65\x73\
-\x73\x61\x67\x65\x20\x7b\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3a\x20\x73\x69\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\x67\
-\x65\x0d\x0a\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x75\x74\
-\x74\x6f\x6e\x2e\x6f\x6e\x43\x6c\x69\x63\x6b\x65\x64\x3a\x20\x7b\
-\x0d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x73\x69\
-\x6d\x70\x6c\x65\x4d\x65\x73\x73\x61\x67\x65\x50\x6f\x70\x75\x70\
-\x2e\x63\x6c\x6f\x73\x65\x28\x29\x0d\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x7d\x0d\x0a\x20\x20\x20\x20\x7d\x0d\x0a\x7d\x0d\x0a\
-\x00\x00\x02\x54\
-\x00\
-\x00\x09\x96\x78\x9c\xad\x56\x4b\x73\xdb\x20\x10\xbe\xeb\x57\x30\
-\xb9\xa4\x3d\x54\x63\xa7\x3d\xe9\x66\x7b\x9c\xc6\x33\x69\xe2\xb8\
-\x99\xb8\x57\x2a\x6d\x6d\xa6\x08\x54\x40\x23\x7b\x5a\xfd\xf7\xa2\
-\x67\x85\x00\xc7\x4d\xc2\xc1\x63\x76\x3f\xf6\xf1\x2d\xbb\x88\xa4\
-\x19\x17\x0a\x3d\xa8\x87\x9c\xc4\x3f\xd1\x55\xf8\x29\x20\x86\x28\
-\x5c\x70\xa6\x04\xa7\xd2\xa5\xbb\xc5\x47\x9e\x2b\x89\xa6\xe1\x74\
-\x1a\x04\x0b\x4e\xf3\x94\x35\x32\xf4\x3b\x40\x7a\x91\x24\x42\xf1\
-\x40\x1c\xd4\xd2\x4c\xf0\x0c\x84\x3a\x22\x4c\x09\x96\x48\x42\x2c\
-\x40\x3d\xc2\x41\xcd\x04\xe0\x68\xb4\x77\x9d\x88\x31\x8b\x81\xce\
-\x73\xa5\x38\x8b\x8c\x9d\x0b\x2d\x40\x2a\x2e\xa0\x83\x1b\x5b\x17\
-\x9e\x41\xb1\x26\xac\xf2\x7f\x4d\x80\xea\x0c\x46\x02\xb7\x8f\x0c\
-\xb0\x32\x8f\xd9\xb2\xfa\xa4\xcc\x70\x4c\xd8\x2e\x42\x57\x93\x86\
-\x8e\xcf\x82\xe7\xd9\x9c\x1f\x5a\xce\x3a\xde\x1a\xaf\x9d\xb2\x57\
-\x35\x44\x86\x3f\x08\xa5\x5b\x92\xa8\x7d\x84\x94\xc8\xa1\x57\x2b\
-\xa2\x28\x44\xe8\x97\x7c\x14\xef\x2e\x96\x4c\x81\x40\xb8\x32\x85\
-\xd6\xab\xbb\x0f\x31\x4f\xe0\xe2\x7d\xd0\x83\x1d\x15\xb3\x23\x18\
-\x82\x0c\x88\xa6\x7d\xcf\x85\xac\x43\x89\x50\x86\x05\x30\x15\x18\
-\x88\x5b\xfc\x1d\xe8\xc8\xb0\x69\xbc\x46\x58\x7a\xa5\x09\xeb\x72\
-\xb8\x1b\xc4\x1e\xe9\xe0\x87\xb8\xd2\x74\xd7\xf3\x7c\xd2\xa5\x59\
-\x0d\x9f\xdb\x91\xa7\x6a\x81\x4e\xf7\x4b\x15\x45\xed\x68\xc5\x32\
-\x5d\x86\x35\x96\xb2\xe0\x22\x59\x6a\xdd\x3d\x5b\x26\x44\x59\xc7\
-\xda\x82\xa5\x84\x91\x34\x4f\xdb\x9a\x7d\x9c\x4c\x7c\x40\x5f\x65\
-\x1d\x09\x9f\xe2\xb7\xbf\x7d\xcf\x53\xbc\xa9\xa1\xc6\x2d\x79\x25\
-\xd3\x9e\xab\xef\x0b\xe0\xcd\xc9\x3e\xcd\xa1\xf9\xaf\x3c\xd9\x85\
-\xcd\x30\x7a\x83\x2e\xd4\x78\x81\x0a\x4c\x29\xa8\x4b\x89\xbe\x6d\
-\xd6\xad\xe9\xff\xe8\xc7\xe6\xc0\x2b\xfa\x71\xa5\x20\xf5\x54\x8c\
-\x68\xd5\xd4\x47\xa7\x9e\x71\x3b\x96\x6a\x73\x91\x1e\xfd\xe1\xac\
-\xda\xdd\x2c\xa0\x4e\xeb\x4f\x2f\x79\x6a\x24\x2f\x29\xc9\x00\xd6\
-\xb6\xc9\x0d\x90\xdd\x5e\xbb\x9b\xfa\xfb\x24\xc5\x87\x31\xd2\x82\
-\x7e\x8d\xf5\xd3\x45\x9f\x88\xbe\xd9\x76\xda\x3d\xad\x3d\xc8\x09\
-\x79\x9e\xd6\x6e\xc5\x94\x64\x9e\xec\xaa\xd5\xbd\x68\x9e\x50\xfa\
-\x70\xec\xe7\xcf\xb5\x0a\x81\xb3\x7f\x0d\x12\x6e\xf5\x76\xa6\xb6\
-\xba\x3b\xe6\x3c\x67\x09\x16\xc7\x7b\x31\x63\xc7\x62\x0f\xc2\x1d\
-\xcd\x19\x01\x97\x96\xb4\x3c\xa7\x93\x36\xbc\xb0\xae\x70\x3d\x14\
-\x3a\xf9\xb8\x8b\x5e\x74\xbd\x3c\xd7\xaa\xd7\x37\xef\xbb\xa3\x8b\
-\xac\xcf\x85\x6e\x0d\x27\xd2\xa2\x06\x0d\xe6\x52\x79\x86\x65\xfb\
-\xcb\xc2\x65\x7a\xd3\xa0\xda\x59\x60\xb8\x68\x7e\xcb\xe0\x2f\xdd\
-\xf5\x93\xc1\
-\x00\x00\x01\xba\
-\x00\
-\x00\x06\x15\x78\x9c\xad\x54\xc9\x4e\xc3\x30\x10\xbd\xe7\x2b\xac\
-\x9e\xe0\x40\xd4\x85\x53\x6e\x34\x2a\x50\xa9\x94\xb6\xaa\xe0\x6c\
-\x92\xa1\xb5\x70\xec\xe0\x4c\x94\x56\xd0\x7f\xc7\x75\x9a\x28\xce\
-\xd2\x22\x81\x0f\x51\xfc\xe6\x79\x96\x37\x1e\xb3\x28\x96\x0a\xc9\
-\x12\x97\x29\x0b\x3e\xc8\xd0\xbd\x75\x98\x05\xb9\xbe\x14\xa8\x24\
-\x4f\xb4\x6d\x50\xb7\xcd\xe8\x5e\xa6\x98\x90\x81\x3b\x72\x1c\x5f\
-\xf2\x34\x12\x39\x44\xbe\x1c\xa2\x17\x0b\x3d\x12\x54\x60\xc7\xa0\
-\xb1\x92\x31\x28\xdc\x13\xca\x19\x4d\x48\x40\x45\x00\x7c\x9c\x22\
-\x4a\xe1\x59\xbb\x36\xb6\x80\x6c\xc1\xc4\x1a\x76\x78\xcf\x80\x6b\
-\xff\x35\xa0\xed\x8c\x82\x18\x28\xda\xc7\x9a\x58\x6b\x6e\x4a\x93\
-\xa0\xcc\xad\xb2\x33\xec\x24\xa6\x01\x13\x1b\x8f\x0c\xfb\x79\x69\
-\x0f\x4a\xa6\xf1\x58\xee\x4e\xf5\x17\x1a\xe4\x39\x16\xc6\xd2\x94\
-\x8b\xe2\xbe\x33\xce\x5f\x59\x88\x5b\x8f\xa0\x4a\xa1\x34\x23\x43\
-\x0e\x1e\xf9\x4c\xd6\xea\xaa\x37\x11\x08\x8a\xd0\xa3\x2b\xb2\x98\
-\xce\x6f\x02\x19\x42\xef\xda\x29\xc9\x2d\xea\x37\x33\xa8\x92\x2c\
-\x8a\x16\x7d\x2b\x55\x62\x52\xf1\x48\x4c\x15\x08\x74\x2c\xc6\x8c\
-\xbe\x01\xaf\x39\xb6\x9d\x1b\x46\xc3\x8e\x5a\xde\xa2\x86\x79\x25\
-\x77\x4f\x27\x5f\xe5\x1d\xec\x70\x65\x57\xce\x86\xb4\x7b\xd7\x15\
-\xb6\x16\xe9\xb8\x40\x97\xfb\x74\xcc\xc2\x04\x9a\x8a\x58\xb7\x61\
-\x41\x93\x24\x93\x2a\x9c\x68\xdb\xb3\x98\x84\x0c\x1b\xc7\x4e\x0d\
-\x8b\x98\x60\x51\x1a\x9d\x7a\x36\xea\xf7\xbb\x88\x5d\x9d\x6d\x29\
-\xf8\x9c\xbe\xe5\x5d\xbd\x2c\xf1\xca\x50\xad\x5b\xf2\x47\xa5\x3b\
-\x06\xa5\x2b\x81\x7f\x17\xfb\xbc\x86\xf6\xdf\xa9\xb4\x95\xcc\x1a\
-\x83\x60\x4a\x29\xf0\xfa\x04\xea\x61\xdf\x88\x48\xdf\x79\x4f\x3f\
-\x6d\xee\xdd\x71\xf7\xe8\x83\x99\xb8\xef\x12\x79\xc9\x91\x4b\xd3\
-\x5b\xda\xf3\x77\xa2\x65\x16\x1b\x4f\x5c\x9b\x8e\xbe\x21\x55\xd4\
-\x3c\xfc\xc6\x73\xfd\x81\x6a\xf5\x6c\x48\x24\xa3\x9c\x03\x5a\x01\
-\xf2\xef\xc1\xf9\x01\x1e\x46\xad\x32\
-\x00\x00\x03\x9b\
-\x00\
-\x00\x15\xfa\x78\x9c\xcd\x58\xdd\x6f\xd3\x30\x10\x7f\xaf\xd4\xff\
-\xc1\xea\x13\x48\xa8\x5a\x5b\x04\x28\x6f\xac\xb0\x0f\x51\x36\xb6\
-\x55\xf0\x80\x78\xf0\x92\x6b\x6b\x2d\x89\x83\xe3\xac\x2b\x68\xff\
-\x3b\x76\x52\xb7\xf9\xb0\x5d\xa7\xdd\x00\xab\x52\x15\xdf\x9d\xf3\
-\xbb\x9f\xcf\x77\xe7\x90\x28\xa1\x8c\xa3\x2b\x7e\x95\x11\xff\x0e\
-\x0d\xfb\xaf\xbb\x1d\x52\x99\xeb\x8f\x69\xcc\x19\x0d\x53\x21\x1c\
-\x34\x84\x13\xbc\xa2\x19\x4f\xd1\xa0\x3f\xea\x76\xba\x9d\x73\x0e\
-\x11\xfa\xdd\xed\x20\x31\x48\xe0\xa1\x08\x93\x58\xce\x15\x33\x09\
-\xa3\x09\x30\xbe\x42\x38\x24\x38\x45\x94\x27\xd3\x55\x02\x5f\x71\
-\x98\xc1\x04\xdf\x42\xe8\x35\xa7\xb4\x86\x71\x16\xdd\x02\xbb\x9c\
-\x7d\x20\x73\xc2\x53\x69\xb0\x36\x37\x08\xb4\x8b\xa4\xc0\x2f\x60\
-\x79\x03\x9c\x93\x78\x9e\x1e\x67\x9c\xd3\xd8\xd3\xce\x6a\xcd\xb9\
-\x80\x7a\x8d\x03\x42\x95\x65\x6d\x42\x6b\xb4\xa8\x1b\x2d\x1c\x8c\
-\xaa\x4e\xdd\x24\x24\x3e\xa6\x0f\x75\x5f\xd7\xd3\xfa\x05\x60\xf9\
-\x09\x56\x53\x78\xe0\x27\x04\x42\xb1\x2b\xb5\x09\xad\xd1\x1c\x62\
-\xa1\xa3\x70\x96\x9f\x2c\xea\x13\x88\xe7\x7c\xb1\x81\xa8\x99\xb4\
-\x18\x9f\x50\x16\x61\x3e\xa6\xd1\x2d\x2d\x59\x57\x67\x65\x8c\xc9\
-\x05\xc6\x34\xcc\xa2\xb8\x08\x3e\x15\x6f\xe5\x98\x2b\xcb\xb7\x52\
-\x1c\xfb\x0b\xca\xd2\x7e\x08\x33\xee\xa1\x04\x33\x88\x79\xfe\xa0\
-\x57\xf9\x8c\xd9\x9c\x08\xe7\x07\x6f\x8f\x9a\x0a\x8c\xcc\x17\xdb\
-\x45\xf2\x27\x83\x92\x76\x99\x34\xc1\xbe\x88\x30\x0f\x0d\x35\x6b\
-\xdf\x0b\x6e\x88\x8f\xc3\xb1\x58\x1a\xd8\xe6\x25\xd5\x69\x45\x85\
-\x1c\xa7\x8c\x66\x89\xa0\xa7\x4c\x85\xa2\xc3\xcf\x98\xb4\x56\x21\
-\xad\x54\xab\x8a\x05\x53\xfd\x19\x09\xc3\x6f\x24\xe0\x0b\x11\xce\
-\x2c\x83\xaa\x0e\x27\x3c\x04\x0f\xfd\x4c\xa7\xec\x45\x6f\x5c\xac\
-\x2a\xcf\x4b\xbe\x6c\xef\x65\x19\x4f\x81\x89\x04\xcd\x0d\xb2\x22\
-\x53\x06\x4d\x75\xc5\x8c\x04\xa8\xf8\x68\x6a\x31\xba\x4c\x05\xa3\
-\x4d\x81\x9f\x87\x43\x21\x6b\x4a\xf3\x1c\xa1\x03\xa9\x80\xae\xb3\
-\x92\x3c\x30\xa5\x7c\x52\x1f\x5c\x88\x15\x3d\x97\xd3\x2f\x88\x0b\
-\x13\x4f\xf2\xa2\x53\x16\xde\x90\x5f\x22\xb1\xe2\xf0\x7d\x48\xe6\
-\x71\x24\xfc\xf1\x90\x7c\x41\x3f\x7f\x9e\x54\x82\x52\x8d\xc7\x43\
-\xd0\xd7\x73\xaa\x0d\xfe\x9e\xa8\xcf\x54\x64\xea\x6c\x5d\x42\x6c\
-\x7f\x27\x6b\x99\xdf\x7d\xa7\x2e\x72\x43\x44\x67\x28\xc8\x4d\xb5\
-\x3b\xf6\x24\x98\xaa\xd5\xc8\x86\xe9\x1f\xd3\x6f\x78\x7c\x74\xcd\
-\x38\xf1\xb6\x80\x3e\x51\xb6\x11\xcb\xc9\x55\x2d\xd9\xc6\x54\x10\
-\x0c\xb8\xf4\xf5\x41\x0d\xb7\x6c\x63\xf2\xa2\xa9\x69\x4f\x85\x5a\
-\xda\xcc\xa9\x50\x8e\x22\xd1\x8d\xf4\x42\x7b\xb2\x2b\x90\x5b\x22\
-\x57\xc1\xa9\x27\x3d\x4d\x5a\x55\xa3\x55\xe6\xd3\x9e\x25\x39\xae\
-\xe9\xd2\x4e\x52\x0d\xd9\x46\xdf\xac\xed\xbe\x45\x1b\x10\xdb\x66\
-\xcc\x06\x43\x41\xd1\x36\x7d\xa6\x51\xa6\x69\x2a\x78\x32\x31\xb4\
-\x0b\xbd\xcd\xc6\x5f\x80\x7f\x07\xc1\x2e\x55\xe3\x26\xc8\xd1\x92\
-\x03\x6d\x0f\x6b\x1a\x65\x0e\xce\x9e\x81\x83\xc7\x96\x41\xe7\x74\
-\x14\x0c\xc5\xc5\xf1\x44\x38\x55\x18\x2b\xc8\x75\xef\xdc\x0e\x66\
-\xa5\xe1\xd6\xbb\xde\x8e\x5a\x4e\x3d\xf4\xce\x2c\x9e\x31\x1a\x79\
-\xe8\x8d\x59\xe1\x5e\x36\x20\x46\x8d\x03\x77\x28\xbf\xd1\x58\xca\
-\x6b\xee\x40\x79\x53\x44\x35\xb9\x83\x55\xfb\xbd\xd8\xdc\x9a\xdc\
-\x20\xd5\x2e\x59\xbb\x60\xd9\x8e\x43\x9b\xfd\xd2\x1c\x03\xad\x47\
-\xf6\x53\x2e\xdd\xd0\x5f\x88\x77\xf7\x30\xc2\xc2\xe4\xcc\x5f\x6c\
-\x45\x8a\x3b\xe4\x13\x75\x21\xa7\x10\x03\xc3\x1c\x10\x96\xa1\xb3\
-\xcf\x8d\x47\xc1\xf9\x5f\x2f\x3a\xe5\x2b\xb7\x63\xaf\x5a\x28\xbb\
-\x77\xcd\xea\x26\xef\x0a\x63\x7b\xf3\xd7\x69\x47\x34\x90\xdf\x7d\
-\xbe\xf7\xce\xe0\x01\x07\xe0\x93\x08\x87\xbd\x57\xa8\x77\x8c\x53\
-\x18\x0d\x7b\x3f\x0c\x1d\x52\x71\xf1\x3c\x8f\x03\x78\xf0\xd0\xd1\
-\xc1\x51\xba\x37\xd3\xc5\xa7\x11\x47\xa6\x0b\x65\x77\xa6\x77\x54\
-\x8d\x3a\x0a\x6b\xbd\x68\x93\x7b\x64\x9d\x18\x19\x6a\x63\x51\x24\
-\x06\x06\xca\xd7\x15\x62\xa8\x11\x1f\xc2\xf2\xc7\x28\xe1\xb6\xda\
-\xb0\x2b\x01\xef\x99\x39\xab\xdf\xcc\x76\xbf\x5a\xa5\x97\x67\x4d\
-\x9b\xeb\x3f\xf1\xfb\x03\x02\x9e\x3f\x5f\
 "
 
 qt_resource_name = b"\
@@ -2728,261 +2705,261 @@ qt_resource_name = b"\
 \x00\x71\
 \x00\x74\x00\x71\x00\x75\x00\x69\x00\x63\x00\x6b\x00\x63\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x73\x00\x32\x00\x2e\
 \x00\x63\x00\x6f\x00\x6e\x00\x66\
-\x00\x12\
-\x08\x69\x76\x5c\
-\x00\x45\
-\x00\x74\x00\x68\x00\x65\x00\x72\x00\x65\x00\x75\x00\x6d\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x2e\x00\x71\x00\x6d\
-\x00\x6c\
-\x00\x1f\
-\x0b\xb9\x4d\xbc\
+\x00\x0a\
+\x00\x45\x99\x1c\
+\x00\x57\
+\x00\x69\x00\x72\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x18\
+\x00\xc1\x8a\xdc\
+\x00\x50\
+\x00\x69\x00\x6e\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\
+\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x20\
+\x00\xc2\x31\xfc\
+\x00\x44\
+\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x4d\
+\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x21\
+\x02\x55\x87\x5c\
+\x00\x50\
+\x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x53\x00\x65\x00\x65\x00\x64\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\
+\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\
+\x00\x26\
+\x02\xa5\x37\x5c\
 \x00\x50\
 \x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x45\x00\x6e\
-\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\
+\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x11\
+\x03\x7b\xd4\xdc\
+\x00\x53\
+\x00\x69\x00\x6d\x00\x70\x00\x6c\x00\x65\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\
+\x00\x15\
+\x04\x6a\x16\x1c\
+\x00\x59\
+\x00\x65\x00\x73\x00\x4e\x00\x6f\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\
+\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x22\
+\x04\xb9\xb8\x3c\
+\x00\x44\
+\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x4d\
+\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\
+\x00\x6c\
+\x00\x17\
+\x05\x82\x08\x7c\
+\x00\x52\
+\x00\x65\x00\x6d\x00\x6f\x00\x74\x00\x65\x00\x53\x00\x63\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\
+\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x17\
+\x06\x50\xd1\xdc\
+\x00\x42\
+\x00\x69\x00\x6e\x00\x64\x00\x69\x00\x6e\x00\x67\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\
+\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x19\
 \x06\x59\xa7\x1c\
 \x00\x42\
 \x00\x69\x00\x6e\x00\x64\x00\x69\x00\x6e\x00\x67\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\
 \x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x17\
+\x06\x9c\xe5\x3c\
+\x00\x46\
+\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x50\x00\x6f\x00\x70\
+\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x1f\
+\x06\xb4\xcd\xfc\
+\x00\x50\
+\x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x53\x00\x65\x00\x65\x00\x64\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\
+\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x0b\
+\x06\xfa\xa2\x3c\
+\x00\x4f\
+\x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x10\
+\x07\x02\x54\x3c\
+\x00\x52\
+\x00\x65\x00\x6d\x00\x6f\x00\x74\x00\x65\x00\x53\x00\x63\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x1a\
+\x07\x13\x58\x3c\
+\x00\x50\
+\x00\x69\x00\x6e\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\
+\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x19\
+\x07\xec\x03\xdc\
+\x00\x46\
+\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x4d\x00\x65\x00\x73\
+\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x1b\
+\x08\x09\xf0\x5c\
+\x00\x44\
+\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x4d\
+\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x13\
 \x08\x1c\xd9\x5c\
 \x00\x50\
 \x00\x69\x00\x6e\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\
 \x00\x6d\x00\x6c\
-\x00\x1d\
-\x0a\xb8\x5b\x3c\
-\x00\x44\
-\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x53\x00\x65\x00\x65\x00\x64\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\
-\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x21\
-\x02\x55\x87\x5c\
-\x00\x50\
-\x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x53\x00\x65\x00\x65\x00\x64\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\
-\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\
-\x00\x12\
-\x0a\xf3\x8a\x3c\
-\x00\x46\
-\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x71\x00\x6d\
-\x00\x6c\
 \x00\x1b\
 \x08\x4c\x30\x3c\
 \x00\x44\
 \x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x53\x00\x65\x00\x65\x00\x64\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\
 \x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x24\
-\x0e\xb4\x3d\x5c\
-\x00\x50\
-\x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x45\x00\x6e\
-\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\
-\x00\x71\x00\x6d\x00\x6c\
+\x00\x12\
+\x08\x69\x76\x5c\
+\x00\x45\
+\x00\x74\x00\x68\x00\x65\x00\x72\x00\x65\x00\x75\x00\x6d\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x2e\x00\x71\x00\x6d\
+\x00\x6c\
+\x00\x20\
+\x09\x0c\x7c\x5c\
+\x00\x46\
+\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x4d\x00\x65\x00\x73\
+\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x19\
 \x09\x66\xf8\x3c\
 \x00\x45\
 \x00\x74\x00\x68\x00\x65\x00\x72\x00\x65\x00\x75\x00\x6d\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x46\x00\x6f\x00\x72\
 \x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x10\
-\x0d\x48\x33\x1c\
-\x00\x59\
-\x00\x65\x00\x73\x00\x4e\x00\x6f\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x17\
-\x06\x50\xd1\xdc\
-\x00\x42\
-\x00\x69\x00\x6e\x00\x64\x00\x69\x00\x6e\x00\x67\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\
-\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x17\
-\x0c\xe3\x21\xdc\
+\x00\x16\
+\x09\xad\xea\x7c\
 \x00\x53\
-\x00\x65\x00\x63\x00\x61\x00\x6c\x00\x6f\x00\x74\x00\x43\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x50\x00\x61\x00\x6e\
-\x00\x65\x00\x6c\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x20\
-\x00\xc2\x31\xfc\
-\x00\x44\
-\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x4d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x10\
-\x07\x02\x54\x3c\
-\x00\x52\
-\x00\x65\x00\x6d\x00\x6f\x00\x74\x00\x65\x00\x53\x00\x63\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x18\
-\x00\xc1\x8a\xdc\
-\x00\x50\
-\x00\x69\x00\x6e\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\
-\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x69\x00\x6d\x00\x70\x00\x6c\x00\x65\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\
+\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x14\
+\x09\xd8\xa6\xdc\
+\x00\x58\
+\x00\x72\x00\x70\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\
+\x00\x71\x00\x6d\x00\x6c\
+\x00\x08\
+\x0a\x61\x5a\xa7\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x19\
 \x0a\x7d\x47\x9c\
 \x00\x46\
 \x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x46\x00\x6f\x00\x72\
 \x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x1b\
-\x08\x09\xf0\x5c\
+\x00\x1d\
+\x0a\xb8\x5b\x3c\
 \x00\x44\
-\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x4d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x53\x00\x65\x00\x65\x00\x64\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\
+\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x12\
+\x0a\xe0\x48\x9c\
+\x00\x4f\
+\x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\
+\x00\x6c\
+\x00\x12\
+\x0a\xf3\x8a\x3c\
+\x00\x46\
+\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x71\x00\x6d\
+\x00\x6c\
+\x00\x15\
+\x0b\x3d\x5e\x5c\
+\x00\x4f\
+\x00\x74\x00\x70\x00\x43\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\
+\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x18\
 \x0b\x72\x1d\x7c\
 \x00\x53\
 \x00\x69\x00\x6d\x00\x70\x00\x6c\x00\x65\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\
 \x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x17\
-\x05\x82\x08\x7c\
-\x00\x52\
-\x00\x65\x00\x6d\x00\x6f\x00\x74\x00\x65\x00\x53\x00\x63\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\
-\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x1a\
 \x0b\xb2\xd0\x3c\
 \x00\x50\
 \x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x53\x00\x65\x00\x65\x00\x64\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\
 \x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x19\
-\x07\xec\x03\xdc\
-\x00\x46\
-\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x4d\x00\x65\x00\x73\
-\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x0d\
-\x0d\xec\xe9\x3c\
-\x00\x58\
-\x00\x72\x00\x70\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x15\
-\x04\x6a\x16\x1c\
-\x00\x59\
-\x00\x65\x00\x73\x00\x4e\x00\x6f\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\
-\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x11\
-\x03\x7b\xd4\xdc\
-\x00\x53\
-\x00\x69\x00\x6d\x00\x70\x00\x6c\x00\x65\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\
 \x00\x1f\
-\x06\xb4\xcd\xfc\
+\x0b\xb9\x4d\xbc\
 \x00\x50\
-\x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x53\x00\x65\x00\x65\x00\x64\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\
-\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x17\
-\x06\x9c\xe5\x3c\
-\x00\x46\
-\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x50\x00\x6f\x00\x70\
-\x00\x75\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x12\
-\x0a\xe0\x48\x9c\
-\x00\x4f\
-\x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\
-\x00\x6c\
-\x00\x0b\
-\x06\xfa\xa2\x3c\
-\x00\x4f\
-\x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x17\
-\x0c\x8e\x62\xfc\
-\x00\x59\
-\x00\x65\x00\x73\x00\x4e\x00\x6f\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\
-\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x14\
-\x09\xd8\xa6\xdc\
-\x00\x58\
-\x00\x72\x00\x70\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\
-\x00\x71\x00\x6d\x00\x6c\
-\x00\x22\
-\x04\xb9\xb8\x3c\
-\x00\x44\
-\x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x4d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\
-\x00\x6c\
-\x00\x0e\
-\x0f\xcb\x8a\xfc\
-\x00\x4f\
-\x00\x74\x00\x70\x00\x43\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x45\x00\x6e\
+\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x16\
 \x0c\x79\xe2\xdc\
 \x00\x44\
 \x00\x69\x00\x73\x00\x70\x00\x6c\x00\x61\x00\x79\x00\x53\x00\x65\x00\x65\x00\x64\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\
 \x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x20\
-\x09\x0c\x7c\x5c\
-\x00\x46\
-\x00\x69\x00\x72\x00\x6d\x00\x77\x00\x61\x00\x72\x00\x65\x00\x55\x00\x70\x00\x64\x00\x61\x00\x74\x00\x65\x00\x4d\x00\x65\x00\x73\
-\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x0a\
-\x00\x45\x99\x1c\
-\x00\x57\
-\x00\x69\x00\x72\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x17\
+\x0c\x8e\x62\xfc\
+\x00\x59\
+\x00\x65\x00\x73\x00\x4e\x00\x6f\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\
+\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 \x00\x12\
 \x0c\x92\xf1\x3c\
 \x00\x42\
 \x00\x69\x00\x6e\x00\x64\x00\x69\x00\x6e\x00\x67\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\
 \x00\x6c\
-\x00\x16\
-\x09\xad\xea\x7c\
+\x00\x17\
+\x0c\xe3\x21\xdc\
 \x00\x53\
-\x00\x69\x00\x6d\x00\x70\x00\x6c\x00\x65\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\
-\x00\x70\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x26\
-\x02\xa5\x37\x5c\
+\x00\x65\x00\x63\x00\x61\x00\x6c\x00\x6f\x00\x74\x00\x43\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x50\x00\x61\x00\x6e\
+\x00\x65\x00\x6c\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x10\
+\x0d\x48\x33\x1c\
+\x00\x59\
+\x00\x65\x00\x73\x00\x4e\x00\x6f\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x0d\
+\x0d\xec\xe9\x3c\
+\x00\x58\
+\x00\x72\x00\x70\x00\x57\x00\x61\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x24\
+\x0e\xb4\x3d\x5c\
 \x00\x50\
 \x00\x69\x00\x6e\x00\x41\x00\x6e\x00\x64\x00\x58\x00\x72\x00\x70\x00\x53\x00\x65\x00\x63\x00\x72\x00\x65\x00\x74\x00\x45\x00\x6e\
-\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\
-\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x1a\
-\x07\x13\x58\x3c\
-\x00\x50\
-\x00\x69\x00\x6e\x00\x45\x00\x6e\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x46\x00\x6f\
-\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\x00\x2e\x00\x71\x00\x6d\x00\x6c\
-\x00\x15\
-\x0b\x3d\x5e\x5c\
+\x00\x74\x00\x72\x00\x79\x00\x4d\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x50\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\
+\x00\x71\x00\x6d\x00\x6c\
+\x00\x0e\
+\x0f\xcb\x8a\xfc\
 \x00\x4f\
-\x00\x74\x00\x70\x00\x43\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x46\x00\x6f\x00\x72\x00\x6d\x00\x2e\x00\x75\x00\x69\
-\x00\x2e\x00\x71\x00\x6d\x00\x6c\
+\x00\x74\x00\x70\x00\x43\x00\x6f\x00\x6e\x00\x74\x00\x72\x00\x6f\x00\x6c\x00\x2e\x00\x71\x00\x6d\x00\x6c\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x2a\x00\x00\x00\x03\
 \x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x07\x94\x00\x01\x00\x00\x00\x01\x00\x00\x93\x97\
-\x00\x00\x03\x92\x00\x00\x00\x00\x00\x01\x00\x00\x65\x19\
-\x00\x00\x03\x26\x00\x00\x00\x00\x00\x01\x00\x00\x60\x60\
-\x00\x00\x01\x64\x00\x01\x00\x00\x00\x01\x00\x00\x4b\x70\
-\x00\x00\x08\x0a\x00\x01\x00\x00\x00\x01\x00\x00\x9b\x8a\
-\x00\x00\x05\x68\x00\x00\x00\x00\x00\x01\x00\x00\x76\xa0\
-\x00\x00\x05\x38\x00\x00\x00\x00\x00\x01\x00\x00\x74\x20\
-\x00\x00\x06\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x86\x4b\
-\x00\x00\x04\x72\x00\x01\x00\x00\x00\x01\x00\x00\x6e\x96\
-\x00\x00\x02\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x5a\x5c\
-\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x42\xf2\
-\x00\x00\x05\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x7b\x06\
-\x00\x00\x05\x90\x00\x00\x00\x00\x00\x01\x00\x00\x76\xd4\
-\x00\x00\x06\x32\x00\x00\x00\x00\x00\x01\x00\x00\x80\x6d\
-\x00\x00\x03\x6c\x00\x01\x00\x00\x00\x01\x00\x00\x63\x2c\
-\x00\x00\x08\x5c\x00\x01\x00\x00\x00\x01\x00\x00\x9d\xe2\
-\x00\x00\x04\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x71\x18\
-\x00\x00\x04\x00\x00\x00\x00\x00\x00\x01\x00\x00\x6c\x12\
-\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x46\xf3\
-\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x50\xbb\
 \x00\x00\x00\x3c\x00\x01\x00\x00\x00\x01\x00\x00\x00\x55\
-\x00\x00\x07\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x90\x8d\
-\x00\x00\x02\x60\x00\x01\x00\x00\x00\x01\x00\x00\x57\xc6\
-\x00\x00\x07\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x99\x76\
-\x00\x00\x06\x82\x00\x01\x00\x00\x00\x01\x00\x00\x83\xe3\
-\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x03\x5d\
-\x00\x00\x03\xc8\x00\x01\x00\x00\x00\x01\x00\x00\x68\x99\
-\x00\x00\x01\x24\x00\x00\x00\x00\x00\x01\x00\x00\x47\x24\
-\x00\x00\x06\x08\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xff\
-\x00\x00\x01\xac\x00\x01\x00\x00\x00\x01\x00\x00\x4d\xc3\
-\x00\x00\x08\x96\x00\x01\x00\x00\x00\x01\x00\x00\x9f\xa0\
-\x00\x00\x04\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x6c\x4b\
-\x00\x00\x04\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x70\xe0\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x03\x20\
-\x00\x00\x07\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x90\x59\
-\x00\x00\x06\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x81\x67\
-\x00\x00\x07\xae\x00\x00\x00\x00\x00\x01\x00\x00\x99\x46\
-\x00\x00\x02\xf2\x00\x01\x00\x00\x00\x01\x00\x00\x5d\x55\
-\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00\x5a\x2e\
-\x00\x00\x05\x18\x00\x01\x00\x00\x00\x01\x00\x00\x71\x52\
-\x00\x00\x02\x12\x00\x00\x00\x00\x00\x01\x00\x00\x53\x57\
-\x00\x00\x06\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x8a\xaf\
+\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x06\xa7\
+\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x27\
+\x00\x00\x00\xd2\x00\x01\x00\x00\x00\x01\x00\x00\x0c\xf3\
+\x00\x00\x01\x1a\x00\x01\x00\x00\x00\x01\x00\x00\x0f\x46\
+\x00\x00\x01\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x11\x9e\
+\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x11\xd2\
+\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x14\x52\
+\x00\x00\x02\x0e\x00\x01\x00\x00\x00\x01\x00\x00\x18\xb6\
+\x00\x00\x02\x42\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x00\
+\x00\x00\x02\x76\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xf9\
+\x00\x00\x02\xae\x00\x01\x00\x00\x00\x01\x00\x00\x21\xfa\
+\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x23\xa8\
+\x00\x00\x03\x26\x00\x00\x00\x00\x00\x01\x00\x00\x27\xda\
+\x00\x00\x03\x42\x00\x01\x00\x00\x00\x01\x00\x00\x28\xd4\
+\x00\x00\x03\x68\x00\x01\x00\x00\x00\x01\x00\x00\x2a\xc1\
+\x00\x00\x03\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x7f\
+\x00\x00\x03\xda\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xb9\
+\x00\x00\x04\x16\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xf2\
+\x00\x00\x04\x42\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x23\
+\x00\x00\x04\x7e\x00\x01\x00\x00\x00\x01\x00\x00\x2f\xbf\
+\x00\x00\x04\xa8\x00\x01\x00\x00\x00\x01\x00\x00\x32\x8a\
+\x00\x00\x04\xee\x00\x01\x00\x00\x00\x01\x00\x00\x33\xf0\
+\x00\x00\x05\x26\x00\x00\x00\x00\x00\x01\x00\x00\x36\x58\
+\x00\x00\x05\x58\x00\x01\x00\x00\x00\x01\x00\x00\x38\x6c\
+\x00\x00\x05\x86\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xd4\
+\x00\x00\x05\x9c\x00\x01\x00\x00\x00\x01\x00\x00\x7a\x69\
+\x00\x00\x05\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xe2\
+\x00\x00\x06\x14\x00\x00\x00\x00\x00\x01\x00\x00\x82\x2e\
+\x00\x00\x06\x3e\x00\x01\x00\x00\x00\x01\x00\x00\x84\x9c\
+\x00\x00\x06\x68\x00\x01\x00\x00\x00\x01\x00\x00\x88\x74\
+\x00\x00\x06\x98\x00\x00\x00\x00\x00\x01\x00\x00\x8c\x13\
+\x00\x00\x06\xce\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x5e\
+\x00\x00\x07\x08\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x96\
+\x00\x00\x07\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x8e\xd3\
+\x00\x00\x07\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x07\
+\x00\x00\x07\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x91\x83\
+\x00\x00\x07\xdc\x00\x01\x00\x00\x00\x01\x00\x00\x91\xb3\
+\x00\x00\x08\x10\x00\x00\x00\x00\x00\x01\x00\x00\x94\xbe\
+\x00\x00\x08\x36\x00\x01\x00\x00\x00\x01\x00\x00\x94\xec\
+\x00\x00\x08\x56\x00\x00\x00\x00\x00\x01\x00\x00\x97\xba\
+\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x9c\x29\
 "
 
 qt_resource_struct_v2 = b"\
@@ -2991,91 +2968,91 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x2a\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x07\x94\x00\x01\x00\x00\x00\x01\x00\x00\x93\x97\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x03\x92\x00\x00\x00\x00\x00\x01\x00\x00\x65\x19\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x03\x26\x00\x00\x00\x00\x00\x01\x00\x00\x60\x60\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x01\x64\x00\x01\x00\x00\x00\x01\x00\x00\x4b\x70\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x08\x0a\x00\x01\x00\x00\x00\x01\x00\x00\x9b\x8a\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x05\x68\x00\x00\x00\x00\x00\x01\x00\x00\x76\xa0\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x05\x38\x00\x00\x00\x00\x00\x01\x00\x00\x74\x20\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x06\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x86\x4b\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x04\x72\x00\x01\x00\x00\x00\x01\x00\x00\x6e\x96\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x02\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x5a\x5c\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x42\xf2\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x05\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x7b\x06\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x05\x90\x00\x00\x00\x00\x00\x01\x00\x00\x76\xd4\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x06\x32\x00\x00\x00\x00\x00\x01\x00\x00\x80\x6d\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x03\x6c\x00\x01\x00\x00\x00\x01\x00\x00\x63\x2c\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x08\x5c\x00\x01\x00\x00\x00\x01\x00\x00\x9d\xe2\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x04\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x71\x18\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x04\x00\x00\x00\x00\x00\x00\x01\x00\x00\x6c\x12\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x46\xf3\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x50\xbb\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
 \x00\x00\x00\x3c\x00\x01\x00\x00\x00\x01\x00\x00\x00\x55\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x07\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x90\x8d\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x02\x60\x00\x01\x00\x00\x00\x01\x00\x00\x57\xc6\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x07\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x99\x76\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x06\x82\x00\x01\x00\x00\x00\x01\x00\x00\x83\xe3\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x03\x5d\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x03\xc8\x00\x01\x00\x00\x00\x01\x00\x00\x68\x99\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x01\x24\x00\x00\x00\x00\x00\x01\x00\x00\x47\x24\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x06\x08\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xff\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x01\xac\x00\x01\x00\x00\x00\x01\x00\x00\x4d\xc3\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x08\x96\x00\x01\x00\x00\x00\x01\x00\x00\x9f\xa0\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x04\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x6c\x4b\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x04\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x70\xe0\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x03\x20\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x07\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x90\x59\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x06\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x81\x67\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x07\xae\x00\x00\x00\x00\x00\x01\x00\x00\x99\x46\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x02\xf2\x00\x01\x00\x00\x00\x01\x00\x00\x5d\x55\
-\x00\x00\x01\x6a\x03\xfa\x95\x38\
-\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00\x5a\x2e\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x05\x18\x00\x01\x00\x00\x00\x01\x00\x00\x71\x52\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x02\x12\x00\x00\x00\x00\x00\x01\x00\x00\x53\x57\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
-\x00\x00\x06\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x8a\xaf\
-\x00\x00\x01\x6a\x03\xf5\x97\xe0\
+\x00\x00\x01\xa1\x4f\xcd\xf9\x99\
+\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\x06\xa7\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x27\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x00\xd2\x00\x01\x00\x00\x00\x01\x00\x00\x0c\xf3\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x01\x1a\x00\x01\x00\x00\x00\x01\x00\x00\x0f\x46\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x01\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x11\x9e\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x11\xd2\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x14\x52\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x02\x0e\x00\x01\x00\x00\x00\x01\x00\x00\x18\xb6\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x02\x42\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x00\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x02\x76\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xf9\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x02\xae\x00\x01\x00\x00\x00\x01\x00\x00\x21\xfa\
+\x00\x00\x01\xa1\x4f\xcd\xf9\x98\
+\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x23\xa8\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x03\x26\x00\x00\x00\x00\x00\x01\x00\x00\x27\xda\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x03\x42\x00\x01\x00\x00\x00\x01\x00\x00\x28\xd4\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x03\x68\x00\x01\x00\x00\x00\x01\x00\x00\x2a\xc1\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x03\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x7f\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x03\xda\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xb9\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x04\x16\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xf2\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x04\x42\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x23\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x04\x7e\x00\x01\x00\x00\x00\x01\x00\x00\x2f\xbf\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x04\xa8\x00\x01\x00\x00\x00\x01\x00\x00\x32\x8a\
+\x00\x00\x01\xa1\x4f\xcd\xf9\x98\
+\x00\x00\x04\xee\x00\x01\x00\x00\x00\x01\x00\x00\x33\xf0\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x05\x26\x00\x00\x00\x00\x00\x01\x00\x00\x36\x58\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x05\x58\x00\x01\x00\x00\x00\x01\x00\x00\x38\x6c\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x05\x86\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xd4\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x05\x9c\x00\x01\x00\x00\x00\x01\x00\x00\x7a\x69\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x05\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xe2\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x06\x14\x00\x00\x00\x00\x00\x01\x00\x00\x82\x2e\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x06\x3e\x00\x01\x00\x00\x00\x01\x00\x00\x84\x9c\
+\x00\x00\x01\xa1\x4f\xcd\xf9\x98\
+\x00\x00\x06\x68\x00\x01\x00\x00\x00\x01\x00\x00\x88\x74\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x06\x98\x00\x00\x00\x00\x00\x01\x00\x00\x8c\x13\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x06\xce\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x5e\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x07\x08\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x96\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x07\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x8e\xd3\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x07\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x07\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x07\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x91\x83\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x07\xdc\x00\x01\x00\x00\x00\x01\x00\x00\x91\xb3\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x08\x10\x00\x00\x00\x00\x00\x01\x00\x00\x94\xbe\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x08\x36\x00\x01\x00\x00\x00\x01\x00\x00\x94\xec\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x08\x56\x00\x00\x00\x00\x00\x01\x00\x00\x97\xba\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
+\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x9c\x29\
+\x00\x00\x01\x6a\x04\x2a\x8e\x78\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
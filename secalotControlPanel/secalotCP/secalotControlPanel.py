@@ -20,6 +20,7 @@ from secalotCP.deviceFinder import DeviceFinder
 from secalotCP.deviceCommunicator import DeviceCommunicator
 from secalotCP.qmlHelperUtils import QmlHelperUtils
 from secalotCP.remoteScreen import RemoteScreen
+import secalotCP.apduTrace as apduTrace
 
 
 class SystemTray(QObject):
@@ -57,6 +58,8 @@ class SystemTray(QObject):
 def main():
     # QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
 
+    apduTrace.installFromEnvironment()
+
     global app
     app = QApplication(sys.argv)
 
@@ -73,6 +76,11 @@ def main():
     qmlHelperUtils = QmlHelperUtils()
     remoteScreen = RemoteScreen(engine, deviceCommunicator)
 
+    deviceFinder.deviceAdded.connect(deviceCommunicator.deviceAdded)
+    # Emitted before oneDeviceConnected, so the device is being read before the panel selects it.
+    deviceFinder.deviceAdded.connect(deviceCommunicator.prefetchDeviceSnapshot)
+    deviceFinder.deviceRemoved.connect(deviceCommunicator.deviceRemoved)
+
     if platform.system() == 'Windows':
         if getattr(sys, 'frozen', False):
             engine.addImportPath(sys._MEIPASS)
@@ -0,0 +1,567 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# An in-process simulation of Secalot devices. Once installed, smartcard.System.readers() returns
+# simulated readers, so the control utilities and the control panel run without a physical dongle.
+
+import argparse
+import hashlib
+import importlib
+import os
+import struct
+import sys
+import threading
+import time
+
+import smartcard.System
+from smartcard.Exceptions import CardConnectionException, NoCardException
+
+import secalotCP.bip32 as bip32
+import secalotCP.readerMonitor as readerMonitor
+from secalotCP.appletSession import OTP_APPLET_AID, ETH_APPLET_AID, XRP_APPLET_AID, SSL_APPLET_AID, \
+    BOOTLOADER_APPLET_AID
+from secalotCP.updateFirmware import READER_NAME, BOOTLOADER_READER_NAME, HEADER_LENGTH, SIGNATURE_LENGTH, \
+    CHUNK_LENGTH, FIRMWARE_CHUNKS, BOOTLOADER_CHUNKS
+
+DEVICE_ID = 0x00000001
+FIRMWARE_VERSION = 0x00000001
+FILE_SYSTEM_VERSION = 0x00000001
+BOOTLOADER_VERSION = 0x00000001
+FIRST_SERIAL_NUMBER = 0x5EC00001
+
+APP_VERSION = (0x01, 0x06)
+PIN_TRIES = 3
+
+REENUMERATION_DELAY = 0.5
+
+ATR = [0x3B, 0x8A, 0x80, 0x01, 0x53, 0x65, 0x63, 0x61, 0x6C, 0x6F, 0x74, 0x43, 0x50, 0x00, 0x2F]
+
+SW_SUCCESS = 0x9000
+SW_WRONG_LENGTH = 0x6700
+SW_SECURITY_STATUS_NOT_SATISFIED = 0x6982
+SW_PIN_BLOCKED = 0x6983
+SW_CONDITIONS_NOT_SATISFIED = 0x6985
+SW_WRONG_DATA = 0x6A80
+SW_APPLET_NOT_FOUND = 0x6A82
+SW_INS_NOT_SUPPORTED = 0x6D00
+
+TOOLS = ['updateFirmware', 'otpControl', 'ethControl', 'xrpControl', 'sslControl', 'totpService', 'apduTrace',
+         'daemon', 'secalotControlPanel']
+
+originalReaders = None
+
+
+class SimulatedWallet(object):
+
+    def __init__(self):
+        self.key = None
+        self.pin = None
+        self.pinVerified = False
+        self.triesLeft = PIN_TRIES
+
+    def initialized(self):
+        return self.key is not None
+
+    def initialize(self, pin, key):
+        self.key = key
+        self.pin = pin
+        self.pinVerified = False
+        self.triesLeft = PIN_TRIES
+
+    def wipeout(self):
+        self.__init__()
+
+    def info(self):
+        flags = 0
+        if self.initialized():
+            flags |= 0x01
+        if self.pinVerified:
+            flags |= 0x02
+
+        return list(APP_VERSION) + [flags, 0x00, 0x00, 0x00, 0x00, 0x00]
+
+    def verifyPin(self, pin):
+        if not self.initialized():
+            return SW_INS_NOT_SUPPORTED
+        if len(pin) < 4 or len(pin) > 32:
+            return SW_WRONG_LENGTH
+        if self.triesLeft == 0:
+            return SW_PIN_BLOCKED
+
+        if pin != self.pin:
+            self.pinVerified = False
+            self.triesLeft -= 1
+            return SW_SECURITY_STATUS_NOT_SATISFIED
+
+        self.pinVerified = True
+        self.triesLeft = PIN_TRIES
+        return SW_SUCCESS
+
+    def checkAccess(self):
+        if not self.initialized():
+            return SW_INS_NOT_SUPPORTED
+        if not self.pinVerified:
+            return SW_SECURITY_STATUS_NOT_SATISFIED
+        return SW_SUCCESS
+
+
+def simulatedPublicKey(*parts):
+    # SSL and XRP public keys are derived by hashing instead of elliptic curve arithmetic. They are stable for
+    # a given wallet, which is all the utilities rely on, but they are not points on secp256k1. ETH keys follow
+    # BIP32, so keys derived on the host can be checked against the simulated device.
+    digest = hashlib.sha512(b''.join(parts)).digest()
+    return bytes([0x04]) + digest
+
+
+class SimulatedDevice(object):
+
+    def __init__(self, serialNumber, latency=0.0, reenumerationDelay=REENUMERATION_DELAY, mode='firmware'):
+        self.lock = threading.RLock()
+
+        self.serialNumber = serialNumber
+        self.latency = latency
+        self.reenumerationDelay = reenumerationDelay
+
+        self.mode = mode
+        self.generation = 0
+        self.availableAt = 0.0
+        self.selectedAID = None
+
+        self.deviceID = DEVICE_ID
+        self.firmwareVersion = FIRMWARE_VERSION
+        self.fileSystemVersion = FILE_SYSTEM_VERSION
+        self.bootloaderVersion = BOOTLOADER_VERSION
+        self.fileSystemUpdateInProgress = False
+        self.firmwareIsBootable = True
+        self.bootloaderIsBootable = True
+        self.manufacturerBootloaderEnabled = False
+
+        self.loadTarget = None
+        self.loadHeader = None
+        self.loadedChunks = 0
+
+        self.numberOfDigits = 6
+        self.otpType = 2
+        self.otpKey = None
+        self.time = None
+
+        self.ethWallet = SimulatedWallet()
+        self.xrpWallet = SimulatedWallet()
+        self.dataToSign = None
+
+        self.sslPublicKey = simulatedPublicKey(b'SSL', serialNumber.to_bytes(4, 'big'))
+
+        self.applets = {
+            OTP_APPLET_AID: self.processOtpAPDU,
+            ETH_APPLET_AID: self.processEthAPDU,
+            XRP_APPLET_AID: self.processXrpAPDU,
+            SSL_APPLET_AID: self.processSslAPDU,
+            BOOTLOADER_APPLET_AID: self.processBootloaderAppletAPDU,
+        }
+
+    def readerName(self):
+        if self.mode == 'firmware':
+            prefix = READER_NAME
+        else:
+            prefix = BOOTLOADER_READER_NAME
+
+        return prefix + ' [CCID Interface] (' + format(self.serialNumber, '08x') + ') 00 00'
+
+    def available(self):
+        return time.monotonic() >= self.availableAt
+
+    def reenumerate(self, mode):
+        # The device resets and shows up under a new reader name once it has booted in the other mode.
+        self.mode = mode
+        self.generation += 1
+        self.availableAt = time.monotonic() + self.reenumerationDelay
+        self.selectedAID = None
+        self.loadTarget = None
+        self.ethWallet.pinVerified = False
+        self.xrpWallet.pinVerified = False
+
+    def connect(self, readerName):
+        with self.lock:
+            if not self.available() or readerName != self.readerName():
+                raise NoCardException('Unable to connect with protocol: T1.', hresult=0x80100069)
+            return self.generation
+
+    def transmit(self, generation, apdu):
+        with self.lock:
+            if generation != self.generation or not self.available():
+                raise CardConnectionException('Failed to transmit with protocol T1. The smart card has been removed.',
+                                              hresult=0x80100069)
+
+            if self.latency > 0:
+                time.sleep(self.latency)
+
+            apdu = bytes(apdu)
+
+            if len(apdu) < 4:
+                return [], 0x67, 0x00
+
+            cla, ins, p1, p2 = apdu[0:4]
+
+            if len(apdu) == 5:
+                data = b''
+                le = apdu[4]
+            elif len(apdu) > 5:
+                data = apdu[5:5 + apdu[4]]
+                le = None
+                if len(data) != apdu[4]:
+                    return [], 0x67, 0x00
+            else:
+                data = b''
+                le = None
+
+            response, sw = self.processAPDU(cla, ins, p1, p2, data, le)
+
+            return list(response), sw >> 8, sw & 0xFF
+
+    def processAPDU(self, cla, ins, p1, p2, data, le):
+        if self.mode == 'bootloader':
+            return self.processBootloaderAPDU(ins, p1, p2, data)
+
+        if cla == 0x00 and ins == 0xA4:
+            if p1 != 0x04 or data not in self.applets:
+                self.selectedAID = None
+                return b'', SW_APPLET_NOT_FOUND
+            self.selectedAID = data
+            return b'', SW_SUCCESS
+
+        if self.selectedAID is None:
+            return b'', SW_INS_NOT_SUPPORTED
+
+        return self.applets[self.selectedAID](ins, p1, p2, data, le)
+
+    def processOtpAPDU(self, ins, p1, p2, data, le):
+        if ins == 0x00:
+            if len(data) != 1 or data[0] < 6 or data[0] > 8:
+                return b'', SW_WRONG_DATA
+            self.numberOfDigits = data[0]
+            return b'', SW_SUCCESS
+        elif ins == 0x01:
+            if len(data) < 11 or len(data) > 33 or data[0] not in (1, 2):
+                return b'', SW_WRONG_DATA
+            self.otpType = data[0]
+            self.otpKey = data[1:]
+            return b'', SW_SUCCESS
+        elif ins == 0x02:
+            return bytes([self.numberOfDigits, self.otpType]), SW_SUCCESS
+        elif ins == 0x03:
+            if len(data) != 4:
+                return b'', SW_WRONG_DATA
+            self.time = int.from_bytes(data, 'big')
+            return b'', SW_SUCCESS
+
+        return b'', SW_INS_NOT_SUPPORTED
+
+    def processWalletAPDU(self, wallet, ins, p1, p2, data, le):
+        if ins == 0xC4:
+            return bytes(wallet.info()), SW_SUCCESS
+        elif ins == 0xC0:
+            return os.urandom(le or 0), SW_SUCCESS
+        elif ins == 0xF0:
+            if not wallet.initialized():
+                return b'', SW_INS_NOT_SUPPORTED
+            wallet.wipeout()
+            return b'', SW_SUCCESS
+        elif ins == 0x22 and p1 == 0x80:
+            if not wallet.initialized():
+                return b'', SW_INS_NOT_SUPPORTED
+            return b'', 0x63C0 + wallet.triesLeft
+        elif ins == 0x22:
+            return b'', wallet.verifyPin(data)
+
+        return None
+
+    def processEthAPDU(self, ins, p1, p2, data, le):
+        wallet = self.ethWallet
+
+        response = self.processWalletAPDU(wallet, ins, p1, p2, data, le)
+        if response is not None:
+            return response
+
+        if ins == 0x20:
+            if wallet.initialized():
+                return b'', SW_INS_NOT_SUPPORTED
+            if len(data) < 1 or len(data) < 2 + data[0]:
+                return b'', SW_WRONG_LENGTH
+            pin = data[1:1 + data[0]]
+            seed = data[2 + data[0]:]
+            if len(seed) != data[1 + data[0]] or len(seed) < 32 or len(seed) > 64:
+                return b'', SW_WRONG_DATA
+            wallet.initialize(pin, seed)
+            return b'', SW_SUCCESS
+        elif ins == 0x40:
+            sw = wallet.checkAccess()
+            if sw != SW_SUCCESS:
+                return b'', sw
+            if len(data) < 1 or len(data) != 1 + 4 * data[0] or data[0] > 10:
+                return b'', SW_WRONG_DATA
+            path = [int.from_bytes(data[i:i + 4], 'big') for i in range(1, len(data), 4)]
+            node = bip32.publicNode(bip32.privateNodeAtPath(wallet.key, path))
+            return node.publicKey + node.chainCode, SW_SUCCESS
+
+        return b'', SW_INS_NOT_SUPPORTED
+
+    def processXrpAPDU(self, ins, p1, p2, data, le):
+        wallet = self.xrpWallet
+
+        response = self.processWalletAPDU(wallet, ins, p1, p2, data, le)
+        if response is not None:
+            return response
+
+        if ins == 0x20:
+            if wallet.initialized():
+                return b'', SW_INS_NOT_SUPPORTED
+            if len(data) < 1:
+                return b'', SW_WRONG_LENGTH
+            pin = data[1:1 + data[0]]
+            key = data[1 + data[0]:]
+            if (p2 == 0x01 and len(key) != 16) or (p2 == 0x00 and len(key) != 32):
+                return b'', SW_WRONG_DATA
+            wallet.initialize(pin, key)
+            return b'', SW_SUCCESS
+        elif ins == 0x40:
+            sw = wallet.checkAccess()
+            if sw != SW_SUCCESS:
+                return b'', sw
+            return simulatedPublicKey(b'XRP', wallet.key), SW_SUCCESS
+        elif ins == 0xF2:
+            sw = wallet.checkAccess()
+            if sw != SW_SUCCESS:
+                return b'', sw
+            if p1 == 0x00:
+                self.dataToSign = bytearray(data)
+                return b'', SW_SUCCESS
+            elif p1 == 0x01 and self.dataToSign is not None:
+                self.dataToSign += data
+                return b'', SW_SUCCESS
+            elif p1 == 0x02 and self.dataToSign is not None:
+                digest = hashlib.sha512(b'XRP signature' + wallet.key + self.dataToSign).digest()
+                self.dataToSign = None
+                return bytes([0x30, 0x44, 0x02, 0x20]) + digest[:32] + bytes([0x02, 0x20]) + digest[32:], SW_SUCCESS
+            return b'', SW_CONDITIONS_NOT_SATISFIED
+
+        return b'', SW_INS_NOT_SUPPORTED
+
+    def processSslAPDU(self, ins, p1, p2, data, le):
+        if ins == 0x10:
+            return self.sslPublicKey, SW_SUCCESS
+
+        return b'', SW_INS_NOT_SUPPORTED
+
+    def deviceInfo(self):
+        return struct.pack('>IIIII???', self.deviceID, self.serialNumber, self.firmwareVersion,
+                           self.fileSystemVersion, self.bootloaderVersion, self.fileSystemUpdateInProgress,
+                           self.firmwareIsBootable, self.bootloaderIsBootable)
+
+    def processBootloaderAppletAPDU(self, ins, p1, p2, data, le):
+        if ins == 0x00:
+            return self.deviceInfo(), SW_SUCCESS
+        elif ins == 0x05:
+            if not self.bootloaderIsBootable:
+                return b'', SW_CONDITIONS_NOT_SATISFIED
+            self.reenumerate('bootloader')
+            return b'', SW_SUCCESS
+        elif ins == 0x80:
+            self.manufacturerBootloaderEnabled = True
+            return b'', SW_SUCCESS
+        elif ins in (0x02, 0x03, 0x04):
+            return self.processImageAPDU('bootloader', ins, p1, data)
+
+        return b'', SW_INS_NOT_SUPPORTED
+
+    def processBootloaderAPDU(self, ins, p1, p2, data):
+        if ins == 0x00:
+            return self.deviceInfo(), SW_SUCCESS
+        elif ins == 0x01:
+            if not self.firmwareIsBootable:
+                return b'', SW_CONDITIONS_NOT_SATISFIED
+            self.reenumerate('firmware')
+            return b'', SW_SUCCESS
+        elif ins in (0x02, 0x03, 0x04):
+            return self.processImageAPDU('firmware', ins, p1, data)
+
+        return b'', SW_INS_NOT_SUPPORTED
+
+    def processImageAPDU(self, target, ins, p1, data):
+        if target == 'firmware':
+            infoLength = HEADER_LENGTH + SIGNATURE_LENGTH
+            numberOfChunks = FIRMWARE_CHUNKS
+        else:
+            infoLength = 8 + SIGNATURE_LENGTH
+            numberOfChunks = BOOTLOADER_CHUNKS
+
+        if ins == 0x02:
+            if len(data) != infoLength:
+                return b'', SW_WRONG_LENGTH
+            if int.from_bytes(data[0:4], 'big') != self.deviceID:
+                return b'', SW_WRONG_DATA
+
+            self.loadTarget = target
+            self.loadHeader = data[0:infoLength - SIGNATURE_LENGTH]
+            self.loadedChunks = 0
+
+            if target == 'firmware':
+                self.firmwareIsBootable = False
+            else:
+                self.bootloaderIsBootable = False
+
+            return b'', SW_SUCCESS
+
+        if self.loadTarget != target:
+            return b'', SW_CONDITIONS_NOT_SATISFIED
+
+        if ins == 0x03:
+            if len(data) != CHUNK_LENGTH or self.loadedChunks >= numberOfChunks:
+                return b'', SW_WRONG_DATA
+            self.loadedChunks += 1
+            return b'', SW_SUCCESS
+
+        if self.loadedChunks != numberOfChunks:
+            return b'', SW_CONDITIONS_NOT_SATISFIED
+
+        if target == 'firmware':
+            deviceID, firmwareVersion, fileSystemVersion, bootloaderVersion = struct.unpack('>IIII', self.loadHeader)
+            self.firmwareVersion = firmwareVersion
+            if p1 == 0x01:
+                self.fileSystemVersion = fileSystemVersion
+                self.fileSystemUpdateInProgress = False
+                self.ethWallet.wipeout()
+                self.xrpWallet.wipeout()
+            self.firmwareIsBootable = True
+        else:
+            deviceID, bootloaderVersion = struct.unpack('>II', self.loadHeader)
+            self.bootloaderVersion = bootloaderVersion
+            self.bootloaderIsBootable = True
+
+        self.loadTarget = None
+
+        return b'', SW_SUCCESS
+
+
+class SimulatedConnection(object):
+
+    def __init__(self, device, readerName):
+        self.device = device
+        self.readerName = readerName
+        self.generation = None
+
+    def connect(self, protocol=None, mode=None, disposition=None):
+        self.generation = self.device.connect(self.readerName)
+
+    def reconnect(self, protocol=None, mode=None, disposition=None):
+        self.connect()
+
+    def disconnect(self):
+        self.generation = None
+
+    def getATR(self):
+        return list(ATR)
+
+    def getReader(self):
+        return self.readerName
+
+    def transmit(self, command, protocol=None):
+        if self.generation is None:
+            raise CardConnectionException('Card not connected')
+
+        return self.device.transmit(self.generation, command)
+
+
+class SimulatedReader(object):
+
+    def __init__(self, device):
+        self.device = device
+        self.name = device.readerName()
+
+    def createConnection(self):
+        return SimulatedConnection(self.device, self.name)
+
+    def __eq__(self, other):
+        return isinstance(other, SimulatedReader) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return self.name
+
+    def __str__(self):
+        return self.name
+
+
+class Simulator(object):
+
+    def __init__(self, numberOfDevices=1, latency=0.0, reenumerationDelay=REENUMERATION_DELAY, mode='firmware'):
+        self.devices = [SimulatedDevice(FIRST_SERIAL_NUMBER + index, latency, reenumerationDelay, mode) for index in
+                        range(0, numberOfDevices)]
+
+    def readers(self, groups=[]):
+        return [SimulatedReader(device) for device in self.devices if device.available()]
+
+    def device(self, serialNumber):
+        return next((device for device in self.devices if device.serialNumber == serialNumber), None)
+
+
+def install(simulator):
+    global originalReaders
+
+    if originalReaders is None:
+        originalReaders = smartcard.System.readers
+
+    smartcard.System.readers = simulator.readers
+    readerMonitor.pcscEventsAvailable = False
+
+
+def uninstall():
+    global originalReaders
+
+    if originalReaders is not None:
+        smartcard.System.readers = originalReaders
+        originalReaders = None
+
+    readerMonitor.pcscEventsAvailable = True
+
+
+def numberOfDevices(string):
+    integer = int(string)
+    if integer < 1:
+        raise argparse.ArgumentTypeError('At least one device should be simulated')
+    return integer
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Run a Secalot utility against simulated devices.')
+    parser._optionals.title = 'Options'
+    parser.add_argument('--devices', type=numberOfDevices, default=1, help=('Number of simulated devices.'))
+    parser.add_argument('--latency', type=float, default=0.0, help=('Per-APDU latency in milliseconds.'))
+    parser.add_argument('--reenumerationDelay', type=float, default=REENUMERATION_DELAY,
+                        help=('Seconds a device stays unavailable after switching modes.'))
+    parser.add_argument('--mode', choices=['firmware', 'bootloader'], default='firmware',
+                        help=('Mode the simulated devices start in.'))
+    parser.add_argument('tool', choices=TOOLS, help=('Utility to run.'))
+    parser.add_argument('arguments', nargs=argparse.REMAINDER, help=('Arguments passed to the utility.'))
+
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    arguments = parse_arguments()
+
+    install(Simulator(arguments.devices, arguments.latency / 1000, arguments.reenumerationDelay, arguments.mode))
+
+    tool = importlib.import_module('secalotCP.' + arguments.tool)
+    sys.argv = [arguments.tool] + arguments.arguments
+    tool.main()
+
+
+if __name__ == "__main__":
+    main()
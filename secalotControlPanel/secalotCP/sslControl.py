@@ -7,6 +7,11 @@
 
 import argparse
 import smartcard.System
+from secalotCP.appletSession import AppletSession, operation
+from secalotCP.apduBatch import ApduBatch, ApduBatchError
+import secalotCP.apduTrace as apduTrace
+import secalotCP.batchMode as batchMode
+import secalotCP.daemon as daemon
 import hashlib
 
 READER_NAME = 'Secalot Secalot Dongle'
@@ -20,21 +25,28 @@ class InvalidCardResponseError(Exception):
     pass
 
 
-def parse_arguments():
-    parser = argparse.ArgumentParser(description='SSL control.')
+def argumentParser(parserClass=argparse.ArgumentParser):
+    parser = parserClass(description='SSL control.')
     parser._optionals.title = 'Options'
     subparsers = parser.add_subparsers(dest='subcommand')
-    subparsers.required = True
 
     parserGetPublicKeyFingerprint = subparsers.add_parser('getPublicKeyFingerprint', help='Get public key fingerprint.')
     parserGetPublicKey = subparsers.add_parser('getPublicKey', help='Get public key.')
 
+    batchMode.addBatchArgument(parser)
+
+    return parser
+
+
+def parse_arguments():
+    parser = argumentParser()
     args = parser.parse_args()
+    batchMode.checkArguments(parser, args)
     return args
 
 
 def findConnectedDevice():
-    connectedReaders = smartcard.System.readers()
+    connectedReaders = daemon.readers()
 
     reader = next((reader for reader in connectedReaders if reader.name.startswith(READER_NAME)), None)
 
@@ -45,26 +57,39 @@ def findConnectedDevice():
 
     connection.connect()
 
-    return connection
+    return AppletSession(connection)
+
+
+SELECT_APDU = [0x00, 0xA4, 0x04, 0x00, 0x09, 0x53, 0x53, 0x4C, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54]
 
 
 def selectApp(connection):
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x09, 0x53, 0x53, 0x4C, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
+    response, sw1, sw2 = connection.transmit(SELECT_APDU)
     if sw1 != 0x90 or sw2 != 00:
         raise InvalidCardResponseError()
 
 
-def getPublicKeyFingerprint(connection):
-    selectApp(connection)
+def readPublicKey(connection):
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add([0x80, 0x10, 0x00, 0x00])
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x10, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
+    try:
+        response = batch.execute(connection)[1].data
+    except ApduBatchError:
         raise InvalidCardResponseError()
 
+    return parsePublicKey(response)
+
+
+def parsePublicKey(response):
     if len(response) != 65:
         raise InvalidCardResponseError()
 
+    return response
+
+
+def publicKeyFingerprint(response):
     response = response[1:]
 
     hash = hashlib.sha256(bytes(response)).hexdigest()
@@ -72,35 +97,62 @@ def getPublicKeyFingerprint(connection):
     return hash[:16]
 
 
+def publicKeyToHex(response):
+    return bytes(response[1:]).hex()
+
+
+def getPublicKeyFingerprint(connection):
+    return publicKeyFingerprint(readPublicKey(connection))
+
+
 def getPublicKey(connection):
-    selectApp(connection)
+    return publicKeyToHex(readPublicKey(connection))
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x10, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
 
-    if len(response) != 65:
-        raise InvalidCardResponseError()
+CLI_ERRORS = (NoReaderFoundError, InvalidCardResponseError)
 
-    return bytes(response[1:]).hex()
+
+def errorMessage(e):
+    if isinstance(e, NoReaderFoundError):
+        return 'please connect a device.'
+    else:
+        return 'invalid response received from the device.'
+
+
+def executeSubcommand(connection, arguments):
+    if arguments.subcommand == 'getPublicKeyFingerprint':
+        return {'fingerprint': getPublicKeyFingerprint(connection)}
+    elif arguments.subcommand == 'getPublicKey':
+        return {'publicKey': getPublicKey(connection)}
+
+    return {}
 
 
 def main():
     arguments = parse_arguments()
+    apduTrace.installFromEnvironment()
 
     try:
         connection = findConnectedDevice()
+
+        if arguments.batch is not None:
+            batchMode.runBatch(argumentParser(batchMode.BatchArgumentParser), arguments.batch, connection,
+                               executeSubcommand, CLI_ERRORS, errorMessage)
+            return
+
+        with operation(connection):
+            result = executeSubcommand(connection, arguments)
+
         if arguments.subcommand == 'getPublicKeyFingerprint':
-            fingerprint = getPublicKeyFingerprint(connection)
-            print('Public key fingerprint: ' + fingerprint)
+            print('Public key fingerprint: ' + result['fingerprint'])
         elif arguments.subcommand == 'getPublicKey':
-            key = getPublicKey(connection)
-            print('Public key: ' + key)
+            print('Public key: ' + result['publicKey'])
 
-    except NoReaderFoundError:
-        print('Error: please connect a device.')
-    except InvalidCardResponseError:
-        print('Error: invalid response received from the device.')
+    except CLI_ERRORS as e:
+        if arguments.batch is not None:
+            batchMode.printRecord({'error': errorMessage(e)})
+        else:
+            print('Error: ' + errorMessage(e))
 
 
 if __name__ == "__main__":
@@ -9,25 +9,26 @@ import smartcard.System
 import time
 import struct
 
+from secalotCP.apduBatch import ApduBatch
+import secalotCP.apduTrace as apduTrace
+
 READER_NAME = 'Secalot Secalot Dongle'
 
 
 def sendTime(connection):
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x09, 0x4F, 0x54, 0x50, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-    if sw1 != 0x90 or sw2 != 00:
-        raise Exception()
-
     epoch_time = int(time.time())
 
     epoch_time = epoch_time.to_bytes(4, 'big')
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x03, 0x00, 0x00, len(epoch_time)] + list(epoch_time))
-    if sw1 != 0x90 or sw2 != 00:
-        raise Exception()
+    batch = ApduBatch()
+    batch.add([0x00, 0xA4, 0x04, 0x00, 0x09, 0x4F, 0x54, 0x50, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
+    batch.add([0x80, 0x03, 0x00, 0x00, len(epoch_time)] + list(epoch_time))
+    batch.execute(connection)
 
 
 def main():
+    apduTrace.installFromEnvironment()
+
     readers = []
     addedReaders = []
 
@@ -6,10 +6,20 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import argparse
+import mmap
+import os
+import signal
 import smartcard.System
+import threading
 import time
 import struct
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import secalotCP.apduTrace as apduTrace
+from secalotCP.apduBatch import ApduBatch, ApduBatchError
+from secalotCP.publicKeyCache import forgetCachedDevice
+from secalotCP.readerMonitor import ReaderMonitor, waitForReadyReader, ReaderWaitTimeoutError, POLLING_INTERVAL
 
 READER_NAME = 'Secalot Secalot Dongle'
 BOOTLOADER_READER_NAME = 'Secalot Secalot Bootloader'
@@ -22,6 +32,19 @@ CHUNK_LENGTH = 128
 FIRMWARE_CHUNKS = 1664
 BOOTLOADER_CHUNKS = 256
 
+FIRMWARE_DATA_OFFSET = len(MAGIC) + HEADER_LENGTH + 2 * SIGNATURE_LENGTH
+BOOTLOADER_DATA_OFFSET = FIRMWARE_DATA_OFFSET + FIRMWARE_CHUNKS * CHUNK_LENGTH
+IMAGE_LENGTH = BOOTLOADER_DATA_OFFSET + BOOTLOADER_CHUNKS * CHUNK_LENGTH
+
+LOAD_IMAGE_DATA_HEADER = bytes([0x80, 0x03, 0x00, 0x00, CHUNK_LENGTH])
+
+SELECT_APDU = [0x00, 0xA4, 0x04, 0x00, 0x0A, 0x42, 0x4C, 0x44, 0x52, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54]
+
+PROGRESS_INTERVAL = 0.1
+
+# Devices of a fleet are updated by parallel threads, their lines are printed one at a time.
+fleetOutputLock = threading.Lock()
+
 
 class InvalidUpdateImageError(Exception):
     pass
@@ -35,6 +58,14 @@ class InvalidCardResponseError(Exception):
     pass
 
 
+class ModeSwitchTimeoutError(Exception):
+    pass
+
+
+class FlashCancelledError(Exception):
+    pass
+
+
 class NotSuitableImageError(Exception):
     def __init__(self, reasonCode):
         super().__init__()
@@ -44,6 +75,18 @@ class NotSuitableImageError(Exception):
 DeviceInfo = namedtuple('DeviceInfo',
                         'deviceID serialNumber firmwareVersion fileSystemVersion bootloaderVersion fileSystemUpdateInProgress firmwareIsBootable bootloaderIsBootable')
 ImageInfo = namedtuple('ImageInfo', 'deviceID firmwareVersion fileSystemVersion bootloaderVersion')
+FleetResult = namedtuple('FleetResult', 'serialNumber outcome duration')
+FlashProgress = namedtuple('FlashProgress', 'stage bytesSent totalBytes elapsed throughput eta')
+
+NOT_SUITABLE_IMAGE_MESSAGES = [
+    'This update is targeting a different device version.',
+    'A downgrade can not be performed.',
+    'A downgrade can not be performed.',
+    'A downgrade can not be performed.',
+    'This update can only be applied together with cleaning a file system. Please use a --cleanFileSystem option.',
+    'An update performed on this device was interrupted while cleaning a file system. '
+    'Please use a --cleanFileSystem option.',
+    'Previous update was interrupted. Please continue with the exact same update image file.']
 
 
 def parse_arguments():
@@ -59,12 +102,28 @@ def parse_arguments():
                                           help=('File with an update image.'))
     parserSwitch = subparsers.add_parser('switch',
                                          help='Switch mode. Go to bootloader mode if in firmware mode and vice versa.')
+    parserSwitch._optionals.title = 'Options'
+    parserSwitch.add_argument('--modeSwitchTimeout', type=float, default=None,
+                              help=('Seconds to wait for the device to reappear. Waits forever by default.'))
     parserUpload = subparsers.add_parser('upload', help='Upload a an update image')
     parserUpload._optionals.title = 'Options'
     parserUpload.add_argument('--imageFile', required=True, type=argparse.FileType('rb'),
                               help=('File with an update image.'))
     parserUpload.add_argument('--cleanFileSystem', action='store_true',
                               help=('Reinstantiate a clean file system (all data will be lost).'))
+    parserUpload.add_argument('--modeSwitchTimeout', type=float, default=None,
+                              help=('Seconds to wait for the device to reappear after each mode switch. '
+                                    'Waits forever by default.'))
+    parserFleetUpload = subparsers.add_parser('fleetUpload', aliases=['fleet-upload'],
+                                              help='Upload an update image to all connected devices in parallel.')
+    parserFleetUpload._optionals.title = 'Options'
+    parserFleetUpload.add_argument('--imageFile', required=True, type=argparse.FileType('rb'),
+                                   help=('File with an update image.'))
+    parserFleetUpload.add_argument('--cleanFileSystem', action='store_true',
+                                   help=('Reinstantiate a clean file system (all data will be lost).'))
+    parserFleetUpload.add_argument('--modeSwitchTimeout', type=float, default=None,
+                                   help=('Seconds to wait for a device to reappear after each mode switch. '
+                                         'Waits forever by default.'))
     parserEnableManufacturerBootloader = subparsers.add_parser('enableManufacturerBootloader',
                                                                help='Enable manufacturer bootloader.')
     args = parser.parse_args()
@@ -86,56 +145,94 @@ def getUpdateImageInfo(imageFile):
     return imageInfo
 
 
-def updateImageToAPDUs(imageFile, cleanFileSystemRequested):
-    fwApduList = []
-    blApduList = []
+class ImageAPDUs(object):
 
-    imageFile.seek(0, 0)
+    def __init__(self, image, imageViews, setImageInfoAPDU, dataOffset, numberOfChunks, finalAPDU):
+        self.image = image
+        self.imageViews = imageViews
+        self.setImageInfoAPDU = setImageInfoAPDU
+        self.dataOffset = dataOffset
+        self.numberOfChunks = numberOfChunks
+        self.finalAPDU = finalAPDU
 
-    if MAGIC != imageFile.read(4):
-        raise InvalidUpdateImageError()
+    def __enter__(self):
+        return self
 
-    header = imageFile.read(HEADER_LENGTH)
-    if len(header) != HEADER_LENGTH:
-        raise InvalidUpdateImageError()
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
 
-    fwSignature = imageFile.read(SIGNATURE_LENGTH)
-    if len(fwSignature) != SIGNATURE_LENGTH:
-        raise InvalidUpdateImageError()
+    def close(self):
+        # The firmware and bootloader APDUs share one mapping of the image, closing either unmaps it.
+        # Views held by iterations that were interrupted and never resumed are released first.
+        for imageView in list(self.imageViews.values()):
+            imageView.release()
+        self.imageViews.clear()
+
+        self.image.close()
+
+    def __len__(self):
+        return self.numberOfChunks + 2
+
+    def totalLength(self):
+        return len(self.setImageInfoAPDU) + self.numberOfChunks * (len(LOAD_IMAGE_DATA_HEADER) + CHUNK_LENGTH) + len(
+            self.finalAPDU)
+
+    def __iter__(self):
+        yield self.setImageInfoAPDU
+
+        # Every data APDU reuses the same buffer. A yielded view is only valid until the next one is requested.
+        # Chunks are copied into it straight from the mapping, each chunk view is released before the APDU is yielded.
+        apdu = bytearray(LOAD_IMAGE_DATA_HEADER) + bytearray(CHUNK_LENGTH)
+        apduView = memoryview(apdu)
+        imageView = memoryview(self.image)
+        # Views of one image compare equal by content, they are kept by identity.
+        self.imageViews[id(imageView)] = imageView
+
+        try:
+            for offset in range(self.dataOffset, self.dataOffset + self.numberOfChunks * CHUNK_LENGTH, CHUNK_LENGTH):
+                with imageView[offset:offset + CHUNK_LENGTH] as chunk:
+                    apduView[len(LOAD_IMAGE_DATA_HEADER):] = chunk
+                yield apduView
+        finally:
+            self.imageViews.pop(id(imageView), None)
+            imageView.release()
+            apduView.release()
 
-    blSignature = imageFile.read(SIGNATURE_LENGTH)
-    if len(blSignature) != SIGNATURE_LENGTH:
+        yield self.finalAPDU
+
+
+def updateImageToAPDUs(imageFile, cleanFileSystemRequested):
+    if os.fstat(imageFile.fileno()).st_size < IMAGE_LENGTH:
         raise InvalidUpdateImageError()
 
-    fwSetImageInfoAPDU = [0x80, 0x02, 0x00, 0x00, HEADER_LENGTH + SIGNATURE_LENGTH] + list(header) + list(fwSignature)
-    fwApduList.append(fwSetImageInfoAPDU)
+    # The mapping keeps its own handle of the file, the caller may close the file once this returns.
+    image = mmap.mmap(imageFile.fileno(), IMAGE_LENGTH, access=mmap.ACCESS_READ)
 
-    blSetImageInfoAPDU = [0x80, 0x02, 0x00, 0x00, 8 + SIGNATURE_LENGTH] + list(header[0:4]) + list(
-        header[12:16]) + list(blSignature)
-    blApduList.append(blSetImageInfoAPDU)
+    if MAGIC != image[0:len(MAGIC)]:
+        image.close()
+        raise InvalidUpdateImageError()
 
-    for count in range(0, FIRMWARE_CHUNKS):
-        chunk = imageFile.read(CHUNK_LENGTH)
-        if len(chunk) != CHUNK_LENGTH:
-            raise InvalidUpdateImageError()
-        loadImageDataAPDU = [0x80, 0x03, 0x00, 0x00, CHUNK_LENGTH] + list(chunk)
-        fwApduList.append(loadImageDataAPDU)
+    header = image[len(MAGIC):len(MAGIC) + HEADER_LENGTH]
+    fwSignature = image[len(MAGIC) + HEADER_LENGTH:len(MAGIC) + HEADER_LENGTH + SIGNATURE_LENGTH]
+    blSignature = image[len(MAGIC) + HEADER_LENGTH + SIGNATURE_LENGTH:FIRMWARE_DATA_OFFSET]
 
-    for count in range(0, BOOTLOADER_CHUNKS):
-        chunk = imageFile.read(CHUNK_LENGTH)
-        if len(chunk) != CHUNK_LENGTH:
-            raise InvalidUpdateImageError()
-        loadImageDataAPDU = [0x80, 0x03, 0x00, 0x00, CHUNK_LENGTH] + list(chunk)
-        blApduList.append(loadImageDataAPDU)
+    fwSetImageInfoAPDU = bytes([0x80, 0x02, 0x00, 0x00, HEADER_LENGTH + SIGNATURE_LENGTH]) + header + fwSignature
+    blSetImageInfoAPDU = bytes([0x80, 0x02, 0x00, 0x00, 8 + SIGNATURE_LENGTH]) + header[0:4] + header[12:16] + \
+                         blSignature
 
     if cleanFileSystemRequested == True:
-        fwApduList.append([0x80, 0x04, 0x00, 0x01])
+        fwFinalAPDU = bytes([0x80, 0x04, 0x00, 0x01])
     else:
-        fwApduList.append([0x80, 0x04, 0x00, 0x00])
+        fwFinalAPDU = bytes([0x80, 0x04, 0x00, 0x00])
 
-    blApduList.append([0x80, 0x04, 0x00, 0x00])
+    blFinalAPDU = bytes([0x80, 0x04, 0x00, 0x00])
 
-    return fwApduList, blApduList
+    imageViews = {}
+    fwApdus = ImageAPDUs(image, imageViews, fwSetImageInfoAPDU, FIRMWARE_DATA_OFFSET, FIRMWARE_CHUNKS, fwFinalAPDU)
+    blApdus = ImageAPDUs(image, imageViews, blSetImageInfoAPDU, BOOTLOADER_DATA_OFFSET, BOOTLOADER_CHUNKS,
+                         blFinalAPDU)
+
+    return fwApdus, blApdus
 
 
 def findConnectedDevice():
@@ -159,58 +256,70 @@ def findConnectedDevice():
     return device, connection
 
 
-def switchModes(device, connection):
+def targetMode(device):
     if device == 'bootloader':
-        targetReaderName = READER_NAME
-        modeSwitchingTo = 'firmware'
+        return 'firmware'
     elif device == 'firmware':
-        targetReaderName = BOOTLOADER_READER_NAME
-        modeSwitchingTo = 'bootloader'
+        return 'bootloader'
     else:
         raise Exception
 
+
+def switchModes(device, connection, timeout=None):
+    if targetMode(device) == 'firmware':
+        targetReaderName = READER_NAME
+    else:
+        targetReaderName = BOOTLOADER_READER_NAME
+
+    requestModeSwitch(device, connection)
+
+    try:
+        readerName, switchTime = waitForReadyReader(targetReaderName, timeout)
+    except ReaderWaitTimeoutError:
+        raise ModeSwitchTimeoutError()
+
+    return switchTime
+
+
+def requestModeSwitch(device, connection):
+    batch = ApduBatch()
+
     if device == 'firmware':
-        response, sw1, sw2 = connection.transmit(
-            [0x00, 0xA4, 0x04, 0x00, 0x0A, 0x42, 0x4C, 0x44, 0x52, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-        if sw1 != 0x90 or sw2 != 00:
-            raise InvalidCardResponseError()
-        response, sw1, sw2 = connection.transmit([0x80, 0x05, 0x00, 0x00])
-        if sw1 != 0x90 or sw2 != 00:
-            raise InvalidCardResponseError()
+        batch.add(SELECT_APDU)
+        batch.add([0x80, 0x05, 0x00, 0x00])
     else:
-        response, sw1, sw2 = connection.transmit([0x80, 0x01, 0x00, 0x00])
-        if sw1 != 0x90 or sw2 != 00:
-            raise InvalidCardResponseError()
+        batch.add([0x80, 0x01, 0x00, 0x00])
+
+    executeBatch(connection, batch)
 
     connection.disconnect()
 
-    print('Switching to ' + modeSwitchingTo + ' mode. Please replug the device.')
 
-    while True:
-        time.sleep(0.1)
-        try:
-            connectedReaders = smartcard.System.readers()
-        except smartcard.pcsc.PCSCExceptions.ListReadersException:
-            smartcard.pcsc.PCSCContext.PCSCContext.instance = None
-        reader = next((reader for reader in connectedReaders if reader.name.startswith(targetReaderName)), None)
-        if reader != None:
-            time.sleep(0.5)
-            break
+def switchModesAndReport(device, connection, timeout=None):
+    print('Switching to ' + targetMode(device) + ' mode. Please replug the device.')
+    switchTime = switchModes(device, connection, timeout)
+    print('Mode switched in ' + format(switchTime, '.2f') + ' s.')
+
 
-    print('Mode switched.')
+def executeBatch(connection, batch):
+    try:
+        return batch.execute(connection)
+    except ApduBatchError:
+        raise InvalidCardResponseError()
 
 
 def getDeviceInfo(device, connection):
+    batch = ApduBatch()
+
     if device == 'firmware':
-        response, sw1, sw2 = connection.transmit(
-            [0x00, 0xA4, 0x04, 0x00, 0x0A, 0x42, 0x4C, 0x44, 0x52, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-        if sw1 != 0x90 or sw2 != 00:
-            raise InvalidCardResponseError()
+        batch.add(SELECT_APDU)
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x00, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+    batch.add([0x80, 0x00, 0x00, 0x00])
 
+    return parseDeviceInfo(executeBatch(connection, batch)[-1].data)
+
+
+def parseDeviceInfo(response):
     if len(response) != 23:
         raise InvalidCardResponseError()
 
@@ -244,58 +353,354 @@ def printUpdateImageInfo(imageInfo):
 
 def checkImageInfo(imageInfo, deviceInfo, cleanFileSystemRequested):
     if imageInfo.deviceID != deviceInfo.deviceID:
-        print('This update is targeting a different device version.')
         raise NotSuitableImageError(1)
     if imageInfo.firmwareVersion < deviceInfo.firmwareVersion:
-        print('A downgrade can not be performed.')
         raise NotSuitableImageError(2)
     if imageInfo.bootloaderVersion < deviceInfo.bootloaderVersion:
-        print('A downgrade can not be performed.')
         raise NotSuitableImageError(3)
     if imageInfo.fileSystemVersion < deviceInfo.fileSystemVersion:
-        print('A downgrade can not be performed.')
         raise NotSuitableImageError(4)
     if cleanFileSystemRequested == False and imageInfo.fileSystemVersion > deviceInfo.fileSystemVersion:
-        print(
-            'This update can only be applied together with cleaning a file system. Please use a --cleanFileSystem option.')
         raise NotSuitableImageError(5)
     if cleanFileSystemRequested == False and deviceInfo.fileSystemUpdateInProgress == True:
-        print(
-            'An update performed on this device was interrupted while cleaning a file system. Please use a --cleanFileSystem option.')
         raise NotSuitableImageError(6)
     if (imageInfo.bootloaderVersion != deviceInfo.bootloaderVersion) and deviceInfo.firmwareIsBootable == False:
-        print('Previous update was interrupted. Please continue with the exact same update image file.')
         raise NotSuitableImageError(7)
 
 
-def loadTheImage(connection, apduList):
-    print('Loading image.')
-    for apdu in apduList:
-        response, sw1, sw2 = connection.transmit(apdu)
+def forgetCachedPublicKeys(deviceInfo, cleanFileSystemRequested):
+    # A clean file system erases the wallets, public keys cached for the device belong to the old ones.
+    if cleanFileSystemRequested == True:
+        forgetCachedDevice(format(deviceInfo.serialNumber, '08x'))
+
+
+class FlashJob(object):
+    # Progress of a single update. Reports are throttled to one per progressInterval, not one per chunk.
+    # Cancellation is requested from any thread and takes effect at the next checkpoint.
+
+    def __init__(self, progressCallback=None, progressInterval=PROGRESS_INTERVAL):
+        self.progressCallback = progressCallback
+        self.progressInterval = progressInterval
+        self.cancelRequested = threading.Event()
+        self.stage = None
+        self.bytesSent = 0
+        self.totalBytes = 0
+        self.stageStart = 0.0
+        self.lastReport = 0.0
+
+    def cancel(self):
+        self.cancelRequested.set()
+
+    def checkpoint(self):
+        if self.cancelRequested.is_set():
+            raise FlashCancelledError()
+
+    def beginStage(self, stage, totalBytes):
+        self.stage = stage
+        self.bytesSent = 0
+        self.totalBytes = totalBytes
+        self.stageStart = time.monotonic()
+        self.report(self.stageStart)
+
+    def chunkSent(self, length):
+        self.bytesSent += length
+        now = time.monotonic()
+
+        if now - self.lastReport >= self.progressInterval or self.bytesSent >= self.totalBytes:
+            self.report(now)
+
+    def progress(self, now=None):
+        if now is None:
+            now = time.monotonic()
+
+        elapsed = now - self.stageStart
+
+        if elapsed > 0 and self.bytesSent > 0:
+            throughput = self.bytesSent / elapsed
+            eta = (self.totalBytes - self.bytesSent) / throughput
+        else:
+            throughput = 0.0
+            eta = None
+
+        return FlashProgress(self.stage, self.bytesSent, self.totalBytes, elapsed, throughput, eta)
+
+    def report(self, now):
+        self.lastReport = now
+
+        if self.progressCallback is not None:
+            self.progressCallback(self.progress(now))
+
+
+def loadTheImage(connection, apdus, job=None, stage='firmware'):
+    if job is not None:
+        job.beginStage(stage, apdus.totalLength())
+
+    for apdu in apdus:
+        if job is not None:
+            # An interrupted load is resumed with the same image, so stopping between chunks is safe.
+            job.checkpoint()
+
+        length = len(apdu)
+        # pyscard only accepts APDUs as lists of integers.
+        response, sw1, sw2 = connection.transmit(list(apdu))
         if sw1 != 0x90 or sw2 != 00:
             raise InvalidCardResponseError()
-    print('Done.')
 
+        if job is not None:
+            job.chunkSent(length)
+
+
+def printProgress(progress):
+    if progress.totalBytes != 0:
+        percent = 100 * progress.bytesSent / progress.totalBytes
+    else:
+        percent = 100
+
+    line = format(percent, '3.0f') + '%  ' + format(progress.throughput / 1024, '.1f') + ' KiB/s'
+    if progress.eta is not None:
+        line += '  ' + format(progress.eta, '.0f') + ' s left'
+
+    print('\r' + line.ljust(40), end='', flush=True)
+
+
+def loadTheImageAndReport(connection, apdus, job=None, stage='firmware'):
+    if job is None:
+        job = FlashJob(printProgress)
+
+    print('Loading ' + stage + ' image.')
+    loadTheImage(connection, apdus, job, stage)
+    progress = job.progress()
+    print('')
+    print('Done. ' + str(progress.bytesSent) + ' bytes in ' + format(progress.elapsed, '.1f') + ' s (' +
+          format(progress.throughput / 1024, '.1f') + ' KiB/s).')
+
+
+def performUpdate(device, connection, fwApdus, blApdus, imageInfo, deviceInfo, modeSwitchTimeout=None, job=None):
+    if job is None:
+        job = FlashJob(printProgress)
 
-def performUpdate(device, connection, fwApduList, blApduList, imageInfo, deviceInfo):
     if device == 'bootloader':
         if deviceInfo.bootloaderVersion != imageInfo.bootloaderVersion:
-            switchModes(device, connection)
+            job.checkpoint()
+            switchModesAndReport(device, connection, modeSwitchTimeout)
             device, connection = findConnectedDevice()
-            loadTheImage(connection, blApduList)
-            switchModes(device, connection)
+            loadTheImageAndReport(connection, blApdus, job, 'bootloader')
+            job.checkpoint()
+            switchModesAndReport(device, connection, modeSwitchTimeout)
             device, connection = findConnectedDevice()
     else:
         if (deviceInfo.bootloaderVersion != imageInfo.bootloaderVersion) or deviceInfo.bootloaderIsBootable == False:
-            loadTheImage(connection, blApduList)
-        switchModes(device, connection)
+            loadTheImageAndReport(connection, blApdus, job, 'bootloader')
+        job.checkpoint()
+        switchModesAndReport(device, connection, modeSwitchTimeout)
         device, connection = findConnectedDevice()
 
-    loadTheImage(connection, fwApduList)
-    switchModes(device, connection)
+    loadTheImageAndReport(connection, fwApdus, job, 'firmware')
+    job.checkpoint()
+    switchModesAndReport(device, connection, modeSwitchTimeout)
     device, connection = findConnectedDevice()
 
 
+class DeviceRegistry(object):
+    # Maps reader names to device serial numbers, so that devices can be told apart while they
+    # reenumerate under new reader names after switching modes.
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.serialNumbers = {}
+
+    def listDevices(self):
+        devices = []
+
+        for reader in smartcard.System.readers():
+            if reader.name.startswith(BOOTLOADER_READER_NAME):
+                devices.append((reader, 'bootloader'))
+            elif reader.name.startswith(READER_NAME):
+                devices.append((reader, 'firmware'))
+
+        return devices
+
+    def identifyDevices(self):
+        # Must be called with the lock held. Returns False if some device could not be identified yet.
+        devices = self.listDevices()
+        allIdentified = True
+
+        readerNames = [reader.name for reader, device in devices]
+        for readerName in list(self.serialNumbers.keys()):
+            if readerName not in readerNames:
+                del self.serialNumbers[readerName]
+
+        for reader, device in devices:
+            if reader.name in self.serialNumbers:
+                continue
+
+            connection = None
+            try:
+                connection = reader.createConnection()
+                connection.connect()
+                self.serialNumbers[reader.name] = getDeviceInfo(device, connection).serialNumber
+            except Exception:
+                allIdentified = False
+            finally:
+                if connection is not None:
+                    try:
+                        connection.disconnect()
+                    except Exception:
+                        pass
+
+        return devices, allIdentified
+
+    def allSerialNumbers(self):
+        with self.lock:
+            devices, allIdentified = self.identifyDevices()
+            return sorted(set(self.serialNumbers[reader.name] for reader, device in devices if
+                              reader.name in self.serialNumbers))
+
+    def forget(self, serialNumber):
+        with self.lock:
+            for readerName in [readerName for readerName, value in self.serialNumbers.items() if
+                               value == serialNumber]:
+                del self.serialNumbers[readerName]
+
+    def connectToDevice(self, serialNumber, timeout=None):
+        if timeout is None:
+            deadline = None
+        else:
+            deadline = time.monotonic() + timeout
+
+        readerMonitor = None
+        try:
+            readerMonitor = ReaderMonitor()
+            if not readerMonitor.pnpNotificationSupported():
+                readerMonitor.close()
+                readerMonitor = None
+        except Exception:
+            readerMonitor = None
+
+        try:
+            while True:
+                with self.lock:
+                    devices, allIdentified = self.identifyDevices()
+
+                    for reader, device in devices:
+                        if self.serialNumbers.get(reader.name) == serialNumber:
+                            connection = reader.createConnection()
+                            connection.connect()
+                            return device, connection
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ModeSwitchTimeoutError()
+
+                if readerMonitor is not None and allIdentified:
+                    if deadline is None:
+                        readerMonitor.waitForReaderListChange()
+                    else:
+                        readerMonitor.waitForReaderListChange(max(int((deadline - time.monotonic()) * 1000), 1))
+                else:
+                    time.sleep(POLLING_INTERVAL)
+        finally:
+            if readerMonitor is not None:
+                readerMonitor.close()
+
+
+def switchFleetDevice(registry, serialNumber, device, connection, modeSwitchTimeout, job=None):
+    if job is not None:
+        job.checkpoint()
+
+    registry.forget(serialNumber)
+    requestModeSwitch(device, connection)
+    return registry.connectToDevice(serialNumber, modeSwitchTimeout)
+
+
+def performFleetUpdate(registry, serialNumber, fwApdus, blApdus, imageInfo, cleanFileSystemRequested,
+                       modeSwitchTimeout, job=None):
+    device, connection = registry.connectToDevice(serialNumber, modeSwitchTimeout)
+    deviceInfo = getDeviceInfo(device, connection)
+    checkImageInfo(imageInfo, deviceInfo, cleanFileSystemRequested)
+    forgetCachedPublicKeys(deviceInfo, cleanFileSystemRequested)
+
+    if device == 'bootloader':
+        if deviceInfo.bootloaderVersion != imageInfo.bootloaderVersion:
+            device, connection = switchFleetDevice(registry, serialNumber, device, connection, modeSwitchTimeout,
+                                                   job)
+            loadTheImage(connection, blApdus, job, 'bootloader')
+            device, connection = switchFleetDevice(registry, serialNumber, device, connection, modeSwitchTimeout,
+                                                   job)
+    else:
+        if (deviceInfo.bootloaderVersion != imageInfo.bootloaderVersion) or deviceInfo.bootloaderIsBootable == False:
+            loadTheImage(connection, blApdus, job, 'bootloader')
+        device, connection = switchFleetDevice(registry, serialNumber, device, connection, modeSwitchTimeout, job)
+
+    loadTheImage(connection, fwApdus, job, 'firmware')
+    device, connection = switchFleetDevice(registry, serialNumber, device, connection, modeSwitchTimeout, job)
+    connection.disconnect()
+
+
+def flashFleetDevice(registry, serialNumber, fwApdus, blApdus, imageInfo, cleanFileSystemRequested,
+                     modeSwitchTimeout):
+    start = time.monotonic()
+
+    try:
+        performFleetUpdate(registry, serialNumber, fwApdus, blApdus, imageInfo, cleanFileSystemRequested,
+                           modeSwitchTimeout)
+        outcome = 'updated'
+    except NotSuitableImageError as e:
+        outcome = 'skipped: ' + NOT_SUITABLE_IMAGE_MESSAGES[e.reasonCode - 1]
+    except ModeSwitchTimeoutError:
+        outcome = 'failed: the device did not reappear after switching modes'
+    except InvalidCardResponseError:
+        outcome = 'failed: invalid response received from the device'
+    except Exception as e:
+        outcome = 'failed: ' + (str(e) or type(e).__name__)
+
+    result = FleetResult(serialNumber, outcome, time.monotonic() - start)
+    printFleetLine(formatSerialNumber(serialNumber) + ': ' + outcome + '.')
+
+    return result
+
+
+def performFleetUpload(imageFile, cleanFileSystemRequested, modeSwitchTimeout):
+    imageInfo = getUpdateImageInfo(imageFile)
+    fwApdus, blApdus = updateImageToAPDUs(imageFile, cleanFileSystemRequested)
+
+    with fwApdus, blApdus:
+        registry = DeviceRegistry()
+        serialNumbers = registry.allSerialNumbers()
+
+        if len(serialNumbers) == 0:
+            raise NoReaderFoundError
+
+        printFleetLine('Updating ' + str(len(serialNumbers)) + ' devices. Please replug the devices if asked to.')
+
+        with ThreadPoolExecutor(max_workers=len(serialNumbers)) as executor:
+            futures = [executor.submit(flashFleetDevice, registry, serialNumber, fwApdus, blApdus, imageInfo,
+                                       cleanFileSystemRequested, modeSwitchTimeout) for serialNumber in serialNumbers]
+            results = [future.result() for future in futures]
+
+    printFleetSummary(results)
+
+
+def printFleetLine(line):
+    with fleetOutputLock:
+        print(line, flush=True)
+
+
+def formatSerialNumber(serialNumber):
+    return hex(serialNumber)[2:].zfill(8)
+
+
+def printFleetSummary(results):
+    print('')
+    print('Serial number  Time      Outcome')
+    for result in results:
+        print(formatSerialNumber(result.serialNumber) + '       ' + format(result.duration, '6.1f') + ' s  ' +
+              result.outcome)
+
+    updated = len([result for result in results if result.outcome == 'updated'])
+    print('')
+    print(str(updated) + ' of ' + str(len(results)) + ' devices updated.')
+
+
 def enableManufacturerBootloader(device, connection):
     print('Enabling manufacturer bootloader.')
 
@@ -303,24 +708,31 @@ def enableManufacturerBootloader(device, connection):
         print('This command is only available in firmware mode')
         return
 
-    response, sw1, sw2 = connection.transmit(
-        [0x00, 0xA4, 0x04, 0x00, 0x0A, 0x42, 0x4C, 0x44, 0x52, 0x41, 0x50, 0x50, 0x4C, 0x45, 0x54])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+    batch = ApduBatch()
+    batch.add(SELECT_APDU)
+    batch.add([0x80, 0x80, 0x00, 0x00])
 
-    response, sw1, sw2 = connection.transmit([0x80, 0x80, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+    executeBatch(connection, batch)
 
     print('Done.')
 
 
+def cancelOnInterrupt(job):
+    # The first Ctrl+C stops the update at the next safe point, a second one interrupts right away.
+    def interrupted(signum, frame):
+        job.cancel()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    signal.signal(signal.SIGINT, interrupted)
+
+
 def main():
     arguments = parse_arguments()
+    apduTrace.installFromEnvironment()
 
     try:
 
-        if arguments.subcommand != 'getUpdateImageInfo':
+        if arguments.subcommand not in ('getUpdateImageInfo', 'fleetUpload', 'fleet-upload'):
             device, connection = findConnectedDevice()
 
         if arguments.subcommand == 'getDeviceInfo':
@@ -330,13 +742,20 @@ def main():
             imageInfo = getUpdateImageInfo(arguments.imageFile)
             printUpdateImageInfo(imageInfo)
         elif arguments.subcommand == 'switch':
-            switchModes(device, connection)
+            switchModesAndReport(device, connection, arguments.modeSwitchTimeout)
         elif arguments.subcommand == 'upload':
             imageInfo = getUpdateImageInfo(arguments.imageFile)
-            fwApduList, blApduList = updateImageToAPDUs(arguments.imageFile, arguments.cleanFileSystem)
-            deviceInfo = getDeviceInfo(device, connection)
-            checkImageInfo(imageInfo, deviceInfo, arguments.cleanFileSystem)
-            performUpdate(device, connection, fwApduList, blApduList, imageInfo, deviceInfo)
+            fwApdus, blApdus = updateImageToAPDUs(arguments.imageFile, arguments.cleanFileSystem)
+            with fwApdus, blApdus:
+                deviceInfo = getDeviceInfo(device, connection)
+                checkImageInfo(imageInfo, deviceInfo, arguments.cleanFileSystem)
+                forgetCachedPublicKeys(deviceInfo, arguments.cleanFileSystem)
+                job = FlashJob(printProgress)
+                cancelOnInterrupt(job)
+                performUpdate(device, connection, fwApdus, blApdus, imageInfo, deviceInfo,
+                              arguments.modeSwitchTimeout, job)
+        elif arguments.subcommand in ('fleetUpload', 'fleet-upload'):
+            performFleetUpload(arguments.imageFile, arguments.cleanFileSystem, arguments.modeSwitchTimeout)
         elif arguments.subcommand == 'enableManufacturerBootloader':
             enableManufacturerBootloader(device, connection)
     except InvalidUpdateImageError:
@@ -345,8 +764,13 @@ def main():
         print("Error: please connect a device.");
     except InvalidCardResponseError:
         print("Error: invalid response received from the device.");
-    except NotSuitableImageError:
-        pass
+    except ModeSwitchTimeoutError:
+        print("Error: the device did not reappear after switching modes.");
+    except NotSuitableImageError as e:
+        print(NOT_SUITABLE_IMAGE_MESSAGES[e.reasonCode - 1])
+    except FlashCancelledError:
+        print('')
+        print("Update cancelled. Upload the same image again to complete it.");
 
 
 if __name__ == "__main__":
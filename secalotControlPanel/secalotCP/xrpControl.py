@@ -7,9 +7,15 @@
 
 import argparse
 import smartcard.System
+from secalotCP.appletSession import AppletSession, operation
+from secalotCP.apduBatch import exclusiveTransaction
+import secalotCP.apduTrace as apduTrace
+import secalotCP.batchMode as batchMode
+import secalotCP.daemon as daemon
 from collections import namedtuple
 import base58check
 import hashlib
+import sys
 from collections import namedtuple
 
 
@@ -125,11 +131,10 @@ def dataToSign(dataString):
     return dataByteArray
 
 
-def parse_arguments():
-    parser = argparse.ArgumentParser(description='Ripple control.')
+def argumentParser(parserClass=argparse.ArgumentParser):
+    parser = parserClass(description='Ripple control.')
     parser._optionals.title = 'Options'
     subparsers = parser.add_subparsers(dest='subcommand')
-    subparsers.required = True
 
     parserGetInfo = subparsers.add_parser('getInfo', help='Get wallet info.')
 
@@ -157,8 +162,15 @@ def parse_arguments():
     parserSign._optionals.title = 'Options'
 
     parser.add_argument("--u2f", help="use U2F as transport", action="store_true")
+    batchMode.addBatchArgument(parser)
+
+    return parser
 
+
+def parse_arguments():
+    parser = argumentParser()
     args = parser.parse_args()
+    batchMode.checkArguments(parser, args)
     return args
 
 
@@ -178,7 +190,7 @@ def findConnectedDevice(useU2f):
 
         connection = device
     else:
-        connectedReaders = smartcard.System.readers()
+        connectedReaders = daemon.readers()
 
         reader = next((reader for reader in connectedReaders if reader.name.startswith(READER_NAME)), None)
 
@@ -188,57 +200,63 @@ def findConnectedDevice(useU2f):
             raise NoReaderFoundError
 
         connection.connect()
+        connection = AppletSession(connection)
 
     return connection
 
 def sendAPDU(connection, apdu):
     if U2F_SUPPORTED and isinstance(connection, HIDDevice):
-        signRequest = {}
-
-        keyHandle = bytearray.fromhex('8877665544332211') + bytes(apdu)
-
-        signRequest["version"] = "U2F_V2"
-        signRequest["appId"] = "http://localhost"
-        signRequest["challenge"] = websafe_encode(
-            bytearray.fromhex('0000000000000000000000000000000000000000000000000000000000000000'))
-        signRequest["keyHandle"] = websafe_encode(keyHandle)
-
-        signRequest = json.dumps(signRequest)
-
-        with connection:
-            apduSent = False
-
-            while apduSent == False:
-                try:
-                    response = u2f.authenticate(connection, signRequest, "http://localhost")
-                    apduSent = True
-                except DeviceError as e:
-                    if isinstance(e, U2FHIDError) and e.code is 0x06:
-                        pass
-                    else:
-                        raise
-                except APDUError as e:
-                    if e.code == 0x6985:
-                        pass
-                    else:
-                        raise
-
-            response = list(websafe_decode(response["signatureData"]))
-
-        if len(response) < 7:
-            raise InvalidCardResponseError()
+        return apduTrace.traceTransmit('U2F ' + connection.path.decode('utf-8', 'replace'), apdu,
+                                       lambda apdu: sendU2fAPDU(connection, apdu))
+    else:
+        return connection.transmit(apdu)
 
-        if response[0] != 0x01 or response[1] != 0x00 or response[2] != 0x00 or response[3] != 0x00 or response[4] != 0x00:
-            raise InvalidCardResponseError()
 
-        response = response[5:]
+def sendU2fAPDU(connection, apdu):
+    signRequest = {}
 
-        sw2 = response.pop()
-        sw1 = response.pop()
+    keyHandle = bytearray.fromhex('8877665544332211') + bytes(apdu)
 
-        return response, sw1, sw2
-    else:
-        return connection.transmit(apdu)
+    signRequest["version"] = "U2F_V2"
+    signRequest["appId"] = "http://localhost"
+    signRequest["challenge"] = websafe_encode(
+        bytearray.fromhex('0000000000000000000000000000000000000000000000000000000000000000'))
+    signRequest["keyHandle"] = websafe_encode(keyHandle)
+
+    signRequest = json.dumps(signRequest)
+
+    with connection:
+        apduSent = False
+
+        while apduSent == False:
+            try:
+                response = u2f.authenticate(connection, signRequest, "http://localhost")
+                apduSent = True
+            except DeviceError as e:
+                if isinstance(e, U2FHIDError) and e.code is 0x06:
+                    pass
+                else:
+                    raise
+            except APDUError as e:
+                if e.code == 0x6985:
+                    pass
+                else:
+                    raise
+
+        response = list(websafe_decode(response["signatureData"]))
+
+    if len(response) < 7:
+        raise InvalidCardResponseError()
+
+    if response[0] != 0x01 or response[1] != 0x00 or response[2] != 0x00 or response[3] != 0x00 or response[4] != 0x00:
+        raise InvalidCardResponseError()
+
+    response = response[5:]
+
+    sw2 = response.pop()
+    sw1 = response.pop()
+
+    return response, sw1, sw2
 
 
 def selectApp(connection):
@@ -250,12 +268,17 @@ def selectApp(connection):
 
 
 def getInfo(connection):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
+
+        response, sw1, sw2 = sendAPDU(connection, [0x80, 0xC4, 0x00, 0x00])
+        if sw1 != 0x90 or sw2 != 00:
+            raise InvalidCardResponseError()
+
+        return parseAppInfo(response)
 
-    response, sw1, sw2 = sendAPDU(connection, [0x80, 0xC4, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
 
+def parseAppInfo(response):
     if len(response) != 8:
         raise InvalidCardResponseError()
 
@@ -269,123 +292,131 @@ def getInfo(connection):
 
 
 def getRandom(connection, length):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
 
-    response, sw1, sw2 = sendAPDU(connection, [0x80, 0xC0, 0x00, 0x00, length])
-    if sw1 != 0x90 or sw2 != 00:
-        raise InvalidCardResponseError()
+        response, sw1, sw2 = sendAPDU(connection, [0x80, 0xC0, 0x00, 0x00, length])
+        if sw1 != 0x90 or sw2 != 00:
+            raise InvalidCardResponseError()
 
-    if len(response) != length:
-        raise InvalidCardResponseError()
+        if len(response) != length:
+            raise InvalidCardResponseError()
 
-    return response
+        return response
 
 
 def initWallet(connection, privateKey, pin):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
 
-    data = bytearray()
+        data = bytearray()
 
-    if privateKey.type is 'secret':
-        header = [0x80, 0x20, 0x00, 0x01]
-    else:
-        header = [0x80, 0x20, 0x00, 0x00]
+        if privateKey.type is 'secret':
+            header = [0x80, 0x20, 0x00, 0x01]
+        else:
+            header = [0x80, 0x20, 0x00, 0x00]
 
-    data.append(len(pin))
-    data += pin
-    data += privateKey.value
+        data.append(len(pin))
+        data += pin
+        data += privateKey.value
 
-    response, sw1, sw2 = sendAPDU(connection, header + [len(data)] + list(data))
-    if sw1 != 0x90 or sw2 != 00:
-        if sw1 == 0x6d and sw2 == 0x00:
-            raise WalletError("ALREADY_INIT", 'Wallet already initialized')
-        else:
-            raise InvalidCardResponseError()
+        response, sw1, sw2 = sendAPDU(connection, header + [len(data)] + list(data))
+        if sw1 != 0x90 or sw2 != 00:
+            if sw1 == 0x6d and sw2 == 0x00:
+                raise WalletError("ALREADY_INIT", 'Wallet already initialized')
+            else:
+                raise InvalidCardResponseError()
 
 
 def wipeoutWallet(connection):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
 
-    response, sw1, sw2 = sendAPDU(connection, [0x80, 0xF0, 0x00, 0x00])
-    if sw1 != 0x90 or sw2 != 00:
-        if sw1 == 0x6d and sw2 == 0x00:
-            raise WalletError("NOT_INIT", 'Wallet not initialized')
-        else:
-            raise InvalidCardResponseError()
+        response, sw1, sw2 = sendAPDU(connection, [0x80, 0xF0, 0x00, 0x00])
+        if sw1 != 0x90 or sw2 != 00:
+            if sw1 == 0x6d and sw2 == 0x00:
+                raise WalletError("NOT_INIT", 'Wallet not initialized')
+            else:
+                raise InvalidCardResponseError()
 
 
 def verifyPin(connection, pin):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
 
-    response, sw1, sw2 = sendAPDU(connection, [0x80, 0x22, 0x00, 0x00] + [len(pin)] + list(pin))
+        response, sw1, sw2 = sendAPDU(connection, [0x80, 0x22, 0x00, 0x00] + [len(pin)] + list(pin))
 
-    if sw1 != 0x90 or sw2 != 00:
-        if sw1 == 0x6d and sw2 == 0x00:
-            raise WalletError("NOT_INIT", 'Wallet not initialized')
-        elif sw1 == 0x69 and sw2 == 0x82:
-            triesLeft = getPinTriesLeft(connection)
-            raise WalletError("INVALID_PIN", 'Invalid PIN-code. ' + str(triesLeft) + ' tries left.')
-        elif sw1 == 0x67 and sw2 == 0x00:
-            raise WalletError("WRONG_LENGTH", 'Unsupported PIN-code length')
-        elif sw1 == 0x69 and sw2 == 0x83:
-            raise WalletError("PIN_BLOCKED", 'PIN-code blocked')
-        else:
-            raise InvalidCardResponseError()
+        if sw1 != 0x90 or sw2 != 00:
+            if sw1 == 0x6d and sw2 == 0x00:
+                raise WalletError("NOT_INIT", 'Wallet not initialized')
+            elif sw1 == 0x69 and sw2 == 0x82:
+                triesLeft = getPinTriesLeft(connection)
+                raise WalletError("INVALID_PIN", 'Invalid PIN-code. ' + str(triesLeft) + ' tries left.')
+            elif sw1 == 0x67 and sw2 == 0x00:
+                raise WalletError("WRONG_LENGTH", 'Unsupported PIN-code length')
+            elif sw1 == 0x69 and sw2 == 0x83:
+                raise WalletError("PIN_BLOCKED", 'PIN-code blocked')
+            else:
+                raise InvalidCardResponseError()
 
 
 def getPinTriesLeft(connection):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
 
-    response, sw1, sw2 = sendAPDU(connection, [0x80, 0x22, 0x80, 0x00])
-    if sw1 != 0x63:
-        if sw1 == 0x6d and sw2 == 0x00:
-            raise WalletError("NOT_INIT", 'Wallet not initialized')
-        else:
-            raise InvalidCardResponseError()
+        response, sw1, sw2 = sendAPDU(connection, [0x80, 0x22, 0x80, 0x00])
+        if sw1 != 0x63:
+            if sw1 == 0x6d and sw2 == 0x00:
+                raise WalletError("NOT_INIT", 'Wallet not initialized')
+            else:
+                raise InvalidCardResponseError()
 
-    return (sw2 - 0xC0)
+        return (sw2 - 0xC0)
 
 
 def getPublicKey(connection):
-    selectApp(connection)
+    with exclusiveTransaction(connection):
+        selectApp(connection)
 
-    response, sw1, sw2 = sendAPDU(connection, [0x80, 0x40, 0x00, 0x00])
+        response, sw1, sw2 = sendAPDU(connection, [0x80, 0x40, 0x00, 0x00])
 
-    if sw1 != 0x90 or sw2 != 00:
-        if sw1 == 0x6d and sw2 == 0x00:
-            raise WalletError("NOT_INIT", 'Wallet not initialized')
-        elif sw1 == 0x69 and sw2 == 0x82:
-            raise WalletError("PIN_NOT_VERIFIED", 'PIN-code not verified.')
-        else:
-            raise InvalidCardResponseError()
+        if sw1 != 0x90 or sw2 != 00:
+            if sw1 == 0x6d and sw2 == 0x00:
+                raise WalletError("NOT_INIT", 'Wallet not initialized')
+            elif sw1 == 0x69 and sw2 == 0x82:
+                raise WalletError("PIN_NOT_VERIFIED", 'PIN-code not verified.')
+            else:
+                raise InvalidCardResponseError()
 
-    if len(response) != 65:
-        raise InvalidCardResponseError()
+        if len(response) != 65:
+            raise InvalidCardResponseError()
 
-    return bytes(response)
+        return bytes(response)
 
 
 def sign(connection, dataToSign):
-    firstChunk = True
-    selectApp(connection)
-
-    chunks = [dataToSign[i:i + 128] for i in range(0, len(dataToSign), 128)]
+    # The transaction covers the data only, other clients are not locked out while the touch button is waited for.
+    with exclusiveTransaction(connection):
+        firstChunk = True
+        selectApp(connection)
 
+        chunks = [dataToSign[i:i + 128] for i in range(0, len(dataToSign), 128)]
 
-    for chunk in chunks:
-        if firstChunk is True:
-            response, sw1, sw2 = sendAPDU(connection, [0x80, 0xf2, 0x00, 0x00] + [len(chunk)] + list(chunk))
-            firstChunk = False;
-        else:
-            response, sw1, sw2 = sendAPDU(connection, [0x80, 0xf2, 0x01, 0x00] + [len(chunk)] + list(chunk))
 
-        if sw1 != 0x90 or sw2 != 00:
-            if sw1 == 0x6d and sw2 == 0x00:
-                raise WalletError("NOT_INIT", 'Wallet not initialized')
-            elif sw1 == 0x69 and sw2 == 0x82:
-                raise WalletError("PIN_NOT_VERIFIED", 'PIN-code not verified.')
+        for chunk in chunks:
+            if firstChunk is True:
+                response, sw1, sw2 = sendAPDU(connection, [0x80, 0xf2, 0x00, 0x00] + [len(chunk)] + list(chunk))
+                firstChunk = False;
             else:
-                raise InvalidCardResponseError()
+                response, sw1, sw2 = sendAPDU(connection, [0x80, 0xf2, 0x01, 0x00] + [len(chunk)] + list(chunk))
+
+            if sw1 != 0x90 or sw2 != 00:
+                if sw1 == 0x6d and sw2 == 0x00:
+                    raise WalletError("NOT_INIT", 'Wallet not initialized')
+                elif sw1 == 0x69 and sw2 == 0x82:
+                    raise WalletError("PIN_NOT_VERIFIED", 'PIN-code not verified.')
+                else:
+                    raise InvalidCardResponseError()
 
     response, sw1, sw2 = sendAPDU(connection, [0x80, 0xf2, 0x02, 0x00])
 
@@ -399,51 +430,98 @@ def sign(connection, dataToSign):
     return bytes(response)
 
 
+CLI_ERRORS = (NoReaderFoundError, InvalidCardResponseError, WalletError, U2fNotInstalledError)
+
+TOUCH_PROMPT = 'Please confirm the action by tapping a touch button'
+
+
+def errorMessage(e):
+    if isinstance(e, NoReaderFoundError):
+        return 'please connect a device.'
+    elif isinstance(e, WalletError):
+        return e.message
+    elif isinstance(e, U2fNotInstalledError):
+        return 'U2F Python packages are not installed.'
+    else:
+        return 'invalid response received from the device.'
+
+
+def executeSubcommand(connection, arguments):
+    if arguments.subcommand == 'initWallet':
+        initWallet(connection, arguments.key, arguments.pin)
+    elif arguments.subcommand == 'getPublicKey':
+        publicKey = getPublicKey(connection)
+        return {'publicKey': ''.join(format(x, '02x') for x in publicKey)}
+    elif arguments.subcommand == 'wipeoutWallet':
+        wipeoutWallet(connection)
+    elif arguments.subcommand == 'verifyPin':
+        verifyPin(connection, arguments.pin)
+    elif arguments.subcommand == 'getInfo':
+        info = getInfo(connection)
+        return {'version': info.version, 'walletInitialized': info.walletInitialized,
+                'pinVerified': info.pinVerified}
+    elif arguments.subcommand == 'getRandom':
+        rand = getRandom(connection, arguments.length)
+        return {'random': ''.join(format(x, '02x') for x in rand)}
+    elif arguments.subcommand == 'sign':
+        signature = sign(connection, arguments.data)
+        return {'signature': ''.join(format(x, '02x') for x in signature)}
+
+    return {}
+
+
+def executeBatchSubcommand(connection, arguments):
+    # The standard output only carries JSON lines in batch mode.
+    if arguments.subcommand == 'sign':
+        print(TOUCH_PROMPT, file=sys.stderr, flush=True)
+
+    return executeSubcommand(connection, arguments)
+
+
 def main():
 
     arguments = parse_arguments()
+    apduTrace.installFromEnvironment()
 
     try:
         connection = findConnectedDevice(arguments.u2f)
-        if arguments.subcommand == 'initWallet':
-            initWallet(connection, arguments.key, arguments.pin)
-        elif arguments.subcommand == 'getPublicKey':
-            publicKey = getPublicKey(connection)
-            print('Public key: ' + ''.join(format(x, '02x') for x in publicKey))
-        elif arguments.subcommand == 'wipeoutWallet':
-            wipeoutWallet(connection)
-        elif arguments.subcommand == 'verifyPin':
-            verifyPin(connection, arguments.pin)
+
+        if arguments.batch is not None:
+            batchMode.runBatch(argumentParser(batchMode.BatchArgumentParser), arguments.batch, connection,
+                               executeBatchSubcommand, CLI_ERRORS, errorMessage)
+            return
+
+        if arguments.subcommand == 'sign':
+            print(TOUCH_PROMPT)
+
+        with operation(connection):
+            result = executeSubcommand(connection, arguments)
+
+        if arguments.subcommand == 'getPublicKey':
+            print('Public key: ' + result['publicKey'])
         elif arguments.subcommand == 'getInfo':
-            info = getInfo(connection)
             print('')
-            print('App version: ' + info.version)
+            print('App version: ' + result['version'])
 
-            if info.walletInitialized == True:
+            if result['walletInitialized'] == True:
                 print('Wallet status: initialized')
             else:
                 print('Wallet status: not initialized')
 
-            if info.pinVerified == True:
+            if result['pinVerified'] == True:
                 print('Pin status: verified')
             else:
                 print('Pin status: unverified')
         elif arguments.subcommand == 'getRandom':
-            rand = getRandom(connection, arguments.length)
-            print('Random string: ' + ''.join(format(x, '02x') for x in rand))
+            print('Random string: ' + result['random'])
         elif arguments.subcommand == 'sign':
-            print('Please confirm the action by tapping a touch button')
-            signature = sign(connection, arguments.data)
-            print('Signature: ' + ''.join(format(x, '02x') for x in signature))
-
-    except NoReaderFoundError:
-        print('Error: please connect a device.')
-    except InvalidCardResponseError:
-        print('Error: invalid response received from the device.')
-    except WalletError as e:
-        print('Error: ' + e.message)
-    except U2fNotInstalledError:
-        print('Error: U2F Python packages are not installed.')
+            print('Signature: ' + result['signature'])
+
+    except CLI_ERRORS as e:
+        if arguments.batch is not None:
+            batchMode.printRecord({'error': errorMessage(e)})
+        else:
+            print('Error: ' + errorMessage(e))
 
 if __name__ == "__main__":
     main()
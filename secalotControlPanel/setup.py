@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name='secalotControlPanel',
     version='1.6',
-    packages=['secalotCP'],
+    packages=['secalotCP', 'secalotCP.aio'],
     install_requires=[
         'PyQt5>=5.11',
         'pyscard',
@@ -33,6 +33,9 @@ setup(
             'scpEthControl=secalotCP.ethControl:main',
             'scpSslControl=secalotCP.sslControl:main',
             'scpXrpControl=secalotCP.xrpControl:main',
+            'scpSimulator=secalotCP.simulator:main',
+            'scpApduTrace=secalotCP.apduTrace:main',
+            'scpDaemon=secalotCP.daemon:main',
         ],
     },    
 )
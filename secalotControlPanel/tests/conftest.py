@@ -0,0 +1,41 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+import secalotCP.simulator as simulator
+
+
+@pytest.fixture
+def secalot(monkeypatch):
+    # One simulated device in firmware mode, used directly rather than through a running daemon.
+    monkeypatch.setenv('SECALOT_DAEMON_SOCKET', '')
+
+    instance = simulator.Simulator(1, reenumerationDelay=0.0)
+    simulator.install(instance)
+    yield instance.devices[0]
+    simulator.uninstall()
+
+
+@pytest.fixture
+def readerName(secalot):
+    return secalot.readerName()
+
+
+@pytest.fixture
+def cardAPDUs(monkeypatch):
+    # CLA and INS of every APDU that reached the simulated card, e.g. '00a4' for a SELECT.
+    headers = []
+    transmit = simulator.SimulatedDevice.transmit
+
+    def recordingTransmit(device, generation, apdu):
+        headers.append(bytes(apdu[0:2]).hex())
+        return transmit(device, generation, apdu)
+
+    monkeypatch.setattr(simulator.SimulatedDevice, 'transmit', recordingTransmit)
+
+    return headers
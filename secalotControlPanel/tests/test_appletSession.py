@@ -0,0 +1,143 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+import secalotCP.apduBatch as apduBatch
+import secalotCP.ethControl as ethControl
+import secalotCP.xrpControl as xrpControl
+from secalotCP.apduBatch import ApduBatch, ApduBatchError, exclusiveTransaction
+from secalotCP.appletSession import AppletSession, OTP_APPLET_AID, ETH_APPLET_AID, operation, selectAPDU
+from secalotCP.connectionPool import ConnectionPool
+from secalotCP.deviceCommunicator import DeviceCommunicatorImplementation
+
+PIN = b'1234'
+SEED = bytes(range(64))
+
+
+@pytest.fixture
+def session(readerName):
+    connection = ConnectionPool().getConnection(readerName)
+    yield connection.session
+    connection.disconnect()
+
+
+@pytest.fixture
+def transactions(monkeypatch):
+    # The simulator has no PC/SC handles, transactions are recorded in the APDU order instead.
+    events = []
+    monkeypatch.setattr(apduBatch, 'findCardHandle', lambda connection: 1)
+    monkeypatch.setattr(apduBatch, 'SCardBeginTransaction', lambda hcard: events.append('begin') or 0)
+    monkeypatch.setattr(apduBatch, 'SCardEndTransaction', lambda hcard, disposition: events.append('end') or 0)
+    return events
+
+
+def testSelectIsSkippedWithinAnOperation(session, cardAPDUs):
+    with operation(session):
+        session.select(OTP_APPLET_AID)
+        session.select(OTP_APPLET_AID)
+        session.select(ETH_APPLET_AID)
+
+    assert cardAPDUs == ['00a4', '00a4']
+    assert session.savedRoundTrips == 1
+
+
+def testSelectIsSentByEveryOperation(session, cardAPDUs):
+    for count in range(0, 2):
+        with operation(session):
+            session.select(OTP_APPLET_AID)
+
+    assert cardAPDUs == ['00a4', '00a4']
+    assert session.savedRoundTrips == 0
+
+
+def testFailedSelectIsNotRemembered(session, cardAPDUs):
+    with operation(session):
+        assert session.transmit(selectAPDU(b'NOAPPLET'))[1] == 0x6A
+        session.transmit(selectAPDU(b'NOAPPLET'))
+
+    assert cardAPDUs == ['00a4', '00a4']
+
+
+def testHelpersShareTheSelectionOfATransaction(session, cardAPDUs):
+    ethControl.initWallet(session, SEED, PIN)
+    del cardAPDUs[:]
+
+    with exclusiveTransaction(session):
+        ethControl.getInfo(session)
+        ethControl.getRandom(session, 16)
+
+    assert cardAPDUs.count('00a4') == 1
+    assert session.savedRoundTrips == 1
+
+
+def testFailedVerifyPinSelectsOnce(session, cardAPDUs):
+    ethControl.initWallet(session, SEED, PIN)
+    del cardAPDUs[:]
+
+    with pytest.raises(ethControl.WalletError):
+        ethControl.verifyPin(session, b'9999')
+
+    # The rejected PIN-code and the tries counter read behind one SELECT.
+    assert cardAPDUs == ['00a4', '8022', '8022']
+
+
+def testCreateEthereumWalletSelectsOnce(secalot, readerName, cardAPDUs):
+    application = QCoreApplication.instance() or QCoreApplication([])
+    implementation = DeviceCommunicatorImplementation(readerName, 'firmware')
+    phrases = []
+    errors = []
+    implementation.createEthereumWalletReady.connect(phrases.append)
+    implementation.errorOccurred.connect(errors.append)
+
+    implementation.createEthereumWallet('1234', '1234')
+    implementation.closeAllConnections()
+
+    assert errors == []
+    assert len(phrases) == 1
+    assert cardAPDUs.count('00a4') == 1
+    assert implementation.connectionPool.savedRoundTrips() == 1
+    assert secalot.ethWallet.initialized()
+
+
+def testBatchReportsTheFailedCommand(session):
+    batch = ApduBatch()
+    batch.add(selectAPDU(OTP_APPLET_AID))
+    batch.add(selectAPDU(b'NOAPPLET'))
+    batch.add(selectAPDU(OTP_APPLET_AID))
+
+    with pytest.raises(ApduBatchError) as error:
+        batch.execute(session)
+
+    assert error.value.index == 1
+    assert error.value.response.sw1 == 0x6A
+
+
+def testNestedTransactionsBeginOnce(session, transactions):
+    with exclusiveTransaction(session):
+        with exclusiveTransaction(session):
+            transactions.append('nested')
+
+    assert transactions == ['begin', 'nested', 'end']
+    assert session.transactionDepth == 0
+
+
+def testXrpSignReleasesTheTransactionBeforeTheTouchButton(session, transactions, cardAPDUs, monkeypatch):
+    xrpControl.initWallet(session, xrpControl.privateKey(bytes(range(1, 33)).hex()), PIN)
+    xrpControl.verifyPin(session, PIN)
+    del transactions[:]
+
+    def recordingTransmit(apdu, protocol=None):
+        transactions.append(bytes(apdu[0:3]).hex())
+        return AppletSession.transmit(session, apdu, protocol)
+
+    monkeypatch.setattr(session, 'transmit', recordingTransmit)
+
+    xrpControl.sign(session, bytes(200))
+
+    assert transactions == ['begin', '00a404', '80f200', '80f201', 'end', '80f202']
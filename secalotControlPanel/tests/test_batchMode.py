@@ -0,0 +1,56 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+
+import secalotCP.batchMode as batchMode
+import secalotCP.ethControl as ethControl
+
+SEED = bytes(range(32)).hex()
+
+
+def runBatch(connection, lines, tmp_path):
+    batchFile = tmp_path / 'batch.txt'
+    batchFile.write_text('\n'.join(lines) + '\n')
+
+    return batchMode.runBatch(ethControl.argumentParser(batchMode.BatchArgumentParser), str(batchFile), connection,
+                              ethControl.executeSubcommand, ethControl.CLI_ERRORS, ethControl.errorMessage)
+
+
+def testRecordsPerLine(secalot, tmp_path, capsys):
+    connection = ethControl.findConnectedDevice()
+
+    failed = runBatch(connection, ['# A comment', '', 'initWallet --seed ' + SEED + ' --pin 1234', 'verifyPin --pin 9999',
+                                   'noSuchSubcommand', 'getInfo'], tmp_path)
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert failed == 2
+    assert [record['line'] for record in records] == [3, 4, 5, 6]
+    assert records[0] == {'line': 3, 'subcommand': 'initWallet', 'result': {}}
+    assert records[1]['subcommand'] == 'verifyPin' and 'error' in records[1]
+    assert 'subcommand' not in records[2] and 'error' in records[2]
+    assert records[3]['result']['walletInitialized'] is True
+
+
+def testLinesAreNotEchoed(secalot, tmp_path, capsys):
+    connection = ethControl.findConnectedDevice()
+
+    runBatch(connection, ['initWallet --seed ' + SEED + ' --pin 4321', 'verifyPin --pin 98765',
+                          'verifyPin --pin "56789'], tmp_path)
+
+    output = capsys.readouterr().out
+
+    for secret in [SEED, '4321', '98765', '56789']:
+        assert secret not in output
+
+
+def testNestedBatchIsRejected(secalot, tmp_path, capsys):
+    connection = ethControl.findConnectedDevice()
+
+    assert runBatch(connection, ['--batch other.txt getInfo'], tmp_path) == 1
+    assert json.loads(capsys.readouterr().out)['error'] == '--batch can not be nested'
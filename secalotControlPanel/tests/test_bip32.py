@@ -0,0 +1,45 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+import secalotCP.bip32 as bip32
+
+# BIP32 test vector 1.
+SEED = bytes.fromhex('000102030405060708090a0b0c0d0e0f')
+
+
+def compressed(node):
+    return bip32.compressedPublicKey(*bip32.parsePublicKey(node.publicKey))
+
+
+def testPrivateDerivation():
+    node = bip32.publicNode(bip32.privateNodeAtPath(SEED, [bip32.HARDENED]))
+
+    assert compressed(node).hex() == '035a784662a4a20a65bf6aab9ae98a6c068a81c52e4b032c0fb5400c706cfccc56'
+    assert node.chainCode.hex() == '47fdacbd0f1097043b78c63c20c34ef4ed9a111d980047ad16282c7ae6236141'
+
+
+def testPublicDerivation():
+    child = bip32.publicChild(bip32.publicNode(bip32.privateNodeAtPath(SEED, [bip32.HARDENED])), 1)
+
+    assert compressed(child).hex() == '03501e454bf00751f24b1b489aa925215d66af2234e3891c3b21a52bedb3cd711c'
+    assert child.chainCode.hex() == '2a7857631386ba23dacac34180dd1983734e444fdbf774041578e9b6adb37c19'
+
+
+def testPublicChildrenMatchPrivateChildren():
+    parent = bip32.privateNodeAtPath(SEED, [bip32.HARDENED, 1])
+    indexes = [0, 1, 2, 1000000000]
+
+    children = bip32.publicChildren(bip32.publicNode(parent), indexes)
+
+    assert children == [bip32.publicNode(bip32.privateChild(parent, index)) for index in indexes]
+
+
+def testHardenedChildOfAPublicNode():
+    with pytest.raises(ValueError):
+        bip32.publicChild(bip32.publicNode(bip32.masterNode(SEED)), bip32.HARDENED)
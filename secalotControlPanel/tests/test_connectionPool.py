@@ -0,0 +1,64 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from smartcard.Exceptions import CardConnectionException
+from smartcard.scard import SCARD_E_NO_SERVICE
+
+import secalotCP.otpControl as otpControl
+from secalotCP.connectionPool import ConnectionPool, ReaderNotFoundError
+
+
+def beginOperation(pool, readerName):
+    connection = pool.getConnection(readerName)
+    connection.session.restartOperation()
+    return connection
+
+
+def testConnectionIsReused(secalot, readerName):
+    pool = ConnectionPool()
+
+    assert pool.getConnection(readerName) is pool.getConnection(readerName)
+
+
+def testUnknownReader(secalot):
+    with pytest.raises(ReaderNotFoundError):
+        ConnectionPool().getConnection('No such reader')
+
+
+def testResetCardIsRetriedOnce(secalot, readerName, cardAPDUs):
+    pool = ConnectionPool()
+    connection = beginOperation(pool, readerName)
+    expected = otpControl.getNumberOfDigitsAndType(connection)
+    command = cardAPDUs[-1]
+
+    # The card was replugged, the handle of the pooled connection is stale.
+    secalot.generation += 1
+    del cardAPDUs[:]
+
+    assert otpControl.getNumberOfDigitsAndType(connection) == expected
+    # The SELECT rejected on the stale handle, the same SELECT once more on a new one, then the command.
+    assert cardAPDUs == ['00a4', '00a4', command]
+    assert pool.connections[readerName] is connection
+
+
+def testConnectionIsEvictedAfterUnrecoverableError(secalot, readerName, monkeypatch):
+    pool = ConnectionPool()
+    connection = beginOperation(pool, readerName)
+
+    def failingTransmit(generation, apdu):
+        raise CardConnectionException('Service not available.', hresult=SCARD_E_NO_SERVICE)
+
+    monkeypatch.setattr(secalot, 'transmit', failingTransmit)
+
+    with pytest.raises(CardConnectionException):
+        otpControl.getNumberOfDigitsAndType(connection)
+
+    assert readerName not in pool.connections
+
+    monkeypatch.undo()
+    assert pool.getConnection(readerName) is not connection
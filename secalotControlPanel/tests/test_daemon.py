@@ -0,0 +1,100 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import threading
+
+import pytest
+
+import secalotCP.daemon as daemon
+
+
+@pytest.fixture
+def server(secalot, tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon, 'CLAIM_TIMEOUT', 0.5)
+
+    instance = daemon.DaemonServer(str(tmp_path / 'daemon.socket'))
+    thread = threading.Thread(target=instance.serve_forever)
+    thread.start()
+
+    yield instance
+
+    instance.shutdown()
+    thread.join()
+    instance.server_close()
+    instance.connectionPool.evictAll()
+
+
+@pytest.fixture
+def clients(server):
+    created = []
+
+    def client():
+        created.append(daemon.DaemonClient(server.server_address))
+        return created[-1]
+
+    yield client
+
+    for client in created:
+        client.close()
+
+
+def testTransmit(readerName, clients):
+    client = clients()
+
+    assert client.call('listReaders') == [readerName]
+
+    response = client.call('transmit', reader='Secalot', apdu='00a4040009' + b'OTPAPPLET'.hex())
+    assert (response['sw1'], response['sw2']) == (0x90, 0x00)
+
+
+def testClaimedReaderIsBusy(readerName, clients):
+    first = clients()
+    second = clients()
+    first.call('connect', reader=readerName)
+
+    with pytest.raises(daemon.DaemonError) as error:
+        second.call('connect', reader=readerName)
+    assert error.value.code == daemon.ERROR_READER_BUSY
+
+    first.call('release', reader=readerName)
+    second.call('connect', reader=readerName)
+
+
+def testReaderIsReleasedWhenTheClientDisconnects(readerName, clients):
+    first = clients()
+    first.call('connect', reader=readerName)
+    first.close()
+
+    clients().call('connect', reader=readerName)
+
+
+def testUnknownReader(clients):
+    with pytest.raises(daemon.DaemonError) as error:
+        clients().call('connect', reader='No such reader')
+
+    assert error.value.code == daemon.ERROR_READER_NOT_FOUND
+
+
+def testConcurrentClientsShareOneConnection(readerName, server, clients):
+    errors = []
+
+    def transmit(client):
+        try:
+            for count in range(0, 20):
+                client.call('transmit', reader=readerName, apdu='00a4040009' + b'OTPAPPLET'.hex())
+                client.call('release', reader=readerName)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=transmit, args=(clients(),)) for count in range(0, 4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert list(server.connectionPool.connections) == [readerName]
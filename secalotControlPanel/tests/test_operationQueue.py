@@ -0,0 +1,63 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from secalotCP.operationQueue import OperationQueue, PRIORITY_INTERACTIVE, PRIORITY_USER, PRIORITY_BACKGROUND
+
+
+def drain(queue):
+    methods = []
+
+    while True:
+        operation = queue.get()
+        if operation is None:
+            return methods
+        methods.append(operation.method)
+
+
+def testPriorityOrder():
+    queue = OperationQueue()
+    queue.put(PRIORITY_BACKGROUND, 'background')
+    queue.put(PRIORITY_USER, 'firstUser')
+    queue.put(PRIORITY_INTERACTIVE, 'interactive')
+    queue.put(PRIORITY_USER, 'secondUser')
+
+    assert drain(queue) == ['interactive', 'firstUser', 'secondUser', 'background']
+
+
+def testCoalescing():
+    queue = OperationQueue()
+
+    assert queue.put(PRIORITY_BACKGROUND, 'getDeviceSnapshot', coalescable=True)
+    assert not queue.put(PRIORITY_BACKGROUND, 'getDeviceSnapshot', coalescable=True)
+    assert queue.put(PRIORITY_BACKGROUND, 'getDeviceSnapshot', ('other reader',), coalescable=True)
+    assert queue.put(PRIORITY_BACKGROUND, 'verifyPin')
+    assert queue.put(PRIORITY_BACKGROUND, 'verifyPin')
+
+    assert queue.depth() == 4
+    assert drain(queue) == ['getDeviceSnapshot', 'getDeviceSnapshot', 'verifyPin', 'verifyPin']
+    assert queue.statistics()['background'].coalesced == 1
+
+
+def testCoalescedOperationIsPromoted():
+    queue = OperationQueue()
+    queue.put(PRIORITY_BACKGROUND, 'getDeviceSnapshot', coalescable=True)
+    queue.put(PRIORITY_USER, 'readerSelected')
+    queue.put(PRIORITY_INTERACTIVE, 'getDeviceSnapshot', coalescable=True)
+
+    assert queue.depth() == 2
+    operation = queue.get()
+    assert (operation.method, operation.priority) == ('getDeviceSnapshot', PRIORITY_INTERACTIVE)
+    assert drain(queue) == ['readerSelected']
+
+
+def testCoalescingEndsOnceTheOperationIsTaken():
+    queue = OperationQueue()
+    queue.put(PRIORITY_BACKGROUND, 'getDeviceSnapshot', coalescable=True)
+    queue.get()
+
+    assert queue.put(PRIORITY_BACKGROUND, 'getDeviceSnapshot', coalescable=True)
+    assert queue.statistics()['background'].executed == 1
@@ -0,0 +1,56 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from secalotCP.remoteScreen import RemoteScreen, BinaryFrame, FrameTooLargeError
+
+
+def testLineFramerJoinsPartialLines():
+    framer = RemoteScreen.LineFramer(64)
+
+    assert framer.feed(b'{"a":') == []
+    assert framer.feed(b' 1}\n{"b": 2}\n{"c"') == [b'{"a": 1}\n', b'{"b": 2}\n']
+    assert framer.feed(b': 3}\n') == [b'{"c": 3}\n']
+
+
+def testLineFramerSplitsEveryByte():
+    framer = RemoteScreen.LineFramer(64)
+    frames = []
+
+    for byte in b'first\nsecond\n':
+        frames += framer.feed(bytes([byte]))
+
+    assert frames == [b'first\n', b'second\n']
+
+
+def testLineFramerRejectsLongLines():
+    framer = RemoteScreen.LineFramer(8)
+
+    with pytest.raises(FrameTooLargeError):
+        framer.feed(b'0123456789')
+
+    with pytest.raises(FrameTooLargeError):
+        RemoteScreen.LineFramer(8).feed(b'short\n0123456789\n')
+
+
+def testBinaryFramerRoundTrip():
+    framer = RemoteScreen.BinaryFramer(64)
+    data = RemoteScreen.BinaryFramer.encode(RemoteScreen.FRAME_APDU, b'\x00\xa4\x04\x00') + \
+        RemoteScreen.BinaryFramer.encode(RemoteScreen.FRAME_PING, b'')
+
+    assert framer.feed(data[:2]) == []
+    assert framer.feed(data[2:5]) == []
+    assert framer.feed(data[5:]) == [BinaryFrame(RemoteScreen.FRAME_APDU, b'\x00\xa4\x04\x00'),
+                                     BinaryFrame(RemoteScreen.FRAME_PING, b'')]
+
+
+def testBinaryFramerRejectsLongFrames():
+    framer = RemoteScreen.BinaryFramer(8)
+
+    with pytest.raises(FrameTooLargeError):
+        framer.feed(RemoteScreen.BinaryFramer.encode(RemoteScreen.FRAME_APDU, bytes(9))[:3])
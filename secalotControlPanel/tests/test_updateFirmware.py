@@ -0,0 +1,61 @@
+# Secalot utilities.
+# Copyright (c) 2018 Matvey Mukha <matvey.mukha@gmail.com>
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+import secalotCP.updateFirmware as updateFirmware
+from secalotCP.updateFirmware import CHUNK_LENGTH, FIRMWARE_DATA_OFFSET, IMAGE_LENGTH, LOAD_IMAGE_DATA_HEADER, MAGIC
+
+
+@pytest.fixture
+def image(tmp_path):
+    data = bytearray(index % 251 for index in range(0, IMAGE_LENGTH))
+    data[0:len(MAGIC)] = MAGIC
+
+    imageFile = tmp_path / 'image.bin'
+    imageFile.write_bytes(data)
+
+    with open(str(imageFile), 'rb') as file:
+        yield file, bytes(data)
+
+
+def testDataAPDUs(image):
+    file, data = image
+    fwApdus, blApdus = updateFirmware.updateImageToAPDUs(file, False)
+
+    with fwApdus, blApdus:
+        apdus = [bytes(apdu) for apdu in fwApdus]
+
+    assert len(apdus) == len(fwApdus)
+    assert apdus[1] == LOAD_IMAGE_DATA_HEADER + data[FIRMWARE_DATA_OFFSET:FIRMWARE_DATA_OFFSET + CHUNK_LENGTH]
+    assert apdus[-1] == bytes([0x80, 0x04, 0x00, 0x00])
+
+
+def testCloseAfterInterruptedIterations(image):
+    file, data = image
+    fwApdus, blApdus = updateFirmware.updateImageToAPDUs(file, True)
+
+    fwIterator = iter(fwApdus)
+    blIterator = iter(blApdus)
+    for count in range(0, 2):
+        next(fwIterator)
+        next(blIterator)
+
+    blApdus.close()
+
+    assert fwApdus.image.closed
+    with pytest.raises(ValueError):
+        next(fwIterator)
+
+
+def testShortImage(tmp_path):
+    imageFile = tmp_path / 'image.bin'
+    imageFile.write_bytes(MAGIC + bytes(16))
+
+    with open(str(imageFile), 'rb') as file:
+        with pytest.raises(updateFirmware.InvalidUpdateImageError):
+            updateFirmware.updateImageToAPDUs(file, False)